@@ -0,0 +1,140 @@
+"""search index documents
+
+Revision ID: 3e9b2c71d5a8
+Revises: 7c605d1a4386
+Create Date: 2026-10-17 11:04:27.531906
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.search.normalization import normalize_search_text
+from app.utils.time_utils import utcnow
+
+# revision identifiers, used by Alembic.
+revision: str = '3e9b2c71d5a8'
+down_revision: Union[str, Sequence[str], None] = '7c605d1a4386'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TRIGRAM_COLUMNS = ('name_norm', 'identifier_norm', 'search_text')
+_BACKFILL_BATCH = 1000
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('search_documents',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('entity_type', sa.String(length=30), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=False),
+    sa.Column('client_record_id', sa.Integer(), nullable=True),
+    sa.Column('name_norm', sa.Text(), nullable=False),
+    sa.Column('identifier_norm', sa.Text(), nullable=False),
+    sa.Column('search_text', sa.Text(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('entity_type', 'entity_id', name='uq_search_documents_entity')
+    )
+    op.create_index('idx_search_documents_client', 'search_documents', ['client_record_id'], unique=False)
+    if op.get_bind().dialect.name == 'postgresql':
+        # Trigram indexes back the LIKE '%term%' matching and the similarity() ranking.
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for column in _TRIGRAM_COLUMNS:
+            op.create_index(
+                f'idx_search_documents_{column}_trgm',
+                'search_documents',
+                [column],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+            )
+    _backfill()
+
+
+def _backfill() -> None:
+    """Index every existing client, binder and document; the session hook takes over after.
+
+    The text goes through the same `normalize_search_text` as the index writer
+    (NFKC, niqqud, final letters), which plain SQL cannot reproduce, so rows
+    are read and normalised here rather than copied with INSERT ... SELECT.
+    """
+    bind = op.get_bind()
+    table = sa.table(
+        'search_documents',
+        sa.column('entity_type', sa.String),
+        sa.column('entity_id', sa.Integer),
+        sa.column('client_record_id', sa.Integer),
+        sa.column('name_norm', sa.Text),
+        sa.column('identifier_norm', sa.Text),
+        sa.column('search_text', sa.Text),
+        sa.column('updated_at', sa.DateTime),
+    )
+    now = utcnow()
+
+    business_names: dict[int, list[str]] = {}
+    for legal_entity_id, business_name in bind.execute(sa.text(
+        'SELECT legal_entity_id, business_name FROM businesses'
+        ' WHERE deleted_at IS NULL AND business_name IS NOT NULL'
+    )):
+        business_names.setdefault(legal_entity_id, []).append(business_name)
+
+    def documents(entity_type, query, build):
+        batch = []
+        for row in bind.execute(sa.text(query)):
+            name, identifier, parts = build(row)
+            batch.append({
+                'entity_type': entity_type,
+                'entity_id': row.id,
+                'client_record_id': row.client_record_id,
+                'name_norm': normalize_search_text(name),
+                'identifier_norm': normalize_search_text(identifier),
+                'search_text': normalize_search_text(*parts),
+                'updated_at': now,
+            })
+            if len(batch) >= _BACKFILL_BATCH:
+                op.bulk_insert(table, batch)
+                batch = []
+        if batch:
+            op.bulk_insert(table, batch)
+
+    documents(
+        'client',
+        'SELECT c.id, c.id AS client_record_id, c.legal_entity_id, c.office_client_number,'
+        ' le.official_name, le.id_number'
+        ' FROM client_records c JOIN legal_entities le ON le.id = c.legal_entity_id',
+        lambda row: (
+            row.official_name,
+            row.id_number,
+            (
+                row.official_name,
+                row.id_number,
+                row.office_client_number,
+                *business_names.get(row.legal_entity_id, []),
+            ),
+        ),
+    )
+    documents(
+        'binder',
+        'SELECT id, client_record_id, binder_number FROM binders',
+        lambda row: (row.binder_number, row.binder_number, (row.binder_number,)),
+    )
+    documents(
+        'permanent_document',
+        'SELECT id, client_record_id, original_filename, document_type FROM permanent_documents',
+        lambda row: (
+            row.original_filename,
+            row.document_type,
+            (row.original_filename, row.document_type),
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        for column in _TRIGRAM_COLUMNS:
+            op.drop_index(f'idx_search_documents_{column}_trgm', table_name='search_documents')
+    op.drop_index('idx_search_documents_client', table_name='search_documents')
+    op.drop_table('search_documents')
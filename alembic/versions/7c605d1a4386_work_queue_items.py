@@ -0,0 +1,55 @@
+"""work queue read model
+
+Revision ID: 7c605d1a4386
+Revises: bfaed5b29bd3
+Create Date: 2026-10-17 09:12:41.208113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '7c605d1a4386'
+down_revision: Union[str, Sequence[str], None] = 'bfaed5b29bd3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('work_queue_items',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('source_type', sa.String(length=50), nullable=False),
+    sa.Column('source_id', sa.Integer(), nullable=False),
+    sa.Column('client_record_id', sa.Integer(), nullable=True),
+    sa.Column('business_id', sa.Integer(), nullable=True),
+    sa.Column('due_date', sa.Date(), nullable=True),
+    sa.Column('urgency_rank', sa.Integer(), nullable=False),
+    sa.Column('item_kind', sa.Integer(), nullable=False),
+    sa.Column('task_status', sa.String(length=20), nullable=True),
+    sa.Column('status_rank', sa.Integer(), nullable=False),
+    sa.Column('priority_rank', sa.Integer(), nullable=False),
+    sa.Column('linked_count', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=500), nullable=False),
+    sa.Column('search_text', sa.Text(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('source_type', 'source_id', name='uq_work_queue_items_source')
+    )
+    op.create_index('idx_work_queue_items_client', 'work_queue_items', ['client_record_id'], unique=False)
+    op.create_index('idx_work_queue_items_order', 'work_queue_items', ['urgency_rank', 'due_date'], unique=False)
+    op.create_table('work_queue_read_model_state',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('bucket_date', sa.Date(), nullable=False),
+    sa.Column('rebuilt_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('work_queue_read_model_state')
+    op.drop_index('idx_work_queue_items_order', table_name='work_queue_items')
+    op.drop_index('idx_work_queue_items_client', table_name='work_queue_items')
+    op.drop_table('work_queue_items')
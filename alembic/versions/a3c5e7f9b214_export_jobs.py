@@ -0,0 +1,56 @@
+"""export jobs
+
+Revision ID: a3c5e7f9b214
+Revises: 8d4e2f6a1c37
+Create Date: 2026-10-17 16:48:12.530918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c5e7f9b214'
+down_revision: Union[str, Sequence[str], None] = '8d4e2f6a1c37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('export_jobs',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('kind', sa.String(length=30), nullable=False),
+    sa.Column('format', sa.String(length=10), nullable=False),
+    sa.Column('params', sa.JSON().with_variant(postgresql.JSONB(astext_type=sa.Text()), 'postgresql'), nullable=False),
+    sa.Column('request_hash', sa.String(length=64), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('attempts', sa.SmallInteger(), nullable=False),
+    sa.Column('locked_until', sa.DateTime(), nullable=True),
+    sa.Column('content_hash', sa.String(length=64), nullable=True),
+    sa.Column('storage_key', sa.String(length=500), nullable=True),
+    sa.Column('filename', sa.String(length=255), nullable=True),
+    sa.Column('media_type', sa.String(length=100), nullable=True),
+    sa.Column('size_bytes', sa.Integer(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('requested_by', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.Column('expires_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['requested_by'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_export_jobs_content', 'export_jobs', ['content_hash', 'status'], unique=False)
+    op.create_index('idx_export_jobs_request', 'export_jobs', ['requested_by', 'request_hash', 'status'], unique=False)
+    op.create_index('idx_export_jobs_status_created', 'export_jobs', ['status', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_export_jobs_status_created', table_name='export_jobs')
+    op.drop_index('idx_export_jobs_request', table_name='export_jobs')
+    op.drop_index('idx_export_jobs_content', table_name='export_jobs')
+    op.drop_table('export_jobs')
@@ -0,0 +1,52 @@
+"""notification campaigns
+
+Revision ID: a8c2e4b6d915
+Revises: f3b7d9e1a264
+Create Date: 2026-10-18 13:26:08.417532
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8c2e4b6d915'
+down_revision: Union[str, Sequence[str], None] = 'f3b7d9e1a264'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('notification_campaigns',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('trigger', sa.String(length=50), nullable=False),
+    sa.Column('channel', sa.String(length=20), nullable=False),
+    sa.Column('selector', sa.JSON(), nullable=False),
+    sa.Column('total_targets', sa.Integer(), nullable=False),
+    sa.Column('blocked_results', sa.JSON(), nullable=False),
+    sa.Column('triggered_by', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['triggered_by'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_notification_campaigns_created_at', 'notification_campaigns', ['created_at'], unique=False)
+    with op.batch_alter_table('notifications') as batch_op:
+        batch_op.add_column(sa.Column('campaign_id', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key(
+            'fk_notifications_campaign_id', 'notification_campaigns', ['campaign_id'], ['id']
+        )
+        batch_op.create_index(
+            'idx_notification_campaign_status', ['campaign_id', 'status'], unique=False
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('notifications') as batch_op:
+        batch_op.drop_index('idx_notification_campaign_status')
+        batch_op.drop_constraint('fk_notifications_campaign_id', type_='foreignkey')
+        batch_op.drop_column('campaign_id')
+    op.drop_index('idx_notification_campaigns_created_at', table_name='notification_campaigns')
+    op.drop_table('notification_campaigns')
@@ -0,0 +1,29 @@
+"""permanent document content sha256
+
+Revision ID: b5d1f7c3e820
+Revises: a8c2e4b6d915
+Create Date: 2026-10-18 16:41:27.903214
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d1f7c3e820'
+down_revision: Union[str, Sequence[str], None] = 'a8c2e4b6d915'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'permanent_documents', sa.Column('content_sha256', sa.String(length=64), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('permanent_documents', 'content_sha256')
@@ -0,0 +1,41 @@
+"""document blobs
+
+Revision ID: c7e3a9d2f481
+Revises: b5d1f7c3e820
+Create Date: 2026-10-18 18:12:05.411876
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e3a9d2f481'
+down_revision: Union[str, Sequence[str], None] = 'b5d1f7c3e820'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('document_blobs',
+    sa.Column('sha256', sa.String(length=64), nullable=False),
+    sa.Column('storage_key', sa.String(), nullable=False),
+    sa.Column('size_bytes', sa.BigInteger(), nullable=False),
+    sa.Column('mime_type', sa.String(), nullable=True),
+    sa.Column('ref_count', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('released_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('sha256'),
+    sa.UniqueConstraint('storage_key')
+    )
+    op.create_index('ix_document_blobs_unreferenced', 'document_blobs', ['released_at'], unique=False, postgresql_where=sa.text('ref_count = 0'), sqlite_where=sa.text('ref_count = 0'))
+    op.create_index(op.f('ix_permanent_documents_storage_key'), 'permanent_documents', ['storage_key'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_permanent_documents_storage_key'), table_name='permanent_documents')
+    op.drop_index('ix_document_blobs_unreferenced', table_name='document_blobs', postgresql_where=sa.text('ref_count = 0'), sqlite_where=sa.text('ref_count = 0'))
+    op.drop_table('document_blobs')
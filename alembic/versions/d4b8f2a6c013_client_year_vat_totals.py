@@ -0,0 +1,65 @@
+"""client year vat totals
+
+Revision ID: d4b8f2a6c013
+Revises: c7d1e3f5a902
+Create Date: 2026-10-17 23:52:08.614203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4b8f2a6c013'
+down_revision: Union[str, Sequence[str], None] = 'c7d1e3f5a902'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('client_year_vat_totals',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('client_record_id', sa.Integer(), nullable=False),
+    sa.Column('tax_year', sa.Integer(), nullable=False),
+    sa.Column('income_net', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.Column('expense_net', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.Column('output_vat', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.Column('input_vat', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.Column('filed_income_net', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.Column('periods_count', sa.Integer(), nullable=False),
+    sa.Column('filed_count', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['client_record_id'], ['client_records.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('client_record_id', 'tax_year', name='uq_client_year_vat_totals')
+    )
+    # Backfill from the live work items; the session hook maintains the rows from here on.
+    op.execute(
+        """
+        INSERT INTO client_year_vat_totals (
+            client_record_id, tax_year, income_net, expense_net, output_vat, input_vat,
+            filed_income_net, periods_count, filed_count, updated_at
+        )
+        SELECT
+            client_record_id,
+            CAST(SUBSTR(period, 1, 4) AS INTEGER),
+            COALESCE(SUM(total_output_net), 0),
+            COALESCE(SUM(total_input_net), 0),
+            COALESCE(SUM(total_output_vat), 0),
+            COALESCE(SUM(total_input_vat), 0),
+            COALESCE(SUM(CASE WHEN status = 'filed' THEN total_output_net ELSE 0 END), 0),
+            COUNT(id),
+            SUM(CASE WHEN status = 'filed' THEN 1 ELSE 0 END),
+            CURRENT_TIMESTAMP
+        FROM vat_work_items
+        WHERE deleted_at IS NULL
+        GROUP BY client_record_id, CAST(SUBSTR(period, 1, 4) AS INTEGER)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('client_year_vat_totals')
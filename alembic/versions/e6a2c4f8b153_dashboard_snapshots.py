@@ -0,0 +1,37 @@
+"""dashboard snapshots
+
+Revision ID: e6a2c4f8b153
+Revises: d4b8f2a6c013
+Create Date: 2026-10-18 09:14:37.502816
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a2c4f8b153'
+down_revision: Union[str, Sequence[str], None] = 'd4b8f2a6c013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('dashboard_snapshots',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('role', sa.String(length=20), nullable=False),
+    sa.Column('reference_date', sa.Date(), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('etag', sa.String(length=64), nullable=False),
+    sa.Column('computed_at', sa.DateTime(), nullable=False),
+    sa.Column('dirty_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('role', 'reference_date', name='uq_dashboard_snapshots_role_date')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('dashboard_snapshots')
@@ -1,18 +1,31 @@
 from __future__ import annotations
 
+from functools import cache
+
 from app.binders.models.binder import Binder, BinderCapacityStatus, BinderLocationStatus
 from app.binders.services.binder_lifecycle_service import BinderLifecycleService
 
 
+@cache
+def _action_keys_for_state(
+    location_status: BinderLocationStatus,
+    capacity_status: BinderCapacityStatus,
+) -> tuple[str, ...]:
+    # Depends on the state pair only, so list endpoints share one tuple per state.
+    return tuple(
+        BinderLifecycleService.get_available_action_keys_for_state(
+            location_status=location_status,
+            capacity_status=capacity_status,
+        )
+    )
+
+
 def get_binder_actions_for_state(
     *,
     location_status: BinderLocationStatus,
     capacity_status: BinderCapacityStatus,
 ) -> list[str]:
-    return BinderLifecycleService.get_available_action_keys_for_state(
-        location_status=location_status,
-        capacity_status=capacity_status,
-    )
+    return list(_action_keys_for_state(location_status, capacity_status))
 
 
 def get_binder_actions(binder: Binder) -> list[str]:
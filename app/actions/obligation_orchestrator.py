@@ -28,7 +28,7 @@ class ObligationResult:
         return self.reports_created
 
 
-def _years_to_generate(reference_date: date | None = None) -> list[int]:
+def years_to_generate(reference_date: date | None = None) -> list[int]:
     if not 2 <= CLIENT_OBLIGATION_NEXT_YEAR_START_MONTH <= 12:
         raise ValueError("CLIENT_OBLIGATION_NEXT_YEAR_START_MONTH must be between 2 and 12")
     today = reference_date or date.today()
@@ -90,7 +90,7 @@ def generate_client_obligations_result(
     Tax periods and annual reports are created in two separate stages, and each year is saved in an independent savepoint.
     Therefore, a situation may occur where some periods were created without a matching annual report, or vice versa, if another stage failed.
     """
-    years = _years_to_generate(reference_date)
+    years = years_to_generate(reference_date)
     result = ObligationResult()
     if not ClientRecordRepository(db).get_by_id(client_record_id):
         if best_effort:
@@ -1,4 +1,5 @@
 from datetime import date
+from typing import Literal
 
 from fastapi import APIRouter, Depends, Query
 
@@ -33,11 +34,13 @@ def list_advance_payments_overview(
     status: list[AdvancePaymentStatus] | None = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=200),
+    cursor: str | None = Query(None),
+    count: Literal["exact", "estimated"] = Query("exact"),
 ):
     resolved_statuses = status if status else None
 
     service = AdvancePaymentAnalyticsService(db)
-    rows, total = service.list_overview(
+    rows, total, next_cursor = service.list_overview_page(
         year=year,
         month=month,
         due_date=due_date,
@@ -46,6 +49,8 @@ def list_advance_payments_overview(
         statuses=resolved_statuses,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        count_mode=count,
     )
     kpis = service.get_overview_kpis(
         year=year,
@@ -84,6 +89,7 @@ def list_advance_payments_overview(
         page=page,
         page_size=page_size,
         total=total,
+        next_cursor=next_cursor,
         total_expected=kpis["total_expected"],
         total_paid=kpis["total_paid"],
         collection_rate=kpis["collection_rate"],
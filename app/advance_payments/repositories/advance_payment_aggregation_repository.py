@@ -14,6 +14,7 @@ from app.clients.models.client_record import ClientRecord
 from app.clients.models.legal_entity import LegalEntity
 from app.clients.repositories.active_client_scope import scope_to_active_clients_stmt
 from app.common.repositories.base_repository import BaseRepository
+from app.common.repositories.keyset import CountMode, Keyset, KeysetColumn
 
 
 @dataclass(slots=True, frozen=True)
@@ -38,6 +39,20 @@ def advance_payment_matches_month_expr(month: int):
     return (start_month <= month) & (end_month >= month)
 
 
+def _business_name_expr():
+    return func.coalesce(LegalEntity.official_name, "")
+
+
+_OVERVIEW_KEYSET = Keyset(
+    "advance_payments.overview",
+    [
+        KeysetColumn(_business_name_expr()),
+        KeysetColumn(AdvancePayment.period),
+        KeysetColumn(AdvancePayment.id),
+    ],
+)
+
+
 def _overview_filters(
     year: int,
     month: int | None,
@@ -99,50 +114,44 @@ class AdvancePaymentAggregationRepository(BaseRepository):
         client_search: str | None = None,
         due_date: date | None = None,
         period_months_count: int | None = None,
-    ) -> tuple[list[AdvancePaymentOverviewRow], int]:
+        cursor: str | None = None,
+        count_mode: CountMode = "exact",
+    ) -> tuple[list[AdvancePaymentOverviewRow], int | None, str | None]:
         filters = _overview_filters(
             year, month, statuses, due_date, period_months_count, client_search
         )
-
-        count_stmt = (
-            scope_to_active_clients_stmt(select(func.count(AdvancePayment.id)), AdvancePayment)
-            .outerjoin(LegalEntity, LegalEntity.id == ClientRecord.legal_entity_id)
-            .where(*filters)
-        )
-        total = self.db.scalar(count_stmt)
-
-        offset = (page - 1) * page_size
         stmt = (
             scope_to_active_clients_stmt(
                 select(
                     AdvancePayment,
                     ClientRecord.office_client_number,
-                    func.coalesce(LegalEntity.official_name, "").label("business_name"),
+                    _business_name_expr().label("business_name"),
                     LegalEntity.id_number,
                 ),
                 AdvancePayment,
             )
             .outerjoin(LegalEntity, LegalEntity.id == ClientRecord.legal_entity_id)
             .where(*filters)
-            .order_by(
-                func.coalesce(LegalEntity.official_name, "").asc(),
-                AdvancePayment.period.asc(),
-            )
-            .offset(offset)
-            .limit(page_size)
+        )
+        result = self.fetch_page(
+            stmt,
+            _OVERVIEW_KEYSET,
+            cursor=cursor,
+            page=page,
+            page_size=page_size,
+            count_mode=count_mode,
+            entities=False,
         )
         rows = [
             AdvancePaymentOverviewRow(
-                payment=payment,
-                office_client_number=office_client_number,
-                business_name=business_name,
-                id_number=id_number,
+                payment=row.AdvancePayment,
+                office_client_number=row.office_client_number,
+                business_name=row.business_name,
+                id_number=row.id_number,
             )
-            for payment, office_client_number, business_name, id_number in self.db.execute(
-                stmt
-            ).all()
+            for row in result.items
         ]
-        return rows, int(total or 0)
+        return rows, result.total, result.next_cursor
 
     def sum_paid_by_client_year(self, client_record_id: int, year: int) -> float:
         result = self.db.scalar(
@@ -1,18 +1,14 @@
 from sqlalchemy import case, func, select, tuple_
-from sqlalchemy.orm import Session
 
 from app.advance_payments.models.advance_payment import (
     AdvancePayment,
     AdvancePaymentStatus,
 )
 from app.clients.repositories.active_client_scope import scope_to_active_clients_stmt
-from app.common.repositories.base_repository import BaseRepository
+from app.common.repositories.read_repository import ReadRepository
 
 
-class AdvancePaymentDashboardRepository(BaseRepository):
-    def __init__(self, db: Session):
-        super().__init__(db)
-
+class AdvancePaymentDashboardRepository(ReadRepository):
     def completion_for_period(self, period: str, period_months_count: int) -> tuple[int, int]:
         paid_expr = case(
             (AdvancePayment.status == AdvancePaymentStatus.PAID, 1),
@@ -159,6 +159,7 @@ class AdvancePaymentOverviewResponse(BaseModel):
     page: int
     page_size: int
     total: int
+    next_cursor: str | None = None
     total_expected: ApiDecimal | None = None
     total_paid: ApiDecimal | None = None
     collection_rate: float | None = None  # 0.0–100.0
@@ -21,6 +21,7 @@ from app.advance_payments.repositories.turnover_lookup_repository import (
 )
 from app.advance_payments.schemas.advance_payment import MonthBatchSummary
 from app.clients.repositories.client_record_repository import ClientRecordRepository
+from app.common.repositories.keyset import CountMode
 from app.core.exceptions import NotFoundError
 
 
@@ -56,10 +57,36 @@ class AdvancePaymentAnalyticsService:
         due_date: date | None = None,
         period_months_count: int | None = None,
     ) -> tuple[list[AdvancePaymentOverviewEnrichedRow], int]:
+        rows, total, _ = self.list_overview_page(
+            year=year,
+            month=month,
+            statuses=statuses,
+            page=page,
+            page_size=page_size,
+            client_search=client_search,
+            due_date=due_date,
+            period_months_count=period_months_count,
+        )
+        return rows, total
+
+    def list_overview_page(
+        self,
+        year: int,
+        month: int | None = None,
+        statuses: list[AdvancePaymentStatus] | None = None,
+        page: int = 1,
+        page_size: int = 50,
+        client_search: str | None = None,
+        due_date: date | None = None,
+        period_months_count: int | None = None,
+        cursor: str | None = None,
+        count_mode: CountMode = "exact",
+    ) -> tuple[list[AdvancePaymentOverviewEnrichedRow], int, str | None]:
+        """`list_overview` plus the keyset `next_cursor`; a cursor replaces `page`."""
         if statuses is None:
             statuses = list(AdvancePaymentStatus)
 
-        rows, total = self.repo.list_overview_payment_rows(
+        rows, total, next_cursor = self.repo.list_overview_payment_rows(
             year=year,
             month=month,
             statuses=statuses,
@@ -68,6 +95,8 @@ class AdvancePaymentAnalyticsService:
             client_search=client_search,
             due_date=due_date,
             period_months_count=period_months_count,
+            cursor=cursor,
+            count_mode=count_mode,
         )
 
         turnover_repo = TurnoverLookupRepository(self.db)
@@ -87,7 +116,7 @@ class AdvancePaymentAnalyticsService:
             )
             for row in rows
         ]
-        return enriched, total
+        return enriched, total, next_cursor
 
     @staticmethod
     def _build_live_turnover_map(
@@ -60,7 +60,9 @@ def _get_font() -> str:
 
         for path in _HEBREW_FONT_CANDIDATES:
             if os.path.exists(path):
-                pdfmetrics.registerFont(TTFont("Hebrew", path))
+                # Parsing the TTF is the slow part; do it once per process.
+                if "Hebrew" not in pdfmetrics.getRegisteredFontNames():
+                    pdfmetrics.registerFont(TTFont("Hebrew", path))
                 return "Hebrew"
     except Exception:
         pass
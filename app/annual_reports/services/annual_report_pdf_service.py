@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from decimal import Decimal
+
 from sqlalchemy.orm import Session
 
 from app.annual_reports.repositories.annual_report_repository import (
     AnnualReportRepository,
 )
+from app.annual_reports.schemas.annual_report_financials import (
+    FinancialSummaryResponse,
+    TaxCalculationResponse,
+)
 from app.annual_reports.services.annual_report_pdf_builder import build_pdf
-from app.annual_reports.services.detail_service import AnnualReportDetailService
 from app.annual_reports.services.financial_service import AnnualReportFinancialService
 from app.annual_reports.services.messages import (
     ANNUAL_REPORT_NOT_FOUND,
@@ -18,11 +24,31 @@ from app.clients.repositories.client_record_repository import ClientRecordReposi
 from app.core.exceptions import NotFoundError
 
 
+@dataclass(frozen=True)
+class AnnualReportPdfHeader:
+    """The report fields the PDF needs, detached from the session (picklable)."""
+
+    tax_year: int
+    client_type: str | None
+    status: str
+    ita_reference: str | None
+    refund_due: Decimal | None
+    tax_due: Decimal | None
+
+
+@dataclass(frozen=True)
+class AnnualReportPdfInput:
+    report: AnnualReportPdfHeader
+    client_name: str
+    summary: FinancialSummaryResponse
+    tax: TaxCalculationResponse
+
+
 class AnnualReportPdfService:
     def __init__(self, db: Session):
         self.db = db
 
-    def generate(self, report_id: int) -> tuple[bytes, int]:
+    def load(self, report_id: int) -> AnnualReportPdfInput:
         repo = AnnualReportRepository(self.db)
         report = repo.get_by_id(report_id)
         if not report:
@@ -39,13 +65,31 @@ class AnnualReportPdfService:
         )
 
         fin_svc = AnnualReportFinancialService(self.db)
-        summary = fin_svc.get_financial_summary(report_id)
-        tax = fin_svc.get_tax_calculation(report_id)
+        return AnnualReportPdfInput(
+            report=AnnualReportPdfHeader(
+                tax_year=report.tax_year,
+                client_type=_value(report.client_type),
+                status=_value(report.status),
+                ita_reference=report.ita_reference,
+                refund_due=report.refund_due,
+                tax_due=report.tax_due,
+            ),
+            client_name=client_name,
+            summary=fin_svc.get_financial_summary(report_id),
+            tax=fin_svc.get_tax_calculation(report_id),
+        )
+
+    def generate(self, report_id: int) -> tuple[bytes, int]:
+        data = self.load(report_id)
+        return render(data), data.report.tax_year
+
+
+def render(data: AnnualReportPdfInput) -> bytes:
+    return build_pdf(data.report, data.client_name, data.summary, data.tax, None)
 
-        detail_svc = AnnualReportDetailService(self.db)
-        detail = detail_svc.get_detail(report_id)
 
-        return build_pdf(report, client_name, summary, tax, detail), report.tax_year
+def _value(value) -> str | None:  # noqa: ANN001
+    return value.value if hasattr(value, "value") else value
 
 
-__all__ = ["AnnualReportPdfService"]
+__all__ = ["AnnualReportPdfInput", "AnnualReportPdfService", "render"]
@@ -29,6 +29,31 @@ from .messages import (
 )
 
 
+def report_created_status_history(report: AnnualReport, changed_by: int) -> dict:
+    """The status-history entry opening a new report's history."""
+    return {
+        "annual_report_id": report.id,
+        "from_status": None,
+        "to_status": AnnualReportStatus.NOT_STARTED,
+        "changed_by": changed_by,
+        "note": ANNUAL_REPORT_CREATED_NOTE.format(
+            form_type=report.form_type.value,
+            filing_deadline=report.filing_deadline.strftime("%d/%m/%Y")
+            if report.filing_deadline
+            else DEADLINE_NOT_SET,
+        ),
+    }
+
+
+def report_created_audit(report: AnnualReport) -> dict:
+    return {
+        "tax_year": report.tax_year,
+        "client_type": report.client_type.value,
+        "client_record_id": report.client_record_id,
+        "form_type": report.form_type,
+    }
+
+
 class AnnualReportCreateService(AnnualReportBaseService):
     def create_report(
         self,
@@ -134,28 +159,12 @@ class AnnualReportCreateService(AnnualReportBaseService):
         # Auto-generate required schedules
         self._generate_schedules(linked_report)
 
-        self.repo.append_status_history(
-            annual_report_id=linked_report.id,
-            from_status=None,
-            to_status=AnnualReportStatus.NOT_STARTED,
-            changed_by=created_by,
-            note=ANNUAL_REPORT_CREATED_NOTE.format(
-                form_type=form_type.value,
-                filing_deadline=filing_deadline.strftime("%d/%m/%Y")
-                if filing_deadline
-                else DEADLINE_NOT_SET,
-            ),
-        )
+        self.repo.append_status_history(**report_created_status_history(linked_report, created_by))
 
         EntityAuditWriter(self.db).record_create(
             ENTITY_ANNUAL_REPORT,
             linked_report.id,
             created_by,
-            new_value={
-                "tax_year": tax_year,
-                "client_type": client_type,
-                "client_record_id": client_record_id,
-                "form_type": form_type,
-            },
+            new_value=report_created_audit(linked_report),
         )
         return linked_report
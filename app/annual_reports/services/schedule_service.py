@@ -43,25 +43,25 @@ class AnnualReportScheduleService(AnnualReportBaseService):
 
     # internal
     def _generate_schedules(self, report: AnnualReport) -> None:
-        if report.client_type in {
-            ClientAnnualFilingType.SELF_EMPLOYED,
-            ClientAnnualFilingType.PARTNERSHIP,
-        }:
+        for schedule in required_schedules(report):
             self.repo.add_schedule(
                 annual_report_id=report.id,
-                schedule=AnnualReportSchedule.SCHEDULE_A,
+                schedule=schedule,
                 is_required=True,
             )
-        if report.client_type == ClientAnnualFilingType.PARTNERSHIP:
-            self.repo.add_schedule(
-                annual_report_id=report.id,
-                schedule=AnnualReportSchedule.FORM_1504,
-                is_required=True,
-            )
-        for flag_attr, schedule in SCHEDULE_FLAGS:
-            if getattr(report, flag_attr, False):
-                self.repo.add_schedule(
-                    annual_report_id=report.id,
-                    schedule=schedule,
-                    is_required=True,
-                )
+
+
+def required_schedules(report: AnnualReport) -> list[AnnualReportSchedule]:
+    """Schedules a new report must carry, from its filing type and income flags."""
+    schedules = []
+    if report.client_type in {
+        ClientAnnualFilingType.SELF_EMPLOYED,
+        ClientAnnualFilingType.PARTNERSHIP,
+    }:
+        schedules.append(AnnualReportSchedule.SCHEDULE_A)
+    if report.client_type == ClientAnnualFilingType.PARTNERSHIP:
+        schedules.append(AnnualReportSchedule.FORM_1504)
+    for flag_attr, schedule in SCHEDULE_FLAGS:
+        if getattr(report, flag_attr, False):
+            schedules.append(schedule)
+    return schedules
@@ -30,6 +30,9 @@ from app.annual_reports.services.messages import (
     VAT_IMPORTED_EXPENSE_DESCRIPTION,
 )
 from app.core.exceptions import AppError, ConflictError, NotFoundError
+from app.vat_reports.repositories.client_year_vat_totals_repository import (
+    ClientYearVatTotalsRepository,
+)
 from app.vat_reports.repositories.vat_invoice_aggregation_repository import (
     VatInvoiceAggregationRepository,
 )
@@ -78,6 +81,7 @@ class VatImportService:
         self.income_repo = AnnualReportIncomeRepository(db)
         self.expense_repo = AnnualReportExpenseRepository(db)
         self.vat_agg_repo = VatInvoiceAggregationRepository(db)
+        self.vat_totals_repo = ClientYearVatTotalsRepository(db)
 
     def auto_populate(self, report_id: int, force: bool = False) -> dict:
         """Import VAT income/expense data into annual report lines.
@@ -116,11 +120,16 @@ class VatImportService:
                 self.expense_repo.delete(line.id)
                 lines_deleted += 1
 
-        income_total = self.vat_agg_repo.sum_income_net_by_client_year(
-            report.client_record_id, report.tax_year
-        )
-        expense_by_vat_cat = self.vat_agg_repo.sum_expense_net_by_client_year_grouped(
-            report.client_record_id, report.tax_year
+        vat_totals = self.vat_totals_repo.get(report.client_record_id, report.tax_year)
+        has_vat_periods = vat_totals is not None and vat_totals.periods_count > 0
+        income_total = vat_totals.income_net if has_vat_periods else Decimal("0")
+        # The per-category split is only in the invoices; skip it when the year has no VAT.
+        expense_by_vat_cat = (
+            self.vat_agg_repo.sum_expense_net_by_client_year_grouped(
+                report.client_record_id, report.tax_year
+            )
+            if has_vat_periods
+            else {}
         )
 
         income_lines_created = 0
@@ -17,6 +17,13 @@ ALLOWED_READ_ENTITY_TYPES = {
     ENTITY_CLIENT,
 }
 
+# Entity types listed in the dashboard's recent activity
+RECENT_ACTIVITY_ENTITY_TYPES = {
+    ENTITY_ANNUAL_REPORT,
+    ENTITY_CHARGE,
+    ENTITY_CLIENT,
+}
+
 INVALID_ENTITY_TYPE_ERROR = "סוג ישות לא נתמך להיסטוריית שינויים"
 ENTITY_NOT_FOUND_ERROR = "הישות המבוקשת לא נמצאה"
 
@@ -1,6 +1,8 @@
 """Repository for EntityAuditLog entities."""
 
-from sqlalchemy import func, select
+from collections.abc import Iterable
+
+from sqlalchemy import func, insert, select
 from sqlalchemy.orm import Session
 
 from app.audit.models.entity_audit_log import EntityAuditLog
@@ -34,6 +36,11 @@ class EntityAuditLogRepository(BaseRepository[EntityAuditLog]):
         self.db.flush()
         return entry
 
+    def append_many(self, rows: list[dict]) -> None:
+        """Insert many entries in one executemany statement (no ORM objects returned)."""
+        if rows:
+            self.db.execute(insert(EntityAuditLog), rows)
+
     def get_audit_trail(
         self,
         entity_type: str,
@@ -60,9 +67,12 @@ class EntityAuditLogRepository(BaseRepository[EntityAuditLog]):
             )
         )
 
-    def list_recent(self, limit: int = 5) -> list[EntityAuditLog]:
+    def list_recent(
+        self, limit: int = 5, entity_types: Iterable[str] | None = None
+    ) -> list[EntityAuditLog]:
+        stmt = select(EntityAuditLog)
+        if entity_types is not None:
+            stmt = stmt.where(EntityAuditLog.entity_type.in_(entity_types))
         return self.db.scalars(
-            select(EntityAuditLog)
-            .order_by(EntityAuditLog.performed_at.desc(), EntityAuditLog.id.desc())
-            .limit(limit)
+            stmt.order_by(EntityAuditLog.performed_at.desc(), EntityAuditLog.id.desc()).limit(limit)
         ).all()
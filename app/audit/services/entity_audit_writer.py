@@ -63,6 +63,30 @@ class EntityAuditWriter:
             note=note,
         )
 
+    def record_create_many(
+        self,
+        entity_type: str,
+        created: list[tuple[int, Any]],
+        actor_id: int | None,
+    ) -> None:
+        """``record_create`` for many ``(entity_id, new_value)`` pairs in one statement."""
+        if actor_id is None:
+            return
+        self._repo.append_many(
+            [
+                {
+                    "entity_type": entity_type,
+                    "entity_id": entity_id,
+                    "performed_by": actor_id,
+                    "action": ACTION_CREATED,
+                    "old_value": None,
+                    "new_value": self._serialize_value(new_value),
+                    "note": None,
+                }
+                for entity_id, new_value in created
+            ]
+        )
+
     def record_update(
         self,
         entity_type: str,
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from fastapi import APIRouter, Depends, Query, Response, status
 
 from app.binders.schemas.binder import BinderListResponse, BinderResponse
@@ -5,6 +7,8 @@ from app.binders.services.binder_list_service import BinderListService
 from app.binders.services.binder_service import BinderService
 from app.binders.services.messages import BINDER_NOT_FOUND
 from app.core.exceptions import NotFoundError
+from app.core.perf import query_budget
+from app.infrastructure.http_cache import ResponseCache, cached_response
 from app.users.api.deps import CurrentUser, DBSession, require_role
 from app.users.models.user import UserRole
 
@@ -16,6 +20,7 @@ router = APIRouter(
 
 
 @router.get("", response_model=BinderListResponse)
+@query_budget(15, max_repeated=5)
 def list_binders(
     db: DBSession,
     user: CurrentUser,
@@ -30,10 +35,18 @@ def list_binders(
     page_size: int = Query(20, ge=1, le=100),
     sort_by: str | None = Query(None),
     sort_dir: str = Query("desc"),
+    cursor: str | None = Query(None),
+    count: Literal["exact", "estimated"] = Query("exact"),
+    cache: ResponseCache = Depends(
+        cached_response("binders", "client_records", "legal_entities")
+    ),
 ):
     """List active binders with optional filters, sorting, and pagination."""
+    cached = cache.lookup()
+    if cached is not None:
+        return cached
     service = BinderListService(db)
-    items, total, counters = service.list_binders_enriched(
+    items, total, counters, next_cursor = service.list_binders_page(
         client_record_id=client_record_id,
         location_status=location_status,
         capacity_status=capacity_status,
@@ -45,13 +58,18 @@ def list_binders(
         sort_dir=sort_dir,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        count_mode=count,
     )
-    return BinderListResponse(
-        items=items,
-        page=page,
-        page_size=page_size,
-        total=total,
-        counters=counters,
+    return cache.store(
+        BinderListResponse(
+            items=items,
+            page=page,
+            page_size=page_size,
+            total=total,
+            next_cursor=next_cursor,
+            counters=counters,
+        )
     )
 
 
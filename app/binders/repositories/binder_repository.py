@@ -10,6 +10,7 @@ from app.clients.models.client_record import ClientRecord
 from app.clients.models.legal_entity import LegalEntity
 from app.clients.repositories.active_client_scope import scope_to_active_clients_stmt
 from app.common.repositories.base_repository import BaseRepository
+from app.common.repositories.keyset import CountMode, Keyset, KeysetColumn, count_rows
 from app.utils.time_utils import utcnow
 
 
@@ -96,22 +97,22 @@ class BinderRepository(BaseRepository[Binder]):
         return stmt
 
     @staticmethod
-    def _order_active_paginated_stmt(stmt, *, sort_by: str, sort_dir: str):
-        order_fn = asc if sort_dir == "asc" else desc
-        effective_sort_dir = sort_dir
-        if sort_by == "days_in_office":
-            effective_sort_dir = "asc" if sort_dir == "desc" else "desc"
-            order_fn = asc if effective_sort_dir == "asc" else desc
-
+    def _active_list_keyset(*, sort_by: str, sort_dir: str) -> Keyset:
+        descending = sort_dir != "asc"
+        scope = f"binders:{sort_by}:{sort_dir}"
         if sort_by == "client_name":
-            name_order = order_fn(LegalEntity.official_name)
-            period_order = (asc if sort_dir == "asc" else desc)(Binder.period_start)
-            return stmt.order_by(
-                nullslast(name_order),
-                nullslast(period_order),
-                Binder.id.asc() if sort_dir == "asc" else Binder.id.desc(),
+            return Keyset(
+                scope,
+                [
+                    KeysetColumn(LegalEntity.official_name, descending, nullable=True),
+                    KeysetColumn(Binder.period_start, descending, nullable=True),
+                    KeysetColumn(Binder.id, descending),
+                ],
             )
 
+        if sort_by == "days_in_office":
+            # Older period_start means more days in office.
+            descending = not descending
         sort_col_map = {
             "period_start": Binder.period_start,
             "days_in_office": Binder.period_start,
@@ -119,7 +120,14 @@ class BinderRepository(BaseRepository[Binder]):
             "capacity_status": Binder.capacity_status,
         }
         col = sort_col_map.get(sort_by, Binder.period_start)
-        return stmt.order_by(nullslast(order_fn(col)))
+        return Keyset(
+            scope,
+            [
+                # NULLs in period_start (newly opened binders without material) sort last.
+                KeysetColumn(col, descending, nullable=col is Binder.period_start),
+                KeysetColumn(Binder.id, descending),
+            ],
+        )
 
     def create(
         self,
@@ -169,8 +177,6 @@ class BinderRepository(BaseRepository[Binder]):
 
         By default excludes handed-over binders.
         """
-        from sqlalchemy import asc, desc
-
         stmt = self._active_client_stmt().where(Binder.deleted_at.is_(None))
         if not include_handed_over:
             stmt = stmt.where(Binder.location_status != BinderLocationStatus.HANDED_OVER)
@@ -219,31 +225,30 @@ class BinderRepository(BaseRepository[Binder]):
         sort_dir: str = "desc",
         page: int = 1,
         page_size: int = 20,
-    ) -> tuple[list[Binder], int]:
-        include_legal_entity = sort_by == "client_name"
-        base_kwargs = {
-            "client_record_id": client_record_id,
-            "location_status": location_status,
-            "capacity_status": capacity_status,
-            "include_handed_over": include_handed_over,
-            "query": query,
-            "client_name_filter": client_name_filter,
-            "binder_number": binder_number,
-            "year": year,
-            "include_legal_entity": include_legal_entity,
-        }
-        count_stmt = self._filtered_active_stmt(
-            select(func.count(Binder.id)),
-            **base_kwargs,
+        cursor: str | None = None,
+        count_mode: CountMode = "exact",
+    ) -> tuple[list[Binder], int | None, str | None]:
+        stmt = self._filtered_active_stmt(
+            select(Binder),
+            client_record_id=client_record_id,
+            location_status=location_status,
+            capacity_status=capacity_status,
+            include_handed_over=include_handed_over,
+            query=query,
+            client_name_filter=client_name_filter,
+            binder_number=binder_number,
+            year=year,
+            include_legal_entity=sort_by == "client_name",
         )
-        stmt = self._filtered_active_stmt(select(Binder), **base_kwargs)
-        stmt = self._order_active_paginated_stmt(
+        result = self.fetch_page(
             stmt,
-            sort_by=sort_by,
-            sort_dir=sort_dir,
+            self._active_list_keyset(sort_by=sort_by, sort_dir=sort_dir),
+            cursor=cursor,
+            page=page,
+            page_size=page_size,
+            count_mode=count_mode,
         )
-        stmt = self.apply_pagination(stmt, page, page_size)
-        return list(self.db.scalars(stmt).all()), int(self.db.scalar(count_stmt) or 0)
+        return result.items, result.total, result.next_cursor
 
     def list_active_paginated_projected(
         self,
@@ -260,10 +265,9 @@ class BinderRepository(BaseRepository[Binder]):
         sort_dir: str = "desc",
         page: int = 1,
         page_size: int = 20,
-    ) -> tuple[list[BinderListRow], int]:
-        # LegalEntity join is needed for count only when filtering/sorting by client_name.
-        # The projection SELECT always needs it to populate client fields.
-        needs_join_for_filter = sort_by == "client_name" or bool(query or client_name_filter)
+        cursor: str | None = None,
+        count_mode: CountMode = "exact",
+    ) -> tuple[list[BinderListRow], int | None, str | None]:
         filter_kwargs = dict(
             client_record_id=client_record_id,
             location_status=location_status,
@@ -274,11 +278,15 @@ class BinderRepository(BaseRepository[Binder]):
             binder_number=binder_number,
             year=year,
         )
-
-        count_stmt = self._filtered_active_stmt(
-            select(func.count(Binder.id)),
-            **filter_kwargs,
-            include_legal_entity=needs_join_for_filter,
+        # LegalEntity join is needed for count only when filtering/sorting by client_name.
+        # The projection SELECT always needs it to populate client fields.
+        needs_join_for_filter = sort_by == "client_name" or bool(query or client_name_filter)
+        total = count_rows(
+            self.db,
+            self._filtered_active_stmt(
+                select(Binder.id), **filter_kwargs, include_legal_entity=needs_join_for_filter
+            ),
+            count_mode,
         )
 
         proj_stmt = self._filtered_active_stmt(
@@ -302,8 +310,14 @@ class BinderRepository(BaseRepository[Binder]):
             **filter_kwargs,
             include_legal_entity=True,
         )
-        proj_stmt = self._order_active_paginated_stmt(proj_stmt, sort_by=sort_by, sort_dir=sort_dir)
-        proj_stmt = self.apply_pagination(proj_stmt, page, page_size)
+        result = self.fetch_page(
+            proj_stmt,
+            self._active_list_keyset(sort_by=sort_by, sort_dir=sort_dir),
+            cursor=cursor,
+            page=page,
+            page_size=page_size,
+            entities=False,
+        )
 
         rows = [
             BinderListRow(
@@ -323,9 +337,9 @@ class BinderRepository(BaseRepository[Binder]):
                 notes=row.notes,
                 created_at=row.created_at,
             )
-            for row in self.db.execute(proj_stmt).all()
+            for row in result.items
         ]
-        return rows, int(self.db.scalar(count_stmt) or 0)
+        return rows, total, result.next_cursor
 
     def count_by_lifecycle_filtered(
         self,
@@ -524,7 +538,9 @@ class BinderRepository(BaseRepository[Binder]):
             result.setdefault(binder.client_record_id, binder)
         return result
 
-    def list_overdue_handover(self, overdue_days: int = 30, limit: int = 50) -> list[Binder]:
+    def list_overdue_handover(
+        self, overdue_days: int = 30, limit: int | None = 50
+    ) -> list[Binder]:
         """Return ready-for-handover binders older than overdue_days."""
         cutoff = utcnow() - _dt.timedelta(days=overdue_days)
         stmt = (
@@ -83,6 +83,7 @@ class BinderListResponse(BaseModel):
     page: int
     page_size: int
     total: int
+    next_cursor: str | None = None
     counters: BinderListCounters
 
 
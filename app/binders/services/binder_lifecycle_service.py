@@ -35,6 +35,26 @@ ACTION_REVERT_READY_FOR_HANDOVER = "revert_ready_for_handover"
 ACTION_HANDOVER_TO_CLIENT = "handover_to_client"
 
 
+def initial_state_log_rows(
+    binder: Binder, changed_by_user_id: int, notes: str | None = None
+) -> list[dict]:
+    """Lifecycle log rows recording a new binder's starting location and capacity."""
+    return [
+        {
+            "binder_id": binder.id,
+            "field_name": field_name,
+            "old_value": "null",
+            "new_value": value,
+            "changed_by_user_id": changed_by_user_id,
+            "notes": notes or BINDER_RECEIVED,
+        }
+        for field_name, value in (
+            ("location_status", binder.location_status.value),
+            ("capacity_status", binder.capacity_status.value),
+        )
+    ]
+
+
 class BinderLifecycleService:
     """Owns binder lifecycle state transitions and their side effects."""
 
@@ -348,19 +368,5 @@ class BinderLifecycleService:
         changed_by_user_id: int,
         notes: str | None = None,
     ) -> None:
-        self._append_log(
-            binder,
-            "location_status",
-            "null",
-            binder.location_status.value,
-            changed_by_user_id,
-            notes or BINDER_RECEIVED,
-        )
-        self._append_log(
-            binder,
-            "capacity_status",
-            "null",
-            binder.capacity_status.value,
-            changed_by_user_id,
-            notes or BINDER_RECEIVED,
-        )
+        for row in initial_state_log_rows(binder, changed_by_user_id, notes):
+            self.lifecycle_log_repo.append(**row)
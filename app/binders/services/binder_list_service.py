@@ -1,14 +1,13 @@
 from datetime import date
 
-from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.actions.action_registry import get_binder_actions, get_binder_actions_for_state
 from app.binders.models.binder import Binder
 from app.binders.repositories.binder_repository import BinderListRow, BinderRepository
 from app.binders.schemas.binder import BinderResponse
-from app.clients.models.legal_entity import LegalEntity
-from app.clients.repositories.client_record_repository import ClientRecordRepository
+from app.clients.repositories.client_identity_loader import ClientIdentityLoader
+from app.common.repositories.keyset import CountMode
 
 _ALLOWED_SORT_COLS = {
     "period_start",
@@ -26,37 +25,16 @@ class BinderListService:
     def __init__(self, db: Session):
         self.db = db
         self.binder_repo = BinderRepository(db)
-        self.client_record_repo = ClientRecordRepository(db)
+        self.identity_loader = ClientIdentityLoader(db)
 
     def _build_client_context_maps(
         self, client_record_ids: list[int]
     ) -> tuple[dict[int, int | None], dict[int, str], dict[int, str | None]]:
-        client_records = (
-            self.client_record_repo.list_by_ids(client_record_ids) if client_record_ids else []
-        )
-        legal_entity_ids = list({record.legal_entity_id for record in client_records})
-        legal_entity_by_id = (
-            {
-                entity.id: entity
-                for entity in self.db.scalars(
-                    select(LegalEntity).where(LegalEntity.id.in_(legal_entity_ids))
-                ).all()
-            }
-            if legal_entity_ids
-            else {}
-        )
+        identities = self.identity_loader.load(client_record_ids)
         return (
-            {record.id: record.office_client_number for record in client_records},
-            {
-                record.id: legal_entity_by_id[record.legal_entity_id].official_name
-                for record in client_records
-                if record.legal_entity_id in legal_entity_by_id
-            },
-            {
-                record.id: legal_entity_by_id[record.legal_entity_id].id_number
-                for record in client_records
-                if record.legal_entity_id in legal_entity_by_id
-            },
+            {client_id: identity.office_client_number for client_id, identity in identities.items()},
+            {client_id: identity.official_name for client_id, identity in identities.items()},
+            {client_id: identity.id_number for client_id, identity in identities.items()},
         )
 
     def build_binder_response(
@@ -150,12 +128,47 @@ class BinderListService:
         page_size: int = 20,
         reference_date: date | None = None,
     ) -> tuple[list[BinderResponse], int, dict[str, int]]:
+        items, total, counters, _ = self.list_binders_page(
+            client_record_id=client_record_id,
+            location_status=location_status,
+            capacity_status=capacity_status,
+            query=query,
+            client_name_filter=client_name_filter,
+            binder_number=binder_number,
+            year=year,
+            sort_by=sort_by,
+            sort_dir=sort_dir,
+            page=page,
+            page_size=page_size,
+            reference_date=reference_date,
+        )
+        return items, total, counters
+
+    def list_binders_page(
+        self,
+        *,
+        client_record_id: int | None = None,
+        location_status: str | None = None,
+        capacity_status: str | None = None,
+        query: str | None = None,
+        client_name_filter: str | None = None,
+        binder_number: str | None = None,
+        year: int | None = None,
+        sort_by: str = "period_start",
+        sort_dir: str = "desc",
+        page: int = 1,
+        page_size: int = 20,
+        cursor: str | None = None,
+        count_mode: CountMode = "exact",
+        reference_date: date | None = None,
+    ) -> tuple[list[BinderResponse], int, dict[str, int], str | None]:
+        """`list_binders_enriched` plus the keyset `next_cursor`; a cursor replaces `page`."""
         if sort_dir not in ("asc", "desc"):
             sort_dir = "desc"
         effective_sort_by = sort_by if sort_by in _ALLOWED_SORT_COLS else "period_start"
 
         ref_date = reference_date or date.today()
-        rows, total = self.binder_repo.list_active_paginated_projected(
+        rows, total, next_cursor = self.binder_repo.list_active_paginated_projected(
             client_record_id=client_record_id,
             location_status=location_status,
             capacity_status=capacity_status,
@@ -168,6 +181,8 @@ class BinderListService:
             sort_dir=sort_dir,
             page=page,
             page_size=page_size,
+            cursor=cursor,
+            count_mode=count_mode,
         )
         counters = self.binder_repo.count_by_lifecycle_filtered(
             client_record_id=client_record_id,
@@ -178,4 +193,4 @@ class BinderListService:
         )
 
         items = [self._row_to_response(row, ref_date) for row in rows]
-        return items, total, counters
+        return items, total, counters, next_cursor
@@ -8,7 +8,11 @@ from app.clients.models.client_record import ClientRecord
 
 _log = logging.getLogger(__name__)
 
-_AUTO_BINDER_LIFECYCLE_LOG_NOTES = "קלסר נפתח אוטומטית"
+AUTO_BINDER_LIFECYCLE_LOG_NOTES = "קלסר נפתח אוטומטית"
+
+
+def initial_binder_number(client_record: ClientRecord, seq: int = 1) -> str:
+    return f"{client_record.office_client_number}/{seq}"
 
 
 def create_initial_binder(
@@ -34,12 +38,12 @@ def create_initial_binder(
     seq = binder_repo.count_all_by_client(client_record.id) + 1
     binder = binder_repo.create(
         client_record_id=client_record.id,
-        binder_number=f"{client_record.office_client_number}/{seq}",
+        binder_number=initial_binder_number(client_record, seq),
         period_start=None,
         created_by=actor_id,
     )
     BinderLifecycleService(db).log_initial_state(
         binder=binder,
         changed_by_user_id=actor_id,
-        notes=_AUTO_BINDER_LIFECYCLE_LOG_NOTES,
+        notes=AUTO_BINDER_LIFECYCLE_LOG_NOTES,
     )
@@ -23,6 +23,14 @@ def _serialize(d: dict) -> dict:
     }
 
 
+def business_created_audit(business: Business, client_record_id: int) -> dict:
+    return {
+        "client_record_id": client_record_id,
+        "business_name": business.business_name,
+        "opened_at": business.opened_at,
+    }
+
+
 class BusinessService:
     """Business management — CRUD and lifecycle logic."""
 
@@ -101,11 +109,7 @@ class BusinessService:
             ENTITY_BUSINESS,
             business.id,
             actor_id,
-            new_value={
-                "client_record_id": client_record_id,
-                "business_name": business_name,
-                "opened_at": effective_opened_at,
-            },
+            new_value=business_created_audit(business, client_record_id),
         )
         return business
 
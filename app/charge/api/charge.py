@@ -1,4 +1,5 @@
 import datetime
+from typing import Literal
 
 from fastapi import APIRouter, Body, Depends, Query, Response, status
 
@@ -14,6 +15,7 @@ from app.charge.services.billing_service import BillingService
 from app.charge.services.bulk_billing_service import BulkBillingService
 from app.charge.services.charge_query_service import ChargeQueryService
 from app.charge.services.charge_response_builder import ChargeResponseBuilder
+from app.core.perf import query_budget
 from app.infrastructure.idempotency import IdempotencyGuard, require_idempotency_key
 from app.users.api.deps import CurrentUser, DBSession, require_role
 from app.users.models.user import UserRole
@@ -87,6 +89,7 @@ def cancel_charge(
     response_model=ChargeListResponse,
     dependencies=[Depends(require_role(UserRole.ADVISOR, UserRole.SECRETARY))],
 )
+@query_budget(20, max_repeated=5)
 def list_charges(
     db: DBSession,
     business_id: int | None = None,
@@ -98,6 +101,8 @@ def list_charges(
     issued_before: datetime.date | None = None,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
+    count: Literal["exact", "estimated"] = Query("exact"),
 ):
     return ChargeQueryService(db).list_charges_paginated(
         business_id=business_id,
@@ -109,6 +114,8 @@ def list_charges(
         issued_before=issued_before,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        count_mode=count,
     )
 
 
@@ -7,6 +7,12 @@ from sqlalchemy.orm import Session
 from app.charge.models.charge import Charge, ChargeStatus
 from app.clients.repositories.active_client_scope import scope_to_active_clients_stmt
 from app.common.repositories.base_repository import BaseRepository
+from app.common.repositories.keyset import CountMode, Keyset, KeysetColumn, KeysetPage
+
+_LIST_KEYSET = Keyset(
+    "charges",
+    [KeysetColumn(Charge.created_at, descending=True), KeysetColumn(Charge.id, descending=True)],
+)
 
 
 class ChargeRepository(BaseRepository[Charge]):
@@ -106,15 +112,49 @@ class ChargeRepository(BaseRepository[Charge]):
         page: int = 1,
         page_size: int = 20,
     ) -> list[Charge]:
+        return self.list_charges_page(
+            client_record_id=client_record_id,
+            business_id=business_id,
+            business_ids=business_ids,
+            status=status,
+            charge_type=charge_type,
+            period=period,
+            issued_after=issued_after,
+            issued_before=issued_before,
+            page=page,
+            page_size=page_size,
+        ).items
+
+    def list_charges_page(
+        self,
+        client_record_id: int | None = None,
+        business_id: int | None = None,
+        business_ids: list[int] | None = None,
+        status: str | None = None,
+        charge_type: str | None = None,
+        period: str | None = None,
+        issued_after: date | None = None,
+        issued_before: date | None = None,
+        page: int = 1,
+        page_size: int = 20,
+        cursor: str | None = None,
+        count_mode: CountMode = "none",
+    ) -> KeysetPage[Charge]:
+        """Newest first, `id` as tiebreaker; a cursor replaces `page`."""
         stmt = self._base_stmt(
             client_record_id, business_id, business_ids, status, charge_type,
             period, issued_after, issued_before,
         )
         if stmt is None:
-            return []
-        stmt = stmt.order_by(Charge.created_at.desc())
-        stmt = self.apply_pagination(stmt, page, page_size)
-        return list(self.db.scalars(stmt).all())
+            return KeysetPage(items=[], total=None if count_mode == "none" else 0)
+        return self.fetch_page(
+            stmt,
+            _LIST_KEYSET,
+            cursor=cursor,
+            page=page,
+            page_size=page_size,
+            count_mode=count_mode,
+        )
 
     def list_charges_by_client_record(
         self,
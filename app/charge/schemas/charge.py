@@ -75,6 +75,7 @@ class ChargeListResponse(BaseModel):
     page: int
     page_size: int
     total: int
+    next_cursor: str | None = None
     stats: ChargeListStats
 
 
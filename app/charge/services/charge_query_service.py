@@ -17,6 +17,7 @@ from app.clients.repositories.client_record_read_repository import (
     get_full_records_bulk,
 )
 from app.clients.repositories.client_record_repository import ClientRecordRepository
+from app.common.repositories.keyset import CountMode
 
 
 class ChargeQueryService:
@@ -47,60 +48,30 @@ class ChargeQueryService:
         issued_before: date | None = None,
         page: int = 1,
         page_size: int = 20,
+        cursor: str | None = None,
+        count_mode: CountMode = "exact",
     ) -> tuple[
         list[Charge],
         int,
+        str | None,
         dict[int, str | None],
         dict[int, str | None],
         dict[int, int | None],
     ]:
-        client_record = (
-            ClientRecordRepository(self.db).get_by_id(client_record_id)
-            if client_record_id is not None
-            else None
+        result = self.charge_repo.list_charges_page(
+            client_record_id=client_record_id,
+            business_id=business_id,
+            status=status,
+            charge_type=charge_type,
+            period=period,
+            issued_after=issued_after,
+            issued_before=issued_before,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            count_mode=count_mode,
         )
-        if client_record is not None:
-            items = self.charge_repo.list_charges_by_client_record(
-                client_record_id=client_record.id,
-                business_id=business_id,
-                status=status,
-                charge_type=charge_type,
-                period=period,
-                issued_after=issued_after,
-                issued_before=issued_before,
-                page=page,
-                page_size=page_size,
-            )
-            total = self.charge_repo.count_charges_by_client_record(
-                client_record_id=client_record.id,
-                business_id=business_id,
-                status=status,
-                charge_type=charge_type,
-                period=period,
-                issued_after=issued_after,
-                issued_before=issued_before,
-            )
-        else:
-            items = self.charge_repo.list_charges(
-                client_record_id=client_record_id,
-                business_id=business_id,
-                status=status,
-                charge_type=charge_type,
-                period=period,
-                issued_after=issued_after,
-                issued_before=issued_before,
-                page=page,
-                page_size=page_size,
-            )
-            total = self.charge_repo.count_charges(
-                client_record_id=client_record_id,
-                business_id=business_id,
-                status=status,
-                charge_type=charge_type,
-                period=period,
-                issued_after=issued_after,
-                issued_before=issued_before,
-            )
+        items = result.items
 
         business_ids = list({c.business_id for c in items if c.business_id is not None})
         businesses = self.business_repo.list_by_ids(business_ids) if business_ids else []
@@ -126,7 +97,8 @@ class ChargeQueryService:
 
         return (
             items,
-            total,
+            result.total,
+            result.next_cursor,
             client_name_map,
             business_name_map,
             office_client_number_map,
@@ -143,19 +115,28 @@ class ChargeQueryService:
         issued_before: date | None = None,
         page: int = 1,
         page_size: int = 20,
+        cursor: str | None = None,
+        count_mode: CountMode = "exact",
     ) -> ChargeListResponse:
-        items, total, client_name_map, business_name_map, office_client_number_map = (
-            self.list_charges(
-                business_id=business_id,
-                client_record_id=client_record_id,
-                status=status,
-                charge_type=charge_type,
-                period=period,
-                issued_after=issued_after,
-                issued_before=issued_before,
-                page=page,
-                page_size=page_size,
-            )
+        (
+            items,
+            total,
+            next_cursor,
+            client_name_map,
+            business_name_map,
+            office_client_number_map,
+        ) = self.list_charges(
+            business_id=business_id,
+            client_record_id=client_record_id,
+            status=status,
+            charge_type=charge_type,
+            period=period,
+            issued_after=issued_after,
+            issued_before=issued_before,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            count_mode=count_mode,
         )
 
         def _enrich(charge: Charge) -> ChargeResponse:
@@ -191,5 +172,6 @@ class ChargeQueryService:
             page=page,
             page_size=page_size,
             total=total,
+            next_cursor=next_cursor,
             stats=stats,
         )
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from fastapi import APIRouter, Depends, Query, Response, status
 
 from app.clients.create_policy import preview_vat_reporting_frequency
@@ -21,6 +23,8 @@ from app.clients.services.client_update_service import ClientUpdateService
 from app.clients.services.create_client_service import CreateClientService
 from app.clients.services.impact_preview_service import compute_creation_impact
 from app.common.enums import EntityType
+from app.core.perf import query_budget
+from app.infrastructure.http_cache import ResponseCache, cached_response
 from app.users.api.deps import CurrentUser, DBSession, require_role
 from app.users.models.user import UserRole
 
@@ -81,6 +85,7 @@ def create_client(
 
 
 @router.get("", response_model=ClientRecordListResponse)
+@query_budget(15, max_repeated=5)
 def list_clients(
     db: DBSession,
     search: str | None = Query(None),
@@ -95,8 +100,27 @@ def list_clients(
     sort_order: str = Query("asc", pattern="^(asc|desc)$"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
+    count: Literal["exact", "estimated"] = Query("exact"),
+    cache: ResponseCache = Depends(
+        cached_response(
+            "client_records",
+            "legal_entities",
+            "persons",
+            "person_legal_entity_links",
+            "binders",
+            "client_year_vat_totals",
+        )
+    ),
 ):
-    """List clients with optional search, status filter, and sorting."""
+    """List clients with optional search, status filter, and sorting.
+
+    Pass the previous response's `next_cursor` as `cursor` to page by keyset
+    instead of `page`.
+    """
+    cached = cache.lookup()
+    if cached is not None:
+        return cached
     service = ClientQueryService(db)
     result = service.list_full_clients(
         search=search,
@@ -108,8 +132,10 @@ def list_clients(
         sort_order=sort_order,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        count_mode=count,
     )
-    return result
+    return cache.store(result)
 
 
 @router.get("/sidebar", response_model=ClientSidebarListResponse)
@@ -120,6 +146,8 @@ def list_sidebar_clients(
     sort_order: str = Query("asc", pattern="^(asc|desc)$"),
     page: int = Query(1, ge=1),
     page_size: int = Query(100, ge=1, le=100),
+    cursor: str | None = Query(None),
+    count: Literal["exact", "estimated"] = Query("exact"),
 ):
     service = ClientQueryService(db)
     return service.list_sidebar_clients(
@@ -128,6 +156,8 @@ def list_sidebar_clients(
         sort_order=sort_order,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        count_mode=count,
     )
 
 
@@ -10,14 +10,16 @@ from fastapi.responses import FileResponse
 
 from app.clients.constants import EXCEL_MEDIA_TYPE, MAX_CLIENT_IMPORT_UPLOAD_SIZE
 from app.clients.schemas.client import ClientImportResponse
+from app.clients.schemas.client_import_job import ClientImportJobResponse
 from app.clients.services.client_excel_service import (
     ClientExcelImportError,
     ClientExcelService,
 )
+from app.clients.services.client_import_job_service import ClientImportJobService
 from app.clients.services.client_query_service import ClientQueryService
 from app.clients.services.create_client_service import CreateClientService
 from app.infrastructure.idempotency import IdempotencyGuard, require_idempotency_key
-from app.users.api.deps import CurrentUser, DBSession, require_role
+from app.users.api.deps import CurrentUser, DBSession, ExportDBSession, require_role
 from app.users.models.user import UserRole
 
 MAX_UPLOAD_SIZE = MAX_CLIENT_IMPORT_UPLOAD_SIZE
@@ -30,11 +32,11 @@ router = APIRouter(
 
 
 @router.get("/export")
-def export_clients(db: DBSession):
+def export_clients(db: ExportDBSession):
     """Return all clients as an Excel workbook."""
     excel_service = ClientExcelService(db)
     try:
-        result = excel_service.export_clients(ClientQueryService(db).list_all_clients())
+        result = excel_service.export_clients(ClientQueryService(db).iter_all_clients())
     except ImportError as exc:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -102,3 +104,50 @@ async def import_clients_from_excel(
             ) from exc
 
     return idem.execute(payload=contents, fn=_run)
+
+
+@router.post(
+    "/import/jobs",
+    response_model=ClientImportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(require_role(UserRole.ADVISOR))],
+)
+async def submit_client_import_job(
+    file: UploadFile,
+    request: Request,
+    db: DBSession,
+    user: CurrentUser,
+    idem: IdempotencyGuard = Depends(require_idempotency_key),
+):
+    """Queue a bulk client import (advisor-only); poll `GET /clients/import/jobs/{id}`."""
+    content_length = request.headers.get("Content-Length")
+    parsed_content_length = int(content_length) if content_length is not None else None
+    contents = await file.read(MAX_UPLOAD_SIZE + 1)
+    service = ClientImportJobService(db)
+
+    def _run():
+        try:
+            job = service.submit(
+                contents=contents,
+                filename=file.filename,
+                user=user,
+                content_length=parsed_content_length,
+                max_upload_size=MAX_UPLOAD_SIZE,
+            )
+        except ClientExcelImportError as exc:
+            raise HTTPException(
+                status_code=exc.status_code,
+                detail=str(exc),
+            ) from exc
+        return ClientImportJobResponse.model_validate(job)
+
+    return idem.execute(payload=contents, fn=_run)
+
+
+@router.get(
+    "/import/jobs/{job_id}",
+    response_model=ClientImportJobResponse,
+    dependencies=[Depends(require_role(UserRole.ADVISOR))],
+)
+def get_client_import_job(job_id: int, db: DBSession, user: CurrentUser):
+    return ClientImportJobService(db).get_for_user(job_id, user)
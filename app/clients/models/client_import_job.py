@@ -0,0 +1,63 @@
+"""Client import jobs — Excel client imports processed outside the HTTP request.
+
+A request stores the uploaded workbook on a QUEUED job and returns at once.
+`ClientImportWorker` claims it, validates every row up front (`total_rows`,
+`errors`), then creates the valid rows in batches, committing each batch
+together with `processed_rows` / `created_count` / `last_row`. A job whose
+worker died resumes after `last_row` once its lease lapses. The workbook is
+cleared when the job finishes.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum as PyEnum
+from typing import Any
+
+from sqlalchemy import JSON, ForeignKey, Index, Integer, LargeBinary, SmallInteger, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, deferred, mapped_column
+
+from app.database import Base
+from app.utils.time_utils import utcnow
+
+
+class ClientImportJobStatus(str, PyEnum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class ClientImportJob(Base):
+    __tablename__ = "client_import_jobs"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, default=ClientImportJobStatus.QUEUED.value
+    )
+    filename: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    # Only the worker reads the upload; polling the job must not load it.
+    contents: Mapped[bytes | None] = deferred(mapped_column(LargeBinary, nullable=True))
+
+    total_rows: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    processed_rows: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    created_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_row: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    errors: Mapped[list[dict[str, Any]]] = mapped_column(
+        JSON().with_variant(JSONB, "postgresql"), nullable=False, default=list
+    )
+
+    attempts: Mapped[int] = mapped_column(SmallInteger, nullable=False, default=0)
+    locked_until: Mapped[datetime | None] = mapped_column(nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    requested_by: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(default=utcnow, nullable=False)
+    started_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(nullable=True)
+
+    __table_args__ = (Index("idx_client_import_jobs_status_created", "status", "created_at"),)
+
+    def __repr__(self) -> str:
+        return f"<ClientImportJob(id={self.id}, status='{self.status}')>"
@@ -5,7 +5,7 @@ from datetime import datetime
 
 from sqlalchemy import ForeignKey, Index, Sequence, Text, column, text
 from sqlalchemy import event, func, select
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, object_session
 
 from app.clients.enums import ClientStatus
 from app.common.soft_delete import SoftDeletableMixin
@@ -83,4 +83,11 @@ def _assign_test_office_client_number(_mapper, connection, target: ClientRecord)
     current_max = connection.scalar(
         select(func.max(ClientRecord.office_client_number)).select_from(ClientRecord.__table__)
     )
-    target.office_client_number = (current_max or 100000) + 1
+    # Records inserted in the same flush have not reached the table yet.
+    session = object_session(target)
+    pending = [
+        obj.office_client_number
+        for obj in (session.new if session is not None else ())
+        if isinstance(obj, ClientRecord) and obj.office_client_number is not None
+    ]
+    target.office_client_number = max([current_max or 100000, *pending]) + 1
@@ -0,0 +1,68 @@
+"""Set-based reads and writes for importing many clients at once.
+
+Entity rows (legal entities, people, client records, businesses, binders,
+work items, payments, reports) are added as ORM objects and flushed together:
+the unit of work sends one multi-row INSERT per table, and the session
+listeners that keep the search index, work-queue read model and due-date
+snapshots in step still see every new row. Append-only log rows nothing else
+listens to go through a plain executemany ``insert()``.
+"""
+
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import Row, insert, select, tuple_
+from sqlalchemy.orm import Session
+
+from app.clients.models.client_record import ClientRecord
+from app.clients.models.legal_entity import LegalEntity
+from app.clients.models.person import Person
+from app.common.enums import IdNumberType
+
+
+class ClientBulkWriter:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def existing_identities(self, id_numbers: Iterable[str]) -> list[Row]:
+        """
+        ``(id_number, id_number_type, client_record_id, deleted_at)`` for every
+        legal entity holding one of *id_numbers*; the record columns are None
+        for an entity without a client record.
+        """
+        id_numbers = set(id_numbers)
+        if not id_numbers:
+            return []
+        return list(
+            self.db.execute(
+                select(
+                    LegalEntity.id_number,
+                    LegalEntity.id_number_type,
+                    ClientRecord.id.label("client_record_id"),
+                    ClientRecord.deleted_at,
+                )
+                .outerjoin(ClientRecord, ClientRecord.legal_entity_id == LegalEntity.id)
+                .where(LegalEntity.id_number.in_(id_numbers))
+            ).all()
+        )
+
+    def people_by_id_number(
+        self, keys: Iterable[tuple[IdNumberType, str]]
+    ) -> dict[tuple[IdNumberType, str], Person]:
+        keys = set(keys)
+        if not keys:
+            return {}
+        people = self.db.scalars(
+            select(Person).where(tuple_(Person.id_number_type, Person.id_number).in_(keys))
+        ).all()
+        return {(person.id_number_type, person.id_number): person for person in people}
+
+    def add_all(self, entities: list[Any]) -> None:
+        if not entities:
+            return
+        self.db.add_all(entities)
+        self.db.flush()
+
+    def insert_rows(self, model: type, rows: list[dict[str, Any]]) -> None:
+        if rows:
+            self.db.execute(insert(model), rows)
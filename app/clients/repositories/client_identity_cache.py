@@ -0,0 +1,81 @@
+"""Process-wide LRU + TTL cache of `ClientIdentity` snapshots.
+
+Sits behind the per-session memo of `ClientIdentityLoader` and is off unless
+`CLIENT_IDENTITY_CACHE_ENABLED` is set. Entries are evicted explicitly by the
+client write services (see `ClientIdentityLoader.invalidate`); the TTL bounds
+staleness for writes made by other processes or outside those services.
+
+Every invalidation bumps `generation`. A loader that read from the database
+before an invalidation landed passes the generation it started with to
+`put_many`, which then refuses to store its (possibly stale) rows.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from app.config import settings
+
+if TYPE_CHECKING:
+    from app.clients.repositories.client_identity_loader import ClientIdentity
+
+
+class ClientIdentityCache:
+    def __init__(self, *, max_entries: int, ttl_seconds: float, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[int, tuple[float, ClientIdentity]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.generation = 0
+
+    def get_many(self, client_record_ids: Iterable[int]) -> dict[int, ClientIdentity]:
+        now = self._clock()
+        found = {}
+        with self._lock:
+            for client_id in client_record_ids:
+                entry = self._entries.get(client_id)
+                if entry is None:
+                    continue
+                expires_at, identity = entry
+                if expires_at <= now:
+                    del self._entries[client_id]
+                    continue
+                self._entries.move_to_end(client_id)
+                found[client_id] = identity
+        return found
+
+    def put_many(self, identities: Iterable[ClientIdentity], *, generation: int) -> None:
+        expires_at = self._clock() + self.ttl_seconds
+        with self._lock:
+            if generation != self.generation:
+                return
+            for identity in identities:
+                self._entries[identity.client_record_id] = (expires_at, identity)
+                self._entries.move_to_end(identity.client_record_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, client_record_ids: Iterable[int]) -> None:
+        with self._lock:
+            self.generation += 1
+            for client_id in client_record_ids:
+                self._entries.pop(client_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+client_identity_cache = ClientIdentityCache(
+    max_entries=settings.CLIENT_IDENTITY_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.CLIENT_IDENTITY_CACHE_TTL_SECONDS,
+)
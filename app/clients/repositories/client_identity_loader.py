@@ -0,0 +1,270 @@
+"""Batched loading of client display identity.
+
+Reports, search, timeline and document listings all decorate rows with the
+same handful of identity fields (office number, official name, id number,
+owner name, business name). `ClientIdentityLoader` fetches them for a whole
+batch of ids in one query and memoises the snapshots on the session
+(`Session.info`), so every loader created for the same request shares one
+identity map and ids already seen cost nothing.
+
+The memo is dropped when the transaction commits or rolls back, and whenever a
+flush touches a client record, legal entity, business, person or owner link,
+so it never serves identity that the session itself has changed.
+
+Client identities missing from the memo are looked up in the optional
+process-wide cache (`client_identity_cache`) before the database. The client
+write services call `invalidate` for the records they change: the ids leave
+the shared cache immediately and again once the transaction commits. Memo and
+shared-cache hits and database misses are counted in the request summary log.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import chain
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from app.businesses.models.business import Business
+from app.clients.enums import ClientStatus
+from app.clients.models.client_record import ClientRecord
+from app.clients.models.legal_entity import LegalEntity
+from app.clients.models.person import Person
+from app.clients.models.person_legal_entity_link import (
+    PersonLegalEntityLink,
+    PersonLegalEntityRole,
+)
+from app.clients.repositories.client_identity_cache import client_identity_cache
+from app.common.enums import EntityType, IdNumberType
+from app.config import settings
+from app.core.logging_config import record_identity_cache_lookup
+
+_MEMO_KEY = "client_identity_memo"
+_INVALIDATED_KEY = "client_identity_invalidated"
+_WROTE_IDENTITY_KEY = "client_identity_written"
+_IDENTITY_MODELS = (ClientRecord, LegalEntity, Business, Person, PersonLegalEntityLink)
+
+
+@dataclass(frozen=True, slots=True)
+class ClientIdentity:
+    client_record_id: int
+    legal_entity_id: int
+    office_client_number: int | None
+    status: ClientStatus
+    official_name: str
+    id_number: str
+    id_number_type: IdNumberType
+    entity_type: EntityType | None
+    owner_name: str | None
+    # Creation time of the legal entity (what the timeline reports as "client created").
+    created_at: datetime
+    deleted_at: datetime | None
+
+    @property
+    def display_name(self) -> str:
+        """Owner name when linked, else the official name (as `get_full_records_bulk`)."""
+        return self.owner_name or self.official_name
+
+
+@dataclass(frozen=True, slots=True)
+class BusinessIdentity:
+    business_id: int
+    legal_entity_id: int
+    business_name: str | None
+    official_name: str
+
+    @property
+    def full_name(self) -> str:
+        return self.business_name or self.official_name
+
+
+@dataclass
+class _IdentityMemo:
+    # None marks an id already looked up and not found.
+    clients: dict[int, ClientIdentity | None] = field(default_factory=dict)
+    businesses: dict[int, BusinessIdentity | None] = field(default_factory=dict)
+    primary_businesses: dict[int, BusinessIdentity | None] = field(default_factory=dict)
+
+
+class ClientIdentityLoader:
+    def __init__(self, db: Session):
+        self.db = db
+
+    @property
+    def _memo(self) -> _IdentityMemo:
+        return self.db.info.setdefault(_MEMO_KEY, _IdentityMemo())
+
+    def get(self, client_record_id: int, *, include_deleted: bool = False) -> ClientIdentity | None:
+        return self.load([client_record_id], include_deleted=include_deleted).get(client_record_id)
+
+    def load(
+        self, client_record_ids: Iterable[int], *, include_deleted: bool = False
+    ) -> dict[int, ClientIdentity]:
+        """Identities by client record id; soft-deleted records are skipped by default."""
+        memo = self._memo.clients
+        ids = {client_id for client_id in client_record_ids if client_id is not None}
+        missing = ids - memo.keys()
+        fetched = 0
+        if missing:
+            memo.update(dict.fromkeys(missing))
+            if settings.CLIENT_IDENTITY_CACHE_ENABLED:
+                shared = client_identity_cache.get_many(missing)
+                memo.update(shared)
+                missing -= shared.keys()
+            if missing:
+                fetched = len(missing)
+                memo.update(self._fetch_clients(missing))
+        if ids:
+            record_identity_cache_lookup(hits=len(ids) - fetched, misses=fetched)
+        return {
+            client_id: memo[client_id]
+            for client_id in ids
+            if memo[client_id] is not None
+            and (include_deleted or memo[client_id].deleted_at is None)
+        }
+
+    def load_businesses(self, business_ids: Iterable[int]) -> dict[int, BusinessIdentity]:
+        """Active businesses by id."""
+        memo = self._memo.businesses
+        ids = {business_id for business_id in business_ids if business_id is not None}
+        missing = ids - memo.keys()
+        if missing:
+            memo.update(dict.fromkeys(missing))
+            memo.update(
+                (business.business_id, business)
+                for business in self._fetch_businesses(Business.id.in_(missing))
+            )
+        return {business_id: memo[business_id] for business_id in ids if memo[business_id]}
+
+    def load_primary_businesses(
+        self, legal_entity_ids: Iterable[int]
+    ) -> dict[int, BusinessIdentity]:
+        """Earliest-opened active business per legal entity."""
+        memo = self._memo.primary_businesses
+        ids = {legal_id for legal_id in legal_entity_ids if legal_id is not None}
+        missing = ids - memo.keys()
+        if missing:
+            memo.update(dict.fromkeys(missing))
+            for business in self._fetch_businesses(
+                Business.legal_entity_id.in_(missing),
+                order_by=(Business.opened_at.desc(), Business.id.desc()),
+            ):
+                # Descending order: the last write per legal entity is the earliest business.
+                memo[business.legal_entity_id] = business
+        return {legal_id: memo[legal_id] for legal_id in ids if memo[legal_id]}
+
+    def invalidate(self, client_record_ids: Iterable[int]) -> None:
+        """Forget cached identity for clients this session is changing."""
+        ids = set(client_record_ids)
+        if not ids:
+            return
+        memo: _IdentityMemo | None = self.db.info.get(_MEMO_KEY)
+        if memo is not None:
+            for client_id in ids:
+                memo.clients.pop(client_id, None)
+        self.db.info.setdefault(_INVALIDATED_KEY, set()).update(ids)
+        client_identity_cache.invalidate(ids)
+
+    def _fetch_clients(self, client_record_ids: set[int]) -> dict[int, ClientIdentity]:
+        generation = client_identity_cache.generation
+        rows = self.db.execute(
+            select(
+                ClientRecord.id,
+                ClientRecord.legal_entity_id,
+                ClientRecord.office_client_number,
+                ClientRecord.status,
+                ClientRecord.deleted_at,
+                LegalEntity.official_name,
+                LegalEntity.id_number,
+                LegalEntity.id_number_type,
+                LegalEntity.entity_type,
+                LegalEntity.created_at,
+                Person.full_name.label("owner_name"),
+            )
+            .join(LegalEntity, LegalEntity.id == ClientRecord.legal_entity_id)
+            .outerjoin(
+                PersonLegalEntityLink,
+                (PersonLegalEntityLink.legal_entity_id == LegalEntity.id)
+                & (PersonLegalEntityLink.role == PersonLegalEntityRole.OWNER),
+            )
+            .outerjoin(Person, Person.id == PersonLegalEntityLink.person_id)
+            .where(ClientRecord.id.in_(client_record_ids))
+            .order_by(PersonLegalEntityLink.id.desc())
+        ).all()
+        # Descending link order: with several owners the first-linked one wins.
+        identities = {
+            row.id: ClientIdentity(
+                client_record_id=row.id,
+                legal_entity_id=row.legal_entity_id,
+                office_client_number=row.office_client_number,
+                status=row.status,
+                official_name=row.official_name,
+                id_number=row.id_number,
+                id_number_type=row.id_number_type,
+                entity_type=row.entity_type,
+                owner_name=row.owner_name,
+                created_at=row.created_at,
+                deleted_at=row.deleted_at,
+            )
+            for row in rows
+        }
+        # Rows read after this transaction changed identity may never commit: keep them local.
+        if settings.CLIENT_IDENTITY_CACHE_ENABLED and not (
+            self.db.info.get(_WROTE_IDENTITY_KEY) or self.db.info.get(_INVALIDATED_KEY)
+        ):
+            client_identity_cache.put_many(identities.values(), generation=generation)
+        return identities
+
+    def _fetch_businesses(self, criterion, *, order_by=()) -> list[BusinessIdentity]:
+        rows = self.db.execute(
+            select(
+                Business.id,
+                Business.legal_entity_id,
+                Business.business_name,
+                LegalEntity.official_name,
+            )
+            .join(LegalEntity, LegalEntity.id == Business.legal_entity_id)
+            .where(criterion, Business.deleted_at.is_(None))
+            .order_by(*order_by)
+        ).all()
+        return [
+            BusinessIdentity(
+                business_id=row.id,
+                legal_entity_id=row.legal_entity_id,
+                business_name=row.business_name,
+                official_name=row.official_name,
+            )
+            for row in rows
+        ]
+
+
+@event.listens_for(Session, "after_flush")
+def _forget_changed_identities(session: Session, _flush_context) -> None:
+    if any(
+        isinstance(target, _IDENTITY_MODELS)
+        for target in chain(session.new, session.dirty, session.deleted)
+    ):
+        session.info.pop(_MEMO_KEY, None)
+        session.info[_WROTE_IDENTITY_KEY] = True
+
+
+def _end_transaction(session: Session) -> None:
+    session.info.pop(_MEMO_KEY, None)
+    session.info.pop(_WROTE_IDENTITY_KEY, None)
+    invalidated = session.info.pop(_INVALIDATED_KEY, None)
+    if invalidated:
+        # Evict again: a concurrent reader may have re-cached the pre-commit row.
+        client_identity_cache.invalidate(invalidated)
+
+
+@event.listens_for(Session, "after_commit")
+def _forget_on_commit(session: Session) -> None:
+    _end_transaction(session)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _forget_on_rollback(session: Session, _previous_transaction) -> None:
+    _end_transaction(session)
@@ -3,11 +3,10 @@ from __future__ import annotations
 from collections.abc import Iterable
 from dataclasses import dataclass
 
-from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.clients.models.client_record import ClientRecord
-from app.clients.models.legal_entity import LegalEntity
+from app.clients.repositories.client_identity_loader import ClientIdentityLoader
 from app.common.repositories.base_repository import BaseRepository
 
 
@@ -24,23 +23,10 @@ class ClientIdentityRepository(BaseRepository[ClientRecord]):
         super().__init__(db)
 
     def get_display_map(self, client_record_ids: Iterable[int]) -> dict[int, ClientDisplayProfile]:
-        ids = list(set(client_record_ids))
-        if not ids:
-            return {}
-
-        rows = self.db.execute(
-            select(
-                ClientRecord.id,
-                LegalEntity.official_name,
-                ClientRecord.office_client_number,
-            )
-            .join(LegalEntity, LegalEntity.id == ClientRecord.legal_entity_id)
-            .where(ClientRecord.id.in_(ids), ClientRecord.deleted_at.is_(None))
-        ).all()
         return {
-            row.id: ClientDisplayProfile(
-                client_name=row.official_name,
-                office_client_number=row.office_client_number,
+            client_id: ClientDisplayProfile(
+                client_name=identity.official_name,
+                office_client_number=identity.office_client_number,
             )
-            for row in rows
+            for client_id, identity in ClientIdentityLoader(self.db).load(client_record_ids).items()
         }
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.clients.models.client_import_job import ClientImportJob, ClientImportJobStatus
+from app.infrastructure.jobs import claim_leased
+from app.utils.time_utils import utcnow
+
+
+class ClientImportJobRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def create(
+        self, *, filename: str | None, contents: bytes, requested_by: int
+    ) -> ClientImportJob:
+        job = ClientImportJob(
+            filename=filename,
+            contents=contents,
+            requested_by=requested_by,
+            status=ClientImportJobStatus.QUEUED.value,
+        )
+        self.db.add(job)
+        self.db.flush()
+        return job
+
+    def get_by_id(self, job_id: int) -> ClientImportJob | None:
+        return self.db.get(ClientImportJob, job_id)
+
+    # ── Worker side ───────────────────────────────────────────────────────────
+
+    def claim(self, *, lease_until: datetime) -> ClientImportJob | None:
+        """Lease the oldest queued job, or a running one whose worker let the lease lapse."""
+        now = utcnow()
+        jobs = claim_leased(self.db, ClientImportJob, limit=1, lease_until=lease_until, now=now)
+        if not jobs:
+            return None
+        job = jobs[0]
+        job.started_at = job.started_at or now
+        self.db.flush()
+        return job
+
+    def record_validation(
+        self, job_id: int, *, total_rows: int, errors: list[dict[str, Any]]
+    ) -> None:
+        self.db.execute(
+            update(ClientImportJob)
+            .where(ClientImportJob.id == job_id)
+            .values(total_rows=total_rows, errors=errors)
+        )
+
+    def record_progress(
+        self,
+        job_id: int,
+        *,
+        last_row: int,
+        processed_rows: int,
+        created_count: int,
+        errors: list[dict[str, Any]],
+        lease_until: datetime,
+    ) -> None:
+        self.db.execute(
+            update(ClientImportJob)
+            .where(ClientImportJob.id == job_id)
+            .values(
+                last_row=last_row,
+                processed_rows=processed_rows,
+                created_count=created_count,
+                errors=errors,
+                locked_until=lease_until,
+            )
+        )
+
+    def mark_succeeded(self, job_id: int, *, processed_rows: int, finished_at: datetime) -> None:
+        self.db.execute(
+            update(ClientImportJob)
+            .where(ClientImportJob.id == job_id)
+            .values(
+                status=ClientImportJobStatus.SUCCEEDED.value,
+                processed_rows=processed_rows,
+                contents=None,
+                error=None,
+                locked_until=None,
+                finished_at=finished_at,
+            )
+        )
+
+    def mark_failed(self, job_id: int, error: str, *, finished_at: datetime) -> None:
+        self.db.execute(
+            update(ClientImportJob)
+            .where(ClientImportJob.id == job_id)
+            .values(
+                status=ClientImportJobStatus.FAILED.value,
+                contents=None,
+                error=error,
+                locked_until=None,
+                finished_at=finished_at,
+            )
+        )
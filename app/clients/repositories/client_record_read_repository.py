@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import date, datetime
 from decimal import Decimal
 from typing import TypedDict
@@ -16,6 +17,7 @@ from app.clients.models.person_legal_entity_link import (
     PersonLegalEntityRole,
 )
 from app.common.enums import AdvancePaymentFrequency, EntityType, IdNumberType, VatType
+from app.common.repositories.read_repository import read_session
 
 
 class ClientRecordData(TypedDict):
@@ -115,12 +117,36 @@ def get_full_record_including_deleted(
 
 
 def get_full_records_bulk(db: Session, client_record_ids: list[int]) -> dict[int, ClientRecordData]:
+    """Active records by id; read from the replica when it is safe to (list views, exports)."""
     if not client_record_ids:
         return {}
-    rows = db.execute(
+    rows = read_session(db).execute(
         _full_record_query().where(
             ClientRecord.id.in_(client_record_ids),
             ClientRecord.deleted_at.is_(None),
         )
     ).all()
     return {cr.id: _full_record_dict(cr, le, person) for cr, le, person in rows}
+
+
+def iter_full_records(db: Session, batch_size: int = 1000) -> Iterator[ClientRecordData]:
+    """
+    Stream every active client record, ordered by official name.
+
+    Rows are fetched ``batch_size`` at a time from a server-side cursor
+    (``yield_per``), so memory does not grow with the number of clients.
+    A record with several owners is yielded once, for its first owner row.
+    Reads from the replica when it is safe to.
+    """
+    stmt = (
+        _full_record_query()
+        .where(ClientRecord.deleted_at.is_(None))
+        .order_by(LegalEntity.official_name.asc(), ClientRecord.id.asc())
+        .execution_options(yield_per=batch_size)
+    )
+    last_id = None
+    for cr, le, person in read_session(db).execute(stmt):
+        if cr.id == last_id:
+            continue
+        last_id = cr.id
+        yield _full_record_dict(cr, le, person)
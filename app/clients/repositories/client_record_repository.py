@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import asc, case, desc, func, select
+from sqlalchemy import case, func, select
 from sqlalchemy.orm import Session
 
 from app.clients.enums import ClientStatus
@@ -12,6 +12,13 @@ from app.clients.models.person_legal_entity_link import (
     PersonLegalEntityRole,
 )
 from app.common.enums import EntityType
+from app.common.repositories.keyset import (
+    CountMode,
+    Keyset,
+    KeysetColumn,
+    KeysetPage,
+    fetch_page,
+)
 from app.core.exceptions import NotFoundError
 from app.utils.time_utils import utcnow
 
@@ -196,6 +203,22 @@ class ClientRecordRepository:
             stmt = stmt.where(LegalEntity.entity_type == entity_type)
         return stmt
 
+    def _list_keyset(self, sort_by: str, sort_order: str) -> Keyset:
+        if sort_by == "entity_type":
+            order_map = {v: i for i, v in enumerate(self._ENTITY_TYPE_ORDER)}
+            sort_col = case(order_map, value=LegalEntity.entity_type, else_=len(order_map))
+        else:
+            sort_by = sort_by if sort_by in self._SORTABLE_FIELDS else "official_name"
+            sort_col = self._SORTABLE_FIELDS[sort_by]
+        descending = sort_order == "desc"
+        return Keyset(
+            f"clients:{sort_by}:{sort_order}",
+            [
+                KeysetColumn(sort_col, descending),
+                KeysetColumn(ClientRecord.id, descending),
+            ],
+        )
+
     def list(
         self,
         search: str | None = None,
@@ -207,26 +230,45 @@ class ClientRecordRepository:
         page: int = 1,
         page_size: int = 20,
     ) -> list[ClientRecord]:
-        stmt = self._apply_list_filters(
-            self._active_query(), search, status, accountant_id, entity_type
-        )
-        if sort_by == "entity_type":
-            order_map = {v: i for i, v in enumerate(self._ENTITY_TYPE_ORDER)}
-            sort_col = case(order_map, value=LegalEntity.entity_type)
-        else:
-            sort_col = self._SORTABLE_FIELDS.get(sort_by, LegalEntity.official_name)
-        stmt = stmt.order_by(desc(sort_col) if sort_order == "desc" else asc(sort_col))
-        offset = (page - 1) * page_size
-        return list(self.db.scalars(stmt.offset(offset).limit(page_size)).all())
+        return self.list_page(
+            search=search,
+            status=status,
+            accountant_id=accountant_id,
+            entity_type=entity_type,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            page=page,
+            page_size=page_size,
+        ).items
 
-    def list_sidebar(
+    def list_page(
         self,
         search: str | None = None,
-        sort_by: str = "full_name",
+        status: ClientStatus | None = None,
+        accountant_id: int | None = None,
+        entity_type: EntityType | None = None,
+        sort_by: str = "official_name",
         sort_order: str = "asc",
         page: int = 1,
-        page_size: int = 100,
-    ):
+        page_size: int = 20,
+        cursor: str | None = None,
+        count_mode: CountMode = "none",
+    ) -> KeysetPage[ClientRecord]:
+        """`list` plus `next_cursor`; a cursor replaces `page` (keyset pagination)."""
+        stmt = self._apply_list_filters(
+            self._active_query(), search, status, accountant_id, entity_type
+        )
+        return fetch_page(
+            self.db,
+            stmt,
+            self._list_keyset(sort_by, sort_order),
+            cursor=cursor,
+            page=page,
+            page_size=page_size,
+            count_mode=count_mode,
+        )
+
+    def _sidebar_stmt(self, search: str | None):
         full_name = func.coalesce(Person.full_name, LegalEntity.official_name).label("full_name")
         stmt = (
             select(
@@ -254,12 +296,63 @@ class ClientRecordRepository:
                 | LegalEntity.official_name.ilike(term)
                 | LegalEntity.id_number.ilike(term)
             )
-        sort_col = (
-            ClientRecord.office_client_number if sort_by == "office_client_number" else full_name
+        return stmt, full_name
+
+    def list_sidebar(
+        self,
+        search: str | None = None,
+        sort_by: str = "full_name",
+        sort_order: str = "asc",
+        page: int = 1,
+        page_size: int = 100,
+    ):
+        return self.list_sidebar_page(
+            search=search,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            page=page,
+            page_size=page_size,
+        ).items
+
+    def list_sidebar_page(
+        self,
+        search: str | None = None,
+        sort_by: str = "full_name",
+        sort_order: str = "asc",
+        page: int = 1,
+        page_size: int = 100,
+        cursor: str | None = None,
+        count_mode: CountMode = "none",
+    ) -> KeysetPage:
+        """Sidebar rows as mappings plus `next_cursor` for infinite scroll."""
+        stmt, full_name = self._sidebar_stmt(search)
+        if sort_by == "office_client_number":
+            sort_col = ClientRecord.office_client_number
+        else:
+            sort_by, sort_col = "full_name", full_name
+        descending = sort_order == "desc"
+        keyset = Keyset(
+            f"clients.sidebar:{sort_by}:{sort_order}",
+            [
+                KeysetColumn(sort_col, descending),
+                KeysetColumn(ClientRecord.id, descending),
+            ],
+        )
+        result = fetch_page(
+            self.db,
+            stmt,
+            keyset,
+            cursor=cursor,
+            page=page,
+            page_size=page_size,
+            count_mode=count_mode,
+            entities=False,
+        )
+        return KeysetPage(
+            items=[row._mapping for row in result.items],
+            next_cursor=result.next_cursor,
+            total=result.total,
         )
-        stmt = stmt.order_by(desc(sort_col) if sort_order == "desc" else asc(sort_col))
-        offset = (page - 1) * page_size
-        return self.db.execute(stmt.offset(offset).limit(page_size)).mappings().all()
 
     def count(
         self,
@@ -280,26 +373,13 @@ class ClientRecordRepository:
         return self.db.scalar(count_stmt)
 
     def count_sidebar(self, search: str | None = None) -> int:
-        full_name = func.coalesce(Person.full_name, LegalEntity.official_name)
-        stmt = (
-            select(func.count(ClientRecord.id))
-            .join(LegalEntity, LegalEntity.id == ClientRecord.legal_entity_id)
-            .outerjoin(
-                PersonLegalEntityLink,
-                (PersonLegalEntityLink.legal_entity_id == LegalEntity.id)
-                & (PersonLegalEntityLink.role == PersonLegalEntityRole.OWNER),
-            )
-            .outerjoin(Person, Person.id == PersonLegalEntityLink.person_id)
-            .where(ClientRecord.deleted_at.is_(None))
-        )
-        if search:
-            term = f"%{search.strip()}%"
-            stmt = stmt.where(
-                full_name.ilike(term)
-                | LegalEntity.official_name.ilike(term)
-                | LegalEntity.id_number.ilike(term)
-            )
-        return self.db.scalar(stmt)
+        stmt, _ = self._sidebar_stmt(search)
+        return self.db.scalar(select(func.count()).select_from(stmt.subquery()))
+
+    _SEARCH_KEYSET = Keyset(
+        "clients.search",
+        [KeysetColumn(LegalEntity.official_name), KeysetColumn(ClientRecord.id)],
+    )
 
     def search(
         self,
@@ -312,6 +392,30 @@ class ClientRecordRepository:
         page_size: int = 20,
     ) -> tuple[list[ClientRecord], int]:
         """Cross-domain search by name / id_number / status / entity_type."""
+        result = self.search_page(
+            query=query,
+            client_name=client_name,
+            id_number=id_number,
+            status=status,
+            entity_type=entity_type,
+            page=page,
+            page_size=page_size,
+            count_mode="exact",
+        )
+        return result.items, result.total
+
+    def search_page(
+        self,
+        query: str | None = None,
+        client_name: str | None = None,
+        id_number: str | None = None,
+        status: ClientStatus | None = None,
+        entity_type: EntityType | None = None,
+        page: int = 1,
+        page_size: int = 20,
+        cursor: str | None = None,
+        count_mode: CountMode = "none",
+    ) -> KeysetPage[ClientRecord]:
         stmt = self._apply_list_filters(
             self._active_query(),
             search=query,
@@ -320,14 +424,15 @@ class ClientRecordRepository:
             client_name=client_name,
             id_number=id_number,
         )
-        total = self.db.scalar(select(func.count()).select_from(stmt.subquery()))
-        offset = (page - 1) * page_size
-        items = list(
-            self.db.scalars(
-                stmt.order_by(LegalEntity.official_name.asc()).offset(offset).limit(page_size)
-            ).all()
+        return fetch_page(
+            self.db,
+            stmt,
+            self._SEARCH_KEYSET,
+            cursor=cursor,
+            page=page,
+            page_size=page_size,
+            count_mode=count_mode,
         )
-        return items, total
 
     def list_all(self) -> list[ClientRecord]:
         """All active ClientRecords ordered by official_name."""
@@ -1,17 +1,13 @@
 from sqlalchemy import func, select
-from sqlalchemy.orm import Session
 
 from app.clients.enums import ClientStatus
 from app.clients.models.client_record import ClientRecord
 from app.clients.models.legal_entity import LegalEntity
 from app.common.enums import EntityType, VatType
-from app.common.repositories.base_repository import BaseRepository
+from app.common.repositories.read_repository import ReadRepository
 
 
-class ClientVatStatsRepository(BaseRepository[ClientRecord]):
-    def __init__(self, db: Session):
-        self.db = db
-
+class ClientVatStatsRepository(ReadRepository[ClientRecord]):
     def _active_base_stmt(self):
         return (
             select(func.count(ClientRecord.id))
@@ -0,0 +1,22 @@
+from pydantic import BaseModel
+
+from app.clients.models.client_import_job import ClientImportJobStatus
+from app.clients.schemas.client import ClientImportError
+from app.core.api_types import ApiDateTime
+
+
+class ClientImportJobResponse(BaseModel):
+    id: int
+    status: ClientImportJobStatus
+    filename: str | None = None
+    # Known once the worker has read the file; processed_rows counts up to it.
+    total_rows: int | None = None
+    processed_rows: int
+    created_count: int
+    errors: list[ClientImportError]
+    error: str | None = None
+    created_at: ApiDateTime
+    started_at: ApiDateTime | None = None
+    finished_at: ApiDateTime | None = None
+
+    model_config = {"from_attributes": True}
@@ -65,6 +65,7 @@ class ClientRecordListResponse(BaseModel):
     page: int
     page_size: int
     total: int
+    next_cursor: str | None = None
     stats: ClientRecordListStats
 
 
@@ -83,6 +84,7 @@ class ClientSidebarListResponse(BaseModel):
     page: int
     page_size: int
     total: int
+    next_cursor: str | None = None
 
 
 class CreateClientRecordResponse(BaseModel):
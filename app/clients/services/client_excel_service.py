@@ -1,5 +1,6 @@
 import tempfile
 from collections.abc import Iterable
+from dataclasses import dataclass
 from io import BytesIO
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -16,15 +17,46 @@ from app.clients.constants import (
     CLIENT_TEMPLATE_COLUMNS,
     CLIENT_TEMPLATE_SAMPLE_ROW,
     MAX_CLIENT_IMPORT_UPLOAD_SIZE,
+    UNSUPPORTED_EMPLOYEE_CREATE_ERROR,
 )
 from app.clients.create_policy import derive_id_number_type
-from app.common.enums import AdvancePaymentFrequency, EntityType, VatType
-from app.utils.excel import adjust_column_widths, save_workbook_to_temp
+from app.common.enums import AdvancePaymentFrequency, EntityType, IdNumberType, VatType
+from app.utils.excel import StreamingWorkbook, save_workbook_to_temp
 
 if TYPE_CHECKING:
     from app.clients.services.create_client_service import CreateClientService
 
 
+@dataclass(frozen=True, slots=True)
+class ClientImportRow:
+    """One validated row of a client import workbook."""
+
+    row: int
+    full_name: str
+    business_name: str
+    id_number: str
+    id_number_type: IdNumberType
+    entity_type: EntityType
+    vat_reporting_frequency: VatType
+    advance_payment_frequency: AdvancePaymentFrequency
+    phone: str | None
+    email: str | None
+
+    def create_kwargs(self) -> dict:
+        """Keyword arguments for ``CreateClientService.create_client``."""
+        return {
+            "full_name": self.full_name,
+            "business_name": self.business_name,
+            "id_number": self.id_number,
+            "id_number_type": self.id_number_type,
+            "entity_type": self.entity_type,
+            "vat_reporting_frequency": self.vat_reporting_frequency,
+            "advance_payment_frequency": self.advance_payment_frequency,
+            "phone": self.phone,
+            "email": self.email,
+        }
+
+
 class ClientExcelImportError(ValueError):
     def __init__(self, message: str, status_code: int):
         super().__init__(message)
@@ -34,63 +66,57 @@ class ClientExcelImportError(ValueError):
 class ClientExcelService:
     """Helper for creating client Excel exports and templates."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session | None, export_dir: str | Path | None = None):
         self.db = db
-        self.export_dir = Path(tempfile.gettempdir()) / "exports" / "clients"
+        self.export_dir = (
+            Path(export_dir) if export_dir else Path(tempfile.gettempdir()) / "exports" / "clients"
+        )
         self.export_dir.mkdir(parents=True, exist_ok=True)
 
     def export_clients(self, clients: Iterable[object]) -> dict:
-        """Create an Excel file containing the provided clients."""
-        wb, ws = self._create_workbook_with_columns(CLIENT_EXPORT_COLUMNS)
-        for row_index, client in enumerate(clients, start=2):
-            for col_index, (attr, _) in enumerate(CLIENT_EXPORT_COLUMNS, start=1):
-                ws.cell(
-                    row=row_index,
-                    column=col_index,
-                    value=self._value_from_client(client, attr),
-                )
+        """
+        Create an Excel file containing the provided clients.
 
-        adjust_column_widths(ws)
+        *clients* is consumed once, row by row, so a repository cursor can be
+        passed straight in without materialising the list.
+        """
+        wb, ws = self._create_workbook_with_columns(CLIENT_EXPORT_COLUMNS)
+        attrs = [attr for attr, _ in CLIENT_EXPORT_COLUMNS]
+        ws.extend(
+            [self._value_from_client(client, attr) for attr in attrs] for client in clients
+        )
         return save_workbook_to_temp(wb, prefix="clients_export", export_dir=self.export_dir)
 
     def generate_template(self) -> dict:
         """Create a client import template that includes helper headers."""
         wb, ws = self._create_workbook_with_columns(CLIENT_TEMPLATE_COLUMNS)
-        for col_index, value in enumerate(CLIENT_TEMPLATE_SAMPLE_ROW, start=1):
-            ws.cell(row=2, column=col_index, value=value)
-
-        adjust_column_widths(ws)
+        ws.append(CLIENT_TEMPLATE_SAMPLE_ROW)
         return save_workbook_to_temp(wb, prefix="clients_template", export_dir=self.export_dir)
 
     def _create_workbook_with_columns(self, columns: list[tuple[str, str]]):
         try:
-            from openpyxl import Workbook
+            wb = StreamingWorkbook()
             from openpyxl.styles import Alignment, Font
         except ImportError as exc:
             raise ImportError("הספרייה openpyxl נדרשת לצורך ייצוא לקוחות לאקסל") from exc
 
-        wb = Workbook()
-        ws = wb.active
-        ws.title = CLIENT_EXCEL_SHEET_TITLE
-        header_font = Font(bold=True)
-
-        for index, (_, header) in enumerate(columns, start=1):
-            cell = ws.cell(row=1, column=index, value=header)
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal="center")
-
-        ws.freeze_panes = CLIENT_EXCEL_FREEZE_PANES
+        ws = wb.add_sheet(CLIENT_EXCEL_SHEET_TITLE, freeze_panes=CLIENT_EXCEL_FREEZE_PANES)
+        ws.append(
+            [header for _, header in columns],
+            font=Font(bold=True),
+            alignment=Alignment(horizontal="center"),
+        )
         return wb, ws
 
-    def import_clients_from_excel(
-        self,
-        workbook,
-        create_client_service: "CreateClientService",
-        actor_id: int | None = None,
-    ) -> tuple[int, list[dict]]:
-        """Parse workbook and create clients with their first business."""
+    def read_import_rows(self, workbook) -> tuple[list["ClientImportRow"], list[dict]]:
+        """
+        Parse and validate every row of an import workbook.
+
+        Blank rows are skipped. Returns the rows that can be created and a
+        ``{"row", "error"}`` entry for each row that cannot.
+        """
         worksheet = workbook.active
-        created = 0
+        rows: list[ClientImportRow] = []
         errors: list[dict] = []
 
         for row_index, row in enumerate(worksheet.iter_rows(min_row=2, values_only=True), start=2):
@@ -98,11 +124,7 @@ class ClientExcelService:
                 continue
 
             values = self._template_row_values(row)
-            full_name = values["full_name"]
-            business_name = values["business_name"]
-            id_number = values["id_number"]
-
-            if not (full_name and business_name and id_number):
+            if not (values["full_name"] and values["business_name"] and values["id_number"]):
                 errors.append(
                     {
                         "row": row_index,
@@ -111,41 +133,62 @@ class ClientExcelService:
                 )
                 continue
 
-            savepoint = self.db.begin_nested()
             try:
                 entity_type = self._enum_value(
                     values["entity_type"],
                     EntityType,
                     default=CLIENT_IMPORT_DEFAULT_ENTITY_TYPE,
                 )
-                vat_reporting_frequency = self._enum_value(
-                    values["vat_reporting_frequency"],
-                    VatType,
-                    default=CLIENT_IMPORT_DEFAULT_VAT_REPORTING_FREQUENCY,
-                )
-                advance_payment_frequency = self._enum_value(
-                    values["advance_payment_frequency"],
-                    AdvancePaymentFrequency,
-                    default=CLIENT_IMPORT_DEFAULT_ADVANCE_PAYMENT_FREQUENCY,
-                )
-                create_client_service.create_client(
-                    full_name=full_name,
-                    business_name=business_name,
-                    id_number=id_number,
-                    id_number_type=derive_id_number_type(entity_type),
-                    entity_type=entity_type,
-                    vat_reporting_frequency=vat_reporting_frequency,
-                    advance_payment_frequency=advance_payment_frequency,
-                    phone=values["phone"] or None,
-                    email=values["email"] or None,
-                    actor_id=actor_id,
+                if entity_type == EntityType.EMPLOYEE:
+                    raise ValueError(UNSUPPORTED_EMPLOYEE_CREATE_ERROR)
+                rows.append(
+                    ClientImportRow(
+                        row=row_index,
+                        full_name=values["full_name"],
+                        business_name=values["business_name"],
+                        id_number=values["id_number"],
+                        id_number_type=derive_id_number_type(entity_type),
+                        entity_type=entity_type,
+                        vat_reporting_frequency=self._enum_value(
+                            values["vat_reporting_frequency"],
+                            VatType,
+                            default=CLIENT_IMPORT_DEFAULT_VAT_REPORTING_FREQUENCY,
+                        ),
+                        advance_payment_frequency=self._enum_value(
+                            values["advance_payment_frequency"],
+                            AdvancePaymentFrequency,
+                            default=CLIENT_IMPORT_DEFAULT_ADVANCE_PAYMENT_FREQUENCY,
+                        ),
+                        phone=values["phone"] or None,
+                        email=values["email"] or None,
+                    )
                 )
+            except ValueError as exc:
+                errors.append({"row": row_index, "error": str(exc)})
+
+        return rows, errors
+
+    def import_clients_from_excel(
+        self,
+        workbook,
+        create_client_service: "CreateClientService",
+        actor_id: int | None = None,
+    ) -> tuple[int, list[dict]]:
+        """Parse workbook and create clients with their first business."""
+        rows, errors = self.read_import_rows(workbook)
+        created = 0
+
+        for row in rows:
+            savepoint = self.db.begin_nested()
+            try:
+                create_client_service.create_client(**row.create_kwargs(), actor_id=actor_id)
                 savepoint.commit()
                 created += 1
             except Exception as exc:
                 savepoint.rollback()
-                errors.append({"row": row_index, "error": str(exc)})
+                errors.append({"row": row.row, "error": str(exc)})
 
+        errors.sort(key=lambda error: error["row"])
         return created, errors
 
     def import_clients_from_upload(
@@ -156,6 +199,25 @@ class ClientExcelService:
         content_length: int | None = None,
         max_upload_size: int = MAX_CLIENT_IMPORT_UPLOAD_SIZE,
     ) -> dict:
+        workbook = self.load_upload(
+            contents, content_length=content_length, max_upload_size=max_upload_size
+        )
+        total_rows = max(workbook.active.max_row - 1, 0)
+        created, errors = self.import_clients_from_excel(
+            workbook,
+            create_client_service,
+            actor_id=actor_id,
+        )
+        return {"created": created, "total_rows": total_rows, "errors": errors}
+
+    def load_upload(
+        self,
+        contents: bytes,
+        *,
+        content_length: int | None = None,
+        max_upload_size: int = MAX_CLIENT_IMPORT_UPLOAD_SIZE,
+    ):
+        """Check the size of an uploaded import file and open it as a workbook."""
         if content_length is not None and content_length > max_upload_size:
             raise ClientExcelImportError("הקובץ חורג ממגבלת הגודל של 10MB", 413)
         if len(contents) > max_upload_size:
@@ -170,18 +232,10 @@ class ClientExcelService:
             ) from exc
 
         try:
-            workbook = load_workbook(BytesIO(contents), data_only=True)
+            return load_workbook(BytesIO(contents), data_only=True)
         except Exception as exc:
             raise ClientExcelImportError("לא ניתן לקרוא את קובץ האקסל", 400) from exc
 
-        total_rows = max(workbook.active.max_row - 1, 0)
-        created, errors = self.import_clients_from_excel(
-            workbook,
-            create_client_service,
-            actor_id=actor_id,
-        )
-        return {"created": created, "total_rows": total_rows, "errors": errors}
-
     def _value_from_client(self, client: object, attr: str):
         value = getattr(client, attr, "")
         return value or ""
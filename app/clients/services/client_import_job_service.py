@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from sqlalchemy.orm import Session
+
+from app.clients.constants import MAX_CLIENT_IMPORT_UPLOAD_SIZE
+from app.clients.models.client_import_job import ClientImportJob
+from app.clients.repositories.client_import_job_repository import ClientImportJobRepository
+from app.clients.services.client_excel_service import ClientExcelService
+from app.clients.services.messages import CLIENT_IMPORT_JOB_NOT_FOUND
+from app.common.services.base_service import BaseService
+from app.core.exceptions import NotFoundError
+from app.users.models.user import User
+
+
+class ClientImportJobService(BaseService):
+    def __init__(self, db: Session):
+        super().__init__(db)
+        self.repo = ClientImportJobRepository(db)
+
+    def submit(
+        self,
+        *,
+        contents: bytes,
+        filename: str | None,
+        user: User,
+        content_length: int | None = None,
+        max_upload_size: int = MAX_CLIENT_IMPORT_UPLOAD_SIZE,
+    ) -> ClientImportJob:
+        """Queue an import; the file is opened here so an unreadable upload fails the request."""
+        ClientExcelService(self.db).load_upload(
+            contents, content_length=content_length, max_upload_size=max_upload_size
+        )
+        with self.transaction():
+            job = self.repo.create(filename=filename, contents=contents, requested_by=user.id)
+        return job
+
+    def get_for_user(self, job_id: int, user: User) -> ClientImportJob:
+        job = self.repo.get_by_id(job_id)
+        if job is None or job.requested_by != user.id:
+            raise NotFoundError(
+                CLIENT_IMPORT_JOB_NOT_FOUND.format(job_id=job_id), "CLIENT_IMPORT.NOT_FOUND"
+            )
+        return job
@@ -0,0 +1,179 @@
+"""Background processing of queued client import jobs (see `client_import_jobs`).
+
+The worker claims one job at a time and runs it in a thread with its own
+session. Every row is parsed and checked for conflicts before anything is
+created, so the job reports its total and all known row errors up front.
+Valid rows are then created in batches through `ClientBulkImportService`; each
+batch commits together with the job's progress and a renewed lease. A batch
+that fails as a whole is retried row by row through `CreateClientService` so
+one bad row costs only itself.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_right
+from collections.abc import Callable
+
+from sqlalchemy.orm import Session
+
+from app.clients.models.client_import_job import ClientImportJob
+from app.clients.repositories.client_import_job_repository import ClientImportJobRepository
+from app.clients.services.client_bulk_import_service import CalendarCache, ClientBulkImportService
+from app.clients.services.client_excel_service import (
+    ClientExcelImportError,
+    ClientExcelService,
+    ClientImportRow,
+)
+from app.clients.services.create_client_service import CreateClientService
+from app.clients.services.messages import CLIENT_IMPORT_FAILED, CLIENT_IMPORT_GAVE_UP
+from app.config import settings
+from app.core.exceptions import AppError
+from app.core.logging_config import get_logger
+from app.infrastructure.jobs import LeasedQueueWorker
+from app.utils.time_utils import utcnow
+
+logger = get_logger(__name__)
+
+
+class ClientImportWorker(LeasedQueueWorker):
+    name = "client import worker"
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        *,
+        batch_size: int,
+        lease_seconds: int,
+        max_attempts: int,
+    ) -> None:
+        super().__init__(
+            session_factory,
+            claim_limit=1,
+            lease_seconds=lease_seconds,
+            max_attempts=max_attempts,
+        )
+        self._batch_size = batch_size
+
+    async def run_once(self) -> int:
+        """Process the next queued job; returns how many were claimed (0 or 1)."""
+        return await asyncio.to_thread(self.process_next)
+
+    def process_next(self) -> int:
+        db = self._session_factory()
+        try:
+            repo = ClientImportJobRepository(db)
+            job = repo.claim(lease_until=self.lease_until())
+            db.commit()
+            if job is None:
+                return 0
+            job_id = job.id
+            try:
+                if self.gave_up(job.attempts):
+                    raise AppError(
+                        CLIENT_IMPORT_GAVE_UP.format(attempts=job.attempts - 1),
+                        "CLIENT_IMPORT.GAVE_UP",
+                    )
+                self._run(db, repo, job)
+            except Exception as exc:
+                db.rollback()
+                if isinstance(exc, (AppError, ClientExcelImportError)):
+                    error = exc.message if isinstance(exc, AppError) else str(exc)
+                else:
+                    logger.exception("client import job %s failed", job_id)
+                    error = CLIENT_IMPORT_FAILED.format(error=exc)
+                repo.mark_failed(job_id, error, finished_at=utcnow())
+                db.commit()
+                logger.warning("client import job %s failed: %s", job_id, error)
+            return 1
+        finally:
+            db.close()
+
+    # ── Steps ─────────────────────────────────────────────────────────────────
+
+    def _run(self, db: Session, repo: ClientImportJobRepository, job: ClientImportJob) -> None:
+        job_id, actor_id = job.id, job.requested_by
+        # Rows up to last_row were committed by an earlier attempt, errors included.
+        resume_after = job.last_row or 0
+        kept_errors = [error for error in job.errors or [] if error["row"] <= resume_after]
+        created = job.created_count
+
+        workbook = ClientExcelService(db).load_upload(job.contents)
+        rows, parse_errors = ClientExcelService(db).read_import_rows(workbook)
+        row_numbers = sorted([row.row for row in rows] + [error["row"] for error in parse_errors])
+
+        calendar: CalendarCache = {}
+        bulk = ClientBulkImportService(db, calendar=calendar)
+        accepted, conflicts = bulk.validate([row for row in rows if row.row > resume_after])
+        errors = (
+            kept_errors
+            + [error for error in parse_errors if error["row"] > resume_after]
+            + conflicts
+        )
+        errors.sort(key=lambda error: error["row"])
+        repo.record_validation(job_id, total_rows=len(row_numbers), errors=errors)
+        db.commit()
+
+        for start in range(0, len(accepted), self._batch_size):
+            batch = accepted[start : start + self._batch_size]
+            created += self._import_batch(db, bulk, calendar, batch, errors, actor_id)
+            errors.sort(key=lambda error: error["row"])
+            repo.record_progress(
+                job_id,
+                last_row=batch[-1].row,
+                processed_rows=bisect_right(row_numbers, batch[-1].row),
+                created_count=created,
+                errors=errors,
+                lease_until=self.lease_until(),
+            )
+            db.commit()
+
+        repo.mark_succeeded(job_id, processed_rows=len(row_numbers), finished_at=utcnow())
+        db.commit()
+        logger.info(
+            "client import job %s succeeded rows=%s created=%s errors=%s",
+            job_id,
+            len(row_numbers),
+            created,
+            len(errors),
+        )
+
+    def _import_batch(
+        self,
+        db: Session,
+        bulk: ClientBulkImportService,
+        calendar: CalendarCache,
+        batch: list[ClientImportRow],
+        errors: list[dict],
+        actor_id: int,
+    ) -> int:
+        savepoint = db.begin_nested()
+        try:
+            bulk.import_rows(batch, actor_id=actor_id)
+            savepoint.commit()
+            return len(batch)
+        except Exception:
+            savepoint.rollback()
+            logger.warning("client import batch failed; retrying %s rows one by one", len(batch))
+        # Calendar entries created inside the rolled-back savepoint are gone.
+        calendar.clear()
+        created = 0
+        for row in batch:
+            savepoint = db.begin_nested()
+            try:
+                CreateClientService(db).create_client(**row.create_kwargs(), actor_id=actor_id)
+                savepoint.commit()
+                created += 1
+            except Exception as exc:
+                savepoint.rollback()
+                errors.append({"row": row.row, "error": str(exc)})
+        return created
+
+
+def build_client_import_worker(session_factory: Callable[[], Session]) -> ClientImportWorker:
+    return ClientImportWorker(
+        session_factory,
+        batch_size=settings.CLIENT_IMPORT_BATCH_SIZE,
+        lease_seconds=settings.CLIENT_IMPORT_JOB_LEASE_SECONDS,
+        max_attempts=settings.CLIENT_IMPORT_JOB_MAX_ATTEMPTS,
+    )
@@ -2,6 +2,7 @@ from sqlalchemy.orm import Session
 
 from app.audit.constants import ENTITY_CLIENT
 from app.audit.services.entity_audit_writer import EntityAuditWriter
+from app.clients.repositories.client_identity_loader import ClientIdentityLoader
 from app.clients.repositories.client_record_read_repository import (
     get_full_record,
     get_full_record_including_deleted,
@@ -25,6 +26,7 @@ class ClientLifecycleService:
         client = self.record_repo.get_by_id_including_deleted(client_id)
         if not client or client.deleted_at is not None:
             raise NotFoundError(CLIENT_NOT_FOUND.format(client_id=client_id), "CLIENT.NOT_FOUND")
+        ClientIdentityLoader(self.db).invalidate([client_id])
         self.record_repo.soft_delete(client_id, deleted_by=actor_id)
         self._audit.record_delete(ENTITY_CLIENT, client_id, actor_id)
 
@@ -41,6 +43,7 @@ class ClientLifecycleService:
                 CLIENT_ID_NUMBER_ACTIVE_EXISTS.format(id_number=id_number),
                 "CLIENT.CONFLICT",
             )
+        ClientIdentityLoader(self.db).invalidate([client_id])
         restored_record = self.record_repo.restore(client_id, restored_by=actor_id)
         restored = get_full_record(self.db, restored_record.id) if restored_record else None
         if not restored:
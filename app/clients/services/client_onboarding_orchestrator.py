@@ -1,9 +1,10 @@
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import date
 
 from sqlalchemy.orm import Session
 
-from app.actions.obligation_orchestrator import generate_client_obligations
+from app.actions.obligation_orchestrator import generate_client_obligations, years_to_generate
 from app.advance_payments.repositories.advance_payment_repository import (
     AdvancePaymentRepository,
 )
@@ -14,6 +15,7 @@ from app.clients.repositories.client_record_repository import ClientRecordReposi
 from app.clients.repositories.legal_entity_repository import LegalEntityRepository
 from app.common.enums import ObligationType
 from app.common.obligation_plan import (
+    PeriodicObligationPlan,
     advance_payment_obligation_plan,
     vat_obligation_plan,
 )
@@ -26,6 +28,43 @@ from app.vat_reports.repositories.vat_work_item_write_repository import (
 )
 from app.vat_reports.services.intake import create_work_item
 
+ONBOARDING_VAT_PENDING_NOTE = "נוצר אוטומטית מפתיחת לקוח"
+
+# (obligation type, period, months) -> (tax_calendar_entry_id, due_date)
+EntryLookup = Callable[[ObligationType, str, int | None], tuple[int, date]]
+DuePeriod = tuple[PeriodicObligationPlan, int, date]
+
+
+def onboarding_vat_plans(vat_type, years: list[int]) -> list[PeriodicObligationPlan]:
+    return [plan for year in years for plan in vat_obligation_plan(vat_type, year)]
+
+
+def onboarding_advance_payment_plans(
+    frequency, entity_type, years: list[int]
+) -> list[PeriodicObligationPlan]:
+    return [
+        plan
+        for year in years
+        for plan in advance_payment_obligation_plan(
+            frequency=frequency, year=year, entity_type=entity_type
+        )
+    ]
+
+
+def due_onboarding_periods(
+    obligation: ObligationType,
+    plans: list[PeriodicObligationPlan],
+    entry_for: EntryLookup,
+    reference_date: date,
+) -> list[DuePeriod]:
+    """Plans onboarding opens a record for (deadline not yet passed), with their calendar entry."""
+    due = []
+    for plan in plans:
+        entry_id, due_date = entry_for(obligation, plan.period, plan.period_months_count)
+        if due_date >= reference_date:
+            due.append((plan, entry_id, due_date))
+    return due
+
 
 @dataclass(slots=True)
 class ClientOnboardingResult:
@@ -87,6 +126,12 @@ class ClientOnboardingOrchestrator:
             return
         create_initial_binder(self.db, record, actor_id)
 
+    def _entry(
+        self, obligation: ObligationType, period: str, months: int | None
+    ) -> tuple[int, date]:
+        entry = self.tax_calendar.ensure_periodic_entry(obligation, period, months)
+        return entry.id, entry.due_date
+
     def _sync_vat_work_items(
         self,
         client_record_id: int,
@@ -94,35 +139,28 @@ class ClientOnboardingOrchestrator:
         vat_type,
         reference_date: date,
     ) -> int:
-        from app.actions.obligation_orchestrator import _years_to_generate
-
-        years = _years_to_generate(reference_date)
         created = 0
-        for year in years:
-            plans = vat_obligation_plan(vat_type, year)
-            for plan in plans:
-                entry = self.tax_calendar.ensure_periodic_entry(
-                    ObligationType.VAT,
-                    plan.period,
-                    plan.period_months_count,
-                )
-                if entry.due_date < reference_date:
-                    continue
-                item = self.vat_repo.get_by_client_record_period(client_record_id, plan.period)
-                if item is None and actor_id is not None:
-                    try:
-                        create_work_item(
-                            self.vat_repo,
-                            self.db,
-                            client_record_id=client_record_id,
-                            period=plan.period,
-                            created_by=actor_id,
-                            mark_pending=True,
-                            pending_materials_note="נוצר אוטומטית מפתיחת לקוח",
-                        )
-                        created += 1
-                    except ConflictError:
-                        pass
+        for plan, _entry_id, _due in due_onboarding_periods(
+            ObligationType.VAT,
+            onboarding_vat_plans(vat_type, years_to_generate(reference_date)),
+            self._entry,
+            reference_date,
+        ):
+            item = self.vat_repo.get_by_client_record_period(client_record_id, plan.period)
+            if item is None and actor_id is not None:
+                try:
+                    create_work_item(
+                        self.vat_repo,
+                        self.db,
+                        client_record_id=client_record_id,
+                        period=plan.period,
+                        created_by=actor_id,
+                        mark_pending=True,
+                        pending_materials_note=ONBOARDING_VAT_PENDING_NOTE,
+                    )
+                    created += 1
+                except ConflictError:
+                    pass
         return created
 
     def _sync_advance_payments(
@@ -134,42 +172,33 @@ class ClientOnboardingOrchestrator:
     ) -> int:
         if frequency is None:
             return 0
-        from app.actions.obligation_orchestrator import _years_to_generate
-
-        years = _years_to_generate(reference_date)
         created = 0
-        for year in years:
-            plans = advance_payment_obligation_plan(
-                frequency=frequency,
-                year=year,
-                entity_type=entity_type,
-            )
-            for plan in plans:
-                entry = self.tax_calendar.ensure_periodic_entry(
-                    ObligationType.ADVANCE_PAYMENT,
-                    plan.period,
-                    plan.period_months_count,
-                )
-                if entry.due_date < reference_date:
-                    continue
-                payment = self.advance_repo.get_by_period(client_record_id, plan.period)
-                if payment is None:
-                    try:
-                        self.advance_service.create_payment_for_client(
-                            client_record_id=client_record_id,
-                            period=plan.period,
-                            period_months_count=plan.period_months_count,
-                        )
-                        created += 1
-                    except ConflictError:
-                        pass
-                elif (
-                    payment.period_months_count != plan.period_months_count
-                    or payment.due_date != entry.due_date
-                ):
-                    self.advance_repo.update_payment(
-                        payment,
+        for plan, _entry_id, due_date in due_onboarding_periods(
+            ObligationType.ADVANCE_PAYMENT,
+            onboarding_advance_payment_plans(
+                frequency, entity_type, years_to_generate(reference_date)
+            ),
+            self._entry,
+            reference_date,
+        ):
+            payment = self.advance_repo.get_by_period(client_record_id, plan.period)
+            if payment is None:
+                try:
+                    self.advance_service.create_payment_for_client(
+                        client_record_id=client_record_id,
+                        period=plan.period,
                         period_months_count=plan.period_months_count,
-                        due_date=entry.due_date,
                     )
+                    created += 1
+                except ConflictError:
+                    pass
+            elif (
+                payment.period_months_count != plan.period_months_count
+                or payment.due_date != due_date
+            ):
+                self.advance_repo.update_payment(
+                    payment,
+                    period_months_count=plan.period_months_count,
+                    due_date=due_date,
+                )
         return created
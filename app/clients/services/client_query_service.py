@@ -1,3 +1,5 @@
+from collections.abc import Iterator
+
 from sqlalchemy.orm import Session
 
 from app.clients.enums import ClientStatus
@@ -5,6 +7,7 @@ from app.clients.repositories.client_record_read_repository import (
     get_full_record,
     get_full_record_including_deleted,
     get_full_records_bulk,
+    iter_full_records,
 )
 from app.clients.repositories.client_record_repository import ClientRecordRepository
 from app.clients.schemas.client_conflicts import (
@@ -21,6 +24,7 @@ from app.clients.schemas.client_record_response import (
 )
 from app.clients.services.client_enrichment_service import ClientEnrichmentService
 from app.common.enums import EntityType
+from app.common.repositories.keyset import CountMode
 from app.core.exceptions import NotFoundError
 
 
@@ -42,6 +46,11 @@ class ClientQueryService:
         full_map = get_full_records_bulk(self.db, [r.id for r in records])
         return [ClientRecordResponse(**full_map[r.id]) for r in records if r.id in full_map]
 
+    def iter_all_clients(self) -> Iterator[ClientRecordResponse]:
+        """Same rows as ``list_all_clients``, streamed from a cursor for exports."""
+        for data in iter_full_records(self.db):
+            yield ClientRecordResponse(**data)
+
     def get_conflict_info(self, id_number: str) -> ClientConflictInfo:
         active_records = self.record_repo.get_active_by_id_number(id_number)
         deleted_records = self.record_repo.get_deleted_by_id_number(id_number)
@@ -90,8 +99,10 @@ class ClientQueryService:
         sort_order: str = "asc",
         page: int = 1,
         page_size: int = 20,
+        cursor: str | None = None,
+        count_mode: CountMode = "exact",
     ) -> ClientRecordListResponse:
-        records = self.record_repo.list(
+        result = self.record_repo.list_page(
             search=search,
             status=status,
             accountant_id=accountant_id,
@@ -100,14 +111,10 @@ class ClientQueryService:
             sort_order=sort_order,
             page=page,
             page_size=page_size,
+            cursor=cursor,
+            count_mode=count_mode,
         )
-        total = self.record_repo.count(
-            search=search,
-            status=status,
-            accountant_id=accountant_id,
-            entity_type=entity_type,
-        )
-        record_ids = [r.id for r in records]
+        record_ids = [r.id for r in result.items]
         full_map = get_full_records_bulk(self.db, record_ids)
         items = [ClientRecordResponse(**full_map[rid]) for rid in record_ids if rid in full_map]
         items = ClientEnrichmentService(self.db).enrich_list(items, tax_year=tax_year)
@@ -125,7 +132,8 @@ class ClientQueryService:
             items=items,
             page=page,
             page_size=page_size,
-            total=total,
+            total=result.total,
+            next_cursor=result.next_cursor,
             stats=stats,
         )
 
@@ -136,18 +144,22 @@ class ClientQueryService:
         sort_order: str = "asc",
         page: int = 1,
         page_size: int = 100,
+        cursor: str | None = None,
+        count_mode: CountMode = "exact",
     ) -> ClientSidebarListResponse:
-        rows = self.record_repo.list_sidebar(
+        result = self.record_repo.list_sidebar_page(
             search=search,
             sort_by=sort_by,
             sort_order=sort_order,
             page=page,
             page_size=page_size,
+            cursor=cursor,
+            count_mode=count_mode,
         )
-        total = self.record_repo.count_sidebar(search=search)
         return ClientSidebarListResponse(
-            items=[ClientSidebarItemResponse(**dict(row)) for row in rows],
+            items=[ClientSidebarItemResponse(**dict(row)) for row in result.items],
             page=page,
             page_size=page_size,
-            total=total,
+            total=result.total,
+            next_cursor=result.next_cursor,
         )
@@ -14,6 +14,7 @@ from app.audit.services.entity_audit_writer import EntityAuditWriter
 from app.binders.repositories.binder_repository import BinderRepository
 from app.clients.enums import ClientStatus
 from app.clients.repositories.client_graph_writer import apply_graph_update
+from app.clients.repositories.client_identity_loader import ClientIdentityLoader
 from app.clients.repositories.client_record_read_repository import (
     get_full_record,
 )
@@ -50,6 +51,7 @@ class ClientUpdateService:
                 client_id, old_entity_type, new_entity_type, actor_id
             )
         old_snapshot = {k: existing.get(k) for k in fields if k in existing}
+        ClientIdentityLoader(self.db).invalidate([client_id])
         updated = self._update_client_record_graph(client_id, **fields)
         if new_status is not None:
             self._update_client_record_status(client_id, new_status)
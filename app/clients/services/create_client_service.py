@@ -19,6 +19,7 @@ from app.clients.create_policy import (
     preview_vat_reporting_frequency,
 )
 from app.clients.models.client_record import ClientRecord
+from app.clients.repositories.client_identity_loader import ClientIdentityLoader
 from app.clients.repositories.client_record_repository import ClientRecordRepository
 from app.clients.repositories.legal_entity_repository import LegalEntityRepository
 from app.clients.repositories.person_repository import PersonRepository
@@ -40,6 +41,21 @@ from app.core.exceptions import AppError, ConflictError
 from app.users.models.user import UserRole
 
 
+def client_created_audit(
+    client_record: ClientRecord,
+    *,
+    full_name: str,
+    id_number: str,
+    entity_type: EntityType | None,
+) -> dict:
+    return {
+        "full_name": full_name,
+        "id_number": id_number,
+        "entity_type": entity_type,
+        "office_client_number": client_record.office_client_number,
+    }
+
+
 class CreateClientService:
     """Coordinate creation of a reporting entity and its first business."""
 
@@ -206,6 +222,7 @@ class CreateClientService:
             raise ConflictError(
                 CLIENT_ID_NUMBER_EXISTS.format(id_number=id_number), "CLIENT.CONFLICT"
             ) from exc
+        ClientIdentityLoader(self.db).invalidate([client_record.id])
         ClientOnboardingOrchestrator(self.db).run(
             client_record.id,
             actor_id=actor_id,
@@ -216,12 +233,9 @@ class CreateClientService:
             ENTITY_CLIENT,
             client_record.id,
             actor_id,
-            new_value={
-                "full_name": full_name,
-                "id_number": id_number,
-                "entity_type": entity_type,
-                "office_client_number": client_record.office_client_number,
-            },
+            new_value=client_created_audit(
+                client_record, full_name=full_name, id_number=id_number, entity_type=entity_type
+            ),
         )
         return client_record
 
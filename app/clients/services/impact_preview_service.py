@@ -2,7 +2,7 @@ from datetime import date
 
 from sqlalchemy.orm import Session
 
-from app.actions.obligation_orchestrator import _years_to_generate
+from app.actions.obligation_orchestrator import years_to_generate
 from app.clients.create_policy import normalize_vat_exempt_ceiling
 from app.clients.schemas.impact import ClientCreationImpactResponse, CreationImpactItem
 from app.common.enums import (
@@ -31,7 +31,7 @@ def compute_creation_impact(
         raise ValueError("פתיחת לקוח מסוג שכיר אינה נתמכת במערכת")
 
     today = reference_date or date.today()
-    years = _years_to_generate(today)
+    years = years_to_generate(today)
     n = len(years)
     is_exempt = vat_reporting_frequency in (VatType.EXEMPT, None)
     tax_calendar = TaxCalendarMaterializationService(db)
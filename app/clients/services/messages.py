@@ -5,3 +5,6 @@ CLIENT_NOT_FOUND = "לקוח {client_id} לא נמצא"
 CLIENT_NOT_DELETED = "לקוח זה אינו מחוק"
 CLIENT_ID_NUMBER_ACTIVE_EXISTS = "לקוח עם מספר ת.ז. {id_number} כבר קיים ופעיל במערכת"
 CLIENT_OFFICE_NUMBER_CONFLICT = "שגיאה בהקצאת מספר לקוח פנימי — נסה שוב"
+CLIENT_IMPORT_JOB_NOT_FOUND = "משימת ייבוא לקוחות {job_id} לא נמצאה"
+CLIENT_IMPORT_FAILED = "ייבוא הלקוחות נכשל: {error}"
+CLIENT_IMPORT_GAVE_UP = "ייבוא הלקוחות נכשל לאחר {attempts} ניסיונות"
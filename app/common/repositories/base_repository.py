@@ -5,6 +5,7 @@ from typing import Any, ClassVar, Generic, TypeVar
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.common.repositories.keyset import Keyset, KeysetPage, fetch_page
 from app.utils.time_utils import utcnow
 
 ModelType = TypeVar("ModelType")
@@ -115,6 +116,10 @@ class BaseRepository(Generic[ModelType]):
 
     apply_pagination = staticmethod(_apply_pagination)
 
+    def fetch_page(self, stmt, keyset: Keyset, **kwargs) -> KeysetPage:
+        """Keyset-paginated variant of `apply_pagination`; see `keyset.fetch_page`."""
+        return fetch_page(self.db, stmt, keyset, **kwargs)
+
     def _update_entity(
         self,
         entity,
@@ -0,0 +1,237 @@
+"""Keyset (cursor) pagination shared by the high-volume list repositories.
+
+A list opts in by describing its ORDER BY as a `Keyset`: the sort columns in
+order, ending with the primary key as a unique tiebreaker. The keyset then
+
+- orders the statement (NULLs always last, so every dialect agrees),
+- selects the sort values next to each row,
+- fetches one row beyond the page to know whether another page exists, and
+- turns the last row's sort values into an opaque `next_cursor` token.
+
+Passing that token back replaces OFFSET with a "rows after this sort tuple"
+predicate, so page N costs the same as page 1. Without a cursor the statement
+still uses page / page_size, which keeps the existing API contract; those
+responses carry a `next_cursor` too, so a client can switch to cursors after
+the first page.
+
+`count_rows` backs the optional estimated-count mode: on PostgreSQL it asks
+the planner for a row estimate instead of running a second full COUNT(*).
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Generic, Literal, TypeVar
+
+from sqlalchemy import ClauseElement, and_, false, func, or_, select, tuple_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import Executable, nullslast
+
+from app.core.exceptions import AppError
+
+T = TypeVar("T")
+
+CountMode = Literal["exact", "estimated", "none"]
+
+INVALID_CURSOR_MESSAGE = "סמן העימוד אינו תקין — יש לטעון את הרשימה מחדש"
+INVALID_CURSOR_CODE = "PAGINATION.INVALID_CURSOR"
+
+# Planner estimates are unreliable for small results; below this many
+# estimated rows an exact COUNT(*) is cheap, so it is used instead.
+EXACT_COUNT_BELOW = 1000
+
+_KEY_LABEL = "_keyset_{}"
+
+
+@dataclass(frozen=True)
+class KeysetColumn:
+    expr: Any
+    descending: bool = False
+    nullable: bool = False
+
+
+@dataclass(frozen=True)
+class KeysetPage(Generic[T]):
+    items: list[T]
+    next_cursor: str | None = None
+    total: int | None = None
+
+
+class Keyset:
+    """Sort definition of one list; `scope` ties cursors to the list and sort they came from."""
+
+    def __init__(self, scope: str, columns: Sequence[KeysetColumn]):
+        self.scope = scope
+        self.columns = tuple(columns)
+
+    def order(self, stmt):
+        """Apply the ORDER BY only (for callers that page by OFFSET)."""
+        return stmt.order_by(*(self._order_clause(column) for column in self.columns))
+
+    def paginate(self, stmt, *, cursor: str | None, page: int, page_size: int):
+        """Order, position and limit `stmt`; pair with `page()` on the fetched rows.
+
+        The sort values are appended as extra labelled columns, so ORM callers
+        read the entity with `row[0]` and projections keep their named fields.
+        """
+        stmt = self.order(stmt).add_columns(
+            *(column.expr.label(_KEY_LABEL.format(i)) for i, column in enumerate(self.columns))
+        )
+        if cursor:
+            stmt = stmt.where(self._after(decode_cursor(cursor, self.scope, len(self.columns))))
+        else:
+            stmt = stmt.offset((page - 1) * page_size)
+        return stmt.limit(page_size + 1)
+
+    def page(self, rows: Sequence, page_size: int) -> tuple[list, str | None]:
+        """Trim the look-ahead row and build the cursor of the last row kept."""
+        if len(rows) <= page_size:
+            return list(rows), None
+        rows = list(rows[:page_size])
+        size = len(self.columns)
+        last = rows[-1]
+        return rows, encode_cursor(self.scope, tuple(last[len(last) - size :]))
+
+    @staticmethod
+    def _order_clause(column: KeysetColumn):
+        clause = column.expr.desc() if column.descending else column.expr.asc()
+        return nullslast(clause) if column.nullable else clause
+
+    def _after(self, values: Sequence):
+        """Rows strictly after `values` in this keyset's order."""
+        columns = self.columns
+        uniform = len({column.descending for column in columns}) == 1
+        if uniform and not any(column.nullable for column in columns):
+            left = tuple_(*(column.expr for column in columns))
+            right = tuple_(*values)
+            return left < right if columns[0].descending else left > right
+
+        branches = []
+        for i, (column, value) in enumerate(zip(columns, values, strict=True)):
+            prefix = [
+                earlier.expr.is_(None) if earlier_value is None else earlier.expr == earlier_value
+                for earlier, earlier_value in zip(columns[:i], values[:i], strict=True)
+            ]
+            branches.append(and_(*prefix, _strictly_after(column, value)))
+        return or_(*branches)
+
+
+def _strictly_after(column: KeysetColumn, value):
+    if value is None:
+        # NULLs sort last: nothing in this column comes after a NULL.
+        return false()
+    after = column.expr < value if column.descending else column.expr > value
+    return or_(after, column.expr.is_(None)) if column.nullable else after
+
+
+# ── Cursor tokens ─────────────────────────────────────────────────────────────
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"n": str(value)}
+    return value
+
+
+def _decode_value(value):
+    if not isinstance(value, dict):
+        return value
+    ((tag, raw),) = value.items()
+    if tag == "dt":
+        return datetime.fromisoformat(raw)
+    if tag == "d":
+        return date.fromisoformat(raw)
+    if tag == "n":
+        return Decimal(raw)
+    raise ValueError(tag)
+
+
+def encode_cursor(scope: str, values: Sequence) -> str:
+    payload = json.dumps([scope, [_encode_value(value) for value in values]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, scope: str, size: int) -> tuple:
+    """Sort values carried by `token`; AppError 400 when it is malformed or from another list."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        token_scope, values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if token_scope != scope or len(values) != size:
+            raise ValueError(token_scope)
+        return tuple(_decode_value(value) for value in values)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError, AttributeError):
+        raise AppError(INVALID_CURSOR_MESSAGE, INVALID_CURSOR_CODE) from None
+
+
+# ── Counting ──────────────────────────────────────────────────────────────────
+
+
+class _Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def _planner_estimate(db: Session, stmt) -> int | None:
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+    plan = db.execute(_Explain(stmt)).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def count_rows(db: Session, stmt, mode: CountMode = "exact") -> int | None:
+    """Total rows of the filtered (unordered, unpaged) `stmt` under `mode`.
+
+    "estimated" uses the PostgreSQL planner's row estimate and falls back to
+    an exact count on other dialects or when the estimate is small.
+    """
+    if mode == "none":
+        return None
+    stmt = stmt.order_by(None)
+    if mode == "estimated":
+        estimate = _planner_estimate(db, stmt)
+        if estimate is not None and estimate >= EXACT_COUNT_BELOW:
+            return estimate
+    return int(db.scalar(select(func.count()).select_from(stmt.subquery())) or 0)
+
+
+def fetch_page(
+    db: Session,
+    stmt,
+    keyset: Keyset,
+    *,
+    cursor: str | None = None,
+    page: int = 1,
+    page_size: int = 20,
+    count_mode: CountMode = "none",
+    entities: bool = True,
+) -> KeysetPage:
+    """Run `stmt` (filtered, not yet ordered) as one page of `keyset`.
+
+    With `entities` the items are the first column of each row (the ORM
+    entity); otherwise the rows themselves, sort values included.
+    """
+    total = count_rows(db, stmt, count_mode)
+    rows = db.execute(keyset.paginate(stmt, cursor=cursor, page=page, page_size=page_size)).all()
+    rows, next_cursor = keyset.page(rows, page_size)
+    items = [row[0] for row in rows] if entities else rows
+    return KeysetPage(items=items, next_cursor=next_cursor, total=total)
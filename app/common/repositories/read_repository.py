@@ -0,0 +1,158 @@
+"""Read-replica routing for read-only repositories.
+
+`ReadRepository` subclasses (and other read-only helpers through
+`read_session`) query the replica configured by DATABASE_READ_URL. The
+replica session is opened lazily next to the request's primary session and is
+closed with it. Reads fall back to the primary session when
+
+- no replica is configured, or `db` is not a `PrimarySession`. For example,
+  the sync facade of an AsyncSession used by `ConcurrentReads` is not one.
+- the replica is unreachable or lags by more than DB_READ_REPLICA_MAX_LAG_SECONDS.
+  This is probed at most every DB_READ_REPLICA_LAG_CHECK_SECONDS per process.
+- the session has pending or flushed writes, so a request reads its own writes.
+- the acting user committed a write in the last DB_READ_REPLICA_PIN_SECONDS.
+  This is tracked per process, so the lag limit covers requests that land on
+  another worker.
+
+Routing is decided on every `db` access, not once per repository. Only plain
+data (counts, rows, dicts) may leave a replica read: ORM objects loaded there
+belong to the replica session, not to `db`.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TypeVar
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.common.repositories.base_repository import BaseRepository
+from app.config import settings
+from app.core.logging_config import get_logger, get_request_log_stats
+from app.database import (
+    REPLICA_SESSION_KEY,
+    STATEMENT_TIMEOUT_KEY,
+    PrimarySession,
+    ReadSessionLocal,
+    read_engine,
+)
+
+logger = get_logger(__name__)
+
+ModelType = TypeVar("ModelType")
+
+_WROTE_KEY = "wrote"
+
+# Zero while the replica has replayed everything it received; otherwise the
+# age of the last replayed transaction.
+_LAG_SQL = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+_lock = threading.Lock()
+_replica_checked_at = float("-inf")
+_replica_usable = False
+_pinned_until: dict[int, float] = {}
+
+
+def read_session(db: Session) -> Session:
+    """The session a read-only query on behalf of `db` should use."""
+    if not replica_usable(db):
+        return db
+    replica = db.info.get(REPLICA_SESSION_KEY)
+    if replica is None:
+        replica = db.info[REPLICA_SESSION_KEY] = ReadSessionLocal()
+        if STATEMENT_TIMEOUT_KEY in db.info:
+            replica.info[STATEMENT_TIMEOUT_KEY] = db.info[STATEMENT_TIMEOUT_KEY]
+    return replica
+
+
+def replica_usable(db: Session) -> bool:
+    """Whether reads on behalf of `db` may go to the replica right now."""
+    if ReadSessionLocal is None or not isinstance(db, PrimarySession):
+        return False
+    if db.info.get(_WROTE_KEY) or db.new or db.dirty or db.deleted:
+        return False
+    return not _actor_pinned() and _replica_healthy()
+
+
+class ReadRepository(BaseRepository[ModelType]):
+    """Read-only repository whose queries go to the read replica when it is safe to."""
+
+    def __init__(self, db: Session):
+        self.primary_db = db
+
+    @property
+    def db(self) -> Session:
+        return read_session(self.primary_db)
+
+
+# ── Pinning after writes ──────────────────────────────────────────────────────
+
+
+def _actor_id() -> int | None:
+    stats = get_request_log_stats()
+    return stats.actor_user_id if stats is not None else None
+
+
+def _actor_pinned() -> bool:
+    actor_id = _actor_id()
+    return actor_id is not None and _pinned_until.get(actor_id, 0.0) > time.monotonic()
+
+
+@event.listens_for(PrimarySession, "after_flush")
+def _mark_flush(session, _flush_context) -> None:
+    session.info[_WROTE_KEY] = True
+
+
+@event.listens_for(PrimarySession, "do_orm_execute")
+def _mark_bulk_write(orm_execute_state) -> None:
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info[_WROTE_KEY] = True
+
+
+@event.listens_for(PrimarySession, "after_commit")
+def _pin_actor(session) -> None:
+    if read_engine is None or not session.info.get(_WROTE_KEY):
+        return
+    actor_id = _actor_id()
+    if actor_id is None:
+        return
+    now = time.monotonic()
+    with _lock:
+        _pinned_until[actor_id] = now + settings.DB_READ_REPLICA_PIN_SECONDS
+        for expired in [key for key, until in _pinned_until.items() if until <= now]:
+            del _pinned_until[expired]
+
+
+# ── Replica health ────────────────────────────────────────────────────────────
+
+
+def _replica_healthy() -> bool:
+    global _replica_checked_at, _replica_usable
+    now = time.monotonic()
+    if now - _replica_checked_at < settings.DB_READ_REPLICA_LAG_CHECK_SECONDS:
+        return _replica_usable
+    with _lock:
+        if now - _replica_checked_at >= settings.DB_READ_REPLICA_LAG_CHECK_SECONDS:
+            _replica_usable = _probe_replica()
+            _replica_checked_at = now
+    return _replica_usable
+
+
+def _probe_replica() -> bool:
+    try:
+        with read_engine.connect() as conn:
+            if conn.dialect.name != "postgresql":
+                return True
+            lag = float(conn.execute(_LAG_SQL).scalar() or 0)
+    except Exception:  # noqa: BLE001
+        logger.warning("read replica unreachable; reading from the primary", exc_info=True)
+        return False
+    if lag > settings.DB_READ_REPLICA_MAX_LAG_SECONDS:
+        logger.warning("read replica lags %.1fs; reading from the primary", lag)
+        return False
+    return True
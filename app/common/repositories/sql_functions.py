@@ -0,0 +1,84 @@
+"""Portable date expressions for read queries that run on PostgreSQL and SQLite.
+
+Production runs on PostgreSQL while the test-suite runs on SQLite, so date
+arithmetic that cannot be expressed with plain comparisons is compiled per
+dialect here instead of being spread across repositories.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import Date, Integer
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+
+
+class as_date(FunctionElement):
+    """Truncate a DATE/TIMESTAMP expression to a DATE."""
+
+    type = Date()
+    inherit_cache = True
+    name = "as_date"
+
+
+class add_days(FunctionElement):
+    """`as_date(expr) + days` as a DATE."""
+
+    type = Date()
+    inherit_cache = True
+    name = "add_days"
+
+
+class days_between(FunctionElement):
+    """Whole days from `start` to `end` (`end - start`) as an INTEGER."""
+
+    type = Integer()
+    inherit_cache = True
+    name = "days_between"
+
+
+@compiles(as_date)
+def _as_date_default(element, compiler, **kw):
+    (expr,) = list(element.clauses)
+    return f"CAST({compiler.process(expr, **kw)} AS DATE)"
+
+
+@compiles(as_date, "sqlite")
+def _as_date_sqlite(element, compiler, **kw):
+    (expr,) = list(element.clauses)
+    return f"date({compiler.process(expr, **kw)})"
+
+
+@compiles(add_days)
+def _add_days_default(element, compiler, **kw):
+    expr, days = list(element.clauses)
+    return f"(CAST({compiler.process(expr, **kw)} AS DATE) + {compiler.process(days, **kw)})"
+
+
+@compiles(add_days, "sqlite")
+def _add_days_sqlite(element, compiler, **kw):
+    expr, days = list(element.clauses)
+    return (
+        f"date({compiler.process(expr, **kw)}, "
+        f"(CAST({compiler.process(days, **kw)} AS TEXT) || ' days'))"
+    )
+
+
+@compiles(days_between)
+def _days_between_default(element, compiler, **kw):
+    start, end = list(element.clauses)
+    return (
+        f"(CAST({compiler.process(end, **kw)} AS DATE) "
+        f"- CAST({compiler.process(start, **kw)} AS DATE))"
+    )
+
+
+@compiles(days_between, "sqlite")
+def _days_between_sqlite(element, compiler, **kw):
+    start, end = list(element.clauses)
+    return (
+        f"CAST(julianday(date({compiler.process(end, **kw)})) "
+        f"- julianday(date({compiler.process(start, **kw)})) AS INTEGER)"
+    )
+
+
+__all__ = ["add_days", "as_date", "days_between"]
@@ -59,6 +59,23 @@ class Settings(BaseSettings):
     PORT: int = 8000
 
     DATABASE_URL: str = _DEFAULT_DATABASE_URL
+    # Optional read replica for ReadRepository reads (app/common/repositories/read_repository.py).
+    DATABASE_READ_URL: str = ""
+    DB_READ_REPLICA_MAX_LAG_SECONDS: float = 2.0
+    DB_READ_REPLICA_LAG_CHECK_SECONDS: float = 5.0
+    DB_READ_REPLICA_PIN_SECONDS: float = 10.0
+
+    # Per-engine connection pool (PostgreSQL; SQLite keeps SQLAlchemy's defaults).
+    # Each process holds up to DB_POOL_SIZE + DB_MAX_OVERFLOW connections per engine.
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+
+    # Server-side statement_timeout per route class (PostgreSQL, milliseconds; 0 disables).
+    DB_STATEMENT_TIMEOUT_MS: int = 15000
+    DB_EXPORT_STATEMENT_TIMEOUT_MS: int = 300000
 
     JWT_SECRET: str = ""
     JWT_ALGORITHM: str = "HS256"
@@ -88,6 +105,11 @@ class Settings(BaseSettings):
     LOG_SLOW_REQUEST_MS: int = 500
     LOG_SLOW_QUERY_MS: int = 250
     LOG_HIGH_QUERY_COUNT: int = 20
+    # A statement run this many times in one request is reported as a likely N+1.
+    PERF_REPEATED_QUERY_THRESHOLD: int = 5
+    # What an over-budget route does: "raise" fails the request (the test default),
+    # "warn" logs the summary at WARNING.
+    PERF_QUERY_BUDGET_MODE: Literal["off", "warn", "raise"] = "warn"
 
     AUTH_LOGIN_RATE_LIMIT: str = "5/minute"
 
@@ -98,6 +120,62 @@ class Settings(BaseSettings):
 
     NOTIFICATIONS_ENABLED: bool = False
 
+    # DB-coordinated background job runner (see app/infrastructure/jobs/runner.py).
+    JOB_RUNNER_ENABLED: bool = True
+    JOB_RUNNER_POLL_SECONDS: float = 15.0
+    JOB_RUNNER_LEADER_TTL_SECONDS: int = 60
+    JOB_RUNNER_JOB_LEASE_SECONDS: int = 1800
+    JOB_RUNNER_MAX_WORKERS: int = 4
+    # Reminder execution still fails every action as unsupported; keep firing off until it lands.
+    REMINDER_FIRING_JOB_ENABLED: bool = False
+
+    # Notification outbox delivery worker (see app/notification/services/notification_outbox_worker.py).
+    NOTIFICATION_OUTBOX_WORKER_ENABLED: bool = True
+    NOTIFICATION_OUTBOX_POLL_SECONDS: float = 5.0
+    NOTIFICATION_OUTBOX_BATCH_SIZE: int = 50
+    NOTIFICATION_OUTBOX_LEASE_SECONDS: int = 300
+    NOTIFICATION_OUTBOX_MAX_ATTEMPTS: int = 6
+    NOTIFICATION_OUTBOX_RETRY_BASE_SECONDS: float = 30.0
+    NOTIFICATION_OUTBOX_RETRY_MAX_SECONDS: float = 3600.0
+    NOTIFICATION_OUTBOX_EMAIL_CONCURRENCY: int = 4
+    NOTIFICATION_OUTBOX_WHATSAPP_CONCURRENCY: int = 2
+    # Campaign messages per provider batch call (Brevo messageVersions); 1 disables batching.
+    NOTIFICATION_OUTBOX_SEND_BATCH_SIZE: int = 50
+
+    # Asynchronous report exports (see app/exports/services/export_worker.py).
+    EXPORT_WORKER_ENABLED: bool = True
+    EXPORT_WORKER_POLL_SECONDS: float = 2.0
+    EXPORT_PROCESS_POOL_SIZE: int = 2
+    EXPORT_JOB_LEASE_SECONDS: int = 600
+    EXPORT_JOB_MAX_ATTEMPTS: int = 3
+    EXPORT_RESULT_TTL_SECONDS: int = 86400
+    EXPORT_DOWNLOAD_URL_SECONDS: int = 900
+
+    # Background Excel client imports (see app/clients/services/client_import_worker.py).
+    CLIENT_IMPORT_WORKER_ENABLED: bool = True
+    CLIENT_IMPORT_WORKER_POLL_SECONDS: float = 2.0
+    CLIENT_IMPORT_BATCH_SIZE: int = 200
+    CLIENT_IMPORT_JOB_LEASE_SECONDS: int = 300
+    CLIENT_IMPORT_JOB_MAX_ATTEMPTS: int = 3
+
+    WORK_QUEUE_READ_MODEL_ENABLED: bool = True
+
+    # Precomputed dashboard overview (see app/dashboard/models/dashboard_snapshot.py).
+    DASHBOARD_SNAPSHOT_ENABLED: bool = True
+    DASHBOARD_SNAPSHOT_REFRESH_SECONDS: int = 30
+    DASHBOARD_SNAPSHOT_MAX_STALENESS_SECONDS: int = 120
+    DASHBOARD_SNAPSHOT_MAX_AGE_SECONDS: int = 900
+
+    # Conditional GET on read endpoints (see app/infrastructure/http_cache).
+    HTTP_CACHE_ENABLED: bool = True
+    HTTP_CACHE_BODY_MAX_ENTRIES: int = 512
+    HTTP_CACHE_BODY_MAX_BYTES: int = 512_000
+
+    # Process-wide client identity cache (per-request memoisation is always on).
+    CLIENT_IDENTITY_CACHE_ENABLED: bool = False
+    CLIENT_IDENTITY_CACHE_MAX_ENTRIES: int = 5000
+    CLIENT_IDENTITY_CACHE_TTL_SECONDS: float = 60.0
+
     BREVO_API_KEY: str = ""
     BREVO_API_URL: str = "https://api.brevo.com/v3/smtp/email"
     EMAIL_FROM_ADDRESS: str = ""
@@ -107,6 +185,15 @@ class Settings(BaseSettings):
     WHATSAPP_API_URL: str = "https://waba.360dialog.io/v1/messages"
     WHATSAPP_FROM_NUMBER: str = ""
 
+    # Outbound provider HTTP clients (see app/infrastructure/http_clients/), per provider pool.
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 10
+    HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS: int = 5
+    HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    # Only takes effect when the optional `h2` package is installed.
+    HTTP_CLIENT_HTTP2: bool = True
+    HTTP_CLIENT_BREAKER_FAILURE_THRESHOLD: int = 5
+    HTTP_CLIENT_BREAKER_RESET_SECONDS: float = 30.0
+
     INVOICE_PROVIDER_BASE_URL: str = ""
     INVOICE_PROVIDER_API_KEY: str = ""
 
@@ -116,6 +203,14 @@ class Settings(BaseSettings):
     R2_ENDPOINT_URL: str = ""
     R2_REGION: str = "auto"
     LOCAL_STORAGE_PATH: str = "./storage"
+    # S3/R2 multipart uploads (parts must be at least 5 MB).
+    S3_MULTIPART_THRESHOLD_BYTES: int = 8 * 1024 * 1024
+    S3_MULTIPART_CHUNK_BYTES: int = 8 * 1024 * 1024
+    S3_MULTIPART_CONCURRENCY: int = 4
+    # Unreferenced document blobs are deleted after this grace period; keep it
+    # longer than any presigned download URL.
+    DOCUMENT_BLOB_GC_GRACE_HOURS: int = 24
+    DOCUMENT_BLOB_GC_BATCH_SIZE: int = 500
 
     @property
     def CORS_ALLOWED_ORIGINS(self) -> list[str]:
@@ -132,6 +227,9 @@ class Settings(BaseSettings):
         if "LOG_SQL" not in values and os.getenv("LOG_SQL") is None:
             values["LOG_SQL"] = app_env == "development"
 
+        if "PERF_QUERY_BUDGET_MODE" not in values and os.getenv("PERF_QUERY_BUDGET_MODE") is None:
+            values["PERF_QUERY_BUDGET_MODE"] = "raise" if app_env == "test" else "warn"
+
         if "SENTRY_ENVIRONMENT" not in values and os.getenv("SENTRY_ENVIRONMENT") is None:
             values["SENTRY_ENVIRONMENT"] = app_env
 
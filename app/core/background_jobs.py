@@ -1,35 +1,35 @@
-import asyncio
+import multiprocessing
 import os
-from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from datetime import time, timedelta
 
+from app.clients.services.client_import_worker import build_client_import_worker
 from app.config import settings
 from app.core.logging_config import get_logger
-from app.database import SessionLocal
+from app.dashboard.services.dashboard_snapshot_service import DashboardSnapshotService
+from app.database import SessionLocal, export_session
+from app.exports.services.export_job_service import ExportJobService
+from app.exports.services.export_worker import build_export_worker
+from app.exports.services.renderers import warm_up
+from app.infrastructure.http_clients import http_clients
+from app.infrastructure.jobs import DailyAt, Every, JobRegistry, JobRunner
+from app.infrastructure.storage import get_storage_provider
+from app.notification.services.notification_outbox_worker import build_outbox_worker
+from app.permanent_documents.services.document_blob_service import DocumentBlobService
+from app.reminders.services.reminder_executor_service import ReminderExecutorService
 from app.signature_requests.repositories.signature_request_repository import (
     SignatureRequestRepository,
 )
 from app.signature_requests.services.admin_actions import expire_overdue_requests
-from app.tax_calendar.services.bootstrap import bootstrap_tax_calendar
+from app.tax_calendar.services.bootstrap import bootstrap_tax_calendar, default_year_range
+from app.tax_calendar.services.tax_calendar_entry_service import generate_for_year_range
+from app.utils.time_utils import israel_today
+from app.vat_reports.services.vat_totals_reconciliation import reconcile_vat_totals
+from app.work_queue.services.read_model_service import WorkQueueReadModelService
 
 logger = get_logger(__name__)
 
-_INTERVAL: int = getattr(settings, "BACKGROUND_JOB_INTERVAL_SECONDS", 86_400)
-
-
-def run_startup_expiry() -> None:
-    db = SessionLocal()
-    try:
-        count = expire_overdue_requests(SignatureRequestRepository(db))
-        db.commit()
-        if count:
-            logger.info("Expired %d overdue signature request(s) on startup", count)
-    except Exception:
-        db.rollback()
-        logger.exception("Startup signature expiry failed")
-        raise
-    finally:
-        db.close()
-
 
 def run_development_tax_calendar_bootstrap() -> None:
     if settings.APP_ENV != "development":
@@ -58,25 +58,110 @@ def run_development_tax_calendar_bootstrap() -> None:
         db.close()
 
 
-async def _run_job(name: str, task: Callable) -> None:
-    while True:
-        await asyncio.sleep(_INTERVAL)
-        db = SessionLocal()
-        try:
-            task(db)
-            db.commit()
-        except Exception:
-            db.rollback()
-            logger.exception("%s failed", name)
-        finally:
-            db.close()
-
-
-def _expiry_task(db) -> None:
+def _expiry_task(db) -> dict[str, int]:
     count = expire_overdue_requests(SignatureRequestRepository(db))
     if count:
-        logger.info("Daily job: expired %d overdue signature request(s)", count)
+        logger.info("Expired %d overdue signature request(s)", count)
+    return {"expired": count}
+
+
+def _reminder_firing_task(db) -> dict[str, int]:
+    result = ReminderExecutorService(db).fire_due()
+    return asdict(result)
+
+
+def _tax_calendar_materialization_task(db) -> dict[str, int]:
+    start_year, end_year = default_year_range(israel_today())
+    result = generate_for_year_range(db, start_year=start_year, end_year=end_year)
+    return {"start_year": start_year, "end_year": end_year, **asdict(result)}
+
+
+def _work_queue_rebucket_task(db) -> dict[str, int] | None:
+    count = WorkQueueReadModelService(db).rebucket()
+    return None if count is None else {"rebucketed": count}
+
+
+def _dashboard_snapshot_refresh_task(db) -> dict[str, int]:
+    today = israel_today()
+    service = DashboardSnapshotService(db)
+    dropped, roles = service.claim_due(today)
+    # Commit the cleared dirty marks first: a write landing during the refresh marks it again.
+    db.commit()
+    for role in roles:
+        service.refresh(role, today)
+    return {"refreshed": len(roles), "dropped": dropped}
+
+
+def _export_cleanup_task(db) -> dict[str, int]:
+    return ExportJobService(db).expire_results()
+
+
+def _document_blob_gc_task(db) -> dict[str, int]:
+    return DocumentBlobService(db, get_storage_provider()).collect_garbage()
+
+
+def _vat_totals_reconciliation_task(db) -> dict[str, int]:
+    return reconcile_vat_totals(db)
+
+
+def build_job_registry() -> JobRegistry:
+    registry = JobRegistry()
+    registry.register("signature_request_expiry", Every(timedelta(hours=1)), _expiry_task)
+    if settings.REMINDER_FIRING_JOB_ENABLED:
+        registry.register("reminder_firing", Every(timedelta(minutes=1)), _reminder_firing_task)
+    registry.register(
+        "tax_calendar_materialization",
+        DailyAt(time(0, 30)),
+        _tax_calendar_materialization_task,
+    )
+    # Just after the Israel date rolls over, so urgency buckets track israel_today().
+    registry.register("work_queue_rebucket", DailyAt(time(0, 5)), _work_queue_rebucket_task)
+    if settings.DASHBOARD_SNAPSHOT_ENABLED:
+        registry.register(
+            "dashboard_snapshot_refresh",
+            Every(timedelta(seconds=settings.DASHBOARD_SNAPSHOT_REFRESH_SECONDS)),
+            _dashboard_snapshot_refresh_task,
+        )
+    registry.register("export_cleanup", Every(timedelta(minutes=15)), _export_cleanup_task)
+    registry.register("document_blob_gc", DailyAt(time(2, 0)), _document_blob_gc_task)
+    registry.register(
+        "vat_totals_reconciliation", DailyAt(time(1, 0)), _vat_totals_reconciliation_task
+    )
+    return registry
+
+
+async def job_runner_job() -> None:
+    runner = JobRunner(
+        build_job_registry(),
+        export_session,
+        leader_ttl_seconds=settings.JOB_RUNNER_LEADER_TTL_SECONDS,
+        job_lease_seconds=settings.JOB_RUNNER_JOB_LEASE_SECONDS,
+        max_workers=settings.JOB_RUNNER_MAX_WORKERS,
+    )
+    await runner.run_forever(settings.JOB_RUNNER_POLL_SECONDS)
+
+
+async def notification_outbox_job() -> None:
+    # Provider clients are owned by the lifespan, which closes them on shutdown.
+    worker = build_outbox_worker(SessionLocal, http_clients)
+    await worker.run_forever(settings.NOTIFICATION_OUTBOX_POLL_SECONDS)
+
+
+async def export_worker_job() -> None:
+    # spawn, not fork: children must not inherit the parent's DB connections or event loop.
+    pool = ProcessPoolExecutor(
+        max_workers=settings.EXPORT_PROCESS_POOL_SIZE,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=warm_up,
+    )
+    try:
+        worker = build_export_worker(export_session, get_storage_provider(), pool)
+        await worker.run_forever(settings.EXPORT_WORKER_POLL_SECONDS)
+    finally:
+        # Unfinished jobs keep their lease and are picked up again after it lapses.
+        pool.shutdown(wait=False, cancel_futures=True)
 
 
-async def daily_expiry_job() -> None:
-    await _run_job("daily_expiry_job", _expiry_task)
+async def client_import_worker_job() -> None:
+    worker = build_client_import_worker(export_session)
+    await worker.run_forever(settings.CLIENT_IMPORT_WORKER_POLL_SECONDS)
@@ -0,0 +1,51 @@
+"""
+Pre-serialized JSON responses for large list endpoints.
+
+FastAPI serializes a route's return value by validating it against the
+route's response_model again, dumping it to Python primitives and then running
+`json.dumps` over the result. For list endpoints returning hundreds of rows
+that is most of the request's CPU time. `json_response` skips all three: a
+value that already is an instance of the model goes straight to pydantic-core's
+`dump_json`, and the route returns the bytes as a plain `Response`, which
+FastAPI sends as is.
+
+Routes keep `response_model=` so the OpenAPI schema is unchanged. The output
+is the same JSON FastAPI would produce (aliases applied, `None` kept); only the
+whitespace differs. `scripts/tooling/bench_json_serialization.py` compares the
+two paths.
+"""
+
+from __future__ import annotations
+
+from functools import cache
+from typing import Any
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+@cache
+def response_adapter(response_model: Any) -> TypeAdapter:
+    return TypeAdapter(response_model)
+
+
+def dump_json(response_model: Any, value: Any) -> bytes:
+    """Serialize `value` as `response_model`, validating only when it isn't one already."""
+    adapter = response_adapter(response_model)
+    if type(value) is not response_model:
+        value = adapter.validate_python(value, from_attributes=True)
+    return adapter.dump_json(value, by_alias=True)
+
+
+def json_response(
+    response_model: Any,
+    value: Any,
+    *,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    return Response(
+        dump_json(response_model, value), media_type="application/json", headers=headers
+    )
+
+
+__all__ = ["dump_json", "json_response", "response_adapter"]
@@ -11,6 +11,7 @@ Provides consistent log format with:
 
 import json
 import logging
+import re
 import sys
 from contextvars import ContextVar, Token
 from dataclasses import dataclass, field
@@ -25,6 +26,15 @@ request_log_stats_ctx: ContextVar["RequestLogStats | None"] = ContextVar(
 )
 
 
+@dataclass
+class SqlFingerprintStats:
+    """Executions of one normalised statement within a request."""
+
+    count: int = 0
+    total_ms: float = 0
+    caller: str | None = None
+
+
 @dataclass
 class RequestLogStats:
     """Runtime log counters for one request."""
@@ -53,6 +63,10 @@ class RequestLogStats:
     slowest_sql_ms: float = 0
     app_warnings: int = 0
     app_errors: int = 0
+    identity_cache_hits: int = 0
+    identity_cache_misses: int = 0
+    sql_fingerprints: dict[str, SqlFingerprintStats] = field(default_factory=dict)
+    budget_violations: list[str] = field(default_factory=list)
 
     def record_sql_query(self, statement: str, duration_ms: float) -> None:
         operation = _sql_operation(statement)
@@ -61,6 +75,21 @@ class RequestLogStats:
         self.sql_total_ms += duration_ms
         self.slowest_sql_ms = max(self.slowest_sql_ms, duration_ms)
 
+        fingerprint = sql_fingerprint(statement)
+        entry = self.sql_fingerprints.get(fingerprint)
+        if entry is None:
+            entry = self.sql_fingerprints[fingerprint] = SqlFingerprintStats()
+        entry.count += 1
+        entry.total_ms += duration_ms
+        # Attributing means walking the stack, so only statements that repeat pay for it.
+        if entry.count == 2:
+            entry.caller = _sql_caller()
+
+    def repeated_queries(self, threshold: int) -> list[tuple[str, SqlFingerprintStats]]:
+        """Statements executed at least `threshold` times, most repeated first."""
+        repeated = [item for item in self.sql_fingerprints.items() if item[1].count >= threshold]
+        return sorted(repeated, key=lambda item: item[1].count, reverse=True)
+
     def record_transaction(self, transaction: str) -> None:
         self.sql_transactions[transaction] = self.sql_transactions.get(transaction, 0) + 1
 
@@ -72,6 +101,48 @@ def _sql_operation(statement: str) -> str:
     return stripped.split(None, 1)[0].upper()
 
 
+_SQL_STRING = re.compile(r"'(?:[^']|'')*'")
+_SQL_PARAM = re.compile(r"%\(\w+\)s|%s|\$\d+|\?")
+_SQL_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_SQL_PARAM_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SQL_WHITESPACE = re.compile(r"\s+")
+
+# Frames of these modules are plumbing around the query, never its caller.
+_SQL_CALLER_SKIP = ("app.core.", "app.database", "app.middleware.")
+
+
+def sql_fingerprint(statement: str) -> str:
+    """Normalise a statement so executions that differ only in values compare equal.
+
+    Literals and bind parameters become `?` and parameter lists collapse to `(?)`,
+    so `WHERE id IN (?, ?)` and `WHERE id IN (?, ?, ?)` share a fingerprint.
+    """
+    normalised = _SQL_STRING.sub("?", statement)
+    normalised = _SQL_PARAM.sub("?", normalised)
+    normalised = _SQL_NUMBER.sub("?", normalised)
+    normalised = _SQL_PARAM_LIST.sub("(?)", normalised)
+    return _SQL_WHITESPACE.sub(" ", normalised).strip()
+
+
+def _sql_caller() -> str | None:
+    """`module.Class.method` of the repository method running the current query.
+
+    Falls back to the innermost app frame (a service lazy-loading a relationship,
+    say) when no domain repository is on the stack.
+    """
+    frame = sys._getframe(2)
+    fallback = None
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith("app.") and not module.startswith(_SQL_CALLER_SKIP):
+            caller = f"{module}.{frame.f_code.co_qualname}"
+            if ".repositories." in module and not module.startswith("app.common."):
+                return caller
+            fallback = fallback or caller
+        frame = frame.f_back
+    return fallback
+
+
 def begin_request_log_stats() -> None:
     """Start log counters for the current request."""
     request_log_stats_ctx.set(RequestLogStats())
@@ -94,6 +165,14 @@ def record_sql_query(statement: str, duration_ms: float) -> None:
         stats.record_sql_query(statement, duration_ms)
 
 
+def record_identity_cache_lookup(*, hits: int, misses: int) -> None:
+    """Record client identity cache hits/misses for the current request."""
+    stats = request_log_stats_ctx.get()
+    if stats is not None:
+        stats.identity_cache_hits += hits
+        stats.identity_cache_misses += misses
+
+
 def set_request_summary_context(
     method: str,
     path: str,
@@ -166,7 +245,7 @@ def has_request_db_activity() -> bool:
     return stats.sql_queries > 0 or bool(stats.sql_transactions)
 
 
-def format_request_summary(stats: RequestLogStats) -> str:
+def format_request_summary(stats: RequestLogStats, *, repeated_query_threshold: int = 5) -> str:
     """Format the current request summary."""
     request_method = stats.request_method or "UNKNOWN"
     request_path = stats.request_path or "unknown"
@@ -208,6 +287,18 @@ def format_request_summary(stats: RequestLogStats) -> str:
             f"  errors: {stats.app_errors}",
         ]
     )
+    if stats.identity_cache_hits or stats.identity_cache_misses:
+        lines.append(
+            f"  identity cache: hits={stats.identity_cache_hits} "
+            f"misses={stats.identity_cache_misses}"
+        )
+    for fingerprint, repeated in stats.repeated_queries(repeated_query_threshold):
+        lines.append(
+            f"  repeated query: {repeated.count}x {repeated.total_ms:.1f}ms "
+            f"{fingerprint[:120]} ({repeated.caller or 'unknown caller'})"
+        )
+    for violation in stats.budget_violations:
+        lines.append(f"  over query budget: {violation}")
     if stats.error_type:
         lines.append(f"  error: {stats.error_type}")
 
@@ -235,6 +326,7 @@ def request_summary_level(
     slow_request_ms: int,
     slow_query_ms: int,
     high_query_count: int,
+    repeated_query_threshold: int = 5,
 ) -> int:
     """Choose log level from request outcome and thresholds."""
     status_code = stats.status_code if stats.status_code is not None else 500
@@ -250,6 +342,8 @@ def request_summary_level(
     )
     if any(flags.values()) or stats.app_warnings or stats.app_errors:
         return logging.WARNING
+    if stats.budget_violations or stats.repeated_queries(repeated_query_threshold):
+        return logging.WARNING
     return logging.INFO
 
 
@@ -261,6 +355,7 @@ def build_request_summary_event(
     slow_request_ms: int,
     slow_query_ms: int,
     high_query_count: int,
+    repeated_query_threshold: int = 5,
 ) -> dict[str, Any]:
     """Build the structured request summary payload."""
     flags = _request_flags(
@@ -269,12 +364,18 @@ def build_request_summary_event(
         slow_query_ms=slow_query_ms,
         high_query_count=high_query_count,
     )
-    possible_n_plus_one = (
+    repeated = stats.repeated_queries(repeated_query_threshold)
+    possible_n_plus_one = bool(repeated) or (
         stats.sql_queries >= high_query_count
         and stats.sql_by_operation.get("SELECT", 0) >= high_query_count
     )
     status_code = stats.status_code if stats.status_code is not None else 500
-    diagnostic = any(flags.values()) or status_code >= 400 or stats.error_type is not None
+    diagnostic = (
+        any(flags.values())
+        or bool(repeated)
+        or status_code >= 400
+        or stats.error_type is not None
+    )
     payload: dict[str, Any] = {
         "event": "http_request_completed",
         "service": service,
@@ -295,6 +396,13 @@ def build_request_summary_event(
             "errors": stats.app_errors,
         },
     }
+    if stats.identity_cache_hits or stats.identity_cache_misses:
+        payload["cache"] = {
+            "client_identity": {
+                "hits": stats.identity_cache_hits,
+                "misses": stats.identity_cache_misses,
+            }
+        }
     if stats.actor_user_id is not None:
         payload["actor"] = {
             "user_id": stats.actor_user_id,
@@ -322,6 +430,18 @@ def build_request_summary_event(
             payload["http"]["user_agent"] = stats.user_agent
         if stats.referer:
             payload["http"]["referer"] = stats.referer
+    if repeated:
+        payload["db"]["repeated"] = [
+            {
+                "fingerprint": fingerprint,
+                "count": entry.count,
+                "total_ms": round(entry.total_ms, 1),
+                "caller": entry.caller,
+            }
+            for fingerprint, entry in repeated
+        ]
+    if stats.budget_violations:
+        payload["budget"] = {"violations": stats.budget_violations}
     if diagnostic and stats.response_content_length is not None:
         payload["response"] = {"content_length": stats.response_content_length}
     if stats.idempotency_key is not None:
@@ -345,6 +465,7 @@ def log_request_summary(
     slow_request_ms: int = 500,
     slow_query_ms: int = 250,
     high_query_count: int = 20,
+    repeated_query_threshold: int = 5,
 ) -> None:
     """Log the current request summary once."""
     stats = request_log_stats_ctx.get()
@@ -357,10 +478,11 @@ def log_request_summary(
         slow_request_ms=slow_request_ms,
         slow_query_ms=slow_query_ms,
         high_query_count=high_query_count,
+        repeated_query_threshold=repeated_query_threshold,
     )
     logger.log(
         level,
-        format_request_summary(stats),
+        format_request_summary(stats, repeated_query_threshold=repeated_query_threshold),
         extra={
             "structured_event": build_request_summary_event(
                 stats,
@@ -369,6 +491,7 @@ def log_request_summary(
                 slow_request_ms=slow_request_ms,
                 slow_query_ms=slow_query_ms,
                 high_query_count=high_query_count,
+                repeated_query_threshold=repeated_query_threshold,
             )
         },
     )
@@ -0,0 +1,244 @@
+"""
+Per-route query budgets and request performance histograms.
+
+Routes declare a budget with `@query_budget(...)` placed under the router
+decorator. When a request finishes, `finish_request` checks the budget, adds
+the request to the per-route histograms served by `/internal/perf` and logs
+the request summary. An over-budget request is logged at WARNING, and
+`enforce_query_budget` raises `QueryBudgetExceeded` when
+PERF_QUERY_BUDGET_MODE is "raise" (the test default), failing the test that
+made the request.
+
+Histograms are kept in memory per worker process and reset on restart.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from bisect import bisect_left
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from typing import Any, TypeVar
+
+from app.config import settings
+from app.core.logging_config import RequestLogStats, get_request_log_stats, log_request_summary
+
+EndpointT = TypeVar("EndpointT", bound=Callable[..., Any])
+
+QUERY_COUNT_BOUNDS: tuple[float, ...] = (1, 2, 5, 10, 20, 50, 100)
+DURATION_MS_BOUNDS: tuple[float, ...] = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """A route ran more queries than its declared budget allows."""
+
+
+@dataclass(frozen=True)
+class QueryBudget:
+    """Limits for one route.
+
+    `max_db_ms` is only ever warned about: timings are too noisy to fail tests on.
+    """
+
+    max_queries: int
+    max_repeated: int | None = None
+    max_db_ms: float | None = None
+
+    def violations(self, stats: RequestLogStats, *, timings: bool = True) -> list[str]:
+        found = []
+        if stats.sql_queries > self.max_queries:
+            found.append(f"{stats.sql_queries} queries, budget {self.max_queries}")
+        if self.max_repeated is not None:
+            for fingerprint, entry in stats.repeated_queries(self.max_repeated + 1):
+                found.append(
+                    f"{entry.count}x {fingerprint[:120]} "
+                    f"({entry.caller or 'unknown caller'}), budget {self.max_repeated}"
+                )
+        if timings and self.max_db_ms is not None and stats.sql_total_ms > self.max_db_ms:
+            found.append(f"{stats.sql_total_ms:.1f}ms in SQL, budget {self.max_db_ms:.0f}ms")
+        return found
+
+
+_budgets: dict[str, QueryBudget] = {}
+
+
+def endpoint_route_name(endpoint: Callable[..., Any] | None) -> str | None:
+    """`domain.function` name a route is logged, budgeted and profiled under."""
+    if endpoint is None:
+        return None
+    module = getattr(endpoint, "__module__", "")
+    name = getattr(endpoint, "__name__", None)
+    if not name:
+        return None
+    parts = module.split(".")
+    if len(parts) >= 2 and parts[0] == "app":
+        return f"{parts[1]}.{name}"
+    return name
+
+
+def query_budget(
+    max_queries: int,
+    *,
+    max_repeated: int | None = None,
+    max_db_ms: float | None = None,
+) -> Callable[[EndpointT], EndpointT]:
+    """Declare the query budget of the route function it decorates."""
+    budget = QueryBudget(max_queries=max_queries, max_repeated=max_repeated, max_db_ms=max_db_ms)
+
+    def decorate(endpoint: EndpointT) -> EndpointT:
+        _budgets[endpoint_route_name(endpoint)] = budget
+        return endpoint
+
+    return decorate
+
+
+def get_query_budget(route: str | None) -> QueryBudget | None:
+    return _budgets.get(route) if route else None
+
+
+# ── Histograms ────────────────────────────────────────────────────────────────
+
+
+class Histogram:
+    """Fixed-bucket histogram; each bucket counts observations <= its bound."""
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.samples = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.samples += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given fraction of observations."""
+        if not self.samples:
+            return 0.0
+        wanted = fraction * self.samples
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts[:-1], strict=True):
+            seen += count
+            if seen >= wanted:
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self) -> dict[str, Any]:
+        buckets = [
+            {"le": bound, "count": count}
+            for bound, count in zip(self.bounds, self.counts[:-1], strict=True)
+        ]
+        buckets.append({"le": None, "count": self.counts[-1]})
+        return {
+            "count": self.samples,
+            "sum": round(self.total, 1),
+            "max": round(self.max, 1),
+            "p50": round(self.percentile(0.5), 1),
+            "p95": round(self.percentile(0.95), 1),
+            "buckets": buckets,
+        }
+
+
+class RoutePerf:
+    """Per-route request counters and histograms."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.repeated_query_requests = 0
+        self.over_budget_requests = 0
+        self.queries = Histogram(QUERY_COUNT_BOUNDS)
+        self.db_ms = Histogram(DURATION_MS_BOUNDS)
+        self.duration_ms = Histogram(DURATION_MS_BOUNDS)
+
+
+class PerfRegistry:
+    """In-process per-route performance histograms."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._routes: dict[str, RoutePerf] = {}
+        self._since = datetime.now(UTC)
+
+    def record(self, stats: RequestLogStats, *, repeated_query_threshold: int) -> None:
+        route = stats.request_route or "unmatched"
+        repeated = bool(stats.repeated_queries(repeated_query_threshold))
+        with self._lock:
+            perf = self._routes.get(route)
+            if perf is None:
+                perf = self._routes[route] = RoutePerf()
+            perf.requests += 1
+            perf.repeated_query_requests += int(repeated)
+            perf.over_budget_requests += int(bool(stats.budget_violations))
+            perf.queries.observe(stats.sql_queries)
+            perf.db_ms.observe(stats.sql_total_ms)
+            perf.duration_ms.observe(stats.duration_ms or 0)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            routes = []
+            for route, perf in sorted(self._routes.items()):
+                budget = get_query_budget(route)
+                routes.append(
+                    {
+                        "route": route,
+                        "requests": perf.requests,
+                        "repeated_query_requests": perf.repeated_query_requests,
+                        "over_budget_requests": perf.over_budget_requests,
+                        "budget": asdict(budget) if budget is not None else None,
+                        "queries": perf.queries.snapshot(),
+                        "db_ms": perf.db_ms.snapshot(),
+                        "duration_ms": perf.duration_ms.snapshot(),
+                    }
+                )
+        return {"pid": os.getpid(), "since": self._since, "routes": routes}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routes.clear()
+            self._since = datetime.now(UTC)
+
+
+perf_registry = PerfRegistry()
+
+
+# ── Request completion ────────────────────────────────────────────────────────
+
+
+def finish_request(logger: logging.Logger) -> None:
+    """Budget-check, profile and log the current request, once."""
+    stats = get_request_log_stats()
+    if stats is None or stats.summary_logged:
+        return
+
+    budget = get_query_budget(stats.request_route)
+    if budget is not None and settings.PERF_QUERY_BUDGET_MODE != "off":
+        stats.budget_violations = budget.violations(
+            stats, timings=settings.PERF_QUERY_BUDGET_MODE == "warn"
+        )
+    perf_registry.record(stats, repeated_query_threshold=settings.PERF_REPEATED_QUERY_THRESHOLD)
+    log_request_summary(
+        logger,
+        service="binder-billing-crm",
+        env=settings.APP_ENV,
+        slow_request_ms=settings.LOG_SLOW_REQUEST_MS,
+        slow_query_ms=settings.LOG_SLOW_QUERY_MS,
+        high_query_count=settings.LOG_HIGH_QUERY_COUNT,
+        repeated_query_threshold=settings.PERF_REPEATED_QUERY_THRESHOLD,
+    )
+
+
+def enforce_query_budget(stats: RequestLogStats | None) -> None:
+    """Raise for a finished over-budget request when budgets are enforced."""
+    if stats is None or not stats.budget_violations:
+        return
+    if settings.PERF_QUERY_BUDGET_MODE == "raise":
+        raise QueryBudgetExceeded(
+            f"{stats.request_route} over query budget: " + "; ".join(stats.budget_violations)
+        )
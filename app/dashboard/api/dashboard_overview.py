@@ -1,8 +1,11 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import JSONResponse
 
+from app.core.perf import query_budget
 from app.dashboard.schemas.dashboard_extended import DashboardOverviewResponse
-from app.dashboard.services.dashboard_overview_service import DashboardOverviewService
-from app.users.api.deps import CurrentUser, DBSession, require_role
+from app.dashboard.services.dashboard_snapshot_service import DashboardSnapshotService
+from app.infrastructure.http_cache import cache_headers, etag_matches
+from app.users.api.deps import CurrentUser, DBReads, require_role
 from app.users.models.user import UserRole
 
 router = APIRouter(
@@ -13,8 +16,17 @@ router = APIRouter(
 
 
 @router.get("/overview", response_model=DashboardOverviewResponse)
-def get_dashboard_overview(db: DBSession, user: CurrentUser):
-    """Get dashboard overview (ADVISOR only)."""
-    service = DashboardOverviewService(db)
-    overview = service.get_overview(user_role=user.role)
-    return DashboardOverviewResponse(**overview)
+@query_budget(40, max_repeated=5)
+async def get_dashboard_overview(request: Request, reads: DBReads, user: CurrentUser):
+    """Get dashboard overview (ADVISOR only).
+
+    Served from the precomputed snapshot of the user's role (computed live,
+    without storing it, when there is none yet); a matching If-None-Match
+    gets 304 Not Modified.
+    """
+    snapshot = await DashboardSnapshotService.get_overview(reads, user.role)
+    etag = f'"{snapshot.etag}"'
+    headers = cache_headers(etag)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(snapshot.payload, headers=headers)
@@ -0,0 +1,43 @@
+"""Precomputed dashboard overview payloads.
+
+One row per (role, reference date) holding the serialized
+`DashboardOverviewResponse` the overview endpoint serves, and its ETag. Writes
+to the rows the overview reads (VAT work items, advance payments, charges,
+binders, annual reports, tasks, client records and the audit / lifecycle logs)
+mark every snapshot dirty through the session hook in
+`dashboard_snapshot_events`; the `dashboard_snapshot_refresh` job recomputes
+dirty snapshots, and any snapshot older than DASHBOARD_SNAPSHOT_MAX_AGE_SECONDS,
+in the background.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from importlib import import_module
+from typing import Any
+
+from sqlalchemy import JSON, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.utils.time_utils import utcnow
+
+
+class DashboardSnapshot(Base):
+    __tablename__ = "dashboard_snapshots"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    role: Mapped[str] = mapped_column(String(20), nullable=False)
+    reference_date: Mapped[date] = mapped_column(nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    etag: Mapped[str] = mapped_column(String(64), nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(nullable=False, default=utcnow)
+    # Set by the first write after `computed_at`; cleared when the snapshot is recomputed.
+    dirty_at: Mapped[datetime | None] = mapped_column(nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("role", "reference_date", name="uq_dashboard_snapshots_role_date"),
+    )
+
+
+import_module("app.dashboard.models.dashboard_snapshot_events")
@@ -0,0 +1,95 @@
+"""Session events marking `dashboard_snapshots` dirty when the data behind them changes.
+
+Every flush that inserts, updates or deletes a row the overview aggregates flags
+the session; audit entries count only for the entity types recent activity lists,
+and rows written back unchanged don't count. Just before commit one UPDATE stamps
+`dirty_at` on the snapshots that are still clean, inside the same transaction as
+the write. Recomputing is left to the refresh job (or to a read that finds a
+snapshot dirty for longer than DASHBOARD_SNAPSHOT_MAX_STALENESS_SECONDS), so
+writes never pay for it.
+"""
+
+from __future__ import annotations
+
+from itertools import chain
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.advance_payments.models.advance_payment import AdvancePayment
+from app.annual_reports.models.annual_report_model import AnnualReport
+from app.audit.constants import RECENT_ACTIVITY_ENTITY_TYPES
+from app.audit.models.entity_audit_log import EntityAuditLog
+from app.binders.models.binder import Binder
+from app.binders.models.binder_lifecycle_log import BinderLifecycleLog
+from app.charge.models.charge import Charge
+from app.clients.models.client_record import ClientRecord
+from app.clients.models.legal_entity import LegalEntity
+from app.clients.models.person import Person
+from app.clients.models.person_legal_entity_link import PersonLegalEntityLink
+from app.config import settings
+from app.tasks.models.task import Task
+from app.vat_reports.models.vat_work_item import VatWorkItem
+
+_DIRTY_KEY = "dashboard_snapshots_dirty"
+# Tables read by the overview sections: tax status stats, open charges, the
+# attention list (projected from the work queue sources) and recent activity,
+# plus the client identity tables their client names come from.
+_SOURCE_MODELS = (
+    VatWorkItem,
+    AdvancePayment,
+    Charge,
+    Binder,
+    BinderLifecycleLog,
+    EntityAuditLog,
+    AnnualReport,
+    Task,
+    ClientRecord,
+    LegalEntity,
+    Person,
+    PersonLegalEntityLink,
+)
+
+
+def _is_source_change(session: Session, target) -> bool:
+    if not isinstance(target, _SOURCE_MODELS):
+        return False
+    if isinstance(target, EntityAuditLog):
+        return target.entity_type in RECENT_ACTIVITY_ENTITY_TYPES
+    return target not in session.dirty or session.is_modified(target)
+
+
+def has_unmarked_changes(session: Session) -> bool:
+    """Whether `session` holds flushed source writes its snapshots don't know about yet."""
+    return bool(session.info.get(_DIRTY_KEY))
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session: Session, _flush_context) -> None:
+    if not settings.DASHBOARD_SNAPSHOT_ENABLED or session.info.get(_DIRTY_KEY):
+        return
+    if any(
+        _is_source_change(session, target)
+        for target in chain(session.new, session.dirty, session.deleted)
+    ):
+        session.info[_DIRTY_KEY] = True
+
+
+@event.listens_for(Session, "before_commit")
+def _mark_snapshots_dirty(session: Session) -> None:
+    if not settings.DASHBOARD_SNAPSHOT_ENABLED:
+        return
+    session.flush()
+    if not session.info.pop(_DIRTY_KEY, False):
+        return
+
+    from app.dashboard.repositories.dashboard_snapshot_repository import (
+        DashboardSnapshotRepository,
+    )
+
+    DashboardSnapshotRepository(session).mark_all_dirty()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending(session: Session, _previous_transaction) -> None:
+    session.info.pop(_DIRTY_KEY, None)
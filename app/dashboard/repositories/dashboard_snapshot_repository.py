@@ -0,0 +1,111 @@
+"""Storage of the precomputed `dashboard_snapshots`."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy import delete, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.dashboard.models.dashboard_snapshot import DashboardSnapshot
+from app.utils.time_utils import utcnow
+
+
+class DashboardSnapshotRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get(self, role: str, reference_date: date) -> DashboardSnapshot | None:
+        return self.db.scalar(
+            select(DashboardSnapshot).where(
+                DashboardSnapshot.role == role,
+                DashboardSnapshot.reference_date == reference_date,
+            )
+        )
+
+    def list_roles(self, reference_date: date) -> set[str]:
+        return set(
+            self.db.scalars(
+                select(DashboardSnapshot.role).where(
+                    DashboardSnapshot.reference_date == reference_date
+                )
+            )
+        )
+
+    def save(
+        self,
+        role: str,
+        reference_date: date,
+        *,
+        payload: dict[str, Any],
+        etag: str,
+        computed_at: datetime,
+    ) -> None:
+        """Insert or replace the snapshot of (role, reference_date).
+
+        The dirty mark is left alone: it is cleared before recomputing
+        (`clear_dirty`), so a write that lands meanwhile keeps the snapshot due.
+        """
+        snapshot = self.get(role, reference_date)
+        if snapshot is not None:
+            snapshot.payload = payload
+            snapshot.etag = etag
+            snapshot.computed_at = computed_at
+            self.db.flush()
+            return
+        try:
+            with self.db.begin_nested():
+                self.db.add(
+                    DashboardSnapshot(
+                        role=role,
+                        reference_date=reference_date,
+                        payload=payload,
+                        etag=etag,
+                        computed_at=computed_at,
+                    )
+                )
+        except IntegrityError:
+            # A concurrent request stored the first snapshot of this key; keep theirs.
+            pass
+
+    def mark_all_dirty(self, now: datetime | None = None) -> None:
+        """Stamp `dirty_at` on every clean snapshot; already dirty ones keep their first mark."""
+        self.db.execute(
+            update(DashboardSnapshot)
+            .where(DashboardSnapshot.dirty_at.is_(None))
+            .values(dirty_at=now or utcnow())
+        )
+
+    def list_due(
+        self, reference_date: date, *, computed_before: datetime
+    ) -> list[DashboardSnapshot]:
+        """Snapshots of `reference_date` that are dirty or were computed before `computed_before`."""
+        return list(
+            self.db.scalars(
+                select(DashboardSnapshot)
+                .where(
+                    DashboardSnapshot.reference_date == reference_date,
+                    or_(
+                        DashboardSnapshot.dirty_at.is_not(None),
+                        DashboardSnapshot.computed_at < computed_before,
+                    ),
+                )
+                .order_by(DashboardSnapshot.id)
+            )
+        )
+
+    def clear_dirty(self, snapshot_ids: list[int]) -> None:
+        if snapshot_ids:
+            self.db.execute(
+                update(DashboardSnapshot)
+                .where(DashboardSnapshot.id.in_(snapshot_ids))
+                .values(dirty_at=None)
+            )
+
+    def delete_before(self, reference_date: date) -> int:
+        result = self.db.execute(
+            delete(DashboardSnapshot).where(DashboardSnapshot.reference_date < reference_date)
+        )
+        return result.rowcount or 0
@@ -1,5 +1,7 @@
+from collections.abc import Callable
 from datetime import date
 from decimal import Decimal, InvalidOperation
+from typing import Any
 
 from sqlalchemy.orm import Session
 
@@ -14,6 +16,7 @@ from app.dashboard.services.advisor_today_service import AdvisorTodayService
 from app.dashboard.services.dashboard_attention_service import DashboardAttentionService
 from app.dashboard.services.recent_activity_service import RecentActivityService
 from app.dashboard.services.tax_status_stats_service import TaxStatusStatsService
+from app.database import ConcurrentReads, SerialReads
 from app.notification.repositories.notification_repository import NotificationRepository
 from app.users.models.user import UserRole
 from app.utils.time_utils import israel_today
@@ -51,39 +54,70 @@ class DashboardOverviewService:
     ) -> dict:
         if reference_date is None:
             reference_date = israel_today()
-
-        vat_stats = self.vat_stats_service.build(reference_date)
-
-        is_advisor = user_role == UserRole.ADVISOR
-
-        attention_items = (
-            self.attention_service.build(user_role=user_role, reference_date=reference_date)
-            if is_advisor
-            else []
+        sections = self._section_builders(reference_date, user_role)
+        return self._assemble(
+            {name: build(self) for name, build in sections.items()},
+            reference_date,
+            user_role,
         )
 
-        open_charges_count, open_charges_amount_ils = self._open_charges_stats(is_advisor)
-
-        quick_actions = self._build_quick_actions(reference_date) if is_advisor else []
-        advisor_today = (
-            self.advisor_today_service.build(reference_date)
-            if is_advisor
-            else {"deadline_items": []}
+    @classmethod
+    async def get_overview_concurrently(
+        cls,
+        reads: ConcurrentReads | SerialReads,
+        reference_date: date | None = None,
+        user_role: UserRole | None = None,
+    ) -> dict:
+        """`get_overview` with each section read on its own connection, concurrently."""
+        if reference_date is None:
+            reference_date = israel_today()
+        sections = cls._section_builders(reference_date, user_role)
+        results = await reads.gather(
+            *(lambda db, build=build: build(cls(db)) for build in sections.values())
         )
-
-        has_clients = self.client_record_repo.count() > 0
+        return cls._assemble(dict(zip(sections, results, strict=True)), reference_date, user_role)
+
+    @staticmethod
+    def _section_builders(
+        reference_date: date, user_role: UserRole | None
+    ) -> dict[str, Callable[["DashboardOverviewService"], Any]]:
+        """Independent reads of the overview; the secretary subset skips the advisor-only ones."""
+        builders = {
+            "vat_stats": lambda service: service.vat_stats_service.build(reference_date),
+            "has_clients": lambda service: service.client_record_repo.count() > 0,
+        }
+        if user_role == UserRole.ADVISOR:
+            builders |= {
+                "attention": lambda service: service.attention_service.build(
+                    user_role=user_role, reference_date=reference_date
+                ),
+                "open_charges": lambda service: service._open_charges_stats(True),
+                "advisor_today": lambda service: service.advisor_today_service.build(
+                    reference_date
+                ),
+                "recent_activity": lambda service: service.recent_activity_service.build(),
+            }
+        return builders
+
+    @classmethod
+    def _assemble(
+        cls, sections: dict[str, Any], reference_date: date, user_role: UserRole | None
+    ) -> dict:
+        is_advisor = user_role == UserRole.ADVISOR
+        attention_items = sections.get("attention", [])
+        open_charges_count, open_charges_amount_ils = sections.get("open_charges", (0, None))
         return {
-            "is_empty": not has_clients,
+            "is_empty": not sections["has_clients"],
             "open_charges_count": open_charges_count,
             "open_charges_amount_ils": open_charges_amount_ils,
-            "vat_stats": vat_stats,
-            "quick_actions": quick_actions,
+            "vat_stats": sections["vat_stats"],
+            "quick_actions": cls._build_quick_actions(reference_date) if is_advisor else [],
             "attention": {
                 "items": attention_items,
                 "total": len(attention_items),
             },
-            "advisor_today": advisor_today,
-            "recent_activity": self.recent_activity_service.build() if is_advisor else [],
+            "advisor_today": sections.get("advisor_today", {"deadline_items": []}),
+            "recent_activity": sections.get("recent_activity", []),
         }
 
     def _open_charges_stats(self, is_advisor: bool) -> tuple[int, str | None]:
@@ -95,5 +129,6 @@ class DashboardOverviewService:
         amount_ils = _format_ils(total) if total is not None else None
         return count, amount_ils
 
-    def _build_quick_actions(self, today) -> list[dict]:
+    @staticmethod
+    def _build_quick_actions(today) -> list[dict]:
         return []
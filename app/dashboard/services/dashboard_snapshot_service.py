@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.common.services.base_service import BaseService
+from app.config import settings
+from app.dashboard.models.dashboard_snapshot import DashboardSnapshot
+from app.dashboard.models.dashboard_snapshot_events import has_unmarked_changes
+from app.dashboard.repositories.dashboard_snapshot_repository import (
+    DashboardSnapshotRepository,
+)
+from app.dashboard.schemas.dashboard_extended import DashboardOverviewResponse
+from app.dashboard.services.dashboard_overview_service import DashboardOverviewService
+from app.database import ConcurrentReads, SerialReads
+from app.users.models.user import UserRole
+from app.utils.time_utils import israel_today, utcnow
+
+
+@dataclass(frozen=True)
+class OverviewSnapshot:
+    payload: dict[str, Any]
+    etag: str
+
+
+# The roles allowed on GET /dashboard/overview.
+SNAPSHOT_ROLES = (UserRole.ADVISOR, UserRole.SECRETARY)
+
+
+def _seconds(value: int) -> timedelta:
+    return timedelta(seconds=value)
+
+
+def payload_etag(payload: dict[str, Any]) -> str:
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _overview_snapshot(overview: dict) -> OverviewSnapshot:
+    payload = DashboardOverviewResponse(**overview).model_dump(mode="json")
+    return OverviewSnapshot(payload, payload_etag(payload))
+
+
+class DashboardSnapshotService(BaseService):
+    """Serves the dashboard overview from `dashboard_snapshots`, one keyed read per request.
+
+    Reads never write: snapshots are stored only by the refresh job. A dirty
+    snapshot keeps being served while the job catches up, until it has been
+    due for longer than DASHBOARD_SNAPSHOT_MAX_STALENESS_SECONDS. Past that
+    bound, or before the job has stored one, the overview is computed live
+    with its sections read concurrently.
+    """
+
+    def __init__(self, db: Session):
+        super().__init__(db)
+        self.repo = DashboardSnapshotRepository(db)
+
+    @classmethod
+    async def get_overview(
+        cls,
+        reads: ConcurrentReads | SerialReads,
+        user_role: UserRole,
+        reference_date: date | None = None,
+    ) -> OverviewSnapshot:
+        reference_date = reference_date or israel_today()
+        (stored,) = await reads.gather(lambda db: cls(db).get_stored(user_role, reference_date))
+        if stored is not None:
+            return stored
+        overview = await DashboardOverviewService.get_overview_concurrently(
+            reads, reference_date, user_role
+        )
+        return _overview_snapshot(overview)
+
+    def get_stored(self, user_role: UserRole, reference_date: date) -> OverviewSnapshot | None:
+        """The stored snapshot when it may be served, else None (compute it live)."""
+        # Uncommitted writes of this session aren't marked yet; read them live.
+        if not settings.DASHBOARD_SNAPSHOT_ENABLED or has_unmarked_changes(self.db):
+            return None
+        snapshot = self.repo.get(user_role.value, reference_date)
+        if snapshot is None or self._past_staleness_bound(snapshot, utcnow()):
+            return None
+        return OverviewSnapshot(snapshot.payload, snapshot.etag)
+
+    def refresh(self, user_role: UserRole, reference_date: date) -> OverviewSnapshot:
+        computed_at = utcnow()
+        snapshot = _overview_snapshot(
+            DashboardOverviewService(self.db).get_overview(reference_date, user_role)
+        )
+        self.repo.save(
+            user_role.value,
+            reference_date,
+            payload=snapshot.payload,
+            etag=snapshot.etag,
+            computed_at=computed_at,
+        )
+        return snapshot
+
+    def claim_due(self, reference_date: date | None = None) -> tuple[int, list[UserRole]]:
+        """Drop snapshots of past dates, clear the dirty marks of the due ones.
+
+        Returns the number of dropped snapshots and the roles whose snapshot of
+        `reference_date` must be refreshed: the due ones and those not stored
+        yet. The caller commits before refreshing, so a write landing during
+        the refresh marks it dirty again.
+        """
+        reference_date = reference_date or israel_today()
+        dropped = self.repo.delete_before(reference_date)
+        due = self.repo.list_due(
+            reference_date,
+            computed_before=utcnow() - _seconds(settings.DASHBOARD_SNAPSHOT_MAX_AGE_SECONDS),
+        )
+        self.repo.clear_dirty([snapshot.id for snapshot in due])
+        stored = self.repo.list_roles(reference_date)
+        missing = [role for role in SNAPSHOT_ROLES if role.value not in stored]
+        return dropped, [UserRole(snapshot.role) for snapshot in due] + missing
+
+    @staticmethod
+    def _past_staleness_bound(snapshot: DashboardSnapshot, now: datetime) -> bool:
+        due_since = snapshot.dirty_at or snapshot.computed_at + _seconds(
+            settings.DASHBOARD_SNAPSHOT_MAX_AGE_SECONDS
+        )
+        return now - due_since >= _seconds(settings.DASHBOARD_SNAPSHOT_MAX_STALENESS_SECONDS)
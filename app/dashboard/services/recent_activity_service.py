@@ -14,6 +14,7 @@ from app.audit.constants import (
     ENTITY_ANNUAL_REPORT,
     ENTITY_CHARGE,
     ENTITY_CLIENT,
+    RECENT_ACTIVITY_ENTITY_TYPES,
 )
 from app.audit.models.entity_audit_log import EntityAuditLog
 from app.audit.repositories.entity_audit_log_repository import EntityAuditLogRepository
@@ -72,7 +73,9 @@ class RecentActivityService:
         self.binder_lifecycle_log_repo = BinderLifecycleLogRepository(db)
 
     def build(self) -> list[dict]:
-        audit_rows = self.repo.list_recent(_ACTIVITY_FETCH_LIMIT)
+        audit_rows = self.repo.list_recent(
+            _ACTIVITY_FETCH_LIMIT, entity_types=RECENT_ACTIVITY_ENTITY_TYPES
+        )
         binder_rows = self.binder_lifecycle_log_repo.list_recent(_ACTIVITY_FETCH_LIMIT)
         client_names = self._client_names(audit_rows, binder_rows)
 
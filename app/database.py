@@ -1,8 +1,18 @@
+import asyncio
 import logging
+from collections.abc import Callable
 from time import perf_counter
+from typing import Any
 
 from sqlalchemy import create_engine, event
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from app.config import settings
 from app.core.logging_config import (
@@ -10,29 +20,92 @@ from app.core.logging_config import (
     clear_request_log_stats,
     get_logger,
     get_request_log_stats,
-    log_request_summary,
     record_sql_query,
 )
+from app.core.perf import enforce_query_budget, finish_request
 
 logger = get_logger(__name__)
 
 if settings.APP_ENV == "production" and settings.DATABASE_URL.startswith("sqlite"):
     raise RuntimeError("SQLite אינו מותר בסביבת ייצור")
 
+
+
+def engine_options(url: str) -> dict[str, Any]:
+    """Pool sizing and the interactive statement timeout for an engine on `url`.
+
+    The timeout is set per connection at connect time; routes of the export
+    class raise it per transaction with `set_statement_timeout`.
+    """
+    parsed = make_url(url)
+    options: dict[str, Any] = {"echo": False, "pool_pre_ping": settings.DB_POOL_PRE_PING}
+    if parsed.get_backend_name() != "postgresql":
+        return options
+    options |= {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+    }
+    timeout_ms = settings.DB_STATEMENT_TIMEOUT_MS
+    if timeout_ms > 0:
+        if parsed.get_driver_name() == "asyncpg":
+            options["connect_args"] = {"server_settings": {"statement_timeout": str(timeout_ms)}}
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={timeout_ms}"}
+    return options
+
+
 # Create engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    echo=False,
-    pool_pre_ping=True,
-)
+engine = create_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL))
+
+# Async twin of the engine (asyncpg / aiosqlite) for concurrent read paths
+_ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def async_database_url(url: str) -> str | None:
+    """Async-driver form of a sync DATABASE_URL, or None when there is no usable one.
+
+    In-memory SQLite has no async twin: a second engine would open a second,
+    empty database.
+    """
+    parsed = make_url(url)
+    driver = _ASYNC_DRIVERS.get(parsed.drivername)
+    if driver is None:
+        return None
+    if driver.startswith("sqlite") and parsed.database in (None, "", ":memory:"):
+        return None
+    parsed = parsed.set(drivername=driver)
+    sslmode = parsed.query.get("sslmode")
+    if driver.endswith("asyncpg") and sslmode is not None:
+        # asyncpg spells libpq's sslmode as ssl.
+        parsed = parsed.difference_update_query(["sslmode"]).update_query_dict({"ssl": sslmode})
+    return parsed.render_as_string(hide_password=False)
+
+
+_async_url = async_database_url(settings.DATABASE_URL)
+
+# Optional read replica; see app/common/repositories/read_repository.py for the routing.
+_read_url = settings.DATABASE_READ_URL or None
+read_engine = create_engine(_read_url, **engine_options(_read_url)) if _read_url else None
+_async_read_url = async_database_url(_read_url) if _read_url else None
+
+# Async session factories by URL, their engines created on first use (see async_sessions).
+_async_sessionmakers: dict[str, async_sessionmaker[AsyncSession]] = {}
 
 
-@event.listens_for(engine, "before_cursor_execute")
+# Registered on the Engine class so that every engine (async, replica, the test
+# suite's) feeds the request's query stats and budget.
+@event.listens_for(Engine, "before_cursor_execute")
 def _record_query_start(conn, cursor, statement, parameters, context, executemany):
     context._query_start_time = perf_counter()
 
 
-@event.listens_for(engine, "after_cursor_execute")
+@event.listens_for(Engine, "after_cursor_execute")
 def _record_query_end(conn, cursor, statement, parameters, context, executemany):
     start_time = getattr(context, "_query_start_time", None)
     if start_time is None:
@@ -45,8 +118,89 @@ logging.getLogger("sqlalchemy.engine").setLevel(
     logging.INFO if settings.LOG_SQL else logging.WARNING
 )
 
+# Statement timeout override of a session, in milliseconds (see set_statement_timeout).
+STATEMENT_TIMEOUT_KEY = "statement_timeout_ms"
+# Replica session that read repositories open next to a primary session.
+REPLICA_SESSION_KEY = "replica_session"
+
+
+class PrimarySession(Session):
+    """Session on the primary engine; closing it also closes its replica session."""
+
+    def close(self) -> None:
+        replica = self.info.pop(REPLICA_SESSION_KEY, None)
+        if replica is not None:
+            replica.close()
+        super().close()
+
+
 # Session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(class_=PrimarySession, autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = (
+    sessionmaker(autocommit=False, autoflush=False, bind=read_engine) if read_engine else None
+)
+
+
+def _async_sessionmaker(url: str | None) -> async_sessionmaker[AsyncSession] | None:
+    if url is None:
+        return None
+    sessions = _async_sessionmakers.get(url)
+    if sessions is None:
+        engine = create_async_engine(url, **engine_options(url))
+        sessions = _async_sessionmakers[url] = async_sessionmaker(
+            engine, autoflush=False, expire_on_commit=False
+        )
+    return sessions
+
+
+def async_sessions() -> async_sessionmaker[AsyncSession] | None:
+    """Async sessions on the primary; None when DATABASE_URL has no async driver.
+
+    The engine is created on first use, so scripts and workers that never read
+    concurrently do not need asyncpg / aiosqlite installed.
+    """
+    return _async_sessionmaker(_async_url)
+
+
+def async_read_sessions() -> async_sessionmaker[AsyncSession] | None:
+    """`async_sessions` on the read replica; None without a replica or its async driver."""
+    return _async_sessionmaker(_async_read_url)
+
+
+async def dispose_async_engines() -> None:
+    engines: list[AsyncEngine] = [sessions.kw["bind"] for sessions in _async_sessionmakers.values()]
+    _async_sessionmakers.clear()
+    for engine in engines:
+        await engine.dispose()
+
+
+def set_statement_timeout(db: Session, timeout_ms: int) -> None:
+    """Use `timeout_ms` as the statement timeout for the rest of `db`'s transactions.
+
+    PostgreSQL only (`SET LOCAL`, re-applied at the start of every transaction);
+    a no-op elsewhere. 0 disables the timeout.
+    """
+    db.info[STATEMENT_TIMEOUT_KEY] = timeout_ms
+    if db.in_transaction() and db.get_bind().dialect.name == "postgresql":
+        _set_local_statement_timeout(db.connection(), timeout_ms)
+
+
+def export_session() -> Session:
+    """Session for exports and other bulk jobs: the export-class statement timeout."""
+    db = SessionLocal()
+    set_statement_timeout(db, settings.DB_EXPORT_STATEMENT_TIMEOUT_MS)
+    return db
+
+
+def _set_local_statement_timeout(connection, timeout_ms: int) -> None:
+    connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(timeout_ms)}")
+
+
+@event.listens_for(Session, "after_begin")
+def _apply_statement_timeout(session, transaction, connection) -> None:
+    timeout_ms = session.info.get(STATEMENT_TIMEOUT_KEY)
+    if timeout_ms is not None and connection.dialect.name == "postgresql":
+        _set_local_statement_timeout(connection, timeout_ms)
 
 
 # Base class for ORM models
@@ -71,14 +225,76 @@ def get_db():
         raise
     finally:
         db.close()
-        if get_request_log_stats() is not None:
-            log_request_summary(
-                logger,
-                service="binder-billing-crm",
-                env=settings.APP_ENV,
-                slow_request_ms=settings.LOG_SLOW_REQUEST_MS,
-                slow_query_ms=settings.LOG_SLOW_QUERY_MS,
-                high_query_count=settings.LOG_HIGH_QUERY_COUNT,
-            )
-            clear_request_log_stats()
-            clear_request_id()
+        finish_request_stats()
+
+
+def finish_request_stats() -> None:
+    """Log the request summary once the request's session is closed.
+
+    Runs after the response is sent, so commit-time flushes are counted. Raises
+    `QueryBudgetExceeded` for an over-budget route when budgets are enforced.
+    """
+    stats = get_request_log_stats()
+    if stats is None:
+        return
+    finish_request(logger)
+    clear_request_log_stats()
+    clear_request_id()
+    enforce_query_budget(stats)
+
+
+async def get_async_db():
+    """Async counterpart of `get_db` for `async def` routes.
+
+    Raises when DATABASE_URL has no async driver (in-memory SQLite); routes that
+    must also run there go through `ConcurrentReads` / `SerialReads` instead.
+    """
+    sessions = async_sessions()
+    if sessions is None:
+        raise RuntimeError("DATABASE_URL has no async driver")
+    async with sessions() as db:
+        try:
+            yield db
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+
+ReadFn = Callable[[Session], Any]
+
+
+class ConcurrentReads:
+    """Runs independent read-only callables concurrently, one pooled connection each.
+
+    Every callable gets its own `AsyncSession` and runs through `run_sync`, so
+    it receives a regular `Session` and the existing sync repositories and
+    services work unchanged while their round trips overlap. Each callable sees
+    its own snapshot and must return plain data (dicts, DTOs or fully loaded
+    rows): its session is closed once it returns.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+        self._session_factory = session_factory
+
+    async def gather(self, *reads: ReadFn) -> list:
+        return list(await asyncio.gather(*(self._run(read) for read in reads)))
+
+    async def _run(self, read: ReadFn):
+        async with self._session_factory() as session:
+            return await session.run_sync(read)
+
+
+class SerialReads:
+    """`ConcurrentReads` fallback: the callables run one after another on one sync session.
+
+    Used when there is no async engine and in tests, where the request session
+    holds uncommitted fixture data. The calls run in a worker thread so the
+    event loop is not blocked.
+    """
+
+    def __init__(self, db: Session):
+        self._db = db
+
+    async def gather(self, *reads: ReadFn) -> list:
+        return await asyncio.to_thread(lambda: [read(self._db) for read in reads])
@@ -0,0 +1,42 @@
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import RedirectResponse
+
+from app.exports.models.export_job import ExportJob, ExportJobStatus
+from app.exports.schemas.export_job import ExportJobCreateRequest, ExportJobResponse
+from app.exports.services.export_job_service import ExportJobService
+from app.users.api.deps import CurrentUser, DBSession, require_role
+from app.users.models.user import UserRole
+
+router = APIRouter(
+    prefix="/exports",
+    tags=["exports"],
+    dependencies=[Depends(require_role(UserRole.ADVISOR, UserRole.SECRETARY))],
+)
+
+
+def _response(service: ExportJobService, job: ExportJob) -> ExportJobResponse:
+    response = ExportJobResponse.model_validate(job)
+    if job.status == ExportJobStatus.SUCCEEDED.value:
+        response.download_url = service.download_url(job)
+    return response
+
+
+@router.post("", response_model=ExportJobResponse, status_code=status.HTTP_202_ACCEPTED)
+def submit_export(request: ExportJobCreateRequest, db: DBSession, user: CurrentUser):
+    """Queue an export; poll `GET /exports/{id}` until it has a download URL."""
+    service = ExportJobService(db)
+    job = service.submit(kind=request.kind, fmt=request.format, params=request.params(), user=user)
+    return _response(service, job)
+
+
+@router.get("/{job_id}", response_model=ExportJobResponse)
+def get_export(job_id: int, db: DBSession, user: CurrentUser):
+    service = ExportJobService(db)
+    return _response(service, service.get_for_user(job_id, user))
+
+
+@router.get("/{job_id}/download", status_code=status.HTTP_307_TEMPORARY_REDIRECT)
+def download_export(job_id: int, db: DBSession, user: CurrentUser):
+    """Redirect to a presigned storage URL for the finished export."""
+    service = ExportJobService(db)
+    return RedirectResponse(service.download_url(service.get_for_user(job_id, user)))
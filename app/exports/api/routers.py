@@ -0,0 +1,10 @@
+"""Exports API router."""
+
+from fastapi import APIRouter
+
+from app.exports.api.exports import router as exports_router
+
+router = APIRouter()
+router.include_router(exports_router)
+
+__all__ = ["router"]
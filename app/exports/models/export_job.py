@@ -0,0 +1,85 @@
+"""Export jobs — report files rendered outside the HTTP request.
+
+A request creates a QUEUED job and returns at once. `ExportWorker` claims it,
+loads the data, renders the file in a process pool and uploads it to storage;
+the client polls the job and downloads through a presigned URL.
+
+`request_hash` identifies what was asked for (kind, format, parameters) and is
+used to return the caller's in-flight job instead of queueing a duplicate.
+`content_hash` identifies the data that was rendered: a job whose data hashes
+to an existing, unexpired result reuses that file instead of rendering again.
+Results are kept until `expires_at`; the cleanup job then marks them EXPIRED
+and deletes files no other live job points to.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum as PyEnum
+from typing import Any
+
+from sqlalchemy import JSON, ForeignKey, Index, Integer, SmallInteger, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.utils.time_utils import utcnow
+
+
+class ExportKind(str, PyEnum):
+    AGING_REPORT = "aging_report"
+    VAT_CLIENT = "vat_client"
+    CLIENTS = "clients"
+    ANNUAL_REPORT = "annual_report"
+
+
+class ExportFormat(str, PyEnum):
+    EXCEL = "excel"
+    PDF = "pdf"
+
+
+class ExportJobStatus(str, PyEnum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    EXPIRED = "expired"
+
+
+class ExportJob(Base):
+    __tablename__ = "export_jobs"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    kind: Mapped[str] = mapped_column(String(30), nullable=False)
+    format: Mapped[str] = mapped_column(String(10), nullable=False)
+    params: Mapped[dict[str, Any]] = mapped_column(
+        JSON().with_variant(JSONB, "postgresql"), nullable=False, default=dict
+    )
+    request_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, default=ExportJobStatus.QUEUED.value
+    )
+    attempts: Mapped[int] = mapped_column(SmallInteger, nullable=False, default=0)
+    locked_until: Mapped[datetime | None] = mapped_column(nullable=True)
+
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    storage_key: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    filename: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    media_type: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    size_bytes: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    requested_by: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(default=utcnow, nullable=False)
+    started_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    expires_at: Mapped[datetime | None] = mapped_column(nullable=True)
+
+    __table_args__ = (
+        Index("idx_export_jobs_status_created", "status", "created_at"),
+        Index("idx_export_jobs_request", "requested_by", "request_hash", "status"),
+        Index("idx_export_jobs_content", "content_hash", "status"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ExportJob(id={self.id}, kind='{self.kind}', status='{self.status}')>"
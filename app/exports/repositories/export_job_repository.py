@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.exports.models.export_job import ExportJob, ExportJobStatus
+from app.infrastructure.jobs import claim_leased
+from app.utils.time_utils import utcnow
+
+_IN_FLIGHT = (ExportJobStatus.QUEUED.value, ExportJobStatus.RUNNING.value)
+
+
+@dataclass(frozen=True, slots=True)
+class ClaimedExport:
+    """A leased job, detached from the session that claimed it."""
+
+    job_id: int
+    kind: str
+    format: str
+    params: dict[str, Any]
+    attempts: int
+
+
+@dataclass(frozen=True, slots=True)
+class StoredResult:
+    storage_key: str
+    filename: str
+    media_type: str
+    size_bytes: int
+
+
+class ExportJobRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def create(
+        self,
+        *,
+        kind: str,
+        format: str,
+        params: dict[str, Any],
+        request_hash: str,
+        requested_by: int,
+    ) -> ExportJob:
+        job = ExportJob(
+            kind=kind,
+            format=format,
+            params=params,
+            request_hash=request_hash,
+            requested_by=requested_by,
+            status=ExportJobStatus.QUEUED.value,
+        )
+        self.db.add(job)
+        self.db.flush()
+        return job
+
+    def get_by_id(self, job_id: int) -> ExportJob | None:
+        return self.db.get(ExportJob, job_id)
+
+    def find_in_flight(self, requested_by: int, request_hash: str) -> ExportJob | None:
+        return self.db.scalars(
+            select(ExportJob)
+            .where(
+                ExportJob.requested_by == requested_by,
+                ExportJob.request_hash == request_hash,
+                ExportJob.status.in_(_IN_FLIGHT),
+            )
+            .order_by(ExportJob.id.desc())
+            .limit(1)
+        ).first()
+
+    # ── Worker side ───────────────────────────────────────────────────────────
+
+    def claim(self, *, limit: int, lease_until: datetime) -> list[ClaimedExport]:
+        """Lease queued jobs, and running jobs whose worker let the lease lapse."""
+        now = utcnow()
+        claimed = []
+        for job in claim_leased(self.db, ExportJob, limit=limit, lease_until=lease_until, now=now):
+            job.started_at = now
+            claimed.append(
+                ClaimedExport(job.id, job.kind, job.format, dict(job.params or {}), job.attempts)
+            )
+        self.db.flush()
+        return claimed
+
+    def find_result(self, content_hash: str, *, now: datetime) -> StoredResult | None:
+        """A stored file rendered from identical data that has not expired yet."""
+        row = self.db.execute(
+            select(
+                ExportJob.storage_key,
+                ExportJob.filename,
+                ExportJob.media_type,
+                ExportJob.size_bytes,
+            )
+            .where(
+                ExportJob.content_hash == content_hash,
+                ExportJob.status == ExportJobStatus.SUCCEEDED.value,
+                ExportJob.expires_at > now,
+            )
+            .order_by(ExportJob.expires_at.desc())
+            .limit(1)
+        ).first()
+        return StoredResult(*row) if row else None
+
+    def mark_succeeded(
+        self,
+        job_id: int,
+        *,
+        content_hash: str,
+        result: StoredResult,
+        finished_at: datetime,
+        expires_at: datetime,
+    ) -> None:
+        self.db.execute(
+            update(ExportJob)
+            .where(ExportJob.id == job_id)
+            .values(
+                status=ExportJobStatus.SUCCEEDED.value,
+                content_hash=content_hash,
+                storage_key=result.storage_key,
+                filename=result.filename,
+                media_type=result.media_type,
+                size_bytes=result.size_bytes,
+                error=None,
+                locked_until=None,
+                finished_at=finished_at,
+                expires_at=expires_at,
+            )
+        )
+
+    def mark_failed(self, job_id: int, error: str, *, finished_at: datetime) -> None:
+        self.db.execute(
+            update(ExportJob)
+            .where(ExportJob.id == job_id)
+            .values(
+                status=ExportJobStatus.FAILED.value,
+                error=error,
+                locked_until=None,
+                finished_at=finished_at,
+            )
+        )
+
+    # ── Expiry ────────────────────────────────────────────────────────────────
+
+    def expire_due(self, *, now: datetime) -> tuple[int, set[str]]:
+        """Mark lapsed results EXPIRED; returns how many, and their storage keys."""
+        rows = self.db.execute(
+            select(ExportJob.id, ExportJob.storage_key).where(
+                ExportJob.status == ExportJobStatus.SUCCEEDED.value,
+                ExportJob.expires_at <= now,
+            )
+        ).all()
+        if not rows:
+            return 0, set()
+        self.db.execute(
+            update(ExportJob)
+            .where(ExportJob.id.in_([row.id for row in rows]))
+            .values(status=ExportJobStatus.EXPIRED.value)
+        )
+        return len(rows), {row.storage_key for row in rows if row.storage_key}
+
+    def live_storage_keys(self, keys: set[str]) -> set[str]:
+        """Keys among `keys` that a succeeded job still points to (shared results)."""
+        if not keys:
+            return set()
+        return set(
+            self.db.scalars(
+                select(ExportJob.storage_key).where(
+                    ExportJob.storage_key.in_(keys),
+                    ExportJob.status == ExportJobStatus.SUCCEEDED.value,
+                )
+            )
+        )
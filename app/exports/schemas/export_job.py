@@ -0,0 +1,38 @@
+from datetime import date
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from app.core.api_types import ApiDateTime
+from app.exports.models.export_job import ExportFormat, ExportJobStatus, ExportKind
+
+
+class ExportJobCreateRequest(BaseModel):
+    kind: ExportKind
+    format: ExportFormat
+    as_of_date: date | None = None
+    client_record_id: int | None = None
+    year: int | None = Field(None, ge=2000, le=2100)
+    report_id: int | None = None
+
+    def params(self) -> dict[str, Any]:
+        return self.model_dump(mode="json", exclude={"kind", "format"}, exclude_none=True)
+
+
+class ExportJobResponse(BaseModel):
+    id: int
+    kind: ExportKind
+    format: ExportFormat
+    status: ExportJobStatus
+    params: dict[str, Any]
+    filename: str | None = None
+    size_bytes: int | None = None
+    error: str | None = None
+    created_at: ApiDateTime
+    started_at: ApiDateTime | None = None
+    finished_at: ApiDateTime | None = None
+    expires_at: ApiDateTime | None = None
+    # Set once the export has succeeded; short-lived, fetch the job again for a fresh one.
+    download_url: str | None = None
+
+    model_config = {"from_attributes": True}
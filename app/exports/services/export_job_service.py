@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.common.services.base_service import BaseService
+from app.config import settings
+from app.core.exceptions import AppError, ConflictError, ForbiddenError, NotFoundError
+from app.core.logging_config import get_logger
+from app.exports.models.export_job import ExportFormat, ExportJob, ExportJobStatus, ExportKind
+from app.exports.repositories.export_job_repository import ExportJobRepository
+from app.exports.services.export_sources import (
+    ALLOWED_ROLES,
+    OPTIONAL_PARAMS,
+    REQUIRED_PARAMS,
+    SUPPORTED_FORMATS,
+    request_hash,
+)
+from app.exports.services.messages import (
+    EXPORT_EXPIRED,
+    EXPORT_FORMAT_NOT_SUPPORTED,
+    EXPORT_JOB_NOT_FOUND,
+    EXPORT_KIND_FORBIDDEN,
+    EXPORT_NOT_READY,
+    EXPORT_PARAMS_MISSING,
+)
+from app.infrastructure.storage import StorageProvider, get_storage_provider
+from app.users.models.user import User
+from app.utils.time_utils import utcnow
+
+logger = get_logger(__name__)
+
+
+class ExportJobService(BaseService):
+    def __init__(self, db: Session, storage: StorageProvider | None = None):
+        super().__init__(db)
+        self.repo = ExportJobRepository(db)
+        self._storage = storage
+
+    @property
+    def storage(self) -> StorageProvider:
+        # Resolved lazily: submitting and polling never touch storage.
+        if self._storage is None:
+            self._storage = get_storage_provider()
+        return self._storage
+
+    def submit(
+        self,
+        *,
+        kind: ExportKind,
+        fmt: ExportFormat,
+        params: dict[str, Any],
+        user: User,
+    ) -> ExportJob:
+        """Queue an export, or return the caller's identical export still in flight."""
+        if user.role not in ALLOWED_ROLES[kind]:
+            raise ForbiddenError(EXPORT_KIND_FORBIDDEN.format(kind=kind.value), "EXPORT.FORBIDDEN")
+        if fmt not in SUPPORTED_FORMATS[kind]:
+            raise AppError(
+                EXPORT_FORMAT_NOT_SUPPORTED.format(format=fmt.value, kind=kind.value),
+                "EXPORT.FORMAT_NOT_SUPPORTED",
+            )
+        missing = [name for name in REQUIRED_PARAMS[kind] if params.get(name) is None]
+        if missing:
+            raise AppError(
+                EXPORT_PARAMS_MISSING.format(missing=", ".join(missing)),
+                "EXPORT.PARAMS_MISSING",
+            )
+        allowed = REQUIRED_PARAMS[kind] + OPTIONAL_PARAMS.get(kind, ())
+        job_params = {name: params[name] for name in allowed if params.get(name) is not None}
+
+        digest = request_hash(kind, fmt, job_params)
+        existing = self.repo.find_in_flight(user.id, digest)
+        if existing is not None:
+            return existing
+        with self.transaction():
+            job = self.repo.create(
+                kind=kind.value,
+                format=fmt.value,
+                params=job_params,
+                request_hash=digest,
+                requested_by=user.id,
+            )
+        return job
+
+    def get_for_user(self, job_id: int, user: User) -> ExportJob:
+        job = self.repo.get_by_id(job_id)
+        if job is None or job.requested_by != user.id:
+            raise NotFoundError(EXPORT_JOB_NOT_FOUND.format(job_id=job_id), "EXPORT.NOT_FOUND")
+        return job
+
+    def download_url(self, job: ExportJob) -> str:
+        """Presigned URL for a finished export; never outlives the result's TTL."""
+        now = utcnow()
+        if job.status == ExportJobStatus.EXPIRED.value or (
+            job.status == ExportJobStatus.SUCCEEDED.value and job.expires_at <= now
+        ):
+            raise AppError(EXPORT_EXPIRED, "EXPORT.EXPIRED", status_code=410)
+        if job.status != ExportJobStatus.SUCCEEDED.value:
+            raise ConflictError(EXPORT_NOT_READY, "EXPORT.NOT_READY")
+        remaining = int((job.expires_at - now).total_seconds())
+        expires_in = max(1, min(settings.EXPORT_DOWNLOAD_URL_SECONDS, remaining))
+        return self.storage.get_presigned_url(job.storage_key, expires_in=expires_in)
+
+    def expire_results(self) -> dict[str, int]:
+        """Expire results past their TTL and delete files no live job still shares."""
+        with self.transaction():
+            expired, keys = self.repo.expire_due(now=utcnow())
+            orphaned = keys - self.repo.live_storage_keys(keys)
+        # Committed first: a failed delete leaves an orphan file, never a dangling job.
+        deleted = 0
+        for key in sorted(orphaned):
+            try:
+                self.storage.delete(key)
+                deleted += 1
+            except Exception:
+                logger.exception("could not delete expired export %s", key)
+        return {"expired": expired, "files_deleted": deleted}
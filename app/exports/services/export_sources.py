@@ -0,0 +1,122 @@
+"""What each export kind needs: parameters, roles and the data to render.
+
+Loading runs in the export worker with a database session; the result is a
+plain, picklable payload handed to the process pool (see `renderers`). The
+payload is also what the content hash is taken over, so two jobs that would
+render the same data share one stored file.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass, is_dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from app.annual_reports.services.annual_report_pdf_service import AnnualReportPdfService
+from app.clients.constants import EXCEL_MEDIA_TYPE
+from app.clients.services.client_query_service import ClientQueryService
+from app.exports.models.export_job import ExportFormat, ExportKind
+from app.reports.services.reports_service import AgingReportService
+from app.users.models.user import UserRole
+from app.vat_reports.services.vat_export_service import load_export_data
+
+MEDIA_TYPES = {
+    ExportFormat.EXCEL: EXCEL_MEDIA_TYPE,
+    ExportFormat.PDF: "application/pdf",
+}
+
+SUPPORTED_FORMATS: dict[ExportKind, frozenset[ExportFormat]] = {
+    ExportKind.AGING_REPORT: frozenset({ExportFormat.EXCEL, ExportFormat.PDF}),
+    ExportKind.VAT_CLIENT: frozenset({ExportFormat.EXCEL, ExportFormat.PDF}),
+    ExportKind.CLIENTS: frozenset({ExportFormat.EXCEL}),
+    ExportKind.ANNUAL_REPORT: frozenset({ExportFormat.PDF}),
+}
+
+REQUIRED_PARAMS: dict[ExportKind, tuple[str, ...]] = {
+    ExportKind.AGING_REPORT: (),
+    ExportKind.VAT_CLIENT: ("client_record_id", "year"),
+    ExportKind.CLIENTS: (),
+    ExportKind.ANNUAL_REPORT: ("report_id",),
+}
+
+OPTIONAL_PARAMS: dict[ExportKind, tuple[str, ...]] = {
+    ExportKind.AGING_REPORT: ("as_of_date",),
+}
+
+# Same roles as the synchronous export endpoints.
+ALLOWED_ROLES: dict[ExportKind, frozenset[UserRole]] = {
+    ExportKind.AGING_REPORT: frozenset({UserRole.ADVISOR}),
+    ExportKind.VAT_CLIENT: frozenset({UserRole.ADVISOR}),
+    ExportKind.CLIENTS: frozenset({UserRole.ADVISOR, UserRole.SECRETARY}),
+    ExportKind.ANNUAL_REPORT: frozenset({UserRole.ADVISOR, UserRole.SECRETARY}),
+}
+
+
+@dataclass(frozen=True)
+class ExportInput:
+    renderer: str
+    payload: dict[str, Any]
+
+
+def load_export_input(
+    db: Session, kind: ExportKind, fmt: ExportFormat, params: dict[str, Any]
+) -> ExportInput:
+    renderer = f"{kind.value}_{fmt.value}"
+    if kind == ExportKind.AGING_REPORT:
+        as_of = params.get("as_of_date")
+        report = AgingReportService(db).generate_aging_report(
+            as_of_date=date.fromisoformat(as_of) if as_of else None
+        )
+        return ExportInput(renderer, {"report": report})
+    if kind == ExportKind.VAT_CLIENT:
+        client_record_id, year = params["client_record_id"], params["year"]
+        client_name, periods = load_export_data(db, client_record_id, year)
+        return ExportInput(
+            renderer,
+            {
+                "client_name": client_name,
+                "client_record_id": client_record_id,
+                "year": year,
+                "periods": periods,
+            },
+        )
+    if kind == ExportKind.CLIENTS:
+        return ExportInput(renderer, {"clients": list(ClientQueryService(db).iter_all_clients())})
+    report_id = params["report_id"]
+    return ExportInput(
+        renderer, {"report_id": report_id, "data": AnnualReportPdfService(db).load(report_id)}
+    )
+
+
+def request_hash(kind: ExportKind, fmt: ExportFormat, params: dict[str, Any]) -> str:
+    return _sha256({"kind": kind.value, "format": fmt.value, "params": params})
+
+
+def content_hash(export_input: ExportInput) -> str:
+    return _sha256({"renderer": export_input.renderer, "payload": export_input.payload})
+
+
+def _sha256(value: Any) -> str:
+    canonical = json.dumps(value, sort_keys=True, default=_jsonable, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"cannot hash {type(value).__name__}")
@@ -0,0 +1,213 @@
+"""Background rendering of queued export jobs (see `export_jobs`).
+
+Each pass claims up to one job per pool slot. Per job the worker loads the
+data in a thread with its own short session, looks for an unexpired result
+rendered from identical data (content hash), and otherwise renders the file
+in the process pool — reportlab/openpyxl are CPU-bound and would hold the
+GIL of the request workers — and uploads it to storage. No database
+transaction is open while rendering or uploading.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import shutil
+import tempfile
+from collections.abc import Callable
+from concurrent.futures import Executor
+from datetime import timedelta
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.exceptions import AppError
+from app.core.logging_config import get_logger
+from app.exports.models.export_job import ExportFormat, ExportKind
+from app.exports.repositories.export_job_repository import (
+    ClaimedExport,
+    ExportJobRepository,
+    StoredResult,
+)
+from app.exports.services.export_sources import (
+    MEDIA_TYPES,
+    ExportInput,
+    content_hash,
+    load_export_input,
+)
+from app.exports.services.messages import EXPORT_FAILED, EXPORT_GAVE_UP
+from app.exports.services.renderers import render_export
+from app.infrastructure.jobs import LeasedQueueWorker
+from app.infrastructure.storage import StorageProvider
+from app.utils.time_utils import utcnow
+
+logger = get_logger(__name__)
+
+# A shared result is reused only with this much life left, so the cleanup job
+# cannot delete it between the lookup and the new job being recorded.
+_REUSE_MARGIN = timedelta(minutes=10)
+
+
+class ExportWorker(LeasedQueueWorker):
+    name = "export worker"
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        storage: StorageProvider,
+        executor: Executor,
+        *,
+        batch_size: int,
+        lease_seconds: int,
+        max_attempts: int,
+        ttl_seconds: int,
+    ) -> None:
+        super().__init__(
+            session_factory,
+            claim_limit=batch_size,
+            lease_seconds=lease_seconds,
+            max_attempts=max_attempts,
+        )
+        self._storage = storage
+        self._executor = executor
+        self._ttl = timedelta(seconds=ttl_seconds)
+
+    async def run_once(self) -> int:
+        """Process one batch of queued jobs; returns how many were claimed."""
+        jobs = await asyncio.to_thread(self._claim)
+        if jobs:
+            await asyncio.gather(*(self._process(job) for job in jobs))
+        return len(jobs)
+
+    # ── Steps ─────────────────────────────────────────────────────────────────
+
+    async def _process(self, job: ClaimedExport) -> None:
+        if self.gave_up(job.attempts):
+            await asyncio.to_thread(self._fail, job, EXPORT_GAVE_UP.format(attempts=job.attempts - 1))
+            return
+        try:
+            export_input = await asyncio.to_thread(self._load, job)
+            digest = content_hash(export_input)
+            result = await asyncio.to_thread(self._find_result, digest)
+            if result is None:
+                result = await self._render_and_store(job, export_input, digest)
+            else:
+                logger.info("export job %s reused stored result %s", job.job_id, result.storage_key)
+            await asyncio.to_thread(self._succeed, job, digest, result)
+        except asyncio.CancelledError:
+            raise
+        except AppError as exc:
+            await asyncio.to_thread(self._fail, job, exc.message)
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("export job %s failed", job.job_id)
+            await asyncio.to_thread(self._fail, job, EXPORT_FAILED.format(error=exc))
+
+    def _claim(self) -> list[ClaimedExport]:
+        db = self._session_factory()
+        try:
+            jobs = ExportJobRepository(db).claim(
+                limit=self._claim_limit, lease_until=self.lease_until()
+            )
+            db.commit()
+            return jobs
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _load(self, job: ClaimedExport) -> ExportInput:
+        db = self._session_factory()
+        try:
+            return load_export_input(
+                db, ExportKind(job.kind), ExportFormat(job.format), job.params
+            )
+        finally:
+            db.rollback()
+            db.close()
+
+    def _find_result(self, digest: str) -> StoredResult | None:
+        db = self._session_factory()
+        try:
+            return ExportJobRepository(db).find_result(digest, now=utcnow() + _REUSE_MARGIN)
+        finally:
+            db.close()
+
+    async def _render_and_store(
+        self, job: ClaimedExport, export_input: ExportInput, digest: str
+    ) -> StoredResult:
+        loop = asyncio.get_running_loop()
+        export_dir = tempfile.mkdtemp(prefix=f"export-{job.job_id}-")
+        try:
+            rendered = await loop.run_in_executor(
+                self._executor,
+                render_export,
+                export_input.renderer,
+                export_input.payload,
+                export_dir,
+            )
+            result = StoredResult(
+                storage_key=f"exports/{digest}/{rendered['filename']}",
+                filename=rendered["filename"],
+                media_type=MEDIA_TYPES[ExportFormat(job.format)],
+                size_bytes=os.path.getsize(rendered["filepath"]),
+            )
+            await asyncio.to_thread(self._upload, rendered["filepath"], result)
+            return result
+        finally:
+            shutil.rmtree(export_dir, ignore_errors=True)
+
+    def _upload(self, filepath: str, result: StoredResult) -> None:
+        with open(filepath, "rb") as fh:
+            self._storage.upload(result.storage_key, fh, result.media_type)
+
+    def _succeed(self, job: ClaimedExport, digest: str, result: StoredResult) -> None:
+        finished_at = utcnow()
+        db = self._session_factory()
+        try:
+            ExportJobRepository(db).mark_succeeded(
+                job.job_id,
+                content_hash=digest,
+                result=result,
+                finished_at=finished_at,
+                expires_at=finished_at + self._ttl,
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        logger.info(
+            "export job %s succeeded kind=%s format=%s bytes=%s",
+            job.job_id,
+            job.kind,
+            job.format,
+            result.size_bytes,
+        )
+
+    def _fail(self, job: ClaimedExport, error: str) -> None:
+        db = self._session_factory()
+        try:
+            ExportJobRepository(db).mark_failed(job.job_id, error, finished_at=utcnow())
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        logger.warning("export job %s failed: %s", job.job_id, error)
+
+
+def build_export_worker(
+    session_factory: Callable[[], Session], storage: StorageProvider, executor: Executor
+) -> ExportWorker:
+    return ExportWorker(
+        session_factory,
+        storage,
+        executor,
+        batch_size=settings.EXPORT_PROCESS_POOL_SIZE,
+        lease_seconds=settings.EXPORT_JOB_LEASE_SECONDS,
+        max_attempts=settings.EXPORT_JOB_MAX_ATTEMPTS,
+        ttl_seconds=settings.EXPORT_RESULT_TTL_SECONDS,
+    )
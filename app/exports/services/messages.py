@@ -0,0 +1,8 @@
+EXPORT_JOB_NOT_FOUND = "משימת ייצוא {job_id} לא נמצאה"
+EXPORT_FORMAT_NOT_SUPPORTED = "הפורמט {format} אינו נתמך עבור ייצוא מסוג {kind}"
+EXPORT_PARAMS_MISSING = "חסרים פרמטרים לייצוא: {missing}"
+EXPORT_KIND_FORBIDDEN = "אין הרשאה לייצוא מסוג {kind}"
+EXPORT_NOT_READY = "קובץ הייצוא עדיין לא מוכן"
+EXPORT_EXPIRED = "תוקף קובץ הייצוא פג — יש לייצא מחדש"
+EXPORT_FAILED = "הייצוא נכשל: {error}"
+EXPORT_GAVE_UP = "הייצוא נכשל לאחר {attempts} ניסיונות"
@@ -0,0 +1,85 @@
+"""File renderers executed in the export process pool.
+
+Everything here takes and returns plain picklable values: the worker process
+has no database session and no access to the caller's objects. Each renderer
+writes into `export_dir` (a per-job temp directory) and returns the file's
+path and download name.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from typing import Any
+
+from app.annual_reports.services import annual_report_pdf_builder
+from app.annual_reports.services.annual_report_pdf_service import render as render_annual_report
+from app.clients.services.client_excel_service import ClientExcelService
+from app.reports.services.export_excel import export_aging_report_to_excel
+from app.reports.services.export_pdf import export_aging_report_to_pdf
+from app.vat_reports.services import vat_export_pdf
+from app.vat_reports.services.vat_export_excel import export_vat_to_excel
+
+
+def _aging_report_excel(payload: dict[str, Any], export_dir: str) -> dict[str, object]:
+    return export_aging_report_to_excel(payload["report"], export_dir)
+
+
+def _aging_report_pdf(payload: dict[str, Any], export_dir: str) -> dict[str, object]:
+    return export_aging_report_to_pdf(payload["report"], export_dir)
+
+
+def _vat_args(payload: dict[str, Any]) -> tuple:
+    return (
+        payload["client_name"],
+        payload["client_record_id"],
+        payload["year"],
+        payload["periods"],
+    )
+
+
+def _vat_client_excel(payload: dict[str, Any], export_dir: str) -> dict[str, object]:
+    return export_vat_to_excel(*_vat_args(payload), export_dir)
+
+
+def _vat_client_pdf(payload: dict[str, Any], export_dir: str) -> dict[str, object]:
+    return vat_export_pdf.export_vat_to_pdf(*_vat_args(payload), export_dir)
+
+
+def _clients_excel(payload: dict[str, Any], export_dir: str) -> dict[str, object]:
+    return ClientExcelService(None, export_dir=export_dir).export_clients(payload["clients"])
+
+
+def _annual_report_pdf(payload: dict[str, Any], export_dir: str) -> dict[str, object]:
+    data = payload["data"]
+    filename = f"annual_report_{payload['report_id']}_{data.report.tax_year}.pdf"
+    filepath = os.path.join(export_dir, filename)
+    with open(filepath, "wb") as fh:
+        fh.write(render_annual_report(data))
+    return {"filepath": filepath, "filename": filename}
+
+
+RENDERERS: dict[str, Callable[[dict[str, Any], str], dict[str, object]]] = {
+    "aging_report_excel": _aging_report_excel,
+    "aging_report_pdf": _aging_report_pdf,
+    "vat_client_excel": _vat_client_excel,
+    "vat_client_pdf": _vat_client_pdf,
+    "clients_excel": _clients_excel,
+    "annual_report_pdf": _annual_report_pdf,
+}
+
+
+def render_export(renderer: str, payload: dict[str, Any], export_dir: str) -> dict[str, str]:
+    """Process-pool entry point; returns {"filepath", "filename"}."""
+    result = RENDERERS[renderer](payload, export_dir)
+    return {"filepath": str(result["filepath"]), "filename": str(result["filename"])}
+
+
+def warm_up() -> None:
+    """Pool initializer: import reportlab and register the TTF fonts once per process."""
+    try:
+        vat_export_pdf.register_fonts()
+        annual_report_pdf_builder._get_font()
+    except ImportError:
+        # Rendering reports the missing dependency per job.
+        pass
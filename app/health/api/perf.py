@@ -0,0 +1,35 @@
+"""
+Internal performance surface.
+
+Per-route histograms of query count, DB time and total latency for the worker
+process that serves the request, plus the route's declared query budget; and
+the outbound provider clients' breaker state, error counts and latency.
+"""
+
+import os
+
+from fastapi import APIRouter, Depends
+
+from app.core.perf import perf_registry
+from app.health.schemas import PerfSnapshotResponse, ProviderStatsListResponse
+from app.infrastructure.http_clients import http_clients
+from app.users.api.deps import require_role
+from app.users.models.user import UserRole
+
+router = APIRouter(
+    prefix="/internal",
+    tags=["internal"],
+    dependencies=[Depends(require_role(UserRole.ADVISOR))],
+)
+
+
+@router.get("/perf", response_model=PerfSnapshotResponse)
+def get_perf() -> PerfSnapshotResponse:
+    """Per-route performance histograms since this worker started."""
+    return PerfSnapshotResponse(**perf_registry.snapshot())
+
+
+@router.get("/providers", response_model=ProviderStatsListResponse)
+def get_provider_stats() -> ProviderStatsListResponse:
+    """Outbound provider clients (Brevo, 360dialog) of this worker."""
+    return ProviderStatsListResponse(pid=os.getpid(), providers=http_clients.snapshot())
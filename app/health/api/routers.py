@@ -3,8 +3,10 @@
 from fastapi import APIRouter
 
 from app.health.api.health import router as health_router
+from app.health.api.perf import router as perf_router
 
 router = APIRouter()
 router.include_router(health_router)
+router.include_router(perf_router)
 
 __all__ = ["router"]
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Literal
 
 from pydantic import BaseModel
@@ -6,3 +7,55 @@ from pydantic import BaseModel
 class HealthCheckResponse(BaseModel):
     status: Literal["healthy", "unhealthy"]
     database: Literal["connected", "disconnected"]
+
+
+class HistogramBucket(BaseModel):
+    le: float | None  # None is the overflow bucket
+    count: int
+
+
+class HistogramResponse(BaseModel):
+    count: int
+    sum: float
+    max: float
+    p50: float
+    p95: float
+    buckets: list[HistogramBucket]
+
+
+class QueryBudgetResponse(BaseModel):
+    max_queries: int
+    max_repeated: int | None = None
+    max_db_ms: float | None = None
+
+
+class RoutePerfResponse(BaseModel):
+    route: str
+    requests: int
+    repeated_query_requests: int
+    over_budget_requests: int
+    budget: QueryBudgetResponse | None = None
+    queries: HistogramResponse
+    db_ms: HistogramResponse
+    duration_ms: HistogramResponse
+
+
+class PerfSnapshotResponse(BaseModel):
+    pid: int
+    since: datetime
+    routes: list[RoutePerfResponse]
+
+
+class ProviderStatsResponse(BaseModel):
+    provider: str
+    breaker: Literal["closed", "open", "half_open"]
+    http2: bool
+    requests: int
+    errors: int
+    short_circuited: int
+    latency_ms: HistogramResponse
+
+
+class ProviderStatsListResponse(BaseModel):
+    pid: int
+    providers: list[ProviderStatsResponse]
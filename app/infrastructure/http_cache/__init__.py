@@ -0,0 +1,21 @@
+from app.infrastructure.http_cache.dependency import (
+    ResponseCache,
+    body_cache,
+    cache_headers,
+    cached_response,
+    etag_matches,
+)
+from app.infrastructure.http_cache.events import watched_tables
+from app.infrastructure.http_cache.model import ChangeCounter
+from app.infrastructure.http_cache.repository import ChangeCounterRepository
+
+__all__ = [
+    "ChangeCounter",
+    "ChangeCounterRepository",
+    "ResponseCache",
+    "body_cache",
+    "cache_headers",
+    "cached_response",
+    "etag_matches",
+    "watched_tables",
+]
@@ -0,0 +1,143 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import cache
+from typing import Any
+
+from fastapi import Depends, Request, Response
+from sqlalchemy.orm import Session
+
+from app.common.repositories.read_repository import read_session
+from app.config import settings
+from app.core.json_response import dump_json, response_adapter
+from app.database import get_db
+from app.infrastructure.http_cache.events import has_pending_changes, watch_tables
+from app.infrastructure.http_cache.repository import ChangeCounterRepository
+from app.users.api.deps import get_current_user
+from app.users.models.user import UserRole
+from app.users.repositories.user_repository import AuthSubject
+from app.utils.time_utils import israel_today
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header value matches `etag` (weak comparison)."""
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def cache_headers(etag: str) -> dict[str, str]:
+    # no-cache: the browser may keep the body but must revalidate it on every use.
+    return {"ETag": etag, "Cache-Control": "private, no-cache", "Vary": "Authorization"}
+
+
+class BodyCache:
+    """Process-local LRU of serialized response bodies keyed by ETag."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._bodies: OrderedDict[str, bytes] = OrderedDict()
+
+    def get(self, etag: str) -> bytes | None:
+        with self._lock:
+            body = self._bodies.get(etag)
+            if body is not None:
+                self._bodies.move_to_end(etag)
+            return body
+
+    def put(self, etag: str, body: bytes) -> None:
+        max_entries = settings.HTTP_CACHE_BODY_MAX_ENTRIES
+        if max_entries <= 0 or len(body) > settings.HTTP_CACHE_BODY_MAX_BYTES:
+            return
+        with self._lock:
+            self._bodies[etag] = body
+            self._bodies.move_to_end(etag)
+            while len(self._bodies) > max_entries:
+                self._bodies.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._bodies.clear()
+
+
+body_cache = BodyCache()
+
+
+@cache
+def _schema_fingerprint(response_model: Any) -> str:
+    """Changes with the response shape, so a deploy never revalidates an old body."""
+    schema = json.dumps(response_adapter(response_model).json_schema(), sort_keys=True)
+    return hashlib.sha256(schema.encode()).hexdigest()[:16]
+
+
+@dataclass
+class ResponseCache:
+    """Conditional GET for one request; `etag` is None when caching is bypassed.
+
+    Routes call `lookup()` before doing any work and return its response when
+    there is one (304, or a cached body); otherwise they build their result and
+    return `store(result)`, which serializes it with `dump_json` even when
+    caching is bypassed.
+    """
+
+    request: Request
+    etag: str | None
+
+    def lookup(self) -> Response | None:
+        if self.etag is None:
+            return None
+        if etag_matches(self.request.headers.get("if-none-match"), self.etag):
+            return Response(status_code=304, headers=cache_headers(self.etag))
+        body = body_cache.get(self.etag)
+        if body is None:
+            return None
+        return Response(body, media_type="application/json", headers=cache_headers(self.etag))
+
+    def store(self, result: Any) -> Response:
+        body = dump_json(self.request.scope["route"].response_model, result)
+        if self.etag is None:
+            return Response(body, media_type="application/json")
+        body_cache.put(self.etag, body)
+        return Response(body, media_type="application/json", headers=cache_headers(self.etag))
+
+
+def _version_etag(request: Request, role: UserRole, versions: dict[str, Any]) -> str:
+    counters = sorted((name, version, str(at)) for name, (version, at) in versions.items())
+    parts = [
+        request.url.path,
+        sorted(request.query_params.multi_items()),
+        role.value,
+        israel_today().isoformat(),
+        _schema_fingerprint(request.scope["route"].response_model),
+        counters,
+    ]
+    digest = hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def cached_response(*table_names: str) -> Callable[..., ResponseCache]:
+    """Dependency: ETag / 304 handling for a GET route reading `table_names`.
+
+    The ETag covers the path and query string, the caller's role, today's date
+    and the change counters of `table_names`, so it must list every table the
+    route's response is built from. Only tables listed by some route have their
+    counters bumped.
+    """
+    watch_tables(table_names)
+
+    def dependency(
+        request: Request,
+        user: AuthSubject = Depends(get_current_user),
+        db: Session = Depends(get_db),
+    ) -> ResponseCache:
+        # Uncommitted writes of this session aren't counted yet.
+        if not settings.HTTP_CACHE_ENABLED or has_pending_changes(db):
+            return ResponseCache(request=request, etag=None)
+        versions = ChangeCounterRepository(read_session(db)).versions(table_names)
+        return ResponseCache(request=request, etag=_version_etag(request, user.role, versions))
+
+    return dependency
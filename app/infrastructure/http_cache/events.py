@@ -0,0 +1,98 @@
+"""Session events bumping `change_counters` for the tables a transaction writes.
+
+Flushed ORM changes and bulk INSERT / UPDATE / DELETE statements executed
+through the session record their table names; just before commit the counters
+of those tables are incremented inside the same transaction, so a counter
+never moves without its data (or the other way round). Writes issued as raw
+SQL text bypass this and must not touch tables behind cached endpoints.
+
+Only tables some `cached_response(...)` reads are counted: bumping takes a row
+lock held until commit, which would serialize every writer of a hot table for
+no reader. A process that declares no cached route (an ops script) counts
+every table it writes, so its writes still move the ETags the API serves.
+"""
+
+from __future__ import annotations
+
+from itertools import chain
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.config import settings
+
+_PENDING_KEY = "change_counters_pending"
+_IGNORED_TABLES = frozenset({"change_counters"})
+# Tables read by cached routes; filled by cached_response() as routes are declared.
+_cached_tables: set[str] = set()
+
+
+def watch_tables(table_names) -> None:
+    _cached_tables.update(table_names)
+
+
+def watched_tables() -> frozenset[str]:
+    return frozenset(_cached_tables)
+
+
+def has_pending_changes(session: Session) -> bool:
+    """Whether `session` wrote tables whose counters are not bumped yet (uncommitted)."""
+    return bool(session.info.get(_PENDING_KEY))
+
+
+def _record(session: Session, table_names) -> None:
+    names = set(table_names) - _IGNORED_TABLES
+    if _cached_tables:
+        names &= _cached_tables
+    if names:
+        session.info.setdefault(_PENDING_KEY, set()).update(names)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_tables(session: Session, _flush_context) -> None:
+    if not settings.HTTP_CACHE_ENABLED:
+        return
+    _record(
+        session,
+        (
+            table.name
+            for target in chain(session.new, session.dirty, session.deleted)
+            for table in inspect(target).mapper.tables
+        ),
+    )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_write(orm_execute_state) -> None:
+    if not settings.HTTP_CACHE_ENABLED:
+        return
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is not None:
+            _record(orm_execute_state.session, [table.name])
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_counters(session: Session) -> None:
+    if not settings.HTTP_CACHE_ENABLED:
+        return
+    session.flush()
+    table_names = session.info.pop(_PENDING_KEY, None)
+    if not table_names:
+        return
+
+    from app.infrastructure.http_cache.repository import ChangeCounterRepository
+
+    ChangeCounterRepository(session).bump(table_names)
+
+
+# Read models refreshed by later before_commit hooks (work_queue_items,
+# dashboard_snapshots) are not counted; cached routes declare their sources.
+@event.listens_for(Session, "after_commit")
+def _drop_late_writes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending(session: Session, _previous_transaction) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,28 @@
+"""Per-table change counters behind the ETags of cached read endpoints.
+
+Every committed transaction that inserted, updated or deleted rows of a table
+bumps that table's `version` (see `events`). Aggregate tables maintained by
+session hooks, such as `client_year_vat_totals`, are bumped like any other.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from importlib import import_module
+
+from sqlalchemy import BigInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.utils.time_utils import utcnow
+
+
+class ChangeCounter(Base):
+    __tablename__ = "change_counters"
+
+    table_name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    changed_at: Mapped[datetime] = mapped_column(nullable=False, default=utcnow)
+
+
+import_module("app.infrastructure.http_cache.events")
@@ -0,0 +1,56 @@
+from collections.abc import Iterable
+from datetime import datetime
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.infrastructure.http_cache.model import ChangeCounter
+from app.utils.time_utils import utcnow
+
+
+class ChangeCounterRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def versions(self, table_names: Iterable[str]) -> dict[str, tuple[int, datetime]]:
+        """(version, changed_at) per table; tables never written have no entry."""
+        rows = self.db.execute(
+            select(ChangeCounter.table_name, ChangeCounter.version, ChangeCounter.changed_at).where(
+                ChangeCounter.table_name.in_(sorted(set(table_names)))
+            )
+        )
+        return {name: (version, changed_at) for name, version, changed_at in rows}
+
+    def bump(self, table_names: Iterable[str]) -> None:
+        names = sorted(set(table_names))
+        if not names:
+            return
+        now = utcnow()
+        result = self.db.execute(
+            update(ChangeCounter)
+            .where(ChangeCounter.table_name.in_(names))
+            .values(version=ChangeCounter.version + 1, changed_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == len(names):
+            return
+        existing = set(
+            self.db.scalars(
+                select(ChangeCounter.table_name).where(ChangeCounter.table_name.in_(names))
+            )
+        )
+        for name in names:
+            if name in existing:
+                continue
+            try:
+                with self.db.begin_nested():
+                    self.db.add(ChangeCounter(table_name=name, version=1, changed_at=now))
+            except IntegrityError:
+                # Another transaction created the row first; count this write on top of it.
+                self.db.execute(
+                    update(ChangeCounter)
+                    .where(ChangeCounter.table_name == name)
+                    .values(version=ChangeCounter.version + 1, changed_at=now)
+                    .execution_options(synchronize_session=False)
+                )
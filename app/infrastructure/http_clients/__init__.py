@@ -0,0 +1,25 @@
+from app.infrastructure.http_clients.breaker import (
+    BreakerState,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+from app.infrastructure.http_clients.manager import (
+    BREVO,
+    PROVIDERS,
+    WHATSAPP,
+    HttpClientManager,
+    ProviderStats,
+    http_clients,
+)
+
+__all__ = [
+    "BREVO",
+    "PROVIDERS",
+    "WHATSAPP",
+    "BreakerState",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "HttpClientManager",
+    "ProviderStats",
+    "http_clients",
+]
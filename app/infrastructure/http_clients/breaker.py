@@ -0,0 +1,92 @@
+"""Per-provider circuit breaker.
+
+After `failure_threshold` consecutive failures (network errors and 5xx) the
+breaker opens and calls fail immediately with `CircuitOpenError` instead of
+waiting on a provider that is down. After `reset_seconds` one probe call is
+let through: success closes the breaker, failure opens it again.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from enum import Enum
+
+import httpx
+
+
+class BreakerState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(httpx.TransportError):
+    """The provider's breaker is open; the request was not sent.
+
+    A `httpx.RequestError`, so channels treat it like any network failure
+    (retryable).
+    """
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        *,
+        failure_threshold: int,
+        reset_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_threshold = max(1, failure_threshold)
+        self._reset_seconds = reset_seconds
+        self._clock = clock
+        # Shared by the sync client (threadpool) and the async client (event loop).
+        self._lock = threading.Lock()
+        self._state = BreakerState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    @property
+    def state(self) -> BreakerState:
+        with self._lock:
+            if self._state == BreakerState.OPEN and self._reset_due():
+                return BreakerState.HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may go out now; in half-open state only one probe at a time."""
+        with self._lock:
+            if self._state == BreakerState.CLOSED:
+                return True
+            if self._state == BreakerState.OPEN:
+                if not self._reset_due():
+                    return False
+                self._state = BreakerState.HALF_OPEN
+            if self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = BreakerState.CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._probing = False
+            if self._state == BreakerState.HALF_OPEN or self._failures >= self._failure_threshold:
+                self._state = BreakerState.OPEN
+                self._opened_at = self._clock()
+
+    def release(self) -> None:
+        """End a call that neither succeeded nor failed (e.g. cancelled)."""
+        with self._lock:
+            self._probing = False
+
+    def _reset_due(self) -> bool:
+        return self._clock() - self._opened_at >= self._reset_seconds
@@ -0,0 +1,238 @@
+"""Process-wide pooled HTTP clients for outbound provider calls.
+
+One sync `httpx.Client` (password reset, other request-path sends) and one
+`httpx.AsyncClient` (outbox worker) per provider. Each keeps its own
+keep-alive pool and speaks HTTP/2 when enabled and the optional `h2` package
+is installed (`pip install httpx[http2]`). Both clients of a provider share
+a `CircuitBreaker` and latency/error counters, applied in a transport
+wrapper, so callers use the plain httpx API.
+
+`app/lifespan.py` opens the pools on startup and closes them on shutdown;
+code running outside the app (scripts, tests) gets clients created on first
+use.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from importlib.util import find_spec
+from typing import Any
+
+import httpx
+
+from app.config import settings
+from app.core.perf import DURATION_MS_BOUNDS, Histogram
+from app.infrastructure.http_clients.breaker import CircuitBreaker, CircuitOpenError
+
+BREVO = "brevo"
+WHATSAPP = "whatsapp"
+PROVIDERS = (BREVO, WHATSAPP)
+
+
+class ProviderStats:
+    """Request, error and short-circuit counters plus a latency histogram."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.short_circuited = 0
+        self.latency_ms = Histogram(DURATION_MS_BOUNDS)
+
+    def observe(self, elapsed_ms: float, *, failed: bool) -> None:
+        with self._lock:
+            self.requests += 1
+            self.errors += int(failed)
+            self.latency_ms.observe(elapsed_ms)
+
+    def short_circuit(self) -> None:
+        with self._lock:
+            self.short_circuited += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "errors": self.errors,
+                "short_circuited": self.short_circuited,
+                "latency_ms": self.latency_ms.snapshot(),
+            }
+
+
+class _Guard:
+    """Breaker check before a request and outcome accounting after it."""
+
+    def __init__(self, provider: str, breaker: CircuitBreaker, stats: ProviderStats) -> None:
+        self.provider = provider
+        self.breaker = breaker
+        self.stats = stats
+
+    def admit(self, request: httpx.Request) -> float:
+        if not self.breaker.allow():
+            self.stats.short_circuit()
+            raise CircuitOpenError(f"{self.provider} circuit open", request=request)
+        return time.perf_counter()
+
+    def completed(self, started: float, status_code: int) -> None:
+        failed = status_code >= 500
+        self.stats.observe(_elapsed_ms(started), failed=failed)
+        if failed:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+
+    def failed(self, started: float) -> None:
+        self.stats.observe(_elapsed_ms(started), failed=True)
+        self.breaker.record_failure()
+
+
+class GuardedTransport(httpx.BaseTransport):
+    def __init__(self, inner: httpx.BaseTransport, guard: _Guard) -> None:
+        self._inner = inner
+        self._guard = guard
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        started = self._guard.admit(request)
+        try:
+            response = self._inner.handle_request(request)
+        except httpx.TransportError:
+            self._guard.failed(started)
+            raise
+        except BaseException:
+            self._guard.breaker.release()
+            raise
+        self._guard.completed(started, response.status_code)
+        return response
+
+    def close(self) -> None:
+        self._inner.close()
+
+
+class AsyncGuardedTransport(httpx.AsyncBaseTransport):
+    def __init__(self, inner: httpx.AsyncBaseTransport, guard: _Guard) -> None:
+        self._inner = inner
+        self._guard = guard
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = self._guard.admit(request)
+        try:
+            response = await self._inner.handle_async_request(request)
+        except httpx.TransportError:
+            self._guard.failed(started)
+            raise
+        except BaseException:
+            self._guard.breaker.release()
+            raise
+        self._guard.completed(started, response.status_code)
+        return response
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+class HttpClientManager:
+    """Pooled, breaker-guarded sync and async clients per provider.
+
+    `transport` / `async_transport` build the innermost transport for a
+    provider; they default to httpx's pooled transports and are replaced by
+    `httpx.MockTransport` in tests.
+    """
+
+    def __init__(
+        self,
+        *,
+        limits: httpx.Limits,
+        http2: bool = False,
+        failure_threshold: int,
+        reset_seconds: float,
+        transport: Callable[[str], httpx.BaseTransport] | None = None,
+        async_transport: Callable[[str], httpx.AsyncBaseTransport] | None = None,
+    ) -> None:
+        self._limits = limits
+        self._http2 = http2
+        self._transport = transport or self._pooled_transport
+        self._async_transport = async_transport or self._pooled_async_transport
+        self._lock = threading.Lock()
+        self._guards = {
+            provider: _Guard(
+                provider,
+                CircuitBreaker(failure_threshold=failure_threshold, reset_seconds=reset_seconds),
+                ProviderStats(),
+            )
+            for provider in PROVIDERS
+        }
+        self._clients: dict[str, httpx.Client] = {}
+        self._async_clients: dict[str, httpx.AsyncClient] = {}
+
+    @classmethod
+    def from_settings(cls) -> HttpClientManager:
+        return cls(
+            limits=httpx.Limits(
+                max_connections=settings.HTTP_CLIENT_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            http2=settings.HTTP_CLIENT_HTTP2 and find_spec("h2") is not None,
+            failure_threshold=settings.HTTP_CLIENT_BREAKER_FAILURE_THRESHOLD,
+            reset_seconds=settings.HTTP_CLIENT_BREAKER_RESET_SECONDS,
+        )
+
+    def client(self, provider: str) -> httpx.Client:
+        with self._lock:
+            client = self._clients.get(provider)
+            if client is None:
+                transport = GuardedTransport(self._transport(provider), self._guards[provider])
+                client = self._clients[provider] = httpx.Client(transport=transport)
+            return client
+
+    def async_client(self, provider: str) -> httpx.AsyncClient:
+        with self._lock:
+            client = self._async_clients.get(provider)
+            if client is None:
+                transport = AsyncGuardedTransport(
+                    self._async_transport(provider), self._guards[provider]
+                )
+                client = self._async_clients[provider] = httpx.AsyncClient(transport=transport)
+            return client
+
+    def open(self) -> None:
+        """Create every provider's pools up front (app startup)."""
+        for provider in PROVIDERS:
+            self.client(provider)
+            self.async_client(provider)
+
+    async def aclose(self) -> None:
+        """Close every pool; later calls start new ones."""
+        with self._lock:
+            clients, self._clients = self._clients, {}
+            async_clients, self._async_clients = self._async_clients, {}
+        for client in clients.values():
+            client.close()
+        for async_client in async_clients.values():
+            await async_client.aclose()
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "provider": provider,
+                "breaker": guard.breaker.state.value,
+                "http2": self._http2,
+                **guard.stats.snapshot(),
+            }
+            for provider, guard in self._guards.items()
+        ]
+
+    def _pooled_transport(self, _provider: str) -> httpx.BaseTransport:
+        return httpx.HTTPTransport(limits=self._limits, http2=self._http2)
+
+    def _pooled_async_transport(self, _provider: str) -> httpx.AsyncBaseTransport:
+        return httpx.AsyncHTTPTransport(limits=self._limits, http2=self._http2)
+
+
+def _elapsed_ms(started: float) -> float:
+    return (time.perf_counter() - started) * 1000
+
+
+http_clients = HttpClientManager.from_settings()
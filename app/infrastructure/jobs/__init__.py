@@ -0,0 +1,21 @@
+from app.infrastructure.jobs.leased_queue import LeasedQueueWorker, claim_leased
+from app.infrastructure.jobs.model import JobRun, JobRunStatus, ScheduledJob
+from app.infrastructure.jobs.registry import JobDefinition, JobRegistry
+from app.infrastructure.jobs.repository import JobRepository
+from app.infrastructure.jobs.runner import JobOutcome, JobRunner
+from app.infrastructure.jobs.schedules import DailyAt, Every
+
+__all__ = [
+    "DailyAt",
+    "Every",
+    "JobDefinition",
+    "JobOutcome",
+    "JobRegistry",
+    "JobRepository",
+    "JobRun",
+    "JobRunStatus",
+    "JobRunner",
+    "LeasedQueueWorker",
+    "ScheduledJob",
+    "claim_leased",
+]
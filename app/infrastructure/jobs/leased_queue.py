@@ -0,0 +1,102 @@
+"""Claiming and polling for user-requested jobs queued in a table.
+
+Scheduled jobs run through `JobRunner`, once per due time and on the leader
+only. Jobs a user queues and waits for (exports, client imports) instead go
+through a queue table that every process drains: rows are leased with
+`FOR UPDATE SKIP LOCKED`, so processes never claim the same row, and a worker
+that dies mid-job lets its lease lapse so the row is claimed again with its
+`attempts` incremented.
+
+A queue model has `status` ("queued" / "running"), `attempts`,
+`locked_until`, `created_at` and `id` columns.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import TypeVar
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.orm import Session
+
+from app.core.logging_config import get_logger
+from app.utils.time_utils import utcnow
+
+logger = get_logger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+
+Job = TypeVar("Job")
+
+
+def claim_leased(
+    db: Session, model: type[Job], *, limit: int, lease_until: datetime, now: datetime
+) -> list[Job]:
+    """Lease queued jobs, and running jobs whose worker let the lease lapse."""
+    jobs = list(
+        db.scalars(
+            select(model)
+            .where(
+                or_(
+                    model.status == QUEUED,
+                    and_(model.status == RUNNING, model.locked_until <= now),
+                )
+            )
+            .order_by(model.created_at, model.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+    )
+    for job in jobs:
+        job.status = RUNNING
+        job.attempts += 1
+        job.locked_until = lease_until
+    db.flush()
+    return jobs
+
+
+class LeasedQueueWorker(ABC):
+    """Base for workers draining a leased queue; subclasses implement `run_once`."""
+
+    name = "queue worker"
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        *,
+        claim_limit: int,
+        lease_seconds: int,
+        max_attempts: int,
+    ) -> None:
+        self._session_factory = session_factory
+        self._claim_limit = claim_limit
+        self._lease_seconds = lease_seconds
+        self._max_attempts = max_attempts
+
+    @abstractmethod
+    async def run_once(self) -> int:
+        """Process one pass of claimed jobs; returns how many were claimed."""
+
+    async def run_forever(self, poll_seconds: float) -> None:
+        while True:
+            try:
+                claimed = await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("%s pass failed", self.name)
+                claimed = 0
+            # A full claim suggests a backlog: go again without waiting.
+            if claimed < self._claim_limit:
+                await asyncio.sleep(poll_seconds)
+
+    def lease_until(self) -> datetime:
+        return utcnow() + timedelta(seconds=self._lease_seconds)
+
+    def gave_up(self, attempts: int) -> bool:
+        # Claimed again after its lease lapsed too often: the job keeps killing its worker.
+        return attempts > self._max_attempts
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from sqlalchemy.orm import Session
+
+
+class Schedule(Protocol):
+    def first_run(self, now): ...
+
+    def next_after(self, now): ...
+
+    def describe(self) -> str: ...
+
+
+# A task does its work in the session it is given and returns counters for the
+# run record (or None). The runner commits on success and rolls back on error.
+JobTask = Callable[[Session], dict[str, Any] | None]
+
+
+@dataclass(frozen=True)
+class JobDefinition:
+    name: str
+    schedule: Schedule
+    task: JobTask
+
+
+class JobRegistry:
+    def __init__(self) -> None:
+        self._jobs: dict[str, JobDefinition] = {}
+
+    def register(self, name: str, schedule: Schedule, task: JobTask) -> JobDefinition:
+        if name in self._jobs:
+            raise ValueError(f"job {name!r} is already registered")
+        job = JobDefinition(name=name, schedule=schedule, task=task)
+        self._jobs[name] = job
+        return job
+
+    def get(self, name: str) -> JobDefinition | None:
+        return self._jobs.get(name)
+
+    def __iter__(self) -> Iterator[JobDefinition]:
+        return iter(self._jobs.values())
+
+    def __len__(self) -> int:
+        return len(self._jobs)
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.orm import Session
+
+from app.infrastructure.jobs.model import (
+    JobRun,
+    JobRunStatus,
+    JobSchedulerLease,
+    ScheduledJob,
+)
+
+
+class JobRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    # ── Registration ──────────────────────────────────────────────────────────
+
+    def missing_jobs(self, names: Iterable[str]) -> set[str]:
+        wanted = set(names)
+        if not wanted:
+            return set()
+        existing = self.db.scalars(select(ScheduledJob.name).where(ScheduledJob.name.in_(wanted)))
+        return wanted - set(existing)
+
+    def add_job(self, name: str, next_run_at: datetime) -> None:
+        """Caller must handle IntegrityError when another process registered it first."""
+        self.db.add(ScheduledJob(name=name, next_run_at=next_run_at))
+        self.db.flush()
+
+    # ── Leadership ────────────────────────────────────────────────────────────
+
+    def acquire_lease(self, name: str, owner: str, *, now: datetime, expires_at: datetime) -> bool:
+        """Take or renew a named lease; False while another owner holds it."""
+        result = self.db.execute(
+            update(JobSchedulerLease)
+            .where(
+                JobSchedulerLease.name == name,
+                or_(JobSchedulerLease.owner == owner, JobSchedulerLease.expires_at <= now),
+            )
+            .values(owner=owner, expires_at=expires_at)
+        )
+        return result.rowcount == 1
+
+    def lease_exists(self, name: str) -> bool:
+        return self.db.get(JobSchedulerLease, name) is not None
+
+    def add_lease(self, name: str, owner: str, expires_at: datetime) -> None:
+        """Caller must handle IntegrityError when another process created it first."""
+        self.db.add(JobSchedulerLease(name=name, owner=owner, expires_at=expires_at))
+        self.db.flush()
+
+    def release_lease(self, name: str, owner: str, *, now: datetime) -> None:
+        self.db.execute(
+            update(JobSchedulerLease)
+            .where(JobSchedulerLease.name == name, JobSchedulerLease.owner == owner)
+            .values(expires_at=now)
+        )
+
+    # ── Claiming and recording runs ───────────────────────────────────────────
+
+    def claim_due(
+        self, names: Iterable[str], owner: str, *, now: datetime, lease_until: datetime
+    ) -> list[str]:
+        """Lease every due, unleased job among `names`; other claimers skip locked rows."""
+        wanted = set(names)
+        if not wanted:
+            return []
+        claimed = list(
+            self.db.scalars(
+                select(ScheduledJob.name)
+                .where(
+                    ScheduledJob.name.in_(wanted),
+                    ScheduledJob.next_run_at <= now,
+                    or_(
+                        ScheduledJob.lease_expires_at.is_(None),
+                        ScheduledJob.lease_expires_at <= now,
+                    ),
+                )
+                .order_by(ScheduledJob.next_run_at, ScheduledJob.name)
+                .with_for_update(skip_locked=True)
+            )
+        )
+        if claimed:
+            self.db.execute(
+                update(ScheduledJob)
+                .where(ScheduledJob.name.in_(claimed))
+                .values(lease_owner=owner, lease_expires_at=lease_until, last_started_at=now)
+            )
+        return claimed
+
+    def record_run(
+        self,
+        name: str,
+        owner: str,
+        *,
+        status: JobRunStatus,
+        started_at: datetime,
+        finished_at: datetime,
+        result: dict[str, Any] | None,
+        error: str | None,
+        next_run_at: datetime,
+    ) -> JobRun:
+        """Store the run, schedule the next one and release the job's lease."""
+        failed = status == JobRunStatus.FAILED
+        self.db.execute(
+            update(ScheduledJob)
+            .where(ScheduledJob.name == name, ScheduledJob.lease_owner == owner)
+            .values(
+                next_run_at=next_run_at,
+                lease_owner=None,
+                lease_expires_at=None,
+                last_finished_at=finished_at,
+                last_status=status.value,
+                last_error=error,
+                run_count=ScheduledJob.run_count + 1,
+                failure_count=ScheduledJob.failure_count + (1 if failed else 0),
+            )
+        )
+        run = JobRun(
+            job_name=name,
+            owner=owner,
+            status=status.value,
+            started_at=started_at,
+            finished_at=finished_at,
+            duration_ms=int((finished_at - started_at).total_seconds() * 1000),
+            result=result,
+            error=error,
+        )
+        self.db.add(run)
+        self.db.flush()
+        return run
+
+    def get_job(self, name: str) -> ScheduledJob | None:
+        return self.db.get(ScheduledJob, name)
+
+    def list_runs(self, name: str, limit: int = 20) -> list[JobRun]:
+        return list(
+            self.db.scalars(
+                select(JobRun)
+                .where(JobRun.job_name == name)
+                .order_by(JobRun.started_at.desc(), JobRun.id.desc())
+                .limit(limit)
+            )
+        )
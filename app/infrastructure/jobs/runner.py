@@ -0,0 +1,230 @@
+"""DB-coordinated runner for registered background jobs.
+
+Every app process starts a runner, but only the holder of the `"scheduler"`
+lease claims work, so a job runs once per due time however many gunicorn
+workers or nodes are up. If the leader dies its lease lapses and another
+process takes over on its next poll. Each claimed job also carries its own
+lease (claimed with `FOR UPDATE SKIP LOCKED`), which keeps a job that is still
+running from being started again after a leadership change.
+
+Polling, claiming and the jobs themselves run in a thread pool; the event loop
+only schedules them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, is_dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.logging_config import get_logger
+from app.infrastructure.jobs.model import JobRunStatus
+from app.infrastructure.jobs.registry import JobRegistry
+from app.infrastructure.jobs.repository import JobRepository
+from app.utils.time_utils import utcnow
+
+logger = get_logger(__name__)
+
+LEADER_LEASE = "scheduler"
+
+
+@dataclass(frozen=True)
+class JobOutcome:
+    name: str
+    status: JobRunStatus
+    duration_ms: int
+    result: dict[str, Any] | None
+    error: str | None
+
+
+def default_owner() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class JobRunner:
+    def __init__(
+        self,
+        registry: JobRegistry,
+        session_factory: Callable[[], Session],
+        *,
+        owner: str | None = None,
+        leader_ttl_seconds: int = 60,
+        job_lease_seconds: int = 1800,
+        max_workers: int = 4,
+        clock: Callable[[], datetime] = utcnow,
+    ) -> None:
+        self.registry = registry
+        self.owner = owner or default_owner()
+        self._session_factory = session_factory
+        self._leader_ttl = timedelta(seconds=leader_ttl_seconds)
+        self._job_lease = timedelta(seconds=job_lease_seconds)
+        self._clock = clock
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="jobs")
+        self._registered = False
+        self._running: set[asyncio.Future] = set()
+
+    # ── Synchronous steps (run in the pool) ───────────────────────────────────
+
+    def claim(self) -> list[str]:
+        """Register jobs, renew or take leadership, and lease the due jobs."""
+        if not self._registered:
+            self._register()
+        db = self._session_factory()
+        try:
+            repo = JobRepository(db)
+            now = self._clock()
+            if not self._lead(repo, now):
+                db.commit()
+                return []
+            names = repo.claim_due(
+                [job.name for job in self.registry],
+                self.owner,
+                now=now,
+                lease_until=now + self._job_lease,
+            )
+            db.commit()
+            return names
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def execute(self, name: str) -> JobOutcome:
+        """Run one claimed job in its own session and record the run."""
+        job = self.registry.get(name)
+        started_at = self._clock()
+        result = None
+        error = None
+        status = JobRunStatus.SUCCEEDED
+        db = self._session_factory()
+        try:
+            result = _as_counters(job.task(db))
+            db.commit()
+        except Exception as exc:  # noqa: BLE001
+            db.rollback()
+            status = JobRunStatus.FAILED
+            error = f"{type(exc).__name__}: {exc}"
+            logger.exception("job %s failed", name)
+        finally:
+            db.close()
+        finished_at = self._clock()
+
+        db = self._session_factory()
+        try:
+            run = JobRepository(db).record_run(
+                name,
+                self.owner,
+                status=status,
+                started_at=started_at,
+                finished_at=finished_at,
+                result=result,
+                error=error,
+                next_run_at=job.schedule.next_after(finished_at),
+            )
+            duration_ms = run.duration_ms
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        logger.info(
+            "job %s %s in %dms result=%s", name, status.value, duration_ms, result or {}
+        )
+        return JobOutcome(name, status, duration_ms, result, error)
+
+    def run_pending(self) -> list[JobOutcome]:
+        """Claim and run every due job in the calling thread (scripts and tests)."""
+        return [self.execute(name) for name in self.claim()]
+
+    def release(self) -> None:
+        db = self._session_factory()
+        try:
+            JobRepository(db).release_lease(LEADER_LEASE, self.owner, now=self._clock())
+            db.commit()
+        except Exception:
+            db.rollback()
+            logger.exception("could not release scheduler lease")
+        finally:
+            db.close()
+
+    # ── Event loop side ───────────────────────────────────────────────────────
+
+    async def run_forever(self, poll_seconds: float) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                try:
+                    names = await loop.run_in_executor(self._executor, self.claim)
+                except Exception:
+                    logger.exception("job runner poll failed")
+                    names = []
+                for name in names:
+                    future = loop.run_in_executor(self._executor, self.execute, name)
+                    self._running.add(future)
+                    future.add_done_callback(self._running.discard)
+                await asyncio.sleep(poll_seconds)
+        finally:
+            # Running jobs finish in their threads; their leases cover the gap.
+            self._executor.submit(self.release)
+            self._executor.shutdown(wait=False)
+
+    # ── Internals ─────────────────────────────────────────────────────────────
+
+    def _register(self) -> None:
+        now = self._clock()
+        db = self._session_factory()
+        try:
+            missing = JobRepository(db).missing_jobs(job.name for job in self.registry)
+            db.commit()
+        finally:
+            db.close()
+        for name in missing:
+            self._insert_once(
+                lambda repo, name=name: repo.add_job(
+                    name, self.registry.get(name).schedule.first_run(now)
+                )
+            )
+        self._registered = True
+
+    def _lead(self, repo: JobRepository, now: datetime) -> bool:
+        expires_at = now + self._leader_ttl
+        if repo.acquire_lease(LEADER_LEASE, self.owner, now=now, expires_at=expires_at):
+            return True
+        if repo.lease_exists(LEADER_LEASE):
+            return False
+        # First process ever: create the lease row; losing that race means someone else leads.
+        return self._insert_once(
+            lambda other: other.add_lease(LEADER_LEASE, self.owner, expires_at)
+        )
+
+    def _insert_once(self, insert: Callable[[JobRepository], None]) -> bool:
+        """Insert in a separate transaction; False when another process got there first."""
+        db = self._session_factory()
+        try:
+            insert(JobRepository(db))
+            db.commit()
+            return True
+        except IntegrityError:
+            db.rollback()
+            return False
+        finally:
+            db.close()
+
+
+def _as_counters(result: Any) -> dict[str, Any] | None:
+    if result is None or isinstance(result, dict):
+        return result
+    if is_dataclass(result):
+        return asdict(result)
+    return {"result": result}
@@ -0,0 +1,50 @@
+"""Schedules for registered jobs.
+
+A schedule answers one question: given the moment a run was due (or the moment
+a job is first registered), when is the next run due? Times are naive UTC, as
+stored everywhere else; `DailyAt` interprets its wall-clock time in a zone.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime, time, timedelta, tzinfo
+
+from app.utils.time_utils import ISRAEL_TZ
+
+
+@dataclass(frozen=True)
+class Every:
+    """Fixed interval; the first run is due as soon as the job is registered."""
+
+    interval: timedelta
+
+    def first_run(self, now: datetime) -> datetime:
+        return now
+
+    def next_after(self, now: datetime) -> datetime:
+        return now + self.interval
+
+    def describe(self) -> str:
+        return f"every {int(self.interval.total_seconds())}s"
+
+
+@dataclass(frozen=True)
+class DailyAt:
+    """Once a day at a wall-clock time (Israel time by default)."""
+
+    at: time
+    tz: tzinfo = ISRAEL_TZ
+
+    def first_run(self, now: datetime) -> datetime:
+        return self.next_after(now)
+
+    def next_after(self, now: datetime) -> datetime:
+        local_now = now.replace(tzinfo=UTC).astimezone(self.tz)
+        candidate = datetime.combine(local_now.date(), self.at, self.tz)
+        if candidate <= local_now:
+            candidate = datetime.combine(local_now.date() + timedelta(days=1), self.at, self.tz)
+        return candidate.astimezone(UTC).replace(tzinfo=None)
+
+    def describe(self) -> str:
+        return f"daily at {self.at.strftime('%H:%M')} {self.tz}"
@@ -4,20 +4,52 @@ Infrastructure adapters for external notification channels.
 WhatsApp: 360dialog API — real implementation when WHATSAPP_API_KEY is set;
           falls back to stub (returns False) so caller can fall back to email.
 Email:    Brevo (formerly Sendinblue) — real implementation, gated by NOTIFICATIONS_ENABLED flag.
+
+The blocking channels serve one-off sends (password reset). Client notifications
+go through the outbox worker, which uses the async channels below. Both kinds
+default to the process-wide pooled clients in `app.infrastructure.http_clients`,
+which keep connections alive and trip a circuit breaker when a provider is
+down; `FakeNotificationProvider` stands in for the async channels in tests and
+local runs.
 """
 
 from __future__ import annotations
 
+import asyncio
 import html
 import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
 from typing import Any
 
 import httpx
 
+from app.infrastructure.http_clients import BREVO, WHATSAPP, http_clients
+
 logger = logging.getLogger(__name__)
 
 EMAIL_PROVIDER_TIMEOUT_SECONDS = 10
+WHATSAPP_PROVIDER_TIMEOUT_SECONDS = 15
 MAX_PROVIDER_ERROR_BODY_LENGTH = 1000
+DEFAULT_EMAIL_SUBJECT = "הודעה ממערכת ניהול התיקים"
+
+
+@dataclass(frozen=True, slots=True)
+class DeliveryResult:
+    """Outcome of one async delivery attempt; `retryable` failures may succeed later."""
+
+    ok: bool
+    error: str | None = None
+    retryable: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class OutgoingMessage:
+    """One message in a `send_batch` call."""
+
+    recipient: str
+    content: str
+    subject: str | None = None
 
 
 # ─── Email via Brevo ──────────────────────────────────────────────────────────
@@ -39,6 +71,7 @@ class EmailChannel:
 
     When NOTIFICATIONS_ENABLED=false (the default), the channel logs the
     message and returns success without actually sending — safe for dev/test.
+    Requests go through the shared Brevo client unless `http` is given.
     """
 
     def __init__(
@@ -49,7 +82,9 @@ class EmailChannel:
         api_url: str,
         from_address: str,
         from_name: str = "",
+        http: httpx.Client | None = None,
     ) -> None:
+        self._http = http or http_clients.client(BREVO)
         self._enabled = enabled
         self._api_key = api_key
         self._api_url = api_url
@@ -59,26 +94,22 @@ class EmailChannel:
     def send(
         self, recipient: str, content: str, subject: str | None = None
     ) -> tuple[bool, str | None]:
-        resolved_subject = subject or "הודעה ממערכת ניהול התיקים"
-        payload = {
-            "sender": {"email": self._from_address, "name": self._from_name or "CRM"},
-            "to": [{"email": recipient}],
-            "subject": resolved_subject,
-            "textContent": content,
-            "htmlContent": _to_html(content),
-        }
+        payload = _brevo_payload(
+            self._from_address,
+            self._from_name,
+            recipient,
+            subject or DEFAULT_EMAIL_SUBJECT,
+            content,
+            _to_html(content),
+        )
         return self._send_payload(payload, success_log_recipient=recipient)
 
     def send_html(
         self, recipient: str, html_content: str, plain_text: str, subject: str
     ) -> tuple[bool, str | None]:
-        payload = {
-            "sender": {"email": self._from_address, "name": self._from_name or "CRM"},
-            "to": [{"email": recipient}],
-            "subject": subject,
-            "textContent": plain_text,
-            "htmlContent": html_content,
-        }
+        payload = _brevo_payload(
+            self._from_address, self._from_name, recipient, subject, plain_text, html_content
+        )
         return self._send_payload(payload, success_log_recipient=recipient)
 
     def _send_payload(
@@ -94,12 +125,8 @@ class EmailChannel:
             )
             return (True, None)
 
-        if not self._api_key:
-            msg = "BREVO_API_KEY is not configured"
-            logger.error(msg)
-            return (False, msg)
-        if not self._from_address:
-            msg = "EMAIL_FROM_ADDRESS is not configured"
+        msg = _brevo_config_error(self._api_key, self._from_address)
+        if msg:
             logger.error(msg)
             return (False, msg)
 
@@ -115,7 +142,7 @@ class EmailChannel:
 
     def _post_brevo(self, payload: dict[str, Any]) -> int:
         try:
-            response = httpx.post(
+            response = self._http.post(
                 self._api_url,
                 json=payload,
                 headers={
@@ -128,10 +155,7 @@ class EmailChannel:
             raise EmailDeliveryError(f"Brevo email request failed: {exc}") from exc
 
         if response.status_code not in (200, 201):
-            body = response.text[:MAX_PROVIDER_ERROR_BODY_LENGTH]
-            raise EmailDeliveryError(
-                f"Brevo rejected email: status={response.status_code} body={body}"
-            )
+            raise EmailDeliveryError(_brevo_rejection(response))
         return response.status_code
 
 
@@ -144,9 +168,18 @@ class WhatsAppChannel:
 
     When WHATSAPP_API_KEY is empty the channel is disabled and returns
     (False, "not configured") so the caller can fall back to email.
+    Requests go through the shared 360dialog client unless `http` is given.
     """
 
-    def __init__(self, *, api_key: str, api_url: str, from_number: str) -> None:
+    def __init__(
+        self,
+        *,
+        api_key: str,
+        api_url: str,
+        from_number: str,
+        http: httpx.Client | None = None,
+    ) -> None:
+        self._http = http or http_clients.client(WHATSAPP)
         self._api_key = api_key
         self._api_url = api_url
         self._from_number = from_number
@@ -167,42 +200,247 @@ class WhatsAppChannel:
             return (False, "not configured")
 
         try:
-            import json
-            import urllib.request
-
             # 360dialog API payload — does NOT use messaging_product (that's Meta Graph API)
-            payload = {
-                "to": recipient_phone,
-                "type": "text",
-                "text": {"body": content},
-            }
-            data = json.dumps(payload).encode("utf-8")
-            req = urllib.request.Request(
+            response = self._http.post(
                 self._api_url,
-                data=data,
-                headers={
-                    "D360-API-KEY": self._api_key,
-                    "Content-Type": "application/json",
-                },
-                method="POST",
+                json={"to": recipient_phone, "type": "text", "text": {"body": content}},
+                headers={"D360-API-KEY": self._api_key, "Content-Type": "application/json"},
+                timeout=WHATSAPP_PROVIDER_TIMEOUT_SECONDS,
             )
-            with urllib.request.urlopen(req, timeout=15) as resp:
-                if resp.status in (200, 201):
-                    logger.info("WhatsApp sent to %s", recipient_phone)
-                    return (True, None)
-                msg = f"Unexpected WhatsApp status: {resp.status}"
-                logger.warning(msg)
-                return (False, msg)
-
-        except Exception as exc:  # noqa: BLE001
+        except httpx.RequestError as exc:
             msg = f"WhatsApp error: {exc}"
             logger.error(msg)
             return (False, msg)
 
+        if response.status_code in (200, 201):
+            logger.info("WhatsApp sent to %s", recipient_phone)
+            return (True, None)
+        msg = f"Unexpected WhatsApp status: {response.status_code}"
+        logger.warning(msg)
+        return (False, msg)
+
+
+# ─── Async channels (outbox worker) ───────────────────────────────────────────
+
+
+class AsyncEmailChannel:
+    """
+    Brevo email channel for the outbox worker, over the shared Brevo AsyncClient.
+
+    Same configuration and NOTIFICATIONS_ENABLED behaviour as `EmailChannel`.
+    Network errors, 429 and 5xx responses are retryable; other rejections and
+    missing configuration are not. `send_batch` sends many messages in one
+    request through Brevo's `messageVersions`; Brevo accepts or rejects the
+    request as a whole, so every message in it gets the same result.
+    """
+
+    def __init__(
+        self,
+        http: httpx.AsyncClient,
+        *,
+        enabled: bool,
+        api_key: str,
+        api_url: str,
+        from_address: str,
+        from_name: str = "",
+    ) -> None:
+        self._http = http
+        self._enabled = enabled
+        self._api_key = api_key
+        self._api_url = api_url
+        self._from_address = from_address
+        self._from_name = from_name
+
+    async def send(
+        self, recipient: str, content: str, subject: str | None = None
+    ) -> DeliveryResult:
+        if not self._enabled:
+            logger.info("[NOTIFICATIONS_DISABLED] Would send email to %s", recipient)
+            return DeliveryResult(ok=True)
+        msg = _brevo_config_error(self._api_key, self._from_address)
+        if msg:
+            return DeliveryResult(ok=False, error=msg)
+
+        payload = _brevo_payload(
+            self._from_address,
+            self._from_name,
+            recipient,
+            subject or DEFAULT_EMAIL_SUBJECT,
+            content,
+            _to_html(content),
+        )
+        return await self._post(payload)
+
+    async def send_batch(self, messages: list[OutgoingMessage]) -> list[DeliveryResult]:
+        if not self._enabled:
+            logger.info("[NOTIFICATIONS_DISABLED] Would send %s emails", len(messages))
+            return [DeliveryResult(ok=True)] * len(messages)
+        msg = _brevo_config_error(self._api_key, self._from_address)
+        if msg:
+            return [DeliveryResult(ok=False, error=msg)] * len(messages)
+
+        versions = [
+            {
+                "to": [{"email": message.recipient}],
+                "subject": message.subject or DEFAULT_EMAIL_SUBJECT,
+                "textContent": message.content,
+                "htmlContent": _to_html(message.content),
+            }
+            for message in messages
+        ]
+        first = versions[0]
+        payload = {
+            "sender": {"email": self._from_address, "name": self._from_name or "CRM"},
+            "subject": first["subject"],
+            "htmlContent": first["htmlContent"],
+            "messageVersions": versions,
+        }
+        return [await self._post(payload)] * len(messages)
+
+    async def _post(self, payload: dict[str, Any]) -> DeliveryResult:
+        try:
+            response = await self._http.post(
+                self._api_url,
+                json=payload,
+                headers={"api-key": self._api_key, "Content-Type": "application/json"},
+                timeout=EMAIL_PROVIDER_TIMEOUT_SECONDS,
+            )
+        except httpx.RequestError as exc:
+            return DeliveryResult(
+                ok=False, error=f"Brevo email request failed: {exc}", retryable=True
+            )
+        if response.status_code not in (200, 201):
+            return DeliveryResult(
+                ok=False,
+                error=_brevo_rejection(response),
+                retryable=_is_retryable_status(response.status_code),
+            )
+        return DeliveryResult(ok=True)
+
+
+class AsyncWhatsAppChannel:
+    """360dialog WhatsApp channel for the outbox worker (see `WhatsAppChannel`)."""
+
+    def __init__(
+        self, http: httpx.AsyncClient, *, api_key: str, api_url: str, from_number: str
+    ) -> None:
+        self._http = http
+        self._api_key = api_key
+        self._api_url = api_url
+        self._from_number = from_number
+
+    async def send(
+        self, recipient: str, content: str, subject: str | None = None
+    ) -> DeliveryResult:
+        if not (self._api_key and self._from_number):
+            logger.info("[WHATSAPP_DISABLED] Would send WhatsApp to %s", recipient)
+            return DeliveryResult(ok=False, error="not configured")
+        try:
+            response = await self._http.post(
+                self._api_url,
+                json={"to": recipient, "type": "text", "text": {"body": content}},
+                headers={"D360-API-KEY": self._api_key, "Content-Type": "application/json"},
+                timeout=WHATSAPP_PROVIDER_TIMEOUT_SECONDS,
+            )
+        except httpx.RequestError as exc:
+            return DeliveryResult(ok=False, error=f"WhatsApp error: {exc}", retryable=True)
+        if response.status_code not in (200, 201):
+            return DeliveryResult(
+                ok=False,
+                error=f"Unexpected WhatsApp status: {response.status_code}",
+                retryable=_is_retryable_status(response.status_code),
+            )
+        return DeliveryResult(ok=True)
+
+
+class FakeNotificationProvider:
+    """
+    In-memory provider with the async channel interface, for tests and local runs.
+
+    Records every accepted message in `sent`, and the size of each
+    `send_batch` call in `batches`. `outcomes` scripts the results of
+    successive calls (then every call succeeds); `delay` simulates provider
+    latency so concurrency limits can be observed through `max_in_flight`.
+    """
+
+    def __init__(
+        self, outcomes: Iterable[DeliveryResult] = (), *, delay: float = 0.0
+    ) -> None:
+        self._outcomes = list(outcomes)
+        self._delay = delay
+        self.sent: list[dict[str, str | None]] = []
+        self.batches: list[int] = []
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def send(
+        self, recipient: str, content: str, subject: str | None = None
+    ) -> DeliveryResult:
+        result = await self._call()
+        if result.ok:
+            self.sent.append({"recipient": recipient, "subject": subject, "content": content})
+        return result
+
+    async def send_batch(self, messages: list[OutgoingMessage]) -> list[DeliveryResult]:
+        self.batches.append(len(messages))
+        result = await self._call()
+        if result.ok:
+            self.sent.extend(
+                {"recipient": m.recipient, "subject": m.subject, "content": m.content}
+                for m in messages
+            )
+        return [result] * len(messages)
+
+    async def _call(self) -> DeliveryResult:
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self._delay:
+                await asyncio.sleep(self._delay)
+            return self._outcomes.pop(0) if self._outcomes else DeliveryResult(ok=True)
+        finally:
+            self.in_flight -= 1
+
 
 # ─── Helpers ──────────────────────────────────────────────────────────────────
 
 
+def _brevo_payload(
+    from_address: str,
+    from_name: str,
+    recipient: str,
+    subject: str,
+    text_content: str,
+    html_content: str,
+) -> dict[str, Any]:
+    return {
+        "sender": {"email": from_address, "name": from_name or "CRM"},
+        "to": [{"email": recipient}],
+        "subject": subject,
+        "textContent": text_content,
+        "htmlContent": html_content,
+    }
+
+
+def _brevo_config_error(api_key: str, from_address: str) -> str | None:
+    if not api_key:
+        return "BREVO_API_KEY is not configured"
+    if not from_address:
+        return "EMAIL_FROM_ADDRESS is not configured"
+    return None
+
+
+def _brevo_rejection(response: httpx.Response) -> str:
+    body = response.text[:MAX_PROVIDER_ERROR_BODY_LENGTH]
+    return f"Brevo rejected email: status={response.status_code} body={body}"
+
+
+def _is_retryable_status(status_code: int) -> bool:
+    return status_code == 429 or status_code >= 500
+
+
 def _to_html(text: str) -> str:
     """Convert plain-text content to minimal HTML email body (XSS-safe)."""
     lines = text.splitlines()
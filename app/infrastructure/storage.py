@@ -1,11 +1,159 @@
+import hashlib
 import os
+import shutil
+import tempfile
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
 from typing import BinaryIO
+from urllib.parse import quote
 
 from app.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Read size when copying an upload to storage.
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+DEFAULT_MULTIPART_BYTES = 8 * 1024 * 1024
+
+
+class UploadTooLargeError(ValueError):
+    """An upload stream went past its `HashingReader.max_bytes`."""
+
+
+class HashingReader:
+    """
+    Read-through wrapper over an upload stream.
+
+    Tracks the size and SHA-256 of everything read and raises
+    `UploadTooLargeError` once more than `max_bytes` has been read. Providers
+    copy it to storage in chunks, so an upload is validated and hashed while
+    it streams and is never held in memory whole.
+    """
+
+    def __init__(self, raw: BinaryIO, *, max_bytes: int | None = None) -> None:
+        self._raw = raw
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._hash = hashlib.sha256()
+
+    @property
+    def sha256(self) -> str:
+        return self._hash.hexdigest()
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int | None = -1) -> bytes:
+        if size is None or size < 0:
+            return b"".join(iter(lambda: self.read(UPLOAD_CHUNK_BYTES), b""))
+        chunk = self._raw.read(size)
+        self.size += len(chunk)
+        if self.max_bytes is not None and self.size > self.max_bytes:
+            raise UploadTooLargeError(f"upload exceeds {self.max_bytes} bytes")
+        self._hash.update(chunk)
+        return chunk
+
+    def finish(self) -> None:
+        """Read whatever the provider left unread, so `size` and `sha256` cover the stream."""
+        while self.read(UPLOAD_CHUNK_BYTES):
+            pass
+
+
+def remaining_size(file_data: BinaryIO) -> int | None:
+    """Bytes left in a seekable stream, without reading it; None when not seekable."""
+    try:
+        position = file_data.tell()
+        end = file_data.seek(0, os.SEEK_END)
+        file_data.seek(position)
+    except (AttributeError, OSError, ValueError):
+        return None
+    return end - position
+
+
+@dataclass(frozen=True)
+class PresignedDownload:
+    """A stored file to sign a download URL for, with the name and type it is saved as.
+
+    Content-addressed keys carry no filename or extension, so without
+    `filename` the browser saves the file under its hash.
+    """
+
+    key: str
+    filename: str | None = None
+    content_type: str | None = None
+
+
+# (bucket, download, expires_in)
+CacheKey = tuple[str, PresignedDownload, int]
+
+
+def attachment_disposition(filename: str) -> str:
+    """Content-Disposition for downloading as `filename` (RFC 6266, any script)."""
+    return f"attachment; filename*=UTF-8''{quote(filename, safe='')}"
+
+
+class PresignedUrlCache:
+    """
+    In-process LRU cache of presigned URLs keyed by (bucket, download, expires_in).
+
+    The download's filename and content type are signed into the URL, so two
+    documents sharing one stored file get separate entries.
+
+    A URL is handed out again until `margin_seconds` before it expires, so a
+    cached URL always has at least that long left. Signing is local CPU work,
+    but document lists sign one URL per row on every view.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        margin_seconds: float = 60,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.margin_seconds = margin_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[CacheKey, tuple[str, float]] = OrderedDict()
+
+    def get(self, cache_key: CacheKey) -> str | None:
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                return None
+            url, reusable_until = entry
+            if self._clock() >= reusable_until:
+                del self._entries[cache_key]
+                return None
+            self._entries.move_to_end(cache_key)
+            return url
+
+    def put(self, cache_key: CacheKey, url: str) -> None:
+        expires_in = cache_key[2]
+        if expires_in <= self.margin_seconds:
+            return
+        with self._lock:
+            self._entries[cache_key] = (url, self._clock() + expires_in - self.margin_seconds)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared by every S3StorageProvider built by get_storage_provider().
+presigned_url_cache = PresignedUrlCache(max_entries=10_000)
+
 
 class StorageProvider(ABC):
     """Abstract storage provider for S3/GCS compatible storage."""
@@ -15,6 +163,8 @@ class StorageProvider(ABC):
         """
         Upload file to storage.
 
+        Providers read `file_data` in chunks and never load it whole.
+
         Args:
             key: Storage key/path
             file_data: File binary data
@@ -24,6 +174,18 @@ class StorageProvider(ABC):
             Storage key for retrieval
         """
 
+    @abstractmethod
+    def open(self, key: str) -> BinaryIO:
+        """
+        Open a stored file for chunked reading; the caller closes it.
+
+        Args:
+            key: Storage key/path
+
+        Raises:
+            FileNotFoundError: nothing is stored under `key`
+        """
+
     @abstractmethod
     def delete(self, key: str) -> None:
         """
@@ -34,18 +196,50 @@ class StorageProvider(ABC):
         """
 
     @abstractmethod
-    def get_presigned_url(self, key: str, expires_in: int = 3600) -> str:
+    def get_presigned_url(
+        self,
+        key: str,
+        expires_in: int = 3600,
+        *,
+        filename: str | None = None,
+        content_type: str | None = None,
+    ) -> str:
         """
         Generate a presigned URL for downloading a file.
 
         Args:
             key: Storage key/path
             expires_in: URL expiry in seconds (default: 1 hour)
+            filename: Name the browser saves the file as
+            content_type: MIME type the download is served with
 
         Returns:
             Presigned URL string
         """
 
+    def get_presigned_urls(
+        self, downloads: Iterable[PresignedDownload], expires_in: int = 3600
+    ) -> dict[PresignedDownload, str]:
+        """
+        Generate presigned download URLs for many files at once.
+
+        Args:
+            downloads: Files to sign (duplicates are signed once)
+            expires_in: URL expiry in seconds (default: 1 hour)
+
+        Returns:
+            Presigned URL per download
+        """
+        return {
+            download: self.get_presigned_url(
+                download.key,
+                expires_in,
+                filename=download.filename,
+                content_type=download.content_type,
+            )
+            for download in dict.fromkeys(downloads)
+        }
+
 
 class LocalStorageProvider(StorageProvider):
     """Local filesystem storage provider for development/testing."""
@@ -65,18 +259,29 @@ class LocalStorageProvider(StorageProvider):
         return resolved
 
     def upload(self, key: str, file_data: BinaryIO, content_type: str) -> str:
-        """Upload file to local storage."""
+        """Upload file to local storage, copied in chunks through a temp file."""
         file_path = self._safe_path(key)
         parent = os.path.dirname(file_path)
         if parent:
             os.makedirs(parent, exist_ok=True)
 
-        with open(file_path, "wb") as f:
-            f.write(file_data.read())
+        # A failed or rejected copy never leaves a partial file under `key`.
+        fd, tmp_path = tempfile.mkstemp(dir=parent, prefix=".upload-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                shutil.copyfileobj(file_data, f, UPLOAD_CHUNK_BYTES)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
 
         logger.info("[LocalStorage] Uploaded: %s", key)
         return key
 
+    def open(self, key: str) -> BinaryIO:
+        """Open a file in local storage."""
+        return open(self._safe_path(key), "rb")
+
     def delete(self, key: str) -> None:
         """Delete file from local storage."""
         file_path = self._safe_path(key)
@@ -86,8 +291,15 @@ class LocalStorageProvider(StorageProvider):
         else:
             logger.warning("[LocalStorage] Delete — file not found: %s", key)
 
-    def get_presigned_url(self, key: str, expires_in: int = 3600) -> str:
-        """Return local file path as URL (dev only)."""
+    def get_presigned_url(
+        self,
+        key: str,
+        expires_in: int = 3600,
+        *,
+        filename: str | None = None,
+        content_type: str | None = None,
+    ) -> str:
+        """Return local file path as URL (dev only; the filename is not applied)."""
         return f"/local-storage/{key}"
 
 
@@ -104,6 +316,10 @@ class S3StorageProvider(StorageProvider):
         endpoint_url       — For R2: https://<account-id>.r2.cloudflarestorage.com
                              For AWS S3: leave as None
         region             — AWS region (default: auto, R2 ignores this)
+
+    Uploads larger than `multipart_threshold` go up as a multipart upload in
+    `multipart_chunksize` parts, read from the stream one part at a time.
+    Presigned URLs are reused from `url_cache` when one is given.
     """
 
     def __init__(
@@ -114,9 +330,14 @@ class S3StorageProvider(StorageProvider):
         bucket_name: str,
         endpoint_url: str | None = None,
         region: str,
+        multipart_threshold: int = DEFAULT_MULTIPART_BYTES,
+        multipart_chunksize: int = DEFAULT_MULTIPART_BYTES,
+        multipart_concurrency: int = 4,
+        url_cache: PresignedUrlCache | None = None,
     ) -> None:
         try:
             import boto3
+            from boto3.s3.transfer import TransferConfig
             from botocore.config import Config
         except ImportError as exc:
             raise RuntimeError(
@@ -125,6 +346,12 @@ class S3StorageProvider(StorageProvider):
 
         self._bucket = bucket_name
         self._endpoint_url = endpoint_url
+        self._url_cache = url_cache
+        self._transfer_config = TransferConfig(
+            multipart_threshold=multipart_threshold,
+            multipart_chunksize=multipart_chunksize,
+            max_concurrency=multipart_concurrency,
+        )
 
         self._client = boto3.client(
             "s3",
@@ -146,43 +373,88 @@ class S3StorageProvider(StorageProvider):
         )
 
     def upload(self, key: str, file_data: BinaryIO, content_type: str) -> str:
-        """Upload file to S3/R2."""
+        """Upload file to S3/R2; a failed multipart upload is aborted by boto3."""
         self._client.upload_fileobj(
             file_data,
             self._bucket,
             key,
             ExtraArgs={"ContentType": content_type},
+            Config=self._transfer_config,
         )
         logger.info("[S3Storage] Uploaded: %s → bucket=%s", key, self._bucket)
         return key
 
+    def open(self, key: str) -> BinaryIO:
+        """Stream an object from S3/R2."""
+        try:
+            response = self._client.get_object(Bucket=self._bucket, Key=key)
+        except self._client.exceptions.NoSuchKey as exc:
+            raise FileNotFoundError(key) from exc
+        return response["Body"]
+
     def delete(self, key: str) -> None:
         """Delete file from S3/R2."""
         self._client.delete_object(Bucket=self._bucket, Key=key)
         logger.info("[S3Storage] Deleted: %s", key)
 
-    def get_presigned_url(self, key: str, expires_in: int = 3600) -> str:
+    def get_presigned_url(
+        self,
+        key: str,
+        expires_in: int = 3600,
+        *,
+        filename: str | None = None,
+        content_type: str | None = None,
+    ) -> str:
         """
         Generate a presigned URL for secure file download.
 
         Args:
             key: Storage key/path
             expires_in: Expiry in seconds (default: 1 hour)
+            filename: Sent back as the download's Content-Disposition
+            content_type: Sent back as the download's Content-Type
 
         Returns:
-            Presigned URL valid for `expires_in` seconds
+            Presigned URL valid for `expires_in` seconds (at least the cache
+            margin when it comes from the cache)
         """
-        url = self._client.generate_presigned_url(
-            "get_object",
-            Params={"Bucket": self._bucket, "Key": key},
-            ExpiresIn=expires_in,
-        )
-        logger.info(
-            "[S3Storage] Presigned URL generated for: %s (expires_in=%ds)",
-            key,
+        download = PresignedDownload(key, filename, content_type)
+        return self.get_presigned_urls([download], expires_in=expires_in)[download]
+
+    def get_presigned_urls(
+        self, downloads: Iterable[PresignedDownload], expires_in: int = 3600
+    ) -> dict[PresignedDownload, str]:
+        """Presigned URLs for many downloads, signing only those not in the cache."""
+        urls: dict[PresignedDownload, str] = {}
+        signed = 0
+        for download in dict.fromkeys(downloads):
+            cache_key = (self._bucket, download, expires_in)
+            url = self._url_cache.get(cache_key) if self._url_cache is not None else None
+            if url is None:
+                url = self._client.generate_presigned_url(
+                    "get_object",
+                    Params=self._download_params(download),
+                    ExpiresIn=expires_in,
+                )
+                signed += 1
+                if self._url_cache is not None:
+                    self._url_cache.put(cache_key, url)
+            urls[download] = url
+        logger.debug(
+            "[S3Storage] Presigned URLs: %d signed, %d cached (expires_in=%ds)",
+            signed,
+            len(urls) - signed,
             expires_in,
         )
-        return url
+        return urls
+
+    def _download_params(self, download: PresignedDownload) -> dict[str, str]:
+        params = {"Bucket": self._bucket, "Key": download.key}
+        if download.filename:
+            params["ResponseContentDisposition"] = attachment_disposition(download.filename)
+        if download.content_type:
+            params["ResponseContentType"] = download.content_type
+        return params
 
 
 def get_storage_provider() -> StorageProvider:
@@ -221,4 +493,8 @@ def get_storage_provider() -> StorageProvider:
         bucket_name=settings.R2_BUCKET_NAME,
         endpoint_url=settings.R2_ENDPOINT_URL,
         region=settings.R2_REGION,
+        multipart_threshold=settings.S3_MULTIPART_THRESHOLD_BYTES,
+        multipart_chunksize=settings.S3_MULTIPART_CHUNK_BYTES,
+        multipart_concurrency=settings.S3_MULTIPART_CONCURRENCY,
+        url_cache=presigned_url_cache,
     )
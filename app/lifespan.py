@@ -3,12 +3,17 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from app.config import settings
 from app.core.background_jobs import (
-    daily_expiry_job,
+    client_import_worker_job,
+    export_worker_job,
+    job_runner_job,
+    notification_outbox_job,
     run_development_tax_calendar_bootstrap,
-    run_startup_expiry,
 )
 from app.core.logging_config import get_logger
+from app.database import dispose_async_engines
+from app.infrastructure.http_clients import http_clients
 
 logger = get_logger(__name__)
 
@@ -17,8 +22,21 @@ logger = get_logger(__name__)
 async def lifespan(app: FastAPI):
     logger.info("Application starting")
     run_development_tax_calendar_bootstrap()
-    run_startup_expiry()
-    expiry_task = asyncio.create_task(daily_expiry_job())
+    http_clients.open()
+    tasks = []
+    if settings.JOB_RUNNER_ENABLED:
+        tasks.append(asyncio.create_task(job_runner_job()))
+    if settings.NOTIFICATION_OUTBOX_WORKER_ENABLED:
+        tasks.append(asyncio.create_task(notification_outbox_job()))
+    if settings.EXPORT_WORKER_ENABLED:
+        tasks.append(asyncio.create_task(export_worker_job()))
+    if settings.CLIENT_IMPORT_WORKER_ENABLED:
+        tasks.append(asyncio.create_task(client_import_worker_job()))
     yield
-    expiry_task.cancel()
+    for task in tasks:
+        task.cancel()
+    # Let the workers unwind before the provider pools they use are closed.
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await http_clients.aclose()
+    await dispose_async_engines()
     logger.info("Application shutting down")
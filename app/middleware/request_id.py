@@ -13,17 +13,16 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
 
-from app.config import settings
 from app.core.logging_config import (
     begin_request_log_stats,
     clear_request_log_stats,
     get_logger,
     has_request_db_activity,
-    log_request_summary,
     reset_request_id,
     set_request_id,
     set_request_summary_context,
 )
+from app.core.perf import endpoint_route_name, finish_request
 
 logger = get_logger(__name__)
 
@@ -41,20 +40,6 @@ _SKIP_LOG_PATHS = frozenset(
 )
 
 
-def _route_name(request: Request) -> str | None:
-    endpoint = request.scope.get("endpoint")
-    if endpoint is None:
-        return None
-    module = getattr(endpoint, "__module__", "")
-    name = getattr(endpoint, "__name__", None)
-    if not name:
-        return None
-    parts = module.split(".")
-    if len(parts) >= 2 and parts[0] == "app":
-        return f"{parts[1]}.{name}"
-    return name
-
-
 def _content_length(response: Response | None) -> int | None:
     if response is None:
         return None
@@ -97,7 +82,7 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
                     path=request.url.path,
                     status_code=status_code,
                     duration_ms=duration_ms,
-                    route=_route_name(request),
+                    route=endpoint_route_name(request.scope.get("endpoint")),
                     response_content_length=_content_length(response),
                     client_ip=request.client.host if request.client else None,
                     user_agent=request.headers.get("user-agent"),
@@ -105,14 +90,7 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
                 )
 
                 if not has_request_db_activity():
-                    log_request_summary(
-                        logger,
-                        service="binder-billing-crm",
-                        env=settings.APP_ENV,
-                        slow_request_ms=settings.LOG_SLOW_REQUEST_MS,
-                        slow_query_ms=settings.LOG_SLOW_QUERY_MS,
-                        high_query_count=settings.LOG_HIGH_QUERY_COUNT,
-                    )
+                    finish_request(logger)
                     clear_request_log_stats()
                     reset_request_id(request_id_token)
             else:
@@ -21,17 +21,26 @@ import app.binders.models.binder_intake_material  # noqa: F401
 import app.binders.models.binder_lifecycle_log  # noqa: F401
 import app.businesses.models.business  # noqa: F401
 import app.charge.models.charge  # noqa: F401
+import app.clients.models.client_import_job  # noqa: F401
 import app.clients.models.client_record  # noqa: F401
 import app.clients.models.legal_entity  # noqa: F401
 import app.clients.models.person  # noqa: F401
 import app.clients.models.person_legal_entity_link  # noqa: F401
 import app.correspondence.models.correspondence  # noqa: F401
+import app.dashboard.models.dashboard_snapshot  # noqa: F401
+import app.exports.models.export_job  # noqa: F401
+import app.infrastructure.http_cache.model  # noqa: F401
 import app.infrastructure.idempotency.model  # noqa: F401
+import app.infrastructure.jobs.model  # noqa: F401
 import app.invoice.models.invoice  # noqa: F401
 import app.notes.models.entity_note  # noqa: F401
 import app.notification.models.notification  # noqa: F401
+import app.notification.models.notification_campaign  # noqa: F401
+import app.notification.models.notification_outbox  # noqa: F401
+import app.permanent_documents.models.document_blob  # noqa: F401
 import app.permanent_documents.models.permanent_document  # noqa: F401
 import app.reminders.models.reminder  # noqa: F401
+import app.search.models.search_document  # noqa: F401
 import app.signature_requests.models.signature_request  # noqa: F401
 import app.tasks.models.task  # noqa: F401
 import app.tax_calendar.models.deadline_rule  # noqa: F401
@@ -39,6 +48,8 @@ import app.tax_calendar.models.tax_calendar_entry  # noqa: F401
 import app.users.models.password_reset_token  # noqa: F401
 import app.users.models.user  # noqa: F401
 import app.users.models.user_audit_log  # noqa: F401
+import app.vat_reports.models.client_year_vat_totals  # noqa: F401
 import app.vat_reports.models.vat_audit_log  # noqa: F401
 import app.vat_reports.models.vat_invoice  # noqa: F401
 import app.vat_reports.models.vat_work_item  # noqa: F401
+import app.work_queue.models.work_queue_item  # noqa: F401
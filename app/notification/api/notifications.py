@@ -10,7 +10,10 @@ from app.notification.models.notification import (
     NotificationStatus,
     NotificationTrigger,
 )
+from app.infrastructure.idempotency import IdempotencyGuard, require_idempotency_key
 from app.notification.schemas.notification_schemas import (
+    NotificationCampaignRequest,
+    NotificationCampaignResponse,
     NotificationListResponse,
     NotificationPreviewRequest,
     NotificationPreviewResponse,
@@ -19,6 +22,7 @@ from app.notification.schemas.notification_schemas import (
     NotificationSummaryResponse,
 )
 from app.core.exceptions import AppError
+from app.notification.services.notification_campaign_service import NotificationCampaignService
 from app.notification.services.notification_service import NotificationService
 from app.users.api.deps import CurrentUser, DBSession, require_role
 from app.users.models.user import UserRole
@@ -135,3 +139,27 @@ def send_notification(
         ) from exc
     svc = NotificationService(db)
     return svc.send(body, triggered_by=user.id, idempotency_key=idempotency_key)
+
+
+@router.post(
+    "/campaigns",
+    response_model=NotificationCampaignResponse,
+    dependencies=[Depends(require_role(UserRole.ADVISOR))],
+)
+def create_notification_campaign(
+    body: NotificationCampaignRequest,
+    db: DBSession,
+    user: CurrentUser,
+    idem: IdempotencyGuard = Depends(require_idempotency_key),
+):
+    """Queue one trigger for every matching target; see `NotificationCampaignRequest`."""
+    return idem.execute(
+        payload=body.model_dump_json().encode(),
+        fn=lambda: NotificationCampaignService(db).create(body, triggered_by=user.id),
+    )
+
+
+@router.get("/campaigns/{campaign_id}", response_model=NotificationCampaignResponse)
+def get_notification_campaign(campaign_id: int, db: DBSession):
+    """Campaign progress and per-recipient results."""
+    return NotificationCampaignService(db).get(campaign_id)
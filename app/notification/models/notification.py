@@ -106,6 +106,9 @@ class Notification(Base):
     signature_request_id: Mapped[int | None] = mapped_column(
         ForeignKey("signature_requests.id"), nullable=True, index=True
     )
+    campaign_id: Mapped[int | None] = mapped_column(
+        ForeignKey("notification_campaigns.id"), nullable=True
+    )
     # Generic domain anchor (charge_id, vat_work_item_id, etc.)
     entity_type: Mapped[str | None] = mapped_column(String, nullable=True)
     entity_id: Mapped[int | None] = mapped_column(nullable=True)
@@ -153,6 +156,7 @@ class Notification(Base):
         Index("idx_notification_triggered_by", "triggered_by"),
         Index("idx_notification_idempotency", "idempotency_key"),
         Index("idx_notification_signature_request", "signature_request_id"),
+        Index("idx_notification_campaign_status", "campaign_id", "status"),
     )
 
     def __repr__(self) -> str:
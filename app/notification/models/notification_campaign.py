@@ -0,0 +1,36 @@
+"""Notification campaign — one trigger sent to every client matched by a selector.
+
+A campaign evaluates policy for all its targets at once. It stores a
+`Notification` (PENDING or SKIPPED) plus an outbox row for each target that
+passed, all tagged with `campaign_id`. Blocked targets get no notification, per
+the policy contract; their reasons are kept in `blocked_results`.
+Progress is read from the status of the campaign's notifications. The outbox
+worker sends campaign messages through the provider's batch endpoint.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import JSON, ForeignKey, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.utils.time_utils import utcnow
+
+
+class NotificationCampaign(Base):
+    __tablename__ = "notification_campaigns"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    trigger: Mapped[str] = mapped_column(String(50), nullable=False)
+    channel: Mapped[str] = mapped_column(String(20), nullable=False)
+    # The request's selector, as sent.
+    selector: Mapped[dict] = mapped_column(JSON, nullable=False)
+    total_targets: Mapped[int] = mapped_column(nullable=False, default=0)
+    # [{"client_record_id", "entity_id", "reason"}] for targets policy blocked.
+    blocked_results: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
+    triggered_by: Mapped[int | None] = mapped_column(ForeignKey("users.id"), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(default=utcnow, nullable=False)
+
+    __table_args__ = (Index("idx_notification_campaigns_created_at", "created_at"),)
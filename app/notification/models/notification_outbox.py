@@ -0,0 +1,54 @@
+"""Notification outbox — delivery work queued in the business transaction.
+
+The send services write a `Notification` (status PENDING) and its outbox row in
+the same transaction as the change that triggered it, and return immediately.
+`NotificationOutboxWorker` claims due rows, delivers them outside any request
+and writes the outcome back to the notification:
+
+- delivered → notification SENT, outbox row deleted
+- retryable failure → attempts + 1, next_attempt_at pushed out (exponential
+  backoff with jitter), notification retry_count / error_message updated
+- permanent failure or attempts exhausted → outbox row DEAD_LETTER,
+  notification FAILED
+
+`locked_until` is the claim lease: a worker that dies mid-batch leaves its rows
+to be picked up again once the lease expires (delivery is at-least-once).
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum as PyEnum
+
+from sqlalchemy import ForeignKey, Index, SmallInteger, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.utils.time_utils import utcnow
+
+
+class NotificationOutboxStatus(str, PyEnum):
+    PENDING = "pending"
+    DEAD_LETTER = "dead_letter"
+
+
+class NotificationOutbox(Base):
+    __tablename__ = "notification_outbox"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    notification_id: Mapped[int] = mapped_column(
+        ForeignKey("notifications.id"), nullable=False, unique=True
+    )
+    # Copied from the notification so claims can be balanced per channel without a join.
+    channel: Mapped[str] = mapped_column(String(20), nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, default=NotificationOutboxStatus.PENDING.value
+    )
+    attempts: Mapped[int] = mapped_column(SmallInteger, nullable=False, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(nullable=False, default=utcnow)
+    locked_until: Mapped[datetime | None] = mapped_column(nullable=True)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(default=utcnow, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(default=utcnow, onupdate=utcnow, nullable=False)
+
+    __table_args__ = (Index("idx_notification_outbox_due", "status", "next_attempt_at"),)
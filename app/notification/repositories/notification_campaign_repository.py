@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.notification.models.notification import (
+    Notification,
+    NotificationChannel,
+    NotificationTrigger,
+)
+from app.notification.models.notification_campaign import NotificationCampaign
+
+
+class NotificationCampaignRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def create(
+        self,
+        *,
+        trigger: NotificationTrigger,
+        channel: NotificationChannel,
+        selector: dict,
+        triggered_by: int | None,
+    ) -> NotificationCampaign:
+        campaign = NotificationCampaign(
+            trigger=trigger.value,
+            channel=channel.value,
+            selector=selector,
+            total_targets=0,
+            blocked_results=[],
+            triggered_by=triggered_by,
+        )
+        self.db.add(campaign)
+        self.db.flush()
+        return campaign
+
+    def get_by_id(self, campaign_id: int) -> NotificationCampaign | None:
+        return self.db.get(NotificationCampaign, campaign_id)
+
+    def list_results(self, campaign_id: int) -> list:
+        """(id, client_record_id, entity_id, status, error_message) per notification."""
+        return list(
+            self.db.execute(
+                select(
+                    Notification.id,
+                    Notification.client_record_id,
+                    Notification.entity_id,
+                    Notification.status,
+                    Notification.error_message,
+                )
+                .where(Notification.campaign_id == campaign_id)
+                .order_by(Notification.id)
+            ).all()
+        )
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import delete, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.notification.models.notification import (
+    Notification,
+    NotificationChannel,
+    NotificationStatus,
+)
+from app.notification.models.notification_outbox import (
+    NotificationOutbox,
+    NotificationOutboxStatus,
+)
+from app.utils.time_utils import utcnow
+
+
+@dataclass(frozen=True, slots=True)
+class OutboxMessage:
+    """A claimed delivery, detached from the session that claimed it."""
+
+    outbox_id: int
+    notification_id: int
+    channel: NotificationChannel
+    recipient: str
+    subject: str | None
+    body: str
+    attempts: int
+    campaign_id: int | None = None
+
+
+class NotificationOutboxRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def enqueue(self, notification: Notification) -> NotificationOutbox:
+        entry = NotificationOutbox(
+            notification_id=notification.id,
+            channel=notification.channel.value,
+            status=NotificationOutboxStatus.PENDING.value,
+        )
+        self.db.add(entry)
+        self.db.flush()
+        return entry
+
+    def enqueue_many(self, notifications: list[Notification]) -> None:
+        self.db.add_all(
+            [
+                NotificationOutbox(
+                    notification_id=notification.id,
+                    channel=notification.channel.value,
+                    status=NotificationOutboxStatus.PENDING.value,
+                )
+                for notification in notifications
+            ]
+        )
+        self.db.flush()
+
+    def claim_due(self, *, limit: int, lease_until: datetime) -> list[OutboxMessage]:
+        """Lease up to `limit` due rows; concurrent workers skip each other's rows."""
+        now = utcnow()
+        ids = list(
+            self.db.scalars(
+                select(NotificationOutbox.id)
+                .where(
+                    NotificationOutbox.status == NotificationOutboxStatus.PENDING.value,
+                    NotificationOutbox.next_attempt_at <= now,
+                    or_(
+                        NotificationOutbox.locked_until.is_(None),
+                        NotificationOutbox.locked_until <= now,
+                    ),
+                )
+                .order_by(NotificationOutbox.next_attempt_at, NotificationOutbox.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+        )
+        if not ids:
+            return []
+        self.db.execute(
+            update(NotificationOutbox)
+            .where(NotificationOutbox.id.in_(ids))
+            .values(locked_until=lease_until, updated_at=now)
+        )
+        rows = self.db.execute(
+            select(
+                NotificationOutbox.id,
+                NotificationOutbox.notification_id,
+                NotificationOutbox.attempts,
+                Notification.channel,
+                Notification.recipient,
+                Notification.subject_snapshot,
+                Notification.content_snapshot,
+                Notification.campaign_id,
+            )
+            .join(Notification, Notification.id == NotificationOutbox.notification_id)
+            .where(NotificationOutbox.id.in_(ids))
+            .order_by(NotificationOutbox.next_attempt_at, NotificationOutbox.id)
+        ).all()
+        return [
+            OutboxMessage(
+                outbox_id=row.id,
+                notification_id=row.notification_id,
+                channel=row.channel,
+                recipient=row.recipient,
+                subject=row.subject_snapshot,
+                body=row.content_snapshot,
+                attempts=row.attempts,
+                campaign_id=row.campaign_id,
+            )
+            for row in rows
+        ]
+
+    def mark_delivered(self, message: OutboxMessage) -> None:
+        self.db.execute(
+            update(Notification)
+            .where(Notification.id == message.notification_id)
+            .values(
+                status=NotificationStatus.SENT,
+                sent_at=utcnow(),
+                error_message=None,
+                retry_count=message.attempts,
+            )
+        )
+        self.db.execute(delete(NotificationOutbox).where(NotificationOutbox.id == message.outbox_id))
+
+    def schedule_retry(self, message: OutboxMessage, error: str, next_attempt_at: datetime) -> None:
+        attempts = message.attempts + 1
+        self.db.execute(
+            update(NotificationOutbox)
+            .where(NotificationOutbox.id == message.outbox_id)
+            .values(
+                attempts=attempts,
+                next_attempt_at=next_attempt_at,
+                locked_until=None,
+                last_error=error,
+                updated_at=utcnow(),
+            )
+        )
+        self.db.execute(
+            update(Notification)
+            .where(Notification.id == message.notification_id)
+            .values(retry_count=attempts, error_message=error)
+        )
+
+    def dead_letter(self, message: OutboxMessage, error: str) -> None:
+        now = utcnow()
+        self.db.execute(
+            update(NotificationOutbox)
+            .where(NotificationOutbox.id == message.outbox_id)
+            .values(
+                status=NotificationOutboxStatus.DEAD_LETTER.value,
+                attempts=message.attempts + 1,
+                locked_until=None,
+                last_error=error,
+                updated_at=now,
+            )
+        )
+        self.db.execute(
+            update(Notification)
+            .where(Notification.id == message.notification_id)
+            .values(
+                status=NotificationStatus.FAILED,
+                failed_at=now,
+                error_message=error,
+                retry_count=message.attempts,
+            )
+        )
+
+    def get_by_notification_id(self, notification_id: int) -> NotificationOutbox | None:
+        return self.db.scalars(
+            select(NotificationOutbox).where(NotificationOutbox.notification_id == notification_id)
+        ).first()
+
+    def count_by_status(self) -> dict[str, int]:
+        rows = self.db.execute(
+            select(NotificationOutbox.status, func.count(NotificationOutbox.id)).group_by(
+                NotificationOutbox.status
+            )
+        ).all()
+        return {status: count for status, count in rows}
@@ -60,6 +60,13 @@ class NotificationRepository(BaseRepository[Notification]):
         self.db.flush()
         return notification
 
+    def create_many(self, rows: list[dict]) -> list[Notification]:
+        """Insert many notifications (keyword arguments as for `create`) in one flush."""
+        notifications = [Notification(**row) for row in rows]
+        self.db.add_all(notifications)
+        self.db.flush()
+        return notifications
+
     def mark_sent(self, notification_id: int) -> Notification | None:
         notification = self.get_by_id(notification_id)
         if not notification:
@@ -270,3 +277,32 @@ class NotificationRepository(BaseRepository[Notification]):
             .where(ranked.c.rn == 1)
         ).all()
         return {row.annual_report_id: row for row in rows if row.annual_report_id is not None}
+
+    def latest_by_entity_ids(
+        self, entity_ids: list[int], trigger: NotificationTrigger
+    ) -> dict[int, Notification]:
+        """Set-based `get_last_for_entity_trigger`."""
+        if not entity_ids:
+            return {}
+        ranked = (
+            select(
+                Notification.id.label("id"),
+                func.row_number()
+                .over(
+                    partition_by=Notification.entity_id,
+                    order_by=(Notification.created_at.desc(), Notification.id.desc()),
+                )
+                .label("rn"),
+            )
+            .where(
+                Notification.entity_id.in_(entity_ids),
+                Notification.trigger == trigger,
+            )
+            .subquery()
+        )
+        rows = self.db.scalars(
+            select(Notification)
+            .join(ranked, ranked.c.id == Notification.id)
+            .where(ranked.c.rn == 1)
+        ).all()
+        return {row.entity_id: row for row in rows if row.entity_id is not None}
@@ -44,12 +44,18 @@ class NotificationSendRequest(BaseModel):
 # ── Result schemas ────────────────────────────────────────────────────────────
 
 class NotificationResult(BaseModel):
-    status: Literal["sent", "failed", "skipped", "blocked"]
+    # queued: stored and handed to the outbox worker; the notification row carries the outcome.
+    status: Literal["queued", "sent", "failed", "skipped", "blocked"]
     notification_id: int | None = None
     reason: str | None = None
     warnings: list[str] = Field(default_factory=list)
 
 
+def result_status(status: NotificationStatus) -> str:
+    """Result status for an already-stored notification (PENDING is still queued)."""
+    return "queued" if status == NotificationStatus.PENDING else status.value
+
+
 class NotificationPreviewResponse(BaseModel):
     can_send: bool
     status: Literal["ready", "blocked"]
@@ -111,7 +117,7 @@ class NotificationListResponse(BaseModel):
 class BulkNotificationResultItem(BaseModel):
     entity_id: int | None = None
     client_record_id: int | None = None
-    status: Literal["sent", "failed", "skipped", "blocked"]
+    status: Literal["queued", "sent", "failed", "skipped", "blocked"]
     notification_id: int | None = None
     reason: str | None = None
     warnings: list[str] = Field(default_factory=list)
@@ -124,3 +130,37 @@ class BulkNotificationResult(BaseModel):
     skipped: int
     blocked: int
     results: list[BulkNotificationResultItem] = Field(default_factory=list)
+
+
+# ── Campaigns ─────────────────────────────────────────────────────────────────
+
+class NotificationCampaignRequest(BaseModel):
+    """One trigger for every matching target.
+
+    Targets per trigger:
+    - vat_documents_reminder: open VAT work items of `period` (required)
+    - payment_reminder: issued charges
+    - annual_report_client_reminder: annual reports pending client approval,
+      of `tax_year` when given
+    `client_record_ids` narrows any of them to the listed clients. Targets a
+    single send would only warn about (a recent duplicate reminder) are
+    blocked unless `confirm_recent_duplicate` is set.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    trigger: NotificationTrigger
+    period: str | None = Field(None, pattern=r"^\d{4}-\d{2}$")
+    tax_year: int | None = Field(None, ge=2000, le=2100)
+    client_record_ids: list[int] | None = Field(None, min_length=1)
+    confirm_recent_duplicate: bool = False
+
+
+class NotificationCampaignResponse(BulkNotificationResult):
+    id: int
+    trigger: NotificationTrigger
+    channel: NotificationChannel
+    queued: int
+    # True once every queued message has been delivered, failed or dead-lettered.
+    completed: bool
+    created_at: ApiDateTime
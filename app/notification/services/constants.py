@@ -1,4 +1,4 @@
-BULK_NOTIFY_LIMIT = 500
+BULK_NOTIFY_LIMIT = 2000
 HANDOVER_REMINDER_COOLDOWN_DAYS = 5
 ANNUAL_REMINDER_COOLDOWN_DAYS = 2
 PAYMENT_REMINDER_WARNING_DAYS = 7
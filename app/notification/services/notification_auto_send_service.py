@@ -6,10 +6,8 @@ import json
 from sqlalchemy.orm import Session
 
 from app.clients.models.client_record import ClientRecord
-from app.config import settings
 from app.core.exceptions import AppError, NotFoundError
 from app.core.logging_config import get_logger
-from app.infrastructure.notifications import EmailChannel
 from app.notification.models.notification import (
     NotificationChannel,
     NotificationStatus,
@@ -17,15 +15,18 @@ from app.notification.models.notification import (
 )
 
 _AUTO_SEND_ALLOWED_TRIGGERS = {NotificationTrigger.BINDER_READY_FOR_HANDOVER}
+from app.notification.repositories.notification_outbox_repository import (
+    NotificationOutboxRepository,
+)
 from app.notification.repositories.notification_repository import NotificationRepository
-from app.notification.schemas.notification_schemas import NotificationResult
+from app.notification.schemas.notification_schemas import (
+    NotificationResult,
+    result_status,
+)
 from app.notification.services.constants import NOTIFICATION_IDEMPOTENCY_TTL_HOURS
 from app.notification.services.notification_context_resolver import (
     NotificationContextResolver,
 )
-from app.notification.services.notification_delivery_service import (
-    NotificationDeliveryService,
-)
 from app.notification.services.notification_policy_service import (
     NotificationPolicyService,
 )
@@ -69,7 +70,7 @@ class NotificationAutoSendService:
     Internal send path — not exposed via HTTP.
 
     Used only by BinderLifecycleService (Phase 2) for binder_ready_for_handover.
-    Renders template server-side, runs policy, resolves contact, delivers.
+    Renders template server-side, runs policy, resolves contact, queues delivery.
     idempotency_key is required.
     """
 
@@ -79,15 +80,7 @@ class NotificationAutoSendService:
         self.policy = NotificationPolicyService()
         self.renderer = NotificationTemplateRenderer()
         self.resolver = NotificationContextResolver(db)
-        live = settings.APP_ENV in ("staging", "production")
-        self._email = EmailChannel(
-            enabled=settings.NOTIFICATIONS_ENABLED and live,
-            api_key=settings.BREVO_API_KEY,
-            api_url=settings.BREVO_API_URL,
-            from_address=settings.EMAIL_FROM_ADDRESS,
-            from_name=settings.EMAIL_FROM_NAME,
-        )
-        self._delivery = NotificationDeliveryService()
+        self.outbox = NotificationOutboxRepository(db)
 
     def auto_send(
         self,
@@ -119,14 +112,14 @@ class NotificationAutoSendService:
             idempotency_key,
             ttl_hours=NOTIFICATION_IDEMPOTENCY_TTL_HOURS,
         )
-        if existing is not None and existing.status != NotificationStatus.PENDING:
+        if existing is not None:
             if existing.request_hash != req_hash:
                 logger.warning(
                     "auto_send: idempotency key reused with different payload key=%s",
                     idempotency_key,
                 )
             return NotificationResult(
-                status=existing.status.value,  # type: ignore[arg-type]
+                status=result_status(existing.status),
                 notification_id=existing.id,
                 reason="כבר נשלח (idempotency)",
             )
@@ -209,16 +202,6 @@ class NotificationAutoSendService:
             status=NotificationStatus.PENDING,
         )
 
-        ok, err = self._delivery.send(
-            recipient=recipient,
-            subject=subject,
-            body=body,
-            email_channel=self._email,
-        )
-
-        if ok:
-            self.repo.mark_sent(n.id)
-            return NotificationResult(status="sent", notification_id=n.id)
-
-        self.repo.mark_failed(n.id, err or "delivery failed")
-        return NotificationResult(status="failed", notification_id=n.id, reason=err)
+        # Delivered by the outbox worker once the caller's transaction commits.
+        self.outbox.enqueue(n)
+        return NotificationResult(status="queued", notification_id=n.id)
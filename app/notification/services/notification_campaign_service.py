@@ -0,0 +1,344 @@
+"""
+Notification campaigns: one trigger sent to every target a selector matches.
+
+Unlike `NotificationSendService.send`, which checks policy and resolves
+context one client at a time, a campaign loads its targets with their client
+status and entity type in one query. It then looks up cooldowns, contacts and
+the sender once for the whole set. Policy is the same rules
+`NotificationPolicyService` applies to a single send, run on the loaded rows.
+Notifications and outbox rows are inserted in one flush each, and the outbox
+worker sends them through the provider's batch endpoint.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.clients.models.client_record import ClientRecord
+from app.clients.models.legal_entity import LegalEntity
+from app.core.exceptions import AppError, NotFoundError
+from app.notification.models.notification import (
+    NotificationChannel,
+    NotificationStatus,
+    NotificationTrigger,
+)
+from app.notification.models.notification_campaign import NotificationCampaign
+from app.notification.repositories.notification_campaign_repository import (
+    NotificationCampaignRepository,
+)
+from app.notification.repositories.notification_outbox_repository import (
+    NotificationOutboxRepository,
+)
+from app.notification.repositories.notification_repository import NotificationRepository
+from app.notification.schemas.notification_schemas import (
+    BulkNotificationResultItem,
+    NotificationCampaignRequest,
+    NotificationCampaignResponse,
+    result_status,
+)
+from app.notification.services.constants import BULK_NOTIFY_LIMIT
+from app.notification.services.notification_context_resolver import (
+    NotificationContextResolver,
+)
+from app.notification.services.notification_policy_service import (
+    NotificationPolicyService,
+    PolicyResult,
+)
+from app.notification.services.notification_template_renderer import (
+    NotificationTemplateRenderer,
+)
+
+_NO_EMAIL_REASON = "לא נמצאה כתובת אימייל עבור הלקוח"
+
+
+@dataclass(frozen=True, slots=True)
+class _Target:
+    row: Any  # VatWorkItem / Charge / AnnualReport
+    client_record_id: int
+    client_status: Any
+    entity_type: Any
+
+
+@dataclass(frozen=True)
+class _CampaignKind:
+    """How one trigger selects, checks and renders its targets."""
+
+    model: Callable[[], type]
+    where: Callable[[NotificationCampaignRequest], list]
+    latest: Callable[[NotificationRepository, list[int]], dict] | None
+    rule: Callable[[_Target, Any, NotificationCampaignRequest], PolicyResult | None]
+    context: Callable[[Any], dict]
+    entity_type: str
+    anchors: Callable[[Any], dict]
+
+
+def _vat_work_item():
+    from app.vat_reports.models.vat_work_item import VatWorkItem
+
+    return VatWorkItem
+
+
+def _charge():
+    from app.charge.models.charge import Charge
+
+    return Charge
+
+
+def _annual_report():
+    from app.annual_reports.models.annual_report_model import AnnualReport
+
+    return AnnualReport
+
+
+def _vat_where(request: NotificationCampaignRequest) -> list:
+    from app.vat_reports.models.vat_enums import VatWorkItemStatus
+
+    item = _vat_work_item()
+    return [
+        item.period == request.period,
+        item.status.not_in((VatWorkItemStatus.FILED, VatWorkItemStatus.CANCELED)),
+    ]
+
+
+def _charge_where(request: NotificationCampaignRequest) -> list:  # noqa: ARG001
+    from app.charge.models.charge import ChargeStatus
+
+    return [_charge().status == ChargeStatus.ISSUED]
+
+
+def _annual_report_where(request: NotificationCampaignRequest) -> list:
+    from app.annual_reports.models.annual_report_enums import AnnualReportStatus
+
+    report = _annual_report()
+    filters = [report.status == AnnualReportStatus.PENDING_CLIENT]
+    if request.tax_year is not None:
+        filters.append(report.tax_year == request.tax_year)
+    return filters
+
+
+_KINDS: dict[NotificationTrigger, _CampaignKind] = {
+    NotificationTrigger.VAT_DOCUMENTS_REMINDER: _CampaignKind(
+        model=_vat_work_item,
+        where=_vat_where,
+        latest=None,
+        rule=lambda target, _last, _request: (
+            NotificationPolicyService.vat_documents_reminder_rule(
+                target.row, target.entity_type, client_record_id=target.client_record_id
+            )
+        ),
+        context=NotificationContextResolver.vat_context,
+        entity_type="vat_work_item",
+        anchors=lambda row: {},
+    ),
+    NotificationTrigger.PAYMENT_REMINDER: _CampaignKind(
+        model=_charge,
+        where=_charge_where,
+        latest=lambda repo, ids: repo.latest_by_entity_ids(
+            ids, NotificationTrigger.PAYMENT_REMINDER
+        ),
+        rule=lambda target, last, request: NotificationPolicyService.payment_reminder_rule(
+            target.row,
+            last,
+            client_record_id=target.client_record_id,
+            confirm_recent_duplicate=request.confirm_recent_duplicate,
+        ),
+        context=NotificationContextResolver.charge_context,
+        entity_type="charge",
+        anchors=lambda row: {},
+    ),
+    NotificationTrigger.ANNUAL_REPORT_CLIENT_REMINDER: _CampaignKind(
+        model=_annual_report,
+        where=_annual_report_where,
+        latest=lambda repo, ids: repo.latest_by_annual_report_ids(
+            ids, NotificationTrigger.ANNUAL_REPORT_CLIENT_REMINDER
+        ),
+        rule=lambda target, last, _request: (
+            NotificationPolicyService.annual_report_client_reminder_rule(
+                target.row, last, client_record_id=target.client_record_id
+            )
+        ),
+        context=lambda report: {"tax_year": report.tax_year},
+        entity_type="annual_report",
+        anchors=lambda report: {"annual_report_id": report.id},
+    ),
+}
+
+
+class NotificationCampaignService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.repo = NotificationCampaignRepository(db)
+        self.notifications = NotificationRepository(db)
+        self.outbox = NotificationOutboxRepository(db)
+        self.resolver = NotificationContextResolver(db)
+        self.renderer = NotificationTemplateRenderer()
+
+    def create(
+        self, request: NotificationCampaignRequest, triggered_by: int
+    ) -> NotificationCampaignResponse:
+        kind = _KINDS.get(request.trigger)
+        if kind is None:
+            raise AppError(
+                "סוג הודעה זה אינו נתמך בשליחה מרוכזת",
+                "NOTIFICATION.CAMPAIGN_UNSUPPORTED_TRIGGER",
+            )
+        if request.trigger == NotificationTrigger.VAT_DOCUMENTS_REMINDER and not request.period:
+            raise AppError(
+                'חובה לציין תקופת מע"מ לשליחה מרוכזת', "NOTIFICATION.CAMPAIGN_MISSING_PERIOD"
+            )
+
+        targets = self._targets(kind, request)
+        if len(targets) > BULK_NOTIFY_LIMIT:
+            raise AppError(
+                f"יותר מדי נמענים לשליחה מרוכזת (מקסימום {BULK_NOTIFY_LIMIT})",
+                "NOTIFICATION.CAMPAIGN_TOO_LARGE",
+            )
+
+        channel = NotificationChannel.EMAIL
+        campaign = self.repo.create(
+            trigger=request.trigger,
+            channel=channel,
+            selector=request.model_dump(mode="json", exclude={"trigger"}, exclude_none=True),
+            triggered_by=triggered_by,
+        )
+        entity_ids = [target.row.id for target in targets]
+        latest = kind.latest(self.notifications, entity_ids) if kind.latest else {}
+        contacts = self.resolver.resolve_contacts(t.client_record_id for t in targets)
+        base_context = self.resolver.base_context(triggered_by)
+
+        blocked: list[dict] = []
+        rows: list[dict] = []
+        for target in targets:
+            reason = self._blocked_reason(kind, target, latest.get(target.row.id), request)
+            contact = contacts.get(target.client_record_id)
+            if reason is None:
+                body, subject, reason = self.renderer.build_preview(
+                    request.trigger,
+                    {**base_context, **kind.context(target.row)},
+                    contact.name if contact else "",
+                )
+            if reason is not None:
+                blocked.append(
+                    {
+                        "client_record_id": target.client_record_id,
+                        "entity_id": target.row.id,
+                        "reason": reason,
+                    }
+                )
+                continue
+            recipient = contact.email if contact else None
+            rows.append(
+                {
+                    "campaign_id": campaign.id,
+                    "client_record_id": target.client_record_id,
+                    "trigger": request.trigger,
+                    "channel": channel,
+                    "recipient": recipient or None,
+                    "content_snapshot": body.strip(),
+                    "subject_snapshot": subject.strip(),
+                    "entity_type": kind.entity_type,
+                    "entity_id": target.row.id,
+                    "triggered_by": triggered_by,
+                    "status": (
+                        NotificationStatus.PENDING if recipient else NotificationStatus.SKIPPED
+                    ),
+                    **kind.anchors(target.row),
+                }
+            )
+
+        created = self.notifications.create_many(rows)
+        self.outbox.enqueue_many([n for n in created if n.status == NotificationStatus.PENDING])
+        campaign.total_targets = len(targets)
+        campaign.blocked_results = blocked
+        self.db.flush()
+        return self._response(campaign)
+
+    def get(self, campaign_id: int) -> NotificationCampaignResponse:
+        campaign = self.repo.get_by_id(campaign_id)
+        if campaign is None:
+            raise NotFoundError("הקמפיין לא נמצא", "NOTIFICATION.CAMPAIGN_NOT_FOUND")
+        return self._response(campaign)
+
+    # ── Private helpers ───────────────────────────────────────────────────────
+
+    def _targets(
+        self, kind: _CampaignKind, request: NotificationCampaignRequest
+    ) -> list[_Target]:
+        model = kind.model()
+        stmt = (
+            select(model, ClientRecord.status, LegalEntity.entity_type)
+            .join(ClientRecord, ClientRecord.id == model.client_record_id)
+            .join(LegalEntity, LegalEntity.id == ClientRecord.legal_entity_id)
+            .where(
+                model.deleted_at.is_(None),
+                ClientRecord.deleted_at.is_(None),
+                *kind.where(request),
+            )
+            .order_by(model.client_record_id, model.id)
+        )
+        if request.client_record_ids:
+            stmt = stmt.where(model.client_record_id.in_(request.client_record_ids))
+        # One row past the limit is enough to reject an oversized campaign.
+        stmt = stmt.limit(BULK_NOTIFY_LIMIT + 1)
+        return [
+            _Target(
+                row=row,
+                client_record_id=row.client_record_id,
+                client_status=client_status,
+                entity_type=entity_type,
+            )
+            for row, client_status, entity_type in self.db.execute(stmt).all()
+        ]
+
+    @staticmethod
+    def _blocked_reason(
+        kind: _CampaignKind, target: _Target, last: Any, request: NotificationCampaignRequest
+    ) -> str | None:
+        result = NotificationPolicyService.client_status_rule(
+            target.client_status, request.trigger
+        ) or kind.rule(target, last, request)
+        if result is None:
+            return None
+        if result.blocked:
+            return result.reason
+        # A single send shows warnings (e.g. a recent duplicate) to the user who
+        # sends anyway; a campaign skips those targets unless confirmed upfront.
+        return result.warnings[0] if result.warnings else None
+
+    def _response(self, campaign: NotificationCampaign) -> NotificationCampaignResponse:
+        results = [
+            BulkNotificationResultItem(
+                entity_id=row.entity_id,
+                client_record_id=row.client_record_id,
+                status=result_status(row.status),
+                notification_id=row.id,
+                reason=(
+                    _NO_EMAIL_REASON
+                    if row.status == NotificationStatus.SKIPPED
+                    else row.error_message
+                ),
+            )
+            for row in self.repo.list_results(campaign.id)
+        ]
+        results.extend(
+            BulkNotificationResultItem(status="blocked", **blocked)
+            for blocked in campaign.blocked_results
+        )
+        counts = {status: 0 for status in ("queued", "sent", "failed", "skipped", "blocked")}
+        for item in results:
+            counts[item.status] += 1
+        return NotificationCampaignResponse(
+            id=campaign.id,
+            trigger=NotificationTrigger(campaign.trigger),
+            channel=NotificationChannel(campaign.channel),
+            total=campaign.total_targets,
+            completed=counts["queued"] == 0,
+            created_at=campaign.created_at,
+            results=results,
+            **counts,
+        )
@@ -7,6 +7,9 @@ template context.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from dataclasses import dataclass
+
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
@@ -47,6 +50,14 @@ _SIGNATURE_TRIGGERS = {
 }
 
 
+@dataclass(frozen=True, slots=True)
+class ClientContact:
+    """What `resolve_client_name` and `resolve_person(...).email` return, for one client."""
+
+    name: str
+    email: str | None
+
+
 class NotificationContextResolver:
     def __init__(self, db: Session):
         self.db = db
@@ -65,11 +76,7 @@ class NotificationContextResolver:
         Raises NotFoundError if a required entity is not found.
         extra: caller-supplied values (e.g. message for client_general_message).
         """
-        ctx: dict = {}
-
-        # Base: office_name, sender_name
-        ctx["office_name"] = settings.EMAIL_FROM_NAME or "המשרד"
-        ctx["sender_name"] = self._resolve_sender_name(triggered_by_user_id)
+        ctx = self.base_context(triggered_by_user_id)
 
         # Binder triggers require binder_number
         if trigger in _BINDER_TRIGGERS:
@@ -108,6 +115,13 @@ class NotificationContextResolver:
 
         return ctx
 
+    def base_context(self, triggered_by_user_id: int | None) -> dict:
+        """office_name and sender_name, common to every trigger."""
+        return {
+            "office_name": settings.EMAIL_FROM_NAME or "המשרד",
+            "sender_name": self.resolve_sender_name(triggered_by_user_id),
+        }
+
     def resolve_person(self, client_record_id: int) -> Person | None:
         """Return the OWNER Person for the client record, or None."""
         return self.db.execute(
@@ -138,9 +152,35 @@ class NotificationContextResolver:
         ).scalar()
         return row or FALLBACK_CLIENT_NAME
 
-    # ── Private helpers ───────────────────────────────────────────────────────
+    def resolve_contacts(self, client_record_ids: Iterable[int]) -> dict[int, ClientContact]:
+        """Name and email of many clients in one query (campaigns)."""
+        from app.notification.services.messages import FALLBACK_CLIENT_NAME
 
-    def _resolve_sender_name(self, user_id: int | None) -> str:
+        ids = list(set(client_record_ids))
+        if not ids:
+            return {}
+        rows = self.db.execute(
+            select(ClientRecord.id, Person.full_name, Person.email, LegalEntity.official_name)
+            .select_from(ClientRecord)
+            .join(LegalEntity, LegalEntity.id == ClientRecord.legal_entity_id)
+            .outerjoin(
+                PersonLegalEntityLink,
+                (PersonLegalEntityLink.legal_entity_id == LegalEntity.id)
+                & (PersonLegalEntityLink.role == PersonLegalEntityRole.OWNER),
+            )
+            .outerjoin(Person, Person.id == PersonLegalEntityLink.person_id)
+            .where(ClientRecord.id.in_(ids))
+            .order_by(ClientRecord.id, PersonLegalEntityLink.id)
+        ).all()
+        contacts: dict[int, ClientContact] = {}
+        for client_record_id, full_name, email, official_name in rows:
+            if client_record_id not in contacts:
+                contacts[client_record_id] = ClientContact(
+                    name=full_name or official_name or FALLBACK_CLIENT_NAME, email=email
+                )
+        return contacts
+
+    def resolve_sender_name(self, user_id: int | None) -> str:
         if user_id is None:
             return "צוות המשרד"
         user = self.db.get(User, user_id)
@@ -148,6 +188,34 @@ class NotificationContextResolver:
             return user.full_name
         return "צוות המשרד"
 
+    # ── Context of loaded rows (shared with campaigns) ────────────────────────
+
+    @staticmethod
+    def charge_context(charge) -> dict:
+        amount = int(charge.amount) if charge.amount == int(charge.amount) else float(charge.amount)
+        return {
+            "charge_amount": str(amount),
+            "charge_description": charge.description or "",
+            "issued_at": charge.issued_at.strftime("%d/%m/%Y") if charge.issued_at else "",
+        }
+
+    @staticmethod
+    def vat_context(item) -> dict:
+        import datetime as _dt
+
+        deadline = item.due_date_effective
+        today = _dt.date.today()
+        days_until = (deadline - today).days if deadline else None
+        deadline_note = " — היום הוא המועד האחרון!" if days_until == 0 else ""
+        return {
+            "period": item.period,
+            "deadline": deadline.strftime("%d/%m/%Y") if deadline else "",
+            "days_until_deadline": str(days_until) if days_until is not None else "",
+            "deadline_note": deadline_note,
+        }
+
+    # ── Private helpers ───────────────────────────────────────────────────────
+
     def _resolve_binder_number(self, binder_id: int, client_record_id: int) -> str:
         from app.binders.models.binder import Binder
 
@@ -172,31 +240,15 @@ class NotificationContextResolver:
         charge = self.db.get(Charge, charge_id)
         if charge is None or charge.client_record_id != client_record_id:
             raise NotFoundError("החיוב לא נמצא", "CHARGE.NOT_FOUND")
-        amount = int(charge.amount) if charge.amount == int(charge.amount) else float(charge.amount)
-        return {
-            "charge_amount": str(amount),
-            "charge_description": charge.description or "",
-            "issued_at": charge.issued_at.strftime("%d/%m/%Y") if charge.issued_at else "",
-        }
+        return self.charge_context(charge)
 
     def _resolve_vat_context(self, vat_work_item_id: int, client_record_id: int) -> dict:
-        import datetime as _dt
-
         from app.vat_reports.models.vat_work_item import VatWorkItem
 
         item = self.db.get(VatWorkItem, vat_work_item_id)
         if item is None or item.client_record_id != client_record_id:
             raise NotFoundError('פריט מע"מ לא נמצא', "VAT.NOT_FOUND")
-        deadline = item.due_date_effective
-        today = _dt.date.today()
-        days_until = (deadline - today).days if deadline else None
-        deadline_note = " — היום הוא המועד האחרון!" if days_until == 0 else ""
-        return {
-            "period": item.period,
-            "deadline": deadline.strftime("%d/%m/%Y") if deadline else "",
-            "days_until_deadline": str(days_until) if days_until is not None else "",
-            "deadline_note": deadline_note,
-        }
+        return self.vat_context(item)
 
     def _resolve_signature_context(
         self, signature_request_id: int, client_record_id: int
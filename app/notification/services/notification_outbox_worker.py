@@ -0,0 +1,266 @@
+"""Background delivery of queued notifications (see `notification_outbox`).
+
+Each pass claims a batch of due outbox rows in a short transaction, delivers
+them concurrently on the event loop — at most N in flight per channel — and
+writes every outcome back in a second short transaction. No database
+transaction is held open while a provider is being called.
+
+Messages of one campaign are sent together through the provider's
+`send_batch`, `send_batch_size` per call, when the provider has one; every
+other message is one `send` call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.logging_config import get_logger
+from app.infrastructure.http_clients import BREVO, WHATSAPP, HttpClientManager
+from app.infrastructure.notifications import (
+    AsyncEmailChannel,
+    AsyncWhatsAppChannel,
+    DeliveryResult,
+    OutgoingMessage,
+)
+from app.notification.models.notification import NotificationChannel
+from app.notification.repositories.notification_outbox_repository import (
+    NotificationOutboxRepository,
+    OutboxMessage,
+)
+from app.utils.time_utils import utcnow
+
+logger = get_logger(__name__)
+
+# Upper bound on one provider call, on top of the channel's own HTTP timeout.
+_DELIVERY_TIMEOUT_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int
+    base_seconds: float
+    max_seconds: float
+
+    def delay(self, attempt: int, rng: Callable[[], float] = random.random) -> float:
+        """Backoff before retry number `attempt` (1-based): half fixed, half jitter."""
+        ceiling = min(self.max_seconds, self.base_seconds * 2 ** (attempt - 1))
+        return ceiling / 2 + rng() * ceiling / 2
+
+
+class NotificationOutboxWorker:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        providers: dict[NotificationChannel, object],
+        *,
+        concurrency: dict[NotificationChannel, int],
+        retry: RetryPolicy,
+        batch_size: int,
+        lease_seconds: int,
+        send_batch_size: int = 1,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self._session_factory = session_factory
+        self._providers = providers
+        self._limits = {
+            channel: asyncio.Semaphore(max(1, limit)) for channel, limit in concurrency.items()
+        }
+        self._retry = retry
+        self._batch_size = batch_size
+        self._lease_seconds = lease_seconds
+        self._send_batch_size = max(1, send_batch_size)
+        self._rng = rng
+
+    async def run_once(self) -> int:
+        """Deliver one batch of due messages; returns how many were claimed."""
+        messages = await asyncio.to_thread(self._claim)
+        if not messages:
+            return 0
+        groups = self._delivery_groups(messages)
+        results = await asyncio.gather(*(self._deliver(group) for group in groups))
+        outcomes = [
+            outcome
+            for group, group_results in zip(groups, results, strict=True)
+            for outcome in zip(group, group_results, strict=True)
+        ]
+        await asyncio.to_thread(self._record, outcomes)
+        return len(messages)
+
+    async def run_forever(self, poll_seconds: float) -> None:
+        while True:
+            try:
+                claimed = await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("notification outbox pass failed")
+                claimed = 0
+            # A full batch suggests a backlog: go again without waiting.
+            if claimed < self._batch_size:
+                await asyncio.sleep(poll_seconds)
+
+    # ── Steps ─────────────────────────────────────────────────────────────────
+
+    def _claim(self) -> list[OutboxMessage]:
+        db = self._session_factory()
+        try:
+            messages = NotificationOutboxRepository(db).claim_due(
+                limit=self._batch_size,
+                lease_until=utcnow() + timedelta(seconds=self._lease_seconds),
+            )
+            db.commit()
+            return messages
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _delivery_groups(self, messages: list[OutboxMessage]) -> list[list[OutboxMessage]]:
+        """One group per provider call: campaign chunks when batching, else singles."""
+        groups: list[list[OutboxMessage]] = []
+        campaigns: dict[tuple, list[OutboxMessage]] = defaultdict(list)
+        for message in messages:
+            provider = self._providers.get(message.channel)
+            if (
+                message.campaign_id is not None
+                and self._send_batch_size > 1
+                and hasattr(provider, "send_batch")
+            ):
+                campaigns[(message.channel, message.campaign_id)].append(message)
+            else:
+                groups.append([message])
+        for chunk in campaigns.values():
+            size = self._send_batch_size
+            groups.extend(chunk[i : i + size] for i in range(0, len(chunk), size))
+        return groups
+
+    async def _deliver(self, group: list[OutboxMessage]) -> list[DeliveryResult]:
+        channel = group[0].channel
+        provider = self._providers.get(channel)
+        if provider is None:
+            error = f"no provider for channel {channel.value}"
+            return [DeliveryResult(ok=False, error=error)] * len(group)
+        async with self._limits.setdefault(channel, asyncio.Semaphore(1)):
+            try:
+                return await asyncio.wait_for(
+                    self._send(provider, group), timeout=_DELIVERY_TIMEOUT_SECONDS
+                )
+            except TimeoutError:
+                result = DeliveryResult(ok=False, error="delivery timed out", retryable=True)
+            except Exception as exc:  # noqa: BLE001
+                logger.exception(
+                    "notification provider raised ids=%s",
+                    [message.notification_id for message in group],
+                )
+                result = DeliveryResult(ok=False, error=f"provider error: {exc}", retryable=True)
+        return [result] * len(group)
+
+    @staticmethod
+    async def _send(provider, group: list[OutboxMessage]) -> list[DeliveryResult]:
+        if len(group) == 1:
+            message = group[0]
+            return [await provider.send(message.recipient, message.body, subject=message.subject)]
+        results = await provider.send_batch(
+            [
+                OutgoingMessage(recipient=m.recipient, content=m.body, subject=m.subject)
+                for m in group
+            ]
+        )
+        if len(results) != len(group):
+            logger.error(
+                "provider batch returned %d results for %d messages ids=%s",
+                len(results),
+                len(group),
+                [message.notification_id for message in group],
+            )
+            # A message without a result was not confirmed sent; retry it.
+            missing = DeliveryResult(ok=False, error="no result from provider", retryable=True)
+            results = [*results[: len(group)], *[missing] * (len(group) - len(results))]
+        return results
+
+    def _record(self, outcomes: list[tuple[OutboxMessage, DeliveryResult]]) -> None:
+        db = self._session_factory()
+        try:
+            repo = NotificationOutboxRepository(db)
+            for message, result in outcomes:
+                self._apply(repo, message, result)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _apply(
+        self, repo: NotificationOutboxRepository, message: OutboxMessage, result: DeliveryResult
+    ) -> None:
+        if result.ok:
+            repo.mark_delivered(message)
+            return
+        error = result.error or "delivery failed"
+        attempt = message.attempts + 1
+        if result.retryable and attempt < self._retry.max_attempts:
+            delay = self._retry.delay(attempt, self._rng)
+            repo.schedule_retry(message, error, utcnow() + timedelta(seconds=delay))
+            logger.warning(
+                "notification delivery failed, retrying id=%s attempt=%s in=%.0fs error=%s",
+                message.notification_id,
+                attempt,
+                delay,
+                error,
+            )
+            return
+        repo.dead_letter(message, error)
+        logger.error(
+            "notification dead-lettered id=%s attempts=%s error=%s",
+            message.notification_id,
+            attempt,
+            error,
+        )
+
+
+def build_outbox_worker(
+    session_factory: Callable[[], Session], clients: HttpClientManager
+) -> NotificationOutboxWorker:
+    """Worker wired to the configured Brevo / 360dialog channels and their shared clients."""
+    live = settings.APP_ENV in ("staging", "production")
+    return NotificationOutboxWorker(
+        session_factory,
+        {
+            NotificationChannel.EMAIL: AsyncEmailChannel(
+                clients.async_client(BREVO),
+                enabled=settings.NOTIFICATIONS_ENABLED and live,
+                api_key=settings.BREVO_API_KEY,
+                api_url=settings.BREVO_API_URL,
+                from_address=settings.EMAIL_FROM_ADDRESS,
+                from_name=settings.EMAIL_FROM_NAME,
+            ),
+            NotificationChannel.WHATSAPP: AsyncWhatsAppChannel(
+                clients.async_client(WHATSAPP),
+                api_key=settings.WHATSAPP_API_KEY,
+                api_url=settings.WHATSAPP_API_URL,
+                from_number=settings.WHATSAPP_FROM_NUMBER,
+            ),
+        },
+        concurrency={
+            NotificationChannel.EMAIL: settings.NOTIFICATION_OUTBOX_EMAIL_CONCURRENCY,
+            NotificationChannel.WHATSAPP: settings.NOTIFICATION_OUTBOX_WHATSAPP_CONCURRENCY,
+        },
+        retry=RetryPolicy(
+            max_attempts=settings.NOTIFICATION_OUTBOX_MAX_ATTEMPTS,
+            base_seconds=settings.NOTIFICATION_OUTBOX_RETRY_BASE_SECONDS,
+            max_seconds=settings.NOTIFICATION_OUTBOX_RETRY_MAX_SECONDS,
+        ),
+        batch_size=settings.NOTIFICATION_OUTBOX_BATCH_SIZE,
+        lease_seconds=settings.NOTIFICATION_OUTBOX_LEASE_SECONDS,
+        send_batch_size=settings.NOTIFICATION_OUTBOX_SEND_BATCH_SIZE,
+    )
@@ -30,6 +30,9 @@ _ANNUAL_REPORT_DOCUMENTS_REQUEST_ALLOWED_STATUSES = frozenset({
     _ARS.IN_PREPARATION,
 })
 
+# Cooldowns count queued (outbox) notifications as already sent.
+_DELIVERED_OR_QUEUED = frozenset({NotificationStatus.SENT, NotificationStatus.PENDING})
+
 
 @dataclass
 class PolicyResult:
@@ -58,14 +61,9 @@ class NotificationPolicyService:
         annual_report_id: int | None = None,
         confirm_recent_duplicate: bool = False,
     ) -> PolicyResult:
-        status = client_record.status
-
-        if status in (ClientStatus.FROZEN, ClientStatus.CLOSED):
-            if trigger not in _FROZEN_CLOSED_ALLOWED:
-                return PolicyResult(
-                    blocked=True,
-                    reason="לא ניתן לשלוח הודעות ללקוח שהסטטוס שלו הוא מוקפא או סגור",
-                )
+        result = self.client_status_rule(client_record.status, trigger)
+        if result is not None:
+            return result
 
         # Binder-specific: validate location_status == READY_FOR_HANDOVER
         if trigger == NotificationTrigger.BINDER_READY_FOR_HANDOVER:
@@ -139,27 +137,27 @@ class NotificationPolicyService:
 
         return PolicyResult(blocked=False)
 
-    def _check_binder_ready_for_handover(
-        self, db: Session, binder_id: int
-    ) -> PolicyResult | None:
-        from app.binders.models.binder import Binder, BinderLocationStatus
+    # ── Rules on loaded rows (shared with campaigns, which load rows in bulk) ──
 
-        binder = db.get(Binder, binder_id)
-        if binder is None or binder.location_status != BinderLocationStatus.READY_FOR_HANDOVER:
-            return PolicyResult(
-                blocked=True,
-                reason="הקלסר אינו במצב מוכן למסירה",
-            )
+    @staticmethod
+    def client_status_rule(
+        status: ClientStatus, trigger: NotificationTrigger
+    ) -> PolicyResult | None:
+        if status in (ClientStatus.FROZEN, ClientStatus.CLOSED):
+            if trigger not in _FROZEN_CLOSED_ALLOWED:
+                return PolicyResult(
+                    blocked=True,
+                    reason="לא ניתן לשלוח הודעות ללקוח שהסטטוס שלו הוא מוקפא או סגור",
+                )
         return None
 
-    def _check_annual_report_client_reminder(
-        self, db: Session, annual_report_id: int, client_record_id: int | None = None
+    @staticmethod
+    def annual_report_client_reminder_rule(
+        report, last, *, client_record_id: int | None
     ) -> PolicyResult | None:
+        """`report`: the AnnualReport or None; `last`: its latest reminder or None."""
         from app.annual_reports.models.annual_report_enums import AnnualReportStatus
-        from app.annual_reports.models.annual_report_model import AnnualReport
-        from app.notification.repositories.notification_repository import NotificationRepository
 
-        report = db.get(AnnualReport, annual_report_id)
         if report is None:
             return PolicyResult(blocked=True, reason="הדוח השנתי לא נמצא")
         if client_record_id is not None and report.client_record_id != client_record_id:
@@ -169,12 +167,7 @@ class NotificationPolicyService:
                 blocked=True,
                 reason="הדוח אינו במצב ממתין לאישור לקוח",
             )
-
-        repo = NotificationRepository(db)
-        last = repo.get_last_for_annual_report_trigger(
-            annual_report_id, NotificationTrigger.ANNUAL_REPORT_CLIENT_REMINDER
-        )
-        if last and last.status == NotificationStatus.SENT:
+        if last and last.status in _DELIVERED_OR_QUEUED:
             days_since = (_dt.datetime.now(_dt.UTC) - last.created_at.replace(tzinfo=_dt.UTC)).days
             if days_since < ANNUAL_REMINDER_COOLDOWN_DAYS:
                 return PolicyResult(
@@ -186,39 +179,15 @@ class NotificationPolicyService:
                 )
         return None
 
-    def _check_annual_report_documents_request(
-        self, db: Session, annual_report_id: int, client_record_id: int | None = None
+    @staticmethod
+    def vat_documents_reminder_rule(
+        item, entity_type: EntityType | None, *, client_record_id: int
     ) -> PolicyResult | None:
-        from app.annual_reports.models.annual_report_model import AnnualReport
-
-        report = db.get(AnnualReport, annual_report_id)
-        if report is None:
-            return PolicyResult(blocked=True, reason="הדוח השנתי לא נמצא")
-        if client_record_id is not None and report.client_record_id != client_record_id:
-            return PolicyResult(blocked=True, reason="הדוח השנתי לא שייך ללקוח זה")
-        if report.status not in _ANNUAL_REPORT_DOCUMENTS_REQUEST_ALLOWED_STATUSES:
-            return PolicyResult(
-                blocked=True,
-                reason="הדוח אינו במצב המאפשר שליחת בקשת מסמכים",
-            )
-        return None
-
-    def _check_vat_documents_reminder(
-        self, db: Session, vat_work_item_id: int, client_record_id: int
-    ) -> PolicyResult | None:
-        from app.clients.models.legal_entity import LegalEntity
+        """`item`: the VatWorkItem or None; `entity_type`: the client's legal entity type."""
         from app.vat_reports.models.vat_enums import VatWorkItemStatus
-        from app.vat_reports.models.vat_work_item import VatWorkItem
 
-        item = db.get(VatWorkItem, vat_work_item_id)
         if item is None or item.client_record_id != client_record_id:
             return PolicyResult(blocked=True, reason='פריט מע"מ לא נמצא')
-
-        entity_type = db.scalar(
-            select(LegalEntity.entity_type)
-            .join(ClientRecord, ClientRecord.legal_entity_id == LegalEntity.id)
-            .where(ClientRecord.id == client_record_id)
-        )
         if entity_type == EntityType.OSEK_PATUR:
             return PolicyResult(blocked=True, reason='לקוח עוסק פטור אינו חייב בדיווח מע"מ')
 
@@ -238,17 +207,13 @@ class NotificationPolicyService:
             )
         return None
 
-    def _check_payment_reminder(
-        self,
-        db: Session,
-        charge_id: int,
-        client_record_id: int,
-        confirm_recent_duplicate: bool,
+    @staticmethod
+    def payment_reminder_rule(
+        charge, last, *, client_record_id: int, confirm_recent_duplicate: bool
     ) -> PolicyResult | None:
-        from app.charge.models.charge import Charge, ChargeStatus
-        from app.notification.repositories.notification_repository import NotificationRepository
+        """`charge`: the Charge or None; `last`: its latest payment reminder or None."""
+        from app.charge.models.charge import ChargeStatus
 
-        charge = db.get(Charge, charge_id)
         if charge is None or charge.client_record_id != client_record_id:
             return PolicyResult(blocked=True, reason="החיוב לא נמצא")
         if charge.status != ChargeStatus.ISSUED:
@@ -257,10 +222,7 @@ class NotificationPolicyService:
         if confirm_recent_duplicate:
             return None
 
-        last = NotificationRepository(db).get_last_for_entity_trigger(
-            charge_id, NotificationTrigger.PAYMENT_REMINDER
-        )
-        if last and last.status == NotificationStatus.SENT:
+        if last and last.status in _DELIVERED_OR_QUEUED:
             days_since = (_dt.datetime.now(_dt.UTC) - last.created_at.replace(tzinfo=_dt.UTC)).days
             if days_since < PAYMENT_REMINDER_WARNING_DAYS:
                 return PolicyResult(
@@ -274,6 +236,93 @@ class NotificationPolicyService:
                 )
         return None
 
+    # ── Single-send checks ────────────────────────────────────────────────────
+
+    def _check_binder_ready_for_handover(
+        self, db: Session, binder_id: int
+    ) -> PolicyResult | None:
+        from app.binders.models.binder import Binder, BinderLocationStatus
+
+        binder = db.get(Binder, binder_id)
+        if binder is None or binder.location_status != BinderLocationStatus.READY_FOR_HANDOVER:
+            return PolicyResult(
+                blocked=True,
+                reason="הקלסר אינו במצב מוכן למסירה",
+            )
+        return None
+
+    def _check_annual_report_client_reminder(
+        self, db: Session, annual_report_id: int, client_record_id: int | None = None
+    ) -> PolicyResult | None:
+        from app.annual_reports.models.annual_report_model import AnnualReport
+        from app.notification.repositories.notification_repository import NotificationRepository
+
+        report = db.get(AnnualReport, annual_report_id)
+        last = None
+        if report is not None:
+            last = NotificationRepository(db).get_last_for_annual_report_trigger(
+                annual_report_id, NotificationTrigger.ANNUAL_REPORT_CLIENT_REMINDER
+            )
+        return self.annual_report_client_reminder_rule(
+            report, last, client_record_id=client_record_id
+        )
+
+    def _check_annual_report_documents_request(
+        self, db: Session, annual_report_id: int, client_record_id: int | None = None
+    ) -> PolicyResult | None:
+        from app.annual_reports.models.annual_report_model import AnnualReport
+
+        report = db.get(AnnualReport, annual_report_id)
+        if report is None:
+            return PolicyResult(blocked=True, reason="הדוח השנתי לא נמצא")
+        if client_record_id is not None and report.client_record_id != client_record_id:
+            return PolicyResult(blocked=True, reason="הדוח השנתי לא שייך ללקוח זה")
+        if report.status not in _ANNUAL_REPORT_DOCUMENTS_REQUEST_ALLOWED_STATUSES:
+            return PolicyResult(
+                blocked=True,
+                reason="הדוח אינו במצב המאפשר שליחת בקשת מסמכים",
+            )
+        return None
+
+    def _check_vat_documents_reminder(
+        self, db: Session, vat_work_item_id: int, client_record_id: int
+    ) -> PolicyResult | None:
+        from app.clients.models.legal_entity import LegalEntity
+        from app.vat_reports.models.vat_work_item import VatWorkItem
+
+        item = db.get(VatWorkItem, vat_work_item_id)
+        entity_type = db.scalar(
+            select(LegalEntity.entity_type)
+            .join(ClientRecord, ClientRecord.legal_entity_id == LegalEntity.id)
+            .where(ClientRecord.id == client_record_id)
+        )
+        return self.vat_documents_reminder_rule(
+            item, entity_type, client_record_id=client_record_id
+        )
+
+    def _check_payment_reminder(
+        self,
+        db: Session,
+        charge_id: int,
+        client_record_id: int,
+        confirm_recent_duplicate: bool,
+    ) -> PolicyResult | None:
+        from app.charge.models.charge import Charge
+        from app.notification.repositories.notification_repository import NotificationRepository
+
+        charge = db.get(Charge, charge_id)
+        last = None
+        if charge is not None and not confirm_recent_duplicate:
+            last = NotificationRepository(db).get_last_for_entity_trigger(
+                charge_id, NotificationTrigger.PAYMENT_REMINDER
+            )
+        return self.payment_reminder_rule(
+            charge,
+            last,
+            client_record_id=client_record_id,
+            confirm_recent_duplicate=confirm_recent_duplicate,
+        )
+
     def _check_invoice_issued(
         self, db: Session, charge_id: int, client_record_id: int
     ) -> PolicyResult | None:
@@ -7,10 +7,8 @@ import re
 from sqlalchemy.orm import Session
 
 from app.clients.models.client_record import ClientRecord
-from app.config import settings
 from app.core.exceptions import AppError, NotFoundError
 from app.core.logging_config import get_logger
-from app.infrastructure.notifications import EmailChannel
 from app.notification.models.notification import (
     NotificationChannel,
     NotificationStatus,
@@ -41,12 +39,16 @@ _GENERIC_ENTITY_TRIGGERS = (
     | {NotificationTrigger.VAT_DOCUMENTS_REMINDER}
     | _SIGNATURE_TRIGGERS
 )
+from app.notification.repositories.notification_outbox_repository import (
+    NotificationOutboxRepository,
+)
 from app.notification.repositories.notification_repository import NotificationRepository
 from app.notification.schemas.notification_schemas import (
     NotificationPreviewRequest,
     NotificationPreviewResponse,
     NotificationResult,
     NotificationSendRequest,
+    result_status,
 )
 from app.notification.services.constants import (
     BODY_MAX_LENGTH,
@@ -56,9 +58,6 @@ from app.notification.services.constants import (
 from app.notification.services.notification_context_resolver import (
     NotificationContextResolver,
 )
-from app.notification.services.notification_delivery_service import (
-    NotificationDeliveryService,
-)
 from app.notification.services.notification_policy_service import (
     NotificationPolicyService,
 )
@@ -99,15 +98,7 @@ class NotificationSendService:
         self.policy = NotificationPolicyService()
         self.renderer = NotificationTemplateRenderer()
         self.resolver = NotificationContextResolver(db)
-        live = settings.APP_ENV in ("staging", "production")
-        self._email = EmailChannel(
-            enabled=settings.NOTIFICATIONS_ENABLED and live,
-            api_key=settings.BREVO_API_KEY,
-            api_url=settings.BREVO_API_URL,
-            from_address=settings.EMAIL_FROM_ADDRESS,
-            from_name=settings.EMAIL_FROM_NAME,
-        )
-        self._delivery = NotificationDeliveryService()
+        self.outbox = NotificationOutboxRepository(db)
 
     # ── Preview ───────────────────────────────────────────────────────────────
 
@@ -308,14 +299,11 @@ class NotificationSendService:
                     "idempotency key reused with different payload key=%s",
                     idempotency_key,
                 )
-            # A PENDING row means a prior attempt crashed mid-flight.
-            # Fall through and let this request proceed normally.
-            if existing.status != NotificationStatus.PENDING:
-                return NotificationResult(
-                    status=existing.status.value,  # type: ignore[arg-type]
-                    notification_id=existing.id,
-                    reason="כבר נשלח (idempotency)",
-                )
+            return NotificationResult(
+                status=result_status(existing.status),
+                notification_id=existing.id,
+                reason="כבר נשלח (idempotency)",
+            )
 
         # Contact resolution — skipped = record saved with recipient=null
         if request.trigger in _SIGNATURE_TRIGGERS:
@@ -391,26 +379,11 @@ class NotificationSendService:
             status=NotificationStatus.PENDING,
         )
 
-        ok, err = self._delivery.send(
-            recipient=delivery_recipient,
-            subject=subject,
-            body=body,
-            email_channel=self._email,
-        )
-
-        if ok:
-            self.repo.mark_sent(n.id)
-            return NotificationResult(
-                status="sent",
-                notification_id=n.id,
-                warnings=policy.warnings,
-            )
-
-        self.repo.mark_failed(n.id, err or "delivery failed")
+        # Delivered by the outbox worker once this transaction commits.
+        self.outbox.enqueue(n)
         return NotificationResult(
-            status="failed",
+            status="queued",
             notification_id=n.id,
-            reason=err,
             warnings=policy.warnings,
         )
 
@@ -65,13 +65,15 @@ def list_client_documents(
     db: DBSession,
     user: CurrentUser,
     tax_year: int | None = Query(default=None),
+    include_download_urls: bool = Query(default=False),
 ):
-    """List permanent documents for a client."""
+    """List permanent documents for a client, optionally with download URLs (expire in 1 hour)."""
     service = PermanentDocumentService(db)
     documents = service.list_client_documents(client_record_id, tax_year=tax_year)
+    download_urls = service.get_download_urls(documents) if include_download_urls else None
 
     return PermanentDocumentListResponse(
-        items=PermanentDocumentResponseBuilder(db).build_many(documents)
+        items=PermanentDocumentResponseBuilder(db).build_many(documents, download_urls)
     )
 
 
@@ -0,0 +1,47 @@
+"""
+Document Blob — one stored file, shared by every permanent document with the same content.
+
+Design decisions:
+- Keyed by the hex SHA-256 of the file; stored once under `blobs/sha256/<ab>/<hash>`.
+- ref_count is the number of permanent_documents rows whose storage_key is the
+  blob's key (soft-deleted rows included: soft delete keeps the file). The
+  service bumps it when a row starts pointing at the blob and drops it when a
+  replace moves the row to another file.
+- A blob whose count reaches 0 records released_at; the garbage collector
+  deletes it (row and file) once the grace period has passed, so presigned URLs
+  already handed out keep working until they expire.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Index, Integer, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.utils.time_utils import utcnow
+
+
+class DocumentBlob(Base):
+    __tablename__ = "document_blobs"
+
+    sha256: Mapped[str] = mapped_column(String(64), primary_key=True)
+    storage_key: Mapped[str] = mapped_column(String, nullable=False, unique=True)
+    size_bytes: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    mime_type: Mapped[str | None] = mapped_column(String, nullable=True)
+    ref_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(default=utcnow, nullable=False)
+    released_at: Mapped[datetime | None] = mapped_column(nullable=True)
+
+    __table_args__ = (
+        Index(
+            "ix_document_blobs_unreferenced",
+            "released_at",
+            postgresql_where=text("ref_count = 0"),
+            sqlite_where=text("ref_count = 0"),
+        ),
+    )
+
+    def __repr__(self):
+        return f"<DocumentBlob(sha256='{self.sha256}', ref_count={self.ref_count})>"
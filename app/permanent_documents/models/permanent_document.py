@@ -16,6 +16,9 @@ Design decisions:
 - CheckConstraint enforces the scope/business_id invariant at DB level.
 - is_deleted (soft delete) on the row; storage file is NOT deleted —
   service layer handles storage cleanup separately.
+- Files are content-addressed: storage_key points at a DocumentBlob shared by
+  every row with the same content (rows from before blobs keep per-version
+  keys until scripts/ops/document_blobs.py rehash moves them).
 - superseded_by self-FK chains versions; only the latest has superseded_by=NULL.
 - rejected_by mirrors approved_by for symmetry and audit completeness.
 - annual_report_id links supporting documents to a specific report.
@@ -88,10 +91,12 @@ class PermanentDocument(Base):
 
     # ── Document identity ─────────────────────────────────────────────────────
     document_type: Mapped[DocumentType] = mapped_column(pg_enum(DocumentType), nullable=False)
-    storage_key: Mapped[str] = mapped_column(String, nullable=False)  # מפתח ב-S3/R2
+    storage_key: Mapped[str] = mapped_column(String, nullable=False, index=True)  # מפתח ב-S3/R2
     original_filename: Mapped[str | None] = mapped_column(String, nullable=True)
     file_size_bytes: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
     mime_type: Mapped[str | None] = mapped_column(String, nullable=True)
+    # Hex SHA-256 of the stored file; names its DocumentBlob.
+    content_sha256: Mapped[str | None] = mapped_column(String(64), nullable=True)
     tax_year: Mapped[int | None] = mapped_column(SmallInteger, nullable=True, index=True)
 
     # ── Status ────────────────────────────────────────────────────────────────
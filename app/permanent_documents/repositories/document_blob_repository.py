@@ -0,0 +1,101 @@
+from datetime import datetime
+
+from sqlalchemy import case, delete, func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.permanent_documents.models.document_blob import DocumentBlob
+from app.permanent_documents.models.permanent_document import PermanentDocument
+
+
+class DocumentBlobRepository:
+    """Data access for content-addressed document blobs and their reference counts."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get(self, sha256: str) -> DocumentBlob | None:
+        return self.db.get(DocumentBlob, sha256)
+
+    def acquire(self, sha256: str) -> bool:
+        """Add a reference to an existing blob; False when there is none."""
+        result = self.db.execute(
+            update(DocumentBlob)
+            .where(DocumentBlob.sha256 == sha256)
+            .values(ref_count=DocumentBlob.ref_count + 1, released_at=None)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+
+    def add(self, *, sha256: str, storage_key: str, size_bytes: int, mime_type: str) -> None:
+        """Record a newly uploaded blob with one reference."""
+        try:
+            with self.db.begin_nested():
+                self.db.add(
+                    DocumentBlob(
+                        sha256=sha256,
+                        storage_key=storage_key,
+                        size_bytes=size_bytes,
+                        mime_type=mime_type,
+                        ref_count=1,
+                    )
+                )
+        except IntegrityError:
+            # A concurrent upload of the same content recorded it first.
+            self.acquire(sha256)
+
+    def release(self, storage_key: str, *, now: datetime) -> None:
+        """Drop one reference; legacy (non-blob) keys are ignored."""
+        self.db.execute(
+            update(DocumentBlob)
+            .where(DocumentBlob.storage_key == storage_key, DocumentBlob.ref_count > 0)
+            .values(
+                ref_count=DocumentBlob.ref_count - 1,
+                released_at=case(
+                    (DocumentBlob.ref_count == 1, now), else_=DocumentBlob.released_at
+                ),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    def list_collectable(self, *, released_before: datetime, limit: int) -> list[DocumentBlob]:
+        return list(
+            self.db.scalars(
+                select(DocumentBlob)
+                .where(DocumentBlob.ref_count == 0, DocumentBlob.released_at <= released_before)
+                .order_by(DocumentBlob.released_at)
+                .limit(limit)
+            )
+        )
+
+    def delete_if_unreferenced(self, sha256: str, *, released_before: datetime) -> bool:
+        """Delete the row unless a reference was taken since it was listed.
+
+        On PostgreSQL the row stays locked until commit, so a concurrent
+        `acquire` waits and then falls back to uploading a fresh copy.
+        """
+        result = self.db.execute(
+            delete(DocumentBlob)
+            .where(
+                DocumentBlob.sha256 == sha256,
+                DocumentBlob.ref_count == 0,
+                DocumentBlob.released_at <= released_before,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+
+    def count_references(self, storage_key: str) -> int:
+        return self.db.scalar(
+            select(func.count())
+            .select_from(PermanentDocument)
+            .where(PermanentDocument.storage_key == storage_key)
+        )
+
+    def set_ref_count(self, sha256: str, ref_count: int) -> None:
+        self.db.execute(
+            update(DocumentBlob)
+            .where(DocumentBlob.sha256 == sha256)
+            .values(ref_count=ref_count, released_at=None)
+            .execution_options(synchronize_session=False)
+        )
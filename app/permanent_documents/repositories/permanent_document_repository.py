@@ -1,4 +1,4 @@
-from sqlalchemy import String, cast, func, select
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from app.common.repositories.base_repository import BaseRepository
@@ -30,6 +30,7 @@ class PermanentDocumentRepository(BaseRepository[PermanentDocument]):
         original_filename: str | None = None,
         file_size_bytes: int | None = None,
         mime_type: str | None = None,
+        content_sha256: str | None = None,
     ) -> PermanentDocument:
         document = PermanentDocument(
             client_record_id=client_record_id,
@@ -46,6 +47,7 @@ class PermanentDocumentRepository(BaseRepository[PermanentDocument]):
             original_filename=original_filename,
             file_size_bytes=file_size_bytes,
             mime_type=mime_type,
+            content_sha256=content_sha256,
         )
         self.db.add(document)
         self.db.flush()
@@ -155,31 +157,9 @@ class PermanentDocumentRepository(BaseRepository[PermanentDocument]):
             )
         )
 
-    def search_by_filename(self, filename: str, limit: int = 50) -> list[PermanentDocument]:
-        term = f"%{filename.strip()}%"
+    def list_by_ids(self, document_ids: list[int]) -> list[PermanentDocument]:
+        if not document_ids:
+            return []
         return self.db.scalars(
-            select(PermanentDocument)
-            .where(
-                PermanentDocument.is_deleted == False,  # noqa: E712
-                PermanentDocument.superseded_by == None,  # noqa: E711
-                PermanentDocument.original_filename.ilike(term),
-            )
-            .order_by(PermanentDocument.uploaded_at.desc())
-            .limit(limit)
-        ).all()
-
-    def search_by_query(self, query: str, limit: int = 50) -> list[PermanentDocument]:
-        term = f"%{query.strip()}%"
-        return self.db.scalars(
-            select(PermanentDocument)
-            .where(
-                PermanentDocument.is_deleted == False,  # noqa: E712
-                PermanentDocument.superseded_by == None,  # noqa: E711
-                (
-                    PermanentDocument.original_filename.ilike(term)
-                    | cast(PermanentDocument.document_type, String).ilike(term)
-                ),
-            )
-            .order_by(PermanentDocument.uploaded_at.desc())
-            .limit(limit)
+            select(PermanentDocument).where(PermanentDocument.id.in_(document_ids))
         ).all()
@@ -32,6 +32,7 @@ class PermanentDocumentResponse(BaseModel):
     approved_at: ApiDateTime | None = None
     rejected_by: int | None = None
     rejected_at: ApiDateTime | None = None
+    download_url: str | None = None  # only when requested (include_download_urls)
 
     model_config = {"from_attributes": True}
 
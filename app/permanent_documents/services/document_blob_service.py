@@ -0,0 +1,195 @@
+"""Content-addressed storage for permanent document files.
+
+Every file is stored once, under a key derived from its SHA-256, and shared
+by all documents with the same content (the same ID copy filed for several
+businesses, a re-upload, a replace with an unchanged file). An upload is
+hashed before anything goes to storage, so a file whose blob already exists
+only gains a reference and is never uploaded again.
+"""
+
+from __future__ import annotations
+
+import tempfile
+from collections.abc import Iterator
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import BinaryIO
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.logging_config import get_logger
+from app.infrastructure.storage import (
+    UPLOAD_CHUNK_BYTES,
+    HashingReader,
+    StorageProvider,
+    remaining_size,
+)
+from app.permanent_documents.models.permanent_document import PermanentDocument
+from app.permanent_documents.repositories.document_blob_repository import (
+    DocumentBlobRepository,
+)
+from app.utils.time_utils import utcnow
+
+logger = get_logger(__name__)
+
+BLOB_KEY_PREFIX = "blobs/sha256/"
+
+
+def blob_storage_key(sha256: str) -> str:
+    return f"{BLOB_KEY_PREFIX}{sha256[:2]}/{sha256}"
+
+
+@dataclass(frozen=True)
+class HashedUpload:
+    """An upload whose content hash is known, with a stream positioned at its start."""
+
+    stream: BinaryIO
+    sha256: str
+    size_bytes: int
+
+    @property
+    def storage_key(self) -> str:
+        return blob_storage_key(self.sha256)
+
+
+class DocumentBlobService:
+    def __init__(self, db: Session, storage: StorageProvider):
+        self.db = db
+        self.storage = storage
+        self.repo = DocumentBlobRepository(db)
+
+    @contextmanager
+    def hash_upload(
+        self, file_data: BinaryIO, *, max_bytes: int | None = None
+    ) -> Iterator[HashedUpload]:
+        """Hash an upload in one chunked pass, enforcing `max_bytes`.
+
+        A seekable stream is read and rewound; anything else is spooled to a
+        temporary file (in memory up to one chunk) during the same pass.
+        Raises `UploadTooLargeError` before anything reaches storage.
+        """
+        if remaining_size(file_data) is not None:
+            start = file_data.tell()
+            reader = HashingReader(file_data, max_bytes=max_bytes)
+            reader.finish()
+            file_data.seek(start)
+            yield HashedUpload(file_data, reader.sha256, reader.size)
+            return
+        with tempfile.SpooledTemporaryFile(max_size=UPLOAD_CHUNK_BYTES) as spool:
+            reader = HashingReader(file_data, max_bytes=max_bytes)
+            while chunk := reader.read(UPLOAD_CHUNK_BYTES):
+                spool.write(chunk)
+            spool.seek(0)
+            yield HashedUpload(spool, reader.sha256, reader.size)
+
+    def store(self, upload: HashedUpload, mime_type: str) -> bool:
+        """Reference the upload's blob, uploading it only if it is new.
+
+        Returns True when the file was uploaded, False when an existing blob
+        was reused. The caller commits.
+        """
+        if self.repo.acquire(upload.sha256):
+            return False
+        self.storage.upload(upload.storage_key, upload.stream, mime_type)
+        self.repo.add(
+            sha256=upload.sha256,
+            storage_key=upload.storage_key,
+            size_bytes=upload.size_bytes,
+            mime_type=mime_type,
+        )
+        return True
+
+    def release(self, storage_key: str) -> None:
+        """Drop a document's reference to the blob stored under `storage_key`."""
+        self.repo.release(storage_key, now=utcnow())
+
+    def collect_garbage(self, *, limit: int | None = None) -> dict[str, int]:
+        """Delete blobs unreferenced for longer than the grace period.
+
+        Each blob row is deleted, then its file, then the transaction commits:
+        a failed file delete rolls the row back so the next run retries it.
+        """
+        released_before = utcnow() - timedelta(hours=settings.DOCUMENT_BLOB_GC_GRACE_HOURS)
+        candidates = self.repo.list_collectable(
+            released_before=released_before,
+            limit=limit or settings.DOCUMENT_BLOB_GC_BATCH_SIZE,
+        )
+        self.db.commit()
+        deleted = repaired = 0
+        for sha256, storage_key in [(blob.sha256, blob.storage_key) for blob in candidates]:
+            references = self.repo.count_references(storage_key)
+            if references:
+                # Counter drifted (e.g. rows written outside the service); trust the rows.
+                self.repo.set_ref_count(sha256, references)
+                self.db.commit()
+                repaired += 1
+                continue
+            if not self.repo.delete_if_unreferenced(sha256, released_before=released_before):
+                self.db.rollback()
+                continue
+            try:
+                self.storage.delete(storage_key)
+            except Exception:
+                self.db.rollback()
+                logger.exception("could not delete document blob %s", storage_key)
+                continue
+            self.db.commit()
+            deleted += 1
+        return {"blobs_deleted": deleted, "ref_counts_repaired": repaired}
+
+    def rehash_legacy_documents(
+        self, *, batch_size: int = 100, delete_legacy: bool = False
+    ) -> dict[str, int]:
+        """Move documents stored under per-version keys onto content-addressed blobs.
+
+        Each document's file is downloaded and hashed; documents with equal
+        content end up on one blob. Progress is committed per batch, so an
+        interrupted run resumes where it stopped. With `delete_legacy` the old
+        objects are deleted once the batch that moved them has committed.
+        """
+        counters = {"migrated": 0, "uploaded": 0, "missing": 0, "legacy_deleted": 0}
+        after_id = 0
+        while True:
+            documents = list(
+                self.db.scalars(
+                    select(PermanentDocument)
+                    .where(
+                        PermanentDocument.id > after_id,
+                        PermanentDocument.storage_key.not_like(f"{BLOB_KEY_PREFIX}%"),
+                    )
+                    .order_by(PermanentDocument.id)
+                    .limit(batch_size)
+                )
+            )
+            if not documents:
+                return counters
+            after_id = documents[-1].id
+            legacy_keys = []
+            for document in documents:
+                try:
+                    source = self.storage.open(document.storage_key)
+                except FileNotFoundError:
+                    logger.warning(
+                        "document %s: %s not in storage", document.id, document.storage_key
+                    )
+                    counters["missing"] += 1
+                    continue
+                with closing(source), self.hash_upload(source) as upload:
+                    mime_type = document.mime_type or "application/octet-stream"
+                    counters["uploaded"] += int(self.store(upload, mime_type))
+                legacy_keys.append(document.storage_key)
+                document.storage_key = upload.storage_key
+                document.content_sha256 = upload.sha256
+                document.file_size_bytes = upload.size_bytes
+                counters["migrated"] += 1
+            self.db.commit()
+            if delete_legacy:
+                for key in legacy_keys:
+                    try:
+                        self.storage.delete(key)
+                        counters["legacy_deleted"] += 1
+                    except Exception:
+                        logger.exception("could not delete legacy document file %s", key)
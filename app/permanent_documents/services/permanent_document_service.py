@@ -1,5 +1,6 @@
-import io
 import mimetypes
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import BinaryIO
 
 from sqlalchemy.exc import IntegrityError
@@ -13,7 +14,13 @@ from app.businesses.services.signals_service import SignalsService
 from app.clients.repositories.client_record_repository import ClientRecordRepository
 from app.clients.services.client_service import get_client_or_raise
 from app.core.exceptions import AppError, NotFoundError
-from app.infrastructure.storage import StorageProvider, get_storage_provider
+from app.infrastructure.storage import (
+    PresignedDownload,
+    StorageProvider,
+    UploadTooLargeError,
+    get_storage_provider,
+    remaining_size,
+)
 from app.permanent_documents.models.permanent_document import (
     DocumentScope,
     DocumentStatus,
@@ -30,6 +37,10 @@ from app.permanent_documents.services.constants import (
     ALLOWED_MIME_TYPES,
     MAX_FILE_SIZE_BYTES,
 )
+from app.permanent_documents.services.document_blob_service import (
+    DocumentBlobService,
+    HashedUpload,
+)
 from app.permanent_documents.services.messages import (
     BUSINESS_NOT_FOUND_ERROR,
     DOCUMENT_NOT_FOUND_ERROR,
@@ -55,6 +66,7 @@ class PermanentDocumentService:
         self.document_repo = PermanentDocumentRepository(db)
         self.query_repo = PermanentDocumentQueryRepository(db)
         self.storage = storage or get_storage_provider()
+        self.blobs = DocumentBlobService(db, self.storage)
 
     def _resolve_mime(self, mime_type: str | None, filename: str) -> str:
         resolved = mime_type or mimetypes.guess_type(filename)[0] or "application/octet-stream"
@@ -66,6 +78,18 @@ class PermanentDocumentService:
             )
         return resolved
 
+    @contextmanager
+    def _hash_upload(self, file_data: BinaryIO) -> Iterator[HashedUpload]:
+        """Reject a known-oversized upload up front; otherwise enforce the limit while hashing."""
+        size = remaining_size(file_data)
+        if size is not None and size > MAX_FILE_SIZE_BYTES:
+            raise _file_too_large()
+        try:
+            with self.blobs.hash_upload(file_data, max_bytes=MAX_FILE_SIZE_BYTES) as upload:
+                yield upload
+        except UploadTooLargeError as exc:
+            raise _file_too_large() from exc
+
     def _get_client_record_id(self, client_record_id: int) -> int:
         record = ClientRecordRepository(self.db).get_by_id(client_record_id)
         if not record:
@@ -74,24 +98,6 @@ class PermanentDocumentService:
             )
         return record.id
 
-    def _build_storage_key(
-        self,
-        *,
-        client_record_id: int,
-        document_type: str,
-        tax_year: int | None,
-        version: int,
-        filename: str,
-        business_id: int | None = None,
-    ) -> str:
-        tax_year_str = str(tax_year) if tax_year else "permanent"
-        owner_segment = (
-            f"businesses/{business_id}"
-            if business_id is not None
-            else f"clients/{client_record_id}"
-        )
-        return f"{owner_segment}/{document_type}/{tax_year_str}/v{version}_{filename}"
-
     def upload_document(
         self,
         client_record_id: int,
@@ -126,14 +132,6 @@ class PermanentDocumentService:
         scope = DocumentScope.BUSINESS if business_id is not None else DocumentScope.CLIENT
         DocumentType(document_type)
 
-        file_bytes = file_data.read()
-        file_size = len(file_bytes)
-        if file_size > MAX_FILE_SIZE_BYTES:
-            raise AppError(
-                FILE_TOO_LARGE_ERROR.format(max_size_mb=MAX_FILE_SIZE_BYTES // (1024 * 1024)),
-                "DOCUMENT.FILE_TOO_LARGE",
-                status_code=422,
-            )
         resolved_mime = self._resolve_mime(mime_type, filename)
 
         existing = self.query_repo.get_latest_version(
@@ -143,39 +141,36 @@ class PermanentDocumentService:
             tax_year=tax_year,
         )
         next_version = (existing.version + 1) if existing else 1
-        storage_key = self._build_storage_key(
-            client_record_id=client_record_id,
-            business_id=business_id,
-            document_type=document_type,
-            tax_year=tax_year,
-            version=next_version,
-            filename=filename,
-        )
 
-        # Flush DB record first; upload to storage only if flush succeeds.
-        # Single commit at the end keeps record + superseded_by atomic.
-        document = self.document_repo.create(
-            client_record_id=client_record.id,
-            business_id=business_id,
-            scope=scope,
-            document_type=document_type,
-            storage_key=storage_key,
-            uploaded_by=uploaded_by,
-            tax_year=tax_year,
-            version=next_version,
-            status=DocumentStatus.APPROVED,
-            annual_report_id=annual_report_id,
-            original_filename=filename,
-            file_size_bytes=file_size,
-            mime_type=resolved_mime,
-        )
-        document.approved_by = uploaded_by
-        document.approved_at = utcnow()
-        try:
-            self.storage.upload(storage_key, io.BytesIO(file_bytes), resolved_mime)
-        except Exception as exc:
-            self.db.rollback()
-            raise AppError(UPLOAD_FAILED_ERROR, "DOCUMENT.UPLOAD_FAILED", status_code=500) from exc
+        with self._hash_upload(file_data) as upload:
+            # Flush DB record first; upload to storage only if flush succeeds.
+            # Single commit at the end keeps record + blob reference + superseded_by atomic.
+            document = self.document_repo.create(
+                client_record_id=client_record.id,
+                business_id=business_id,
+                scope=scope,
+                document_type=document_type,
+                storage_key=upload.storage_key,
+                uploaded_by=uploaded_by,
+                tax_year=tax_year,
+                version=next_version,
+                status=DocumentStatus.APPROVED,
+                annual_report_id=annual_report_id,
+                original_filename=filename,
+                file_size_bytes=upload.size_bytes,
+                mime_type=resolved_mime,
+                content_sha256=upload.sha256,
+            )
+            document.approved_by = uploaded_by
+            document.approved_at = utcnow()
+            try:
+                # Skips the upload when a blob with this content already exists.
+                self.blobs.store(upload, resolved_mime)
+            except Exception as exc:
+                self.db.rollback()
+                raise AppError(
+                    UPLOAD_FAILED_ERROR, "DOCUMENT.UPLOAD_FAILED", status_code=500
+                ) from exc
 
         if existing:
             existing.superseded_by = document.id
@@ -195,7 +190,21 @@ class PermanentDocumentService:
         doc = self.document_repo.get_by_id(document_id)
         if not doc:
             raise NotFoundError(DOCUMENT_NOT_FOUND_ERROR, "PERMANENT_DOCUMENTS.NOT_FOUND")
-        return self.storage.get_presigned_url(doc.storage_key, expires_in=expires_in)
+        download = _download(doc)
+        return self.storage.get_presigned_url(
+            download.key,
+            expires_in=expires_in,
+            filename=download.filename,
+            content_type=download.content_type,
+        )
+
+    def get_download_urls(
+        self, documents: list[PermanentDocument], expires_in: int = 3600
+    ) -> dict[int, str]:
+        """Presigned download URL per document id, signed as one batch."""
+        downloads = {doc.id: _download(doc) for doc in documents}
+        urls = self.storage.get_presigned_urls(downloads.values(), expires_in=expires_in)
+        return {doc_id: urls[download] for doc_id, download in downloads.items()}
 
     def list_business_documents(
         self,
@@ -273,34 +282,34 @@ class PermanentDocumentService:
         if not doc:
             raise NotFoundError(DOCUMENT_NOT_FOUND_ERROR, "PERMANENT_DOCUMENTS.NOT_FOUND")
 
-        file_bytes = file_data.read()
-        file_size = len(file_bytes)
-        if file_size > MAX_FILE_SIZE_BYTES:
-            raise AppError(
-                FILE_TOO_LARGE_ERROR.format(max_size_mb=MAX_FILE_SIZE_BYTES // (1024 * 1024)),
-                "DOCUMENT.FILE_TOO_LARGE",
-                status_code=422,
-            )
         resolved_mime = self._resolve_mime(mime_type, filename)
 
-        next_version = doc.version + 1
-        storage_key = self._build_storage_key(
-            client_record_id=doc.client_record_id,
-            business_id=doc.business_id,
-            document_type=doc.document_type,
-            tax_year=doc.tax_year,
-            version=next_version,
-            filename=filename,
-        )
-        self.storage.upload(storage_key, io.BytesIO(file_bytes), resolved_mime)
-        doc.storage_key = storage_key
+        with self._hash_upload(file_data) as upload:
+            # A replace with unchanged content only moves the reference: no upload.
+            self.blobs.store(upload, resolved_mime)
+        self.blobs.release(doc.storage_key)
+        doc.storage_key = upload.storage_key
         doc.mime_type = resolved_mime
-        doc.file_size_bytes = file_size
+        doc.file_size_bytes = upload.size_bytes
+        doc.content_sha256 = upload.sha256
         doc.original_filename = filename
         doc.uploaded_at = utcnow()
         doc.uploaded_by = uploaded_by
         doc.is_present = True
-        doc.version = next_version
+        doc.version = doc.version + 1
         # explicit commit: storage upload already succeeded above
         self.db.commit()
         return doc
+
+
+def _download(doc: PermanentDocument) -> PresignedDownload:
+    # Blob keys are content hashes: the name and type to save as come from the row.
+    return PresignedDownload(doc.storage_key, doc.original_filename, doc.mime_type)
+
+
+def _file_too_large() -> AppError:
+    return AppError(
+        FILE_TOO_LARGE_ERROR.format(max_size_mb=MAX_FILE_SIZE_BYTES // (1024 * 1024)),
+        "DOCUMENT.FILE_TOO_LARGE",
+        status_code=422,
+    )
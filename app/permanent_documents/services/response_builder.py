@@ -12,7 +12,11 @@ class PermanentDocumentResponseBuilder:
     def build_one(self, document: PermanentDocument) -> PermanentDocumentResponse:
         return self.build_many([document])[0]
 
-    def build_many(self, documents: list[PermanentDocument]) -> list[PermanentDocumentResponse]:
+    def build_many(
+        self,
+        documents: list[PermanentDocument],
+        download_urls: dict[int, str] | None = None,
+    ) -> list[PermanentDocumentResponse]:
         client_ids = sorted({doc.client_record_id for doc in documents})
         clients = get_full_records_bulk(self.db, client_ids)
         responses: list[PermanentDocumentResponse] = []
@@ -20,5 +24,7 @@ class PermanentDocumentResponseBuilder:
             response = PermanentDocumentResponse.model_validate(doc)
             client = clients.get(doc.client_record_id)
             response.client_name = client["full_name"] if client else None
+            if download_urls is not None:
+                response.download_url = download_urls.get(doc.id)
             responses.append(response)
         return responses
@@ -3,6 +3,8 @@ from datetime import date
 from fastapi import APIRouter, Depends, Query
 from fastapi.responses import FileResponse
 
+from app.core.perf import query_budget
+from app.infrastructure.http_cache import ResponseCache, cached_response
 from app.reports.schemas import (
     AdvancePaymentCollectionsReportResponse,
     AgingReportResponse,
@@ -16,9 +18,11 @@ from app.reports.services.annual_report_status_report import (
 from app.reports.services.reports_export_service import ReportsExportService
 from app.reports.services.reports_service import AgingReportService
 from app.reports.services.vat_compliance_report import VatComplianceReportService
-from app.users.api.deps import DBSession, require_role
+from app.users.api.deps import DBSession, ExportDBSession, require_role
 from app.users.models.user import UserRole
 
+_CLIENT_TABLES = ("client_records", "legal_entities", "persons", "person_legal_entity_links")
+
 router = APIRouter(
     prefix="/reports",
     tags=["reports"],
@@ -30,9 +34,13 @@ router = APIRouter(
 def get_vat_compliance_report(
     db: DBSession,
     year: int = Query(...),
+    cache: ResponseCache = Depends(cached_response("vat_work_items", *_CLIENT_TABLES)),
 ):
+    cached = cache.lookup()
+    if cached is not None:
+        return cached
     service = VatComplianceReportService(db)
-    return service.get_vat_compliance_report(year)
+    return cache.store(service.get_vat_compliance_report(year))
 
 
 @router.get("/advance-payments", response_model=AdvancePaymentCollectionsReportResponse)
@@ -40,32 +48,45 @@ def get_advance_payment_report(
     db: DBSession,
     year: int = Query(...),
     month: int | None = Query(None),
+    cache: ResponseCache = Depends(cached_response("advance_payments", *_CLIENT_TABLES)),
 ):
+    cached = cache.lookup()
+    if cached is not None:
+        return cached
     service = AdvancePaymentReportService(db)
-    return service.get_collections_report(year, month)
+    return cache.store(service.get_collections_report(year, month))
 
 
 @router.get("/annual-reports", response_model=AnnualReportStatusReportResponse)
 def get_annual_report_status_report(
     db: DBSession,
     tax_year: int = Query(...),
+    cache: ResponseCache = Depends(cached_response("annual_reports", *_CLIENT_TABLES)),
 ):
+    cached = cache.lookup()
+    if cached is not None:
+        return cached
     service = AnnualReportStatusReportService(db)
-    return service.get_report(tax_year)
+    return cache.store(service.get_report(tax_year))
 
 
 @router.get("/aging", response_model=AgingReportResponse)
+@query_budget(12, max_repeated=5)
 def get_aging_report(
     db: DBSession,
     as_of_date: date | None = Query(None),
+    cache: ResponseCache = Depends(cached_response("charges", *_CLIENT_TABLES)),
 ):
+    cached = cache.lookup()
+    if cached is not None:
+        return cached
     service = AgingReportService(db)
-    return service.generate_aging_report(as_of_date=as_of_date)
+    return cache.store(service.generate_aging_report(as_of_date=as_of_date))
 
 
 @router.get("/aging/export")
 def export_aging_report(
-    db: DBSession,
+    db: ExportDBSession,
     format: str = Query(..., pattern="^(excel|pdf)$"),
     as_of_date: date | None = Query(None),
 ):
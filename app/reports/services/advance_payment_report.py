@@ -3,39 +3,29 @@ from sqlalchemy.orm import Session
 from app.advance_payments.repositories.advance_payment_aggregation_repository import (
     AdvancePaymentAggregationRepository,
 )
-from app.clients.repositories.client_record_repository import ClientRecordRepository
-from app.clients.repositories.legal_entity_repository import LegalEntityRepository
+from app.clients.repositories.client_identity_loader import ClientIdentityLoader
 
 
 class AdvancePaymentReportService:
     def __init__(self, db: Session):
         self.repo = AdvancePaymentAggregationRepository(db)
-        self.client_record_repo = ClientRecordRepository(db)
-        self.legal_entity_repo = LegalEntityRepository(db)
+        self.identity_loader = ClientIdentityLoader(db)
 
     def get_collections_report(self, year: int, month: int | None) -> dict:
         rows = self.repo.get_collections_aggregates(year, month)
-        client_record_ids = [row.client_record_id for row in rows]
-        records = {
-            record.id: record for record in self.client_record_repo.list_by_ids(client_record_ids)
-        }
-        legal_entities = {
-            legal_id: self.legal_entity_repo.get_by_id(legal_id)
-            for legal_id in {record.legal_entity_id for record in records.values()}
-        }
+        identities = self.identity_loader.load(row.client_record_id for row in rows)
 
         items = [
             {
                 "client_record_id": r.client_record_id,
                 "office_client_number": (
-                    records[r.client_record_id].office_client_number
-                    if r.client_record_id in records
+                    identities[r.client_record_id].office_client_number
+                    if r.client_record_id in identities
                     else None
                 ),
                 "client_name": (
-                    legal_entities[records[r.client_record_id].legal_entity_id].official_name
-                    if r.client_record_id in records
-                    and legal_entities.get(records[r.client_record_id].legal_entity_id)
+                    identities[r.client_record_id].official_name
+                    if r.client_record_id in identities
                     else f"לקוח #{r.client_record_id}"
                 ),
                 "total_expected": float(r.total_expected),
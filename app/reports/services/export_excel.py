@@ -8,7 +8,7 @@ from app.reports.constants import (
     AGING_REPORT_HEADERS,
     AGING_REPORT_TITLE,
 )
-from app.utils.excel import adjust_column_widths, save_workbook_to_temp
+from app.utils.excel import StreamingWorkbook, save_workbook_to_temp
 
 
 def export_aging_report_to_excel(report_data: dict, export_dir: str) -> dict[str, object]:
@@ -16,17 +16,10 @@ def export_aging_report_to_excel(report_data: dict, export_dir: str) -> dict[str
     Build an Excel file for the aging report.
     Returns download metadata.
     """
-    try:
-        import openpyxl
-        from openpyxl.styles import Alignment, Font, PatternFill
-    except ImportError as exc:
-        raise ImportError(
-            "הספרייה openpyxl נדרשת לצורך ייצוא לאקסל. יש להתקין באמצעות: pip install openpyxl"
-        ) from exc
+    wb = StreamingWorkbook()
+    from openpyxl.styles import Alignment, Font, PatternFill
 
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = AGING_REPORT_TITLE
+    ws = wb.add_sheet(AGING_REPORT_TITLE)
 
     header_fill = PatternFill(
         start_color=AGING_EXPORT_HEADER_COLOR,
@@ -36,47 +29,43 @@ def export_aging_report_to_excel(report_data: dict, export_dir: str) -> dict[str
     header_font = Font(bold=True, color="FFFFFF")
     header_alignment = Alignment(horizontal="center", vertical="center")
 
-    ws.merge_cells("A1:H1")
-    title_cell = ws["A1"]
-    title_cell.value = f"דוח חובות ללקוחות - {report_data['report_date']}"
-    title_cell.font = Font(bold=True, size=14)
-    title_cell.alignment = header_alignment
-
-    for col, header in enumerate(AGING_REPORT_HEADERS, start=1):
-        cell = ws.cell(row=3, column=col)
-        cell.value = header
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = header_alignment
+    ws.append(
+        [f"דוח חובות ללקוחות - {report_data['report_date']}"],
+        font=Font(bold=True, size=14),
+    )
+    ws.append([])
+    ws.append(
+        AGING_REPORT_HEADERS,
+        fill=header_fill,
+        font=header_font,
+        alignment=header_alignment,
+    )
 
-    row = 4
     for item in report_data["items"]:
-        ws.cell(row=row, column=1, value=item["client_name"])
-        ws.cell(row=row, column=2, value=item["total_outstanding"])
-        ws.cell(row=row, column=3, value=item["current"])
-        ws.cell(row=row, column=4, value=item["days_30"])
-        ws.cell(row=row, column=5, value=item["days_60"])
-        ws.cell(row=row, column=6, value=item["days_90_plus"])
-        ws.cell(
-            row=row,
-            column=7,
-            value=str(item["oldest_invoice_date"]) if item["oldest_invoice_date"] else "",
+        ws.append(
+            [
+                item["client_name"],
+                item["total_outstanding"],
+                item["current"],
+                item["days_30"],
+                item["days_60"],
+                item["days_90_plus"],
+                str(item["oldest_invoice_date"]) if item["oldest_invoice_date"] else "",
+                item["oldest_invoice_days"] or "",
+            ]
         )
-        ws.cell(row=row, column=8, value=item["oldest_invoice_days"] or "")
-        row += 1
 
-    row += 1
-    summary_cell = ws.cell(row=row, column=1)
-    summary_cell.value = "סיכום"
-    summary_cell.font = Font(bold=True)
-
-    ws.cell(row=row, column=2, value=report_data["total_outstanding"])
-    ws.cell(row=row, column=3, value=report_data["summary"]["total_current"])
-    ws.cell(row=row, column=4, value=report_data["summary"]["total_30_days"])
-    ws.cell(row=row, column=5, value=report_data["summary"]["total_60_days"])
-    ws.cell(row=row, column=6, value=report_data["summary"]["total_90_plus"])
-
-    adjust_column_widths(ws)
+    ws.append([])
+    ws.append(
+        [
+            ws.cell("סיכום", font=Font(bold=True)),
+            report_data["total_outstanding"],
+            report_data["summary"]["total_current"],
+            report_data["summary"]["total_30_days"],
+            report_data["summary"]["total_60_days"],
+            report_data["summary"]["total_90_plus"],
+        ]
+    )
 
     return save_workbook_to_temp(
         wb,
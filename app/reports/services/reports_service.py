@@ -3,8 +3,7 @@ from datetime import date
 from sqlalchemy.orm import Session
 
 from app.charge.repositories.charge_repository import ChargeRepository
-from app.clients.repositories.client_record_repository import ClientRecordRepository
-from app.clients.repositories.legal_entity_repository import LegalEntityRepository
+from app.clients.repositories.client_identity_loader import ClientIdentityLoader
 from app.reports.constants import AGING_CHARGE_FETCH_LIMIT
 
 
@@ -13,8 +12,7 @@ class AgingReportService:
 
     def __init__(self, db: Session):
         self.charge_repo = ChargeRepository(db)
-        self.client_record_repo = ClientRecordRepository(db)
-        self.legal_entity_repo = LegalEntityRepository(db)
+        self.identity_loader = ClientIdentityLoader(db)
 
     def generate_aging_report(
         self,
@@ -36,22 +34,14 @@ class AgingReportService:
         capped = len(all_rows) > AGING_CHARGE_FETCH_LIMIT
         rows = all_rows[:AGING_CHARGE_FETCH_LIMIT]
 
-        client_record_ids = [row.client_record_id for row in rows]
-        record_map = {
-            record.id: record for record in self.client_record_repo.list_by_ids(client_record_ids)
-        }
-        legal_map = {
-            legal_id: self.legal_entity_repo.get_by_id(legal_id)
-            for legal_id in {record.legal_entity_id for record in record_map.values()}
-        }
+        identities = self.identity_loader.load(row.client_record_id for row in rows)
 
         items = []
         total_outstanding = 0.0
 
         for row in rows:
-            record = record_map.get(row.client_record_id)
-            legal_entity = legal_map.get(record.legal_entity_id) if record else None
-            if not record or not legal_entity:
+            identity = identities.get(row.client_record_id)
+            if not identity:
                 continue
 
             oldest_date = row.oldest_issued_at.date() if row.oldest_issued_at else None
@@ -59,8 +49,8 @@ class AgingReportService:
 
             items.append(
                 {
-                    "client_record_id": record.id,
-                    "client_name": legal_entity.official_name,
+                    "client_record_id": identity.client_record_id,
+                    "client_name": identity.official_name,
                     "total_outstanding": round(float(row.total), 2),
                     "current": round(float(row.current), 2),
                     "days_30": round(float(row.days_30), 2),
@@ -1,10 +1,8 @@
 """VAT Compliance Report: per-client period coverage and stale pending flags."""
 
-from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.clients.models.legal_entity import LegalEntity
-from app.clients.repositories.client_record_repository import ClientRecordRepository
+from app.clients.repositories.client_identity_loader import ClientIdentityLoader
 from app.reports.constants import VAT_STALE_PENDING_DAYS
 from app.utils.time_utils import utcnow
 from app.vat_reports.repositories.vat_compliance_repository import (
@@ -16,7 +14,7 @@ class VatComplianceReportService:
     def __init__(self, db: Session):
         self.db = db
         self.repo = VatComplianceRepository(db)
-        self.client_repo = ClientRecordRepository(db)
+        self.identity_loader = ClientIdentityLoader(db)
 
     def get_vat_compliance_report(self, year: int) -> dict:
         rows = self.repo.get_compliance_aggregates(year)
@@ -92,16 +90,7 @@ class VatComplianceReportService:
         }
 
     def _client_name_map(self, client_record_ids: list[int]) -> dict[int, str]:
-        records = self.client_repo.list_by_ids(list(set(client_record_ids)))
-        legal_entity_ids = list({record.legal_entity_id for record in records})
-        entities = (
-            self.db.scalars(select(LegalEntity).where(LegalEntity.id.in_(legal_entity_ids))).all()
-            if legal_entity_ids
-            else []
-        )
-        entity_map = {entity.id: entity.official_name for entity in entities}
         return {
-            record.id: entity_map[record.legal_entity_id]
-            for record in records
-            if record.legal_entity_id in entity_map
+            client_id: identity.official_name
+            for client_id, identity in self.identity_loader.load(client_record_ids).items()
         }
@@ -11,6 +11,7 @@ from app.charge.api.routers import router as charge_router
 from app.clients.api.routers import router as clients_router
 from app.correspondence.api.routers import router as correspondence_router
 from app.dashboard.api.routers import router as dashboard_router
+from app.exports.api.routers import router as exports_router
 from app.health.api.routers import router as health_router
 from app.notes.api.routers import router as notes_router
 from app.notification.api.routers import router as notification_router
@@ -40,6 +41,7 @@ def register_routers(app: FastAPI) -> None:
     app.include_router(charge_router, prefix="/api/v1")
     app.include_router(permanent_documents_router, prefix="/api/v1")
     app.include_router(reports_router, prefix="/api/v1")
+    app.include_router(exports_router, prefix="/api/v1")
     app.include_router(timeline_router, prefix="/api/v1")
     app.include_router(search_router, prefix="/api/v1")
     app.include_router(reminders.router, prefix="/api/v1")
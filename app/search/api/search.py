@@ -3,6 +3,7 @@ from fastapi import APIRouter, Depends, Query
 from app.binders.models.binder import BinderCapacityStatus, BinderLocationStatus
 from app.clients.enums import ClientStatus
 from app.common.enums import EntityType
+from app.core.perf import query_budget
 from app.search.schemas.search import SearchResponse, SearchResult
 from app.search.services.search_service import SearchService
 from app.users.api.deps import CurrentUser, DBSession, require_role
@@ -16,6 +17,7 @@ router = APIRouter(
 
 
 @router.get("", response_model=SearchResponse)
+@query_budget(20, max_repeated=5)
 def search(
     db: DBSession,
     user: CurrentUser,
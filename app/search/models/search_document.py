@@ -0,0 +1,54 @@
+"""Search index documents.
+
+One row per searchable entity (client, binder, permanent document) holding the
+normalised text the unified search matches on (see `app.search.normalization`).
+Filters such as client status or binder location are not copied here: search
+queries join back to the live source tables, so only text needs to stay in
+sync. Rows are maintained by the session hook in `search_document_events`.
+
+On PostgreSQL the text columns carry pg_trgm GIN indexes, so the
+`LIKE '%term%'` matching is index-backed. Results are ranked with
+`ts_rank` + `similarity` (see the migration and `search_index_repository`).
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum as PyEnum
+from importlib import import_module
+
+from sqlalchemy import Index, String, Text, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.utils.time_utils import utcnow
+
+
+class SearchEntityType(str, PyEnum):
+    CLIENT = "client"
+    BINDER = "binder"
+    PERMANENT_DOCUMENT = "permanent_document"
+
+
+class SearchDocument(Base):
+    __tablename__ = "search_documents"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    entity_type: Mapped[str] = mapped_column(String(30), nullable=False)
+    entity_id: Mapped[int] = mapped_column(nullable=False)
+    client_record_id: Mapped[int | None] = mapped_column(nullable=True)
+    # Client: official name · binder: binder number · document: original filename.
+    name_norm: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    # Client: id number · binder: binder number · document: document type.
+    identifier_norm: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    # Everything a free-text query may hit (clients also carry office number and business names).
+    search_text: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    updated_at: Mapped[datetime] = mapped_column(default=utcnow, onupdate=utcnow, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("entity_type", "entity_id", name="uq_search_documents_entity"),
+        Index("idx_search_documents_client", "client_record_id"),
+    )
+
+
+import_module("app.search.models.search_document_events")
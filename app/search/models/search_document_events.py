@@ -0,0 +1,62 @@
+"""Session events keeping `search_documents` in step with the searchable rows.
+
+After every flush the index rows of touched clients, binders and permanent
+documents are rewritten from the just-flushed state using plain Core
+statements on the same connection, so the index commits or rolls back together
+with the write that changed it. Legal-entity and business changes re-index the
+clients they belong to (official name, id number and business names live in the
+client row's text).
+"""
+
+from __future__ import annotations
+
+from itertools import chain
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.binders.models.binder import Binder
+from app.businesses.models.business import Business
+from app.clients.models.client_record import ClientRecord
+from app.clients.models.legal_entity import LegalEntity
+from app.permanent_documents.models.permanent_document import PermanentDocument
+
+_INDEXED_MODELS = (ClientRecord, LegalEntity, Business, Binder, PermanentDocument)
+
+
+def _legal_entity_ids(business: Business) -> set[int]:
+    """Current and pre-flush owner of a business."""
+    history = inspect(business).attrs["legal_entity_id"].history
+    values = {business.legal_entity_id, *history.deleted}
+    return {value for value in values if value is not None}
+
+
+@event.listens_for(Session, "after_flush")
+def _sync_search_index(session: Session, _flush_context) -> None:
+    client_record_ids: set[int] = set()
+    legal_entity_ids: set[int] = set()
+    binder_ids: set[int] = set()
+    document_ids: set[int] = set()
+    for target in chain(session.new, session.dirty, session.deleted):
+        if not isinstance(target, _INDEXED_MODELS):
+            continue
+        if isinstance(target, ClientRecord):
+            client_record_ids.add(target.id)
+        elif isinstance(target, LegalEntity):
+            legal_entity_ids.add(target.id)
+        elif isinstance(target, Business):
+            legal_entity_ids |= _legal_entity_ids(target)
+        elif isinstance(target, Binder):
+            binder_ids.add(target.id)
+        else:
+            document_ids.add(target.id)
+    if not (client_record_ids or legal_entity_ids or binder_ids or document_ids):
+        return
+
+    from app.search.repositories.search_index_repository import SearchIndexRepository
+
+    repo = SearchIndexRepository(session)
+    client_record_ids.update(repo.client_ids_for_legal_entities(legal_entity_ids))
+    repo.refresh_clients(client_record_ids)
+    repo.refresh_binders(binder_ids)
+    repo.refresh_documents(document_ids)
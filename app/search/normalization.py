@@ -0,0 +1,34 @@
+"""Text normalisation shared by the search index writer and query terms.
+
+Both sides go through `normalize_search_text`, so matching is a plain substring
+test on normalised text:
+
+- Unicode NFKC + casefold (Latin case, full-width digits).
+- Hebrew niqqud and cantillation marks are dropped ("שָׁלוֹם" → "שלום").
+- Final letter forms fold to their regular form (ך→כ, ם→מ, ן→נ, ף→פ, ץ→צ), so a
+  prefix typed mid-word still matches ("שלו" matches "שלום").
+- Geresh/gershayim and ASCII quotes are removed ('בע"מ' → "בעמ").
+- Any other punctuation becomes a space; whitespace runs collapse.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+
+_FINAL_LETTERS = str.maketrans({"ך": "כ", "ם": "מ", "ן": "נ", "ף": "פ", "ץ": "צ"})
+_QUOTES = re.compile("[\"'`\u05f3\u05f4\u2018\u2019\u201c\u201d]")
+# Niqqud and cantillation points; the punctuation in the same block is left alone.
+_HEBREW_MARKS = re.compile("[\u0591-\u05bd\u05bf\u05c1\u05c2\u05c4\u05c5\u05c7]")
+_SEPARATORS = re.compile(r"[^\w]+")
+
+
+def normalize_search_text(*parts: object) -> str:
+    """Normalise and space-join the non-empty parts."""
+    text = " ".join(str(part) for part in parts if part is not None and part != "")
+    text = unicodedata.normalize("NFKC", text).casefold()
+    text = _HEBREW_MARKS.sub("", text)
+    text = _QUOTES.sub("", text)
+    text = text.translate(_FINAL_LETTERS)
+    text = _SEPARATORS.sub(" ", text).replace("_", " ")
+    return " ".join(text.split())
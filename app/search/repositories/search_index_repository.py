@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from sqlalchemy import Float, delete, func, insert, literal, select, union_all
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import FunctionElement
+
+from app.binders.models.binder import (
+    Binder,
+    BinderCapacityStatus,
+    BinderLocationStatus,
+)
+from app.businesses.models.business import Business
+from app.clients.enums import ClientStatus
+from app.clients.models.client_record import ClientRecord
+from app.clients.models.legal_entity import LegalEntity
+from app.clients.repositories.active_client_scope import scope_to_active_clients_stmt
+from app.common.enums import EntityType
+from app.permanent_documents.models.permanent_document import PermanentDocument
+from app.search.models.search_document import SearchDocument, SearchEntityType
+from app.search.normalization import normalize_search_text
+
+
+class search_rank(FunctionElement):
+    """Relevance of `text` for an already-normalised `term`; higher is better."""
+
+    type = Float()
+    inherit_cache = True
+    name = "search_rank"
+
+
+@compiles(search_rank)
+def _search_rank_default(element, compiler, **kw):
+    text, term = (compiler.process(arg, **kw) for arg in element.clauses)
+    return (
+        f"(ts_rank(to_tsvector('simple', {text}), plainto_tsquery('simple', {term}))"
+        f" + similarity({text}, {term}))"
+    )
+
+
+@compiles(search_rank, "sqlite")
+def _search_rank_sqlite(element, compiler, **kw):
+    text, term = (compiler.process(arg, **kw) for arg in element.clauses)
+    return f"(CASE WHEN {text} = {term} THEN 2 WHEN {text} LIKE {term} || '%' THEN 1 ELSE 0 END)"
+
+
+@dataclass(frozen=True)
+class SearchFilters:
+    query: str | None = None
+    client_name: str | None = None
+    id_number: str | None = None
+    binder_number: str | None = None
+    client_status: ClientStatus | None = None
+    entity_type: EntityType | None = None
+    binder_location_status: BinderLocationStatus | None = None
+    binder_capacity_status: BinderCapacityStatus | None = None
+
+    @property
+    def has_client_filter(self) -> bool:
+        return bool(
+            self.query or self.client_name or self.id_number or self.client_status or self.entity_type
+        )
+
+    @property
+    def has_binder_filter(self) -> bool:
+        return bool(
+            self.query
+            or self.binder_number
+            or self.binder_location_status
+            or self.binder_capacity_status
+        )
+
+    @property
+    def binder_term(self) -> str | None:
+        # A free-text query doubles as a binder-number filter unless a client field is targeted.
+        return self.binder_number or (
+            self.query if not (self.client_name or self.id_number) else None
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class SearchHit:
+    result_type: str
+    entity_id: int
+
+
+def _contains(column, value: str | None):
+    return column.like(f"%{normalize_search_text(value)}%")
+
+
+def _rank(column, value: str | None):
+    term = normalize_search_text(value) if value else ""
+    if not term:
+        return literal(0)
+    return search_rank(column, term)
+
+
+class SearchIndexRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    # ── Querying ──────────────────────────────────────────────────────────────
+
+    def search(
+        self, filters: SearchFilters, *, page: int, page_size: int
+    ) -> tuple[list[SearchHit], int]:
+        """Ranked, DB-paginated client and binder hits with the exact total."""
+        branches = []
+        if filters.has_client_filter:
+            branches.append(self._client_branch(filters))
+        if filters.has_binder_filter:
+            branches.append(self._binder_branch(filters))
+        if not branches:
+            return [], 0
+        rows = union_all(*branches).subquery("search_hits")
+        total = self.db.scalar(select(func.count()).select_from(rows)) or 0
+        stmt = (
+            select(rows.c.result_type, rows.c.entity_id)
+            .order_by(
+                rows.c.rank.desc(),
+                rows.c.kind_order,
+                rows.c.sort_name,
+                rows.c.entity_id,
+            )
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+        )
+        hits = [SearchHit(row.result_type, row.entity_id) for row in self.db.execute(stmt)]
+        return hits, total
+
+    def search_document_ids(
+        self, query: str | None, *, filename: str | None = None, limit: int
+    ) -> list[int]:
+        """Current (not deleted, not superseded) documents, best match first."""
+        stmt = (
+            select(SearchDocument.entity_id)
+            .join(PermanentDocument, PermanentDocument.id == SearchDocument.entity_id)
+            .where(
+                SearchDocument.entity_type == SearchEntityType.PERMANENT_DOCUMENT.value,
+                PermanentDocument.is_deleted.is_(False),
+                PermanentDocument.superseded_by.is_(None),
+            )
+        )
+        if filename and not query:
+            stmt = stmt.where(_contains(SearchDocument.name_norm, filename))
+            rank = _rank(SearchDocument.name_norm, filename)
+        else:
+            stmt = stmt.where(_contains(SearchDocument.search_text, query))
+            rank = _rank(SearchDocument.name_norm, query)
+        stmt = stmt.order_by(rank.desc(), PermanentDocument.uploaded_at.desc()).limit(limit)
+        return list(self.db.scalars(stmt))
+
+    def _client_branch(self, filters: SearchFilters):
+        if filters.query or filters.client_name:
+            rank = _rank(SearchDocument.name_norm, filters.query or filters.client_name)
+        else:
+            rank = _rank(SearchDocument.identifier_norm, filters.id_number)
+        stmt = (
+            select(
+                literal("client").label("result_type"),
+                SearchDocument.entity_id.label("entity_id"),
+                rank.label("rank"),
+                literal(0).label("kind_order"),
+                SearchDocument.name_norm.label("sort_name"),
+            )
+            .join(ClientRecord, ClientRecord.id == SearchDocument.entity_id)
+            .join(LegalEntity, LegalEntity.id == ClientRecord.legal_entity_id)
+            .where(
+                SearchDocument.entity_type == SearchEntityType.CLIENT.value,
+                ClientRecord.deleted_at.is_(None),
+            )
+        )
+        if filters.query:
+            stmt = stmt.where(_contains(SearchDocument.search_text, filters.query))
+        if filters.client_name:
+            stmt = stmt.where(_contains(SearchDocument.name_norm, filters.client_name))
+        if filters.id_number:
+            stmt = stmt.where(_contains(SearchDocument.identifier_norm, filters.id_number))
+        if filters.client_status:
+            stmt = stmt.where(ClientRecord.status == filters.client_status)
+        if filters.entity_type is not None:
+            stmt = stmt.where(LegalEntity.entity_type == filters.entity_type)
+        return stmt
+
+    def _binder_branch(self, filters: SearchFilters):
+        term = filters.binder_term
+        stmt = select(
+            literal("binder").label("result_type"),
+            SearchDocument.entity_id.label("entity_id"),
+            _rank(SearchDocument.identifier_norm, term).label("rank"),
+            literal(1).label("kind_order"),
+            SearchDocument.name_norm.label("sort_name"),
+        ).join(Binder, Binder.id == SearchDocument.entity_id)
+        stmt = scope_to_active_clients_stmt(stmt, Binder).where(
+            SearchDocument.entity_type == SearchEntityType.BINDER.value,
+            Binder.deleted_at.is_(None),
+        )
+        location_status = filters.binder_location_status
+        if location_status != BinderLocationStatus.HANDED_OVER:
+            stmt = stmt.where(Binder.location_status != BinderLocationStatus.HANDED_OVER)
+        if location_status:
+            stmt = stmt.where(Binder.location_status == location_status)
+        if filters.binder_capacity_status:
+            stmt = stmt.where(Binder.capacity_status == filters.binder_capacity_status)
+        if term:
+            stmt = stmt.where(_contains(SearchDocument.identifier_norm, term))
+        return stmt
+
+    # ── Index maintenance ─────────────────────────────────────────────────────
+
+    def rebuild(self) -> int:
+        self.db.execute(delete(SearchDocument.__table__))
+        client_ids = self.db.scalars(select(ClientRecord.id)).all()
+        binder_ids = self.db.scalars(select(Binder.id)).all()
+        document_ids = self.db.scalars(select(PermanentDocument.id)).all()
+        self.refresh_clients(client_ids)
+        self.refresh_binders(binder_ids)
+        self.refresh_documents(document_ids)
+        return len(client_ids) + len(binder_ids) + len(document_ids)
+
+    def client_ids_for_legal_entities(self, legal_entity_ids: Iterable[int]) -> list[int]:
+        ids = set(legal_entity_ids)
+        if not ids:
+            return []
+        return list(
+            self.db.scalars(select(ClientRecord.id).where(ClientRecord.legal_entity_id.in_(ids)))
+        )
+
+    def refresh_clients(self, client_record_ids: Iterable[int]) -> None:
+        ids = set(client_record_ids)
+        if not ids:
+            return
+        rows = self.db.execute(
+            select(
+                ClientRecord.id,
+                ClientRecord.legal_entity_id,
+                ClientRecord.office_client_number,
+                LegalEntity.official_name,
+                LegalEntity.id_number,
+            )
+            .join(LegalEntity, LegalEntity.id == ClientRecord.legal_entity_id)
+            .where(ClientRecord.id.in_(ids))
+        ).all()
+        business_names: dict[int, list[str]] = {}
+        legal_entity_ids = {row.legal_entity_id for row in rows}
+        if legal_entity_ids:
+            for legal_entity_id, business_name in self.db.execute(
+                select(Business.legal_entity_id, Business.business_name).where(
+                    Business.legal_entity_id.in_(legal_entity_ids),
+                    Business.deleted_at.is_(None),
+                    Business.business_name.isnot(None),
+                )
+            ):
+                business_names.setdefault(legal_entity_id, []).append(business_name)
+        self._replace(
+            SearchEntityType.CLIENT,
+            ids,
+            [
+                {
+                    "entity_id": row.id,
+                    "client_record_id": row.id,
+                    "name_norm": normalize_search_text(row.official_name),
+                    "identifier_norm": normalize_search_text(row.id_number),
+                    "search_text": normalize_search_text(
+                        row.official_name,
+                        row.id_number,
+                        row.office_client_number,
+                        *business_names.get(row.legal_entity_id, []),
+                    ),
+                }
+                for row in rows
+            ],
+        )
+
+    def refresh_binders(self, binder_ids: Iterable[int]) -> None:
+        ids = set(binder_ids)
+        if not ids:
+            return
+        rows = self.db.execute(
+            select(Binder.id, Binder.client_record_id, Binder.binder_number).where(
+                Binder.id.in_(ids)
+            )
+        ).all()
+        self._replace(
+            SearchEntityType.BINDER,
+            ids,
+            [
+                {
+                    "entity_id": row.id,
+                    "client_record_id": row.client_record_id,
+                    "name_norm": normalize_search_text(row.binder_number),
+                    "identifier_norm": normalize_search_text(row.binder_number),
+                    "search_text": normalize_search_text(row.binder_number),
+                }
+                for row in rows
+            ],
+        )
+
+    def refresh_documents(self, document_ids: Iterable[int]) -> None:
+        ids = set(document_ids)
+        if not ids:
+            return
+        rows = self.db.execute(
+            select(
+                PermanentDocument.id,
+                PermanentDocument.client_record_id,
+                PermanentDocument.original_filename,
+                PermanentDocument.document_type,
+            ).where(PermanentDocument.id.in_(ids))
+        ).all()
+        self._replace(
+            SearchEntityType.PERMANENT_DOCUMENT,
+            ids,
+            [
+                {
+                    "entity_id": row.id,
+                    "client_record_id": row.client_record_id,
+                    "name_norm": normalize_search_text(row.original_filename),
+                    "identifier_norm": normalize_search_text(_enum_value(row.document_type)),
+                    "search_text": normalize_search_text(
+                        row.original_filename, _enum_value(row.document_type)
+                    ),
+                }
+                for row in rows
+            ],
+        )
+
+    def _replace(self, entity_type: SearchEntityType, ids: set[int], documents: list[dict]) -> None:
+        # Core statements only: this also runs from inside a flush (see search_document_events).
+        table = SearchDocument.__table__
+        self.db.execute(
+            delete(table).where(
+                table.c.entity_type == entity_type.value,
+                table.c.entity_id.in_(ids),
+            )
+        )
+        if documents:
+            self.db.execute(
+                insert(table),
+                [{"entity_type": entity_type.value, **document} for document in documents],
+            )
+
+
+def _enum_value(value) -> str | None:
+    return getattr(value, "value", value)
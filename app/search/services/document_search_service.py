@@ -1,10 +1,11 @@
 from sqlalchemy.orm import Session
 
-from app.businesses.repositories.business_repository import BusinessRepository
-from app.clients.repositories.client_record_read_repository import get_full_records_bulk
+from app.clients.repositories.client_identity_loader import ClientIdentityLoader
+from app.permanent_documents.models.permanent_document import PermanentDocument
 from app.permanent_documents.repositories.permanent_document_repository import (
     PermanentDocumentRepository,
 )
+from app.search.repositories.search_index_repository import SearchIndexRepository
 from app.search.schemas.search import DocumentSearchResult
 
 _DOCUMENT_SEARCH_LIMIT = 50
@@ -16,62 +17,55 @@ class DocumentSearchService:
     def __init__(self, db: Session):
         self.db = db
         self.doc_repo = PermanentDocumentRepository(db)
-        self.business_repo = BusinessRepository(db)
+        self.identity_loader = ClientIdentityLoader(db)
+        self.index_repo = SearchIndexRepository(db)
 
     def search_documents(
         self, query: str, filename: str | None = None
     ) -> list[DocumentSearchResult]:
-        if filename and not query:
-            docs = self.doc_repo.search_by_filename(filename, limit=_DOCUMENT_SEARCH_LIMIT)
-        else:
-            docs = self.doc_repo.search_by_query(query, limit=_DOCUMENT_SEARCH_LIMIT)
-        business_cache: dict[int, str] = {}
-        client_map = get_full_records_bulk(self.db, [doc.client_record_id for doc in docs])
+        doc_ids = self.index_repo.search_document_ids(
+            query, filename=filename, limit=_DOCUMENT_SEARCH_LIMIT
+        )
+        docs_by_id = {doc.id: doc for doc in self.doc_repo.list_by_ids(doc_ids)}
+        docs = [docs_by_id[doc_id] for doc_id in doc_ids if doc_id in docs_by_id]
+        return self._build_results(docs, unknown_business_name="לא ידוע")
+
+    def list_client_documents(
+        self, client_record_id: int, query: str
+    ) -> list[DocumentSearchResult]:
+        docs = self.doc_repo.list_by_client_record(client_record_id)
+        term = query.strip().lower()
+        return self._build_results(
+            [
+                doc
+                for doc in docs
+                if term in (doc.original_filename or "").lower()
+                or term in str(doc.document_type).lower()
+            ]
+        )
+
+    def _build_results(
+        self, docs: list[PermanentDocument], *, unknown_business_name: str | None = None
+    ) -> list[DocumentSearchResult]:
+        clients = self.identity_loader.load(doc.client_record_id for doc in docs)
+        businesses = self.identity_loader.load_businesses(doc.business_id for doc in docs)
         results = []
         for doc in docs:
-            if doc.business_id and doc.business_id not in business_cache:
-                business = self.business_repo.get_by_id(doc.business_id)
-                business_cache[doc.business_id] = business.full_name if business else "לא ידוע"
-            client = client_map.get(doc.client_record_id)
+            client = clients.get(doc.client_record_id)
+            business = businesses.get(doc.business_id)
             results.append(
                 DocumentSearchResult(
                     id=doc.id,
                     client_record_id=doc.client_record_id,
-                    office_client_number=client["office_client_number"] if client else None,
-                    client_name=client["full_name"] if client else "לא ידוע",
+                    office_client_number=client.office_client_number if client else None,
+                    client_name=client.display_name if client else "לא ידוע",
                     business_id=doc.business_id,
-                    business_name=business_cache.get(doc.business_id),
+                    business_name=business.full_name
+                    if business
+                    else (unknown_business_name if doc.business_id else None),
                     document_type=doc.document_type,
                     original_filename=doc.original_filename,
                     tax_year=doc.tax_year,
                 )
             )
         return results
-
-    def list_client_documents(
-        self, client_record_id: int, query: str
-    ) -> list[DocumentSearchResult]:
-        docs = self.doc_repo.list_by_client_record(client_record_id)
-        term = query.strip().lower()
-        client_map = get_full_records_bulk(self.db, [client_record_id])
-        client = client_map.get(client_record_id)
-        return [
-            DocumentSearchResult(
-                id=doc.id,
-                client_record_id=doc.client_record_id,
-                office_client_number=client["office_client_number"] if client else None,
-                client_name=client["full_name"] if client else "לא ידוע",
-                business_id=doc.business_id,
-                business_name=(
-                    self.business_repo.get_by_id(doc.business_id).full_name
-                    if doc.business_id and self.business_repo.get_by_id(doc.business_id)
-                    else None
-                ),
-                document_type=doc.document_type,
-                original_filename=doc.original_filename,
-                tax_year=doc.tax_year,
-            )
-            for doc in docs
-            if term in (doc.original_filename or "").lower()
-            or term in str(doc.document_type).lower()
-        ]
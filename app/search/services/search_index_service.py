@@ -0,0 +1,20 @@
+from sqlalchemy.orm import Session
+
+from app.common.services.base_service import BaseService
+from app.core.logging_config import get_logger
+from app.search.repositories.search_index_repository import SearchIndexRepository
+
+logger = get_logger(__name__)
+
+
+class SearchIndexService(BaseService):
+    """Rebuilds the `search_documents` index from the source tables."""
+
+    def __init__(self, db: Session):
+        super().__init__(db)
+        self.repo = SearchIndexRepository(db)
+
+    def rebuild(self) -> int:
+        count = self.repo.rebuild()
+        logger.info("Search index rebuilt: %d document(s)", count)
+        return count
@@ -2,36 +2,29 @@ from sqlalchemy.orm import Session
 
 from app.binders.models.binder import BinderCapacityStatus, BinderLocationStatus
 from app.binders.repositories.binder_repository import BinderRepository
-from app.businesses.repositories.business_repository import BusinessRepository
 from app.clients.enums import ClientStatus
-from app.clients.repositories.client_record_repository import ClientRecordRepository
-from app.clients.repositories.legal_entity_repository import LegalEntityRepository
+from app.clients.repositories.client_identity_loader import ClientIdentityLoader
 from app.common.enums import EntityType
+from app.search.repositories.search_index_repository import (
+    SearchFilters,
+    SearchIndexRepository,
+)
 from app.search.schemas.search import DocumentSearchResult
 from app.search.services.document_search_service import DocumentSearchService
 
-# Safety ceiling for mixed searches that must be resolved in memory.
-# Pure client-only searches already use DB-level pagination and are not affected.
-# Known architectural debt — see CLAUDE.md.
-_MIXED_SEARCH_BINDER_LIMIT = 1000
-_MIXED_SEARCH_CLIENT_LIMIT = 500
-
 
 class SearchService:
-    """Unified search for clients and binders."""
+    """Unified search for clients and binders.
+
+    Matching, ranking and pagination run against the `search_documents` index;
+    only the hits on the requested page are hydrated into result rows.
+    """
 
     def __init__(self, db: Session):
         self.db = db
-        self.client_record_repo = ClientRecordRepository(db)
-        self.legal_entity_repo = LegalEntityRepository(db)
-        self.business_repo = BusinessRepository(db)
+        self.identity_loader = ClientIdentityLoader(db)
         self.binder_repo = BinderRepository(db)
-
-    def _legal_entity_map(self, legal_entity_ids: list[int]) -> dict[int, object]:
-        return {
-            legal_id: self.legal_entity_repo.get_by_id(legal_id)
-            for legal_id in set(legal_entity_ids)
-        }
+        self.index_repo = SearchIndexRepository(db)
 
     def search(
         self,
@@ -51,123 +44,72 @@ class SearchService:
         documents: list[DocumentSearchResult] = (
             doc_service.search_documents(query, filename=filename) if (query or filename) else []
         )
-
-        has_client_filter = bool(query or client_name or id_number or client_status or entity_type)
-        has_binder_filter = bool(
-            query or binder_number or binder_location_status or binder_capacity_status
-        )
-
-        # --- Pure client-only search: DB-level pagination ---
-        if has_client_filter and not has_binder_filter:
-            records, total = self.client_record_repo.search(
+        hits, total = self.index_repo.search(
+            SearchFilters(
                 query=query,
                 client_name=client_name,
                 id_number=id_number,
-                status=client_status,
+                binder_number=binder_number,
+                client_status=client_status,
                 entity_type=entity_type,
-                page=page,
-                page_size=page_size,
-            )
-            legal_map = self._legal_entity_map([record.legal_entity_id for record in records])
-            binder_map = self.binder_repo.map_active_by_clients([record.id for record in records])
-            return (
-                [
-                    {
-                        "result_type": "client",
-                        "client_id": record.id,
-                        "office_client_number": record.office_client_number,
-                        "client_name": legal_map[record.legal_entity_id].official_name
-                        if legal_map.get(record.legal_entity_id)
-                        else "לא ידוע",
-                        "id_number": legal_map[record.legal_entity_id].id_number
-                        if legal_map.get(record.legal_entity_id)
-                        else None,
-                        "client_status": record.status,
-                        "binder_id": binder_map[record.id].id if record.id in binder_map else None,
-                        "binder_number": binder_map[record.id].binder_number
-                        if record.id in binder_map
-                        else None,
-                    }
-                    for record in records
-                ],
-                total,
-                documents,
-            )
-
-        # --- Mixed / binder-number search: build full result set then paginate ---
-        # Bounded by _MIXED_SEARCH_*_LIMIT. Results beyond ceiling are excluded.
-        results: list[dict] = []
-
-        if has_client_filter:
-            all_records, _ = self.client_record_repo.search(
-                query=query,
-                client_name=client_name,
-                id_number=id_number,
-                status=client_status,
-                entity_type=entity_type,
-                page=1,
-                page_size=_MIXED_SEARCH_CLIENT_LIMIT,
-            )
-            legal_map = self._legal_entity_map([record.legal_entity_id for record in all_records])
-            client_binder_map = self.binder_repo.map_active_by_clients(
-                [record.id for record in all_records]
-            )
-            for record in all_records:
-                b = client_binder_map.get(record.id)
-                legal_entity = legal_map.get(record.legal_entity_id)
-                results.append(
-                    {
-                        "result_type": "client",
-                        "client_id": record.id,
-                        "office_client_number": record.office_client_number,
-                        "client_name": legal_entity.official_name if legal_entity else "לא ידוע",
-                        "id_number": legal_entity.id_number if legal_entity else None,
-                        "client_status": record.status,
-                        "binder_id": b.id if b else None,
-                        "binder_number": b.binder_number if b else None,
-                    }
-                )
+                binder_location_status=binder_location_status,
+                binder_capacity_status=binder_capacity_status,
+            ),
+            page=page,
+            page_size=page_size,
+        )
+        client_rows = self._client_results(
+            [hit.entity_id for hit in hits if hit.result_type == "client"]
+        )
+        binder_rows = self._binder_results(
+            [hit.entity_id for hit in hits if hit.result_type == "binder"]
+        )
+        rows_by_hit = {**client_rows, **binder_rows}
+        results = [
+            rows_by_hit[(hit.result_type, hit.entity_id)]
+            for hit in hits
+            if (hit.result_type, hit.entity_id) in rows_by_hit
+        ]
+        return results, total, documents
 
-        if has_binder_filter:
-            db_binder_number = binder_number or (query if not (client_name or id_number) else None)
-            include_handed_over = binder_location_status == BinderLocationStatus.HANDED_OVER
-            binders = self.binder_repo.list_active(
-                binder_number=db_binder_number,
-                location_status=binder_location_status.value if binder_location_status else None,
-                capacity_status=binder_capacity_status.value if binder_capacity_status else None,
-                page=1,
-                page_size=_MIXED_SEARCH_BINDER_LIMIT,
-                include_handed_over=include_handed_over,
-            )
-            binder_cr_ids = [b.client_record_id for b in binders]
-            records = {
-                record.id: record for record in self.client_record_repo.list_by_ids(binder_cr_ids)
+    def _client_results(self, client_record_ids: list[int]) -> dict[tuple[str, int], dict]:
+        identities = self.identity_loader.load(client_record_ids)
+        binder_map = self.binder_repo.map_active_by_clients(list(identities))
+        results = {}
+        for client_id, identity in identities.items():
+            binder = binder_map.get(client_id)
+            results[("client", client_id)] = {
+                "result_type": "client",
+                "client_id": client_id,
+                "office_client_number": identity.office_client_number,
+                "client_name": identity.official_name,
+                "id_number": identity.id_number,
+                "client_status": identity.status,
+                "binder_id": binder.id if binder else None,
+                "binder_number": binder.binder_number if binder else None,
             }
-            cr_to_legal = {record.id: record.legal_entity_id for record in records.values()}
-            legal_entity_ids = list(cr_to_legal.values())
-            legal_map = self._legal_entity_map(legal_entity_ids)
-            businesses = self.business_repo.list_by_legal_entity_ids(legal_entity_ids)
-            legal_to_business = {b.legal_entity_id: b for b in businesses}
-            for binder in binders:
-                record = records.get(binder.client_record_id)
-                legal_id = cr_to_legal.get(binder.client_record_id)
-                business = legal_to_business.get(legal_id) if legal_id else None
-                legal_entity = legal_map.get(legal_id) if legal_id else None
-                results.append(
-                    {
-                        "result_type": "binder",
-                        "client_id": binder.client_record_id,
-                        "office_client_number": record.office_client_number if record else None,
-                        "client_name": business.full_name
-                        if business
-                        else (legal_entity.official_name if legal_entity else "לא ידוע"),
-                        "id_number": legal_entity.id_number if legal_entity else None,
-                        "client_status": record.status if record else None,
-                        "binder_id": binder.id,
-                        "binder_number": binder.binder_number,
-                    }
-                )
+        return results
 
-        total = len(results)
-        offset = (page - 1) * page_size
-        return results[offset : offset + page_size], total, documents
+    def _binder_results(self, binder_ids: list[int]) -> dict[tuple[str, int], dict]:
+        binders = self.binder_repo.get_by_ids(binder_ids).values()
+        identities = self.identity_loader.load(binder.client_record_id for binder in binders)
+        businesses = self.identity_loader.load_primary_businesses(
+            identity.legal_entity_id for identity in identities.values()
+        )
+        results = {}
+        for binder in binders:
+            identity = identities.get(binder.client_record_id)
+            business = businesses.get(identity.legal_entity_id) if identity else None
+            results[("binder", binder.id)] = {
+                "result_type": "binder",
+                "client_id": binder.client_record_id,
+                "office_client_number": identity.office_client_number if identity else None,
+                "client_name": business.full_name
+                if business
+                else (identity.official_name if identity else "לא ידוע"),
+                "id_number": identity.id_number if identity else None,
+                "client_status": identity.status if identity else None,
+                "binder_id": binder.id,
+                "binder_number": binder.binder_number,
+            }
+        return results
@@ -101,6 +101,8 @@ class TaskRepository(BaseRepository[Task]):
         stmt = select(Task).where(Task.deleted_at.is_(None))
         if not include_history:
             stmt = stmt.where(Task.status == TaskStatus.OPEN)
+        # Earliest due date first so merged source rows list their most urgent task first.
+        stmt = stmt.order_by(Task.due_date.is_(None), Task.due_date, Task.id)
         return list(self.db.scalars(stmt).all())
 
     def list_by_ids(self, task_ids: set[int]) -> list[Task]:
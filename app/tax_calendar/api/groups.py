@@ -1,6 +1,8 @@
 from fastapi import APIRouter, Depends, Query
 
 from app.common.enums import ObligationType
+from app.core.perf import query_budget
+from app.infrastructure.http_cache import ResponseCache, cached_response
 from app.tax_calendar.schemas.grouped import (
     TaxCalendarGroupItemsResponse,
     TaxCalendarGroupListResponse,
@@ -10,6 +12,15 @@ from app.tax_calendar.services.grouped_service import list_groups_paginated
 from app.users.api.deps import DBSession, require_role
 from app.users.models.user import UserRole
 
+_GROUP_TABLES = (
+    "tax_calendar_entries",
+    "vat_work_items",
+    "advance_payments",
+    "annual_reports",
+    "client_records",
+    "legal_entities",
+)
+
 router = APIRouter(prefix="/tax-calendar", tags=["tax-calendar"])
 
 
@@ -18,6 +29,7 @@ router = APIRouter(prefix="/tax-calendar", tags=["tax-calendar"])
     response_model=TaxCalendarGroupListResponse,
     dependencies=[Depends(require_role(UserRole.ADVISOR, UserRole.SECRETARY))],
 )
+@query_budget(8, max_repeated=2)
 def list_tax_calendar_groups(
     db: DBSession,
     start_year: int | None = Query(None),
@@ -29,8 +41,12 @@ def list_tax_calendar_groups(
     status: str = Query("all", pattern="^(all|open|overdue|done)$"),
     page: int = Query(1, ge=1),
     page_size: int = Query(25, ge=1, le=100),
+    cache: ResponseCache = Depends(cached_response(*_GROUP_TABLES)),
 ):
-    return list_groups_paginated(
+    cached = cache.lookup()
+    if cached is not None:
+        return cached
+    result = list_groups_paginated(
         db,
         start_year=start_year,
         end_year=end_year,
@@ -42,6 +58,7 @@ def list_tax_calendar_groups(
         page=page,
         page_size=page_size,
     )
+    return cache.store(result)
 
 
 @router.get(
@@ -49,6 +66,7 @@ def list_tax_calendar_groups(
     response_model=TaxCalendarGroupItemsResponse,
     dependencies=[Depends(require_role(UserRole.ADVISOR, UserRole.SECRETARY))],
 )
+@query_budget(8, max_repeated=2)
 def get_tax_calendar_group_items(
     tax_calendar_entry_id: int,
     db: DBSession,
@@ -56,8 +74,12 @@ def get_tax_calendar_group_items(
     page_size: int = Query(50, ge=1, le=200),
     client_search: str | None = Query(None),
     client_record_id: int | None = Query(None),
+    cache: ResponseCache = Depends(cached_response(*_GROUP_TABLES)),
 ):
-    return get_group_items(
+    cached = cache.lookup()
+    if cached is not None:
+        return cached
+    result = get_group_items(
         db,
         tax_calendar_entry_id,
         page=page,
@@ -65,3 +87,4 @@ def get_tax_calendar_group_items(
         client_search=client_search,
         client_record_id=client_record_id,
     )
+    return cache.store(result)
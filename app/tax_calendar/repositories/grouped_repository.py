@@ -1,18 +1,46 @@
 from dataclasses import dataclass
-from typing import Any
+from datetime import date
+from typing import Any, NamedTuple
 
-from sqlalchemy import String, case, cast, func, select
+from sqlalchemy import String, and_, case, cast, false, func, literal, select, union_all
 from sqlalchemy.orm import Session
 
-from app.advance_payments.models.advance_payment import AdvancePayment
+from app.advance_payments.models.advance_payment import AdvancePayment, AdvancePaymentStatus
+from app.annual_reports.models.annual_report_enums import AnnualReportStatus
 from app.annual_reports.models.annual_report_model import AnnualReport
 from app.clients.models.client_record import ClientRecord
 from app.clients.models.legal_entity import LegalEntity
 from app.common.enums import ObligationType
 from app.common.repositories.base_repository import BaseRepository
+from app.common.repositories.sql_functions import as_date
 from app.tax_calendar.models.tax_calendar_entry import TaxCalendarEntry
+from app.vat_reports.models.vat_enums import VatWorkItemStatus
 from app.vat_reports.models.vat_work_item import VatWorkItem
 
+VAT_DONE = {VatWorkItemStatus.FILED}
+ADVANCE_DONE = {AdvancePaymentStatus.PAID}
+ANNUAL_DONE = {
+    AnnualReportStatus.SUBMITTED,
+    AnnualReportStatus.CLOSED,
+    AnnualReportStatus.CANCELED,
+}
+
+# Obligation type -> (linked model, its effective due date, statuses that count as done).
+# A row without its own due date falls back to the entry's regulatory due date.
+_LINKED_SOURCES = {
+    ObligationType.VAT: (VatWorkItem, VatWorkItem.due_date_effective, VAT_DONE),
+    ObligationType.ADVANCE_PAYMENT: (
+        AdvancePayment,
+        AdvancePayment.due_date_effective,
+        ADVANCE_DONE,
+    ),
+    ObligationType.ANNUAL_REPORT: (
+        AnnualReport,
+        as_date(AnnualReport.filing_deadline),
+        ANNUAL_DONE,
+    ),
+}
+
 
 @dataclass(frozen=True)
 class GroupedItemRow:
@@ -26,6 +54,42 @@ class GroupedItemRow:
         yield self.legal_entity
 
 
+class GroupRow(NamedTuple):
+    entry: TaxCalendarEntry
+    linked_count: int
+    done_count: int
+    overdue_count: int
+    effective_due_date_min: date
+    effective_due_date_max: date
+
+
+class GroupsSummaryRow(NamedTuple):
+    groups: int
+    linked: int
+    open: int
+    overdue: int
+    done: int
+
+
+class _GroupCounts:
+    """Per-entry aggregates of linked rows, as columns to outer-join onto entries."""
+
+    def __init__(self, subquery):
+        self.subquery = subquery
+        self.linked_count = func.coalesce(subquery.c.linked_count, 0)
+        self.done_count = func.coalesce(subquery.c.done_count, 0)
+        self.overdue_count = func.coalesce(subquery.c.overdue_count, 0)
+
+    def columns(self):
+        return (
+            self.linked_count.label("linked_count"),
+            self.done_count.label("done_count"),
+            self.overdue_count.label("overdue_count"),
+            func.coalesce(self.subquery.c.due_min, TaxCalendarEntry.due_date).label("due_min"),
+            func.coalesce(self.subquery.c.due_max, TaxCalendarEntry.due_date).label("due_max"),
+        )
+
+
 def _entry_sort_clauses():
     # periodic rows sort by their period; annual_report (period=NULL) sorts after
     # all months of the same tax_year using a synthetic '9999-99' sentinel.
@@ -58,112 +122,124 @@ class TaxCalendarGroupedRepository(BaseRepository[TaxCalendarEntry]):
     def __init__(self, db: Session):
         self.db = db
 
-    def list_entries(
+    def list_group_page(
         self,
         *,
-        start_year: int | None,
-        end_year: int | None,
-        obligation_type: ObligationType | None,
-    ) -> list[TaxCalendarEntry]:
-        stmt = select(TaxCalendarEntry)
-        if start_year is not None:
-            stmt = stmt.where(TaxCalendarEntry.tax_year >= start_year)
-        if end_year is not None:
-            stmt = stmt.where(TaxCalendarEntry.tax_year <= end_year)
-        if obligation_type is not None:
-            stmt = stmt.where(TaxCalendarEntry.obligation_type == obligation_type)
-        else:
-            stmt = stmt.where(
-                TaxCalendarEntry.obligation_type.in_(
-                    [
-                        ObligationType.VAT,
-                        ObligationType.ADVANCE_PAYMENT,
-                        ObligationType.ANNUAL_REPORT,
-                    ]
-                )
-            )
-        return self.db.scalars(stmt.order_by(*_entry_sort_clauses())).all()
+        today: date,
+        limit: int,
+        offset: int,
+        **filters,
+    ) -> list[GroupRow]:
+        """One page of entries with their linked-row counts, in calendar order."""
+        counts = self._group_counts(today=today, **filters)
+        stmt = self._groups_select(TaxCalendarEntry, *counts.columns(), counts=counts, **filters)
+        rows = self.db.execute(
+            stmt.order_by(*_entry_sort_clauses()).limit(limit).offset(offset)
+        ).all()
+        return [GroupRow(*row) for row in rows]
 
-    def list_vat_for_entries(
-        self,
-        *,
-        start_year: int | None,
-        end_year: int | None,
-        obligation_type: ObligationType | None,
-        client_record_id: int | None = None,
-        client_search: str | None = None,
-    ) -> list[VatWorkItem]:
-        if obligation_type is not None and obligation_type != ObligationType.VAT:
-            return []
-        stmt = (
-            select(VatWorkItem)
-            .join(
-                TaxCalendarEntry,
-                TaxCalendarEntry.id == VatWorkItem.tax_calendar_entry_id,
+    def summarize_groups(self, *, today: date, **filters) -> GroupsSummaryRow:
+        """Group total and summed counts over every entry matching the filters."""
+        counts = self._group_counts(today=today, **filters)
+        groups = self._groups_select(*counts.columns(), counts=counts, **filters).subquery()
+        row = self.db.execute(
+            select(
+                func.count(),
+                func.coalesce(func.sum(groups.c.linked_count), 0),
+                func.coalesce(func.sum(groups.c.linked_count - groups.c.done_count), 0),
+                func.coalesce(func.sum(groups.c.overdue_count), 0),
+                func.coalesce(func.sum(groups.c.done_count), 0),
             )
-            .where(TaxCalendarEntry.obligation_type == ObligationType.VAT)
-            .where(VatWorkItem.deleted_at.is_(None))
-        )
-        stmt = self._apply_calendar_filters(stmt, start_year, end_year)
-        stmt = self._scope_to_active_clients(stmt, VatWorkItem)
-        if client_record_id is not None:
-            stmt = stmt.where(VatWorkItem.client_record_id == client_record_id)
-        stmt = self._apply_client_search(stmt, VatWorkItem, client_search)
-        return self.db.scalars(stmt).all()
+        ).one()
+        return GroupsSummaryRow(*(int(value) for value in row))
 
-    def list_advance_for_entries(
+    def _groups_select(
         self,
-        *,
+        *columns,
+        counts: _GroupCounts,
         start_year: int | None,
         end_year: int | None,
         obligation_type: ObligationType | None,
+        include_empty: bool,
+        status: str,
         client_record_id: int | None = None,
         client_search: str | None = None,
-    ) -> list[AdvancePayment]:
-        if obligation_type is not None and obligation_type != ObligationType.ADVANCE_PAYMENT:
-            return []
+    ):
         stmt = (
-            select(AdvancePayment)
-            .join(
-                TaxCalendarEntry,
-                TaxCalendarEntry.id == AdvancePayment.tax_calendar_entry_id,
-            )
-            .where(TaxCalendarEntry.obligation_type == ObligationType.ADVANCE_PAYMENT)
-            .where(AdvancePayment.deleted_at.is_(None))
+            select(*columns)
+            .select_from(TaxCalendarEntry)
+            .outerjoin(counts.subquery, counts.subquery.c.entry_id == TaxCalendarEntry.id)
         )
         stmt = self._apply_calendar_filters(stmt, start_year, end_year)
-        stmt = self._scope_to_active_clients(stmt, AdvancePayment)
-        if client_record_id is not None:
-            stmt = stmt.where(AdvancePayment.client_record_id == client_record_id)
-        stmt = self._apply_client_search(stmt, AdvancePayment, client_search)
-        return self.db.scalars(stmt).all()
+        if obligation_type is not None:
+            stmt = stmt.where(TaxCalendarEntry.obligation_type == obligation_type)
+        else:
+            stmt = stmt.where(TaxCalendarEntry.obligation_type.in_(list(_LINKED_SOURCES)))
+        if not include_empty:
+            stmt = stmt.where(counts.subquery.c.entry_id.is_not(None))
+        open_count = counts.linked_count - counts.done_count
+        if status == "open":
+            stmt = stmt.where(open_count > 0)
+        elif status == "overdue":
+            stmt = stmt.where(counts.overdue_count > 0)
+        elif status == "done":
+            stmt = stmt.where(counts.linked_count > 0, open_count == 0, counts.overdue_count == 0)
+        return stmt
 
-    def list_annual_for_entries(
+    def _group_counts(
         self,
         *,
+        today: date,
         start_year: int | None,
         end_year: int | None,
         obligation_type: ObligationType | None,
         client_record_id: int | None = None,
         client_search: str | None = None,
-    ) -> list[AnnualReport]:
-        if obligation_type is not None and obligation_type != ObligationType.ANNUAL_REPORT:
-            return []
-        stmt = (
-            select(AnnualReport)
-            .join(
-                TaxCalendarEntry,
-                TaxCalendarEntry.id == AnnualReport.tax_calendar_entry_id,
+        **_entry_filters,
+    ) -> _GroupCounts:
+        branches = []
+        for source_type, (model, due_date_column, done_statuses) in _LINKED_SOURCES.items():
+            if obligation_type is not None and obligation_type != source_type:
+                continue
+            stmt = (
+                select(
+                    model.tax_calendar_entry_id.label("entry_id"),
+                    func.coalesce(due_date_column, TaxCalendarEntry.due_date).label("due_date"),
+                    case((model.status.in_(done_statuses), 1), else_=0).label("done"),
+                )
+                .join(TaxCalendarEntry, TaxCalendarEntry.id == model.tax_calendar_entry_id)
+                .where(TaxCalendarEntry.obligation_type == source_type)
+                .where(model.deleted_at.is_(None))
             )
-            .where(TaxCalendarEntry.obligation_type == ObligationType.ANNUAL_REPORT)
-            .where(AnnualReport.deleted_at.is_(None))
+            stmt = self._apply_calendar_filters(stmt, start_year, end_year)
+            stmt = self._scope_to_active_clients(stmt, model)
+            if client_record_id is not None:
+                stmt = stmt.where(model.client_record_id == client_record_id)
+            branches.append(self._apply_client_search(stmt, model, client_search))
+        if not branches:
+            # An obligation type with no linked source table: every group is empty.
+            model = VatWorkItem
+            branches.append(
+                select(
+                    model.tax_calendar_entry_id.label("entry_id"),
+                    model.due_date_effective.label("due_date"),
+                    literal(0).label("done"),
+                ).where(false())
+            )
+        linked = union_all(*branches).subquery("linked")
+        overdue = case((and_(linked.c.done == 0, linked.c.due_date < today), 1), else_=0)
+        return _GroupCounts(
+            select(
+                linked.c.entry_id,
+                func.count().label("linked_count"),
+                func.sum(linked.c.done).label("done_count"),
+                func.sum(overdue).label("overdue_count"),
+                func.min(linked.c.due_date).label("due_min"),
+                func.max(linked.c.due_date).label("due_max"),
+            )
+            .group_by(linked.c.entry_id)
+            .subquery("group_counts")
         )
-        stmt = self._apply_calendar_filters(stmt, start_year, end_year)
-        stmt = self._scope_to_active_clients(stmt, AnnualReport)
-        if client_record_id is not None:
-            stmt = stmt.where(AnnualReport.client_record_id == client_record_id)
-        stmt = self._apply_client_search(stmt, AnnualReport, client_search)
-        return self.db.scalars(stmt).all()
 
     @staticmethod
     def _apply_calendar_filters(stmt, start_year: int | None, end_year: int | None):
@@ -203,12 +279,16 @@ class TaxCalendarGroupedRepository(BaseRepository[TaxCalendarEntry]):
         *,
         client_search: str | None = None,
         client_record_id: int | None = None,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> list[GroupedItemRow]:
         return self._fetch_items(
             VatWorkItem,
             entry_id,
             client_search=client_search,
             client_record_id=client_record_id,
+            limit=limit,
+            offset=offset,
         )
 
     def list_advance_items(
@@ -217,12 +297,16 @@ class TaxCalendarGroupedRepository(BaseRepository[TaxCalendarEntry]):
         *,
         client_search: str | None = None,
         client_record_id: int | None = None,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> list[GroupedItemRow]:
         return self._fetch_items(
             AdvancePayment,
             entry_id,
             client_search=client_search,
             client_record_id=client_record_id,
+            limit=limit,
+            offset=offset,
         )
 
     def list_annual_items(
@@ -231,14 +315,42 @@ class TaxCalendarGroupedRepository(BaseRepository[TaxCalendarEntry]):
         *,
         client_search: str | None = None,
         client_record_id: int | None = None,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> list[GroupedItemRow]:
         return self._fetch_items(
             AnnualReport,
             entry_id,
             client_search=client_search,
             client_record_id=client_record_id,
+            limit=limit,
+            offset=offset,
         )
 
+    def count_items(
+        self,
+        entry: TaxCalendarEntry,
+        *,
+        client_search: str | None = None,
+        client_record_id: int | None = None,
+    ) -> int:
+        source = _LINKED_SOURCES.get(entry.obligation_type)
+        if source is None:
+            return 0
+        model = source[0]
+        stmt = self._item_filters(
+            select(func.count())
+            .select_from(model)
+            .join(ClientRecord, model.client_record_id == ClientRecord.id)
+            .join(LegalEntity, ClientRecord.legal_entity_id == LegalEntity.id)
+            .where(ClientRecord.deleted_at.is_(None)),
+            model,
+            entry.id,
+            client_search=client_search,
+            client_record_id=client_record_id,
+        )
+        return self.db.scalar(stmt) or 0
+
     def _fetch_items(
         self,
         model,
@@ -246,16 +358,32 @@ class TaxCalendarGroupedRepository(BaseRepository[TaxCalendarEntry]):
         *,
         client_search: str | None,
         client_record_id: int | None,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> list[GroupedItemRow]:
-        stmt = self._with_client(model).where(
-            model.tax_calendar_entry_id == entry_id,
-            model.deleted_at.is_(None),
+        stmt = self._item_filters(
+            self._with_client(model),
+            model,
+            entry_id,
+            client_search=client_search,
+            client_record_id=client_record_id,
         )
+        rows = self.db.execute(stmt.limit(limit).offset(offset)).all()
+        return [GroupedItemRow(row=r[0], client=r[1], legal_entity=r[2]) for r in rows]
+
+    def _item_filters(
+        self,
+        stmt,
+        model,
+        entry_id: int,
+        *,
+        client_search: str | None,
+        client_record_id: int | None,
+    ):
+        stmt = stmt.where(model.tax_calendar_entry_id == entry_id, model.deleted_at.is_(None))
         if client_record_id is not None:
             stmt = stmt.where(model.client_record_id == client_record_id)
-        stmt = self._apply_client_search(stmt, model, client_search)
-        rows = self.db.execute(stmt).all()
-        return [GroupedItemRow(row=r[0], client=r[1], legal_entity=r[2]) for r in rows]
+        return self._apply_client_search(stmt, model, client_search)
 
     def _with_client(self, model):
         return (
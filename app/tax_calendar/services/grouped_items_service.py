@@ -28,12 +28,13 @@ def get_group_items(
     if entry is None:
         raise NotFoundError("רשומת יומן מס לא נמצאה", "TAX_CALENDAR.NOT_FOUND")
 
-    rows = _rows_for_entry(
-        repo,
-        entry,
-        client_search=client_search,
-        client_record_id=client_record_id,
-    )
+    filters = {"client_search": client_search, "client_record_id": client_record_id}
+    total = repo.count_items(entry, **filters)
+    rows = []
+    if total:
+        rows = _rows_for_entry(
+            repo, entry, limit=page_size, offset=(page - 1) * page_size, **filters
+        )
     today = date.today()
     items = [
         _to_item(
@@ -47,27 +48,17 @@ def get_group_items(
         )
         for source_type, row, client, legal_entity in rows
     ]
-    total = len(items)
-    start = (page - 1) * page_size
-
     return TaxCalendarGroupItemsResponse(
         tax_calendar_entry_id=entry.id,
         obligation_type=entry.obligation_type.value,
-        items=items[start : start + page_size],
+        items=items,
         page=page,
         page_size=page_size,
         total=total,
     )
 
 
-def _rows_for_entry(
-    repo: TaxCalendarGroupedRepository,
-    entry,
-    *,
-    client_search: str | None,
-    client_record_id: int | None,
-):
-    kwargs = {"client_search": client_search, "client_record_id": client_record_id}
+def _rows_for_entry(repo: TaxCalendarGroupedRepository, entry, **kwargs):
     if entry.obligation_type == ObligationType.VAT:
         return [("vat_work_item", *row) for row in repo.list_vat_items(entry.id, **kwargs)]
     if entry.obligation_type == ObligationType.ADVANCE_PAYMENT:
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, Query
 
+from app.core.perf import query_budget
+from app.infrastructure.http_cache import ResponseCache, cached_response
 from app.timeline.schemas.timeline import ClientTimelineResponse, TimelineEvent
 from app.timeline.services.timeline_service import TimelineService
-from app.users.api.deps import DBSession, require_role
+from app.users.api.deps import DBReads, require_role
 from app.users.models.user import UserRole
 
 router = APIRouter(
@@ -13,18 +15,41 @@ router = APIRouter(
 
 
 @router.get("/{client_record_id}/timeline", response_model=ClientTimelineResponse)
-def get_client_timeline(
+@query_budget(30, max_repeated=5)
+async def get_client_timeline(
     client_record_id: int,
-    db: DBSession,
+    reads: DBReads,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=200),
     search: str | None = Query(None),
     event_type: list[str] | None = Query(None),
     important_only: bool = Query(False),
+    cache: ResponseCache = Depends(
+        cached_response(
+            "client_records",
+            "legal_entities",
+            "persons",
+            "person_legal_entity_links",
+            "businesses",
+            "binders",
+            "binder_lifecycle_logs",
+            "charges",
+            "invoices",
+            "annual_reports",
+            "annual_report_status_history",
+            "notifications",
+            "permanent_documents",
+            "signature_requests",
+            "signature_audit_events",
+        )
+    ),
 ):
     """Get unified client timeline."""
-    service = TimelineService(db)
-    events, total = service.get_client_timeline(
+    cached = cache.lookup()
+    if cached is not None:
+        return cached
+    events, total = await TimelineService.get_client_timeline_concurrently(
+        reads,
         client_record_id=client_record_id,
         page=page,
         page_size=page_size,
@@ -33,10 +58,12 @@ def get_client_timeline(
         important_only=important_only,
     )
 
-    return ClientTimelineResponse(
-        client_record_id=client_record_id,
-        events=[TimelineEvent(**e) for e in events],
-        page=page,
-        page_size=page_size,
-        total=total,
+    return cache.store(
+        ClientTimelineResponse(
+            client_record_id=client_record_id,
+            events=[TimelineEvent(**e) for e in events],
+            page=page,
+            page_size=page_size,
+            total=total,
+        )
     )
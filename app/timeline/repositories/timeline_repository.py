@@ -1,7 +1,6 @@
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.clients.models.client_record import ClientRecord
 from app.permanent_documents.models.permanent_document import PermanentDocument
 from app.signature_requests.models.signature_request import (
     SignatureAuditEvent,
@@ -16,14 +15,6 @@ class TimelineRepository:
     def __init__(self, db: Session) -> None:
         self.db = db
 
-    def get_client_record(self, client_record_id: int) -> ClientRecord | None:
-        return self.db.scalars(
-            select(ClientRecord).where(
-                ClientRecord.id == client_record_id,
-                ClientRecord.deleted_at.is_(None),
-            )
-        ).first()
-
     def list_permanent_documents(self, business_ids: list[int]) -> list[PermanentDocument]:
         if not business_ids:
             return []
@@ -1,6 +1,6 @@
 from sqlalchemy.orm import Session
 
-from app.clients.repositories.legal_entity_repository import LegalEntityRepository
+from app.clients.repositories.client_identity_loader import ClientIdentityLoader
 from app.timeline.repositories.timeline_repository import TimelineRepository
 from app.timeline.services.timeline_client_builders import (
     client_created_event,
@@ -17,12 +17,8 @@ def build_client_events(
     repo = TimelineRepository(db)
     events = []
 
-    client_record = repo.get_client_record(client_record_id)
-    client = (
-        LegalEntityRepository(db).get_by_id(client_record.legal_entity_id)
-        if client_record
-        else None
-    )
+    # Usually already memoised by TimelineService for this session.
+    client = ClientIdentityLoader(db).get(client_record_id)
     if client:
         events.append(client_created_event(client))
 
@@ -1,3 +1,5 @@
+from collections.abc import Callable
+
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
@@ -10,8 +12,9 @@ from app.binders.repositories.binder_lifecycle_log_repository import BinderLifec
 from app.binders.services.messages import BINDER_RECEIVED
 from app.businesses.models.business import Business
 from app.charge.repositories.charge_repository import ChargeRepository
-from app.clients.repositories.client_record_repository import ClientRecordRepository
+from app.clients.repositories.client_identity_loader import ClientIdentityLoader
 from app.core.exceptions import NotFoundError
+from app.database import ConcurrentReads, SerialReads
 from app.invoice.repositories.invoice_repository import InvoiceRepository
 from app.notification.models.notification import NotificationStatus
 from app.notification.repositories.notification_repository import NotificationRepository
@@ -48,7 +51,7 @@ class TimelineService:
         self.lifecycle_log_repo = BinderLifecycleLogRepository(db)
         self.charge_repo = ChargeRepository(db)
         self.invoice_repo = InvoiceRepository(db)
-        self.client_record_repo = ClientRecordRepository(db)
+        self.identity_loader = ClientIdentityLoader(db)
         self.notification_repo = NotificationRepository(db)
 
     def get_client_timeline(
@@ -60,20 +63,62 @@ class TimelineService:
         event_types: list[str] | None = None,
         important_only: bool = False,
     ) -> tuple[list[dict], int]:
-        client_record = self.client_record_repo.get_by_id(client_record_id)
-        if not client_record:
+        business_ids = self._business_ids(client_record_id)
+        events = []
+        for build in self._section_builders(client_record_id, business_ids):
+            events.extend(build(self))
+        return self._filter_and_page(events, page, page_size, search, event_types, important_only)
+
+    @classmethod
+    async def get_client_timeline_concurrently(
+        cls,
+        reads: ConcurrentReads | SerialReads,
+        client_record_id: int,
+        page: int = 1,
+        page_size: int = 20,
+        search: str | None = None,
+        event_types: list[str] | None = None,
+        important_only: bool = False,
+    ) -> tuple[list[dict], int]:
+        """`get_client_timeline` with each event source read on its own connection, concurrently."""
+        (business_ids,) = await reads.gather(lambda db: cls(db)._business_ids(client_record_id))
+        sections = await reads.gather(
+            *(
+                lambda db, build=build: build(cls(db))
+                for build in cls._section_builders(client_record_id, business_ids)
+            )
+        )
+        events = [event for section in sections for event in section]
+        return cls._filter_and_page(events, page, page_size, search, event_types, important_only)
+
+    def _business_ids(self, client_record_id: int) -> list[int]:
+        client = self.identity_loader.get(client_record_id)
+        if not client:
             raise NotFoundError(message="לקוח לא נמצא", code="TIMELINE.CLIENT_NOT_FOUND")
-        businesses = self.db.scalars(
-            select(Business).where(
-                Business.legal_entity_id == client_record.legal_entity_id,
-                Business.deleted_at.is_(None),
+        return list(
+            self.db.scalars(
+                select(Business.id).where(
+                    Business.legal_entity_id == client.legal_entity_id,
+                    Business.deleted_at.is_(None),
+                )
             )
-        ).all()
-        business_ids = [business.id for business in businesses]
-        client_record_id = int(client_record.id)
+        )
 
-        events = []
+    @staticmethod
+    def _section_builders(
+        client_record_id: int, business_ids: list[int]
+    ) -> tuple[Callable[["TimelineService"], list[dict]], ...]:
+        """Independent event sources of one client's timeline."""
+        return (
+            lambda service: service._build_binder_events(client_record_id),
+            lambda service: service._build_charge_events(business_ids),
+            lambda service: service._build_annual_report_events(client_record_id),
+            lambda service: build_client_events(service.db, client_record_id, business_ids),
+            lambda service: service._build_notification_events(client_record_id),
+        )
 
+    def _build_binder_events(self, client_record_id: int) -> list[dict]:
+        events = []
         # Bounded: _TIMELINE_BULK_LIMIT — older binders silently excluded if exceeded.
         binders = self.binder_repo.list_by_client_record(client_record_id)
         for binder in binders:
@@ -82,7 +127,10 @@ class TimelineService:
             if binder.handed_over_at:
                 events.append(binder_handed_over_event(binder))
             self._append_lifecycle_change_events(events, binder)
+        return events
 
+    def _build_charge_events(self, business_ids: list[int]) -> list[dict]:
+        events = []
         # Bounded fetch — clients with more than _TIMELINE_BULK_LIMIT
         # charges will have older events silently truncated.
         charges = self.charge_repo.list_charges(
@@ -101,11 +149,17 @@ class TimelineService:
             invoice = invoice_map.get(charge.id)
             if invoice:
                 events.append(invoice_attached_event(charge, invoice))
+        return events
 
-        events.extend(self._build_annual_report_events(client_record.id if client_record else None))
-        events.extend(build_client_events(self.db, client_record_id, business_ids))
-        events.extend(self._build_notification_events(client_record_id))
-
+    @staticmethod
+    def _filter_and_page(
+        events: list[dict],
+        page: int,
+        page_size: int,
+        search: str | None,
+        event_types: list[str] | None,
+        important_only: bool,
+    ) -> tuple[list[dict], int]:
         events.sort(key=lambda e: e["timestamp"], reverse=True)
 
         if search:
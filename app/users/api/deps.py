@@ -4,7 +4,16 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.common.repositories.read_repository import replica_usable
+from app.config import settings
+from app.database import (
+    ConcurrentReads,
+    SerialReads,
+    async_read_sessions,
+    async_sessions,
+    get_db,
+    set_statement_timeout,
+)
 from app.core.logging_config import set_actor_context
 from app.users.models.user import UserRole
 from app.users.repositories.user_repository import AuthSubject, UserRepository
@@ -78,6 +87,25 @@ def require_role(*allowed_roles: UserRole):
     return role_checker
 
 
+def get_reads(db: Annotated[Session, Depends(get_db)]) -> ConcurrentReads | SerialReads:
+    """Read runner for `async def` routes; serial on the request session without an async engine."""
+    sessions = async_sessions()
+    if sessions is None:
+        return SerialReads(db)
+    read_sessions = async_read_sessions()
+    if read_sessions is not None and replica_usable(db):
+        return ConcurrentReads(read_sessions)
+    return ConcurrentReads(sessions)
+
+
+def get_export_db(db: Annotated[Session, Depends(get_db)]) -> Session:
+    """Request session for export routes: the export-class statement timeout."""
+    set_statement_timeout(db, settings.DB_EXPORT_STATEMENT_TIMEOUT_MS)
+    return db
+
+
 # Common dependencies
 CurrentUser = Annotated[AuthSubject, Depends(get_current_user)]
 DBSession = Annotated[Session, Depends(get_db)]
+ExportDBSession = Annotated[Session, Depends(get_export_db)]
+DBReads = Annotated[ConcurrentReads | SerialReads, Depends(get_reads)]
@@ -11,9 +11,13 @@ Consumers
 from __future__ import annotations
 
 import tempfile
+from collections.abc import Iterable, Sequence
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
+
+# Rows measured for column widths before a streaming sheet starts writing.
+WIDTH_SAMPLE_ROWS = 1000
 
 # ---------------------------------------------------------------------------
 # Column widths
@@ -51,6 +55,127 @@ def adjust_column_widths(
         ws.column_dimensions[get_column_letter(idx)].width = width
 
 
+# ---------------------------------------------------------------------------
+# Streaming (write-only) workbooks
+# ---------------------------------------------------------------------------
+
+
+class StreamingSheet:
+    """
+    A write-only worksheet: rows go to a temp file as they are appended, so
+    memory stays flat however many rows are written.
+
+    Column widths must be known before the first row is written, so the first
+    *sample_size* rows are buffered and measured the same way as
+    ``adjust_column_widths``; after that rows are written straight through.
+    Formatting that needs random access (merged cells) is not available.
+    """
+
+    def __init__(
+        self,
+        ws,
+        *,
+        freeze_panes: str | None = None,
+        sample_size: int = WIDTH_SAMPLE_ROWS,
+        min_width: int = 8,
+        max_width: int = 50,
+        padding: int = 2,
+    ) -> None:
+        self._ws = ws
+        if freeze_panes:
+            ws.freeze_panes = freeze_panes
+        self._sample_size = sample_size
+        self._min_width = min_width
+        self._max_width = max_width
+        self._padding = padding
+        self._buffer: list[tuple[Sequence[Any], dict[str, Any]]] | None = []
+        self._widths: list[int] = []
+        self.rows_written = 0
+
+    def cell(self, value: Any, **style: Any):
+        """A single styled cell, for rows that style only some of their cells."""
+        from openpyxl.cell import WriteOnlyCell
+
+        cell = WriteOnlyCell(self._ws, value=value)
+        for attr, spec in style.items():
+            setattr(cell, attr, spec)
+        return cell
+
+    def append(self, values: Sequence[Any], **style: Any) -> None:
+        """
+        Add one row. *style* (``font``, ``fill``, ``alignment``) applies to
+        every cell; ``cell()`` results may be mixed in with plain values.
+        """
+        self.rows_written += 1
+        if self._buffer is None:
+            self._write(values, style)
+            return
+        self._measure(values)
+        self._buffer.append((values, style))
+        if len(self._buffer) >= self._sample_size:
+            self.flush()
+
+    def extend(self, rows: Iterable[Sequence[Any]]) -> None:
+        for values in rows:
+            self.append(values)
+
+    def flush(self) -> None:
+        """Fix the column widths and write out the buffered rows."""
+        if self._buffer is None:
+            return
+        from openpyxl.utils import get_column_letter
+
+        for idx, measured in enumerate(self._widths, start=1):
+            width = max(self._min_width, min(measured + self._padding, self._max_width))
+            self._ws.column_dimensions[get_column_letter(idx)].width = width
+        buffered, self._buffer = self._buffer, None
+        for values, style in buffered:
+            self._write(values, style)
+
+    def _measure(self, values: Sequence[Any]) -> None:
+        for idx, value in enumerate(values):
+            if idx == len(self._widths):
+                self._widths.append(0)
+            value = getattr(value, "value", value)
+            if value is not None:
+                self._widths[idx] = max(self._widths[idx], len(str(value)))
+
+    def _write(self, values: Sequence[Any], style: dict[str, Any]) -> None:
+        if style:
+            values = [self.cell(value, **style) for value in values]
+        self._ws.append(list(values))
+
+
+class StreamingWorkbook:
+    """
+    openpyxl ``write_only`` workbook built from ``StreamingSheet`` objects.
+
+    ``save`` accepts a path or a binary file object (a temp file handed to
+    ``FileResponse`` / ``StorageProvider.upload``), so the whole workbook is
+    never held in memory.
+    """
+
+    def __init__(self) -> None:
+        try:
+            from openpyxl import Workbook
+        except ImportError as exc:
+            raise ImportError(
+                "הספרייה openpyxl נדרשת לצורך ייצוא לאקסל. יש להתקין באמצעות: pip install openpyxl"
+            ) from exc
+        self._wb = Workbook(write_only=True)
+        self._sheets: list[StreamingSheet] = []
+
+    def add_sheet(self, title: str, **options: Any) -> StreamingSheet:
+        sheet = StreamingSheet(self._wb.create_sheet(title=title), **options)
+        self._sheets.append(sheet)
+        return sheet
+
+    def save(self, target: str | Path | BinaryIO) -> None:
+        for sheet in self._sheets:
+            sheet.flush()
+        self._wb.save(target)
+
+
 # ---------------------------------------------------------------------------
 # Save workbook
 # ---------------------------------------------------------------------------
@@ -69,7 +194,7 @@ def save_workbook_to_temp(
 
     Parameters
     ----------
-    wb          : openpyxl Workbook
+    wb          : openpyxl Workbook or ``StreamingWorkbook``
     prefix      : filename prefix, e.g. ``"clients_export"``
     subdir      : sub-folder inside the system temp dir (used when
                   *export_dir* is not supplied). Default: ``"exports"``.
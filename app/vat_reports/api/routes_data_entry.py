@@ -1,16 +1,19 @@
 """Routes: invoice data entry (add / update / delete / list)."""
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, UploadFile, status
 
 from app.users.api.deps import CurrentUser, DBSession, require_role
 from app.users.models.user import UserRole
 from app.vat_reports.models.vat_enums import InvoiceType
 from app.vat_reports.schemas.vat_invoice_schema import (
+    VatInvoiceBatchRequest,
+    VatInvoiceBatchResponse,
     VatInvoiceCreateRequest,
     VatInvoiceListResponse,
     VatInvoiceResponse,
 )
 from app.vat_reports.schemas.vat_invoice_update import VatInvoiceUpdateRequest
+from app.vat_reports.services.invoice_batch_upload import MAX_INVOICE_UPLOAD_SIZE
 from app.vat_reports.services.vat_report_service import VatReportService
 
 router = APIRouter(prefix="/vat", tags=["vat-reports"])
@@ -50,6 +53,59 @@ def add_invoice(
     return response
 
 
+def _batch_response(invoices, ceiling_warning: bool) -> VatInvoiceBatchResponse:
+    return VatInvoiceBatchResponse(
+        items=[VatInvoiceResponse.model_validate(invoice) for invoice in invoices],
+        ceiling_warning=ceiling_warning,
+    )
+
+
+@router.post(
+    "/work-items/{item_id}/invoices/batch",
+    response_model=VatInvoiceBatchResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(require_role(UserRole.ADVISOR, UserRole.SECRETARY))],
+)
+def add_invoices(
+    item_id: int,
+    request: VatInvoiceBatchRequest,
+    db: DBSession,
+    current_user: CurrentUser,
+):
+    """Add many invoices at once; any invalid row rejects the batch with per-row errors."""
+    service = VatReportService(db)
+    invoices, ceiling_warning = service.add_invoices(
+        item_id=item_id,
+        created_by=current_user.id,
+        rows=list(enumerate(request.invoices, start=1)),
+    )
+    return _batch_response(invoices, ceiling_warning)
+
+
+@router.post(
+    "/work-items/{item_id}/invoices/batch/upload",
+    response_model=VatInvoiceBatchResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(require_role(UserRole.ADVISOR, UserRole.SECRETARY))],
+)
+def upload_invoices(
+    item_id: int,
+    file: UploadFile,
+    db: DBSession,
+    current_user: CurrentUser,
+):
+    """Add invoices from a CSV or Excel file whose header row names the invoice fields."""
+    contents = file.file.read(MAX_INVOICE_UPLOAD_SIZE + 1)
+    service = VatReportService(db)
+    invoices, ceiling_warning = service.add_invoices_from_upload(
+        item_id=item_id,
+        created_by=current_user.id,
+        filename=file.filename,
+        contents=contents,
+    )
+    return _batch_response(invoices, ceiling_warning)
+
+
 @router.get(
     "/work-items/{item_id}/invoices",
     response_model=VatInvoiceListResponse,
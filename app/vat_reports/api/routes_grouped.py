@@ -3,6 +3,8 @@
 from fastapi import APIRouter, Depends, Query
 
 from app.common.enums import VatType
+from app.core.json_response import json_response
+from app.infrastructure.http_cache import ResponseCache, cached_response
 from app.users.api.deps import CurrentUser, DBSession, require_role
 from app.users.models.user import UserRole
 from app.users.repositories.user_repository import UserRepository
@@ -29,7 +31,19 @@ def list_work_item_groups(
     status_filter: VatWorkItemStatus | None = Query(default=None, alias="status"),
     client_name: str | None = Query(None),
     year: int | None = Query(None),
+    cache: ResponseCache = Depends(
+        cached_response(
+            "vat_work_items",
+            "client_records",
+            "legal_entities",
+            "persons",
+            "person_legal_entity_links",
+        )
+    ),
 ):
+    cached = cache.lookup()
+    if cached is not None:
+        return cached
     groups = vat_grouped_enrichment.get_groups(
         db,
         period_type=period_type,
@@ -37,7 +51,9 @@ def list_work_item_groups(
         status=status_filter,
         year=year,
     )
-    return VatWorkItemGroupsResponse(groups=[VatWorkItemGroupSummary(**g) for g in groups])
+    return cache.store(
+        VatWorkItemGroupsResponse(groups=[VatWorkItemGroupSummary(**g) for g in groups])
+    )
 
 
 @router.get(
@@ -64,4 +80,4 @@ def list_work_item_group_items(
         status=status_filter,
         user_role=current_user.role,
     )
-    return VatWorkItemGroupItemsResponse(**result)
+    return json_response(VatWorkItemGroupItemsResponse, result)
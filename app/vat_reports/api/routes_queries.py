@@ -5,6 +5,7 @@ from typing import Optional
 from fastapi import APIRouter, Depends, Query
 
 from app.common.enums import VatType
+from app.core.perf import query_budget
 from app.users.api.deps import CurrentUser, DBSession, require_role
 from app.users.models.user import UserRole
 from app.vat_reports.api.serializers import (
@@ -125,6 +126,7 @@ def list_client_work_items(
     response_model=VatWorkItemListResponse,
     dependencies=[Depends(require_role(UserRole.ADVISOR, UserRole.SECRETARY))],
 )
+@query_budget(20, max_repeated=5)
 def list_work_items(
     db: DBSession,
     current_user: CurrentUser,
@@ -0,0 +1,70 @@
+"""Per client-year VAT aggregate.
+
+One row per (client record, tax year) summing the denormalized totals of the
+client's live VAT work items for that year: income / expense net and output /
+input VAT over every item, the FILED subset's income net (reported turnover),
+and period counts. Readers that used to re-aggregate invoices or work items —
+the OSEK PATUR ceiling check, client turnover enrichment, the client VAT
+summary and the annual report VAT import — read this row instead.
+
+Rows are maintained by the session hook in `client_year_vat_totals_events`
+(registered with `VatWorkItem`); `scripts/ops/client_year_vat_totals.py`
+rebuilds or verifies them.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import ForeignKey, Integer, Numeric, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.utils.time_utils import utcnow
+
+
+class ClientYearVatTotals(Base):
+    __tablename__ = "client_year_vat_totals"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    client_record_id: Mapped[int] = mapped_column(
+        ForeignKey("client_records.id"), nullable=False
+    )
+    tax_year: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    # All live work items of the year (any status).
+    income_net: Mapped[Decimal] = mapped_column(
+        Numeric(14, 2), nullable=False, default=Decimal("0.00")
+    )
+    expense_net: Mapped[Decimal] = mapped_column(
+        Numeric(14, 2), nullable=False, default=Decimal("0.00")
+    )
+    output_vat: Mapped[Decimal] = mapped_column(
+        Numeric(14, 2), nullable=False, default=Decimal("0.00")
+    )
+    input_vat: Mapped[Decimal] = mapped_column(
+        Numeric(14, 2), nullable=False, default=Decimal("0.00")
+    )
+    # FILED work items only — the turnover actually reported to the tax authority.
+    filed_income_net: Mapped[Decimal] = mapped_column(
+        Numeric(14, 2), nullable=False, default=Decimal("0.00")
+    )
+    periods_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    filed_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    updated_at: Mapped[datetime] = mapped_column(default=utcnow, onupdate=utcnow, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("client_record_id", "tax_year", name="uq_client_year_vat_totals"),
+    )
+
+    @property
+    def net_vat(self) -> Decimal:
+        return self.output_vat - self.input_vat
+
+    def __repr__(self) -> str:
+        return (
+            f"<ClientYearVatTotals(client_record_id={self.client_record_id}, "
+            f"tax_year={self.tax_year})>"
+        )
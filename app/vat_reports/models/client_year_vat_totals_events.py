@@ -0,0 +1,66 @@
+"""Session events keeping `client_year_vat_totals` in step with VAT work items.
+
+Every invoice write path ends by rewriting its work item's totals, so the hook
+watches `VatWorkItem` only: after a flush that inserted, deleted or changed the
+totals, status, period, owner or soft-delete flag of an item, the touched
+(client, year) rows are recomputed from `vat_work_items` with Core statements on
+the same connection. The aggregate therefore commits or rolls back with the
+write, and later reads in the same transaction already see it.
+"""
+
+from __future__ import annotations
+
+from itertools import chain
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.vat_reports.models.vat_work_item import VatWorkItem
+
+_TRACKED_ATTRIBUTES = (
+    "client_record_id",
+    "period",
+    "status",
+    "deleted_at",
+    "total_output_vat",
+    "total_input_vat",
+    "total_output_net",
+    "total_input_net",
+)
+
+
+def _keys(item: VatWorkItem) -> set[tuple[int, int]]:
+    """Current and pre-flush (client_record_id, tax_year) of a work item."""
+    state = inspect(item)
+    clients = {item.client_record_id, *state.attrs.client_record_id.history.deleted}
+    periods = {item.period, *state.attrs.period.history.deleted}
+    return {
+        (client_record_id, int(period[:4]))
+        for client_record_id in clients
+        for period in periods
+        if client_record_id is not None and period
+    }
+
+
+def _changed(item: VatWorkItem) -> bool:
+    attrs = inspect(item).attrs
+    return any(attrs[name].history.has_changes() for name in _TRACKED_ATTRIBUTES)
+
+
+@event.listens_for(Session, "after_flush")
+def _sync_client_year_totals(session: Session, _flush_context) -> None:
+    keys: set[tuple[int, int]] = set()
+    for target in chain(session.new, session.deleted):
+        if isinstance(target, VatWorkItem):
+            keys |= _keys(target)
+    for target in session.dirty:
+        if isinstance(target, VatWorkItem) and _changed(target):
+            keys |= _keys(target)
+    if not keys:
+        return
+
+    from app.vat_reports.repositories.client_year_vat_totals_repository import (
+        ClientYearVatTotalsRepository,
+    )
+
+    ClientYearVatTotalsRepository(session).refresh(keys)
@@ -173,3 +173,4 @@ class VatWorkItem(Base):
 
 
 import_module("app.vat_reports.models.due_date_snapshot_events")
+import_module("app.vat_reports.models.client_year_vat_totals_events")
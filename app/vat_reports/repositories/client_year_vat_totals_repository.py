@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from decimal import ROUND_HALF_UP, Decimal
+
+from sqlalchemy import Integer, bindparam, case, cast, delete, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.vat_reports.models.client_year_vat_totals import ClientYearVatTotals
+from app.vat_reports.models.vat_enums import VatWorkItemStatus
+from app.vat_reports.models.vat_work_item import VatWorkItem
+
+_TOTAL_COLUMNS = ("income_net", "expense_net", "output_vat", "input_vat", "filed_income_net")
+_COUNT_COLUMNS = ("periods_count", "filed_count")
+_ZERO_ROW = {
+    **{column: Decimal("0") for column in _TOTAL_COLUMNS},
+    **{column: 0 for column in _COUNT_COLUMNS},
+}
+
+
+def _cents(value) -> Decimal:
+    return Decimal(str(value or 0)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+class ClientYearVatTotalsRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    # ── Reads ─────────────────────────────────────────────────────────────────
+
+    def get(self, client_record_id: int, tax_year: int) -> ClientYearVatTotals | None:
+        return self.db.scalars(
+            select(ClientYearVatTotals).where(
+                ClientYearVatTotals.client_record_id == client_record_id,
+                ClientYearVatTotals.tax_year == tax_year,
+            )
+        ).first()
+
+    def get_income_net(self, client_record_id: int, tax_year: int) -> Decimal:
+        """Signed income net of the client's live work items in the year (all statuses)."""
+        value = self.db.scalar(
+            select(ClientYearVatTotals.income_net).where(
+                ClientYearVatTotals.client_record_id == client_record_id,
+                ClientYearVatTotals.tax_year == tax_year,
+            )
+        )
+        return Decimal(str(value or 0))
+
+    def filed_turnover_by_client_ids(
+        self, client_record_ids: list[int], tax_year: int
+    ) -> dict[int, Decimal]:
+        """Reported (FILED) income net per client; clients with nothing filed are absent."""
+        if not client_record_ids:
+            return {}
+        rows = self.db.execute(
+            select(
+                ClientYearVatTotals.client_record_id,
+                ClientYearVatTotals.filed_income_net,
+            ).where(
+                ClientYearVatTotals.client_record_id.in_(client_record_ids),
+                ClientYearVatTotals.tax_year == tax_year,
+                ClientYearVatTotals.filed_count > 0,
+            )
+        ).all()
+        return dict(rows)
+
+    def list_for_client(self, client_record_id: int) -> list[ClientYearVatTotals]:
+        """Years with at least one live work item, newest first."""
+        return self.db.scalars(
+            select(ClientYearVatTotals)
+            .where(
+                ClientYearVatTotals.client_record_id == client_record_id,
+                ClientYearVatTotals.periods_count > 0,
+            )
+            .order_by(ClientYearVatTotals.tax_year.desc())
+        ).all()
+
+    def list_all(self) -> list[ClientYearVatTotals]:
+        return self.db.scalars(
+            select(ClientYearVatTotals).order_by(
+                ClientYearVatTotals.client_record_id, ClientYearVatTotals.tax_year
+            )
+        ).all()
+
+    # ── Maintenance ───────────────────────────────────────────────────────────
+    # Core statements only: refresh() also runs from inside a flush
+    # (see client_year_vat_totals_events).
+
+    def compute(
+        self, keys: Iterable[tuple[int, int]] | None = None
+    ) -> dict[tuple[int, int], dict[str, object]]:
+        """Aggregate `vat_work_items` per (client_record_id, tax_year); all keys when None."""
+        year = cast(func.substr(VatWorkItem.period, 1, 4), Integer)
+        filed = VatWorkItem.status == VatWorkItemStatus.FILED
+        stmt = (
+            select(
+                VatWorkItem.client_record_id,
+                year.label("tax_year"),
+                func.sum(VatWorkItem.total_output_net).label("income_net"),
+                func.sum(VatWorkItem.total_input_net).label("expense_net"),
+                func.sum(VatWorkItem.total_output_vat).label("output_vat"),
+                func.sum(VatWorkItem.total_input_vat).label("input_vat"),
+                func.sum(case((filed, VatWorkItem.total_output_net), else_=0)).label(
+                    "filed_income_net"
+                ),
+                func.count(VatWorkItem.id).label("periods_count"),
+                func.sum(case((filed, 1), else_=0)).label("filed_count"),
+            )
+            .where(VatWorkItem.deleted_at.is_(None))
+            .group_by(VatWorkItem.client_record_id, year)
+        )
+        wanted = None if keys is None else set(keys)
+        if wanted is not None:
+            if not wanted:
+                return {}
+            stmt = stmt.where(
+                VatWorkItem.client_record_id.in_({client for client, _ in wanted}),
+                year.in_({tax_year for _, tax_year in wanted}),
+            )
+        result = {}
+        for row in self.db.execute(stmt):
+            key = (row.client_record_id, row.tax_year)
+            if wanted is not None and key not in wanted:
+                continue
+            result[key] = {
+                **{column: _cents(getattr(row, column)) for column in _TOTAL_COLUMNS},
+                **{column: int(getattr(row, column) or 0) for column in _COUNT_COLUMNS},
+            }
+        return result
+
+    def refresh(self, keys: Iterable[tuple[int, int]]) -> None:
+        """Recompute the given (client_record_id, tax_year) rows from their work items.
+
+        The rows are created if missing and locked before the work items are
+        read, so concurrent writers for the same client-year recompute one after
+        the other and the later one sees the earlier commit.
+        """
+        keys = sorted(set(keys))
+        if not keys:
+            return
+        table = ClientYearVatTotals.__table__
+        self.db.execute(
+            self._insert_missing(table),
+            [{"client_record_id": client, "tax_year": year, **_ZERO_ROW} for client, year in keys],
+        )
+        self.db.execute(
+            select(table.c.id)
+            .where(
+                table.c.client_record_id.in_({client for client, _ in keys}),
+                table.c.tax_year.in_({year for _, year in keys}),
+            )
+            .order_by(table.c.client_record_id, table.c.tax_year)
+            .with_for_update()
+        ).all()
+        live = self.compute(keys)
+        self.db.execute(
+            update(table).where(
+                table.c.client_record_id == bindparam("b_client_record_id"),
+                table.c.tax_year == bindparam("b_tax_year"),
+            ),
+            [
+                {
+                    "b_client_record_id": client,
+                    "b_tax_year": year,
+                    **live.get((client, year), _ZERO_ROW),
+                }
+                for client, year in keys
+            ],
+        )
+
+    def rebuild(self) -> int:
+        """Replace every row with a fresh aggregate; returns the number of rows written."""
+        table = ClientYearVatTotals.__table__
+        self.db.execute(delete(table))
+        rows = [
+            {"client_record_id": client, "tax_year": year, **values}
+            for (client, year), values in self.compute().items()
+        ]
+        if rows:
+            self.db.execute(insert(table), rows)
+        return len(rows)
+
+    def _insert_missing(self, table):
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "postgresql":
+            return postgresql.insert(table).on_conflict_do_nothing(
+                index_elements=["client_record_id", "tax_year"]
+            )
+        if dialect == "sqlite":
+            return sqlite.insert(table).on_conflict_do_nothing(
+                index_elements=["client_record_id", "tax_year"]
+            )
+        raise NotImplementedError(f"client_year_vat_totals upsert is not supported on {dialect}")
@@ -1,6 +1,6 @@
 """Repository for VatAuditLog entities."""
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select
 from sqlalchemy.orm import Session
 
 from app.common.repositories.base_repository import BaseRepository
@@ -33,6 +33,11 @@ class VatAuditLogRepository(BaseRepository[VatAuditLog]):
             invoice_id=invoice_id,
         )
 
+    def append_many(self, rows: list[dict]) -> None:
+        """Insert many audit entries (``append`` keyword dicts) in one statement."""
+        if rows:
+            self.db.execute(insert(VatAuditLog), rows)
+
     def count_audit_trail(self, work_item_id: int) -> int:
         return (
             self.db.scalar(
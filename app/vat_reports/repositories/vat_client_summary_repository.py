@@ -2,18 +2,22 @@
 
 from decimal import Decimal
 
-from sqlalchemy import Integer, case, cast, func, select
+from sqlalchemy import case, func, select
 from sqlalchemy.orm import Session
 
 from app.common.repositories.base_repository import BaseRepository
 from app.vat_reports.models.vat_enums import InvoiceType, VatWorkItemStatus
 from app.vat_reports.models.vat_invoice import VatInvoice
 from app.vat_reports.models.vat_work_item import VatWorkItem
+from app.vat_reports.repositories.client_year_vat_totals_repository import (
+    ClientYearVatTotalsRepository,
+)
 
 
 class VatClientSummaryRepository(BaseRepository[VatWorkItem]):
     def __init__(self, db: Session):
         self.db = db
+        self._totals = ClientYearVatTotalsRepository(db)
 
     def get_annual_output_vat(
         self,
@@ -73,15 +77,11 @@ class VatClientSummaryRepository(BaseRepository[VatWorkItem]):
     def get_annual_turnover(self, client_record_id: int, year: int):
         """Sum of total_output_net for FILED work items in the given calendar year.
 
-        Returns the scalar sum (Decimal or None if no FILED items exist).
+        Returns the scalar sum (Decimal or None if no FILED items exist). Read from
+        the client_year_vat_totals aggregate.
         """
-        return self.db.scalar(
-            select(func.sum(VatWorkItem.total_output_net)).where(
-                VatWorkItem.client_record_id == client_record_id,
-                VatWorkItem.period.like(f"{year}-%"),
-                VatWorkItem.status == VatWorkItemStatus.FILED,
-                VatWorkItem.deleted_at.is_(None),
-            )
+        return self._totals.filed_turnover_by_client_ids([client_record_id], year).get(
+            client_record_id
         )
 
     def get_annual_turnover_by_client_ids(
@@ -89,54 +89,17 @@ class VatClientSummaryRepository(BaseRepository[VatWorkItem]):
         client_record_ids: list[int],
         year: int,
     ) -> dict[int, Decimal]:
-        if not client_record_ids:
-            return {}
-
-        rows = self.db.execute(
-            select(
-                VatWorkItem.client_record_id,
-                func.sum(VatWorkItem.total_output_net),
-            )
-            .where(
-                VatWorkItem.client_record_id.in_(client_record_ids),
-                VatWorkItem.period >= f"{year}-01",
-                VatWorkItem.period <= f"{year}-12",
-                VatWorkItem.status == VatWorkItemStatus.FILED,
-                VatWorkItem.deleted_at.is_(None),
-            )
-            .group_by(VatWorkItem.client_record_id)
-        ).all()
-        return dict(rows)
+        return self._totals.filed_turnover_by_client_ids(client_record_ids, year)
 
     def get_annual_aggregates(self, client_record_id: int) -> list[dict[str, object]]:
-        year_expr = cast(func.substr(VatWorkItem.period, 1, 4), Integer).label("year")
-        rows = self.db.execute(
-            select(
-                year_expr,
-                func.sum(VatWorkItem.total_output_vat).label("total_output_vat"),
-                func.sum(VatWorkItem.total_input_vat).label("total_input_vat"),
-                func.sum(VatWorkItem.net_vat).label("net_vat"),
-                func.count(VatWorkItem.id).label("periods_count"),
-                func.sum(case((VatWorkItem.status == VatWorkItemStatus.FILED, 1), else_=0)).label(
-                    "filed_count"
-                ),
-            )
-            .where(
-                VatWorkItem.client_record_id == client_record_id,
-                VatWorkItem.deleted_at.is_(None),
-            )
-            .group_by(year_expr)
-            .order_by(year_expr.desc())
-        ).all()
-
         return [
             {
-                "year": row.year,
-                "total_output_vat": row.total_output_vat,
-                "total_input_vat": row.total_input_vat,
+                "year": row.tax_year,
+                "total_output_vat": row.output_vat,
+                "total_input_vat": row.input_vat,
                 "net_vat": row.net_vat,
                 "periods_count": row.periods_count,
                 "filed_count": row.filed_count,
             }
-            for row in rows
+            for row in self._totals.list_for_client(client_record_id)
         ]
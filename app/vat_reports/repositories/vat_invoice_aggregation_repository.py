@@ -86,6 +86,46 @@ class VatInvoiceAggregationRepository(BaseRepository[VatInvoice]):
             grouped.get(InvoiceType.EXPENSE, Decimal("0")),
         )
 
+    def sum_totals_by_work_items(
+        self, work_item_ids: list[int]
+    ) -> dict[int, tuple[Decimal, Decimal, Decimal, Decimal]]:
+        """Return {work_item_id: (output_vat, input_vat, output_net, input_net)} in one pass.
+
+        Same rules as sum_vat_both_types / sum_net_both_types; items without
+        invoices are absent from the result.
+        """
+        if not work_item_ids:
+            return {}
+        is_income = VatInvoice.invoice_type == InvoiceType.INCOME
+        is_expense = VatInvoice.invoice_type == InvoiceType.EXPENSE
+        signed_vat = self._signed_amount(VatInvoice.vat_amount)
+        signed_net = self._signed_amount(VatInvoice.net_amount)
+        rows = self.db.execute(
+            select(
+                VatInvoice.work_item_id,
+                func.sum(
+                    case(
+                        (is_income & (VatInvoice.rate_type == VatRateType.STANDARD), signed_vat),
+                        else_=0,
+                    )
+                ).label("output_vat"),
+                func.sum(
+                    case((is_expense, signed_vat * VatInvoice.deduction_rate), else_=0)
+                ).label("input_vat"),
+                func.sum(case((is_income, signed_net), else_=0)).label("output_net"),
+                func.sum(case((is_expense, signed_net), else_=0)).label("input_net"),
+            )
+            .where(VatInvoice.work_item_id.in_(work_item_ids))
+            .group_by(VatInvoice.work_item_id)
+        ).all()
+        return {
+            row.work_item_id: tuple(
+                Decimal(str(value or 0))
+                for value in (row.output_vat, row.input_vat, row.output_net, row.input_net)
+            )
+            for row in rows
+        }
+
     def sum_income_net_by_client_year(self, client_record_id: int, year: int) -> Decimal:
         """Sum net_amount of INCOME invoices for a client across a tax year.
 
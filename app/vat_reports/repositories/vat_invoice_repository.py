@@ -6,8 +6,9 @@ This class re-exposes them via composition for backward compatibility.
 """
 
 from datetime import date
+from decimal import Decimal
 
-from sqlalchemy import select
+from sqlalchemy import insert, select, tuple_
 from sqlalchemy.orm import Session
 
 from app.common.repositories.base_repository import BaseRepository
@@ -82,6 +83,30 @@ class VatInvoiceRepository(BaseRepository[VatInvoice]):
             )
         ).first()
 
+    def create_many(self, rows: list[dict]) -> list[VatInvoice]:
+        """Insert ``rows`` in one multi-row INSERT; returns the invoices in input order."""
+        if not rows:
+            return []
+        return list(
+            self.db.scalars(
+                insert(VatInvoice).returning(VatInvoice, sort_by_parameter_order=True), rows
+            )
+        )
+
+    def existing_numbers(
+        self, work_item_id: int, keys: set[tuple[InvoiceType, str]]
+    ) -> set[tuple[InvoiceType, str]]:
+        """Return which (invoice_type, invoice_number) pairs already exist on the item."""
+        if not keys:
+            return set()
+        rows = self.db.execute(
+            select(VatInvoice.invoice_type, VatInvoice.invoice_number).where(
+                VatInvoice.work_item_id == work_item_id,
+                tuple_(VatInvoice.invoice_type, VatInvoice.invoice_number).in_(list(keys)),
+            )
+        ).all()
+        return {(row.invoice_type, row.invoice_number) for row in rows}
+
     def list_by_work_item(
         self,
         work_item_id: int,
@@ -110,6 +135,11 @@ class VatInvoiceRepository(BaseRepository[VatInvoice]):
     def sum_net_both_types(self, work_item_id: int) -> tuple[float, float]:
         return self._agg.sum_net_both_types(work_item_id)
 
+    def sum_totals_by_work_items(
+        self, work_item_ids: list[int]
+    ) -> dict[int, tuple[Decimal, Decimal, Decimal, Decimal]]:
+        return self._agg.sum_totals_by_work_items(work_item_ids)
+
     def sum_income_net_by_client_year(self, client_record_id: int, year: int) -> float:
         return self._agg.sum_income_net_by_client_year(client_record_id, year)
 
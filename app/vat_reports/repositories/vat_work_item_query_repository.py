@@ -237,3 +237,16 @@ class VatWorkItemQueryRepository(BaseRepository[VatWorkItem]):
             .order_by(VatWorkItem.period.asc())
             .limit(limit)
         ).all()
+
+    def list_unfiled_after(self, after_id: int, limit: int = 500) -> list[VatWorkItem]:
+        """Keyset page (by id) of live items whose totals still follow their invoices."""
+        return self.db.scalars(
+            select(VatWorkItem)
+            .where(
+                VatWorkItem.id > after_id,
+                VatWorkItem.status.notin_(list(_FILED_STATUSES)),
+                VatWorkItem.deleted_at.is_(None),
+            )
+            .order_by(VatWorkItem.id.asc())
+            .limit(limit)
+        ).all()
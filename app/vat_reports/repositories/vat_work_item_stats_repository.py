@@ -1,16 +1,12 @@
 from sqlalchemy import func, select, tuple_
-from sqlalchemy.orm import Session
 
 from app.common.enums import VatType
-from app.common.repositories.base_repository import BaseRepository
+from app.common.repositories.read_repository import ReadRepository
 from app.vat_reports.models.vat_enums import VatWorkItemStatus
 from app.vat_reports.models.vat_work_item import VatWorkItem
 
 
-class VatWorkItemStatsRepository(BaseRepository[VatWorkItem]):
-    def __init__(self, db: Session):
-        self.db = db
-
+class VatWorkItemStatsRepository(ReadRepository[VatWorkItem]):
     def count_filed_by_period_type(self, period: str, vat_type: VatType) -> int:
         return self.db.scalar(
             select(func.count(VatWorkItem.id)).where(
@@ -1,6 +1,7 @@
 """Write operations and audit delegation for VatWorkItem entities."""
 
 from datetime import date
+from decimal import Decimal
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session
@@ -80,6 +81,9 @@ class VatWorkItemWriteRepository(BaseRepository[VatWorkItem]):
     def list_open_up_to_period(self, up_to_period: str, limit: int = 50) -> list[VatWorkItem]:
         return self._query.list_open_up_to_period(up_to_period, limit=limit)
 
+    def list_unfiled_after(self, after_id: int, limit: int = 500) -> list[VatWorkItem]:
+        return self._query.list_unfiled_after(after_id, limit=limit)
+
     def create(
         self,
         *,
@@ -156,8 +160,6 @@ class VatWorkItemWriteRepository(BaseRepository[VatWorkItem]):
         total_output_net,
         total_input_net,
     ) -> VatWorkItem | None:
-        from decimal import Decimal
-
         item = self.get_by_id(item_id)
         if not item:
             return None
@@ -170,6 +172,24 @@ class VatWorkItemWriteRepository(BaseRepository[VatWorkItem]):
         self.db.flush()
         return item
 
+    def apply_vat_total_deltas(
+        self,
+        item: VatWorkItem,
+        output_vat: Decimal,
+        input_vat: Decimal,
+        output_net: Decimal,
+        input_net: Decimal,
+    ) -> VatWorkItem:
+        """Add deltas to the stored totals in SQL, so concurrent writers cannot lose updates."""
+        item.total_output_vat = VatWorkItem.total_output_vat + output_vat
+        item.total_input_vat = VatWorkItem.total_input_vat + input_vat
+        item.net_vat = VatWorkItem.net_vat + (output_vat - input_vat)
+        item.total_output_net = VatWorkItem.total_output_net + output_net
+        item.total_input_net = VatWorkItem.total_input_net + input_net
+        item.updated_at = utcnow()
+        self.db.flush()
+        return item
+
     def mark_filed(
         self,
         item_id: int,
@@ -205,6 +225,9 @@ class VatWorkItemWriteRepository(BaseRepository[VatWorkItem]):
     def append_audit(self, **kwargs) -> VatAuditLog:
         return self._audit.append(**kwargs)
 
+    def append_audits(self, rows: list[dict]) -> None:
+        self._audit.append_many(rows)
+
     def count_audit_trail(self, work_item_id: int) -> int:
         return self._audit.count_audit_trail(work_item_id)
 
@@ -19,6 +19,7 @@ MAX_INVOICE_NUMBER_LENGTH = 100
 MAX_COUNTERPARTY_NAME_LENGTH = 255
 MAX_COUNTERPARTY_ID_LENGTH = 32
 ANONYMOUS_COUNTERPARTY_ID = "999999999"
+MAX_INVOICE_BATCH_ROWS = 1000
 
 
 class VatInvoiceValidatorMixin(BaseModel):
@@ -112,3 +113,13 @@ class VatInvoiceResponse(BaseModel):
 
 class VatInvoiceListResponse(BaseModel):
     items: list[VatInvoiceResponse]
+
+
+class VatInvoiceBatchRequest(BaseModel):
+    invoices: list[VatInvoiceCreateRequest] = Field(min_length=1, max_length=MAX_INVOICE_BATCH_ROWS)
+
+
+class VatInvoiceBatchResponse(BaseModel):
+    items: list[VatInvoiceResponse]
+    # True when annual turnover after the batch crosses 80% of the OSEK PATUR ceiling
+    ceiling_warning: bool = False
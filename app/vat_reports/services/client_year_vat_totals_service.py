@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from sqlalchemy.orm import Session
+
+from app.common.services.base_service import BaseService
+from app.core.logging_config import get_logger
+from app.vat_reports.repositories.client_year_vat_totals_repository import (
+    ClientYearVatTotalsRepository,
+)
+
+logger = get_logger(__name__)
+
+ClientYearKey = tuple[int, int]
+
+
+@dataclass(frozen=True)
+class ClientYearTotalsMismatch:
+    client_record_id: int
+    tax_year: int
+    field: str
+    stored: object
+    live: object
+
+
+@dataclass
+class ClientYearTotalsReport:
+    stored_rows: int = 0
+    live_rows: int = 0
+    missing: list[ClientYearKey] = field(default_factory=list)
+    mismatched: list[ClientYearTotalsMismatch] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not (self.missing or self.mismatched)
+
+
+class ClientYearVatTotalsService(BaseService):
+    """Rebuilds and verifies the `client_year_vat_totals` aggregate."""
+
+    def __init__(self, db: Session):
+        super().__init__(db)
+        self.repo = ClientYearVatTotalsRepository(db)
+
+    def rebuild(self) -> int:
+        count = self.repo.rebuild()
+        logger.info("client_year_vat_totals rebuilt: %d row(s)", count)
+        return count
+
+    def check(self) -> ClientYearTotalsReport:
+        """Compare the stored rows against a fresh aggregate of `vat_work_items`."""
+        live = self.repo.compute()
+        stored = {(row.client_record_id, row.tax_year): row for row in self.repo.list_all()}
+        report = ClientYearTotalsReport(stored_rows=len(stored), live_rows=len(live))
+        for key, values in sorted(live.items()):
+            row = stored.get(key)
+            if row is None:
+                report.missing.append(key)
+                continue
+            for name, value in values.items():
+                if getattr(row, name) != value:
+                    report.mismatched.append(
+                        ClientYearTotalsMismatch(*key, name, getattr(row, name), value)
+                    )
+        # Rows for years whose work items are all gone must have been zeroed.
+        for key, row in sorted(stored.items()):
+            if key not in live and row.periods_count:
+                report.mismatched.append(
+                    ClientYearTotalsMismatch(*key, "periods_count", row.periods_count, 0)
+                )
+        return report
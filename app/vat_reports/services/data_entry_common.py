@@ -9,7 +9,15 @@ from app.vat_reports.integrations.tax_rules_financials import (
     get_financial_value,
     get_vat_deduction_rate_for_category,
 )
-from app.vat_reports.models.vat_enums import DocumentType, InvoiceType, VatWorkItemStatus
+from app.vat_reports.models.vat_enums import (
+    DocumentType,
+    InvoiceType,
+    VatRateType,
+    VatWorkItemStatus,
+)
+from app.vat_reports.repositories.client_year_vat_totals_repository import (
+    ClientYearVatTotalsRepository,
+)
 from app.vat_reports.repositories.vat_invoice_repository import VatInvoiceRepository
 from app.vat_reports.repositories.vat_work_item_write_repository import (
     VatWorkItemWriteRepository as VatWorkItemRepository,
@@ -60,6 +68,27 @@ def recalculate_totals(
     return output_vat, input_vat
 
 
+def invoice_totals(invoices) -> tuple[Decimal, Decimal, Decimal, Decimal]:
+    """Return (output_vat, input_vat, output_net, input_net) contributed by ``invoices``.
+
+    Mirrors VatInvoiceAggregationRepository, so adding the result to a work item's
+    totals equals re-summing its invoices.
+    """
+    output_vat = input_vat = output_net = input_net = Decimal("0")
+    for invoice in invoices:
+        sign = -1 if invoice.document_type == DocumentType.CREDIT_NOTE else 1
+        vat = sign * Decimal(str(invoice.vat_amount))
+        net = sign * Decimal(str(invoice.net_amount))
+        if invoice.invoice_type == InvoiceType.INCOME:
+            if invoice.rate_type == VatRateType.STANDARD:
+                output_vat += vat
+            output_net += net
+        elif invoice.invoice_type == InvoiceType.EXPENSE:
+            input_vat += vat * Decimal(str(invoice.deduction_rate))
+            input_net += net
+    return output_vat, input_vat, output_net, input_net
+
+
 def audit_invoice_snapshot(invoice) -> str:
     return json.dumps(
         {
@@ -112,21 +141,22 @@ def resolve_invoice_derived_fields(
 
 def check_osek_patur_ceiling(
     client,
-    invoice_repo: VatInvoiceRepository,
+    totals_repo: ClientYearVatTotalsRepository,
     client_record_id: int,
     period: str,
     new_net_amount: float,
 ) -> bool:
     """Raise AppError if adding this income invoice would exceed the OSEK PATUR ceiling.
     Returns True if the post-add turnover crosses the 80% warning threshold (non-blocking).
-    Only enforced for OSEK_PATUR clients (EntityType.OSEK_PATUR).
+    Only enforced for OSEK_PATUR clients (EntityType.OSEK_PATUR). The year's turnover so
+    far comes from the client_year_vat_totals aggregate.
     """
     is_osek_patur = getattr(client, "entity_type", None) == EntityType.OSEK_PATUR
     if not is_osek_patur:
         return False
     year = int(period[:4])
     ceiling = Decimal(str(get_financial_value(year, "osek_patur_ceiling_ils").value))
-    current_total = Decimal(str(invoice_repo.sum_income_net_by_client_year(client_record_id, year)))
+    current_total = Decimal(str(totals_repo.get_income_net(client_record_id, year)))
     new_total = current_total + Decimal(str(new_net_amount))
     if new_total > ceiling:
         raise AppError(
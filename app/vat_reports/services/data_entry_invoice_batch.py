@@ -0,0 +1,259 @@
+"""Batch invoice add flow for VAT work items.
+
+Same rules as `data_entry_invoices.add_invoice`, applied to many invoices at
+once: every row is validated before anything is written (all or nothing), the
+invoices go in with one multi-row INSERT, and the work item's totals move by
+the batch's contribution instead of being re-summed. The OSEK PATUR ceiling is
+checked once for the whole batch.
+"""
+
+from collections.abc import Sequence
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import uuid4
+
+from app.businesses.repositories.business_repository import BusinessRepository
+from app.clients.enums import ClientStatus
+from app.clients.repositories.client_record_repository import ClientRecordRepository
+from app.clients.repositories.legal_entity_repository import LegalEntityRepository
+from app.core.exceptions import AppError, NotFoundError
+from app.vat_reports.models.vat_enums import InvoiceType, VatWorkItemStatus
+from app.vat_reports.repositories.client_year_vat_totals_repository import (
+    ClientYearVatTotalsRepository,
+)
+from app.vat_reports.repositories.vat_invoice_repository import VatInvoiceRepository
+from app.vat_reports.repositories.vat_work_item_write_repository import (
+    VatWorkItemWriteRepository as VatWorkItemRepository,
+)
+from app.vat_reports.schemas.vat_invoice_schema import VatInvoiceCreateRequest
+from app.vat_reports.services.constants import (
+    ACTION_INVOICE_ADDED,
+    ACTION_STATUS_CHANGED,
+    CATEGORY_LABELS_SERVER,
+)
+from app.vat_reports.services.data_entry_common import (
+    assert_editable,
+    audit_invoice_snapshot,
+    check_osek_patur_ceiling,
+    invoice_totals,
+    resolve_invoice_derived_fields,
+)
+from app.vat_reports.services.messages import (
+    VAT_ADD_INVOICE_INVALID_STATUS,
+    VAT_AUTO_STATUS_CHANGE_ON_FIRST_INVOICE,
+    VAT_BUSINESS_ACTIVITY_WRONG_CLIENT,
+    VAT_CLIENT_CLOSED_ADD_INVOICES,
+    VAT_INCOME_COUNTERPARTY_NAME,
+    VAT_INVOICE_BATCH_DUPLICATE_NUMBER,
+    VAT_INVOICE_BATCH_INVALID_ROWS,
+    VAT_INVOICE_NUMBER_CONFLICT,
+    VAT_ITEM_NOT_FOUND,
+    VAT_UNKNOWN_COUNTERPARTY_NAME,
+)
+from app.vat_reports.services.vat_amounts import split_gross_amount
+
+
+def add_invoices(
+    work_item_repo: VatWorkItemRepository,
+    invoice_repo: VatInvoiceRepository,
+    *,
+    item_id: int,
+    created_by: int,
+    rows: Sequence[tuple[int, VatInvoiceCreateRequest]],
+    errors: list[dict] | None = None,
+):
+    """Add ``rows`` (row number, request) to a work item in one go.
+
+    ``errors`` carries rows already rejected upstream (e.g. while parsing an
+    upload). Any row error rejects the whole batch with every error listed in
+    ``details``. Returns (invoices, ceiling_warning).
+    """
+    item = work_item_repo.get_by_id_for_update(item_id)
+    if not item:
+        raise NotFoundError(VAT_ITEM_NOT_FOUND.format(item_id=item_id), "VAT.NOT_FOUND")
+
+    assert_editable(item)
+
+    db = work_item_repo.db
+    record = ClientRecordRepository(db).get_by_id(item.client_record_id)
+    if not record:
+        raise NotFoundError(
+            VAT_ITEM_NOT_FOUND.format(item_id=item_id),
+            "VAT.CLIENT_RECORD_NOT_FOUND",
+        )
+    if record.status == ClientStatus.CLOSED:
+        raise AppError(VAT_CLIENT_CLOSED_ADD_INVOICES, "VAT.CLIENT_CLOSED")
+
+    original_status = item.status
+    if original_status not in (
+        VatWorkItemStatus.MATERIAL_RECEIVED,
+        VatWorkItemStatus.DATA_ENTRY_IN_PROGRESS,
+        VatWorkItemStatus.READY_FOR_REVIEW,
+    ):
+        raise AppError(
+            VAT_ADD_INVOICE_INVALID_STATUS.format(status=original_status.value),
+            "VAT.INVALID_STATUS",
+        )
+
+    errors = list(errors or [])
+    values = _build_rows(db, item, record, rows, errors, created_by=created_by)
+    _reject_duplicate_numbers(invoice_repo, item_id, values, errors)
+    if errors:
+        errors.sort(key=lambda error: error["row"])
+        raise AppError(
+            VAT_INVOICE_BATCH_INVALID_ROWS.format(count=len(errors)),
+            "VAT.BATCH_INVALID_ROWS",
+            details={"errors": errors},
+        )
+
+    ceiling_warning = False
+    income_nets = [row["net_amount"] for _, row in values if _is_income(row)]
+    legal_entity = (
+        LegalEntityRepository(db).get_by_id(record.legal_entity_id) if income_nets else None
+    )
+    if legal_entity:
+        ceiling_warning = check_osek_patur_ceiling(
+            legal_entity,
+            ClientYearVatTotalsRepository(db),
+            item.client_record_id,
+            item.period,
+            sum(income_nets, Decimal("0")),
+        )
+
+    if original_status == VatWorkItemStatus.MATERIAL_RECEIVED:
+        work_item_repo.update_status(item_id, VatWorkItemStatus.DATA_ENTRY_IN_PROGRESS, item=item)
+        work_item_repo.append_audit(
+            work_item_id=item_id,
+            performed_by=created_by,
+            action=ACTION_STATUS_CHANGED,
+            old_value=VatWorkItemStatus.MATERIAL_RECEIVED.value,
+            new_value=VatWorkItemStatus.DATA_ENTRY_IN_PROGRESS.value,
+            note=VAT_AUTO_STATUS_CHANGE_ON_FIRST_INVOICE,
+        )
+
+    invoices = invoice_repo.create_many([row for _, row in values])
+    work_item_repo.apply_vat_total_deltas(item, *invoice_totals(invoices))
+    work_item_repo.append_audits(
+        [
+            {
+                "work_item_id": item_id,
+                "performed_by": created_by,
+                "action": ACTION_INVOICE_ADDED,
+                "new_value": audit_invoice_snapshot(invoice),
+                "invoice_id": invoice.id,
+            }
+            for invoice in invoices
+        ]
+    )
+    return invoices, ceiling_warning
+
+
+def _is_income(row: dict) -> bool:
+    return row["invoice_type"] == InvoiceType.INCOME
+
+
+def _build_rows(
+    db,
+    item,
+    record,
+    rows: Sequence[tuple[int, VatInvoiceCreateRequest]],
+    errors: list[dict],
+    *,
+    created_by: int,
+) -> list[tuple[int, dict]]:
+    """Validate each row and derive its insert values; failures go to ``errors``."""
+    year = int(item.period[:4])
+    activity_ids = {row.business_activity_id for _, row in rows} - {None}
+    own_activities = {
+        business.id
+        for business in BusinessRepository(db).list_by_ids(sorted(activity_ids))
+        if business.legal_entity_id == record.legal_entity_id
+    }
+
+    values: list[tuple[int, dict]] = []
+    for row_number, request in rows:
+        try:
+            if (
+                request.business_activity_id is not None
+                and request.business_activity_id not in own_activities
+            ):
+                raise AppError(
+                    VAT_BUSINESS_ACTIVITY_WRONG_CLIENT,
+                    "BUSINESS_ACTIVITY.WRONG_CLIENT",
+                )
+            net_amount, vat_amount = split_gross_amount(
+                request.gross_amount, request.rate_type, year
+            )
+            derived = resolve_invoice_derived_fields(
+                request.invoice_type,
+                request.expense_category,
+                request.document_type,
+                request.counterparty_id,
+                float(net_amount),
+                float(vat_amount),
+                year=year,
+            )
+        except AppError as exc:
+            errors.append({"row": row_number, "error": exc.message})
+            continue
+        values.append(
+            (
+                row_number,
+                {
+                    "work_item_id": item.id,
+                    "created_by": created_by,
+                    "business_activity_id": request.business_activity_id,
+                    "invoice_type": request.invoice_type,
+                    "document_type": request.document_type,
+                    "invoice_number": request.invoice_number
+                    or f"{item.period}-{request.invoice_type.value}-{uuid4().hex[:8]}",
+                    "invoice_date": request.invoice_date or _period_start(item.period),
+                    "counterparty_name": request.counterparty_name
+                    or _default_counterparty_name(request),
+                    "counterparty_id": request.counterparty_id,
+                    "counterparty_id_type": request.counterparty_id_type,
+                    "net_amount": net_amount,
+                    "vat_amount": vat_amount,
+                    "expense_category": request.expense_category,
+                    "rate_type": request.rate_type,
+                    "deduction_rate": derived["deduction_rate"],
+                    "is_exceptional": derived["is_exceptional"],
+                },
+            )
+        )
+    return values
+
+
+def _reject_duplicate_numbers(
+    invoice_repo: VatInvoiceRepository,
+    item_id: int,
+    values: list[tuple[int, dict]],
+    errors: list[dict],
+) -> None:
+    """Flag numbers repeated inside the batch or already stored on the work item."""
+    keys = {(row["invoice_type"], row["invoice_number"]) for _, row in values}
+    existing = invoice_repo.existing_numbers(item_id, keys)
+    seen: set[tuple[InvoiceType, str]] = set()
+    for row_number, row in values:
+        key = (row["invoice_type"], row["invoice_number"])
+        if key in existing:
+            message = VAT_INVOICE_NUMBER_CONFLICT.format(invoice_number=key[1])
+        elif key in seen:
+            message = VAT_INVOICE_BATCH_DUPLICATE_NUMBER.format(invoice_number=key[1])
+        else:
+            seen.add(key)
+            continue
+        errors.append({"row": row_number, "error": message})
+
+
+def _period_start(period: str) -> date:
+    return datetime.strptime(f"{period}-01", "%Y-%m-%d").date()
+
+
+def _default_counterparty_name(request: VatInvoiceCreateRequest) -> str:
+    if request.invoice_type == InvoiceType.INCOME:
+        return VAT_INCOME_COUNTERPARTY_NAME
+    return CATEGORY_LABELS_SERVER.get(
+        request.expense_category.value if request.expense_category else "",
+        VAT_UNKNOWN_COUNTERPARTY_NAME,
+    )
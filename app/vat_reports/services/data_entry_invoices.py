@@ -17,6 +17,9 @@ from app.vat_reports.models.vat_enums import (
     VatRateType,
     VatWorkItemStatus,
 )
+from app.vat_reports.repositories.client_year_vat_totals_repository import (
+    ClientYearVatTotalsRepository,
+)
 from app.vat_reports.repositories.vat_invoice_repository import VatInvoiceRepository
 from app.vat_reports.repositories.vat_work_item_write_repository import (
     VatWorkItemWriteRepository as VatWorkItemRepository,
@@ -114,7 +117,11 @@ def add_invoice(
     if invoice_type == InvoiceType.INCOME and legal_entity:
         scope_id = item.client_record_id
         ceiling_warning = check_osek_patur_ceiling(
-            legal_entity, invoice_repo, scope_id, item.period, float(net_amount)
+            legal_entity,
+            ClientYearVatTotalsRepository(db),
+            scope_id,
+            item.period,
+            float(net_amount),
         )
 
     # Auto-fill optional fields when not provided by caller
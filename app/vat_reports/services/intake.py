@@ -48,6 +48,17 @@ def _validate_period_for_vat_type(period: str, vat_type: VatType) -> None:
             )
 
 
+def work_item_created_audit(item, performed_by: int) -> dict:
+    """The audit entry recording a new work item and the status it opened in."""
+    pending = item.status == VatWorkItemStatus.PENDING_MATERIALS
+    return {
+        "work_item_id": item.id,
+        "performed_by": performed_by,
+        "action": ACTION_WORK_ITEM_CREATED_PENDING if pending else ACTION_MATERIAL_RECEIVED,
+        "new_value": json.dumps({"status": item.status.value, "period": item.period}),
+    }
+
+
 def create_work_item(
     work_item_repo: VatWorkItemRepository,
     db,
@@ -111,13 +122,7 @@ def create_work_item(
     materializer.link_vat_work_item(item)
     db.flush()
 
-    action = ACTION_WORK_ITEM_CREATED_PENDING if mark_pending else ACTION_MATERIAL_RECEIVED
-    work_item_repo.append_audit(
-        work_item_id=item.id,
-        performed_by=created_by,
-        action=action,
-        new_value=json.dumps({"status": status.value, "period": period}),
-    )
+    work_item_repo.append_audit(**work_item_created_audit(item, created_by))
 
     return item
 
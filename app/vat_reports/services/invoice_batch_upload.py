@@ -0,0 +1,109 @@
+"""Parse CSV / Excel invoice uploads into batch rows for `data_entry_invoice_batch`.
+
+The first row holds the column names, which are the fields of
+`VatInvoiceCreateRequest` (``invoice_type``, ``gross_amount``, ...); unknown
+columns are ignored and empty cells fall back to the request defaults. Rows are
+numbered as in the file (the header is row 1).
+"""
+
+import csv
+from datetime import date, datetime
+from io import BytesIO, StringIO
+
+from pydantic import ValidationError
+
+from app.core.exceptions import AppError
+from app.vat_reports.schemas.vat_invoice_schema import (
+    MAX_INVOICE_BATCH_ROWS,
+    VatInvoiceCreateRequest,
+)
+from app.vat_reports.services.messages import (
+    VAT_INVOICE_BATCH_TOO_MANY_ROWS,
+    VAT_INVOICE_UPLOAD_EMPTY,
+    VAT_INVOICE_UPLOAD_TOO_LARGE,
+    VAT_INVOICE_UPLOAD_UNREADABLE,
+    VAT_INVOICE_UPLOAD_UNSUPPORTED,
+)
+
+MAX_INVOICE_UPLOAD_SIZE = 5 * 1024 * 1024
+INVOICE_UPLOAD_COLUMNS = frozenset(VatInvoiceCreateRequest.model_fields)
+
+
+def read_invoice_upload(
+    filename: str | None, contents: bytes
+) -> tuple[list[tuple[int, VatInvoiceCreateRequest]], list[dict]]:
+    """Return (rows, errors): valid (row number, request) pairs and per-row schema errors."""
+    if len(contents) > MAX_INVOICE_UPLOAD_SIZE:
+        raise AppError(VAT_INVOICE_UPLOAD_TOO_LARGE, "VAT.UPLOAD_TOO_LARGE", status_code=413)
+    name = (filename or "").lower()
+    if name.endswith(".csv"):
+        table = _read_csv(contents)
+    elif name.endswith(".xlsx"):
+        table = _read_xlsx(contents)
+    else:
+        raise AppError(VAT_INVOICE_UPLOAD_UNSUPPORTED, "VAT.UPLOAD_UNSUPPORTED")
+
+    header = [str(cell).strip().lower() if cell is not None else "" for cell in next(table, [])]
+    rows: list[tuple[int, VatInvoiceCreateRequest]] = []
+    errors: list[dict] = []
+    for row_number, cells in enumerate(table, start=2):
+        values = {}
+        for column, cell in zip(header, cells, strict=False):
+            text = _cell_text(cell)
+            if column in INVOICE_UPLOAD_COLUMNS and text is not None:
+                values[column] = text
+        if not values:
+            continue
+        if len(rows) + len(errors) >= MAX_INVOICE_BATCH_ROWS:
+            raise AppError(
+                VAT_INVOICE_BATCH_TOO_MANY_ROWS.format(max_rows=MAX_INVOICE_BATCH_ROWS),
+                "VAT.BATCH_TOO_LARGE",
+            )
+        try:
+            rows.append((row_number, VatInvoiceCreateRequest(**values)))
+        except ValidationError as exc:
+            errors.append({"row": row_number, "error": _validation_message(exc)})
+    if not rows and not errors:
+        raise AppError(VAT_INVOICE_UPLOAD_EMPTY, "VAT.UPLOAD_EMPTY")
+    return rows, errors
+
+
+def _read_csv(contents: bytes):
+    try:
+        text = contents.decode("utf-8-sig")
+    except UnicodeDecodeError as exc:
+        raise AppError(VAT_INVOICE_UPLOAD_UNREADABLE, "VAT.UPLOAD_UNREADABLE") from exc
+    return iter(csv.reader(StringIO(text)))
+
+
+def _read_xlsx(contents: bytes):
+    from openpyxl import load_workbook
+
+    try:
+        workbook = load_workbook(BytesIO(contents), read_only=True, data_only=True)
+    except Exception as exc:
+        raise AppError(VAT_INVOICE_UPLOAD_UNREADABLE, "VAT.UPLOAD_UNREADABLE") from exc
+    return workbook.active.iter_rows(values_only=True)
+
+
+def _cell_text(cell) -> str | None:
+    """Normalise a CSV / Excel cell to the text the request schema parses."""
+    if cell is None:
+        return None
+    if isinstance(cell, datetime):
+        return cell.date().isoformat()
+    if isinstance(cell, date):
+        return cell.isoformat()
+    if isinstance(cell, float) and cell.is_integer():
+        return str(int(cell))
+    text = str(cell).strip()
+    return text or None
+
+
+def _validation_message(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+        if error["loc"]
+        else error["msg"]
+        for error in exc.errors()
+    )
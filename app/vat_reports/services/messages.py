@@ -22,6 +22,13 @@ VAT_INCOME_COUNTERPARTY_NAME = "הכנסות"
 VAT_UNKNOWN_COUNTERPARTY_NAME = "לא ידוע"
 VAT_INVOICE_NUMBER_CONFLICT = "מספר חשבונית '{invoice_number}' כבר קיים לתקופה ולסוג הזה"
 VAT_AUTO_STATUS_CHANGE_ON_FIRST_INVOICE = "מעבר אוטומטי בעת הוספת חשבונית ראשונה"
+VAT_INVOICE_BATCH_INVALID_ROWS = "{count} שורות אינן תקינות — לא נוספו חשבוניות"
+VAT_INVOICE_BATCH_DUPLICATE_NUMBER = "מספר חשבונית '{invoice_number}' מופיע יותר מפעם אחת"
+VAT_INVOICE_BATCH_TOO_MANY_ROWS = "ניתן להוסיף עד {max_rows} חשבוניות בבת אחת"
+VAT_INVOICE_UPLOAD_TOO_LARGE = "הקובץ חורג ממגבלת הגודל של 5MB"
+VAT_INVOICE_UPLOAD_UNSUPPORTED = "יש להעלות קובץ CSV או Excel (xlsx)"
+VAT_INVOICE_UPLOAD_UNREADABLE = "לא ניתן לקרוא את קובץ החשבוניות"
+VAT_INVOICE_UPLOAD_EMPTY = "קובץ החשבוניות אינו מכיל שורות"
 VAT_ADD_INVOICE_INVALID_STATUS = "לא ניתן להוסיף חשבוניות לפריט עבודה במצב {status}"
 VAT_INVOICE_NOT_FOUND_IN_WORK_ITEM = "החשבונית {invoice_id} לא נמצאה בפריט עבודה {item_id}"
 VAT_READY_FOR_REVIEW_INVALID_STATUS = "לא ניתן לסמן מוכן לבדיקה מסטטוס {status}"
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from decimal import Decimal
 
-from app.utils.excel import adjust_column_widths, save_workbook_to_temp
+from app.utils.excel import StreamingWorkbook, save_workbook_to_temp
 from app.vat_reports.schemas.vat_client_summary_schema import VatPeriodRow
 
 
@@ -16,66 +16,48 @@ def export_vat_to_excel(
     periods: list[VatPeriodRow],
     export_dir: str,
 ) -> dict[str, object]:
-    try:
-        import openpyxl
-        from openpyxl.styles import Alignment, Font, PatternFill
-    except ImportError as exc:
-        raise ImportError(
-            "הספרייה openpyxl נדרשת. יש להתקין באמצעות: pip install openpyxl"
-        ) from exc
+    wb = StreamingWorkbook()
+    from openpyxl.styles import Alignment, Font, PatternFill
 
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = f"מע״מ {year}"
+    ws = wb.add_sheet(f"מע״מ {year}", max_width=40)
 
     header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
     header_font = Font(bold=True, color="FFFFFF")
     center = Alignment(horizontal="center", vertical="center")
 
-    ws.merge_cells("A1:G1")
-    title = ws["A1"]
-    title.value = f"{client_name} — מע״מ {year}"
-    title.font = Font(bold=True, size=13)
-    title.alignment = center
-
+    ws.append([f"{client_name} — מע״מ {year}"], font=Font(bold=True, size=13))
+    ws.append([])
     headers = ["תקופה", "סטטוס", "עסקאות", "תשומות", "נטו", "סופי", "הוגש"]
-    for col, h in enumerate(headers, start=1):
-        cell = ws.cell(row=3, column=col, value=h)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = center
+    ws.append(headers, fill=header_fill, font=header_font, alignment=center)
 
-    row = 4
     totals = {"output": Decimal(0), "input": Decimal(0), "net": Decimal(0)}
     for p in periods:
         status_str = p.status.value if hasattr(p.status, "value") else str(p.status)
-        ws.cell(row=row, column=1, value=p.period)
-        ws.cell(row=row, column=2, value=status_str)
-        ws.cell(row=row, column=3, value=float(p.total_output_vat))
-        ws.cell(row=row, column=4, value=float(p.total_input_vat))
-        ws.cell(row=row, column=5, value=float(p.net_vat))
-        ws.cell(
-            row=row,
-            column=6,
-            value=float(p.final_vat_amount) if p.final_vat_amount is not None else "",
-        )
-        ws.cell(
-            row=row,
-            column=7,
-            value=p.filed_at.strftime("%d/%m/%Y") if p.filed_at else "",
+        ws.append(
+            [
+                p.period,
+                status_str,
+                float(p.total_output_vat),
+                float(p.total_input_vat),
+                float(p.net_vat),
+                float(p.final_vat_amount) if p.final_vat_amount is not None else "",
+                p.filed_at.strftime("%d/%m/%Y") if p.filed_at else "",
+            ]
         )
         totals["output"] += p.total_output_vat
         totals["input"] += p.total_input_vat
         totals["net"] += p.net_vat
-        row += 1
 
-    row += 1
-    ws.cell(row=row, column=1, value="סה״כ").font = Font(bold=True)
-    ws.cell(row=row, column=3, value=float(totals["output"]))
-    ws.cell(row=row, column=4, value=float(totals["input"]))
-    ws.cell(row=row, column=5, value=float(totals["net"]))
-
-    adjust_column_widths(ws, max_width=40)
+    ws.append([])
+    ws.append(
+        [
+            ws.cell("סה״כ", font=Font(bold=True)),
+            None,
+            float(totals["output"]),
+            float(totals["input"]),
+            float(totals["net"]),
+        ]
+    )
 
     return save_workbook_to_temp(
         wb,
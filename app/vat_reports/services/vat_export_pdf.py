@@ -22,6 +22,29 @@ def _hebrew(text: str) -> str:
     return get_display(text)
 
 
+def register_fonts() -> tuple[str, str]:
+    """Register the Hebrew fonts once per process; returns (regular, bold) names."""
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+
+    font_name = "Assistant"
+    font_name_bold = "Assistant-Bold"
+    if font_name_bold in pdfmetrics.getRegisteredFontNames():
+        return font_name, font_name_bold
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+    font_regular = os.path.join(project_root, "assets", "fonts", "Assistant-Regular.ttf")
+    font_bold = os.path.join(project_root, "assets", "fonts", "Assistant-Bold.ttf")
+    try:
+        pdfmetrics.registerFont(TTFont(font_name, font_regular))
+        pdfmetrics.registerFont(TTFont(font_name_bold, font_bold))
+    except Exception as e:
+        raise ImportError(
+            f"Cannot load Hebrew fonts from {font_regular} or {font_bold}. "
+            "Ensure assets/fonts/ directory contains Assistant-Regular.ttf and Assistant-Bold.ttf"
+        ) from e
+    return font_name, font_name_bold
+
+
 def export_vat_to_pdf(
     client_name: str,
     client_record_id: int,
@@ -34,8 +57,6 @@ def export_vat_to_pdf(
         from reportlab.lib.pagesizes import A4, landscape
         from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
         from reportlab.lib.units import cm
-        from reportlab.pdfbase import pdfmetrics
-        from reportlab.pdfbase.ttfonts import TTFont
         from reportlab.platypus import (
             Paragraph,
             SimpleDocTemplate,
@@ -48,19 +69,7 @@ def export_vat_to_pdf(
             "הספרייה reportlab נדרשת. יש להתקין באמצעות: pip install reportlab"
         ) from exc
 
-    font_name = "Assistant"
-    font_name_bold = "Assistant-Bold"
-    try:
-        project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-        font_regular = os.path.join(project_root, "assets", "fonts", "Assistant-Regular.ttf")
-        font_bold = os.path.join(project_root, "assets", "fonts", "Assistant-Bold.ttf")
-        pdfmetrics.registerFont(TTFont(font_name, font_regular))
-        pdfmetrics.registerFont(TTFont(font_name_bold, font_bold))
-    except Exception as e:
-        raise ImportError(
-            f"Cannot load Hebrew fonts from {font_regular} or {font_bold}. "
-            "Ensure assets/fonts/ directory contains Assistant-Regular.ttf and Assistant-Bold.ttf"
-        ) from e
+    font_name, font_name_bold = register_fonts()
 
     filename = f"vat_{client_record_id}_{year}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
     filepath = os.path.join(export_dir, filename)
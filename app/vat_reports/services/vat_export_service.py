@@ -26,7 +26,7 @@ def _get_export_dir() -> str:
     return path
 
 
-def _load(db: Session, client_record_id: int, year: int):
+def load_export_data(db: Session, client_record_id: int, year: int):
     client_record = ClientRecordRepository(db).get_by_id(client_record_id)
     if not client_record:
         raise NotFoundError(
@@ -58,12 +58,12 @@ def _load(db: Session, client_record_id: int, year: int):
 
 
 def export_to_excel(db: Session, client_record_id: int, year: int) -> dict[str, object]:
-    display_name, periods = _load(db, client_record_id, year)
+    display_name, periods = load_export_data(db, client_record_id, year)
     return export_vat_to_excel(display_name, client_record_id, year, periods, _get_export_dir())
 
 
 def export_to_pdf(db: Session, client_record_id: int, year: int) -> dict[str, object]:
-    display_name, periods = _load(db, client_record_id, year)
+    display_name, periods = load_export_data(db, client_record_id, year)
     return export_vat_to_pdf(display_name, client_record_id, year, periods, _get_export_dir())
 
 
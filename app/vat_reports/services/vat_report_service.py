@@ -19,6 +19,7 @@ from app.vat_reports.services import (
     vat_report_enrichment,
     vat_report_queries,
 )
+from app.vat_reports.services.data_entry_invoice_batch import add_invoices
 from app.vat_reports.services.data_entry_invoice_delete import delete_invoice
 from app.vat_reports.services.data_entry_invoice_update import update_invoice
 from app.vat_reports.services.data_entry_invoices import add_invoice
@@ -26,6 +27,7 @@ from app.vat_reports.services.data_entry_status import (
     mark_ready_for_review,
     send_back_for_correction,
 )
+from app.vat_reports.services.invoice_batch_upload import read_invoice_upload
 
 
 class VatReportService:
@@ -62,6 +64,15 @@ class VatReportService:
     def add_invoice(self, **kwargs):
         return add_invoice(self.work_item_repo, self.invoice_repo, **kwargs)
 
+    def add_invoices(self, **kwargs):
+        return add_invoices(self.work_item_repo, self.invoice_repo, **kwargs)
+
+    def add_invoices_from_upload(
+        self, *, item_id: int, created_by: int, filename: str | None, contents: bytes
+    ):
+        rows, errors = read_invoice_upload(filename, contents)
+        return self.add_invoices(item_id=item_id, created_by=created_by, rows=rows, errors=errors)
+
     def delete_invoice(self, **kwargs):
         return delete_invoice(self.work_item_repo, self.invoice_repo, **kwargs)
 
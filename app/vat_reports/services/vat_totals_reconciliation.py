@@ -0,0 +1,58 @@
+"""Verify the denormalized VAT totals on work items against their invoices.
+
+Batch invoice adds move `VatWorkItem` totals by deltas rather than re-summing,
+so a stored total can drift by rounding (or a missed path). This pass re-sums
+every unfiled item, a page at a time, and rewrites totals that disagree. FILED
+items are skipped — their totals are the snapshot that was submitted.
+"""
+
+from decimal import ROUND_HALF_UP, Decimal
+
+from sqlalchemy.orm import Session
+
+from app.core.logging_config import get_logger
+from app.vat_reports.repositories.vat_invoice_repository import VatInvoiceRepository
+from app.vat_reports.repositories.vat_work_item_write_repository import (
+    VatWorkItemWriteRepository as VatWorkItemRepository,
+)
+
+logger = get_logger(__name__)
+
+_CENT = Decimal("0.01")
+_NO_INVOICES = (Decimal("0"),) * 4
+
+
+def reconcile_vat_totals(db: Session, *, page_size: int = 500) -> dict[str, int]:
+    """Re-sum unfiled work items and repair drifted totals; returns counts."""
+    work_item_repo = VatWorkItemRepository(db)
+    invoice_repo = VatInvoiceRepository(db)
+    checked = repaired = 0
+    after_id = 0
+    while items := work_item_repo.list_unfiled_after(after_id, limit=page_size):
+        sums = invoice_repo.sum_totals_by_work_items([item.id for item in items])
+        for item in items:
+            expected = tuple(
+                value.quantize(_CENT, rounding=ROUND_HALF_UP)
+                for value in sums.get(item.id, _NO_INVOICES)
+            )
+            stored = tuple(
+                Decimal(str(value or 0))
+                for value in (
+                    item.total_output_vat,
+                    item.total_input_vat,
+                    item.total_output_net,
+                    item.total_input_net,
+                )
+            )
+            if stored != expected:
+                logger.warning(
+                    "VAT work item %s totals drifted: stored=%s expected=%s",
+                    item.id,
+                    stored,
+                    expected,
+                )
+                work_item_repo.update_vat_totals(item.id, *expected)
+                repaired += 1
+        checked += len(items)
+        after_id = items[-1].id
+    return {"checked": checked, "repaired": repaired}
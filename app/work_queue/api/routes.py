@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends, Query
 
+from app.core.json_response import json_response
+from app.core.perf import query_budget
 from app.tasks.models.task import TaskStatus
-from app.users.api.deps import DBSession, require_role
+from app.users.api.deps import DBReads, require_role
 from app.users.models.user import UserRole
 from app.work_queue.schemas.work_queue import (
     WorkQueueLinkedFilter,
@@ -51,13 +53,15 @@ class WorkQueueFilterParams:
     response_model=WorkQueueListResponse,
     dependencies=[Depends(require_role(UserRole.ADVISOR, UserRole.SECRETARY))],
 )
-def list_work_queue(
-    db: DBSession,
+@query_budget(20, max_repeated=5)
+async def list_work_queue(
+    reads: DBReads,
     filters: WorkQueueFilterParams = Depends(),
     limit: int = Query(_LIMIT_DEFAULT, ge=1, le=_LIMIT_MAX),
     offset: int = Query(0, ge=0),
 ):
-    return WorkQueueService(db).list_items_with_total(
+    result = await WorkQueueService.list_items_with_total_concurrently(
+        reads,
         client_record_id=filters.client_record_id,
         business_id=filters.business_id,
         exclude_source_types=filters.exclude_source_types,
@@ -71,3 +75,4 @@ def list_work_queue(
         limit=limit,
         offset=offset,
     )
+    return json_response(WorkQueueListResponse, result)
@@ -0,0 +1,83 @@
+from app.charge.services.constants import UNPAID_CHARGE_TASK_THRESHOLD_DAYS
+from app.common.source_types import WorkQueueSourceType
+
+APPROACHING_DAYS = 7
+IMPORTANT_DAYS = 21
+UPCOMING_WINDOW_DAYS = 21
+STALE_HANDOVER_THRESHOLD_DAYS = 30
+
+SOURCE_TYPE_LABELS = {
+    WorkQueueSourceType.VAT_WORK_ITEM: 'דוח מע"מ',
+    WorkQueueSourceType.ANNUAL_REPORT: "דוח שנתי",
+    WorkQueueSourceType.ADVANCE_PAYMENT: "מקדמה",
+    WorkQueueSourceType.CHARGE: "חיוב לא שולם",
+    WorkQueueSourceType.BINDER: "קלסר",
+    WorkQueueSourceType.TASK: "משימה",
+}
+
+STATUS_LABELS = {
+    WorkQueueSourceType.VAT_WORK_ITEM: {
+        "pending_materials": "ממתין לחומרים",
+        "material_received": "חומרים התקבלו",
+        "data_entry_in_progress": "בהקלדה",
+        "ready_for_review": "מוכן לבדיקה",
+        "filed": "הוגש",
+        "canceled": "בוטל",
+    },
+    WorkQueueSourceType.ANNUAL_REPORT: {
+        "not_started": "טרם התחיל",
+        "collecting_docs": "איסוף מסמכים",
+        "in_preparation": "בהכנה",
+        "pending_client": "ממתין ללקוח",
+        "submitted": "הוגש",
+        "closed": "סגור",
+        "canceled": "בוטל",
+    },
+    WorkQueueSourceType.ADVANCE_PAYMENT: {
+        "pending": "ממתינה",
+        "partial": "שולמה חלקית",
+        "paid": "שולמה",
+    },
+    WorkQueueSourceType.CHARGE: {
+        "draft": "טיוטה",
+        "issued": "הונפק",
+        "paid": "שולם",
+        "canceled": "בוטל",
+    },
+    WorkQueueSourceType.BINDER: {
+        "in_office": "במשרד",
+        "ready_for_handover": "מוכן למסירה",
+        "handed_over": "נמסר ללקוח",
+    },
+    WorkQueueSourceType.TASK: {
+        "open": "פתוחה",
+        "done": "הושלמה",
+        "canceled": "בוטלה",
+    },
+}
+
+MONTH_LABELS = {
+    1: "ינואר",
+    2: "פברואר",
+    3: "מרץ",
+    4: "אפריל",
+    5: "מאי",
+    6: "יוני",
+    7: "יולי",
+    8: "אוגוסט",
+    9: "ספטמבר",
+    10: "אוקטובר",
+    11: "נובמבר",
+    12: "דצמבר",
+}
+
+__all__ = [
+    "APPROACHING_DAYS",
+    "IMPORTANT_DAYS",
+    "MONTH_LABELS",
+    "SOURCE_TYPE_LABELS",
+    "STALE_HANDOVER_THRESHOLD_DAYS",
+    "STATUS_LABELS",
+    "UNPAID_CHARGE_TASK_THRESHOLD_DAYS",
+    "UPCOMING_WINDOW_DAYS",
+]
@@ -0,0 +1,57 @@
+"""Materialized work-queue read model.
+
+`work_queue_items` holds the active-mode projection of the unified work queue
+(system sources with their open linked tasks merged, plus standalone open
+tasks) as computed by `WorkQueueQueryRepository` for `bucket_date` in
+`work_queue_read_model_state`. Rows are kept current by the session hook in
+`work_queue_item_events` and re-bucketed nightly when the date rolls over.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from importlib import import_module
+
+from sqlalchemy import Index, String, Text, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.utils.time_utils import utcnow
+
+
+class WorkQueueReadModelItem(Base):
+    __tablename__ = "work_queue_items"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    source_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    source_id: Mapped[int] = mapped_column(nullable=False)
+    client_record_id: Mapped[int | None] = mapped_column(nullable=True)
+    business_id: Mapped[int | None] = mapped_column(nullable=True)
+    due_date: Mapped[date | None] = mapped_column(nullable=True)
+    urgency_rank: Mapped[int] = mapped_column(nullable=False)
+    item_kind: Mapped[int] = mapped_column(nullable=False)
+    task_status: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    status_rank: Mapped[int] = mapped_column(nullable=False)
+    priority_rank: Mapped[int] = mapped_column(nullable=False)
+    linked_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    title: Mapped[str] = mapped_column(String(500), nullable=False)
+    search_text: Mapped[str] = mapped_column(Text, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("source_type", "source_id", name="uq_work_queue_items_source"),
+        Index("idx_work_queue_items_client", "client_record_id"),
+        Index("idx_work_queue_items_order", "urgency_rank", "due_date"),
+    )
+
+
+class WorkQueueReadModelState(Base):
+    """Single-row marker: the read model is populated and bucketed for `bucket_date`."""
+
+    __tablename__ = "work_queue_read_model_state"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    bucket_date: Mapped[date] = mapped_column(nullable=False)
+    rebuilt_at: Mapped[datetime] = mapped_column(nullable=False, default=utcnow)
+
+
+import_module("app.work_queue.models.work_queue_item_events")
@@ -0,0 +1,104 @@
+"""Session events keeping `work_queue_items` in step with the rows it projects.
+
+Every flush records which clients' work-queue rows may have changed (a VAT work
+item, annual report, advance payment, charge, binder, task or client record was
+inserted, updated or deleted). Just before commit the affected client partitions
+are recomputed from the live projection inside the same transaction, so the
+read model never diverges from a committed write. Nothing is maintained until
+the read model has been built once (`work_queue_read_model_state` exists).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from itertools import chain
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.advance_payments.models.advance_payment import AdvancePayment
+from app.annual_reports.models.annual_report_model import AnnualReport
+from app.binders.models.binder import Binder
+from app.charge.models.charge import Charge
+from app.clients.models.client_record import ClientRecord
+from app.config import settings
+from app.tasks.models.task import Task
+from app.vat_reports.models.vat_work_item import VatWorkItem
+
+_PENDING_KEY = "work_queue_read_model_pending"
+_CLIENT_SCOPED_MODELS = (VatWorkItem, AnnualReport, AdvancePayment, Charge, Binder)
+
+
+@dataclass
+class _PendingRefresh:
+    client_record_ids: set[int] = field(default_factory=set)
+    task_sources: set[tuple[str, int]] = field(default_factory=set)
+    include_unassigned: bool = False
+
+
+def _values(target, attribute: str) -> set:
+    """Current and pre-flush values of one attribute."""
+    history = inspect(target).attrs[attribute].history
+    return {getattr(target, attribute), *history.deleted}
+
+
+def _record_task(pending: _PendingRefresh, task: Task) -> None:
+    for source_domain in _values(task, "source_domain"):
+        for source_id in _values(task, "source_id"):
+            if source_domain is None or source_id is None:
+                pending.include_unassigned = True
+            else:
+                pending.task_sources.add((source_domain, source_id))
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session: Session, _flush_context) -> None:
+    if not settings.WORK_QUEUE_READ_MODEL_ENABLED:
+        return
+    pending: _PendingRefresh | None = session.info.get(_PENDING_KEY)
+    for target in chain(session.new, session.dirty, session.deleted):
+        if not isinstance(target, (*_CLIENT_SCOPED_MODELS, Task, ClientRecord)):
+            continue
+        if pending is None:
+            pending = session.info[_PENDING_KEY] = _PendingRefresh()
+        if isinstance(target, Task):
+            _record_task(pending, target)
+        elif isinstance(target, ClientRecord):
+            pending.client_record_ids.add(target.id)
+        else:
+            pending.client_record_ids.update(
+                value for value in _values(target, "client_record_id") if value is not None
+            )
+            # Tasks linked to a removed source fall back to having no client.
+            if target in session.deleted:
+                pending.include_unassigned = True
+
+
+@event.listens_for(Session, "before_commit")
+def _refresh_read_model(session: Session) -> None:
+    if not settings.WORK_QUEUE_READ_MODEL_ENABLED:
+        return
+    session.flush()
+    pending: _PendingRefresh | None = session.info.pop(_PENDING_KEY, None)
+    if pending is None:
+        return
+
+    from app.work_queue.repositories.work_queue_read_model_repository import (
+        WorkQueueReadModelRepository,
+    )
+
+    repo = WorkQueueReadModelRepository(session)
+    state = repo.get_state()
+    if state is None:
+        return
+    client_record_ids, unresolved = repo.resolve_source_clients(pending.task_sources)
+    repo.refresh_clients(
+        state.bucket_date,
+        pending.client_record_ids | client_record_ids,
+        include_unassigned=pending.include_unassigned or unresolved,
+    )
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending(session: Session, _previous_transaction) -> None:
+    session.info.pop(_PENDING_KEY, None)
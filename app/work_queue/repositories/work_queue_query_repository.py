@@ -0,0 +1,713 @@
+"""SQL projection of the unified work queue.
+
+Every open obligation source (VAT work items, annual reports, advance payments,
+unpaid charges, stale binders) and every task is projected into one UNION ALL
+row shape carrying the columns the queue filters and sorts on. Filtering,
+sorting, pagination and summary counts run in the database; callers hydrate
+only the rows of the requested page.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any
+
+from sqlalchemy import (
+    Integer,
+    String,
+    and_,
+    case,
+    cast,
+    exists,
+    false,
+    func,
+    literal,
+    null,
+    or_,
+    select,
+    union_all,
+)
+from sqlalchemy.orm import Session
+
+from app.advance_payments.models.advance_payment import AdvancePayment, AdvancePaymentStatus
+from app.annual_reports.models.annual_report_enums import AnnualReportStatus
+from app.annual_reports.models.annual_report_model import AnnualReport
+from app.binders.models.binder import Binder, BinderLocationStatus
+from app.charge.models.charge import Charge, ChargeStatus
+from app.clients.models.client_record import ClientRecord
+from app.clients.models.legal_entity import LegalEntity
+from app.clients.repositories.active_client_scope import scope_to_active_clients_stmt
+from app.common.repositories.sql_functions import add_days, as_date, days_between
+from app.common.source_types import WorkQueueSourceType
+from app.tasks.models.task import Task, TaskPriority, TaskStatus
+from app.utils.time_utils import utcnow
+from app.vat_reports.models.vat_enums import VatWorkItemStatus
+from app.vat_reports.models.vat_work_item import VatWorkItem
+from app.work_queue.constants import (
+    APPROACHING_DAYS,
+    IMPORTANT_DAYS,
+    MONTH_LABELS,
+    SOURCE_TYPE_LABELS,
+    STALE_HANDOVER_THRESHOLD_DAYS,
+    STATUS_LABELS,
+    UNPAID_CHARGE_TASK_THRESHOLD_DAYS,
+    UPCOMING_WINDOW_DAYS,
+)
+from app.work_queue.models.work_queue_item import WorkQueueReadModelItem
+
+# Urgency ranks follow WorkQueueUrgency order: overdue, approaching, important, upcoming.
+URGENCY_OVERDUE = 0
+URGENCY_UPCOMING = 3
+_NO_TASK_URGENCY = 99
+_FAR_FUTURE = date(9999, 12, 31)
+_PRIORITY_RANKS = {
+    TaskPriority.URGENT.value: 0,
+    TaskPriority.HIGH.value: 1,
+    TaskPriority.NORMAL.value: 2,
+    TaskPriority.LOW.value: 3,
+}
+_UNRANKED = 9
+_DONE_ANNUAL_STATUSES = [
+    AnnualReportStatus.SUBMITTED.value,
+    AnnualReportStatus.CLOSED.value,
+    AnnualReportStatus.CANCELED.value,
+]
+PROJECTED_COLUMNS = (
+    "source_type",
+    "source_id",
+    "client_record_id",
+    "business_id",
+    "due_date",
+    "urgency_rank",
+    "item_kind",
+    "task_status",
+    "status_rank",
+    "priority_rank",
+    "linked_count",
+    "title",
+    "search_text",
+)
+SOURCE_MODELS = {
+    WorkQueueSourceType.VAT_WORK_ITEM: VatWorkItem,
+    WorkQueueSourceType.ANNUAL_REPORT: AnnualReport,
+    WorkQueueSourceType.ADVANCE_PAYMENT: AdvancePayment,
+    WorkQueueSourceType.CHARGE: Charge,
+    WorkQueueSourceType.BINDER: Binder,
+}
+
+
+@dataclass(frozen=True)
+class WorkQueueQuery:
+    today: date
+    client_record_id: int | None = None
+    business_id: int | None = None
+    excluded: frozenset[WorkQueueSourceType] = frozenset()
+    include_task_history: bool = False
+    search: str | None = None
+    source_type: WorkQueueSourceType | None = None
+    urgency_rank: int | None = None
+    task_status: TaskStatus | None = None
+    linked: bool | None = None
+    manual_only: bool | None = None
+    from_read_model: bool = False
+
+    @property
+    def merges_tasks(self) -> bool:
+        return WorkQueueSourceType.TASK not in self.excluded and self.business_id is None
+
+    @property
+    def is_unscoped(self) -> bool:
+        """True for the default active queue, the shape `work_queue_items` materializes."""
+        return (
+            self.client_record_id is None
+            and self.business_id is None
+            and not self.excluded
+            and not self.include_task_history
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class WorkQueueRowRef:
+    source_type: WorkQueueSourceType
+    source_id: int
+    client_record_id: int | None
+    urgency_rank: int
+    due_date: date | None
+
+
+@dataclass(frozen=True)
+class WorkQueueCounts:
+    total: int = 0
+    manual_tasks: int = 0
+    linked: int = 0
+    unlinked: int = 0
+    by_urgency_rank: dict[int, int] = field(default_factory=dict)
+    by_source_type: dict[str, int] = field(default_factory=dict)
+    by_task_status: dict[str, int] = field(default_factory=dict)
+
+
+def _text(value: Any):
+    return cast(value, String)
+
+
+def _joined(*parts):
+    """Space-join nullable text expressions (NULL parts become empty strings)."""
+    expr = func.coalesce(parts[0], "")
+    for part in parts[1:]:
+        expr = expr + " " + func.coalesce(part, "")
+    return expr
+
+
+def _status_label(source_type: WorkQueueSourceType, status_text):
+    return func.coalesce(case(STATUS_LABELS[source_type], value=status_text), status_text)
+
+
+def _period_label(period, months_count):
+    """SQL twin of metadata._period_label for well-formed YYYY-MM periods."""
+    month = func.substr(period, 6, 2)
+    year = func.substr(period, 1, 4)
+    start = case({f"{m:02d}": label for m, label in MONTH_LABELS.items()}, value=month)
+    end = case({f"{m:02d}": MONTH_LABELS[m + 1] for m in range(1, 12)}, value=month)
+    single = start + " " + year
+    double = start + "–" + end + " " + year
+    return func.coalesce(case((months_count == 2, double), else_=single), period)
+
+
+class WorkQueueQueryRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    # ── Public API ────────────────────────────────────────────────────────────
+
+    def list_page(self, query: WorkQueueQuery, *, limit: int, offset: int) -> list[WorkQueueRowRef]:
+        rows = self._filtered_rows(query)
+        due_sort = func.coalesce(rows.c.due_date, _FAR_FUTURE)
+        stmt = (
+            select(
+                rows.c.source_type,
+                rows.c.source_id,
+                rows.c.client_record_id,
+                rows.c.urgency_rank,
+                rows.c.due_date,
+            )
+            .order_by(
+                rows.c.urgency_rank,
+                due_sort,
+                rows.c.item_kind,
+                rows.c.status_rank,
+                rows.c.priority_rank,
+                rows.c.title,
+                rows.c.source_type,
+                rows.c.source_id,
+            )
+            .limit(limit)
+            .offset(offset)
+        )
+        return [
+            WorkQueueRowRef(
+                source_type=WorkQueueSourceType(row.source_type),
+                source_id=row.source_id,
+                client_record_id=row.client_record_id,
+                urgency_rank=row.urgency_rank,
+                due_date=row.due_date,
+            )
+            for row in self.db.execute(stmt)
+        ]
+
+    def count_summary(self, query: WorkQueueQuery) -> WorkQueueCounts:
+        rows = self._filtered_rows(query)
+        is_task = rows.c.source_type == WorkQueueSourceType.TASK.value
+
+        def _count(condition):
+            return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+        columns = [
+            func.count().label("total"),
+            _count(rows.c.linked_count > 0).label("linked"),
+            _count(rows.c.linked_count == 0).label("unlinked"),
+            func.coalesce(func.sum(rows.c.linked_count), 0).label("linked_tasks"),
+        ]
+        columns += [
+            _count(rows.c.urgency_rank == rank).label(f"urgency_{rank}")
+            for rank in range(URGENCY_OVERDUE, URGENCY_UPCOMING + 1)
+        ]
+        columns += [
+            _count(rows.c.source_type == source_type.value).label(f"source_{source_type.value}")
+            for source_type in WorkQueueSourceType
+        ]
+        columns += [
+            _count(and_(is_task, rows.c.task_status == status.value)).label(
+                f"task_{status.value}"
+            )
+            for status in TaskStatus
+        ]
+        row = self.db.execute(select(*columns)).one()._mapping
+        by_task_status = {status.value: int(row[f"task_{status.value}"]) for status in TaskStatus}
+        # Linked tasks are merged into their source row only while open.
+        by_task_status[TaskStatus.OPEN.value] += int(row["linked_tasks"])
+        return WorkQueueCounts(
+            total=int(row["total"]),
+            manual_tasks=int(row[f"source_{WorkQueueSourceType.TASK.value}"]),
+            linked=int(row["linked"]),
+            unlinked=int(row["unlinked"]),
+            by_urgency_rank={
+                rank: int(row[f"urgency_{rank}"])
+                for rank in range(URGENCY_OVERDUE, URGENCY_UPCOMING + 1)
+            },
+            by_source_type={
+                source_type.value: int(row[f"source_{source_type.value}"])
+                for source_type in WorkQueueSourceType
+            },
+            by_task_status=by_task_status,
+        )
+
+    def load_sources(
+        self, keys: Iterable[tuple[WorkQueueSourceType, int]]
+    ) -> dict[tuple[WorkQueueSourceType, int], Any]:
+        """Load source ORM rows for one page, one query per source type present."""
+        grouped: dict[WorkQueueSourceType, set[int]] = {}
+        for source_type, source_id in keys:
+            grouped.setdefault(source_type, set()).add(source_id)
+        loaded: dict[tuple[WorkQueueSourceType, int], Any] = {}
+        for source_type, ids in grouped.items():
+            model = SOURCE_MODELS.get(source_type, Task)
+            for row in self.db.scalars(select(model).where(model.id.in_(ids))):
+                loaded[(source_type, row.id)] = row
+        return loaded
+
+    def list_linked_open_tasks(
+        self, keys: Iterable[tuple[WorkQueueSourceType, int]]
+    ) -> list[Task]:
+        """Open tasks linked to the given sources, earliest due date first."""
+        conditions = [
+            and_(Task.source_domain == source_type.value, Task.source_id == source_id)
+            for source_type, source_id in keys
+        ]
+        if not conditions:
+            return []
+        stmt = (
+            select(Task)
+            .where(Task.deleted_at.is_(None), Task.status == TaskStatus.OPEN, or_(*conditions))
+            .order_by(*_linked_task_order())
+        )
+        return list(self.db.scalars(stmt))
+
+    def active_projection(self, today: date):
+        """Unscoped active-queue rows computed live, as stored in `work_queue_items`."""
+        return self._rows(WorkQueueQuery(today=today))
+
+    # ── Row projection ────────────────────────────────────────────────────────
+
+    def _filtered_rows(self, query: WorkQueueQuery):
+        rows = self._rows(query).subquery("work_queue_rows")
+        stmt = select(*rows.c)
+        if query.source_type is not None:
+            stmt = stmt.where(rows.c.source_type == query.source_type.value)
+        if query.urgency_rank is not None:
+            stmt = stmt.where(rows.c.urgency_rank == query.urgency_rank)
+        if query.task_status is not None:
+            matches_status = rows.c.task_status == query.task_status.value
+            if query.task_status == TaskStatus.OPEN:
+                matches_status = or_(matches_status, rows.c.linked_count > 0)
+            stmt = stmt.where(matches_status)
+        if query.linked is True:
+            stmt = stmt.where(rows.c.linked_count > 0)
+        elif query.linked is False:
+            stmt = stmt.where(rows.c.linked_count == 0)
+        if query.manual_only is True:
+            stmt = stmt.where(rows.c.source_type == WorkQueueSourceType.TASK.value)
+        elif query.manual_only is False:
+            stmt = stmt.where(rows.c.source_type != WorkQueueSourceType.TASK.value)
+        term = query.search.strip() if query.search else ""
+        if term:
+            stmt = self._apply_search(stmt, rows, f"%{term}%")
+        return stmt.subquery("work_queue_filtered")
+
+    def _apply_search(self, stmt, rows, like: str):
+        stmt = stmt.outerjoin(
+            ClientRecord,
+            and_(ClientRecord.id == rows.c.client_record_id, ClientRecord.deleted_at.is_(None)),
+        ).outerjoin(LegalEntity, LegalEntity.id == ClientRecord.legal_entity_id)
+        searchable = _joined(
+            rows.c.search_text,
+            LegalEntity.official_name,
+            _text(ClientRecord.office_client_number),
+        )
+        linked_task_match = exists(
+            select(Task.id).where(
+                Task.deleted_at.is_(None),
+                Task.status == TaskStatus.OPEN,
+                Task.source_domain == rows.c.source_type,
+                Task.source_id == rows.c.source_id,
+                _joined(
+                    Task.title,
+                    _text(Task.status),
+                    _text(Task.priority),
+                    _text(Task.assigned_role),
+                    _text(Task.assigned_to_user_id),
+                ).ilike(like),
+            )
+        )
+        return stmt.where(
+            or_(searchable.ilike(like), and_(rows.c.linked_count > 0, linked_task_match))
+        )
+
+    def _rows(self, query: WorkQueueQuery):
+        if query.from_read_model:
+            return select(
+                *(
+                    getattr(WorkQueueReadModelItem, column).label(column)
+                    for column in PROJECTED_COLUMNS
+                )
+            )
+        system = union_all(*self._system_branches(query)).cte("work_queue_system")
+        parts = [self._system_rows(query, system)]
+        if query.merges_tasks:
+            parts.append(self._task_rows(query, system))
+        return union_all(*parts)
+
+    def _system_branches(self, query: WorkQueueQuery) -> list:
+        excluded = query.excluded
+        branches = []
+        # Client-level obligations are not narrowed by business_id.
+        if query.business_id is None:
+            if WorkQueueSourceType.VAT_WORK_ITEM not in excluded:
+                branches.append(self._vat_branch(query))
+            if WorkQueueSourceType.ANNUAL_REPORT not in excluded:
+                branches.append(self._annual_report_branch(query))
+            if WorkQueueSourceType.ADVANCE_PAYMENT not in excluded:
+                branches.append(self._advance_payment_branch(query))
+        if WorkQueueSourceType.CHARGE not in excluded:
+            branches.append(self._charge_branch(query))
+        if query.client_record_id is None and query.business_id is None:
+            if WorkQueueSourceType.BINDER not in excluded:
+                branches.append(self._binder_branch(query))
+        return branches or [self._empty_branch()]
+
+    def _urgency_rank(self, due, today: date):
+        return case(
+            (due < today, URGENCY_OVERDUE),
+            (due <= today + timedelta(days=APPROACHING_DAYS), 1),
+            (due <= today + timedelta(days=IMPORTANT_DAYS), 2),
+            else_=URGENCY_UPCOMING,
+        )
+
+    def _branch(
+        self,
+        source_type: WorkQueueSourceType,
+        model,
+        *,
+        due,
+        urgency_rank,
+        title,
+        search_parts: tuple = (),
+        business_id=None,
+    ):
+        status_text = _text(model.location_status if model is Binder else model.status)
+        return select(
+            literal(source_type.value).label("source_type"),
+            model.id.label("source_id"),
+            model.client_record_id.label("client_record_id"),
+            (business_id if business_id is not None else cast(null(), Integer)).label(
+                "business_id"
+            ),
+            due.label("due_date"),
+            urgency_rank.label("urgency_rank"),
+            title.label("title"),
+            _joined(
+                title,
+                literal(SOURCE_TYPE_LABELS[source_type]),
+                _status_label(source_type, status_text),
+                literal(source_type.value),
+                status_text,
+                *search_parts,
+            ).label("search_text"),
+        )
+
+    def _scoped(self, branch, model, query: WorkQueueQuery):
+        branch = scope_to_active_clients_stmt(branch, model).where(model.deleted_at.is_(None))
+        if query.client_record_id is not None:
+            branch = branch.where(model.client_record_id == query.client_record_id)
+        return branch
+
+    def _vat_branch(self, query: WorkQueueQuery):
+        due = VatWorkItem.due_date_effective
+        months_count = case((_text(VatWorkItem.period_type) == "bimonthly", 2), else_=1)
+        branch = self._branch(
+            WorkQueueSourceType.VAT_WORK_ITEM,
+            VatWorkItem,
+            due=due,
+            urgency_rank=self._urgency_rank(due, query.today),
+            title='מע"מ לא הוגש: ' + _period_label(VatWorkItem.period, months_count),
+            search_parts=(VatWorkItem.period,),
+        ).where(
+            VatWorkItem.status.notin_([VatWorkItemStatus.FILED, VatWorkItemStatus.CANCELED]),
+            func.substr(VatWorkItem.period, 1, 7) < query.today.strftime("%Y-%m"),
+        )
+        return self._scoped(branch, VatWorkItem, query)
+
+    def _annual_report_branch(self, query: WorkQueueQuery):
+        due = as_date(AnnualReport.filing_deadline)
+        branch = self._branch(
+            WorkQueueSourceType.ANNUAL_REPORT,
+            AnnualReport,
+            due=due,
+            urgency_rank=self._urgency_rank(due, query.today),
+            title="דוח שנתי " + _text(AnnualReport.tax_year),
+        ).where(
+            AnnualReport.filing_deadline.isnot(None),
+            AnnualReport.filing_deadline <= query.today + timedelta(days=UPCOMING_WINDOW_DAYS),
+            AnnualReport.status.notin_(_DONE_ANNUAL_STATUSES),
+        )
+        return self._scoped(branch, AnnualReport, query)
+
+    def _advance_payment_branch(self, query: WorkQueueQuery):
+        due = AdvancePayment.due_date
+        branch = self._branch(
+            WorkQueueSourceType.ADVANCE_PAYMENT,
+            AdvancePayment,
+            due=due,
+            urgency_rank=self._urgency_rank(due, query.today),
+            title="מקדמה: "
+            + _period_label(
+                AdvancePayment.period, func.coalesce(AdvancePayment.period_months_count, 1)
+            ),
+            search_parts=(AdvancePayment.period,),
+        ).where(
+            AdvancePayment.status.in_(
+                [AdvancePaymentStatus.PENDING, AdvancePaymentStatus.PARTIAL]
+            ),
+            AdvancePayment.due_date <= query.today + timedelta(days=UPCOMING_WINDOW_DAYS),
+        )
+        return self._scoped(branch, AdvancePayment, query)
+
+    def _charge_branch(self, query: WorkQueueQuery):
+        threshold = query.today - timedelta(days=UNPAID_CHARGE_TASK_THRESHOLD_DAYS)
+        branch = self._branch(
+            WorkQueueSourceType.CHARGE,
+            Charge,
+            due=add_days(Charge.issued_at, UNPAID_CHARGE_TASK_THRESHOLD_DAYS),
+            # Always overdue: charges only appear after the unpaid threshold has passed.
+            urgency_rank=literal(URGENCY_OVERDUE),
+            title=literal("חיוב לא שולם"),
+            search_parts=(Charge.period, _text(Charge.business_id)),
+            business_id=Charge.business_id,
+        ).where(
+            Charge.status == ChargeStatus.ISSUED,
+            Charge.issued_at.isnot(None),
+            Charge.issued_at <= threshold,
+        )
+        branch = self._scoped(branch, Charge, query)
+        if query.business_id is not None:
+            branch = branch.where(Charge.business_id == query.business_id)
+        return branch
+
+    def _binder_branch(self, query: WorkQueueQuery):
+        cutoff = utcnow() - timedelta(days=STALE_HANDOVER_THRESHOLD_DAYS)
+        days_waiting = days_between(Binder.ready_for_handover_at, query.today)
+        branch = self._branch(
+            WorkQueueSourceType.BINDER,
+            Binder,
+            due=as_date(Binder.ready_for_handover_at),
+            urgency_rank=literal(URGENCY_OVERDUE),
+            title="קלסר "
+            + Binder.binder_number
+            + " — ממתין למסירה "
+            + _text(days_waiting)
+            + " ימים",
+        ).where(
+            Binder.location_status == BinderLocationStatus.READY_FOR_HANDOVER,
+            Binder.ready_for_handover_at.isnot(None),
+            Binder.ready_for_handover_at <= cutoff,
+        )
+        return self._scoped(branch, Binder, query)
+
+    def _empty_branch(self):
+        return select(
+            cast(null(), String).label("source_type"),
+            cast(null(), Integer).label("source_id"),
+            cast(null(), Integer).label("client_record_id"),
+            cast(null(), Integer).label("business_id"),
+            as_date(null()).label("due_date"),
+            cast(null(), Integer).label("urgency_rank"),
+            cast(null(), String).label("title"),
+            cast(null(), String).label("search_text"),
+        ).where(false())
+
+    def _system_rows(self, query: WorkQueueQuery, system):
+        if not query.merges_tasks:
+            return select(
+                system.c.source_type,
+                system.c.source_id,
+                system.c.client_record_id,
+                system.c.business_id,
+                system.c.due_date,
+                system.c.urgency_rank,
+                literal(1).label("item_kind"),
+                cast(null(), String).label("task_status"),
+                literal(_UNRANKED).label("status_rank"),
+                literal(_UNRANKED).label("priority_rank"),
+                literal(0).label("linked_count"),
+                system.c.title,
+                system.c.search_text,
+            )
+
+        linked = self._linked_task_stats()
+        task_rank = case(
+            (linked.c.min_due.is_(None), _NO_TASK_URGENCY),
+            else_=self._urgency_rank(linked.c.min_due, query.today),
+        )
+        upgraded = and_(linked.c.linked_count.isnot(None), task_rank < system.c.urgency_rank)
+        return select(
+            system.c.source_type,
+            system.c.source_id,
+            system.c.client_record_id,
+            system.c.business_id,
+            case((upgraded, linked.c.min_due), else_=system.c.due_date).label("due_date"),
+            case((upgraded, task_rank), else_=system.c.urgency_rank).label("urgency_rank"),
+            literal(1).label("item_kind"),
+            cast(null(), String).label("task_status"),
+            case((linked.c.linked_count > 0, 0), else_=_UNRANKED).label("status_rank"),
+            func.coalesce(linked.c.first_priority_rank, _UNRANKED).label("priority_rank"),
+            func.coalesce(linked.c.linked_count, 0).label("linked_count"),
+            system.c.title,
+            system.c.search_text,
+        ).outerjoin(
+            linked,
+            and_(
+                linked.c.source_domain == system.c.source_type,
+                linked.c.source_id == system.c.source_id,
+            ),
+        )
+
+    def _linked_task_stats(self):
+        ordered = select(
+            Task.source_domain,
+            Task.source_id,
+            Task.due_date,
+            case(_PRIORITY_RANKS, value=_text(Task.priority), else_=_UNRANKED).label(
+                "priority_rank"
+            ),
+            func.row_number()
+            .over(
+                partition_by=(Task.source_domain, Task.source_id),
+                order_by=_linked_task_order(),
+            )
+            .label("position"),
+        ).where(
+            Task.deleted_at.is_(None),
+            Task.status == TaskStatus.OPEN,
+            Task.source_domain.isnot(None),
+            Task.source_id.isnot(None),
+        )
+        ordered = ordered.subquery("work_queue_linked_ordered")
+        return (
+            select(
+                ordered.c.source_domain,
+                ordered.c.source_id,
+                func.count().label("linked_count"),
+                func.min(ordered.c.due_date).label("min_due"),
+                func.min(
+                    case((ordered.c.position == 1, ordered.c.priority_rank), else_=None)
+                ).label("first_priority_rank"),
+            )
+            .group_by(ordered.c.source_domain, ordered.c.source_id)
+            .subquery("work_queue_linked")
+        )
+
+    def _task_rows(self, query: WorkQueueQuery, system):
+        task_type = WorkQueueSourceType.TASK
+        joins = {
+            source_type: model.__table__.alias(f"task_source_{source_type.value}")
+            for source_type, model in SOURCE_MODELS.items()
+        }
+        vat = joins[WorkQueueSourceType.VAT_WORK_ITEM]
+        annual = joins[WorkQueueSourceType.ANNUAL_REPORT]
+        advance = joins[WorkQueueSourceType.ADVANCE_PAYMENT]
+        charge = joins[WorkQueueSourceType.CHARGE]
+        binder = joins[WorkQueueSourceType.BINDER]
+        client_record_id = func.coalesce(
+            *(alias.c.client_record_id for alias in joins.values())
+        )
+        status_text = _text(Task.status)
+        source_label = case(
+            (vat.c.id.isnot(None), 'מע"מ ' + vat.c.period),
+            (annual.c.id.isnot(None), "דוח שנתי " + _text(annual.c.tax_year)),
+            (advance.c.id.isnot(None), "מקדמה " + advance.c.period),
+            (charge.c.id.isnot(None), literal("חיוב")),
+            (binder.c.id.isnot(None), "קלסר " + binder.c.binder_number),
+            (
+                and_(
+                    Task.source_domain.in_([source_type.value for source_type in WorkQueueSourceType]),
+                    Task.source_id.isnot(None),
+                ),
+                Task.source_domain + ":" + _text(Task.source_id),
+            ),
+            else_=None,
+        )
+        due = Task.due_date
+        stmt = select(
+            literal(task_type.value).label("source_type"),
+            Task.id.label("source_id"),
+            client_record_id.label("client_record_id"),
+            cast(null(), Integer).label("business_id"),
+            due.label("due_date"),
+            self._urgency_rank(due, query.today).label("urgency_rank"),
+            literal(0).label("item_kind"),
+            status_text.label("task_status"),
+            case((Task.status == TaskStatus.OPEN, 0), else_=_UNRANKED).label("status_rank"),
+            case(_PRIORITY_RANKS, value=_text(Task.priority), else_=_UNRANKED).label(
+                "priority_rank"
+            ),
+            literal(0).label("linked_count"),
+            Task.title.label("title"),
+            _joined(
+                Task.title,
+                Task.description,
+                literal(SOURCE_TYPE_LABELS[task_type]),
+                _status_label(task_type, status_text),
+                literal(task_type.value),
+                source_label,
+                status_text,
+                _text(Task.priority),
+                _text(Task.assigned_role),
+            ).label("search_text"),
+        ).select_from(Task)
+        for source_type, alias in joins.items():
+            stmt = stmt.outerjoin(
+                alias,
+                and_(Task.source_domain == source_type.value, alias.c.id == Task.source_id),
+            )
+
+        merged_into_source = exists(
+            select(system.c.source_id).where(
+                system.c.source_type == Task.source_domain,
+                system.c.source_id == Task.source_id,
+            )
+        )
+        if query.include_task_history:
+            stmt = stmt.where(Task.status.in_([TaskStatus.DONE, TaskStatus.CANCELED]))
+        else:
+            stmt = stmt.where(Task.status == TaskStatus.OPEN, ~merged_into_source)
+        stmt = stmt.where(Task.deleted_at.is_(None))
+        if query.client_record_id is not None:
+            stmt = stmt.where(client_record_id == query.client_record_id)
+        return stmt
+
+
+def _linked_task_order():
+    return (Task.due_date.is_(None), Task.due_date, Task.id)
+
+
+__all__ = [
+    "PROJECTED_COLUMNS",
+    "SOURCE_MODELS",
+    "URGENCY_OVERDUE",
+    "URGENCY_UPCOMING",
+    "WorkQueueCounts",
+    "WorkQueueQuery",
+    "WorkQueueQueryRepository",
+    "WorkQueueRowRef",
+]
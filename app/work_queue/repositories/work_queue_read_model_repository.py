@@ -0,0 +1,146 @@
+"""Maintenance of the materialized `work_queue_items` read model."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import date
+
+from sqlalchemy import delete, exists, func, insert, or_, select, true
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.common.source_types import WorkQueueSourceType, normalize_source_domain
+from app.utils.time_utils import utcnow
+from app.work_queue.models.work_queue_item import (
+    WorkQueueReadModelItem,
+    WorkQueueReadModelState,
+)
+from app.work_queue.repositories.work_queue_query_repository import (
+    PROJECTED_COLUMNS,
+    SOURCE_MODELS,
+    WorkQueueQueryRepository,
+)
+
+_STATE_ID = 1
+# Dialects with INSERT ... ON CONFLICT; others fall back to delete-then-insert.
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+class WorkQueueReadModelRepository:
+    def __init__(self, db: Session):
+        self.db = db
+        self.query_repo = WorkQueueQueryRepository(db)
+
+    def get_state(self) -> WorkQueueReadModelState | None:
+        return self.db.get(WorkQueueReadModelState, _STATE_ID)
+
+    def rebuild(self, today: date) -> int:
+        """Replace every row with the live projection for `today`; return the row count."""
+        self.db.execute(delete(WorkQueueReadModelItem))
+        self._insert_projection(today, None)
+        state = self.get_state()
+        if state is None:
+            state = WorkQueueReadModelState(id=_STATE_ID, bucket_date=today)
+            self.db.add(state)
+        state.bucket_date = today
+        state.rebuilt_at = utcnow()
+        self.db.flush()
+        return self.db.scalar(select(func.count()).select_from(WorkQueueReadModelItem)) or 0
+
+    def refresh_clients(
+        self,
+        today: date,
+        client_record_ids: Iterable[int],
+        *,
+        include_unassigned: bool = False,
+    ) -> None:
+        """Recompute the rows of the given clients (and of client-less tasks)."""
+        ids = sorted(set(client_record_ids))
+        if not ids and not include_unassigned:
+            return
+
+        def _partition(column):
+            conditions = []
+            if ids:
+                conditions.append(column.in_(ids))
+            if include_unassigned:
+                conditions.append(column.is_(None))
+            return or_(*conditions)
+
+        self.db.execute(
+            delete(WorkQueueReadModelItem).where(
+                _partition(WorkQueueReadModelItem.client_record_id)
+            )
+        )
+        self._insert_projection(today, _partition)
+
+    def resolve_source_clients(
+        self, keys: Iterable[tuple[str, int]]
+    ) -> tuple[set[int], bool]:
+        """Map task source links to client ids; flag links that resolve to no client."""
+        grouped: dict[WorkQueueSourceType, set[int]] = {}
+        unresolved = False
+        for source_domain, source_id in keys:
+            source_type = normalize_source_domain(source_domain)
+            if source_type not in SOURCE_MODELS:
+                unresolved = True
+                continue
+            grouped.setdefault(source_type, set()).add(source_id)
+        client_record_ids: set[int] = set()
+        for source_type, ids in grouped.items():
+            model = SOURCE_MODELS[source_type]
+            found = dict(
+                self.db.execute(
+                    select(model.id, model.client_record_id).where(model.id.in_(ids))
+                ).all()
+            )
+            unresolved = unresolved or len(found) < len(ids)
+            client_record_ids.update(
+                client_record_id for client_record_id in found.values() if client_record_id
+            )
+        return client_record_ids, unresolved
+
+    def list_items(self) -> list[WorkQueueReadModelItem]:
+        return list(self.db.scalars(select(WorkQueueReadModelItem)))
+
+    def _insert_projection(self, today: date, partition) -> None:
+        rows = self.query_repo.active_projection(today).subquery("work_queue_projection")
+        stmt = select(*(rows.c[column] for column in PROJECTED_COLUMNS))
+        # SQLite needs a WHERE before ON CONFLICT to parse INSERT ... SELECT.
+        stmt = stmt.where(partition(rows.c.client_record_id) if partition else true())
+        upsert_insert = _UPSERT_INSERTS.get(self.db.get_bind().dialect.name)
+        if upsert_insert is not None:
+            self.db.execute(self._upsert(upsert_insert, stmt))
+            return
+        # No ON CONFLICT here: drop such rows right before inserting, which
+        # narrows the window `_upsert` closes.
+        projected = stmt.subquery("projected")
+        self.db.execute(
+            delete(WorkQueueReadModelItem).where(
+                exists().where(
+                    projected.c.source_type == WorkQueueReadModelItem.source_type,
+                    projected.c.source_id == WorkQueueReadModelItem.source_id,
+                )
+            )
+        )
+        self.db.execute(insert(WorkQueueReadModelItem).from_select(list(PROJECTED_COLUMNS), stmt))
+
+    @staticmethod
+    def _upsert(upsert_insert, projection):
+        """INSERT ... SELECT that overwrites rows already present for a source.
+
+        A concurrent refresh of the same client may commit its rows between
+        our delete and insert; updating them in place avoids a unique
+        violation inside `before_commit`, which would roll back the caller's write.
+        """
+        stmt = upsert_insert(WorkQueueReadModelItem).from_select(
+            list(PROJECTED_COLUMNS), projection
+        )
+        return stmt.on_conflict_do_update(
+            index_elements=["source_type", "source_id"],
+            set_={
+                column: stmt.excluded[column]
+                for column in PROJECTED_COLUMNS
+                if column not in ("source_type", "source_id")
+            },
+        )
@@ -15,26 +15,28 @@ def _disabled(action: ActionDescriptor, reason: str) -> ActionDescriptor:
     return action
 
 
+_SOURCE_LINK_LABELS = {
+    WorkQueueSourceType.VAT_WORK_ITEM: 'פתח דוח מע"מ',
+    WorkQueueSourceType.ANNUAL_REPORT: "פתח דוח שנתי",
+    WorkQueueSourceType.ADVANCE_PAYMENT: "פתח מקדמות",
+    WorkQueueSourceType.CHARGE: "פתח חיובים",
+    WorkQueueSourceType.BINDER: "פתח קלסרים",
+}
+_SOURCE_LINK_KEYS = {
+    WorkQueueSourceType.VAT_WORK_ITEM: "open_vat_work_item",
+    WorkQueueSourceType.ANNUAL_REPORT: "open_annual_report",
+    WorkQueueSourceType.ADVANCE_PAYMENT: "open_advance_payment_context",
+    WorkQueueSourceType.CHARGE: "open_charge_context",
+    WorkQueueSourceType.BINDER: "open_binder_context",
+}
+
+
 def source_link_action(source_type: WorkQueueSourceType, source_id: int) -> ActionDescriptor | None:
     route = source_route(source_type, source_id)
     if route is None:
         return None
-    labels = {
-        WorkQueueSourceType.VAT_WORK_ITEM: 'פתח דוח מע"מ',
-        WorkQueueSourceType.ANNUAL_REPORT: "פתח דוח שנתי",
-        WorkQueueSourceType.ADVANCE_PAYMENT: "פתח מקדמות",
-        WorkQueueSourceType.CHARGE: "פתח חיובים",
-        WorkQueueSourceType.BINDER: "פתח קלסרים",
-    }
-    keys = {
-        WorkQueueSourceType.VAT_WORK_ITEM: "open_vat_work_item",
-        WorkQueueSourceType.ANNUAL_REPORT: "open_annual_report",
-        WorkQueueSourceType.ADVANCE_PAYMENT: "open_advance_payment_context",
-        WorkQueueSourceType.CHARGE: "open_charge_context",
-        WorkQueueSourceType.BINDER: "open_binder_context",
-    }
-    key = keys.get(source_type)
-    label = labels.get(source_type)
+    key = _SOURCE_LINK_KEYS.get(source_type)
+    label = _SOURCE_LINK_LABELS.get(source_type)
     if key is None or label is None:
         return None
     return _link(key, label, route, primary=True)
@@ -139,6 +141,11 @@ def create_linked_task_action() -> ActionDescriptor:
     return _modal("create_linked_task", "צור משימה")
 
 
+# Identical on every system item, so source_actions shares one instance across
+# rows. Only task actions (task_id set) are relabelled or disabled afterwards.
+_CREATE_LINKED_TASK = create_linked_task_action()
+
+
 def source_actions(
     source_type: WorkQueueSourceType,
     source_id: int,
@@ -148,7 +155,7 @@ def source_actions(
     if open_action is not None:
         actions.append(open_action)
     if source_type != WorkQueueSourceType.TASK:
-        actions.append(create_linked_task_action())
+        actions.append(_CREATE_LINKED_TASK)
     return actions
 
 
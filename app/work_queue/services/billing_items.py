@@ -36,23 +36,22 @@ def advance_payment_items(
         stmt = stmt.where(AdvancePayment.client_record_id == client_record_id)
     payments = list(ctx.db.scalars(stmt))
     ctx.preload_client_identities(payment.client_record_id for payment in payments)
-    items: list[WorkQueueItem] = []
-    for payment in payments:
-        metadata = advance_payment_metadata(payment)
-        items.append(
-            ctx.item(
-                WorkQueueSourceType.ADVANCE_PAYMENT,
-                payment.id,
-                f"מקדמה: {metadata['period_label']}",
-                payment.due_date,
-                payment.client_record_id,
-                status_label=payment.status.value
-                if hasattr(payment.status, "value")
-                else str(payment.status),
-                metadata=metadata,
-            )
-        )
-    return items
+    return [advance_payment_item(ctx, payment) for payment in payments]
+
+
+def advance_payment_item(ctx: WorkQueueContext, payment) -> WorkQueueItem:
+    metadata = advance_payment_metadata(payment)
+    return ctx.item(
+        WorkQueueSourceType.ADVANCE_PAYMENT,
+        payment.id,
+        f"מקדמה: {metadata['period_label']}",
+        payment.due_date,
+        payment.client_record_id,
+        status_label=payment.status.value
+        if hasattr(payment.status, "value")
+        else str(payment.status),
+        metadata=metadata,
+    )
 
 
 def charge_items(
@@ -73,10 +72,10 @@ def charge_items(
         stmt = stmt.where(Charge.business_id == business_id)
     charges = list(ctx.db.scalars(stmt))
     ctx.preload_client_identities(charge.client_record_id for charge in charges)
-    return [_charge_item(ctx, charge) for charge in charges]
+    return [charge_item(ctx, charge) for charge in charges]
 
 
-def _charge_item(ctx: WorkQueueContext, charge) -> WorkQueueItem:
+def charge_item(ctx: WorkQueueContext, charge) -> WorkQueueItem:
     due_date = charge.issued_at.date() + timedelta(days=UNPAID_CHARGE_TASK_THRESHOLD_DAYS)
     return ctx.item(
         WorkQueueSourceType.CHARGE,
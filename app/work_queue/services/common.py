@@ -9,6 +9,11 @@ from sqlalchemy.orm import Session
 from app.clients.repositories.client_identity_repository import ClientIdentityRepository
 from app.common.source_types import normalize_source_domain as normalize_source_domain
 from app.common.source_types import source_route as source_route
+from app.work_queue.constants import APPROACHING_DAYS as APPROACHING_DAYS
+from app.work_queue.constants import IMPORTANT_DAYS as IMPORTANT_DAYS
+from app.work_queue.constants import SOURCE_TYPE_LABELS as SOURCE_TYPE_LABELS
+from app.work_queue.constants import STATUS_LABELS as STATUS_LABELS
+from app.work_queue.constants import UPCOMING_WINDOW_DAYS as UPCOMING_WINDOW_DAYS
 from app.work_queue.schemas.work_queue import (
     WorkQueueItem,
     WorkQueueSourceSummary,
@@ -16,60 +21,6 @@ from app.work_queue.schemas.work_queue import (
     WorkQueueUrgency,
 )
 
-APPROACHING_DAYS = 7
-IMPORTANT_DAYS = 21
-UPCOMING_WINDOW_DAYS = 21
-
-SOURCE_TYPE_LABELS = {
-    WorkQueueSourceType.VAT_WORK_ITEM: 'דוח מע"מ',
-    WorkQueueSourceType.ANNUAL_REPORT: "דוח שנתי",
-    WorkQueueSourceType.ADVANCE_PAYMENT: "מקדמה",
-    WorkQueueSourceType.CHARGE: "חיוב לא שולם",
-    WorkQueueSourceType.BINDER: "קלסר",
-    WorkQueueSourceType.TASK: "משימה",
-}
-
-STATUS_LABELS = {
-    WorkQueueSourceType.VAT_WORK_ITEM: {
-        "pending_materials": "ממתין לחומרים",
-        "material_received": "חומרים התקבלו",
-        "data_entry_in_progress": "בהקלדה",
-        "ready_for_review": "מוכן לבדיקה",
-        "filed": "הוגש",
-        "canceled": "בוטל",
-    },
-    WorkQueueSourceType.ANNUAL_REPORT: {
-        "not_started": "טרם התחיל",
-        "collecting_docs": "איסוף מסמכים",
-        "in_preparation": "בהכנה",
-        "pending_client": "ממתין ללקוח",
-        "submitted": "הוגש",
-        "closed": "סגור",
-        "canceled": "בוטל",
-    },
-    WorkQueueSourceType.ADVANCE_PAYMENT: {
-        "pending": "ממתינה",
-        "partial": "שולמה חלקית",
-        "paid": "שולמה",
-    },
-    WorkQueueSourceType.CHARGE: {
-        "draft": "טיוטה",
-        "issued": "הונפק",
-        "paid": "שולם",
-        "canceled": "בוטל",
-    },
-    WorkQueueSourceType.BINDER: {
-        "in_office": "במשרד",
-        "ready_for_handover": "מוכן למסירה",
-        "handed_over": "נמסר ללקוח",
-    },
-    WorkQueueSourceType.TASK: {
-        "open": "פתוחה",
-        "done": "הושלמה",
-        "canceled": "בוטלה",
-    },
-}
-
 
 class ClientWorkQueueProfile(NamedTuple):
     name: str
@@ -2,20 +2,7 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import Any
 
-_MONTH_HE = {
-    1: "ינואר",
-    2: "פברואר",
-    3: "מרץ",
-    4: "אפריל",
-    5: "מאי",
-    6: "יוני",
-    7: "יולי",
-    8: "אוגוסט",
-    9: "ספטמבר",
-    10: "אוקטובר",
-    11: "נובמבר",
-    12: "דצמבר",
-}
+from app.work_queue.constants import MONTH_LABELS
 
 
 def _date_value(value: date | datetime | None) -> str | None:
@@ -44,16 +31,16 @@ def _period_label(period: str, months_count: int) -> str:
     except (ValueError, TypeError):
         return period
 
-    if start_month not in _MONTH_HE:
+    if start_month not in MONTH_LABELS:
         return period
 
     if months_count == 1:
-        return f"{_MONTH_HE[start_month]} {year}"
+        return f"{MONTH_LABELS[start_month]} {year}"
 
     end_month = start_month + months_count - 1
-    if end_month not in _MONTH_HE:
+    if end_month not in MONTH_LABELS:
         return period
-    return f"{_MONTH_HE[start_month]}–{_MONTH_HE[end_month]} {year}"
+    return f"{MONTH_LABELS[start_month]}–{MONTH_LABELS[end_month]} {year}"
 
 
 def vat_work_item_metadata(item, due_date: date) -> dict[str, Any]:
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date
+
+from sqlalchemy.orm import Session
+
+from app.common.services.base_service import BaseService
+from app.core.logging_config import get_logger
+from app.utils.time_utils import israel_today
+from app.work_queue.repositories.work_queue_read_model_repository import (
+    WorkQueueReadModelRepository,
+)
+from app.work_queue.schemas.work_queue import WorkQueueUrgency
+from app.work_queue.services.work_queue_service import WorkQueueService
+
+logger = get_logger(__name__)
+
+SourceKey = tuple[str, int]
+# Stored urgency ranks index WorkQueueUrgency in declaration order.
+_URGENCY_BY_RANK = dict(enumerate(WorkQueueUrgency))
+
+
+@dataclass(frozen=True)
+class WorkQueueRowMismatch:
+    source_type: str
+    source_id: int
+    field: str
+    materialized: object
+    live: object
+
+
+@dataclass
+class WorkQueueConsistencyReport:
+    checked_on: date
+    bucket_date: date | None
+    materialized_rows: int = 0
+    live_rows: int = 0
+    missing: list[SourceKey] = field(default_factory=list)
+    unexpected: list[SourceKey] = field(default_factory=list)
+    mismatched: list[WorkQueueRowMismatch] = field(default_factory=list)
+
+    @property
+    def is_stale(self) -> bool:
+        return self.bucket_date != self.checked_on
+
+    @property
+    def ok(self) -> bool:
+        return not (self.is_stale or self.missing or self.unexpected or self.mismatched)
+
+
+class WorkQueueReadModelService(BaseService):
+    """Builds, re-buckets and verifies the materialized `work_queue_items` table."""
+
+    def __init__(self, db: Session):
+        super().__init__(db)
+        self.repo = WorkQueueReadModelRepository(db)
+
+    def rebuild(self, today: date | None = None) -> int:
+        today = today or israel_today()
+        count = self.repo.rebuild(today)
+        logger.info("Work queue read model rebuilt for %s: %d row(s)", today, count)
+        return count
+
+    def rebucket(self, today: date | None = None) -> int | None:
+        """Nightly pass: re-derive urgency buckets once the date has rolled over.
+
+        Urgency, the upcoming-window membership and the binder waiting-days
+        title all depend on today's date, so the rows are recomputed from the
+        live projection. Skipped until the read model has been built once.
+        """
+        today = today or israel_today()
+        state = self.repo.get_state()
+        if state is None or state.bucket_date == today:
+            return None
+        return self.rebuild(today)
+
+    def check(self) -> WorkQueueConsistencyReport:
+        """Compare the materialized rows against `WorkQueueService._build_items`."""
+        service = WorkQueueService(self.db)
+        state = self.repo.get_state()
+        report = WorkQueueConsistencyReport(
+            checked_on=service.today,
+            bucket_date=state.bucket_date if state else None,
+        )
+        materialized = {
+            (row.source_type, row.source_id): (
+                row.client_record_id,
+                _URGENCY_BY_RANK.get(row.urgency_rank),
+                row.due_date,
+                row.linked_count,
+            )
+            for row in self.repo.list_items()
+        }
+        live = {
+            (item.source_type.value, item.source_id): (
+                item.client_record_id,
+                item.urgency,
+                item.due_date,
+                item.linked_tasks_count,
+            )
+            for item in service.reference_items()
+        }
+        report.materialized_rows = len(materialized)
+        report.live_rows = len(live)
+        report.missing = sorted(live.keys() - materialized.keys())
+        report.unexpected = sorted(materialized.keys() - live.keys())
+        fields = ("client_record_id", "urgency", "due_date", "linked_tasks_count")
+        for key in sorted(live.keys() & materialized.keys()):
+            for name, stored, computed in zip(fields, materialized[key], live[key], strict=True):
+                if stored != computed:
+                    report.mismatched.append(
+                        WorkQueueRowMismatch(key[0], key[1], name, stored, computed)
+                    )
+        return report
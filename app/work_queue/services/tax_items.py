@@ -42,24 +42,23 @@ def vat_work_item_items(ctx: WorkQueueContext, client_record_id: int | None) ->
     ]
     ctx.preload_client_identities(vat_item.client_record_id for vat_item in vat_items)
 
-    items = []
-    for vat_item in vat_items:
-        due_date = _vat_due_date(vat_item)
-        metadata = vat_work_item_metadata(vat_item, due_date)
-        items.append(
-            ctx.item(
-                WorkQueueSourceType.VAT_WORK_ITEM,
-                vat_item.id,
-                f'מע"מ לא הוגש: {metadata["period_label"]}',
-                due_date,
-                vat_item.client_record_id,
-                status_label=vat_item.status.value
-                if hasattr(vat_item.status, "value")
-                else str(vat_item.status),
-                metadata=metadata,
-            )
-        )
-    return items
+    return [vat_work_item_item(ctx, vat_item) for vat_item in vat_items]
+
+
+def vat_work_item_item(ctx: WorkQueueContext, vat_item) -> WorkQueueItem:
+    due_date = _vat_due_date(vat_item)
+    metadata = vat_work_item_metadata(vat_item, due_date)
+    return ctx.item(
+        WorkQueueSourceType.VAT_WORK_ITEM,
+        vat_item.id,
+        f'מע"מ לא הוגש: {metadata["period_label"]}',
+        due_date,
+        vat_item.client_record_id,
+        status_label=vat_item.status.value
+        if hasattr(vat_item.status, "value")
+        else str(vat_item.status),
+        metadata=metadata,
+    )
 
 
 def annual_report_items(ctx: WorkQueueContext, client_record_id: int | None) -> list[WorkQueueItem]:
@@ -75,10 +74,10 @@ def annual_report_items(ctx: WorkQueueContext, client_record_id: int | None) ->
         stmt = stmt.where(annual_report.client_record_id == client_record_id)
     reports = list(ctx.db.scalars(stmt))
     ctx.preload_client_identities(report.client_record_id for report in reports)
-    return [_annual_report_item(ctx, report) for report in reports]
+    return [annual_report_item(ctx, report) for report in reports]
 
 
-def _annual_report_item(ctx: WorkQueueContext, report) -> WorkQueueItem:
+def annual_report_item(ctx: WorkQueueContext, report) -> WorkQueueItem:
     due_date = (
         report.filing_deadline.date()
         if hasattr(report.filing_deadline, "date")
@@ -1,13 +1,24 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import date
 
 from sqlalchemy.orm import Session
 
+from app.config import settings
+from app.database import ConcurrentReads, SerialReads
 from app.tasks.models.task import TaskStatus
 from app.tasks.repositories.task_repository import TaskRepository
 from app.utils.time_utils import israel_today
+from app.work_queue.repositories.work_queue_query_repository import (
+    WorkQueueCounts,
+    WorkQueueQuery,
+    WorkQueueQueryRepository,
+    WorkQueueRowRef,
+)
+from app.work_queue.repositories.work_queue_read_model_repository import (
+    WorkQueueReadModelRepository,
+)
 from app.work_queue.schemas.work_queue import (
     LinkedTaskSummary,
     WorkQueueItem,
@@ -21,17 +32,27 @@ from app.work_queue.schemas.work_queue import (
     WorkQueueWarning,
 )
 from app.work_queue.services.actions import source_actions, task_actions
-from app.work_queue.services.billing_items import advance_payment_items, charge_items
-from app.work_queue.services.binder_items import binder_items
+from app.work_queue.services.billing_items import (
+    advance_payment_item,
+    advance_payment_items,
+    charge_item,
+    charge_items,
+)
+from app.work_queue.services.binder_items import binder_item, binder_items
 from app.work_queue.services.common import (
     WorkQueueContext,
     normalize_source_domain,
     source_key,
     urgency,
 )
-from app.work_queue.services.source_lookup import load_source_states
+from app.work_queue.services.source_lookup import SourceState, load_source_states
 from app.work_queue.services.task_items import task_item, task_summary
-from app.work_queue.services.tax_items import annual_report_items, vat_work_item_items
+from app.work_queue.services.tax_items import (
+    annual_report_item,
+    annual_report_items,
+    vat_work_item_item,
+    vat_work_item_items,
+)
 
 _FAR_FUTURE = date(9999, 12, 31)
 _URGENCY_SORT = {
@@ -44,6 +65,14 @@ _PRIORITY_SORT = {"urgent": 0, "high": 1, "normal": 2, "low": 3}
 _TASK_STATUS_SORT = {"open": 0}
 _HISTORY_TASK_STATUSES = {TaskStatus.DONE.value, TaskStatus.CANCELED.value}
 _ACTIVE_TASK_STATUSES = {TaskStatus.OPEN.value}
+_URGENCY_BY_RANK = {rank: value for value, rank in _URGENCY_SORT.items()}
+_SYSTEM_ITEM_BUILDERS = {
+    WorkQueueSourceType.VAT_WORK_ITEM: vat_work_item_item,
+    WorkQueueSourceType.ANNUAL_REPORT: annual_report_item,
+    WorkQueueSourceType.ADVANCE_PAYMENT: advance_payment_item,
+    WorkQueueSourceType.CHARGE: charge_item,
+    WorkQueueSourceType.BINDER: binder_item,
+}
 
 
 @dataclass(frozen=True)
@@ -164,11 +193,47 @@ def build_work_queue_summary(items: list[WorkQueueItem]) -> WorkQueueSummary:
     )
 
 
+def summary_from_counts(counts: WorkQueueCounts) -> WorkQueueSummary:
+    by_urgency = {
+        urgency_value: counts.by_urgency_rank.get(rank, 0)
+        for urgency_value, rank in _URGENCY_SORT.items()
+    }
+    return WorkQueueSummary(
+        total=counts.total,
+        manual_tasks=counts.manual_tasks,
+        linked=counts.linked,
+        unlinked=counts.unlinked,
+        overdue=by_urgency[WorkQueueUrgency.OVERDUE],
+        approaching=by_urgency[WorkQueueUrgency.APPROACHING],
+        important=by_urgency[WorkQueueUrgency.IMPORTANT],
+        upcoming=by_urgency[WorkQueueUrgency.UPCOMING],
+        by_source_type={
+            source_type: counts.by_source_type.get(source_type.value, 0)
+            for source_type in WorkQueueSourceType
+        },
+        by_task_status={
+            status.value: counts.by_task_status.get(status.value, 0) for status in TaskStatus
+        },
+    )
+
+
 class WorkQueueService:
+    """Unified work queue.
+
+    Listing runs through the SQL projection in `WorkQueueQueryRepository`: the
+    database filters, sorts, paginates and counts, and only the rows of the
+    requested page are hydrated into `WorkQueueItem`s. The unscoped active
+    queue reads the materialized `work_queue_items` table instead of the live
+    projection while that table is bucketed for today. `_build_items` is the
+    in-memory reference computation of the same queue.
+    """
+
     def __init__(self, db: Session):
         self.db = db
         self.today = israel_today()
         self.task_repo = TaskRepository(self.db)
+        self.query_repo = WorkQueueQueryRepository(self.db)
+        self.read_model_repo = WorkQueueReadModelRepository(self.db)
 
     def _context(self, *, include_client_identity: bool = True) -> WorkQueueContext:
         return WorkQueueContext(
@@ -193,24 +258,21 @@ class WorkQueueService:
         offset: int = 0,
         include_client_identity: bool = True,
     ) -> list[WorkQueueItem]:
-        ctx = self._context(include_client_identity=include_client_identity)
-        items = self._filtered_items(
-            ctx,
+        query = self._list_query(
             client_record_id=client_record_id,
             business_id=business_id,
             exclude_source_types=exclude_source_types,
             include_task_history=include_task_history,
-            filters=WorkQueueFilters(
-                search=search,
-                source_type=source_type,
-                urgency=urgency,
-                task_status=task_status,
-                linked=linked,
-                scope=scope,
-            ),
+            search=search,
+            source_type=source_type,
+            urgency=urgency,
+            task_status=task_status,
+            linked=linked,
+            scope=scope,
         )
-        items.sort(key=self._sort_key)
-        return items[offset : offset + limit]
+        refs = self.query_repo.list_page(query, limit=limit, offset=offset)
+        ctx = self._context(include_client_identity=include_client_identity)
+        return self._hydrate(ctx, refs, query)
 
     def list_items_with_total(
         self,
@@ -227,9 +289,58 @@ class WorkQueueService:
         limit: int = 50,
         offset: int = 0,
     ) -> WorkQueueListResponse:
-        ctx = self._context()
-        all_items = self._filtered_items(
-            ctx,
+        query = self._list_query(
+            client_record_id=client_record_id,
+            business_id=business_id,
+            exclude_source_types=exclude_source_types,
+            include_task_history=include_task_history,
+            search=search,
+            source_type=source_type,
+            urgency=urgency,
+            task_status=task_status,
+            linked=linked,
+            scope=scope,
+        )
+        return self._list_response(
+            self._page_items(query, limit=limit, offset=offset),
+            self.query_repo.count_summary(query),
+        )
+
+    @classmethod
+    async def list_items_with_total_concurrently(
+        cls,
+        reads: ConcurrentReads | SerialReads,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+        **filters,
+    ) -> WorkQueueListResponse:
+        """`list_items_with_total` with the page and the summary counts read concurrently.
+
+        `filters` are the keyword filters of `list_items_with_total`.
+        """
+        (query,) = await reads.gather(lambda db: cls(db)._list_query(**filters))
+        items, counts = await reads.gather(
+            lambda db: cls(db)._page_items(query, limit=limit, offset=offset),
+            lambda db: cls(db).query_repo.count_summary(query),
+        )
+        return cls._list_response(items, counts)
+
+    def _list_query(
+        self,
+        *,
+        client_record_id: int | None = None,
+        business_id: int | None = None,
+        exclude_source_types: list[WorkQueueSourceType] | None = None,
+        include_task_history: bool = False,
+        search: str | None = None,
+        source_type: WorkQueueSourceType | None = None,
+        urgency: WorkQueueUrgency | None = None,
+        task_status: TaskStatus | None = None,
+        linked: WorkQueueLinkedFilter | None = None,
+        scope: WorkQueueScope | None = None,
+    ) -> WorkQueueQuery:
+        return self._query(
             client_record_id=client_record_id,
             business_id=business_id,
             exclude_source_types=exclude_source_types,
@@ -243,14 +354,140 @@ class WorkQueueService:
                 scope=scope,
             ),
         )
-        all_items.sort(key=self._sort_key)
-        return WorkQueueListResponse(
-            items=all_items[offset : offset + limit],
-            total=len(all_items),
-            # Summary intentionally reflects the full filtered set before pagination.
-            summary=build_work_queue_summary(all_items),
+
+    def _page_items(self, query: WorkQueueQuery, *, limit: int, offset: int) -> list[WorkQueueItem]:
+        refs = self.query_repo.list_page(query, limit=limit, offset=offset)
+        return self._hydrate(self._context(), refs, query)
+
+    @staticmethod
+    def _list_response(
+        items: list[WorkQueueItem], counts: WorkQueueCounts
+    ) -> WorkQueueListResponse:
+        # Summary intentionally reflects the full filtered set before pagination.
+        summary = summary_from_counts(counts)
+        return WorkQueueListResponse(items=items, total=summary.total, summary=summary)
+
+    def _query(
+        self,
+        *,
+        client_record_id: int | None,
+        business_id: int | None,
+        exclude_source_types: list[WorkQueueSourceType] | None,
+        include_task_history: bool,
+        filters: WorkQueueFilters,
+    ) -> WorkQueueQuery:
+        linked = None
+        if filters.linked is not None:
+            linked = WorkQueueLinkedFilter(filters.linked) == WorkQueueLinkedFilter.LINKED
+        manual_only = None
+        if filters.scope is not None:
+            manual_only = WorkQueueScope(filters.scope) == WorkQueueScope.MANUAL
+        query = WorkQueueQuery(
+            today=self.today,
+            client_record_id=client_record_id,
+            business_id=business_id,
+            excluded=frozenset(exclude_source_types or []),
+            include_task_history=include_task_history,
+            search=filters.search,
+            source_type=filters.source_type,
+            urgency_rank=(
+                _URGENCY_SORT[WorkQueueUrgency(filters.urgency)]
+                if filters.urgency is not None
+                else None
+            ),
+            task_status=filters.task_status,
+            linked=linked,
+            manual_only=manual_only,
+        )
+        if query.is_unscoped and self._read_model_is_current():
+            query = replace(query, from_read_model=True)
+        return query
+
+    def _read_model_is_current(self) -> bool:
+        if not settings.WORK_QUEUE_READ_MODEL_ENABLED:
+            return False
+        state = self.read_model_repo.get_state()
+        return state is not None and state.bucket_date == self.today
+
+    def reference_items(self) -> list[WorkQueueItem]:
+        """Unscoped active queue computed in memory by `_build_items`, in display order."""
+        items = self._filtered_items(
+            self._context(include_client_identity=False),
+            client_record_id=None,
+            business_id=None,
+            exclude_source_types=None,
+            include_task_history=False,
+            filters=WorkQueueFilters(),
+        )
+        items.sort(key=self._sort_key)
+        return items
+
+    def _hydrate(
+        self,
+        ctx: WorkQueueContext,
+        refs: list[WorkQueueRowRef],
+        query: WorkQueueQuery,
+    ) -> list[WorkQueueItem]:
+        """Build full items for one page of projected rows with batched lookups."""
+        sources = self.query_repo.load_sources((ref.source_type, ref.source_id) for ref in refs)
+        tasks = [
+            sources[(ref.source_type, ref.source_id)]
+            for ref in refs
+            if ref.source_type == WorkQueueSourceType.TASK
+            and (ref.source_type, ref.source_id) in sources
+        ]
+        source_states = load_source_states(
+            ctx.db,
+            {
+                (source_type, task.source_id)
+                for task in tasks
+                if task.source_id is not None
+                for source_type in [normalize_source_domain(task.source_domain)]
+                if source_type is not None
+            },
+        )
+        system_keys = [
+            (ref.source_type, ref.source_id)
+            for ref in refs
+            if ref.source_type != WorkQueueSourceType.TASK
+        ]
+        ctx.preload_client_identities(
+            {
+                client_record_id
+                for client_record_id in [
+                    *(getattr(sources.get(key), "client_record_id", None) for key in system_keys),
+                    *(state.client_record_id for state in source_states.values()),
+                ]
+                if client_record_id is not None
+            }
         )
 
+        items: list[WorkQueueItem] = []
+        system_by_key: dict[tuple[str, int], WorkQueueItem] = {}
+        for ref in refs:
+            source = sources.get((ref.source_type, ref.source_id))
+            if source is None:
+                continue
+            if ref.source_type == WorkQueueSourceType.TASK:
+                items.append(self._standalone_task_item(ctx, source, source_states))
+                continue
+            item = _SYSTEM_ITEM_BUILDERS[ref.source_type](ctx, source)
+            if item is None:
+                continue
+            item.available_actions = source_actions(item.source_type, item.source_id)
+            system_by_key[source_key(item.source_type, item.source_id)] = item
+            items.append(item)
+
+        if query.merges_tasks:
+            for task in self.query_repo.list_linked_open_tasks(system_keys):
+                source_type = normalize_source_domain(task.source_domain)
+                if source_type is None or task.source_id is None:
+                    continue
+                source_item = system_by_key.get(source_key(source_type, task.source_id))
+                if source_item is not None:
+                    self._attach_task(source_item, task_summary(task))
+        return items
+
     def _filtered_items(
         self,
         ctx: WorkQueueContext,
@@ -371,45 +608,50 @@ class WorkQueueService:
                     self._attach_task(source_item, task_summary(task))
                     continue
 
-            standalone = task_item(ctx, task)
-            if source_type is not None and task_source_id is not None:
-                state = source_states.get((source_type.value, task_source_id))
-                if state is not None and client_record_id is not None:
-                    if state.client_record_id != client_record_id:
-                        continue
-                if state is not None:
-                    ctx.attach_client_identity(standalone, state.client_record_id)
-                    standalone.source_summary = WorkQueueSourceSummary(
-                        source_type=source_type.value,
-                        source_id=task_source_id,
-                        label=state.label,
-                        route=state.route if not state.is_missing else None,
-                    )
-                    if state.is_missing or state.is_deleted:
-                        standalone.warnings.append(
-                            WorkQueueWarning(
-                                key="source_missing",
-                                label="הפריט המקושר לא נמצא או נמחק",
-                                severity="warning",
-                            )
-                        )
-                    elif state.is_final:
-                        standalone.warnings.append(
-                            WorkQueueWarning(
-                                key="source_final",
-                                label="הפריט המקושר כבר טופל",
-                                severity="info",
-                            )
-                        )
-                else:
+            standalone = self._standalone_task_item(ctx, task, source_states)
+            if client_record_id is None:
+                rows.append(standalone)
+            elif standalone.client_record_id == client_record_id:
+                rows.append(standalone)
+
+        return rows
+
+    def _standalone_task_item(
+        self,
+        ctx: WorkQueueContext,
+        task,
+        source_states: dict[tuple[str, int], SourceState],
+    ) -> WorkQueueItem:
+        standalone = task_item(ctx, task)
+        source_type = normalize_source_domain(task.source_domain)
+        task_source_id = task.source_id
+        if source_type is not None and task_source_id is not None:
+            state = source_states.get((source_type.value, task_source_id))
+            if state is not None:
+                ctx.attach_client_identity(standalone, state.client_record_id)
+                standalone.source_summary = WorkQueueSourceSummary(
+                    source_type=source_type.value,
+                    source_id=task_source_id,
+                    label=state.label,
+                    route=state.route if not state.is_missing else None,
+                )
+                if state.is_missing or state.is_deleted:
                     standalone.warnings.append(
                         WorkQueueWarning(
-                            key="source_unknown",
-                            label="סוג הקישור של המשימה אינו מוכר",
+                            key="source_missing",
+                            label="הפריט המקושר לא נמצא או נמחק",
                             severity="warning",
                         )
                     )
-            elif task.source_domain:
+                elif state.is_final:
+                    standalone.warnings.append(
+                        WorkQueueWarning(
+                            key="source_final",
+                            label="הפריט המקושר כבר טופל",
+                            severity="info",
+                        )
+                    )
+            else:
                 standalone.warnings.append(
                     WorkQueueWarning(
                         key="source_unknown",
@@ -417,13 +659,15 @@ class WorkQueueService:
                         severity="warning",
                     )
                 )
-
-            if client_record_id is None:
-                rows.append(standalone)
-            elif standalone.client_record_id == client_record_id:
-                rows.append(standalone)
-
-        return rows
+        elif task.source_domain:
+            standalone.warnings.append(
+                WorkQueueWarning(
+                    key="source_unknown",
+                    label="סוג הקישור של המשימה אינו מוכר",
+                    severity="warning",
+                )
+            )
+        return standalone
 
     def _attach_task(self, item: WorkQueueItem, task: LinkedTaskSummary) -> None:
         item.linked_tasks.append(task)
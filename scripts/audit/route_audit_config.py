@@ -157,6 +157,8 @@ KNOWN_EXTERNAL_OR_MANUAL_ROUTES: set[tuple[str, str]] = {
     ("GET", "/ready"),
     ("GET", "/info"),
     ("GET", "/"),
+    # Internal diagnostics (called by operators, not the frontend)
+    ("GET", "/internal/perf"),
     # OpenAPI
     ("GET", "/openapi.json"),
     ("GET", "/docs"),
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Rebuild or verify the per client-year VAT aggregate (client_year_vat_totals).
+
+Writes keep the aggregate in sync on their own and the migration that creates
+the table backfills it. Run `check` to look for drift and `rebuild` after bulk
+changes made outside the ORM (raw SQL on vat_work_items).
+
+Commands:
+  rebuild   Replace every row with a fresh aggregate of vat_work_items.
+  check     Compare the stored rows against a fresh aggregate. Exits 1 on drift.
+
+Usage:
+    ./.venv/bin/python scripts/ops/client_year_vat_totals.py rebuild
+    ./.venv/bin/python scripts/ops/client_year_vat_totals.py check
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+os.environ.setdefault("APP_ENV", "development")
+
+GREEN = "\033[32m"
+RED = "\033[31m"
+BOLD = "\033[1m"
+RESET = "\033[0m"
+
+_MAX_LISTED = 20
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Maintain the client_year_vat_totals aggregate.")
+    parser.add_argument("command", choices=["rebuild", "check"])
+    return parser.parse_args()
+
+
+def _print_report(report) -> None:
+    print(f"\n{BOLD}client_year_vat_totals{RESET}")
+    print(f"  stored rows: {report.stored_rows}")
+    print(f"  live rows:   {report.live_rows}")
+    if report.missing:
+        print(f"  {RED}missing: {len(report.missing)}{RESET}")
+        for client_record_id, tax_year in report.missing[:_MAX_LISTED]:
+            print(f"    client {client_record_id} / {tax_year}")
+    if report.mismatched:
+        print(f"  {RED}mismatched: {len(report.mismatched)}{RESET}")
+        for row in report.mismatched[:_MAX_LISTED]:
+            print(
+                f"    client {row.client_record_id} / {row.tax_year} {row.field} "
+                f"stored={row.stored} live={row.live}"
+            )
+    if report.ok:
+        print(f"\n{GREEN}{BOLD}Aggregate is consistent.{RESET}")
+    else:
+        print(f"\n{RED}{BOLD}Aggregate drift detected — run rebuild.{RESET}")
+
+
+def main() -> None:
+    import app.model_registry  # noqa: F401  # pylint: disable=unused-import
+    from app.database import SessionLocal
+    from app.vat_reports.services.client_year_vat_totals_service import (
+        ClientYearVatTotalsService,
+    )
+
+    args = _parse_args()
+    db = SessionLocal()
+    try:
+        service = ClientYearVatTotalsService(db)
+        if args.command == "rebuild":
+            count = service.rebuild()
+            db.commit()
+            print(f"{GREEN}Rebuilt client_year_vat_totals: {count} row(s).{RESET}")
+            return
+        report = service.check()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    _print_report(report)
+    if not report.ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Maintain content-addressed permanent document storage (document_blobs).
+
+New uploads are stored as blobs keyed by SHA-256 on their own. Run `rehash`
+once after the migration that creates the table to move documents uploaded
+before it (per-version keys) onto blobs; documents with identical files end
+up sharing one. It commits per batch and can be re-run after an interruption.
+
+Commands:
+  rehash    Download, hash and re-key documents still on per-version keys.
+            --delete-legacy removes each old object once its batch committed.
+  gc        Delete blobs unreferenced for longer than DOCUMENT_BLOB_GC_GRACE_HOURS
+            (the same work as the nightly document_blob_gc job).
+
+Usage:
+    ./.venv/bin/python scripts/ops/document_blobs.py rehash
+    ./.venv/bin/python scripts/ops/document_blobs.py rehash --delete-legacy
+    ./.venv/bin/python scripts/ops/document_blobs.py gc
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+os.environ.setdefault("APP_ENV", "development")
+
+GREEN = "\033[32m"
+YELLOW = "\033[33m"
+RESET = "\033[0m"
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Maintain the document_blobs store.")
+    parser.add_argument("command", choices=["rehash", "gc"])
+    parser.add_argument(
+        "--delete-legacy",
+        action="store_true",
+        help="rehash: delete the old per-version objects after they are moved",
+    )
+    parser.add_argument("--batch-size", type=int, default=100, help="rehash: rows per commit")
+    return parser.parse_args()
+
+
+def main() -> None:
+    import app.model_registry  # noqa: F401  # pylint: disable=unused-import
+    from app.database import SessionLocal
+    from app.infrastructure.storage import get_storage_provider
+    from app.permanent_documents.services.document_blob_service import DocumentBlobService
+
+    args = _parse_args()
+    db = SessionLocal()
+    try:
+        service = DocumentBlobService(db, get_storage_provider())
+        if args.command == "rehash":
+            result = service.rehash_legacy_documents(
+                batch_size=args.batch_size, delete_legacy=args.delete_legacy
+            )
+        else:
+            result = service.collect_garbage()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    summary = ", ".join(f"{name}={count}" for name, count in result.items())
+    color = YELLOW if result.get("missing") else GREEN
+    print(f"{color}document_blobs {args.command}: {summary}{RESET}")
+
+
+if __name__ == "__main__":
+    main()
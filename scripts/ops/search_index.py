@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Rebuild the unified search index (search_documents).
+
+The migration that creates the table fills it and writes keep it in sync on
+their own; run this after bulk changes made outside the ORM or a change to
+the normalisation rules (app/search/normalization.py).
+
+Usage:
+    ./.venv/bin/python scripts/ops/search_index.py rebuild
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+os.environ.setdefault("APP_ENV", "development")
+
+GREEN = "\033[32m"
+RESET = "\033[0m"
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Maintain the search_documents index.")
+    parser.add_argument("command", choices=["rebuild"])
+    return parser.parse_args()
+
+
+def main() -> None:
+    import app.model_registry  # noqa: F401  # pylint: disable=unused-import
+    from app.database import SessionLocal
+    from app.search.services.search_index_service import SearchIndexService
+
+    _parse_args()
+    db = SessionLocal()
+    try:
+        count = SearchIndexService(db).rebuild()
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+    print(f"{GREEN}Rebuilt search_documents: {count} document(s).{RESET}")
+
+
+if __name__ == "__main__":
+    main()
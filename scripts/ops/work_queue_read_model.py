@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Rebuild or verify the materialized work-queue read model (work_queue_items).
+
+Commands:
+  rebuild   Recompute every row from the live projection for today and mark the
+            read model current (also activates it the first time it is run).
+  check     Compare the stored rows against the in-memory reference computation
+            (WorkQueueService._build_items) and report drift. Exits 1 on drift.
+
+Usage:
+    ./.venv/bin/python scripts/ops/work_queue_read_model.py rebuild
+    ./.venv/bin/python scripts/ops/work_queue_read_model.py check
+    ./.venv/bin/python scripts/ops/work_queue_read_model.py check --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+os.environ.setdefault("APP_ENV", "development")
+
+GREEN = "\033[32m"
+RED = "\033[31m"
+BOLD = "\033[1m"
+RESET = "\033[0m"
+
+_MAX_LISTED = 20
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Maintain the work_queue_items read model.")
+    parser.add_argument("command", choices=["rebuild", "check"])
+    parser.add_argument("--json", action="store_true", help="Print the check report as JSON")
+    return parser.parse_args()
+
+
+def _print_report(report) -> None:
+    print(f"\n{BOLD}Work queue read model — checked {report.checked_on}{RESET}")
+    print(f"  bucket date:       {report.bucket_date or 'never built'}")
+    print(f"  materialized rows: {report.materialized_rows}")
+    print(f"  live rows:         {report.live_rows}")
+    for label, keys in (("missing", report.missing), ("unexpected", report.unexpected)):
+        if keys:
+            print(f"  {RED}{label}: {len(keys)}{RESET}")
+            for source_type, source_id in keys[:_MAX_LISTED]:
+                print(f"    {source_type}:{source_id}")
+    if report.mismatched:
+        print(f"  {RED}mismatched: {len(report.mismatched)}{RESET}")
+        for row in report.mismatched[:_MAX_LISTED]:
+            print(
+                f"    {row.source_type}:{row.source_id} {row.field} "
+                f"stored={row.materialized} live={row.live}"
+            )
+    if report.ok:
+        print(f"\n{GREEN}{BOLD}Read model is consistent.{RESET}")
+    elif report.is_stale:
+        print(f"\n{RED}{BOLD}Read model is not bucketed for today — run rebuild.{RESET}")
+    else:
+        print(f"\n{RED}{BOLD}Read model drift detected — run rebuild.{RESET}")
+
+
+def main() -> None:
+    import app.model_registry  # noqa: F401  # pylint: disable=unused-import
+    from app.database import SessionLocal
+    from app.work_queue.services.read_model_service import WorkQueueReadModelService
+
+    args = _parse_args()
+    db = SessionLocal()
+    try:
+        service = WorkQueueReadModelService(db)
+        if args.command == "rebuild":
+            count = service.rebuild()
+            db.commit()
+            print(f"{GREEN}Rebuilt work_queue_items: {count} row(s).{RESET}")
+            return
+        report = service.check()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    if args.json:
+        payload = {**asdict(report), "ok": report.ok, "is_stale": report.is_stale}
+        print(json.dumps(payload, indent=2, default=str, ensure_ascii=False))
+    else:
+        _print_report(report)
+    if not report.ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -217,6 +217,43 @@ REGISTRY: Registry = {
                     _option("Check custom URL", ["__health_url__"]),
                 ],
             ),
+            "work-queue": _script(
+                "Work queue read model: rebuild / consistency check",
+                "ops/work_queue_read_model.py",
+                [
+                    _option("Check consistency", ["check"]),
+                    _option("Check consistency as JSON", ["check", "--json"]),
+                    _option("Rebuild read model", ["rebuild"], dangerous=True),
+                ],
+            ),
+            "search-index": _script(
+                "Search index: rebuild search_documents",
+                "ops/search_index.py",
+                [
+                    _option("Rebuild search index", ["rebuild"], dangerous=True),
+                ],
+            ),
+            "vat-totals": _script(
+                "Client-year VAT totals: rebuild / consistency check",
+                "ops/client_year_vat_totals.py",
+                [
+                    _option("Check consistency", ["check"]),
+                    _option("Rebuild aggregate", ["rebuild"], dangerous=True),
+                ],
+            ),
+            "document-blobs": _script(
+                "Document blobs: rehash legacy files / collect unreferenced blobs",
+                "ops/document_blobs.py",
+                [
+                    _option("Collect unreferenced blobs", ["gc"]),
+                    _option("Rehash legacy documents", ["rehash"], dangerous=True),
+                    _option(
+                        "Rehash and delete legacy files",
+                        ["rehash", "--delete-legacy"],
+                        dangerous=True,
+                    ),
+                ],
+            ),
         },
     },
     "tooling": {
@@ -253,6 +290,41 @@ REGISTRY: Registry = {
                     _option("Generate JSON_EXAMPLES.md"),
                 ],
             ),
+            "bench-excel": _script(
+                "Benchmark in-memory vs streaming Excel export",
+                "tooling/bench_excel_export.py",
+                [
+                    _option("Export 50k rows"),
+                    _option("Export 5k rows", ["--rows", "5000"]),
+                ],
+            ),
+            "bench-json": _script(
+                "Benchmark FastAPI vs pre-serialized JSON for large list responses",
+                "tooling/bench_json_serialization.py",
+                [
+                    _option("1000 rows per response"),
+                    _option("5000 rows per response", ["--rows", "5000"]),
+                ],
+            ),
+            "bench-reads": _script(
+                "Benchmark serial vs concurrent dashboard/timeline/work-queue reads",
+                "tooling/bench_concurrent_reads.py",
+                [
+                    _option("200 requests, 10 in flight"),
+                    _option(
+                        "1000 requests, 50 in flight",
+                        ["--requests", "1000", "--concurrency", "50"],
+                    ),
+                ],
+            ),
+            "bench-urls": _script(
+                "Benchmark per-row vs cached batch presigned download URLs",
+                "tooling/bench_presigned_urls.py",
+                [
+                    _option("200 rows x 50 pages"),
+                    _option("1000 rows x 20 pages", ["--rows", "1000", "--pages", "20"]),
+                ],
+            ),
         },
     },
 }
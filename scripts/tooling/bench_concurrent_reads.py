@@ -0,0 +1,148 @@
+"""Compare serial and concurrent reads on the dashboard, timeline and work-queue paths.
+
+Each simulated request runs one read path the way its route does:
+`SerialReads` issues the independent queries one after another on a single
+session, and `ConcurrentReads` issues them concurrently on the async engine
+with one pooled connection per query. `--concurrency` requests are kept in
+flight at once, and the report shows p50 / p99 / max latency and throughput
+for each mode.
+
+It needs the configured DATABASE_URL to have an async driver: PostgreSQL via
+asyncpg, or a file-backed SQLite via aiosqlite. Seed data first, for example
+with `scripts/dev/seed_fake_data.py`. The gain from overlapping queries grows
+with the database round-trip time, so measure against a networked PostgreSQL
+rather than local SQLite.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+os.environ.setdefault("APP_ENV", "development")
+
+PATHS = ("dashboard", "timeline", "work-queue")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark concurrent read paths.")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per path and mode.")
+    parser.add_argument("--concurrency", type=int, default=10, help="Requests in flight.")
+    parser.add_argument("--path", choices=PATHS, action="append", help="Paths to run (all).")
+    parser.add_argument("--client-id", type=int, help="Timeline client (first client).")
+    return parser.parse_args()
+
+
+def read_path(name: str, client_record_id: int | None) -> Callable[[object], Awaitable]:
+    from app.dashboard.services.dashboard_overview_service import DashboardOverviewService
+    from app.timeline.services.timeline_service import TimelineService
+    from app.users.models.user import UserRole
+    from app.work_queue.services.work_queue_service import WorkQueueService
+
+    if name == "dashboard":
+        return lambda reads: DashboardOverviewService.get_overview_concurrently(
+            reads, user_role=UserRole.ADVISOR
+        )
+    if name == "timeline":
+        return lambda reads: TimelineService.get_client_timeline_concurrently(
+            reads, client_record_id=client_record_id
+        )
+    return lambda reads: WorkQueueService.list_items_with_total_concurrently(reads, limit=50)
+
+
+async def run(
+    path: Callable[[object], Awaitable],
+    make_reads: Callable[[], tuple[object, Callable[[], None]]],
+    *,
+    requests: int,
+    concurrency: int,
+) -> tuple[list[float], float]:
+    latencies: list[float] = []
+    gate = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with gate:
+            reads, close = make_reads()
+            started = time.perf_counter()
+            try:
+                await path(reads)
+            finally:
+                latencies.append((time.perf_counter() - started) * 1000)
+                close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return latencies, time.perf_counter() - started
+
+
+def report(name: str, latencies: list[float], elapsed: float) -> None:
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, round(0.99 * (len(ordered) - 1)))]
+    print(
+        f"  {name:<11} p50 {statistics.median(ordered):>8.1f}ms  p99 {p99:>8.1f}ms  "
+        f"max {ordered[-1]:>8.1f}ms  {len(ordered) / elapsed:>7.1f} req/s"
+    )
+
+
+async def main_async(args: argparse.Namespace) -> int:
+    from sqlalchemy import select
+
+    import app.model_registry  # noqa: F401  # pylint: disable=unused-import
+    from app.clients.models.client_record import ClientRecord
+    from app.database import (
+        ConcurrentReads,
+        SerialReads,
+        SessionLocal,
+        async_sessions,
+        dispose_async_engines,
+    )
+
+    sessions = async_sessions()
+    if sessions is None:
+        print("DATABASE_URL has no async driver (in-memory SQLite?) — nothing to compare.")
+        return 1
+
+    client_record_id = args.client_id
+    if client_record_id is None:
+        with SessionLocal() as db:
+            client_record_id = db.scalar(select(ClientRecord.id).order_by(ClientRecord.id))
+    paths = [p for p in args.path or PATHS if p != "timeline" or client_record_id is not None]
+
+    def serial() -> tuple[object, Callable[[], None]]:
+        db = SessionLocal()
+        return SerialReads(db), db.close
+
+    def concurrent() -> tuple[object, Callable[[], None]]:
+        return ConcurrentReads(sessions), lambda: None
+
+    print(f"{args.requests} requests per run, {args.concurrency} in flight")
+    for name in paths:
+        path = read_path(name, client_record_id)
+        print(name)
+        for mode, make_reads in (("serial", serial), ("concurrent", concurrent)):
+            # One warm-up request fills the pools and the statement caches.
+            await run(path, make_reads, requests=1, concurrency=1)
+            latencies, elapsed = await run(
+                path, make_reads, requests=args.requests, concurrency=args.concurrency
+            )
+            report(mode, latencies, elapsed)
+    await dispose_async_engines()
+    return 0
+
+
+def main() -> int:
+    return asyncio.run(main_async(parse_args()))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,264 @@
+"""Compare FastAPI's default response serialization with `app.core.json_response`.
+
+For each large list response (work queue, clients, binders, VAT group items)
+the script builds synthetic rows, serializes them the way FastAPI does for a
+route with `response_model=` (revalidate, dump to Python, `json.dumps`) and
+through `dump_json`, checks both produce the same JSON and prints the cost per
+1,000 rows. No database is needed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+os.environ.setdefault("APP_ENV", "development")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark list response serialization.")
+    parser.add_argument("--rows", type=int, default=1_000, help="Rows per response.")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per variant.")
+    return parser.parse_args()
+
+
+def work_queue_response(rows: int) -> Any:
+    from app.work_queue.schemas.work_queue import (
+        WorkQueueItem,
+        WorkQueueListResponse,
+        WorkQueueSourceSummary,
+        WorkQueueSourceType,
+        WorkQueueSummary,
+        WorkQueueUrgency,
+        WorkQueueWarning,
+    )
+    from app.work_queue.services.actions import source_actions
+
+    today = date.today()
+    items = []
+    for i in range(1, rows + 1):
+        source_type = WorkQueueSourceType.VAT_WORK_ITEM
+        item = WorkQueueItem(
+            id=f"vat_work_item:{i}",
+            source_type=source_type,
+            source_id=i,
+            title=f'דוח מע"מ {today:%m/%Y}',
+            description="ממתין לחומרים מהלקוח",
+            type_label='מע"מ',
+            status_label="ממתין לחומרים",
+            due_date=today + timedelta(days=i % 30),
+            urgency=WorkQueueUrgency.UPCOMING,
+            client_record_id=i,
+            client_name=f"לקוח בדיקה {i}",
+            office_client_number=i,
+            source_summary=WorkQueueSourceSummary(
+                source_type=source_type.value,
+                source_id=i,
+                label='דוח מע"מ',
+                route=f"/tax/vat/{i}",
+            ),
+            warnings=[WorkQueueWarning(key="missing_docs", label="חסרים מסמכים")]
+            if i % 4 == 0
+            else [],
+        )
+        item.available_actions = source_actions(source_type, i)
+        items.append(item)
+    summary = WorkQueueSummary(
+        total=rows,
+        manual_tasks=0,
+        linked=0,
+        unlinked=rows,
+        overdue=0,
+        approaching=0,
+        important=0,
+        upcoming=rows,
+        by_source_type={WorkQueueSourceType.VAT_WORK_ITEM: rows},
+        by_task_status={},
+    )
+    return WorkQueueListResponse(items=items, total=rows, summary=summary)
+
+
+def client_list_response(rows: int) -> Any:
+    from app.clients.schemas.client_record_response import (
+        ClientRecordListResponse,
+        ClientRecordListStats,
+        ClientRecordResponse,
+    )
+
+    now = datetime.now()
+    items = [
+        ClientRecordResponse(
+            id=i,
+            full_name=f"לקוח בדיקה {i}",
+            id_number=f"{i:09d}",
+            office_client_number=i,
+            notes="" if i % 3 else "לקוח ותיק, לבדוק מסמכים",
+            vat_exempt_ceiling=Decimal("120000.00"),
+            advance_rate=Decimal("4.50"),
+            phone=f"050-{i % 10_000_000:07d}",
+            email=f"client{i}@example.com",
+            address_street=f"רחוב הרצל {i % 200}",
+            address_city="תל אביב",
+            created_at=now,
+            updated_at=now,
+            active_binder_number=f"{i}/1",
+        )
+        for i in range(1, rows + 1)
+    ]
+    return ClientRecordListResponse(
+        items=items,
+        page=1,
+        page_size=rows,
+        total=rows,
+        stats=ClientRecordListStats(active=rows),
+    )
+
+
+def binder_list_response(rows: int) -> Any:
+    from app.actions.binder_actions import get_binder_actions_for_state
+    from app.binders.models.binder import BinderCapacityStatus, BinderLocationStatus
+    from app.binders.schemas.binder import BinderListCounters, BinderListResponse, BinderResponse
+
+    now = datetime.now()
+    items = []
+    for i in range(1, rows + 1):
+        capacity = BinderCapacityStatus.OPEN if i % 5 else BinderCapacityStatus.FULL
+        items.append(
+            BinderResponse(
+                id=i,
+                client_record_id=i,
+                office_client_number=i,
+                client_name=f"לקוח בדיקה {i}",
+                client_id_number=f"{i:09d}",
+                binder_number=f"{i}/1",
+                period_start=date(2026, 1, 1),
+                location_status=BinderLocationStatus.IN_OFFICE,
+                capacity_status=capacity,
+                created_at=now,
+                days_in_office=i % 365,
+                available_actions=get_binder_actions_for_state(
+                    location_status=BinderLocationStatus.IN_OFFICE,
+                    capacity_status=capacity,
+                ),
+            )
+        )
+    counters = BinderListCounters(
+        total=rows,
+        location_in_office=rows,
+        location_ready_for_handover=0,
+        location_handed_over=0,
+        capacity_open=rows,
+        capacity_full=0,
+    )
+    return BinderListResponse(items=items, page=1, page_size=rows, total=rows, counters=counters)
+
+
+def vat_group_items_response(rows: int) -> Any:
+    from app.common.enums import VatType
+    from app.vat_reports.models.vat_enums import VatWorkItemStatus
+    from app.vat_reports.schemas.vat_report import (
+        VatWorkItemGroupItemsResponse,
+        VatWorkItemResponse,
+    )
+
+    now = datetime.now()
+    items = [
+        VatWorkItemResponse(
+            id=i,
+            client_record_id=i,
+            office_client_number=i,
+            client_name=f"לקוח בדיקה {i}",
+            client_id_number=f"{i:09d}",
+            client_status="active",
+            period="2026-09",
+            period_type=VatType.MONTHLY,
+            status=VatWorkItemStatus.PENDING_MATERIALS,
+            total_output_vat=Decimal("1700.00"),
+            total_input_vat=Decimal("340.00"),
+            net_vat=Decimal("1360.00"),
+            total_output_net=Decimal("10000.00"),
+            total_input_net=Decimal("2000.00"),
+            is_overridden=False,
+            created_by=1,
+            created_at=now,
+            updated_at=now,
+            submission_deadline=date(2026, 10, 15),
+            days_until_deadline=i % 30,
+            is_overdue=False,
+        )
+        for i in range(1, rows + 1)
+    ]
+    return VatWorkItemGroupItemsResponse(items=items, total=rows, period="2026-09")
+
+
+def fastapi_serialize(response_model: Any) -> Callable[[Any], bytes]:
+    from fastapi.responses import JSONResponse
+    from fastapi.routing import serialize_response
+    from fastapi.utils import create_model_field
+
+    field = create_model_field(name="Response", type_=response_model, mode="serialization")
+    loop = asyncio.new_event_loop()
+
+    def serialize(value: Any) -> bytes:
+        content = loop.run_until_complete(serialize_response(field=field, response_content=value))
+        return JSONResponse(content).body
+
+    return serialize
+
+
+def fast_serialize(response_model: Any) -> Callable[[Any], bytes]:
+    from app.core.json_response import dump_json
+
+    return lambda value: dump_json(response_model, value)
+
+
+def measure(serialize: Callable[[Any], bytes], value: Any, repeat: int) -> float:
+    serialize(value)  # warm up adapters and schema caches
+    started = time.perf_counter()
+    for _ in range(repeat):
+        serialize(value)
+    return (time.perf_counter() - started) / repeat
+
+
+def main() -> int:
+    args = parse_args()
+    responses = {
+        "work queue": work_queue_response,
+        "clients": client_list_response,
+        "binders": binder_list_response,
+        "vat group items": vat_group_items_response,
+    }
+    print(f"{args.rows:,} rows per response, mean of {args.repeat} runs; ms per 1,000 rows")
+    print(f"{'response':<16} {'fastapi':>9} {'dump_json':>10} {'speedup':>8} {'KiB':>8}")
+    for name, build in responses.items():
+        value = build(args.rows)
+        response_model = type(value)
+        default, fast = fastapi_serialize(response_model), fast_serialize(response_model)
+        body = fast(value)
+        if json.loads(default(value)) != json.loads(body):
+            raise SystemExit(f"{name}: fast serializer output differs from FastAPI's")
+        per_thousand = 1000 / args.rows * 1000
+        default_ms = measure(default, value, args.repeat) * per_thousand
+        fast_ms = measure(fast, value, args.repeat) * per_thousand
+        print(
+            f"{name:<16} {default_ms:>9.2f} {fast_ms:>10.2f} {default_ms / fast_ms:>7.1f}x "
+            f"{len(body) / 1024:>8.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,110 @@
+"""Compare per-row and cached batch presigned URL generation for document lists.
+
+A document list page needs one download URL per row, each carrying the
+document's filename and type. This signs `--rows` documents `--pages` times
+(repeat views of the same list) three ways:
+
+- `per-row`:       `get_presigned_url` per row with no cache (the old path)
+- `batch, cold`:   `get_presigned_urls` with a fresh cache on every page
+- `batch, cached`: `get_presigned_urls` with one shared cache, as in the app
+
+Signing is local to boto3 (no request reaches S3), so the provider points at
+a fake endpoint with dummy credentials and nothing needs to run. Needs boto3.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+os.environ.setdefault("APP_ENV", "development")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark presigned URL generation.")
+    parser.add_argument("--rows", type=int, default=200, help="Documents per list page.")
+    parser.add_argument("--pages", type=int, default=50, help="Page views to sign.")
+    return parser.parse_args()
+
+
+def provider(url_cache):
+    from app.infrastructure.storage import S3StorageProvider
+
+    return S3StorageProvider(
+        access_key_id="bench",
+        secret_access_key="bench-secret",
+        bucket_name="bench-bucket",
+        endpoint_url="http://127.0.0.1:9",
+        region="auto",
+        url_cache=url_cache,
+    )
+
+
+def timed(page, pages: int) -> list[float]:
+    latencies = []
+    for _ in range(pages):
+        started = time.perf_counter()
+        page()
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def report(name: str, latencies: list[float], baseline: float | None) -> float:
+    total = sum(latencies)
+    speedup = f"  x{baseline / total:.1f}" if baseline else ""
+    print(
+        f"  {name:<14} p50 {statistics.median(latencies):>8.2f}ms/page  "
+        f"total {total:>9.1f}ms{speedup}"
+    )
+    return total
+
+
+def main() -> int:
+    args = parse_args()
+    try:
+        import boto3  # noqa: F401  # pylint: disable=unused-import
+    except ImportError:
+        print("boto3 is not installed — nothing to benchmark.")
+        return 1
+    from app.infrastructure.storage import PresignedDownload, PresignedUrlCache
+
+    downloads = [
+        PresignedDownload(
+            f"blobs/sha256/{i % 256:02x}/{i:064x}", f"מסמך {i}.pdf", "application/pdf"
+        )
+        for i in range(args.rows)
+    ]
+    uncached = provider(None)
+    cold_cache = PresignedUrlCache(max_entries=args.rows)
+    cold = provider(cold_cache)
+    cached = provider(PresignedUrlCache(max_entries=args.rows))
+
+    def per_row() -> None:
+        for download in downloads:
+            uncached.get_presigned_url(
+                download.key, filename=download.filename, content_type=download.content_type
+            )
+
+    def batch_cold() -> None:
+        cold_cache.clear()
+        cold.get_presigned_urls(downloads)
+
+    print(f"\n{args.rows} rows x {args.pages} pages")
+    baseline = report("per-row", timed(per_row, args.pages), None)
+    report("batch, cold", timed(batch_cold, args.pages), baseline)
+    report(
+        "batch, cached", timed(lambda: cached.get_presigned_urls(downloads), args.pages), baseline
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -98,7 +98,7 @@ def test_lifecycle_endpoints_return_final_contract(client, auth_token, test_db,
         "revert_ready_for_handover",
         "handover_to_client",
     ]
-    assert ready_data["notification"]["status"] in ("sent", "skipped", "failed", "blocked")
+    assert ready_data["notification"]["status"] in ("queued", "skipped", "blocked")
 
     handover_response = client.post(
         f"/api/v1/binders/{binder_id}/handover-to-client",
@@ -211,7 +211,7 @@ def test_mark_ready_for_handover_bulk_marks_matching_client_binders(
     data = bulk_ready.json()
     assert [item["binder"]["id"] for item in data] == [first_binder_id]
     assert data[0]["binder"]["location_status"] == "ready_for_handover"
-    assert data[0]["notification"]["status"] in ("sent", "skipped", "failed", "blocked")
+    assert data[0]["notification"]["status"] in ("queued", "skipped", "blocked")
 
     binders = client.get(
         f"/api/v1/binders?client_record_id={test_client.id}&location_status=ready_for_handover",
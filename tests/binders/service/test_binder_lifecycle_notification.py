@@ -41,7 +41,7 @@ def test_mark_ready_for_handover_returns_tuple(test_db, test_user):
     binder_out, notification = result
     assert binder_out.location_status == BinderLocationStatus.READY_FOR_HANDOVER
     assert isinstance(notification, NotificationResult)
-    assert notification.status in ("sent", "skipped", "failed", "blocked")
+    assert notification.status in ("queued", "skipped", "blocked")
 
 
 def test_mark_ready_for_handover_auto_send_called_with_correct_params(test_db, test_user, monkeypatch):
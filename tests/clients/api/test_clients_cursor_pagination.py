@@ -0,0 +1,89 @@
+from app.clients.enums import ClientStatus
+from tests.helpers.identity import seed_client_identity
+
+
+def _seed(test_db):
+    names = ["Dalet", "Alef", "Gimel", "Alef", "Bet"]
+    for i, name in enumerate(names):
+        seed_client_identity(test_db, full_name=name, id_number=f"CUR{i:03d}")
+    seed_client_identity(
+        test_db, full_name="Closed", id_number="CUR999", status=ClientStatus.CLOSED
+    )
+    return len(names) + 1
+
+
+def _walk(client, headers, url, params):
+    items, cursor, totals = [], None, []
+    while True:
+        query = {**params, "cursor": cursor} if cursor else params
+        response = client.get(url, headers=headers, params=query)
+        assert response.status_code == 200
+        data = response.json()
+        items.extend(data["items"])
+        totals.append(data["total"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            return items, totals
+
+
+def test_clients_list_cursor_walk_matches_page_order(client, advisor_headers, test_db):
+    count = _seed(test_db)
+    for sort_by, sort_order in [("full_name", "asc"), ("created_at", "desc"), ("status", "asc")]:
+        params = {"sort_by": sort_by, "sort_order": sort_order}
+        full = client.get(
+            "/api/v1/clients", headers=advisor_headers, params={**params, "page_size": 100}
+        ).json()
+        assert full["next_cursor"] is None
+
+        walked, totals = _walk(
+            client, advisor_headers, "/api/v1/clients", {**params, "page_size": 2}
+        )
+
+        assert [item["id"] for item in walked] == [item["id"] for item in full["items"]]
+        assert totals == [count] * 3
+
+
+def test_clients_page_two_still_works_and_hands_out_a_cursor(client, advisor_headers, test_db):
+    _seed(test_db)
+    page_two = client.get(
+        "/api/v1/clients", headers=advisor_headers, params={"page": 2, "page_size": 2}
+    ).json()
+    resumed = client.get(
+        "/api/v1/clients",
+        headers=advisor_headers,
+        params={"page_size": 2, "cursor": page_two["next_cursor"], "count": "estimated"},
+    ).json()
+    page_three = client.get(
+        "/api/v1/clients", headers=advisor_headers, params={"page": 3, "page_size": 2}
+    ).json()
+
+    assert page_two["page"] == 2
+    assert [item["id"] for item in resumed["items"]] == [item["id"] for item in page_three["items"]]
+    assert resumed["total"] == page_three["total"]
+
+
+def test_sidebar_cursor_walk_covers_every_client(client, advisor_headers, test_db):
+    count = _seed(test_db)
+
+    walked, _ = _walk(
+        client,
+        advisor_headers,
+        "/api/v1/clients/sidebar",
+        {"sort_by": "office_client_number", "sort_order": "desc", "page_size": 4},
+    )
+
+    numbers = [item["office_client_number"] for item in walked]
+    assert len(walked) == count
+    assert numbers == sorted(numbers, reverse=True)
+
+
+def test_invalid_or_foreign_cursor_is_rejected(client, advisor_headers, test_db):
+    _seed(test_db)
+    sidebar_cursor = client.get(
+        "/api/v1/clients/sidebar", headers=advisor_headers, params={"page_size": 1}
+    ).json()["next_cursor"]
+
+    for cursor in ["garbage", sidebar_cursor]:
+        response = client.get("/api/v1/clients", headers=advisor_headers, params={"cursor": cursor})
+        assert response.status_code == 400
+        assert response.json()["error"]["code"] == "PAGINATION.INVALID_CURSOR"
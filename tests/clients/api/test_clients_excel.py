@@ -2,9 +2,12 @@ import io
 
 from openpyxl import Workbook
 from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
 
 from app.clients.api import clients_excel as clients_excel_api
+from app.clients.constants import EXCEL_MEDIA_TYPE
 from app.clients.models.client_record import ClientRecord
+from app.clients.services.client_import_worker import ClientImportWorker
 
 IDEMPOTENCY_HEADER = {"X-Idempotency-Key": "clients-import-test-key"}
 
@@ -234,3 +237,44 @@ def test_import_clients_excel_requires_idempotency_key(client, advisor_headers):
 
     assert response.status_code == 400
     assert response.json()["error"]["message"] == "מפתח אידמפוטנטיות חובה"
+
+
+def test_import_job_is_queued_processed_and_polled(client, test_db, advisor_headers):
+    payload = _workbook_bytes(
+        [
+            ["full_name", "business_name", "id_number", "phone", "email"],
+            ["Job One", "Job One Business", "780000001", None, None],
+            ["Job Two", "Job Two Business", "780000001", None, None],
+        ]
+    )
+
+    submitted = client.post(
+        "/api/v1/clients/import/jobs",
+        headers={**advisor_headers, **IDEMPOTENCY_HEADER},
+        files={"file": ("clients.xlsx", payload, EXCEL_MEDIA_TYPE)},
+    )
+    assert submitted.status_code == 202
+    job = submitted.json()
+    assert (job["status"], job["total_rows"], job["filename"]) == ("queued", None, "clients.xlsx")
+
+    ClientImportWorker(
+        sessionmaker(bind=test_db.get_bind()), batch_size=50, lease_seconds=300, max_attempts=3
+    ).process_next()
+    test_db.expire_all()
+
+    polled = client.get(f"/api/v1/clients/import/jobs/{job['id']}", headers=advisor_headers)
+    assert polled.status_code == 200
+    body = polled.json()
+    assert body["status"] == "succeeded"
+    assert (body["total_rows"], body["processed_rows"], body["created_count"]) == (2, 2, 1)
+    assert [err["row"] for err in body["errors"]] == [3]
+
+
+def test_import_job_rejects_unreadable_file(client, advisor_headers):
+    response = client.post(
+        "/api/v1/clients/import/jobs",
+        headers={**advisor_headers, **IDEMPOTENCY_HEADER},
+        files={"file": ("bad.xlsx", b"not-an-excel", "application/octet-stream")},
+    )
+
+    assert response.status_code == 400
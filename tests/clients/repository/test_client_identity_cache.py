@@ -0,0 +1,99 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.clients.models.legal_entity import LegalEntity
+from app.clients.repositories.client_identity_cache import (
+    ClientIdentityCache,
+    client_identity_cache,
+)
+from app.clients.repositories.client_identity_loader import ClientIdentityLoader
+from app.clients.services.client_lifecycle_service import ClientLifecycleService
+from app.clients.services.client_update_service import ClientUpdateService
+from app.config import settings
+from tests.helpers.identity import seed_client_with_business
+from tests.helpers.query_counter import count_queries
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _identity(client_id: int):
+    return SimpleNamespace(client_record_id=client_id)
+
+
+@pytest.fixture
+def shared_cache(monkeypatch):
+    monkeypatch.setattr(settings, "CLIENT_IDENTITY_CACHE_ENABLED", True)
+    client_identity_cache.clear()
+    yield client_identity_cache
+    client_identity_cache.clear()
+
+
+def test_cache_evicts_least_recently_used_and_expired_entries():
+    clock = _Clock()
+    cache = ClientIdentityCache(max_entries=2, ttl_seconds=10, clock=clock)
+    cache.put_many([_identity(1), _identity(2)], generation=cache.generation)
+    cache.get_many([1])
+    cache.put_many([_identity(3)], generation=cache.generation)
+
+    assert set(cache.get_many([1, 2, 3])) == {1, 3}
+
+    clock.now = 10
+    assert cache.get_many([1, 3]) == {}
+    assert len(cache) == 0
+
+
+def test_cache_rejects_rows_read_before_an_invalidation():
+    cache = ClientIdentityCache(max_entries=10, ttl_seconds=10)
+    generation = cache.generation
+    cache.invalidate([1])
+    cache.put_many([_identity(1)], generation=generation)
+
+    assert cache.get_many([1]) == {}
+
+
+def test_shared_cache_serves_later_transactions(test_db, shared_cache):
+    client, _ = seed_client_with_business(test_db, full_name="Shared", id_number="410000001")
+    test_db.commit()
+
+    ClientIdentityLoader(test_db).load([client.id])
+    test_db.commit()  # drops the per-session memo
+    with count_queries(test_db) as statements:
+        identity = ClientIdentityLoader(test_db).get(client.id)
+
+    assert statements == []
+    assert identity.official_name == "Shared"
+
+
+def test_client_services_invalidate_shared_cache(test_db, test_user, shared_cache):
+    client, _ = seed_client_with_business(test_db, full_name="Before", id_number="410000002")
+    test_db.commit()
+    ClientIdentityLoader(test_db).load([client.id])
+    test_db.commit()
+
+    ClientUpdateService(test_db).update_client(client.id, actor_id=test_user.id, full_name="After")
+    test_db.commit()
+    assert ClientIdentityLoader(test_db).get(client.id).official_name == "After"
+    test_db.commit()
+
+    ClientLifecycleService(test_db).delete_client(client.id, actor_id=test_user.id)
+    test_db.commit()
+    assert ClientIdentityLoader(test_db).get(client.id) is None
+
+
+def test_uncommitted_identity_never_reaches_shared_cache(test_db, shared_cache):
+    client, _ = seed_client_with_business(test_db, full_name="Committed", id_number="410000003")
+    test_db.commit()
+
+    test_db.get(LegalEntity, client.legal_entity_id).official_name = "Rolled back"
+    test_db.flush()
+    assert ClientIdentityLoader(test_db).get(client.id).official_name == "Rolled back"
+    test_db.rollback()
+
+    assert ClientIdentityLoader(test_db).get(client.id).official_name == "Committed"
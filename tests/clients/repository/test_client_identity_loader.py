@@ -0,0 +1,81 @@
+from datetime import date, timedelta
+
+from app.clients.models.client_record import ClientRecord
+from app.clients.models.legal_entity import LegalEntity
+from app.clients.repositories.client_identity_loader import ClientIdentityLoader
+from app.utils.time_utils import utcnow
+from tests.helpers.identity import seed_business, seed_client_with_business
+from tests.helpers.query_counter import count_queries
+
+
+def _clients(db, count: int):
+    return [
+        seed_client_with_business(
+            db,
+            full_name=f"Identity Client {i}",
+            id_number=f"{300000000 + i:09d}",
+            business_name=f"Identity Shop {i}",
+            office_client_number=1000 + i,
+        )
+        for i in range(count)
+    ]
+
+
+def test_load_fetches_a_batch_in_one_query_and_memoises(test_db):
+    seeded = _clients(test_db, 5)
+    test_db.commit()
+    ids = [client.id for client, _ in seeded]
+
+    with count_queries(test_db) as first:
+        identities = ClientIdentityLoader(test_db).load(ids)
+    with count_queries(test_db) as second:
+        again = ClientIdentityLoader(test_db).load(ids[:3])
+
+    assert len(first) == 1
+    assert second == []
+    assert identities[ids[0]].office_client_number == 1000
+    assert identities[ids[0]].official_name == "Identity Client 0"
+    assert identities[ids[0]].display_name == "Identity Client 0"
+    assert set(again) == set(ids[:3])
+
+
+def test_memo_is_dropped_when_identity_changes_or_transaction_ends(test_db):
+    (client, _), = _clients(test_db, 1)
+    loader = ClientIdentityLoader(test_db)
+    assert loader.get(client.id).official_name == "Identity Client 0"
+
+    test_db.get(LegalEntity, client.legal_entity_id).official_name = "Renamed"
+    test_db.flush()
+    assert loader.get(client.id).official_name == "Renamed"
+
+    test_db.commit()
+    with count_queries(test_db) as statements:
+        loader.get(client.id)
+    assert len(statements) == 1
+
+
+def test_deleted_and_unknown_ids_are_skipped(test_db):
+    (live, _), (deleted, _) = _clients(test_db, 2)
+    test_db.get(ClientRecord, deleted.id).deleted_at = utcnow()
+    test_db.flush()
+    loader = ClientIdentityLoader(test_db)
+
+    assert set(loader.load([live.id, deleted.id, 999_999])) == {live.id}
+    assert set(loader.load([deleted.id], include_deleted=True)) == {deleted.id}
+
+
+def test_businesses_by_id_and_primary_per_legal_entity(test_db):
+    (client, first), = _clients(test_db, 1)
+    first.opened_at = date.today() - timedelta(days=30)
+    later = seed_business(test_db, legal_entity_id=client.legal_entity_id, business_name="")
+    loader = ClientIdentityLoader(test_db)
+
+    with count_queries(test_db) as statements:
+        businesses = loader.load_businesses([first.id, later.id, None])
+        primary = loader.load_primary_businesses([client.legal_entity_id])
+
+    assert len(statements) == 2
+    assert businesses[first.id].full_name == "Identity Shop 0"
+    # A blank business name falls back to the legal entity's official name.
+    assert businesses[later.id].full_name == "Identity Client 0"
+    assert primary[client.legal_entity_id].business_id == first.id
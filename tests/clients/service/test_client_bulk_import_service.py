@@ -0,0 +1,254 @@
+import json
+from datetime import date
+
+from sqlalchemy import func, select
+
+from app.advance_payments.models.advance_payment import AdvancePayment
+from app.annual_reports.models.annual_report_model import AnnualReport
+from app.annual_reports.models.annual_report_schedule_entry import AnnualReportScheduleEntry
+from app.annual_reports.models.annual_report_status_history import AnnualReportStatusHistory
+from app.audit.models.entity_audit_log import EntityAuditLog
+from app.binders.models.binder import Binder
+from app.binders.models.binder_lifecycle_log import BinderLifecycleLog
+from app.businesses.models.business import Business
+from app.clients.models.client_record import ClientRecord
+from app.clients.services.client_bulk_import_service import ClientBulkImportService
+from app.clients.services.client_excel_service import ClientImportRow
+from app.clients.services.create_client_service import CreateClientService
+from app.common.enums import AdvancePaymentFrequency, EntityType, IdNumberType, VatType
+from app.tax_calendar.models.tax_calendar_entry import TaxCalendarEntry
+from app.vat_reports.models.vat_audit_log import VatAuditLog
+from app.vat_reports.models.vat_work_item import VatWorkItem
+
+REFERENCE_DATE = date(2026, 4, 30)
+
+
+def _row(row: int, id_number: str, **overrides) -> ClientImportRow:
+    values = {
+        "row": row,
+        "full_name": f"Bulk Client {id_number}",
+        "business_name": f"Bulk Business {id_number}",
+        "id_number": id_number,
+        "id_number_type": IdNumberType.INDIVIDUAL,
+        "entity_type": EntityType.OSEK_MURSHE,
+        "vat_reporting_frequency": VatType.MONTHLY,
+        "advance_payment_frequency": AdvancePaymentFrequency.BIMONTHLY,
+        "phone": None,
+        "email": None,
+    }
+    values.update(overrides)
+    return ClientImportRow(**values)
+
+
+def _graph(db, client_record_id: int) -> dict:
+    reports = select(AnnualReport.id).where(AnnualReport.client_record_id == client_record_id)
+    binders = select(Binder.id).where(Binder.client_record_id == client_record_id)
+    work_items = select(VatWorkItem.id).where(VatWorkItem.client_record_id == client_record_id)
+
+    def count(model, *criteria):
+        return db.scalar(select(func.count()).select_from(model).where(*criteria))
+
+    return {
+        "binders": db.scalars(
+            select(Binder.binder_number).where(Binder.client_record_id == client_record_id)
+        ).all(),
+        "binder_logs": count(BinderLifecycleLog, BinderLifecycleLog.binder_id.in_(binders)),
+        "reports": count(AnnualReport, AnnualReport.client_record_id == client_record_id),
+        "schedules": count(
+            AnnualReportScheduleEntry, AnnualReportScheduleEntry.annual_report_id.in_(reports)
+        ),
+        "report_history": count(
+            AnnualReportStatusHistory, AnnualReportStatusHistory.annual_report_id.in_(reports)
+        ),
+        "vat_items": count(VatWorkItem, VatWorkItem.client_record_id == client_record_id),
+        "vat_audit": count(VatAuditLog, VatAuditLog.work_item_id.in_(work_items)),
+        "payments": count(AdvancePayment, AdvancePayment.client_record_id == client_record_id),
+        "report_audit": count(
+            EntityAuditLog,
+            EntityAuditLog.entity_type == "annual_report",
+            EntityAuditLog.entity_id.in_(reports),
+        ),
+        "client_audit": count(
+            EntityAuditLog,
+            EntityAuditLog.entity_type == "client",
+            EntityAuditLog.entity_id == client_record_id,
+        ),
+    }
+
+
+def test_bulk_import_matches_single_client_onboarding(test_db, test_user):
+    single, _business = CreateClientService(test_db).create_client(
+        **_row(2, "700000001").create_kwargs(),
+        actor_id=test_user.id,
+        reference_date=REFERENCE_DATE,
+    )
+
+    service = ClientBulkImportService(test_db, reference_date=REFERENCE_DATE)
+    created = service.import_rows(
+        [_row(3, "700000002"), _row(4, "700000003")], actor_id=test_user.id
+    )
+    test_db.commit()
+
+    assert len(created) == 2
+    expected = _graph(test_db, single.id)
+    assert expected["vat_items"] and expected["payments"] and expected["schedules"]
+    for client_record_id in created:
+        graph = _graph(test_db, client_record_id)
+        record = test_db.get(ClientRecord, client_record_id)
+        assert graph["binders"] == [f"{record.office_client_number}/1"]
+        assert {key: value for key, value in graph.items() if key != "binders"} == {
+            key: value for key, value in expected.items() if key != "binders"
+        }
+        business = test_db.scalar(
+            select(Business).where(Business.legal_entity_id == record.legal_entity_id)
+        )
+        assert business.business_name.startswith("Bulk Business")
+
+    numbers = test_db.scalars(select(ClientRecord.office_client_number)).all()
+    assert len(set(numbers)) == 3
+
+
+def _side_effects(db, client_record_id: int) -> dict:
+    """The onboarding rows written for a client, without ids or per-client values."""
+    reports = select(AnnualReport.id).where(AnnualReport.client_record_id == client_record_id)
+    binders = select(Binder.id).where(Binder.client_record_id == client_record_id)
+    work_items = select(VatWorkItem.id).where(VatWorkItem.client_record_id == client_record_id)
+    per_client = {"full_name", "id_number", "office_client_number", "client_record_id"}
+
+    def audit(entity_type, *criteria):
+        values = db.scalars(
+            select(EntityAuditLog.new_value).where(
+                EntityAuditLog.entity_type == entity_type, *criteria
+            )
+        )
+        return sorted(
+            json.dumps(
+                {k: v for k, v in json.loads(value).items() if k not in per_client},
+                sort_keys=True,
+            )
+            for value in values
+        )
+
+    return {
+        "binder_logs": db.execute(
+            select(
+                BinderLifecycleLog.field_name,
+                BinderLifecycleLog.old_value,
+                BinderLifecycleLog.new_value,
+                BinderLifecycleLog.notes,
+            )
+            .where(BinderLifecycleLog.binder_id.in_(binders))
+            .order_by(BinderLifecycleLog.field_name)
+        ).all(),
+        "reports": db.execute(
+            select(
+                AnnualReport.tax_year,
+                AnnualReport.form_type,
+                AnnualReport.status,
+                AnnualReport.filing_deadline,
+                AnnualReport.tax_calendar_entry_id,
+            )
+            .where(AnnualReport.client_record_id == client_record_id)
+            .order_by(AnnualReport.tax_year)
+        ).all(),
+        "schedules": db.execute(
+            select(AnnualReport.tax_year, AnnualReportScheduleEntry.schedule)
+            .join(AnnualReport, AnnualReport.id == AnnualReportScheduleEntry.annual_report_id)
+            .where(AnnualReportScheduleEntry.annual_report_id.in_(reports))
+            .order_by(AnnualReport.tax_year, AnnualReportScheduleEntry.schedule)
+        ).all(),
+        "report_history": db.execute(
+            select(
+                AnnualReport.tax_year,
+                AnnualReportStatusHistory.from_status,
+                AnnualReportStatusHistory.to_status,
+                AnnualReportStatusHistory.note,
+            )
+            .join(AnnualReport, AnnualReport.id == AnnualReportStatusHistory.annual_report_id)
+            .where(AnnualReportStatusHistory.annual_report_id.in_(reports))
+            .order_by(AnnualReport.tax_year)
+        ).all(),
+        "vat_items": db.execute(
+            select(
+                VatWorkItem.period,
+                VatWorkItem.status,
+                VatWorkItem.pending_materials_note,
+                VatWorkItem.tax_calendar_entry_id,
+                VatWorkItem.due_date_effective,
+            )
+            .where(VatWorkItem.client_record_id == client_record_id)
+            .order_by(VatWorkItem.period)
+        ).all(),
+        "vat_audit": db.execute(
+            select(VatAuditLog.action, VatAuditLog.new_value)
+            .where(VatAuditLog.work_item_id.in_(work_items))
+            .order_by(VatAuditLog.new_value)
+        ).all(),
+        "payments": db.execute(
+            select(
+                AdvancePayment.period,
+                AdvancePayment.period_months_count,
+                AdvancePayment.due_date,
+                AdvancePayment.expected_amount,
+                AdvancePayment.status,
+                AdvancePayment.tax_calendar_entry_id,
+            )
+            .where(AdvancePayment.client_record_id == client_record_id)
+            .order_by(AdvancePayment.period)
+        ).all(),
+        "client_audit": audit("client", EntityAuditLog.entity_id == client_record_id),
+        "report_audit": audit("annual_report", EntityAuditLog.entity_id.in_(reports)),
+    }
+
+
+def test_bulk_import_writes_the_same_side_effects_as_single_create(test_db, test_user):
+    single, _business = CreateClientService(test_db).create_client(
+        **_row(2, "700000031").create_kwargs(),
+        actor_id=test_user.id,
+        reference_date=REFERENCE_DATE,
+    )
+    (imported,) = ClientBulkImportService(test_db, reference_date=REFERENCE_DATE).import_rows(
+        [_row(3, "700000032")], actor_id=test_user.id
+    )
+    test_db.commit()
+
+    expected = _side_effects(test_db, single.id)
+    assert all(expected.values())
+    assert _side_effects(test_db, imported) == expected
+
+
+def test_bulk_import_resolves_each_calendar_period_once(test_db, test_user):
+    calendar = {}
+    first = ClientBulkImportService(test_db, reference_date=REFERENCE_DATE, calendar=calendar)
+    first.import_rows([_row(2, "700000011")], actor_id=test_user.id)
+    resolved = dict(calendar)
+    entries = test_db.scalar(select(func.count()).select_from(TaxCalendarEntry))
+
+    second = ClientBulkImportService(test_db, reference_date=REFERENCE_DATE, calendar=calendar)
+    second.import_rows([_row(3, "700000012"), _row(4, "700000013")], actor_id=test_user.id)
+
+    assert calendar == resolved
+    assert test_db.scalar(select(func.count()).select_from(TaxCalendarEntry)) == entries
+
+
+def test_bulk_import_validate_reports_conflicts_and_duplicates(test_db, test_user):
+    CreateClientService(test_db).create_client(
+        **_row(2, "700000021").create_kwargs(), actor_id=test_user.id
+    )
+    deleted, _ = CreateClientService(test_db).create_client(
+        **_row(3, "700000022").create_kwargs(), actor_id=test_user.id
+    )
+    deleted.deleted_at = deleted.created_at
+    test_db.flush()
+
+    rows = [
+        _row(2, "700000021"),
+        _row(3, "700000022"),
+        _row(4, "700000023"),
+        _row(5, "700000023"),
+    ]
+    accepted, errors = ClientBulkImportService(test_db).validate(rows)
+
+    assert [row.row for row in accepted] == [4]
+    assert [error["row"] for error in errors] == [2, 3, 5]
+    assert "נמחק" in errors[1]["error"]
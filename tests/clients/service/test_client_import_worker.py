@@ -0,0 +1,126 @@
+import io
+from datetime import timedelta
+
+from openpyxl import Workbook
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.clients.models.client_import_job import ClientImportJob
+from app.clients.models.client_record import ClientRecord
+from app.clients.repositories.client_import_job_repository import ClientImportJobRepository
+from app.clients.services.client_bulk_import_service import ClientBulkImportService
+from app.clients.services.client_import_worker import ClientImportWorker
+from app.utils.time_utils import utcnow
+
+HEADER = ["full_name", "business_name", "id_number", "phone", "email"]
+
+
+def _workbook_bytes(rows: list[list[str | None]]) -> bytes:
+    wb = Workbook()
+    ws = wb.active
+    ws.append(HEADER)
+    for row in rows:
+        ws.append(row)
+    bio = io.BytesIO()
+    wb.save(bio)
+    return bio.getvalue()
+
+
+def _client_row(id_number: str) -> list[str]:
+    return [f"Import {id_number}", f"Import Business {id_number}", id_number, "", ""]
+
+
+def _queue(test_db, test_user, rows, **fields) -> int:
+    job = ClientImportJobRepository(test_db).create(
+        filename="clients.xlsx", contents=_workbook_bytes(rows), requested_by=test_user.id
+    )
+    for name, value in fields.items():
+        setattr(job, name, value)
+    test_db.commit()
+    return job.id
+
+
+def _worker(test_db, **overrides) -> ClientImportWorker:
+    options = {"batch_size": 2, "lease_seconds": 300, "max_attempts": 3, **overrides}
+    return ClientImportWorker(sessionmaker(bind=test_db.get_bind()), **options)
+
+
+def _client_count(test_db) -> int:
+    return test_db.scalar(select(func.count()).select_from(ClientRecord))
+
+
+def test_worker_imports_in_batches_and_reports_row_errors(test_db, test_user):
+    job_id = _queue(
+        test_db,
+        test_user,
+        [
+            _client_row("720000001"),
+            ["", "No Name Business", "720000002", "", ""],
+            _client_row("720000003"),
+            _client_row("720000001"),
+            [None, None, None, None, None],
+            _client_row("720000004"),
+        ],
+    )
+
+    assert _worker(test_db).process_next() == 1
+
+    test_db.expire_all()
+    job = test_db.get(ClientImportJob, job_id)
+    assert job.status == "succeeded"
+    assert (job.total_rows, job.processed_rows, job.created_count) == (5, 5, 3)
+    assert [error["row"] for error in job.errors] == [3, 5]
+    assert job.contents is None
+    assert _client_count(test_db) == 3
+    assert _worker(test_db).process_next() == 0
+
+
+def test_worker_retries_failed_batch_row_by_row(test_db, test_user, monkeypatch):
+    def _fail(self, rows, *, actor_id):
+        raise RuntimeError("batch insert failed")
+
+    monkeypatch.setattr(ClientBulkImportService, "import_rows", _fail)
+    job_id = _queue(test_db, test_user, [_client_row("720000011"), _client_row("720000012")])
+
+    _worker(test_db).process_next()
+
+    test_db.expire_all()
+    job = test_db.get(ClientImportJob, job_id)
+    assert (job.status, job.created_count, job.errors) == ("succeeded", 2, [])
+    assert _client_count(test_db) == 2
+
+
+def test_worker_resumes_after_last_committed_row(test_db, test_user):
+    job_id = _queue(
+        test_db,
+        test_user,
+        [_client_row("720000021"), ["", "", "720000022", "", ""], _client_row("720000023")],
+        status="running",
+        attempts=1,
+        locked_until=utcnow() - timedelta(minutes=1),
+        total_rows=3,
+        last_row=3,
+        processed_rows=2,
+        created_count=1,
+        errors=[{"row": 3, "error": "earlier attempt"}],
+    )
+
+    _worker(test_db).process_next()
+
+    test_db.expire_all()
+    job = test_db.get(ClientImportJob, job_id)
+    assert (job.status, job.processed_rows, job.created_count) == ("succeeded", 3, 2)
+    assert job.errors == [{"row": 3, "error": "earlier attempt"}]
+    assert _client_count(test_db) == 1
+
+
+def test_worker_gives_up_after_max_attempts(test_db, test_user):
+    job_id = _queue(test_db, test_user, [_client_row("720000031")], attempts=3)
+
+    _worker(test_db, max_attempts=3).process_next()
+
+    test_db.expire_all()
+    job = test_db.get(ClientImportJob, job_id)
+    assert job.status == "failed"
+    assert "3" in job.error
+    assert _client_count(test_db) == 0
@@ -35,3 +35,7 @@ def test_list_all_clients_returns_only_active_sorted(test_db):
     items = ClientQueryService(test_db).list_all_clients()
 
     assert [c.id for c in items] == [a.id, b.id]
+
+    streamed = list(ClientQueryService(test_db).iter_all_clients())
+
+    assert streamed == items
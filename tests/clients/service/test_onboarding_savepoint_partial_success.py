@@ -47,7 +47,7 @@ def test_best_effort_year1_persists_when_year2_fails(test_db):
     so year-1 AnnualReport survives. result.errors records the failed year.
     """
     client_id = _client(test_db, "SP-TEST-001")
-    # December reference_date → _years_to_generate returns [year, year+1]
+    # December reference_date → years_to_generate returns [year, year+1]
     reference_date = date(2025, 12, 31)
 
     patched = _fail_on_second_call(AnnualReportCreateService.create_report)
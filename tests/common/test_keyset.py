@@ -0,0 +1,79 @@
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from app.binders.models.binder import Binder, BinderCapacityStatus, BinderLocationStatus
+from app.binders.repositories.binder_repository import BinderRepository
+from app.common.repositories.keyset import decode_cursor, encode_cursor
+from app.core.exceptions import AppError
+from tests.helpers.identity import seed_client_identity
+
+
+def test_cursor_round_trips_sort_values():
+    values = (date(2026, 1, 31), datetime(2026, 2, 1, 8, 30), Decimal("10.50"), None, "x", 7)
+
+    token = encode_cursor("binders:period_start:desc", values)
+
+    assert "=" not in token
+    assert decode_cursor(token, "binders:period_start:desc", len(values)) == values
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        encode_cursor("charges", (1,)),
+        encode_cursor("binders:period_start:asc", (None, 1)),
+        encode_cursor("binders:period_start:desc", (1,)),
+        "not-a-cursor",
+        "",
+    ],
+)
+def test_cursor_from_another_list_or_sort_is_rejected(token):
+    with pytest.raises(AppError) as exc_info:
+        decode_cursor(token, "binders:period_start:desc", 2)
+
+    assert exc_info.value.code == "PAGINATION.INVALID_CURSOR"
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "sort_by,sort_dir",
+    [("period_start", "desc"), ("days_in_office", "desc"), ("client_name", "asc")],
+)
+def test_cursor_walk_matches_offset_order_with_nulls_and_ties(
+    test_db, test_user, sort_by, sort_dir
+):
+    alpha = seed_client_identity(test_db, full_name="Alpha", id_number="KS001")
+    beta = seed_client_identity(test_db, full_name="Beta", id_number="KS002")
+    start = date(2026, 1, 1)
+    periods = [start, start, None, start + timedelta(days=3), None, start - timedelta(days=9)]
+    for i, period_start in enumerate(periods):
+        test_db.add(
+            Binder(
+                client_record_id=(alpha if i % 2 else beta).id,
+                binder_number=f"KS-{i}",
+                period_start=period_start,
+                location_status=BinderLocationStatus.IN_OFFICE,
+                capacity_status=BinderCapacityStatus.OPEN,
+                created_by=test_user.id,
+            )
+        )
+    test_db.commit()
+    repo = BinderRepository(test_db)
+    kwargs = {"sort_by": sort_by, "sort_dir": sort_dir}
+
+    expected, total, _ = repo.list_active_paginated_projected(**kwargs, page_size=100)
+    walked, cursor, pages = [], None, 0
+    while True:
+        rows, _, cursor = repo.list_active_paginated_projected(
+            **kwargs, page_size=4 if pages == 0 else 1, cursor=cursor, count_mode="none"
+        )
+        walked.extend(rows)
+        pages += 1
+        if cursor is None:
+            break
+
+    assert total == len(periods)
+    assert [row.id for row in walked] == [row.id for row in expected]
+    assert pages == 3
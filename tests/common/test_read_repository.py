@@ -0,0 +1,87 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+import app.common.repositories.read_repository as read_repository
+from app.clients.models.client_record import ClientRecord
+from app.core.logging_config import (
+    begin_request_log_stats,
+    clear_request_log_stats,
+    set_actor_context,
+)
+from app.database import PrimarySession
+
+
+@pytest.fixture
+def replica(monkeypatch, tmp_path):
+    primary_engine = create_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+    replica_engine = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    with primary_engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+    monkeypatch.setattr(read_repository, "read_engine", replica_engine)
+    monkeypatch.setattr(read_repository, "ReadSessionLocal", sessionmaker(bind=replica_engine))
+    monkeypatch.setattr(read_repository, "_replica_checked_at", float("-inf"))
+    monkeypatch.setattr(read_repository, "_pinned_until", {})
+    db = PrimarySession(bind=primary_engine)
+    yield db
+    db.close()
+    primary_engine.dispose()
+    replica_engine.dispose()
+
+
+def test_clean_primary_session_reads_from_the_replica(replica):
+    routed = read_repository.read_session(replica)
+
+    assert routed is not replica
+    assert routed.get_bind() is read_repository.read_engine
+    assert read_repository.read_session(replica) is routed
+
+
+def test_closing_the_primary_session_closes_the_replica_session(replica):
+    routed = read_repository.read_session(replica)
+    routed.execute(text("SELECT 1"))
+
+    replica.close()
+
+    assert not routed.in_transaction()
+    assert read_repository.read_session(replica) is not routed
+
+
+def test_pending_and_flushed_writes_pin_reads_to_the_primary(replica):
+    replica.add(ClientRecord(legal_entity_id=1))
+    assert read_repository.read_session(replica) is replica
+
+    replica.expunge_all()
+    replica.info["wrote"] = True  # set by the after_flush / bulk-write hooks
+    assert read_repository.read_session(replica) is replica
+
+
+def test_plain_sessions_are_never_routed(replica):
+    plain = sessionmaker(bind=replica.get_bind())()
+    try:
+        assert read_repository.read_session(plain) is plain
+    finally:
+        plain.close()
+
+
+def test_committed_write_pins_the_actor_to_the_primary(replica, monkeypatch):
+    monkeypatch.setattr(read_repository.settings, "DB_READ_REPLICA_PIN_SECONDS", 60.0)
+    begin_request_log_stats()
+    try:
+        set_actor_context(user_id=7, role="advisor")
+        replica.info["wrote"] = True
+        replica.commit()
+        replica.info.pop("wrote")
+
+        assert read_repository.read_session(replica) is replica
+
+        set_actor_context(user_id=8, role="advisor")
+        assert read_repository.read_session(replica) is not replica
+    finally:
+        clear_request_log_stats()
+
+
+def test_unreachable_replica_falls_back_to_the_primary(replica, monkeypatch):
+    monkeypatch.setattr(read_repository, "_probe_replica", lambda: False)
+
+    assert read_repository.read_session(replica) is replica
@@ -4,11 +4,16 @@ from datetime import date
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
 
 os.environ.setdefault("APP_ENV", "test")
 os.environ.setdefault("JWT_SECRET", "test-secret")
+os.environ.setdefault("NOTIFICATION_OUTBOX_WORKER_ENABLED", "false")
+os.environ.setdefault("JOB_RUNNER_ENABLED", "false")
+os.environ.setdefault("EXPORT_WORKER_ENABLED", "false")
+os.environ.setdefault("CLIENT_IMPORT_WORKER_ENABLED", "false")
 
 import app.core.background_jobs as background_jobs_module
 import app.main as main_module
@@ -26,9 +31,18 @@ from app.clients.models.person_legal_entity_link import PersonLegalEntityLink  #
 from app.common.enums import IdNumberType
 from sqlalchemy import select
 
-from app.database import Base, get_db
+from app.config import settings
+from app.database import (
+    Base,
+    ConcurrentReads,
+    SerialReads,
+    async_database_url,
+    finish_request_stats,
+    get_db,
+)
 from app.tax_calendar.models.deadline_rule import DeadlineRule
 from app.tax_calendar.services.bootstrap import seed_default_deadline_rules
+from app.users.api.deps import get_reads
 from app.users.models.user import User, UserRole
 from app.users.services.auth_service import AuthService
 from app.users.services.token_service import generate_access_token
@@ -67,12 +81,24 @@ def _ensure_client_identity_graph(session, client) -> None:
     client.legal_entity_id = seeded.legal_entity_id
 
 
+@pytest.fixture(autouse=True)
+def local_storage_path(tmp_path, monkeypatch):
+    """Keep files written through the default LocalStorageProvider out of ./storage."""
+    monkeypatch.setattr(settings, "LOCAL_STORAGE_PATH", str(tmp_path / "storage"))
+
+
+@pytest.fixture(scope="function")
+def test_db_url():
+    """In memory; a module overrides it with a file URL when async engines must share the data."""
+    return "sqlite:///:memory:"
+
+
 @pytest.fixture(scope="function")
-def test_db():
+def test_db(test_db_url):
     """Create test database with proper SQLite threading config."""
     # Use StaticPool and check_same_thread=False for SQLite in tests
     engine = create_engine(
-        "sqlite:///:memory:",
+        test_db_url,
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
         echo=False,
@@ -135,9 +161,11 @@ def client(test_db):
         try:
             yield test_db
         finally:
-            pass
+            finish_request_stats()
 
     main_module.app.dependency_overrides[get_db] = override_get_db
+    # Concurrent reads would open their own connections and miss the uncommitted test data.
+    main_module.app.dependency_overrides[get_reads] = lambda: SerialReads(test_db)
     original_expire = background_jobs_module.expire_overdue_requests
     background_jobs_module.expire_overdue_requests = lambda repo: 0
 
@@ -148,6 +176,19 @@ def client(test_db):
     background_jobs_module.expire_overdue_requests = original_expire
 
 
+@pytest.fixture(scope="function")
+def concurrent_reads(client, test_db_url):
+    """Serve `DBReads` through ConcurrentReads on aiosqlite, as in production.
+
+    Needs a file `test_db_url` and committed fixture data: every read opens its
+    own connection.
+    """
+    engine = create_async_engine(async_database_url(test_db_url), poolclass=NullPool)
+    sessions = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+    main_module.app.dependency_overrides[get_reads] = lambda: ConcurrentReads(sessions)
+    return sessions
+
+
 @pytest.fixture(scope="function")
 def test_user(test_db):
     """Create test user."""
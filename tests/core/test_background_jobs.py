@@ -1,51 +1,33 @@
-import pytest
-
 from app.core import background_jobs
 
 
-class _FakeSession:
-    def __init__(self):
-        self.committed = False
-        self.rolled_back = False
-        self.closed = False
-
-    def commit(self):
-        self.committed = True
-
-    def rollback(self):
-        self.rolled_back = True
+def test_job_registry_keeps_reminder_firing_behind_its_flag(monkeypatch):
+    monkeypatch.setattr(background_jobs.settings, "REMINDER_FIRING_JOB_ENABLED", False)
+    names = {job.name for job in background_jobs.build_job_registry()}
+    assert names == {
+        "dashboard_snapshot_refresh",
+        "document_blob_gc",
+        "export_cleanup",
+        "signature_request_expiry",
+        "tax_calendar_materialization",
+        "vat_totals_reconciliation",
+        "work_queue_rebucket",
+    }
 
-    def close(self):
-        self.closed = True
+    monkeypatch.setattr(background_jobs.settings, "REMINDER_FIRING_JOB_ENABLED", True)
+    names = {job.name for job in background_jobs.build_job_registry()}
+    assert "reminder_firing" in names
 
 
-def test_run_startup_expiry_commits_expired_requests(monkeypatch):
-    session = _FakeSession()
-
-    monkeypatch.setattr(background_jobs, "SessionLocal", lambda: session)
+def test_expiry_task_reports_expired_count(monkeypatch):
     monkeypatch.setattr(background_jobs, "SignatureRequestRepository", lambda db: db)
     monkeypatch.setattr(background_jobs, "expire_overdue_requests", lambda repo: 3)
 
-    background_jobs.run_startup_expiry()
-
-    assert session.committed is True
-    assert session.rolled_back is False
-    assert session.closed is True
+    assert background_jobs._expiry_task(object()) == {"expired": 3}
 
 
-def test_run_startup_expiry_rolls_back_on_failure(monkeypatch):
-    session = _FakeSession()
-
-    def fail(_repo):
-        raise RuntimeError("expiry failed")
-
-    monkeypatch.setattr(background_jobs, "SessionLocal", lambda: session)
-    monkeypatch.setattr(background_jobs, "SignatureRequestRepository", lambda db: db)
-    monkeypatch.setattr(background_jobs, "expire_overdue_requests", fail)
-
-    with pytest.raises(RuntimeError, match="expiry failed"):
-        background_jobs.run_startup_expiry()
+def test_tax_calendar_materialization_task_returns_counters(test_db):
+    result = background_jobs._tax_calendar_materialization_task(test_db)
 
-    assert session.committed is False
-    assert session.rolled_back is True
-    assert session.closed is True
+    assert result["start_year"] <= result["end_year"]
+    assert {"entries_created", "entries_skipped"} <= result.keys()
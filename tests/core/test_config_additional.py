@@ -208,3 +208,26 @@ def test_login_rate_limit_is_relaxed_in_test_env(monkeypatch):
     s = Settings(APP_ENV="test", JWT_SECRET="secret")
 
     assert s.AUTH_LOGIN_RATE_LIMIT == "10000/minute"
+
+
+@pytest.mark.parametrize(("env", "mode"), [("test", "raise"), ("production", "warn")])
+def test_query_budgets_fail_only_in_test_env(env, mode, monkeypatch):
+    monkeypatch.delenv("PERF_QUERY_BUDGET_MODE", raising=False)
+
+    s = Settings(
+        APP_ENV=env,
+        JWT_SECRET="secret",
+        DATABASE_URL=_REMOTE_DB,
+        CORS_ALLOWED_ORIGINS="https://crm.example.com",
+        LOG_FORMAT="json",
+    )
+
+    assert s.PERF_QUERY_BUDGET_MODE == mode
+
+
+def test_dashboard_snapshot_staleness_keeps_its_default_in_test_env(monkeypatch):
+    monkeypatch.delenv("DASHBOARD_SNAPSHOT_MAX_STALENESS_SECONDS", raising=False)
+
+    s = Settings(APP_ENV="test", JWT_SECRET="secret")
+
+    assert s.DASHBOARD_SNAPSHOT_MAX_STALENESS_SECONDS == 120
@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+import app.database as database
+from app.database import ConcurrentReads, SerialReads, async_database_url
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("postgresql://u:p@db:5432/crm", "postgresql+asyncpg://u:p@db:5432/crm"),
+        ("postgresql+psycopg2://u:p@db/crm", "postgresql+asyncpg://u:p@db/crm"),
+        ("postgresql://u:p@db/crm?sslmode=require", "postgresql+asyncpg://u:p@db/crm?ssl=require"),
+        ("sqlite:///./crm.db", "sqlite+aiosqlite:///./crm.db"),
+        ("sqlite://", None),
+        ("sqlite:///:memory:", None),
+        ("mysql://u:p@db/crm", None),
+    ],
+)
+def test_async_database_url(url, expected):
+    assert async_database_url(url) == expected
+
+
+def test_async_engine_is_created_on_first_use_and_disposed(monkeypatch, tmp_path):
+    monkeypatch.setattr(database, "_async_url", f"sqlite+aiosqlite:///{tmp_path / 'lazy.db'}")
+    monkeypatch.setattr(database, "_async_read_url", None)
+    monkeypatch.setattr(database, "_async_sessionmakers", {})
+
+    sessions = database.async_sessions()
+
+    assert database.async_sessions() is sessions
+    assert database.async_read_sessions() is None
+    assert list(database._async_sessionmakers) == [database._async_url]
+    asyncio.run(database.dispose_async_engines())
+    assert database._async_sessionmakers == {}
+
+
+def test_concurrent_reads_run_each_read_on_its_own_connection(tmp_path):
+    async def scenario():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'reads.db'}")
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, kind TEXT)"))
+            await conn.execute(text("INSERT INTO items (kind) VALUES ('a'), ('a'), ('b')"))
+        connections = []
+
+        def count(kind):
+            def read(db):
+                connections.append(id(db.connection().connection.dbapi_connection))
+                return db.scalar(text("SELECT count(*) FROM items WHERE kind = :k"), {"k": kind})
+
+            return read
+
+        try:
+            reads = ConcurrentReads(async_sessionmaker(engine))
+            return await reads.gather(count("a"), count("b"), count("c")), connections
+        finally:
+            await engine.dispose()
+
+    results, connections = asyncio.run(scenario())
+
+    assert results == [2, 1, 0]
+    assert len(set(connections)) == 3
+
+
+def test_serial_reads_share_the_given_session(test_db):
+    seen = []
+
+    def read(db):
+        seen.append(db)
+        return len(seen)
+
+    assert asyncio.run(SerialReads(test_db).gather(read, read)) == [1, 2]
+    assert seen == [test_db, test_db]
@@ -0,0 +1,72 @@
+from types import SimpleNamespace
+
+import app.database as database_mod
+from app.database import STATEMENT_TIMEOUT_KEY, engine_options, set_statement_timeout
+
+
+def _pool_settings(monkeypatch, **overrides):
+    values = {
+        "DB_POOL_SIZE": 8,
+        "DB_MAX_OVERFLOW": 4,
+        "DB_POOL_TIMEOUT_SECONDS": 10.0,
+        "DB_POOL_RECYCLE_SECONDS": 600,
+        "DB_POOL_PRE_PING": False,
+        "DB_STATEMENT_TIMEOUT_MS": 5000,
+        **overrides,
+    }
+    for name, value in values.items():
+        monkeypatch.setattr(database_mod.settings, name, value)
+
+
+def test_postgres_engine_options_come_from_settings(monkeypatch):
+    _pool_settings(monkeypatch)
+
+    options = engine_options("postgresql+psycopg2://u:p@db/crm")
+
+    assert options == {
+        "echo": False,
+        "pool_pre_ping": False,
+        "pool_size": 8,
+        "max_overflow": 4,
+        "pool_timeout": 10.0,
+        "pool_recycle": 600,
+        "connect_args": {"options": "-c statement_timeout=5000"},
+    }
+
+
+def test_asyncpg_statement_timeout_uses_server_settings(monkeypatch):
+    _pool_settings(monkeypatch)
+
+    options = engine_options("postgresql+asyncpg://u:p@db/crm")
+
+    assert options["connect_args"] == {"server_settings": {"statement_timeout": "5000"}}
+
+
+def test_zero_statement_timeout_sets_no_connect_args(monkeypatch):
+    _pool_settings(monkeypatch, DB_STATEMENT_TIMEOUT_MS=0)
+
+    assert "connect_args" not in engine_options("postgresql://u:p@db/crm")
+
+
+def test_sqlite_keeps_the_default_pool(monkeypatch):
+    _pool_settings(monkeypatch)
+
+    assert engine_options("sqlite:///./crm.db") == {"echo": False, "pool_pre_ping": False}
+
+
+def test_statement_timeout_override_is_set_local_per_postgres_transaction(test_db):
+    executed = []
+    postgres = SimpleNamespace(
+        dialect=SimpleNamespace(name="postgresql"), exec_driver_sql=executed.append
+    )
+    sqlite = SimpleNamespace(
+        dialect=SimpleNamespace(name="sqlite"), exec_driver_sql=executed.append
+    )
+
+    set_statement_timeout(test_db, 120000)
+    database_mod._apply_statement_timeout(test_db, None, postgres)
+    database_mod._apply_statement_timeout(test_db, None, sqlite)
+
+    assert test_db.info[STATEMENT_TIMEOUT_KEY] == 120000
+    assert executed == ["SET LOCAL statement_timeout = 120000"]
+    test_db.info.pop(STATEMENT_TIMEOUT_KEY)
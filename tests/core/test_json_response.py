@@ -0,0 +1,66 @@
+import json
+from types import SimpleNamespace
+
+from pydantic import BaseModel, Field
+
+from app.actions.binder_actions import get_binder_actions_for_state
+from app.binders.models.binder import BinderCapacityStatus, BinderLocationStatus
+from app.core.json_response import dump_json, json_response
+from app.work_queue.schemas.work_queue import WorkQueueSourceType
+from app.work_queue.services.actions import source_actions
+
+
+class _Row(BaseModel):
+    id: int
+    display_name: str = Field(alias="displayName")
+    tags: list[str] = Field(default_factory=list)
+    note: str | None = None
+
+
+class _RowWithSecret(_Row):
+    secret: str
+
+
+def test_model_instance_serializes_like_fastapi():
+    row = _Row(id=1, displayName="לקוח", tags=["a"])
+
+    assert json.loads(dump_json(_Row, row)) == row.model_dump(mode="json", by_alias=True)
+
+
+def test_other_values_are_validated_against_the_response_model():
+    subclass = _RowWithSecret(id=1, displayName="x", secret="s")
+    orm_like = SimpleNamespace(id=2, displayName="y", tags=(), note=None)
+
+    assert "secret" not in json.loads(dump_json(_Row, subclass))
+    assert json.loads(dump_json(list[_Row], [orm_like])) == [
+        {"id": 2, "displayName": "y", "tags": [], "note": None}
+    ]
+
+
+def test_json_response_carries_body_and_headers():
+    response = json_response(_Row, {"id": 3, "displayName": "z"}, headers={"ETag": '"v1"'})
+
+    assert response.media_type == "application/json"
+    assert response.headers["etag"] == '"v1"'
+    assert json.loads(response.body)["displayName"] == "z"
+
+
+def test_shared_state_actions_hand_out_independent_lists():
+    first = get_binder_actions_for_state(
+        location_status=BinderLocationStatus.IN_OFFICE,
+        capacity_status=BinderCapacityStatus.OPEN,
+    )
+    first.clear()
+
+    assert get_binder_actions_for_state(
+        location_status="in_office", capacity_status="open"
+    ) == ["mark_ready_for_handover", "receive_material", "mark_full"]
+
+
+def test_source_actions_share_the_create_linked_task_action():
+    first = source_actions(WorkQueueSourceType.CHARGE, 1)
+    second = source_actions(WorkQueueSourceType.CHARGE, 2)
+
+    assert [action.key for action in first] == ["open_charge_context", "create_linked_task"]
+    assert first[0].route != second[0].route
+    assert first[-1] is second[-1]
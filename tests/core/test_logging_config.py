@@ -4,10 +4,16 @@ import logging
 from app.core.logging_config import (
     RequestLogStats,
     StructuredFormatter,
+    begin_request_log_stats,
     build_request_summary_event,
     clear_request_id,
+    clear_request_log_stats,
+    format_request_summary,
+    get_request_log_stats,
+    record_identity_cache_lookup,
     request_summary_level,
     set_request_id,
+    sql_fingerprint,
 )
 
 
@@ -45,6 +51,29 @@ def test_request_summary_event_keeps_normal_request_compact():
     assert event["actor"] == {"user_id": 12, "business_id": None, "role": "advisor"}
     assert event["db"] == {"queries": 3, "total_ms": 18.4}
     assert "flags" not in event
+    assert "cache" not in event
+
+
+def test_request_summary_reports_identity_cache_counters():
+    begin_request_log_stats()
+    try:
+        record_identity_cache_lookup(hits=5, misses=2)
+        record_identity_cache_lookup(hits=3, misses=0)
+        stats = get_request_log_stats()
+    finally:
+        clear_request_log_stats()
+
+    event = build_request_summary_event(
+        stats,
+        service="binder-billing-crm",
+        env="production",
+        slow_request_ms=500,
+        slow_query_ms=250,
+        high_query_count=20,
+    )
+
+    assert event["cache"] == {"client_identity": {"hits": 8, "misses": 2}}
+    assert "  identity cache: hits=8 misses=2" in format_request_summary(stats).splitlines()
 
 
 def test_request_summary_level_warns_on_threshold_flags():
@@ -201,3 +230,55 @@ def test_json_formatter_preserves_structured_error_when_exc_info_exists():
     payload = json.loads(formatter.format(record))
 
     assert payload["error"] == {"type": "server_error", "message": "safe"}
+
+
+def test_sql_fingerprint_ignores_values_and_parameter_list_length():
+    first = "SELECT * FROM binders\n  WHERE id IN (?, ?, ?) AND status = 'open' LIMIT 20"
+    second = "SELECT * FROM binders WHERE id IN (%(id_1)s, %(id_2)s) AND status = 'x' LIMIT 5"
+
+    assert sql_fingerprint(first) == sql_fingerprint(second)
+    assert sql_fingerprint("SELECT * FROM binders WHERE id = $1") == (
+        "SELECT * FROM binders WHERE id = ?"
+    )
+
+
+def test_repeated_statements_are_reported_with_their_repository_caller():
+    stats = RequestLogStats(request_route="binders.list_binders", status_code=200)
+
+    def get_by_id(binder_id):
+        stats.record_sql_query(f"SELECT * FROM binders WHERE id = {binder_id}", 1.5)
+
+    for binder_id in range(6):
+        get_by_id(binder_id)
+    stats.record_sql_query("SELECT count(*) FROM binders", 2.0)
+
+    [(fingerprint, repeated)] = stats.repeated_queries(5)
+    event = build_request_summary_event(
+        stats,
+        service="binder-billing-crm",
+        env="production",
+        slow_request_ms=500,
+        slow_query_ms=250,
+        high_query_count=20,
+        repeated_query_threshold=5,
+    )
+
+    assert fingerprint == "SELECT * FROM binders WHERE id = ?"
+    assert repeated.count == 6
+    assert event["db"]["repeated"] == [
+        {"fingerprint": fingerprint, "count": 6, "total_ms": 9.0, "caller": None}
+    ]
+    assert event["db"]["possible_n_plus_one"] is True
+    assert "repeated query: 6x 9.0ms SELECT * FROM binders WHERE id = ?" in (
+        format_request_summary(stats, repeated_query_threshold=5)
+    )
+    assert (
+        request_summary_level(
+            stats,
+            slow_request_ms=500,
+            slow_query_ms=250,
+            high_query_count=20,
+            repeated_query_threshold=5,
+        )
+        == logging.WARNING
+    )
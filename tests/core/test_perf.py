@@ -0,0 +1,89 @@
+import pytest
+
+import app.core.perf as perf
+from app.core.logging_config import (
+    RequestLogStats,
+    begin_request_log_stats,
+    clear_request_log_stats,
+    get_request_log_stats,
+)
+from app.core.perf import Histogram, QueryBudget, QueryBudgetExceeded, perf_registry
+from app.users.repositories.user_repository import UserRepository
+
+
+@pytest.fixture(autouse=True)
+def _fresh_registry():
+    perf_registry.reset()
+    yield
+    perf_registry.reset()
+
+
+def test_repeated_query_is_attributed_to_the_repository_method(test_db, test_user):
+    begin_request_log_stats()
+    try:
+        repo = UserRepository(test_db)
+        for _ in range(3):
+            repo.get_by_email(test_user.email)
+        stats = get_request_log_stats()
+    finally:
+        clear_request_log_stats()
+
+    [(fingerprint, repeated)] = stats.repeated_queries(3)
+    assert fingerprint.startswith("SELECT users.")
+    assert repeated.caller == "app.users.repositories.user_repository.UserRepository.get_by_email"
+
+
+def test_budget_violations_cover_queries_repeats_and_optionally_timings():
+    stats = RequestLogStats(sql_queries=12, sql_total_ms=80.0)
+    for _ in range(4):
+        stats.record_sql_query("SELECT * FROM binders WHERE id = ?", 1.0)
+    budget = QueryBudget(max_queries=10, max_repeated=3, max_db_ms=50)
+
+    violations = budget.violations(stats)
+
+    assert violations[0] == "16 queries, budget 10"
+    assert violations[1].startswith("4x SELECT * FROM binders WHERE id = ?")
+    assert violations[2] == "84.0ms in SQL, budget 50ms"
+    assert len(budget.violations(stats, timings=False)) == 2
+
+
+def test_histogram_percentiles_use_bucket_bounds():
+    histogram = Histogram((1, 5, 10))
+    for value in (1, 1, 3, 4, 8, 40):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+
+    assert [bucket["count"] for bucket in snapshot["buckets"]] == [2, 2, 1, 1]
+    assert snapshot["p50"] == 5
+    assert snapshot["p95"] == 40
+    assert snapshot["max"] == 40
+
+
+def test_over_budget_route_raises_when_enforced(client, advisor_headers, monkeypatch):
+    monkeypatch.setitem(perf._budgets, "health.get_perf", QueryBudget(max_queries=0))
+    monkeypatch.setattr(perf.settings, "PERF_QUERY_BUDGET_MODE", "raise")
+
+    with pytest.raises(QueryBudgetExceeded, match="health.get_perf over query budget"):
+        client.get("/internal/perf", headers=advisor_headers)
+
+
+def test_over_budget_route_warns_and_is_profiled(client, advisor_headers, monkeypatch):
+    monkeypatch.setitem(perf._budgets, "health.get_perf", QueryBudget(max_queries=0))
+    monkeypatch.setattr(perf.settings, "PERF_QUERY_BUDGET_MODE", "warn")
+
+    assert client.get("/internal/perf", headers=advisor_headers).status_code == 200
+    response = client.get("/internal/perf", headers=advisor_headers)
+
+    assert response.status_code == 200
+    [route] = response.json()["routes"]
+    assert route["route"] == "health.get_perf"
+    assert route["requests"] == 1
+    assert route["over_budget_requests"] == 1
+    assert route["budget"] == {"max_queries": 0, "max_repeated": None, "max_db_ms": None}
+    assert route["queries"]["count"] == 1
+    assert route["duration_ms"]["count"] == 1
+
+
+def test_perf_endpoint_is_advisor_only(client, secretary_headers):
+    assert client.get("/internal/perf", headers=secretary_headers).status_code == 403
@@ -0,0 +1,35 @@
+import pytest
+
+import app.main as main_module
+from app.clients.services.create_client_service import CreateClientService
+from app.common.enums import AdvancePaymentFrequency, EntityType, VatType
+from app.database import SerialReads
+from app.users.api.deps import get_reads
+
+
+@pytest.fixture
+def test_db_url(tmp_path):
+    return f"sqlite:///{tmp_path / 'crm.db'}"
+
+
+def test_overview_through_concurrent_reads_matches_serial(
+    client, concurrent_reads, test_db, test_user, advisor_headers
+):
+    CreateClientService(test_db).create_client(
+        full_name="Concurrent Client",
+        id_number="700000041",
+        entity_type=EntityType.OSEK_MURSHE,
+        vat_reporting_frequency=VatType.MONTHLY,
+        advance_payment_frequency=AdvancePaymentFrequency.MONTHLY,
+        actor_id=test_user.id,
+    )
+    test_db.commit()
+
+    concurrent = client.get("/api/v1/dashboard/overview", headers=advisor_headers)
+    main_module.app.dependency_overrides[get_reads] = lambda: SerialReads(test_db)
+    serial = client.get("/api/v1/dashboard/overview", headers=advisor_headers)
+
+    assert concurrent.status_code == 200
+    assert concurrent.json()["is_empty"] is False
+    assert concurrent.json() == serial.json()
+    assert concurrent.headers["ETag"] == serial.headers["ETag"]
@@ -1,3 +1,12 @@
+from app.config import settings
+from app.core.background_jobs import _dashboard_snapshot_refresh_task
+
+
+def _refresh_snapshots(test_db) -> None:
+    _dashboard_snapshot_refresh_task(test_db)
+    test_db.commit()
+
+
 def test_overview_includes_quick_actions(client, advisor_headers):
     """Dashboard overview response includes quick_actions contract field."""
     response = client.get("/api/v1/dashboard/overview", headers=advisor_headers)
@@ -6,3 +15,71 @@ def test_overview_includes_quick_actions(client, advisor_headers):
     data = response.json()
     assert "quick_actions" in data
     assert isinstance(data["quick_actions"], list)
+
+
+def test_overview_revalidates_with_etag(client, advisor_headers, create_client_with_business):
+    first = client.get("/api/v1/dashboard/overview", headers=advisor_headers)
+    etag = first.headers["ETag"]
+
+    unchanged = client.get(
+        "/api/v1/dashboard/overview", headers={**advisor_headers, "If-None-Match": etag}
+    )
+    assert unchanged.status_code == 304
+    assert unchanged.headers["ETag"] == etag
+
+    create_client_with_business(full_name="ETag Client", id_number="777777777")
+    changed = client.get(
+        "/api/v1/dashboard/overview", headers={**advisor_headers, "If-None-Match": etag}
+    )
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert changed.json()["is_empty"] is False
+
+
+def test_overview_serves_a_dirty_snapshot_within_the_staleness_bound(
+    client, test_db, advisor_headers, create_client_with_business
+):
+    _refresh_snapshots(test_db)
+    etag = client.get("/api/v1/dashboard/overview", headers=advisor_headers).headers["ETag"]
+
+    create_client_with_business(full_name="Stale Client", id_number="888888888")
+    stale = client.get(
+        "/api/v1/dashboard/overview", headers={**advisor_headers, "If-None-Match": etag}
+    )
+
+    assert stale.status_code == 304
+    assert stale.headers["ETag"] == etag
+
+
+def test_overview_is_rebuilt_after_a_relevant_write(
+    client, test_db, advisor_headers, create_client_with_business
+):
+    _refresh_snapshots(test_db)
+    etag = client.get("/api/v1/dashboard/overview", headers=advisor_headers).headers["ETag"]
+
+    create_client_with_business(full_name="Fresh Client", id_number="999999999")
+    _refresh_snapshots(test_db)
+    rebuilt = client.get(
+        "/api/v1/dashboard/overview", headers={**advisor_headers, "If-None-Match": etag}
+    )
+
+    assert rebuilt.status_code == 200
+    assert rebuilt.headers["ETag"] != etag
+    assert rebuilt.json()["is_empty"] is False
+
+
+def test_overview_is_read_live_once_a_dirty_snapshot_is_past_the_bound(
+    client, test_db, advisor_headers, create_client_with_business, monkeypatch
+):
+    monkeypatch.setattr(settings, "DASHBOARD_SNAPSHOT_MAX_STALENESS_SECONDS", 0)
+    _refresh_snapshots(test_db)
+    etag = client.get("/api/v1/dashboard/overview", headers=advisor_headers).headers["ETag"]
+
+    create_client_with_business(full_name="Live Client", id_number="123456782")
+    live = client.get(
+        "/api/v1/dashboard/overview", headers={**advisor_headers, "If-None-Match": etag}
+    )
+
+    assert live.status_code == 200
+    assert live.headers["ETag"] != etag
+    assert live.json()["is_empty"] is False
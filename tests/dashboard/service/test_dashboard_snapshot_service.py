@@ -0,0 +1,105 @@
+import asyncio
+from datetime import timedelta
+
+import app.dashboard.services.dashboard_snapshot_service as snapshot_mod
+from app.audit.constants import ACTION_UPDATED, ENTITY_BUSINESS, ENTITY_CLIENT
+from app.audit.repositories.entity_audit_log_repository import EntityAuditLogRepository
+from app.clients.models.client_record import ClientRecord
+from app.core.background_jobs import _dashboard_snapshot_refresh_task
+from app.dashboard.repositories.dashboard_snapshot_repository import (
+    DashboardSnapshotRepository,
+)
+from app.dashboard.services.dashboard_snapshot_service import DashboardSnapshotService
+from app.database import SerialReads
+from app.users.models.user import UserRole
+from app.utils.time_utils import israel_today, utcnow
+from tests.helpers.identity import seed_client_identity
+
+
+def _snapshot(test_db, role=UserRole.ADVISOR):
+    return DashboardSnapshotRepository(test_db).get(role.value, israel_today())
+
+
+def _overview(test_db, role=UserRole.ADVISOR):
+    return asyncio.run(DashboardSnapshotService.get_overview(SerialReads(test_db), role))
+
+
+def test_reads_never_store_a_snapshot_the_refresh_job_does(test_db):
+    live = _overview(test_db)
+    assert _snapshot(test_db) is None
+
+    result = _dashboard_snapshot_refresh_task(test_db)
+    test_db.commit()
+
+    assert result == {"refreshed": 2, "dropped": 0}
+    assert _snapshot(test_db).etag == live.etag
+    assert _overview(test_db) == live
+
+
+def test_dirty_snapshot_is_served_until_the_refresh_job_recomputes_it(
+    test_db, create_client_with_business, monkeypatch
+):
+    monkeypatch.setattr(snapshot_mod.settings, "DASHBOARD_SNAPSHOT_MAX_STALENESS_SECONDS", 60)
+    _dashboard_snapshot_refresh_task(test_db)
+    test_db.commit()
+    first = _overview(test_db)
+
+    create_client_with_business(full_name="Snapshot Client", id_number="555555555")
+
+    assert _snapshot(test_db).dirty_at is not None
+    assert _overview(test_db) == first
+
+    result = _dashboard_snapshot_refresh_task(test_db)
+    test_db.commit()
+
+    refreshed = _overview(test_db)
+    assert result == {"refreshed": 2, "dropped": 0}
+    assert refreshed.payload["is_empty"] is False
+    assert refreshed.etag != first.etag
+    assert _snapshot(test_db).dirty_at is None
+
+
+def test_snapshot_dirty_past_the_staleness_bound_is_computed_live(
+    test_db, create_client_with_business, monkeypatch
+):
+    monkeypatch.setattr(snapshot_mod.settings, "DASHBOARD_SNAPSHOT_MAX_STALENESS_SECONDS", 60)
+    _dashboard_snapshot_refresh_task(test_db)
+    test_db.commit()
+    create_client_with_business(full_name="Snapshot Client", id_number="555555555")
+    stale = _snapshot(test_db, UserRole.SECRETARY)
+    stale.dirty_at = utcnow() - timedelta(seconds=61)
+    test_db.commit()
+
+    overview = _overview(test_db, UserRole.SECRETARY)
+
+    assert overview.payload["is_empty"] is False
+    assert overview.etag != stale.etag
+    assert _snapshot(test_db, UserRole.SECRETARY).dirty_at is not None
+
+
+def test_uncommitted_writes_are_read_live(test_db):
+    _dashboard_snapshot_refresh_task(test_db)
+    test_db.commit()
+    seed_client_identity(test_db, full_name="Pending Client", id_number="666666666")
+
+    assert _overview(test_db).payload["is_empty"] is False
+    test_db.rollback()
+    assert _snapshot(test_db).dirty_at is None
+
+
+def test_only_writes_to_overview_sources_mark_snapshots_dirty(test_db, test_user):
+    client_record = seed_client_identity(test_db, full_name="Quiet Client", id_number="444444444")
+    test_db.commit()
+    _dashboard_snapshot_refresh_task(test_db)
+    test_db.commit()
+    audit = EntityAuditLogRepository(test_db)
+
+    audit.append(ENTITY_BUSINESS, 1, test_user.id, ACTION_UPDATED)
+    record = test_db.get(ClientRecord, client_record.id)
+    record.status = record.status
+    test_db.commit()
+    assert _snapshot(test_db).dirty_at is None
+
+    audit.append(ENTITY_CLIENT, client_record.id, test_user.id, ACTION_UPDATED)
+    test_db.commit()
+    assert _snapshot(test_db).dirty_at is not None
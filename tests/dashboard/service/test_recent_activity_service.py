@@ -31,7 +31,7 @@ def test_recent_activity_batches_related_entity_lookups(monkeypatch):
     service.report_repo = _BatchOnlyRepo({20: SimpleNamespace(client_record_id=102)})
     service.binder_repo = _BatchOnlyRepo({30: SimpleNamespace(client_record_id=103)})
     service.repo = SimpleNamespace(
-        list_recent=lambda _limit: [
+        list_recent=lambda _limit, entity_types: [
             SimpleNamespace(
                 id=1,
                 entity_type=ENTITY_CLIENT,
@@ -0,0 +1,86 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy.orm import sessionmaker
+
+from app.exports.services.export_worker import ExportWorker
+from app.infrastructure.storage import LocalStorageProvider
+
+
+def _run_worker(test_db, tmp_path):
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        worker = ExportWorker(
+            sessionmaker(bind=test_db.get_bind()),
+            LocalStorageProvider(str(tmp_path)),
+            pool,
+            batch_size=1,
+            lease_seconds=600,
+            max_attempts=3,
+            ttl_seconds=3600,
+        )
+        asyncio.run(worker.run_once())
+    # The worker wrote through its own session; the API shares test_db's identity map.
+    test_db.expire_all()
+
+
+def test_export_is_submitted_polled_and_downloaded(client, advisor_headers, test_db, tmp_path):
+    submitted = client.post(
+        "/api/v1/exports",
+        headers=advisor_headers,
+        json={"kind": "aging_report", "format": "pdf"},
+    )
+    assert submitted.status_code == 202
+    job = submitted.json()
+    assert (job["status"], job["download_url"]) == ("queued", None)
+
+    not_ready = client.get(
+        f"/api/v1/exports/{job['id']}/download", headers=advisor_headers, follow_redirects=False
+    )
+    assert not_ready.status_code == 409
+
+    _run_worker(test_db, tmp_path)
+
+    polled = client.get(f"/api/v1/exports/{job['id']}", headers=advisor_headers).json()
+    assert polled["status"] == "succeeded"
+    assert polled["filename"].endswith(".pdf")
+    assert polled["download_url"].startswith("/local-storage/exports/")
+
+    download = client.get(
+        f"/api/v1/exports/{job['id']}/download", headers=advisor_headers, follow_redirects=False
+    )
+    assert download.status_code == 307
+    assert download.headers["location"] == polled["download_url"]
+
+
+def test_export_kind_roles_and_params_are_enforced(client, secretary_headers, advisor_headers):
+    forbidden = client.post(
+        "/api/v1/exports",
+        headers=secretary_headers,
+        json={"kind": "aging_report", "format": "excel"},
+    )
+    assert forbidden.status_code == 403
+
+    missing = client.post(
+        "/api/v1/exports",
+        headers=advisor_headers,
+        json={"kind": "vat_client", "format": "pdf", "year": 2026},
+    )
+    assert missing.status_code == 400
+    assert missing.json()["error"]["code"] == "EXPORT.PARAMS_MISSING"
+
+    unsupported = client.post(
+        "/api/v1/exports",
+        headers=secretary_headers,
+        json={"kind": "clients", "format": "pdf"},
+    )
+    assert unsupported.status_code == 400
+
+
+def test_export_jobs_are_private_to_their_requester(client, advisor_headers, secretary_headers):
+    job = client.post(
+        "/api/v1/exports",
+        headers=advisor_headers,
+        json={"kind": "clients", "format": "excel"},
+    ).json()
+
+    assert client.get(f"/api/v1/exports/{job['id']}", headers=secretary_headers).status_code == 404
@@ -0,0 +1,156 @@
+import asyncio
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+import openpyxl
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.charge.models.charge import Charge, ChargeStatus, ChargeType
+from app.exports.models.export_job import ExportFormat, ExportJobStatus, ExportKind
+from app.exports.services import export_worker as worker_module
+from app.exports.services.export_job_service import ExportJobService
+from app.exports.services.export_sources import load_export_input
+from app.exports.services.export_worker import ExportWorker
+from app.infrastructure.storage import LocalStorageProvider
+from tests.helpers.identity import seed_client_with_business
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return LocalStorageProvider(str(tmp_path / "storage"))
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        yield pool
+
+
+def _worker(test_db, storage, executor, **overrides):
+    options = dict(batch_size=2, lease_seconds=600, max_attempts=3, ttl_seconds=3600)
+    options.update(overrides)
+    return ExportWorker(sessionmaker(bind=test_db.get_bind()), storage, executor, **options)
+
+
+def _seed_charge(db):
+    client, business = seed_client_with_business(
+        db,
+        full_name="Export Worker Client",
+        id_number="345678901",
+        business_name="Export Worker Client",
+        opened_at=date.today(),
+    )
+    db.add(
+        Charge(
+            client_record_id=client.id,
+            business_id=business.id,
+            amount=Decimal("250.00"),
+            charge_type=ChargeType.CONSULTATION_FEE,
+            status=ChargeStatus.ISSUED,
+            issued_at=date.today() - timedelta(days=40),
+        )
+    )
+    db.commit()
+
+
+def _submit(db, user, kind=ExportKind.AGING_REPORT, fmt=ExportFormat.EXCEL, **params):
+    return ExportJobService(db).submit(kind=kind, fmt=fmt, params=params, user=user)
+
+
+def test_worker_renders_uploads_and_reuses_identical_results(
+    test_db, test_user, storage, executor, monkeypatch
+):
+    _seed_charge(test_db)
+    renders = []
+    real_render = worker_module.render_export
+
+    def _counting_render(*args):
+        renders.append(args[0])
+        return real_render(*args)
+
+    monkeypatch.setattr(worker_module, "render_export", _counting_render)
+    worker = _worker(test_db, storage, executor)
+
+    first = _submit(test_db, test_user)
+    assert asyncio.run(worker.run_once()) == 1
+    test_db.refresh(first)
+
+    assert first.status == ExportJobStatus.SUCCEEDED.value
+    assert first.storage_key.startswith(f"exports/{first.content_hash}/")
+    stored = Path(storage.base_path) / first.storage_key
+    assert stored.stat().st_size == first.size_bytes
+    assert openpyxl.load_workbook(stored).active.cell(row=4, column=1).value == (
+        "Export Worker Client"
+    )
+
+    # Same data again: the stored file is reused without rendering.
+    second = _submit(test_db, test_user)
+    assert second.id != first.id
+    asyncio.run(worker.run_once())
+    test_db.refresh(second)
+
+    assert second.status == ExportJobStatus.SUCCEEDED.value
+    assert (second.content_hash, second.storage_key) == (first.content_hash, first.storage_key)
+    assert renders == ["aging_report_excel"]
+
+
+def test_submit_returns_the_callers_job_still_in_flight(test_db, test_user):
+    first = _submit(test_db, test_user, as_of_date="2026-03-01")
+    again = _submit(test_db, test_user, as_of_date="2026-03-01")
+    other = _submit(test_db, test_user, fmt=ExportFormat.PDF, as_of_date="2026-03-01")
+
+    assert again.id == first.id
+    assert other.id != first.id
+
+
+def test_missing_source_data_fails_the_job(test_db, test_user, storage, executor):
+    job = _submit(
+        test_db,
+        test_user,
+        kind=ExportKind.VAT_CLIENT,
+        fmt=ExportFormat.PDF,
+        client_record_id=999_999,
+        year=2026,
+    )
+
+    asyncio.run(_worker(test_db, storage, executor).run_once())
+    test_db.refresh(job)
+
+    assert job.status == ExportJobStatus.FAILED.value
+    assert "999999" in job.error
+    assert job.storage_key is None
+
+
+def test_expired_results_are_marked_and_unshared_files_deleted(
+    test_db, test_user, storage, executor
+):
+    _seed_charge(test_db)
+    job = _submit(test_db, test_user)
+    asyncio.run(_worker(test_db, storage, executor).run_once())
+    test_db.refresh(job)
+    stored = Path(storage.base_path) / job.storage_key
+    assert stored.exists()
+
+    job.expires_at = job.finished_at - timedelta(seconds=1)
+    test_db.commit()
+    result = ExportJobService(test_db, storage=storage).expire_results()
+    test_db.refresh(job)
+
+    assert result == {"expired": 1, "files_deleted": 1}
+    assert job.status == ExportJobStatus.EXPIRED.value
+    assert not stored.exists()
+
+
+def test_render_payloads_can_cross_a_process_boundary(test_db):
+    _seed_charge(test_db)
+    export_input = load_export_input(
+        test_db, ExportKind.CLIENTS, ExportFormat.EXCEL, params={}
+    )
+
+    restored = pickle.loads(pickle.dumps(export_input.payload))
+
+    assert [c.full_name for c in restored["clients"]] == ["Export Worker Client"]
@@ -0,0 +1,21 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+@contextmanager
+def count_queries(db: Session) -> Iterator[list[str]]:
+    """Collect the SQL statements executed on the session's bind inside the block."""
+    statements: list[str] = []
+    bind = db.get_bind()
+
+    def _record(_conn, _cursor, statement, _parameters, _context, _executemany):
+        statements.append(statement)
+
+    event.listen(bind, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(bind, "before_cursor_execute", _record)
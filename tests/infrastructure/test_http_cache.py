@@ -0,0 +1,154 @@
+"""Tests for change counters and conditional GET on cached read endpoints."""
+
+import pytest
+from sqlalchemy import update
+
+import app.binders.api.binders_list_get as binders_api
+import app.model_registry  # noqa: F401
+from app.clients.models.client_record import ClientRecord
+from app.database import Base
+from app.infrastructure.http_cache import (
+    ChangeCounterRepository,
+    body_cache,
+    etag_matches,
+    watched_tables,
+)
+from app.infrastructure.http_cache import events as http_cache_events
+from tests.helpers.identity import seed_client_identity
+
+BINDERS_PATH = "/api/v1/binders"
+
+
+@pytest.fixture(autouse=True)
+def _empty_body_cache():
+    body_cache.clear()
+    yield
+    body_cache.clear()
+
+
+def _versions(test_db, *tables):
+    return {
+        name: version
+        for name, (version, _at) in ChangeCounterRepository(test_db).versions(tables).items()
+    }
+
+
+def test_commit_bumps_the_counters_of_written_tables(test_db):
+    client = seed_client_identity(test_db, full_name="Counter Client", id_number="CNT1")
+    test_db.commit()
+    assert _versions(test_db, "client_records", "legal_entities", "binders") == {
+        "client_records": 1,
+        "legal_entities": 1,
+    }
+
+    test_db.execute(
+        update(ClientRecord).where(ClientRecord.id == client.id).values(notes="bulk")
+    )
+    test_db.commit()
+    assert _versions(test_db, "client_records")["client_records"] == 2
+
+
+def test_only_tables_behind_cached_routes_are_counted(test_db, test_user, monkeypatch):
+    assert "users" not in watched_tables()
+    assert _versions(test_db, "users") == {}
+
+    # A process without cached routes (an ops script) counts every table it writes.
+    monkeypatch.setattr(http_cache_events, "_cached_tables", set())
+    test_user.full_name = "Renamed"
+    test_db.commit()
+    assert _versions(test_db, "users") == {"users": 1}
+
+
+def test_cached_routes_only_declare_existing_tables():
+    assert watched_tables()
+    assert watched_tables() - Base.metadata.tables.keys() == set()
+
+
+def test_rolled_back_writes_are_not_counted(test_db):
+    seed_client_identity(test_db, full_name="Rolled Back", id_number="CNT2")
+    test_db.rollback()
+    test_db.commit()
+
+    assert _versions(test_db, "client_records") == {}
+
+
+def test_unchanged_list_revalidates_with_304(client, advisor_headers, test_db):
+    seed_client_identity(test_db, full_name="ETag Client", id_number="CNT3")
+    test_db.commit()
+
+    first = client.get(BINDERS_PATH, headers=advisor_headers)
+    etag = first.headers["ETag"]
+    revalidated = client.get(BINDERS_PATH, headers={**advisor_headers, "If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert first.headers["Cache-Control"] == "private, no-cache"
+    assert revalidated.status_code == 304
+    assert revalidated.headers["ETag"] == etag
+    assert client.get(f"{BINDERS_PATH}?page_size=5", headers=advisor_headers).headers[
+        "ETag"
+    ] != etag
+
+
+def test_write_to_a_listed_table_changes_the_etag(client, advisor_headers, test_db):
+    seeded = seed_client_identity(test_db, full_name="ETag Client", id_number="CNT4")
+    test_db.commit()
+    etag = client.get(BINDERS_PATH, headers=advisor_headers).headers["ETag"]
+
+    test_db.get(ClientRecord, seeded.id).notes = "changed"
+    test_db.commit()
+    response = client.get(BINDERS_PATH, headers={**advisor_headers, "If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_cached_body_is_served_without_running_the_service(
+    client, advisor_headers, test_db, monkeypatch
+):
+    seed_client_identity(test_db, full_name="Body Client", id_number="CNT5")
+    test_db.commit()
+    first = client.get(BINDERS_PATH, headers=advisor_headers)
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("service ran for a cached body")
+
+    monkeypatch.setattr(binders_api.BinderListService, "list_binders_page", _fail)
+    second = client.get(BINDERS_PATH, headers=advisor_headers)
+
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    assert second.headers["ETag"] == first.headers["ETag"]
+
+
+def test_uncommitted_writes_bypass_the_cache(client, advisor_headers, test_db):
+    seed_client_identity(test_db, full_name="Pending Client", id_number="CNT6")
+
+    response = client.get(BINDERS_PATH, headers=advisor_headers)
+
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+
+
+def test_roles_get_separate_etags(client, advisor_headers, secretary_headers, test_db):
+    seed_client_identity(test_db, full_name="Role Client", id_number="CNT7")
+    test_db.commit()
+
+    advisor = client.get(BINDERS_PATH, headers=advisor_headers).headers["ETag"]
+    secretary = client.get(BINDERS_PATH, headers=secretary_headers).headers["ETag"]
+
+    assert advisor != secretary
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, False),
+        ('"a"', True),
+        ('W/"a"', True),
+        ('"b", "a"', True),
+        ("*", True),
+        ('"b"', False),
+    ],
+)
+def test_etag_matches(header, expected):
+    assert etag_matches(header, '"a"') is expected
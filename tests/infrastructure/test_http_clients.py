@@ -0,0 +1,132 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.infrastructure.http_clients import (
+    BREVO,
+    WHATSAPP,
+    BreakerState,
+    CircuitBreaker,
+    CircuitOpenError,
+    HttpClientManager,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _manager(handler, *, failure_threshold=2):
+    return HttpClientManager(
+        limits=httpx.Limits(max_connections=2),
+        failure_threshold=failure_threshold,
+        reset_seconds=30,
+        transport=lambda _provider: httpx.MockTransport(handler),
+        async_transport=lambda _provider: httpx.MockTransport(handler),
+    )
+
+
+def _stats(manager, provider):
+    return next(entry for entry in manager.snapshot() if entry["provider"] == provider)
+
+
+def test_breaker_opens_after_consecutive_failures_and_probes_after_reset():
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=30, clock=clock)
+
+    breaker.record_failure()
+    assert breaker.allow() is True
+    breaker.record_failure()
+    assert breaker.state == BreakerState.OPEN
+    assert breaker.allow() is False
+
+    clock.now = 30
+    assert breaker.state == BreakerState.HALF_OPEN
+    assert breaker.allow() is True
+    assert breaker.allow() is False  # one probe at a time
+    breaker.record_failure()
+    assert breaker.allow() is False
+
+    clock.now = 60
+    assert breaker.allow() is True
+    breaker.record_success()
+    assert breaker.state == BreakerState.CLOSED
+    assert breaker.allow() is True
+
+
+def test_server_errors_open_the_circuit_and_later_calls_fail_fast():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.host)
+        return httpx.Response(503)
+
+    manager = _manager(handler)
+    client = manager.client(BREVO)
+    assert client.post("https://brevo.test/send").status_code == 503
+    assert client.post("https://brevo.test/send").status_code == 503
+
+    with pytest.raises(CircuitOpenError):
+        client.post("https://brevo.test/send")
+
+    stats = _stats(manager, BREVO)
+    assert len(calls) == 2
+    assert (stats["requests"], stats["errors"], stats["short_circuited"]) == (2, 2, 1)
+    assert stats["breaker"] == "open"
+    assert stats["latency_ms"]["count"] == 2
+    # Providers have separate breakers.
+    assert _stats(manager, WHATSAPP)["breaker"] == "closed"
+
+
+def test_client_errors_do_not_count_against_the_provider():
+    manager = _manager(lambda _request: httpx.Response(400), failure_threshold=1)
+    client = manager.client(WHATSAPP)
+
+    for _ in range(3):
+        assert client.post("https://wa.test/messages").status_code == 400
+
+    stats = _stats(manager, WHATSAPP)
+    assert (stats["errors"], stats["breaker"]) == (0, "closed")
+
+
+def test_network_errors_count_as_failures_for_the_async_client():
+    def handler(request):
+        raise httpx.ConnectError("down", request=request)
+
+    manager = _manager(handler, failure_threshold=1)
+
+    async def _run():
+        client = manager.async_client(BREVO)
+        with pytest.raises(httpx.ConnectError):
+            await client.post("https://brevo.test/send")
+        with pytest.raises(CircuitOpenError):
+            await client.post("https://brevo.test/send")
+        await manager.aclose()
+
+    asyncio.run(_run())
+
+    stats = _stats(manager, BREVO)
+    assert (stats["errors"], stats["short_circuited"]) == (1, 1)
+
+
+def test_clients_are_shared_until_closed():
+    manager = _manager(lambda _request: httpx.Response(200))
+    manager.open()
+    client = manager.client(BREVO)
+
+    assert manager.client(BREVO) is client
+    asyncio.run(manager.aclose())
+    assert manager.client(BREVO) is not client
+
+
+def test_provider_stats_endpoint(client, advisor_headers, secretary_headers):
+    response = client.get("/internal/providers", headers=advisor_headers)
+
+    assert response.status_code == 200
+    assert [entry["provider"] for entry in response.json()["providers"]] == [BREVO, WHATSAPP]
+    assert client.get("/internal/providers", headers=secretary_headers).status_code == 403
@@ -0,0 +1,136 @@
+from datetime import datetime, time, timedelta
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.infrastructure.jobs import (
+    DailyAt,
+    Every,
+    JobRegistry,
+    JobRepository,
+    JobRunner,
+    JobRunStatus,
+)
+
+T0 = datetime(2026, 3, 1, 12, 0)
+
+
+class _Clock:
+    def __init__(self, now: datetime = T0):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, **kwargs) -> None:
+        self.now += timedelta(**kwargs)
+
+
+def _runner(test_db, registry, clock, owner="node-a:1"):
+    return JobRunner(
+        registry,
+        sessionmaker(bind=test_db.get_bind()),
+        owner=owner,
+        leader_ttl_seconds=60,
+        job_lease_seconds=600,
+        max_workers=1,
+        clock=clock,
+    )
+
+
+def _registry(calls: list, task=None) -> JobRegistry:
+    registry = JobRegistry()
+
+    def _count(db):
+        calls.append("count")
+        return {"touched": len(calls)}
+
+    registry.register("count", Every(timedelta(minutes=10)), task or _count)
+    return registry
+
+
+def test_due_job_runs_once_and_is_rescheduled(test_db):
+    clock = _Clock()
+    calls = []
+    runner = _runner(test_db, _registry(calls), clock)
+
+    [outcome] = runner.run_pending()
+
+    assert outcome.status == JobRunStatus.SUCCEEDED
+    assert outcome.result == {"touched": 1}
+    assert runner.run_pending() == []  # next run is 10 minutes out
+    job = JobRepository(test_db).get_job("count")
+    assert job.next_run_at == T0 + timedelta(minutes=10)
+    assert (job.run_count, job.failure_count, job.lease_owner) == (1, 0, None)
+
+    clock.advance(minutes=10)
+    assert [o.name for o in runner.run_pending()] == ["count"]
+    assert calls == ["count", "count"]
+
+
+def test_failed_run_is_recorded_and_retried_on_schedule(test_db):
+    clock = _Clock()
+
+    def _boom(db):
+        raise RuntimeError("provider down")
+
+    runner = _runner(test_db, _registry([], task=_boom), clock)
+
+    [outcome] = runner.run_pending()
+
+    assert outcome.status == JobRunStatus.FAILED
+    assert outcome.error == "RuntimeError: provider down"
+    repo = JobRepository(test_db)
+    job = repo.get_job("count")
+    assert (job.last_status, job.failure_count) == ("failed", 1)
+    [run] = repo.list_runs("count")
+    assert (run.status, run.owner, run.error) == ("failed", "node-a:1", "RuntimeError: provider down")
+
+
+def test_only_the_leader_claims_jobs(test_db):
+    clock = _Clock()
+    first = _runner(test_db, _registry([]), clock, owner="node-a:1")
+    second = _runner(test_db, _registry([]), clock, owner="node-b:1")
+
+    assert first.claim() == ["count"]  # first to poll becomes leader
+    assert second.claim() == []
+    clock.advance(seconds=30)
+    first.execute("count")
+
+    # The leader stopped polling; once its 60 s lease lapses the other process takes over.
+    clock.advance(minutes=10)
+    assert second.claim() == ["count"]
+    assert first.claim() == []
+
+
+def test_claimed_job_is_not_reclaimed_while_leased(test_db):
+    clock = _Clock()
+    runner = _runner(test_db, _registry([]), clock)
+
+    assert runner.claim() == ["count"]
+    clock.advance(minutes=5)
+    assert runner.claim() == []  # still running under its 10-minute lease
+    clock.advance(minutes=6)
+    assert runner.claim() == ["count"]  # lease expired: the run is presumed dead
+
+
+def test_registry_rejects_duplicate_names():
+    registry = JobRegistry()
+    registry.register("a", Every(timedelta(minutes=1)), lambda db: None)
+
+    with pytest.raises(ValueError):
+        registry.register("a", Every(timedelta(minutes=1)), lambda db: None)
+
+
+@pytest.mark.parametrize(
+    "now,expected",
+    [
+        # 21:59 UTC = 23:59 Israel (winter) → 00:05 Israel next day = 22:05 UTC.
+        (datetime(2026, 1, 10, 21, 59), datetime(2026, 1, 10, 22, 5)),
+        (datetime(2026, 1, 10, 22, 5), datetime(2026, 1, 11, 22, 5)),
+        # Summer time: 00:05 Israel = 21:05 UTC.
+        (datetime(2026, 7, 10, 12, 0), datetime(2026, 7, 10, 21, 5)),
+    ],
+)
+def test_daily_schedule_uses_israel_wall_clock(now, expected):
+    assert DailyAt(time(0, 5)).next_after(now) == expected
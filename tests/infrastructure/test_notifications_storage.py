@@ -1,27 +1,28 @@
+import asyncio
 import io
+import json
 
 import httpx
 import pytest
 
 from app.infrastructure import storage as storage_mod
-from app.infrastructure.notifications import EmailChannel, WhatsAppChannel, _to_html
+from app.infrastructure.notifications import (
+    AsyncEmailChannel,
+    AsyncWhatsAppChannel,
+    EmailChannel,
+    WhatsAppChannel,
+    _to_html,
+)
 
 BREVO_API_URL = "https://brevo.test/v3/smtp/email"
 MAX_EXPECTED_PROVIDER_ERROR_BODY_LENGTH = 1000
 
 
-class _Resp:
-    def __init__(self, status):
-        self.status = status
+def _http(handler) -> httpx.Client:
+    return httpx.Client(transport=httpx.MockTransport(handler))
 
-    def __enter__(self):
-        return self
 
-    def __exit__(self, *_exc_info):
-        return False
-
-
-def test_email_channel_disabled_missing_config_and_success(monkeypatch):
+def test_email_channel_disabled_missing_config_and_success():
     disabled = EmailChannel(
         enabled=False,
         api_key="",
@@ -52,48 +53,98 @@ def test_email_channel_disabled_missing_config_and_success(monkeypatch):
 
     captured = {}
 
-    def _post_ok(url, **kwargs):
-        captured["url"] = url
-        captured["kwargs"] = kwargs
+    def _post_ok(request):
+        captured["url"] = str(request.url)
+        captured["json"] = json.loads(request.content)
         return httpx.Response(201)
 
-    monkeypatch.setattr("httpx.post", _post_ok)
     enabled = EmailChannel(
         enabled=True,
         api_key="k",
         api_url=BREVO_API_URL,
         from_address="from@x.com",
         from_name="CRM",
+        http=_http(_post_ok),
     )
     assert enabled.send("a@b.com", "hello")[0] is True
     assert captured["url"] == BREVO_API_URL
-    assert captured["kwargs"]["json"]["textContent"] == "hello"
-    assert captured["kwargs"]["json"]["htmlContent"] == _to_html("hello")
+    assert captured["json"]["textContent"] == "hello"
+    assert captured["json"]["htmlContent"] == _to_html("hello")
 
     ok, msg = enabled.send_html("a@b.com", "<p>hello</p>", "hello", "Subject")
     assert ok is True
-    payload = captured["kwargs"]["json"]
+    payload = captured["json"]
     assert payload["htmlContent"] == "<p>hello</p>"
     assert payload["textContent"] == "hello"
     assert payload["subject"] == "Subject"
 
 
-def test_whatsapp_channel_paths(monkeypatch):
+def test_whatsapp_channel_paths():
     disabled = WhatsAppChannel(api_key="", api_url="https://wa", from_number="")
     assert disabled.enabled is False
     assert disabled.send("050", "x") == (False, "not configured")
 
-    enabled = WhatsAppChannel(api_key="k", api_url="https://wa", from_number="123")
-
-    monkeypatch.setattr("urllib.request.urlopen", lambda _req, **_kwargs: _Resp(201))
+    config = {"api_key": "k", "api_url": "https://wa", "from_number": "123"}
+    enabled = WhatsAppChannel(**config, http=_http(lambda _r: httpx.Response(201)))
     assert enabled.send("050", "x") == (True, None)
 
-    monkeypatch.setattr("urllib.request.urlopen", lambda _req, **_kwargs: _Resp(500))
-    ok, msg = enabled.send("050", "x")
+    failing = WhatsAppChannel(**config, http=_http(lambda _r: httpx.Response(500)))
+    ok, msg = failing.send("050", "x")
     assert ok is False
     assert "Unexpected WhatsApp status" in msg
 
 
+def _send_async(channel_cls, handler, **config):
+    async def _run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            return await channel_cls(http, **config).send("a@b.com", "hello", subject="S")
+
+    return asyncio.run(_run())
+
+
+def test_async_email_channel_classifies_failures():
+    config = dict(enabled=True, api_key="k", api_url=BREVO_API_URL, from_address="from@x.com")
+    captured = {}
+
+    def _accept(request):
+        captured["request"] = request
+        return httpx.Response(201)
+
+    result = _send_async(AsyncEmailChannel, _accept, **config)
+    assert result.ok is True
+    assert captured["request"].headers["api-key"] == "k"
+    assert b'"subject":"S"' in captured["request"].content
+
+    throttled = _send_async(AsyncEmailChannel, lambda _r: httpx.Response(429), **config)
+    assert (throttled.ok, throttled.retryable) == (False, True)
+    rejected = _send_async(AsyncEmailChannel, lambda _r: httpx.Response(400, text="bad"), **config)
+    assert (rejected.ok, rejected.retryable) == (False, False)
+    assert "status=400 body=bad" in rejected.error
+
+    def _drop(request):
+        raise httpx.ConnectError("down", request=request)
+
+    dropped = _send_async(AsyncEmailChannel, _drop, **config)
+    assert (dropped.ok, dropped.retryable) == (False, True)
+
+    unconfigured = _send_async(AsyncEmailChannel, _accept, **{**config, "api_key": ""})
+    assert unconfigured.retryable is False
+    assert "BREVO_API_KEY" in unconfigured.error
+    disabled = _send_async(AsyncEmailChannel, _drop, **{**config, "enabled": False})
+    assert disabled.ok is True
+
+
+def test_async_whatsapp_channel_paths():
+    config = dict(api_key="k", api_url="https://wa", from_number="123")
+    assert _send_async(AsyncWhatsAppChannel, lambda _r: httpx.Response(201), **config).ok is True
+    unavailable = _send_async(AsyncWhatsAppChannel, lambda _r: httpx.Response(503), **config)
+    assert (unavailable.ok, unavailable.retryable) == (False, True)
+    disabled = _send_async(
+        AsyncWhatsAppChannel, lambda _r: httpx.Response(201), **{**config, "api_key": ""}
+    )
+    assert (disabled.ok, disabled.error) == (False, "not configured")
+
+
 def test_local_storage_and_provider_factory(monkeypatch, tmp_path):
     provider = storage_mod.LocalStorageProvider(base_path=str(tmp_path))
     key = provider.upload("a/b.txt", io.BytesIO(b"data"), "text/plain")
@@ -157,7 +208,7 @@ def test_s3_provider_upload_delete_and_presigned(monkeypatch):
             self.uploaded = None
             self.deleted = None
 
-        def upload_fileobj(self, fileobj, bucket, key, ExtraArgs=None):
+        def upload_fileobj(self, fileobj, bucket, key, ExtraArgs=None, Config=None):
             self.uploaded = (bucket, key, fileobj.read(), ExtraArgs)
 
         def delete_object(self, Bucket, Key):
@@ -170,6 +221,8 @@ def test_s3_provider_upload_delete_and_presigned(monkeypatch):
         def __init__(self):
             self._bucket = "bucket"
             self._endpoint_url = "https://x"
+            self._transfer_config = None
+            self._url_cache = None
             self._client = _FakeClient()
 
     provider = _Provider()
@@ -183,37 +236,158 @@ def test_s3_provider_upload_delete_and_presigned(monkeypatch):
     assert "exp=120" in url
 
 
-def test_notification_helpers_html_and_channel_exceptions(monkeypatch):
+def test_presigned_url_cache_reuses_until_margin_and_evicts_lru():
+    now = [0.0]
+    cache = storage_mod.PresignedUrlCache(max_entries=2, margin_seconds=60, clock=lambda: now[0])
+
+    cache.put(("b", "a", 3600), "url-a")
+    cache.put(("b", "short", 30), "url-short")  # shorter than the margin: never cached
+    assert cache.get(("b", "a", 3600)) == "url-a"
+    assert cache.get(("b", "a", 900)) is None
+    assert cache.get(("b", "short", 30)) is None
+
+    cache.put(("b", "c", 3600), "url-c")
+    cache.put(("b", "d", 3600), "url-d")  # evicts the least recently used entry
+    assert len(cache) == 2
+    assert cache.get(("b", "a", 3600)) is None
+
+    now[0] = 3540
+    assert cache.get(("b", "c", 3600)) is None
+
+
+def test_s3_provider_batch_presigned_urls_sign_cache_misses_only():
+    signed = []
+
+    class _FakeClient:
+        def generate_presigned_url(self, _op, Params=None, ExpiresIn=3600):
+            signed.append(Params["Key"])
+            return f"https://example/{Params['Key']}?exp={ExpiresIn}"
+
+    class _Provider(storage_mod.S3StorageProvider):
+        def __init__(self):
+            self._bucket = "bucket"
+            self._url_cache = storage_mod.PresignedUrlCache(max_entries=10)
+            self._client = _FakeClient()
+
+    provider = _Provider()
+    assert provider.get_presigned_url("a") == "https://example/a?exp=3600"
+    downloads = [storage_mod.PresignedDownload(key) for key in "abbc"]
+    urls = provider.get_presigned_urls(downloads)
+
+    assert urls == {
+        storage_mod.PresignedDownload(key): f"https://example/{key}?exp=3600" for key in "abc"
+    }
+    assert signed == ["a", "b", "c"]
+
+
+def test_presigned_url_cache_keeps_download_names_apart():
+    signed = []
+
+    class _FakeClient:
+        def generate_presigned_url(self, _op, Params=None, ExpiresIn=3600):
+            signed.append(Params.get("ResponseContentDisposition"))
+            return f"https://example/{len(signed)}"
+
+    class _Provider(storage_mod.S3StorageProvider):
+        def __init__(self):
+            self._bucket = "bucket"
+            self._url_cache = storage_mod.PresignedUrlCache(max_entries=10)
+            self._client = _FakeClient()
+
+    provider = _Provider()
+    first = provider.get_presigned_url("blobs/x", filename="a.pdf")
+    second = provider.get_presigned_url("blobs/x", filename="b.pdf")
+
+    assert first != second
+    assert provider.get_presigned_url("blobs/x", filename="a.pdf") == first
+    assert len(signed) == 2
+
+
+def test_s3_provider_presigned_url_carries_the_download_name_and_type():
+    params = []
+
+    class _FakeClient:
+        def generate_presigned_url(self, _op, Params=None, ExpiresIn=3600):
+            params.append(Params)
+            return "https://example/signed"
+
+    class _Provider(storage_mod.S3StorageProvider):
+        def __init__(self):
+            self._bucket = "bucket"
+            self._url_cache = None
+            self._client = _FakeClient()
+
+    _Provider().get_presigned_url(
+        "blobs/sha256/ab/abc", filename="דוח שנתי 2025.pdf", content_type="application/pdf"
+    )
+
+    assert params == [
+        {
+            "Bucket": "bucket",
+            "Key": "blobs/sha256/ab/abc",
+            "ResponseContentDisposition": (
+                "attachment; filename*=UTF-8''%D7%93%D7%95%D7%97%20%D7%A9%D7%A0%D7%AA%D7%99"
+                "%202025.pdf"
+            ),
+            "ResponseContentType": "application/pdf",
+        }
+    ]
+
+
+def test_hashing_reader_tracks_size_and_hash_and_enforces_limit():
+    import hashlib
+
+    reader = storage_mod.HashingReader(io.BytesIO(b"abcdef"), max_bytes=6)
+    assert reader.read(4) == b"abcd"
+    reader.finish()
+    assert reader.size == 6
+    assert reader.sha256 == hashlib.sha256(b"abcdef").hexdigest()
+
+    too_big = storage_mod.HashingReader(io.BytesIO(b"abcdefg"), max_bytes=6)
+    with pytest.raises(storage_mod.UploadTooLargeError):
+        too_big.read()
+
+    assert storage_mod.remaining_size(io.BytesIO(b"abcdef")) == 6
+
+
+def test_local_storage_rejected_upload_leaves_no_file(tmp_path):
+    provider = storage_mod.LocalStorageProvider(base_path=str(tmp_path))
+    reader = storage_mod.HashingReader(io.BytesIO(b"x" * 10), max_bytes=4)
+
+    with pytest.raises(storage_mod.UploadTooLargeError):
+        provider.upload("docs/big.bin", reader, "application/octet-stream")
+
+    assert list((tmp_path / "docs").iterdir()) == []
+
+
+def test_notification_helpers_html_and_channel_exceptions():
     html = _to_html("line1\n\nline2")
     assert "<p>line1</p>" in html
     assert "<br>" in html
 
-    def _raise_post(_url, **_kwargs):
-        raise httpx.ConnectError("net-down")
-
-    monkeypatch.setattr("httpx.post", _raise_post)
+    def _raise_post(request):
+        raise httpx.ConnectError("net-down", request=request)
 
-    email = EmailChannel(
-        enabled=True,
-        api_key="k",
-        api_url=BREVO_API_URL,
-        from_address="from@x.com",
-    )
+    config = {
+        "enabled": True,
+        "api_key": "k",
+        "api_url": BREVO_API_URL,
+        "from_address": "from@x.com",
+    }
+    email = EmailChannel(**config, http=_http(_raise_post))
     ok, msg = email.send("to@x.com", "hello")
     assert ok is False
     assert "Brevo email request failed" in msg
 
-    def _post_rejected(_url, **_kwargs):
-        return httpx.Response(400, text="x" * 1200)
-
-    monkeypatch.setattr("httpx.post", _post_rejected)
-
-    ok, msg = email.send("to@x.com", "hello")
+    rejected = EmailChannel(**config, http=_http(lambda _r: httpx.Response(400, text="x" * 1200)))
+    ok, msg = rejected.send("to@x.com", "hello")
     assert ok is False
     assert "Brevo rejected email: status=400" in msg
     assert len(msg.rsplit("body=", 1)[1]) == MAX_EXPECTED_PROVIDER_ERROR_BODY_LENGTH
 
-    wa = WhatsAppChannel(api_key="k", api_url="https://wa", from_number="123")
+    wa = WhatsAppChannel(
+        api_key="k", api_url="https://wa", from_number="123", http=_http(_raise_post)
+    )
     ok, msg = wa.send("050", "hello")
     assert ok is False
     assert "WhatsApp error" in msg
@@ -0,0 +1,200 @@
+"""Tests: NotificationCampaignService targeting, policy and batched delivery."""
+
+import asyncio
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.charge.models.charge import ChargeStatus, ChargeType
+from app.charge.repositories.charge_repository import ChargeRepository
+from app.clients.enums import ClientStatus
+from app.core.exceptions import AppError
+from app.infrastructure.notifications import FakeNotificationProvider
+from app.notification.models.notification import (
+    Notification,
+    NotificationChannel,
+    NotificationStatus,
+    NotificationTrigger,
+)
+from app.notification.models.notification_outbox import NotificationOutbox
+from app.notification.repositories.notification_repository import NotificationRepository
+from app.notification.schemas.notification_schemas import NotificationCampaignRequest
+from app.notification.services import notification_campaign_service as campaign_service_module
+from app.notification.services.notification_campaign_service import (
+    NotificationCampaignService,
+)
+from app.notification.services.notification_outbox_worker import (
+    NotificationOutboxWorker,
+    RetryPolicy,
+)
+from tests.helpers.identity import seed_client_with_business
+
+
+def _issued_charge(test_db, suffix: str, *, email: str | None, status=ClientStatus.ACTIVE):
+    client, business = seed_client_with_business(
+        test_db,
+        full_name=f"Campaign Client {suffix}",
+        id_number=f"CAMP-{suffix}",
+        email=email,
+        status=status,
+    )
+    repo = ChargeRepository(test_db)
+    charge = repo.create(
+        client_record_id=client.id,
+        business_id=business.id,
+        amount=Decimal("100.00"),
+        charge_type=ChargeType.MONTHLY_RETAINER,
+    )
+    repo.update_status(charge.id, ChargeStatus.ISSUED)
+    test_db.commit()
+    return charge
+
+
+def _payment_campaign(**fields) -> NotificationCampaignRequest:
+    return NotificationCampaignRequest(trigger=NotificationTrigger.PAYMENT_REMINDER, **fields)
+
+
+def test_campaign_queues_skips_and_blocks_per_target(test_db, test_user):
+    with_email = _issued_charge(test_db, "1", email="one@example.com")
+    without_email = _issued_charge(test_db, "2", email=None)
+    frozen = _issued_charge(test_db, "3", email="three@example.com", status=ClientStatus.FROZEN)
+
+    result = NotificationCampaignService(test_db).create(
+        _payment_campaign(), triggered_by=test_user.id
+    )
+
+    by_entity = {item.entity_id: item for item in result.results}
+    assert result.total == 3
+    assert (result.queued, result.skipped, result.blocked) == (1, 1, 1)
+    assert by_entity[with_email.id].status == "queued"
+    assert by_entity[without_email.id].status == "skipped"
+    assert by_entity[frozen.id].status == "blocked"
+    assert by_entity[frozen.id].notification_id is None
+    assert not result.completed
+    assert test_db.scalar(select(func.count()).select_from(NotificationOutbox)) == 1
+    assert test_db.scalar(
+        select(func.count()).select_from(Notification).where(
+            Notification.campaign_id == result.id
+        )
+    ) == 2
+
+
+def test_client_record_ids_narrow_the_targets(test_db, test_user):
+    first = _issued_charge(test_db, "4", email="four@example.com")
+    _issued_charge(test_db, "5", email="five@example.com")
+
+    result = NotificationCampaignService(test_db).create(
+        _payment_campaign(client_record_ids=[first.client_record_id]),
+        triggered_by=test_user.id,
+    )
+
+    assert [item.entity_id for item in result.results] == [first.id]
+
+
+def test_recent_reminder_blocks_unless_confirmed(test_db, test_user):
+    charge = _issued_charge(test_db, "6", email="six@example.com")
+    NotificationRepository(test_db).create(
+        client_record_id=charge.client_record_id,
+        trigger=NotificationTrigger.PAYMENT_REMINDER,
+        channel=NotificationChannel.EMAIL,
+        recipient="six@example.com",
+        content_snapshot="earlier",
+        entity_type="charge",
+        entity_id=charge.id,
+        status=NotificationStatus.SENT,
+    )
+    test_db.commit()
+    service = NotificationCampaignService(test_db)
+
+    warned = service.create(_payment_campaign(), triggered_by=test_user.id)
+    confirmed = service.create(
+        _payment_campaign(confirm_recent_duplicate=True), triggered_by=test_user.id
+    )
+
+    assert warned.blocked == 1 and warned.queued == 0
+    assert confirmed.queued == 1
+
+
+@pytest.mark.parametrize(
+    ("fields", "code"),
+    [
+        ({"trigger": "vat_documents_reminder"}, "NOTIFICATION.CAMPAIGN_MISSING_PERIOD"),
+        ({"trigger": "client_general_message"}, "NOTIFICATION.CAMPAIGN_UNSUPPORTED_TRIGGER"),
+    ],
+)
+def test_invalid_campaigns_are_rejected(test_db, test_user, fields, code):
+    with pytest.raises(AppError) as exc:
+        NotificationCampaignService(test_db).create(
+            NotificationCampaignRequest(**fields), triggered_by=test_user.id
+        )
+
+    assert exc.value.code == code
+
+
+def test_campaign_over_the_limit_is_rejected(test_db, test_user, monkeypatch):
+    monkeypatch.setattr(campaign_service_module, "BULK_NOTIFY_LIMIT", 2)
+    for index in range(3):
+        _issued_charge(test_db, f"L{index}", email=f"limit{index}@example.com")
+
+    with pytest.raises(AppError) as exc:
+        NotificationCampaignService(test_db).create(_payment_campaign(), triggered_by=test_user.id)
+
+    assert exc.value.code == "NOTIFICATION.CAMPAIGN_TOO_LARGE"
+
+
+def _batch_worker(test_db, provider) -> NotificationOutboxWorker:
+    return NotificationOutboxWorker(
+        sessionmaker(bind=test_db.get_bind()),
+        {NotificationChannel.EMAIL: provider},
+        concurrency={NotificationChannel.EMAIL: 4},
+        retry=RetryPolicy(max_attempts=3, base_seconds=60, max_seconds=3600),
+        batch_size=50,
+        lease_seconds=300,
+        send_batch_size=2,
+    )
+
+
+def test_worker_delivers_campaign_in_provider_batches(test_db, test_user):
+    for index in range(5):
+        _issued_charge(test_db, f"b{index}", email=f"batch{index}@example.com")
+    campaign = NotificationCampaignService(test_db).create(
+        _payment_campaign(), triggered_by=test_user.id
+    )
+    test_db.commit()
+    provider = FakeNotificationProvider()
+
+    assert asyncio.run(_batch_worker(test_db, provider).run_once()) == 5
+
+    test_db.expire_all()
+    progress = NotificationCampaignService(test_db).get(campaign.id)
+    # Two batch calls plus a single send for the remainder.
+    assert (provider.batches, provider.calls) == ([2, 2], 3)
+    assert len(provider.sent) == 5
+    assert (progress.sent, progress.queued, progress.completed) == (5, 0, True)
+
+
+class _ShortBatchProvider(FakeNotificationProvider):
+    """Drops the last result of every batch, like a provider answering partially."""
+
+    async def send_batch(self, messages):
+        return (await super().send_batch(messages))[:-1]
+
+
+def test_messages_missing_from_a_batch_response_are_retried(test_db, test_user):
+    for index in range(2):
+        _issued_charge(test_db, f"s{index}", email=f"short{index}@example.com")
+    campaign = NotificationCampaignService(test_db).create(
+        _payment_campaign(), triggered_by=test_user.id
+    )
+    test_db.commit()
+
+    assert asyncio.run(_batch_worker(test_db, _ShortBatchProvider()).run_once()) == 2
+
+    test_db.expire_all()
+    progress = NotificationCampaignService(test_db).get(campaign.id)
+    retried = test_db.scalars(select(NotificationOutbox)).one()
+    assert (progress.sent, progress.queued) == (1, 1)
+    assert (retried.attempts, retried.locked_until) == (1, None)
+    assert retried.last_error == "no result from provider"
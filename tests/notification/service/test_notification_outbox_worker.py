@@ -0,0 +1,214 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+from app.infrastructure.notifications import DeliveryResult, FakeNotificationProvider
+from app.notification.models.notification import (
+    Notification,
+    NotificationChannel,
+    NotificationStatus,
+    NotificationTrigger,
+)
+from app.notification.models.notification_outbox import (
+    NotificationOutbox,
+    NotificationOutboxStatus,
+)
+from app.notification.repositories.notification_outbox_repository import (
+    NotificationOutboxRepository,
+)
+from app.notification.repositories.notification_repository import NotificationRepository
+from app.notification.schemas.notification_schemas import NotificationSendRequest
+from app.notification.services.notification_outbox_worker import (
+    NotificationOutboxWorker,
+    RetryPolicy,
+)
+from app.notification.services.notification_send_service import NotificationSendService
+from app.utils.time_utils import utcnow
+from tests.helpers.identity import seed_client_identity
+
+_RETRYABLE = DeliveryResult(ok=False, error="503 from provider", retryable=True)
+_PERMANENT = DeliveryResult(ok=False, error="400 invalid recipient")
+
+
+def _worker(test_db, provider, *, max_attempts=3, base_seconds=60.0, concurrency=4):
+    return NotificationOutboxWorker(
+        sessionmaker(bind=test_db.get_bind()),
+        {NotificationChannel.EMAIL: provider},
+        concurrency={NotificationChannel.EMAIL: concurrency},
+        retry=RetryPolicy(max_attempts=max_attempts, base_seconds=base_seconds, max_seconds=3600),
+        batch_size=50,
+        lease_seconds=300,
+        rng=lambda: 0.5,
+    )
+
+
+def _queue(test_db, count=1) -> list[int]:
+    client = seed_client_identity(test_db, full_name="Outbox Client", id_number="OUTBOX-1")
+    repo = NotificationRepository(test_db)
+    outbox = NotificationOutboxRepository(test_db)
+    ids = []
+    for index in range(count):
+        notification = repo.create(
+            client_record_id=client.id,
+            trigger=NotificationTrigger.CLIENT_GENERAL_MESSAGE,
+            channel=NotificationChannel.EMAIL,
+            recipient=f"client{index}@example.com",
+            content_snapshot=f"body {index}",
+            subject_snapshot="subject",
+        )
+        outbox.enqueue(notification)
+        ids.append(notification.id)
+    test_db.commit()
+    return ids
+
+
+def _reload(test_db, notification_id):
+    test_db.expire_all()
+    notification = test_db.get(Notification, notification_id)
+    entry = NotificationOutboxRepository(test_db).get_by_notification_id(notification_id)
+    return notification, entry
+
+
+def _make_due(test_db, notification_id):
+    entry = NotificationOutboxRepository(test_db).get_by_notification_id(notification_id)
+    entry.next_attempt_at = utcnow() - timedelta(seconds=1)
+    test_db.commit()
+
+
+def test_send_service_queues_in_business_transaction(test_db, test_user):
+    client = seed_client_identity(
+        test_db, full_name="Queued Client", id_number="OUTBOX-2", email="queued@example.com"
+    )
+    result = NotificationSendService(test_db).send(
+        NotificationSendRequest(
+            client_record_id=client.id,
+            trigger=NotificationTrigger.CLIENT_GENERAL_MESSAGE,
+            overrides={"subject": "נושא", "body": "גוף ההודעה"},
+        ),
+        triggered_by=test_user.id,
+        idempotency_key="00000000-0000-4000-8000-000000000601",
+    )
+
+    assert result.status == "queued"
+    notification, entry = _reload(test_db, result.notification_id)
+    assert notification.status == NotificationStatus.PENDING
+    assert entry.status == NotificationOutboxStatus.PENDING.value
+
+    test_db.rollback()
+    assert test_db.scalars(select(NotificationOutbox)).all() == []
+
+
+def test_worker_delivers_and_marks_notification_sent(test_db):
+    [notification_id] = _queue(test_db)
+    provider = FakeNotificationProvider()
+
+    assert asyncio.run(_worker(test_db, provider).run_once()) == 1
+
+    notification, entry = _reload(test_db, notification_id)
+    assert notification.status == NotificationStatus.SENT
+    assert notification.sent_at is not None
+    assert entry is None
+    assert provider.sent == [
+        {"recipient": "client0@example.com", "subject": "subject", "content": "body 0"}
+    ]
+
+
+def test_retryable_failure_backs_off_then_succeeds(test_db):
+    [notification_id] = _queue(test_db)
+    provider = FakeNotificationProvider([_RETRYABLE])
+    worker = _worker(test_db, provider, base_seconds=60)
+
+    before = utcnow()
+    asyncio.run(worker.run_once())
+    notification, entry = _reload(test_db, notification_id)
+    assert notification.status == NotificationStatus.PENDING
+    assert (notification.retry_count, notification.error_message) == (1, "503 from provider")
+    assert entry.attempts == 1
+    assert entry.locked_until is None
+    # First retry: half of the 60 s ceiling fixed, plus half the jitter range (rng = 0.5).
+    assert entry.next_attempt_at - before >= timedelta(seconds=45)
+
+    assert asyncio.run(worker.run_once()) == 0  # not due yet
+    _make_due(test_db, notification_id)
+    asyncio.run(worker.run_once())
+
+    notification, entry = _reload(test_db, notification_id)
+    assert notification.status == NotificationStatus.SENT
+    assert notification.error_message is None
+    assert entry is None
+
+
+def test_permanent_failure_is_dead_lettered(test_db):
+    [notification_id] = _queue(test_db)
+
+    asyncio.run(_worker(test_db, FakeNotificationProvider([_PERMANENT])).run_once())
+
+    notification, entry = _reload(test_db, notification_id)
+    assert notification.status == NotificationStatus.FAILED
+    assert notification.error_message == "400 invalid recipient"
+    assert entry.status == NotificationOutboxStatus.DEAD_LETTER.value
+    assert entry.attempts == 1
+
+
+def test_exhausted_retries_are_dead_lettered(test_db):
+    [notification_id] = _queue(test_db)
+    provider = FakeNotificationProvider([_RETRYABLE, _RETRYABLE])
+    worker = _worker(test_db, provider, max_attempts=2)
+
+    asyncio.run(worker.run_once())
+    _make_due(test_db, notification_id)
+    asyncio.run(worker.run_once())
+
+    notification, entry = _reload(test_db, notification_id)
+    assert notification.status == NotificationStatus.FAILED
+    assert entry.status == NotificationOutboxStatus.DEAD_LETTER.value
+    assert entry.attempts == 2
+    _make_due(test_db, notification_id)
+    assert asyncio.run(worker.run_once()) == 0
+    assert provider.calls == 2
+
+
+def test_provider_exception_is_retried(test_db):
+    [notification_id] = _queue(test_db)
+
+    class _Exploding:
+        async def send(self, recipient, content, subject=None):
+            raise RuntimeError("boom")
+
+    asyncio.run(_worker(test_db, _Exploding()).run_once())
+
+    notification, entry = _reload(test_db, notification_id)
+    assert notification.status == NotificationStatus.PENDING
+    assert "boom" in entry.last_error
+
+
+def test_channel_concurrency_limit(test_db):
+    ids = _queue(test_db, count=6)
+    provider = FakeNotificationProvider(delay=0.02)
+
+    assert asyncio.run(_worker(test_db, provider, concurrency=2).run_once()) == 6
+
+    assert provider.max_in_flight == 2
+    test_db.expire_all()
+    statuses = test_db.scalars(select(Notification.status).where(Notification.id.in_(ids))).all()
+    assert set(statuses) == {NotificationStatus.SENT}
+
+
+def test_claimed_rows_are_leased(test_db):
+    _queue(test_db, count=2)
+    repo = NotificationOutboxRepository(test_db)
+
+    claimed = repo.claim_due(limit=10, lease_until=utcnow() + timedelta(minutes=5))
+
+    assert len(claimed) == 2
+    assert repo.claim_due(limit=10, lease_until=utcnow() + timedelta(minutes=5)) == []
+
+
+@pytest.mark.parametrize("attempt,expected", [(1, (15, 30)), (3, (60, 120)), (10, (1800, 3600))])
+def test_retry_delay_is_exponential_with_jitter(attempt, expected):
+    policy = RetryPolicy(max_attempts=10, base_seconds=30, max_seconds=3600)
+
+    assert (policy.delay(attempt, lambda: 0.0), policy.delay(attempt, lambda: 1.0)) == expected
@@ -155,7 +155,7 @@ def test_send_allowed_for_frozen_client_with_exempt_trigger(test_db):
     )
 
     # Should proceed (skipped due to stub delivery, not blocked)
-    assert result.status in ("sent", "skipped", "failed")
+    assert result.status in ("queued", "skipped")
     assert result.status != "blocked"
 
 
@@ -56,12 +56,8 @@ def _svc(monkeypatch) -> NotificationSendService:
         lambda db: None,
     )
     monkeypatch.setattr(
-        "app.notification.services.notification_send_service.EmailChannel",
-        lambda **kw: None,
-    )
-    monkeypatch.setattr(
-        "app.notification.services.notification_send_service.NotificationDeliveryService",
-        lambda: None,
+        "app.notification.services.notification_send_service.NotificationOutboxRepository",
+        lambda db: None,
     )
     return NotificationSendService.__new__(NotificationSendService)
 
@@ -161,7 +157,7 @@ class TestAnnualReportSendIntegration:
 
         result = self._send(test_db, client.id, report.id, test_user.id)
 
-        assert result.status in ("sent", "skipped")
+        assert result.status in ("queued", "skipped")
         assert result.notification_id is not None
 
         repo = NotificationRepository(test_db)
@@ -189,7 +185,7 @@ class TestAnnualReportSendIntegration:
             test_user.id,
             idempotency_key="00000000-0000-4000-8000-000000000101",
         )
-        assert r1.status in ("sent", "skipped")
+        assert r1.status in ("queued", "skipped")
 
         # Ensure first notification is marked SENT so cooldown applies
         if r1.notification_id:
@@ -57,6 +57,15 @@ def test_upload_and_list_documents(client, test_db, advisor_headers):
     items = list_resp.json()["items"]
     assert len(items) == 1
     assert items[0]["id"] == doc_id
+    assert items[0]["download_url"] is None
+
+    with_urls = client.get(
+        f"/api/v1/documents/client/{business.client_id}",
+        headers=advisor_headers,
+        params={"include_download_urls": True},
+    )
+    assert with_urls.status_code == 200
+    assert with_urls.json()["items"][0]["download_url"] == f"/local-storage/{doc['storage_key']}"
 
 
 def test_get_download_url_and_replace_document(client, test_db, advisor_headers):
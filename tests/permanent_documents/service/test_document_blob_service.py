@@ -0,0 +1,154 @@
+from io import BytesIO
+
+from app.common.enums import IdNumberType
+from app.config import settings
+from app.infrastructure.storage import LocalStorageProvider
+from app.permanent_documents.models.document_blob import DocumentBlob
+from app.permanent_documents.models.permanent_document import DocumentScope, DocumentType
+from app.permanent_documents.repositories.permanent_document_repository import (
+    PermanentDocumentRepository,
+)
+from app.permanent_documents.services.document_blob_service import DocumentBlobService
+from app.permanent_documents.services.permanent_document_service import (
+    PermanentDocumentService,
+)
+from tests.helpers.identity import seed_client_with_business
+
+
+class _Storage(LocalStorageProvider):
+    def __init__(self, base_path):
+        super().__init__(str(base_path))
+        self.uploads = []
+
+    def upload(self, key, file_data, content_type):
+        self.uploads.append(key)
+        return super().upload(key, file_data, content_type)
+
+
+def _business(test_db, suffix):
+    _client, business = seed_client_with_business(
+        test_db,
+        full_name=f"Blob Client {suffix}",
+        id_number=f"7104000{suffix}",
+        id_number_type=IdNumberType.CORPORATION,
+    )
+    test_db.commit()
+    return business
+
+
+def _upload(service, business, user, data, document_type=DocumentType.TAX_FORM):
+    return service.upload_document(
+        client_record_id=business.client_id,
+        document_type=document_type,
+        file_data=BytesIO(data),
+        filename="doc.pdf",
+        uploaded_by=user.id,
+        mime_type="application/pdf",
+        business_id=business.id,
+    )
+
+
+def test_identical_files_are_stored_once_and_shared(test_db, test_user, tmp_path):
+    storage = _Storage(tmp_path)
+    service = PermanentDocumentService(test_db, storage=storage)
+
+    first = _upload(service, _business(test_db, "1"), test_user, b"same id copy")
+    second = _upload(service, _business(test_db, "2"), test_user, b"same id copy")
+
+    assert first.storage_key == second.storage_key
+    assert storage.uploads == [first.storage_key]
+    assert test_db.get(DocumentBlob, first.content_sha256).ref_count == 2
+    assert storage.open(first.storage_key).read() == b"same id copy"
+
+
+def test_replace_moves_the_reference_and_skips_unchanged_content(test_db, test_user, tmp_path):
+    storage = _Storage(tmp_path)
+    service = PermanentDocumentService(test_db, storage=storage)
+    doc = _upload(service, _business(test_db, "3"), test_user, b"v1")
+    old_sha = doc.content_sha256
+
+    service.replace_document(doc.id, BytesIO(b"v1"), "doc.pdf", test_user.id)
+    assert (doc.version, len(storage.uploads)) == (2, 1)
+    assert test_db.get(DocumentBlob, old_sha).ref_count == 1
+
+    service.replace_document(doc.id, BytesIO(b"v2"), "doc.pdf", test_user.id)
+    old_blob = test_db.get(DocumentBlob, old_sha)
+    test_db.refresh(old_blob)
+    assert len(storage.uploads) == 2
+    assert (old_blob.ref_count, old_blob.released_at is not None) == (0, True)
+    assert test_db.get(DocumentBlob, doc.content_sha256).ref_count == 1
+
+
+def test_gc_deletes_released_blobs_after_the_grace_period(
+    test_db, test_user, tmp_path, monkeypatch
+):
+    storage = _Storage(tmp_path)
+    service = PermanentDocumentService(test_db, storage=storage)
+    doc = _upload(service, _business(test_db, "4"), test_user, b"old")
+    old_key = doc.storage_key
+    service.replace_document(doc.id, BytesIO(b"new"), "doc.pdf", test_user.id)
+    blobs = DocumentBlobService(test_db, storage)
+
+    assert blobs.collect_garbage() == {"blobs_deleted": 0, "ref_counts_repaired": 0}
+
+    monkeypatch.setattr(settings, "DOCUMENT_BLOB_GC_GRACE_HOURS", 0)
+    assert blobs.collect_garbage() == {"blobs_deleted": 1, "ref_counts_repaired": 0}
+    assert not (tmp_path / old_key).exists()
+    assert (tmp_path / doc.storage_key).exists()
+
+
+def test_gc_repairs_a_drifted_count_instead_of_deleting(test_db, test_user, tmp_path, monkeypatch):
+    storage = _Storage(tmp_path)
+    doc = _upload(
+        PermanentDocumentService(test_db, storage=storage),
+        _business(test_db, "5"),
+        test_user,
+        b"kept",
+    )
+    blob = test_db.get(DocumentBlob, doc.content_sha256)
+    blob.ref_count = 0
+    blob.released_at = doc.uploaded_at
+    test_db.commit()
+
+    monkeypatch.setattr(settings, "DOCUMENT_BLOB_GC_GRACE_HOURS", 0)
+    result = DocumentBlobService(test_db, storage).collect_garbage()
+
+    test_db.refresh(blob)
+    assert result == {"blobs_deleted": 0, "ref_counts_repaired": 1}
+    assert (blob.ref_count, blob.released_at) == (1, None)
+    assert (tmp_path / doc.storage_key).exists()
+
+
+def test_rehash_moves_legacy_documents_onto_shared_blobs(test_db, test_user, tmp_path):
+    storage = _Storage(tmp_path)
+    business = _business(test_db, "6")
+    repo = PermanentDocumentRepository(test_db)
+    legacy = []
+    for index, key in enumerate(["legacy/v1_a.pdf", "legacy/v1_b.pdf", "legacy/missing.pdf"]):
+        if "missing" not in key:
+            storage.upload(key, BytesIO(b"same bytes"), "application/pdf")
+        legacy.append(
+            repo.create(
+                client_record_id=business.client_id,
+                business_id=business.id,
+                scope=DocumentScope.BUSINESS,
+                document_type=DocumentType.TAX_FORM,
+                storage_key=key,
+                uploaded_by=test_user.id,
+                tax_year=2020 + index,
+                mime_type="application/pdf",
+            )
+        )
+    test_db.commit()
+    storage.uploads.clear()
+
+    result = DocumentBlobService(test_db, storage).rehash_legacy_documents(
+        batch_size=2, delete_legacy=True
+    )
+
+    first, second, missing = legacy
+    assert result == {"migrated": 2, "uploaded": 1, "missing": 1, "legacy_deleted": 2}
+    assert first.storage_key == second.storage_key == storage.uploads[0]
+    assert (first.file_size_bytes, missing.storage_key) == (10, "legacy/missing.pdf")
+    assert test_db.get(DocumentBlob, first.content_sha256).ref_count == 2
+    assert not (tmp_path / "legacy" / "v1_a.pdf").exists()
@@ -1,3 +1,4 @@
+import hashlib
 from io import BytesIO
 
 import pytest
@@ -5,13 +6,26 @@ import pytest
 from app.businesses.models.business import Business
 from app.common.enums import IdNumberType
 from app.core.exceptions import AppError, NotFoundError
-from app.permanent_documents.models.permanent_document import DocumentType
+from app.permanent_documents.models.permanent_document import (
+    DocumentType,
+    PermanentDocument,
+)
 from app.permanent_documents.services.permanent_document_service import (
     PermanentDocumentService,
 )
 from tests.helpers.identity import seed_client_with_business
 
 
+class _Unseekable:
+    """Request body stream without a known length."""
+
+    def __init__(self, data: bytes):
+        self._data = BytesIO(data)
+
+    def read(self, size=-1):
+        return self._data.read(size)
+
+
 class _Storage:
     def __init__(self):
         self.uploads = []
@@ -23,8 +37,8 @@ class _Storage:
     def delete(self, key):
         return None
 
-    def get_presigned_url(self, key, expires_in=3600):
-        return f"/dl/{key}?exp={expires_in}"
+    def get_presigned_url(self, key, expires_in=3600, *, filename=None, content_type=None):
+        return f"/dl/{key}?exp={expires_in}&name={filename}&type={content_type}"
 
 
 def _business(test_db, *, suffix: str) -> Business:
@@ -92,7 +106,46 @@ def test_permanent_document_replace_and_version_increment(test_db, test_user):
         uploaded_by=test_user.id,
     )
     assert replaced.version == 2
-    assert "v2_" in replaced.storage_key
+    assert replaced.storage_key.endswith(f"/{replaced.content_sha256}")
 
     url = service.get_download_url(replaced.id, expires_in=120)
-    assert "exp=120" in url
+    assert url.endswith("?exp=120&name=id2.pdf&type=application/pdf")
+
+
+def test_permanent_document_records_streamed_size_and_sha256(test_db, test_user):
+    b = _business(test_db, suffix="3")
+    service = PermanentDocumentService(test_db, storage=_Storage())
+
+    doc = service.upload_document(
+        client_record_id=b.client_id,
+        document_type=DocumentType.ID_COPY,
+        file_data=_Unseekable(b"payload"),
+        filename="id.pdf",
+        uploaded_by=test_user.id,
+        mime_type="application/pdf",
+        business_id=b.id,
+    )
+
+    assert doc.file_size_bytes == 7
+    assert doc.content_sha256 == hashlib.sha256(b"payload").hexdigest()
+
+
+def test_permanent_document_oversized_stream_is_rejected_without_a_record(test_db, test_user):
+    b = _business(test_db, suffix="4")
+    storage = _Storage()
+    service = PermanentDocumentService(test_db, storage=storage)
+
+    with pytest.raises(AppError) as exc:
+        service.upload_document(
+            client_record_id=b.client_id,
+            document_type=DocumentType.ID_COPY,
+            file_data=_Unseekable(b"x" * (11 * 1024 * 1024)),
+            filename="big.pdf",
+            uploaded_by=test_user.id,
+            mime_type="application/pdf",
+            business_id=b.id,
+        )
+
+    assert exc.value.code == "DOCUMENT.FILE_TOO_LARGE"
+    assert storage.uploads == []
+    assert test_db.query(PermanentDocument).filter_by(business_id=b.id).count() == 0
@@ -8,6 +8,7 @@ from app.reports.services.advance_payment_report import AdvancePaymentReportServ
 from app.reports.services.export_service import ExportService
 from app.reports.services.reports_service import AgingReportService
 from tests.helpers.identity import seed_client_with_business
+from tests.helpers.query_counter import count_queries
 
 
 def _client_and_business(db, suffix: str):
@@ -55,6 +56,24 @@ def test_aging_report_service_calculates_buckets(test_db):
     assert report["summary"]["total_90_plus"] == 400.0
 
 
+def test_aging_report_query_count_does_not_grow_with_clients(test_db):
+    c, b = _client_and_business(test_db, "3")
+    _charge(test_db, c.id, b.id, "100.00", 5)
+
+    with count_queries(test_db) as one_client:
+        AgingReportService(test_db).generate_aging_report()
+
+    for suffix in range(4, 14):
+        c, b = _client_and_business(test_db, str(suffix))
+        _charge(test_db, c.id, b.id, "100.00", 5)
+
+    with count_queries(test_db) as many_clients:
+        report = AgingReportService(test_db).generate_aging_report()
+
+    assert report["summary"]["total_clients"] == 11
+    assert len(many_clients) == len(one_client)
+
+
 def test_export_service_generates_excel_and_pdf_files(test_db):
     c, b = _client_and_business(test_db, "2")
     _charge(test_db, c.id, b.id, "150.00", 20)
@@ -87,7 +106,6 @@ def test_aging_report_service_skips_rows_without_matching_business(test_db):
             )
         ]
     )
-    service.client_record_repo = SimpleNamespace(list_by_ids=lambda ids: [])
 
     report = service.generate_aging_report(as_of_date=date(2026, 3, 1))
 
@@ -97,31 +115,30 @@ def test_aging_report_service_skips_rows_without_matching_business(test_db):
 
 
 def test_advance_payment_report_uses_client_record_legal_entity_names(test_db):
+    client, _ = seed_client_with_business(
+        test_db,
+        full_name="Advance Client",
+        id_number="700000007",
+        business_name="Advance Shop",
+        office_client_number=101234,
+    )
     service = AdvancePaymentReportService(test_db)
     service.repo = SimpleNamespace(
         get_collections_aggregates=lambda year, month: [
             SimpleNamespace(
-                client_record_id=7,
+                client_record_id=client.id,
                 total_expected=Decimal("300.00"),
                 total_paid=Decimal("120.00"),
                 overdue_count=2,
             )
         ]
     )
-    service.client_record_repo = SimpleNamespace(
-        list_by_ids=lambda ids: [
-            SimpleNamespace(id=7, legal_entity_id=70, office_client_number=101234)
-        ]
-    )
-    service.legal_entity_repo = SimpleNamespace(
-        get_by_id=lambda legal_id: SimpleNamespace(id=legal_id, official_name="Advance Client")
-    )
 
     report = service.get_collections_report(year=2026, month=3)
 
     assert report["items"] == [
         {
-            "client_record_id": 7,
+            "client_record_id": client.id,
             "office_client_number": 101234,
             "client_name": "Advance Client",
             "total_expected": 300.0,
@@ -1,55 +1,89 @@
-from types import SimpleNamespace
-
+from app.permanent_documents.models.permanent_document import (
+    DocumentScope,
+    DocumentType,
+    PermanentDocument,
+)
 from app.search.services.document_search_service import DocumentSearchService
+from tests.helpers.identity import seed_client_with_business
+from tests.helpers.query_counter import count_queries
+
+
+def _document(db, client_id, business_id, filename, user_id, **fields) -> PermanentDocument:
+    doc = PermanentDocument(
+        client_record_id=client_id,
+        business_id=business_id,
+        scope=DocumentScope.BUSINESS if business_id else DocumentScope.CLIENT,
+        document_type=fields.pop("document_type", DocumentType.ID_COPY),
+        storage_key=f"key-{filename}",
+        original_filename=filename,
+        uploaded_by=user_id,
+        **fields,
+    )
+    db.add(doc)
+    db.flush()
+    return doc
+
 
+def test_document_search_builds_results_in_rank_order(test_db, test_user):
+    client, business = seed_client_with_business(
+        test_db, full_name="Doc Owner", id_number="900", business_name="Client Ten"
+    )
+    partial = _document(test_db, client.id, business.id, "old_report.pdf", test_user.id)
+    exact = _document(test_db, client.id, None, "report", test_user.id)
+    _document(test_db, client.id, None, "invoice.pdf", test_user.id)
 
-def test_document_search_builds_results_and_caches_client_lookup(test_db):
-    docs = [
-        SimpleNamespace(
-            id=1,
-            client_record_id=100,
-            business_id=10,
-            document_type="id_copy",
-            original_filename="id.pdf",
-            tax_year=2026,
-            status="active",
-        ),
-        SimpleNamespace(
-            id=2,
-            client_record_id=100,
-            business_id=10,
-            document_type="power_of_attorney",
-            original_filename="poa.pdf",
-            tax_year=2026,
-            status="active",
-        ),
-        SimpleNamespace(
-            id=3,
-            client_record_id=101,
-            business_id=11,
-            document_type="engagement_agreement",
-            original_filename="ea.pdf",
-            tax_year=2025,
-            status="archived",
-        ),
-    ]
-
-    calls = {"count": 0}
-
-    def _get_business(business_id):
-        calls["count"] += 1
-        if business_id == 10:
-            return SimpleNamespace(full_name="Client Ten")
-        return None
-
-    svc = DocumentSearchService(test_db)
-    svc.doc_repo = SimpleNamespace(search_by_query=lambda query, limit: docs)
-    svc.business_repo = SimpleNamespace(get_by_id=_get_business)
-    svc.client_record_repo = SimpleNamespace(get_by_id=lambda cr_id: None)
-
-    results = svc.search_documents("doc")
-    assert len(results) == 3
-    assert results[0].business_name == "Client Ten"
+    results = DocumentSearchService(test_db).search_documents("report")
+
+    assert [result.id for result in results] == [exact.id, partial.id]
     assert results[1].business_name == "Client Ten"
-    assert results[2].business_name == "לא ידוע"
-    assert calls["count"] == 2
+    assert results[0].business_name is None
+    assert results[0].client_name == "Doc Owner"
+
+
+def test_document_search_skips_deleted_and_matches_type(test_db, test_user):
+    client, _ = seed_client_with_business(test_db, full_name="Doc Owner", id_number="901")
+    poa = _document(
+        test_db,
+        client.id,
+        None,
+        "scan.pdf",
+        test_user.id,
+        document_type=DocumentType.POWER_OF_ATTORNEY,
+    )
+    deleted = _document(
+        test_db,
+        client.id,
+        None,
+        "scan2.pdf",
+        test_user.id,
+        document_type=DocumentType.POWER_OF_ATTORNEY,
+    )
+    deleted.is_deleted = True
+    test_db.flush()
+
+    service = DocumentSearchService(test_db)
+
+    assert [result.id for result in service.search_documents("power of attorney")] == [poa.id]
+    assert [result.id for result in service.search_documents("", filename="scan")] == [poa.id]
+
+
+def test_document_search_query_count_does_not_grow_with_results(test_db, test_user):
+    def _seed(count: int, offset: int) -> None:
+        for i in range(offset, offset + count):
+            client, business = seed_client_with_business(
+                test_db, full_name=f"Batch Owner {i}", id_number=f"95{i:07d}"
+            )
+            _document(test_db, client.id, business.id, f"batch-{i}.pdf", test_user.id)
+        test_db.commit()
+
+    def _queries() -> int:
+        with count_queries(test_db) as statements:
+            DocumentSearchService(test_db).search_documents("batch")
+        test_db.rollback()
+        return len(statements)
+
+    _seed(1, 0)
+    single = _queries()
+    _seed(10, 1)
+
+    assert _queries() == single
@@ -1,77 +1,165 @@
-from types import SimpleNamespace
+from datetime import date
 
+from sqlalchemy import select
+
+from app.binders.models.binder import Binder, BinderCapacityStatus, BinderLocationStatus
+from app.clients.models.legal_entity import LegalEntity
+from app.search.models.search_document import SearchDocument, SearchEntityType
+from app.search.services.search_index_service import SearchIndexService
 from app.search.services.search_service import SearchService
+from tests.helpers.identity import seed_client_with_business
+from tests.helpers.query_counter import count_queries
 
 
-def test_search_service_mixed_client_and_binder_filters(monkeypatch, test_db):
-    svc = SearchService(test_db)
-    svc.client_record_repo = SimpleNamespace(
-        search=lambda **kwargs: (
-            [
-                SimpleNamespace(
-                    id=1,
-                    legal_entity_id=100,
-                    office_client_number=100101,
-                    status=SimpleNamespace(value="active"),
-                )
-            ],
-            1,
-        ),
-        list_by_ids=lambda ids: [
-            SimpleNamespace(
-                id=1,
-                legal_entity_id=100,
-                office_client_number=100101,
-                status=SimpleNamespace(value="active"),
-            )
-        ],
+def _binder(db, client_record_id: int, binder_number: str, user_id: int) -> Binder:
+    binder = Binder(
+        client_record_id=client_record_id,
+        binder_number=binder_number,
+        period_start=date.today(),
+        created_by=user_id,
+        location_status=BinderLocationStatus.IN_OFFICE,
+        capacity_status=BinderCapacityStatus.OPEN,
     )
-    binder = SimpleNamespace(id=2, client_record_id=1, binder_number="B-1")
-    business = SimpleNamespace(legal_entity_id=100, full_name="Alpha")
-    svc.legal_entity_repo = SimpleNamespace(
-        get_by_id=lambda legal_id: SimpleNamespace(
-            id=legal_id, official_name="Alpha", id_number="123"
+    db.add(binder)
+    db.flush()
+    return binder
+
+
+def _indexed(db, entity_type: SearchEntityType) -> dict[int, SearchDocument]:
+    return {
+        row.entity_id: row
+        for row in db.scalars(
+            select(SearchDocument).where(SearchDocument.entity_type == entity_type.value)
         )
+    }
+
+
+def test_search_service_mixed_client_and_binder_results(test_db, test_user):
+    client, business = seed_client_with_business(
+        test_db, full_name="Alpha", id_number="123", business_name="Alpha Works"
     )
-    svc.business_repo = SimpleNamespace(list_by_legal_entity_ids=lambda ids: [business])
-    svc.binder_repo = SimpleNamespace(
-        list_active=lambda **kwargs: [binder],
-        map_active_by_clients=lambda ids: {1: binder},
-    )
-    monkeypatch.setattr(
-        "app.search.services.search_service.DocumentSearchService",
-        lambda db: SimpleNamespace(search_documents=lambda query, filename=None: [{"id": 10}]),
-    )
+    binder = _binder(test_db, client.id, "ALPHA-001", test_user.id)
 
-    items, total, docs = svc.search(query="alpha", binder_number="B-", page=1, page_size=10)
-    assert docs == [{"id": 10}]
-    assert total >= 1
-    assert any(i["result_type"] == "binder" for i in items)
+    items, total, docs = SearchService(test_db).search(query="alpha", page=1, page_size=10)
 
+    assert total == 2
+    assert docs == []
+    assert [(item["result_type"], item["binder_id"]) for item in items] == [
+        ("client", binder.id),
+        ("binder", binder.id),
+    ]
+    assert items[0]["client_name"] == "Alpha"
+    assert items[1]["client_name"] == business.full_name
 
-def test_search_service_client_only_short_circuit(test_db):
-    svc = SearchService(test_db)
-    client_record = SimpleNamespace(
-        id=1,
-        legal_entity_id=100,
-        office_client_number=100101,
-        status=SimpleNamespace(value="active"),
-    )
-    svc.client_record_repo = SimpleNamespace(
-        search=lambda **kwargs: ([client_record], 1),
-        list_by_ids=lambda ids: [client_record],
-    )
-    svc.legal_entity_repo = SimpleNamespace(
-        get_by_id=lambda legal_id: SimpleNamespace(
-            id=legal_id, official_name="Alpha", id_number="123"
+
+def test_search_ranks_exact_and_prefix_matches_first(test_db):
+    seed_client_with_business(test_db, full_name="Big Cohen Holdings", id_number="301")
+    seed_client_with_business(test_db, full_name="Cohen Family", id_number="302")
+    seed_client_with_business(test_db, full_name="Cohen", id_number="303")
+
+    items, total, _ = SearchService(test_db).search(client_name="cohen", page=1, page_size=10)
+
+    assert total == 3
+    assert [item["client_name"] for item in items] == [
+        "Cohen",
+        "Cohen Family",
+        "Big Cohen Holdings",
+    ]
+
+
+def test_mixed_search_paginates_in_db_beyond_former_ceiling(test_db, test_user):
+    client, _ = seed_client_with_business(test_db, full_name="Archive Owner", id_number="400")
+    test_db.add_all(
+        Binder(
+            client_record_id=client.id,
+            binder_number=f"ARC-{i:04d}",
+            period_start=date.today(),
+            created_by=test_user.id,
         )
+        for i in range(1_005)
     )
-    svc.binder_repo = SimpleNamespace(
-        map_active_by_clients=lambda ids: {},
-        list_active=lambda **kwargs: [],
+    test_db.flush()
+
+    service = SearchService(test_db)
+    items, total, _ = service.search(query="arc", page=51, page_size=20)
+    beyond_last_page, _, _ = service.search(query="arc", page=51, page_size=20, binder_number="arc-1")
+
+    # 1,005 binders + the owning client ("Archive Owner"); the old mixed path capped binders at 1,000.
+    assert total == 1_006
+    assert len(items) == 6
+    assert all(item["result_type"] == "binder" for item in items)
+    assert items[-1]["binder_number"] == "ARC-1004"
+    assert beyond_last_page == []
+
+
+def test_search_matches_hebrew_without_niqqud_or_final_letters(test_db):
+    client, _ = seed_client_with_business(
+        test_db, full_name='שָׁלוֹם בע"מ', id_number="500", business_name="חנות השלום"
     )
 
-    items, total, docs = svc.search(query="alpha", page=1, page_size=10)
+    service = SearchService(test_db)
+    by_prefix, total, _ = service.search(query="שלו", page=1, page_size=10)
+    by_abbreviation, _, _ = service.search(client_name="בעמ", page=1, page_size=10)
+    by_business, _, _ = service.search(query="חנות", page=1, page_size=10)
+
     assert total == 1
-    assert docs == []
-    assert items[0]["result_type"] == "client"
+    assert [item["client_id"] for item in by_prefix] == [client.id]
+    assert [item["client_id"] for item in by_abbreviation] == [client.id]
+    assert [item["client_id"] for item in by_business] == [client.id]
+
+
+def test_index_follows_renames_and_deletes(test_db, test_user):
+    client, _ = seed_client_with_business(test_db, full_name="Old Name", id_number="600")
+    binder = _binder(test_db, client.id, "REN-001", test_user.id)
+
+    test_db.get(LegalEntity, client.legal_entity_id).official_name = "New Name"
+    binder.binder_number = "REN-002"
+    test_db.flush()
+
+    clients = _indexed(test_db, SearchEntityType.CLIENT)
+    assert clients[client.id].name_norm == "new name"
+    assert _indexed(test_db, SearchEntityType.BINDER)[binder.id].identifier_norm == "ren 002"
+
+    test_db.delete(binder)
+    test_db.flush()
+    assert binder.id not in _indexed(test_db, SearchEntityType.BINDER)
+
+
+def test_rolled_back_writes_leave_index_untouched(test_db):
+    seed_client_with_business(test_db, full_name="Kept", id_number="700")
+    test_db.commit()
+    seed_client_with_business(test_db, full_name="Discarded", id_number="701")
+    test_db.rollback()
+
+    names = {row.name_norm for row in _indexed(test_db, SearchEntityType.CLIENT).values()}
+    assert names == {"kept"}
+
+
+def test_rebuild_recreates_index(test_db, test_user):
+    client, _ = seed_client_with_business(test_db, full_name="Rebuilt", id_number="800")
+    _binder(test_db, client.id, "RB-1", test_user.id)
+    test_db.execute(SearchDocument.__table__.delete())
+
+    assert SearchIndexService(test_db).rebuild() == 2
+    items, total, _ = SearchService(test_db).search(query="rebuilt", page=1, page_size=10)
+    assert total == 1
+    assert items[0]["client_id"] == client.id
+
+
+def test_search_hydration_query_count_does_not_grow_with_page_size(test_db, test_user):
+    for i in range(20):
+        client, _ = seed_client_with_business(
+            test_db, full_name=f"Count Client {i:02d}", id_number=f"9{i:08d}"
+        )
+        _binder(test_db, client.id, f"COUNT-{i:02d}", test_user.id)
+    test_db.commit()
+
+    def _queries(page_size: int) -> int:
+        with count_queries(test_db) as statements:
+            items, _, _ = SearchService(test_db).search(query="count", page=1, page_size=page_size)
+        test_db.rollback()
+        assert len(items) == page_size
+        return len(statements)
+
+    # Both pages mix clients and binders; hydration is a fixed set of batched lookups.
+    assert _queries(40) == _queries(22)
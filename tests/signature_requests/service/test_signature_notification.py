@@ -109,7 +109,7 @@ def test_signature_request_sent_send_saves_signature_request_id(test_db, test_us
         idempotency_key="00000000-0000-4000-8000-000000000301",
     )
 
-    assert result.status in ("sent", "failed")
+    assert result.status == "queued"
     assert result.notification_id is not None
     record = NotificationRepository(test_db).get_by_id(result.notification_id)
     assert record is not None
@@ -159,7 +159,7 @@ def test_signature_request_sent_uses_signer_email_not_client_email(test_db, test
         idempotency_key="00000000-0000-4000-8000-000000000303",
     )
 
-    assert result.status in ("sent", "failed")
+    assert result.status == "queued"
     record = NotificationRepository(test_db).get_by_id(result.notification_id)
     assert record is not None
     assert record.recipient == "signer@different.com"
@@ -1,3 +1,6 @@
+from datetime import date
+
+from app.advance_payments.models.advance_payment import AdvancePaymentStatus
 from app.clients.models.client_record import ClientRecord
 from app.utils.time_utils import utcnow
 from tests.tax_calendar.api.grouped_helpers import (
@@ -92,6 +95,51 @@ def test_groups_are_paginated(client, auth_token, test_db):
     assert [row["tax_year"] for row in payload["items"]] == [2026]
 
 
+def test_summary_covers_every_matching_group_not_just_the_page(
+    client, auth_token, test_db, test_user
+):
+    vat = vat_entry(test_db)
+    advance = advance_entry(test_db)
+    annual = annual_entry(test_db)
+    add_vat_item(test_db, vat, test_user.id, due_date=date(2026, 2, 20))
+    add_vat_item(test_db, vat, test_user.id, due_date=date(2026, 2, 25))
+    add_advance_payment(test_db, advance, status=AdvancePaymentStatus.PAID)
+    add_annual_report(test_db, annual)
+    test_db.commit()
+
+    response = client.get(f"{PATH}?page_size=1", headers=headers(auth_token))
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["total"] == 3
+    assert payload["summary"] == {"groups": 3, "linked": 4, "open": 3, "overdue": 2, "done": 1}
+    [group] = payload["items"]
+    assert group["tax_calendar_entry_id"] == vat.id
+    assert (group["effective_due_date_min"], group["effective_due_date_max"]) == (
+        "2026-02-20",
+        "2026-02-25",
+    )
+
+    annual_group = client.get(
+        f"{PATH}?obligation_type=annual_report", headers=headers(auth_token)
+    ).json()["items"][0]
+    assert annual_group["effective_due_date_min"] == "2027-07-31"
+    assert annual_group["overdue_count"] == 0
+
+
+def test_obligation_type_without_linked_source_returns_no_groups(client, auth_token, test_db):
+    vat_entry(test_db)
+    test_db.commit()
+
+    response = client.get(
+        f"{PATH}?include_empty=true&obligation_type=national_insurance",
+        headers=headers(auth_token),
+    )
+
+    assert response.status_code == 200
+    assert response.json()["total"] == 0
+
+
 def test_client_record_id_filter_limits_group_counts(client, auth_token, test_db, test_user):
     entry = vat_entry(test_db)
     first_item = add_vat_item(test_db, entry, test_user.id)
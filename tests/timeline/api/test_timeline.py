@@ -4,12 +4,17 @@ from itertools import count
 
 from app.binders.models.binder import Binder, BinderCapacityStatus, BinderLocationStatus
 from app.charge.models.charge import Charge, ChargeStatus, ChargeType
+from app.infrastructure.http_cache import body_cache
 from app.invoice.models.invoice import Invoice
 from app.notification.models.notification import (
     Notification,
     NotificationChannel,
     NotificationTrigger,
 )
+from app.permanent_documents.models.permanent_document import DocumentScope, DocumentType
+from app.permanent_documents.repositories.permanent_document_repository import (
+    PermanentDocumentRepository,
+)
 from app.reminders.models.reminder import (
     Reminder,
     ReminderActionType,
@@ -162,3 +167,26 @@ def test_timeline_applies_bulk_limits(client, test_db, advisor_headers):
         assert len(data["events"]) == 200
     finally:
         timeline_service_module.build_client_events = original_build_client_events
+
+
+def test_document_upload_changes_the_timeline_etag(client, test_db, advisor_headers, test_user):
+    business = _business(test_db)
+    path = f"/api/v1/clients/{business.client_id}/timeline"
+    body_cache.clear()
+    etag = client.get(path, headers=advisor_headers).headers["ETag"]
+
+    PermanentDocumentRepository(test_db).create(
+        client_record_id=business.client_id,
+        business_id=business.id,
+        scope=DocumentScope.BUSINESS,
+        document_type=DocumentType.TAX_FORM,
+        storage_key="timeline/etag.pdf",
+        uploaded_by=test_user.id,
+        mime_type="application/pdf",
+    )
+    test_db.commit()
+    response = client.get(path, headers={**advisor_headers, "If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert "document_uploaded" in {event["event_type"] for event in response.json()["events"]}
@@ -0,0 +1,60 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+import app.main as main_module
+from app.binders.models.binder import Binder
+from app.charge.models.charge import Charge, ChargeStatus, ChargeType
+from app.database import SerialReads
+from app.infrastructure.http_cache import body_cache
+from app.users.api.deps import get_reads
+from tests.helpers.identity import seed_business, seed_client_identity
+
+
+@pytest.fixture
+def test_db_url(tmp_path):
+    return f"sqlite:///{tmp_path / 'crm.db'}"
+
+
+def test_timeline_through_concurrent_reads_matches_serial(
+    client, concurrent_reads, test_db, test_user, advisor_headers
+):
+    crm_client = seed_client_identity(
+        test_db, full_name="Concurrent Timeline", id_number="232323999"
+    )
+    business = seed_business(
+        test_db,
+        legal_entity_id=crm_client.legal_entity_id,
+        business_name="Concurrent Timeline Business",
+        opened_at=date.today(),
+    )
+    test_db.add(
+        Binder(
+            client_record_id=crm_client.id,
+            binder_number="C-1",
+            period_start=date.today(),
+            created_by=test_user.id,
+        )
+    )
+    test_db.add(
+        Charge(
+            client_record_id=crm_client.id,
+            business_id=business.id,
+            amount=Decimal("100.00"),
+            charge_type=ChargeType.CONSULTATION_FEE,
+            status=ChargeStatus.DRAFT,
+        )
+    )
+    test_db.commit()
+    path = f"/api/v1/clients/{crm_client.id}/timeline"
+
+    body_cache.clear()
+    concurrent = client.get(path, headers=advisor_headers)
+    body_cache.clear()
+    main_module.app.dependency_overrides[get_reads] = lambda: SerialReads(test_db)
+    serial = client.get(path, headers=advisor_headers)
+
+    assert concurrent.status_code == 200
+    assert concurrent.json()["total"] >= 2
+    assert concurrent.json() == serial.json()
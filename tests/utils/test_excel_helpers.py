@@ -1,9 +1,10 @@
 import tempfile
 from pathlib import Path
 
-from openpyxl import Workbook
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import Font
 
-from app.utils.excel import adjust_column_widths, save_workbook_to_temp
+from app.utils.excel import StreamingWorkbook, adjust_column_widths, save_workbook_to_temp
 
 
 def test_adjust_column_widths_apply_styles():
@@ -40,3 +41,35 @@ def test_save_workbook_to_temp_uses_default_subdir():
     ws.append(["x"])
     payload = save_workbook_to_temp(wb, prefix="default_subdir_case")
     assert payload["filepath"].startswith(str(Path(tempfile.gettempdir()) / "exports"))
+
+
+def test_streaming_workbook_sizes_columns_from_sample_rows(tmp_path):
+    wb = StreamingWorkbook()
+    ws = wb.add_sheet("data", freeze_panes="A2", sample_size=2, min_width=5, max_width=30)
+    ws.append(["id", "name"], font=Font(bold=True))
+    ws.append([1, "a fairly long client name"])
+    ws.extend([i, "x" * 100] for i in range(2, 6))  # past the sample: not measured
+
+    target = tmp_path / "stream.xlsx"
+    wb.save(target)
+
+    sheet = load_workbook(target).active
+    assert [c.value for c in sheet[1]] == ["id", "name"]
+    assert sheet["A1"].font.bold is True
+    assert sheet.max_row == 6
+    assert sheet["B6"].value == "x" * 100
+    assert sheet.column_dimensions["A"].width == 5
+    assert sheet.column_dimensions["B"].width == len("a fairly long client name") + 2
+    assert sheet.freeze_panes == "A2"
+
+
+def test_streaming_workbook_saves_short_sheet_through_temp_helper(tmp_path):
+    wb = StreamingWorkbook()
+    ws = wb.add_sheet("data")
+    ws.append([ws.cell("total", font=Font(bold=True)), 12.5])
+
+    payload = save_workbook_to_temp(wb, prefix="streamed", export_dir=tmp_path)
+
+    sheet = load_workbook(payload["filepath"]).active
+    assert sheet["A1"].font.bold is True
+    assert sheet["B1"].value == 12.5
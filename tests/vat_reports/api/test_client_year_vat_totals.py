@@ -0,0 +1,79 @@
+from decimal import Decimal
+
+from app.utils.time_utils import utcnow
+from app.vat_reports.models.vat_work_item import VatWorkItem
+from app.vat_reports.repositories.client_year_vat_totals_repository import (
+    ClientYearVatTotalsRepository,
+)
+from app.vat_reports.services.client_year_vat_totals_service import (
+    ClientYearVatTotalsService,
+)
+from tests.vat_reports.api.test_vat_reports_utils import (
+    add_income_invoice,
+    create_work_item,
+    income_payload,
+    setup_ready_item,
+)
+
+
+def test_invoice_writes_and_filing_maintain_client_year_totals(
+    client, advisor_headers, vat_client, test_db
+):
+    filed_id = setup_ready_item(client, advisor_headers, vat_client, "2026-01")
+    open_id = create_work_item(client, advisor_headers, vat_client, "2026-02")
+    add_income_invoice(client, advisor_headers, open_id, income_payload("INV-002"))
+    response = client.post(
+        f"/api/v1/vat/work-items/{open_id}/invoices/batch",
+        headers=advisor_headers,
+        json={"invoices": [income_payload("INV-003", gross_amount="2360.00")]},
+    )
+    assert response.status_code == 201
+    response = client.post(
+        f"/api/v1/vat/work-items/{filed_id}/file",
+        headers=advisor_headers,
+        json={"submission_method": "online"},
+    )
+    assert response.status_code == 200
+
+    test_db.expire_all()
+    totals = ClientYearVatTotalsRepository(test_db).get(vat_client.id, 2026)
+    assert totals.periods_count == 2
+    assert totals.filed_count == 1
+    assert totals.income_net == Decimal("4000.00")
+    assert totals.output_vat == Decimal("720.00")
+    assert totals.filed_income_net == Decimal("1000.00")
+    assert ClientYearVatTotalsService(test_db).check().ok
+
+
+def test_soft_deleted_work_item_leaves_the_aggregate(client, advisor_headers, vat_client, test_db):
+    item_id = create_work_item(client, advisor_headers, vat_client, "2025-03")
+    add_income_invoice(client, advisor_headers, item_id)
+
+    item = test_db.get(VatWorkItem, item_id)
+    item.deleted_at = utcnow()
+    test_db.commit()
+
+    totals = ClientYearVatTotalsRepository(test_db).get(vat_client.id, 2025)
+    assert totals.periods_count == 0
+    assert totals.income_net == Decimal("0.00")
+    assert ClientYearVatTotalsRepository(test_db).list_for_client(vat_client.id) == []
+
+
+def test_rebuild_matches_maintained_rows(client, advisor_headers, vat_client, test_db):
+    item_id = create_work_item(client, advisor_headers, vat_client, "2026-04")
+    add_income_invoice(client, advisor_headers, item_id)
+    service = ClientYearVatTotalsService(test_db)
+
+    totals = ClientYearVatTotalsRepository(test_db).get(vat_client.id, 2026)
+    totals.income_net = Decimal("1.00")
+    test_db.commit()
+    report = service.check()
+    assert not report.ok
+    assert [row.field for row in report.mismatched] == ["income_net"]
+
+    assert service.rebuild() == 1
+    test_db.commit()
+    assert service.check().ok
+    assert ClientYearVatTotalsRepository(test_db).get_income_net(vat_client.id, 2026) == Decimal(
+        "1000.00"
+    )
@@ -12,7 +12,7 @@ from app.tax_calendar.services.materialization_service import (
 from app.vat_reports.models.vat_enums import VatWorkItemStatus
 from app.vat_reports.models.vat_work_item import VatWorkItem
 from app.vat_reports.services.vat_client_summary_service import get_client_summary
-from app.vat_reports.services.vat_export_service import _load as export_load
+from app.vat_reports.services.vat_export_service import load_export_data as export_load
 
 EXCEL_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
 
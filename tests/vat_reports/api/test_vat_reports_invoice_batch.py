@@ -0,0 +1,152 @@
+from decimal import Decimal
+from io import BytesIO
+
+from openpyxl import Workbook
+from sqlalchemy import func, select
+
+from app.vat_reports.models.vat_audit_log import VatAuditLog
+from app.vat_reports.models.vat_invoice import VatInvoice
+from app.vat_reports.models.vat_work_item import VatWorkItem
+from app.vat_reports.repositories.vat_invoice_repository import VatInvoiceRepository
+from tests.vat_reports.api.test_vat_reports_utils import (
+    add_income_invoice,
+    create_work_item,
+    income_payload,
+)
+
+
+def _expense(number, gross="590.00", category="vehicle", **extra):
+    return {
+        "invoice_type": "expense",
+        "invoice_number": number,
+        "invoice_date": "2026-05-10",
+        "counterparty_name": "Supplier",
+        "gross_amount": gross,
+        "expense_category": category,
+        "document_type": "receipt",
+        **extra,
+    }
+
+
+def _batch(client, headers, item_id, invoices):
+    return client.post(
+        f"/api/v1/vat/work-items/{item_id}/invoices/batch",
+        headers=headers,
+        json={"invoices": invoices},
+    )
+
+
+def test_batch_adds_invoices_and_moves_totals_by_deltas(
+    client, advisor_headers, vat_client, test_db
+):
+    item_id = create_work_item(client, advisor_headers, vat_client, "2026-05")
+    add_income_invoice(client, advisor_headers, item_id, income_payload("INV-000"))
+
+    response = _batch(
+        client,
+        advisor_headers,
+        item_id,
+        [
+            income_payload("INV-001"),
+            income_payload("INV-002", gross_amount="2360.00"),
+            {**income_payload("CN-001", gross_amount="118.00"), "document_type": "credit_note"},
+            _expense("EXP-001"),
+            _expense("EXP-002", gross="1234.56", category="office"),
+            {"invoice_type": "expense", "gross_amount": "100.00", "expense_category": "office"},
+        ],
+    )
+
+    assert response.status_code == 201
+    data = response.json()
+    assert len(data["items"]) == 6
+    assert [item["invoice_number"] for item in data["items"][:3]] == [
+        "INV-001",
+        "INV-002",
+        "CN-001",
+    ]
+    assert data["items"][5]["invoice_number"].startswith("2026-05-expense-")
+
+    test_db.expire_all()
+    item = test_db.get(VatWorkItem, item_id)
+    repo = VatInvoiceRepository(test_db)
+    output_vat, input_vat = repo.sum_vat_both_types(item_id)
+    output_net, input_net = repo.sum_net_both_types(item_id)
+    cent = Decimal("0.01")
+    assert item.total_output_vat == output_vat.quantize(cent) == Decimal("702.00")
+    assert item.total_input_vat == input_vat.quantize(cent)
+    assert item.total_output_net == output_net.quantize(cent)
+    assert item.total_input_net == input_net.quantize(cent)
+    assert item.net_vat == item.total_output_vat - item.total_input_vat
+    added = test_db.scalar(
+        select(func.count())
+        .select_from(VatAuditLog)
+        .where(VatAuditLog.work_item_id == item_id, VatAuditLog.action == "invoice_added")
+    )
+    assert added == 7
+
+
+def test_batch_with_invalid_rows_adds_nothing(client, advisor_headers, vat_client, test_db):
+    item_id = create_work_item(client, advisor_headers, vat_client, "2026-06")
+
+    add_income_invoice(client, advisor_headers, item_id, income_payload("INV-001"))
+    response = _batch(
+        client,
+        advisor_headers,
+        item_id,
+        [
+            income_payload("INV-001"),
+            income_payload("INV-002"),
+            income_payload("INV-002"),
+            {**_expense("EXP-001"), "expense_category": None},
+            income_payload("INV-003"),
+        ],
+    )
+
+    assert response.status_code == 400
+    error = response.json()["error"]
+    assert error["code"] == "VAT.BATCH_INVALID_ROWS"
+    assert [row["row"] for row in error["details"]["errors"]] == [1, 3, 4]
+    count = test_db.scalar(
+        select(func.count()).select_from(VatInvoice).where(VatInvoice.work_item_id == item_id)
+    )
+    assert count == 1
+
+
+def test_batch_upload_accepts_csv_and_excel(client, secretary_headers, vat_client, test_db):
+    item_id = create_work_item(client, secretary_headers, vat_client, "2026-07")
+    csv_body = (
+        "invoice_type,invoice_number,invoice_date,gross_amount,expense_category,notes\n"
+        "income,CSV-1,2026-07-03,1180.00,,ignored\n"
+        "\n"
+        "expense,CSV-2,2026-07-04,590.00,office,\n"
+    ).encode("utf-8-sig")
+    response = client.post(
+        f"/api/v1/vat/work-items/{item_id}/invoices/batch/upload",
+        headers=secretary_headers,
+        files={"file": ("invoices.csv", csv_body, "text/csv")},
+    )
+    assert response.status_code == 201
+    assert [item["invoice_number"] for item in response.json()["items"]] == ["CSV-1", "CSV-2"]
+
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(["invoice_type", "invoice_number", "gross_amount"])
+    sheet.append(["income", 1001, 236])
+    sheet.append(["income", 1002, -5])
+    buffer = BytesIO()
+    workbook.save(buffer)
+    response = client.post(
+        f"/api/v1/vat/work-items/{item_id}/invoices/batch/upload",
+        headers=secretary_headers,
+        files={"file": ("invoices.xlsx", buffer.getvalue(), "application/octet-stream")},
+    )
+    assert response.status_code == 400
+    assert [row["row"] for row in response.json()["error"]["details"]["errors"]] == [3]
+
+    response = client.post(
+        f"/api/v1/vat/work-items/{item_id}/invoices/batch/upload",
+        headers=secretary_headers,
+        files={"file": ("invoices.txt", b"x", "text/plain")},
+    )
+    assert response.status_code == 400
+    assert response.json()["error"]["code"] == "VAT.UPLOAD_UNSUPPORTED"
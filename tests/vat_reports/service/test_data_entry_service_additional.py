@@ -119,12 +119,12 @@ def test_data_entry_common_invalid_transition_and_ceiling():
 
     osek_business = SimpleNamespace(entity_type=EntityType.OSEK_PATUR)
 
-    class _InvoiceRepo:
-        def sum_income_net_by_client_year(self, client_id, year):
+    class _TotalsRepo:
+        def get_income_net(self, client_id, year):
             return 2000000
 
     with pytest.raises(AppError):
-        check_osek_patur_ceiling(osek_business, _InvoiceRepo(), 1, "2026-01", 1)
+        check_osek_patur_ceiling(osek_business, _TotalsRepo(), 1, "2026-01", 1)
 
     derived = resolve_invoice_derived_fields(
         invoice_type=InvoiceType.INCOME,
@@ -140,11 +140,11 @@ def test_data_entry_common_invalid_transition_and_ceiling():
 def test_osek_patur_ceiling_uses_2026_threshold_and_boundary_behavior():
     osek_business = SimpleNamespace(entity_type=EntityType.OSEK_PATUR)
 
-    class _InvoiceRepo:
+    class _TotalsRepo:
         def __init__(self, total):
             self.total = total
 
-        def sum_income_net_by_client_year(self, client_id, year):
+        def get_income_net(self, client_id, year):
             assert year == 2026
             return self.total
 
@@ -152,7 +152,7 @@ def test_osek_patur_ceiling_uses_2026_threshold_and_boundary_behavior():
 
     warning = check_osek_patur_ceiling(
         osek_business,
-        _InvoiceRepo(122832),
+        _TotalsRepo(122832),
         1,
         "2026-01",
         1,
@@ -162,7 +162,7 @@ def test_osek_patur_ceiling_uses_2026_threshold_and_boundary_behavior():
     with pytest.raises(AppError) as exc:
         check_osek_patur_ceiling(
             osek_business,
-            _InvoiceRepo(122833),
+            _TotalsRepo(122833),
             1,
             "2026-01",
             0.01,
@@ -175,16 +175,16 @@ def test_osek_patur_ceiling_warning_threshold_is_80_percent():
     osek_business = SimpleNamespace(entity_type=EntityType.OSEK_PATUR)
     warning_threshold = OSEK_PATUR_CEILING_ILS * OSEK_PATUR_CEILING_WARNING_RATE
 
-    class _InvoiceRepo:
+    class _TotalsRepo:
         def __init__(self, total):
             self.total = total
 
-        def sum_income_net_by_client_year(self, client_id, year):
+        def get_income_net(self, client_id, year):
             return self.total
 
     below_warning = check_osek_patur_ceiling(
         osek_business,
-        _InvoiceRepo(warning_threshold - 1),
+        _TotalsRepo(warning_threshold - 1),
         1,
         "2026-01",
         0.5,
@@ -193,7 +193,7 @@ def test_osek_patur_ceiling_warning_threshold_is_80_percent():
 
     at_warning = check_osek_patur_ceiling(
         osek_business,
-        _InvoiceRepo(warning_threshold - 1),
+        _TotalsRepo(warning_threshold - 1),
         1,
         "2026-01",
         1,
@@ -0,0 +1,51 @@
+from datetime import date
+from decimal import Decimal
+
+from app.common.enums import SubmissionMethod
+from app.vat_reports.models.vat_enums import InvoiceType, VatRateType, VatWorkItemStatus
+from app.vat_reports.models.vat_work_item import VatWorkItem
+from app.vat_reports.repositories.vat_invoice_repository import VatInvoiceRepository
+from app.vat_reports.repositories.vat_work_item_write_repository import (
+    VatWorkItemWriteRepository,
+)
+from app.vat_reports.services.vat_totals_reconciliation import reconcile_vat_totals
+from tests.vat_reports.api.test_vat_reports_utils import add_income_invoice, create_work_item
+
+
+def test_reconciliation_repairs_drifted_totals_and_skips_filed(
+    client, advisor_headers, vat_client, test_db, test_user
+):
+    drifted_id = create_work_item(client, advisor_headers, vat_client, "2026-01")
+    add_income_invoice(client, advisor_headers, drifted_id)
+    clean_id = create_work_item(client, advisor_headers, vat_client, "2026-03")
+    add_income_invoice(client, advisor_headers, clean_id)
+    filed_id = create_work_item(client, advisor_headers, vat_client, "2026-05")
+    add_income_invoice(client, advisor_headers, filed_id)
+    test_db.expire_all()
+
+    repo = VatWorkItemWriteRepository(test_db)
+    repo.mark_filed(filed_id, 180, SubmissionMethod.ONLINE, test_user.id)
+    VatInvoiceRepository(test_db).create(
+        work_item_id=drifted_id,
+        created_by=test_user.id,
+        invoice_type=InvoiceType.INCOME,
+        invoice_number="MISSED-1",
+        invoice_date=date(2026, 1, 20),
+        counterparty_name="Customer",
+        net_amount=100,
+        vat_amount=18,
+        rate_type=VatRateType.STANDARD,
+    )
+    for item_id in (drifted_id, filed_id):
+        test_db.get(VatWorkItem, item_id).total_output_vat = Decimal("1.00")
+    test_db.flush()
+
+    assert reconcile_vat_totals(test_db, page_size=2) == {"checked": 2, "repaired": 1}
+
+    drifted = test_db.get(VatWorkItem, drifted_id)
+    assert drifted.total_output_vat == Decimal("198.00")
+    assert drifted.total_output_net == Decimal("1100.00")
+    assert drifted.net_vat == Decimal("198.00")
+    filed = test_db.get(VatWorkItem, filed_id)
+    assert filed.status == VatWorkItemStatus.FILED
+    assert filed.total_output_vat == Decimal("1.00")
@@ -0,0 +1,307 @@
+"""SQL work-queue projection must match the in-memory reference computation."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.annual_reports.models.annual_report_enums import (
+    AnnualReportStatus,
+    ClientAnnualFilingType,
+    PrimaryAnnualReportForm,
+)
+from app.annual_reports.models.annual_report_model import AnnualReport
+from app.binders.models.binder import Binder, BinderCapacityStatus, BinderLocationStatus
+from app.charge.models.charge import Charge, ChargeStatus, ChargeType
+from app.common.enums import VatType
+from app.tasks.models.task import Task, TaskPriority, TaskStatus
+from app.utils.time_utils import israel_today, utcnow
+from app.vat_reports.models.vat_enums import VatWorkItemStatus
+from app.work_queue.schemas.work_queue import (
+    WorkQueueLinkedFilter,
+    WorkQueueScope,
+    WorkQueueSourceType,
+    WorkQueueUrgency,
+)
+from app.work_queue.services.read_model_service import WorkQueueReadModelService
+from app.work_queue.services.work_queue_service import (
+    WorkQueueFilters,
+    WorkQueueService,
+    build_work_queue_summary,
+)
+from tests.helpers.task_helpers import create_business
+from tests.helpers.tax_calendar_links import (
+    create_linked_advance_payment,
+    create_linked_vat_work_item,
+    create_tax_calendar_entry_for_annual,
+)
+
+
+def _charge(db, biz, *, days_ago: int, status=ChargeStatus.ISSUED) -> Charge:
+    charge = Charge(
+        client_record_id=biz.client_id,
+        business_id=biz.id,
+        amount=500,
+        charge_type=ChargeType.OTHER,
+        status=status,
+        period="2026-01",
+        issued_at=utcnow() - timedelta(days=days_ago),
+    )
+    db.add(charge)
+    db.flush()
+    return charge
+
+
+def _task(
+    db,
+    title: str,
+    *,
+    due_date: date | None = None,
+    status=TaskStatus.OPEN,
+    priority=TaskPriority.NORMAL,
+    source_domain: str | None = None,
+    source_id: int | None = None,
+) -> Task:
+    task = Task(
+        title=title,
+        status=status,
+        priority=priority,
+        due_date=due_date,
+        source_domain=source_domain,
+        source_id=source_id,
+    )
+    db.add(task)
+    db.flush()
+    return task
+
+
+@pytest.fixture
+def mixed_queue(test_db):
+    today = israel_today()
+    first = create_business(test_db)
+    second = create_business(test_db)
+
+    vat = create_linked_vat_work_item(
+        test_db,
+        client_record_id=first.client_id,
+        period=(today.replace(day=1) - timedelta(days=40)).strftime("%Y-%m"),
+        status=VatWorkItemStatus.PENDING_MATERIALS,
+        created_by=1,
+    )
+    create_linked_vat_work_item(
+        test_db,
+        client_record_id=second.client_id,
+        period=(today.replace(day=1) - timedelta(days=70)).strftime("%Y-%m"),
+        period_type=VatType.BIMONTHLY,
+        created_by=1,
+    )
+    entry = create_tax_calendar_entry_for_annual(test_db, today.year - 1)
+    test_db.add(
+        AnnualReport(
+            client_record_id=second.client_id,
+            created_by=1,
+            tax_year=today.year - 1,
+            tax_calendar_entry_id=entry.id,
+            client_type=ClientAnnualFilingType.INDIVIDUAL,
+            form_type=PrimaryAnnualReportForm.FORM_1301,
+            status=AnnualReportStatus.COLLECTING_DOCS,
+            filing_deadline=datetime.combine(today - timedelta(days=12), datetime.min.time()),
+        )
+    )
+    create_linked_advance_payment(
+        test_db,
+        client_record_id=first.client_id,
+        period=today.strftime("%Y-%m"),
+        due_date=today + timedelta(days=3),
+        expected_amount=1000,
+        paid_amount=0,
+    )
+    create_linked_advance_payment(
+        test_db,
+        client_record_id=second.client_id,
+        period=(today - timedelta(days=31)).strftime("%Y-%m"),
+        due_date=today + timedelta(days=15),
+        expected_amount=500,
+        paid_amount=0,
+    )
+    linked_charge = _charge(test_db, first, days_ago=45)
+    _charge(test_db, second, days_ago=33)
+    paid_charge = _charge(test_db, second, days_ago=60, status=ChargeStatus.PAID)
+    test_db.add(
+        Binder(
+            client_record_id=first.client_id,
+            binder_number="WQ-77",
+            location_status=BinderLocationStatus.READY_FOR_HANDOVER,
+            capacity_status=BinderCapacityStatus.OPEN,
+            ready_for_handover_at=utcnow() - timedelta(days=40),
+            created_by=1,
+        )
+    )
+
+    _task(test_db, "Call about charge", source_domain="charge", source_id=linked_charge.id)
+    _task(
+        test_db,
+        "Chase VAT materials",
+        due_date=today + timedelta(days=2),
+        priority=TaskPriority.URGENT,
+        source_domain="vat_work_item",
+        source_id=vat.id,
+    )
+    _task(
+        test_db,
+        "Second VAT follow-up",
+        due_date=today - timedelta(days=1),
+        source_domain="vat_work_item",
+        source_id=vat.id,
+    )
+    _task(test_db, "Manual needle", due_date=today + timedelta(days=30))
+    _task(test_db, "Manual without due", priority=TaskPriority.HIGH)
+    _task(test_db, "Paid follow-up", source_domain="charge", source_id=paid_charge.id)
+    _task(test_db, "Dangling source", source_domain="binder", source_id=99_999)
+    _task(test_db, "Finished", status=TaskStatus.DONE, due_date=today)
+    _task(test_db, "Dropped", status=TaskStatus.CANCELED)
+    test_db.commit()
+    return first, second
+
+
+def _reference(service: WorkQueueService, **kwargs):
+    filter_keys = {"search", "source_type", "urgency", "task_status", "linked", "scope"}
+    filters = WorkQueueFilters(**{k: v for k, v in kwargs.items() if k in filter_keys})
+    items = service._filtered_items(
+        service._context(),
+        client_record_id=kwargs.get("client_record_id"),
+        business_id=kwargs.get("business_id"),
+        exclude_source_types=kwargs.get("exclude_source_types"),
+        include_task_history=kwargs.get("include_task_history", False),
+        filters=filters,
+    )
+    items.sort(key=service._sort_key)
+    return items
+
+
+def _shape(items):
+    return [
+        (
+            item.source_type,
+            item.source_id,
+            item.urgency,
+            item.due_date,
+            item.linked_tasks_count,
+            item.client_record_id,
+            item.title,
+        )
+        for item in items
+    ]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"include_task_history": True},
+        {"search": "needle"},
+        {"search": "WQ-77"},
+        {"search": "Task Test Client"},
+        {"search": "חיוב"},
+        {"search": "chase"},
+        {"source_type": WorkQueueSourceType.CHARGE},
+        {"urgency": WorkQueueUrgency.OVERDUE},
+        {"urgency": WorkQueueUrgency.APPROACHING},
+        {"task_status": TaskStatus.OPEN},
+        {"task_status": TaskStatus.DONE, "include_task_history": True},
+        {"linked": WorkQueueLinkedFilter.LINKED},
+        {"linked": WorkQueueLinkedFilter.UNLINKED},
+        {"scope": WorkQueueScope.MANUAL},
+        {"scope": WorkQueueScope.SYSTEM},
+        {"exclude_source_types": [WorkQueueSourceType.TASK]},
+        {"exclude_source_types": [WorkQueueSourceType.BINDER, WorkQueueSourceType.CHARGE]},
+    ],
+)
+def test_sql_projection_matches_in_memory_reference(test_db, mixed_queue, kwargs):
+    service = WorkQueueService(test_db)
+
+    response = service.list_items_with_total(limit=200, **kwargs)
+    expected = _reference(service, **kwargs)
+
+    assert _shape(response.items) == _shape(expected)
+    assert response.summary == build_work_queue_summary(expected)
+
+
+def test_sql_projection_matches_reference_for_client_and_business_scope(test_db, mixed_queue):
+    first, second = mixed_queue
+    service = WorkQueueService(test_db)
+
+    for kwargs in (
+        {"client_record_id": first.client_id},
+        {"client_record_id": second.client_id},
+        {"business_id": first.id},
+    ):
+        response = service.list_items_with_total(limit=200, **kwargs)
+        expected = _reference(service, **kwargs)
+        assert _shape(response.items) == _shape(expected)
+        assert response.summary == build_work_queue_summary(expected)
+
+
+def test_sql_pages_concatenate_to_full_ordering(test_db, mixed_queue):
+    service = WorkQueueService(test_db)
+
+    full = _shape(service.list_items(limit=200))
+    paged = []
+    for offset in range(0, len(full), 3):
+        paged.extend(_shape(service.list_items(limit=3, offset=offset)))
+
+    assert paged == full
+
+
+def test_page_query_count_does_not_grow_with_queue_size(test_db):
+    biz = create_business(test_db)
+    for _ in range(5):
+        _charge(test_db, biz, days_ago=40)
+    test_db.commit()
+
+    def _count_queries() -> int:
+        statements = []
+        engine = test_db.get_bind()
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            WorkQueueService(test_db).list_items_with_total(limit=2)
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+        return len(statements)
+
+    small = _count_queries()
+    for _ in range(40):
+        _charge(test_db, biz, days_ago=40)
+    test_db.commit()
+
+    assert _count_queries() == small
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"search": "needle"},
+        {"search": "chase"},
+        {"urgency": WorkQueueUrgency.OVERDUE},
+        {"task_status": TaskStatus.OPEN},
+        {"linked": WorkQueueLinkedFilter.LINKED},
+        {"scope": WorkQueueScope.MANUAL},
+    ],
+)
+def test_read_model_matches_in_memory_reference(test_db, mixed_queue, kwargs):
+    WorkQueueReadModelService(test_db).rebuild()
+    test_db.commit()
+    service = WorkQueueService(test_db)
+    assert service._read_model_is_current()
+
+    response = service.list_items_with_total(limit=200, **kwargs)
+    expected = _reference(service, **kwargs)
+
+    assert _shape(response.items) == _shape(expected)
+    assert response.summary == build_work_queue_summary(expected)
+    assert WorkQueueReadModelService(test_db).check().ok
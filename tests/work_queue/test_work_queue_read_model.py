@@ -0,0 +1,213 @@
+from datetime import timedelta
+
+from sqlalchemy import select
+
+from app.charge.models.charge import Charge, ChargeStatus, ChargeType
+from app.tasks.models.task import Task, TaskStatus
+from app.utils.time_utils import israel_today, utcnow
+from app.work_queue.models.work_queue_item import (
+    WorkQueueReadModelItem,
+    WorkQueueReadModelState,
+)
+from app.work_queue.repositories import work_queue_read_model_repository
+from app.work_queue.repositories.work_queue_read_model_repository import (
+    WorkQueueReadModelRepository,
+)
+from app.work_queue.services.read_model_service import WorkQueueReadModelService
+from app.work_queue.services.work_queue_service import WorkQueueService
+from tests.helpers.task_helpers import create_business
+
+
+def _charge(db, biz, *, days_ago: int = 40) -> Charge:
+    charge = Charge(
+        client_record_id=biz.client_id,
+        business_id=biz.id,
+        amount=500,
+        charge_type=ChargeType.OTHER,
+        status=ChargeStatus.ISSUED,
+        period="2026-01",
+        issued_at=utcnow() - timedelta(days=days_ago),
+    )
+    db.add(charge)
+    db.flush()
+    return charge
+
+
+def _rows(db) -> dict[tuple[str, int], WorkQueueReadModelItem]:
+    return {
+        (row.source_type, row.source_id): row
+        for row in db.scalars(select(WorkQueueReadModelItem))
+    }
+
+
+def _shape(items):
+    return [(i.source_type, i.source_id, i.urgency, i.due_date, i.linked_tasks_count) for i in items]
+
+
+def test_rebuild_materializes_live_queue_and_reads_use_it(test_db):
+    biz = create_business(test_db)
+    charge = _charge(test_db, biz)
+    test_db.add(Task(title="Standalone follow-up", due_date=israel_today()))
+    test_db.commit()
+
+    count = WorkQueueReadModelService(test_db).rebuild()
+    test_db.commit()
+
+    assert count == 2
+    assert ("charge", charge.id) in _rows(test_db)
+    assert _rows(test_db)[("charge", charge.id)].client_record_id == biz.client_id
+    service = WorkQueueService(test_db)
+    assert service._read_model_is_current()
+    assert _shape(service.list_items(limit=50)) == _shape(service.reference_items())
+    assert WorkQueueReadModelService(test_db).check().ok
+
+
+def test_writes_refresh_rows_in_the_same_transaction(test_db):
+    biz = create_business(test_db)
+    WorkQueueReadModelService(test_db).rebuild()
+    test_db.commit()
+
+    charge = _charge(test_db, biz)
+    test_db.commit()
+    assert ("charge", charge.id) in _rows(test_db)
+
+    task = Task(title="Call client", source_domain="charge", source_id=charge.id)
+    test_db.add(task)
+    test_db.commit()
+    rows = _rows(test_db)
+    assert rows[("charge", charge.id)].linked_count == 1
+    assert ("task", task.id) not in rows
+
+    charge.status = ChargeStatus.PAID
+    test_db.commit()
+    rows = _rows(test_db)
+    assert ("charge", charge.id) not in rows
+    # With its source out of the queue, the open task surfaces on its own.
+    assert rows[("task", task.id)].client_record_id == biz.client_id
+
+    task.status = TaskStatus.DONE
+    test_db.commit()
+    assert _rows(test_db) == {}
+    assert WorkQueueReadModelService(test_db).check().ok
+
+
+def test_refresh_overwrites_rows_it_did_not_delete(test_db):
+    biz = create_business(test_db)
+    charge = _charge(test_db, biz)
+    test_db.commit()
+    WorkQueueReadModelService(test_db).rebuild()
+    test_db.commit()
+    # As if a concurrent refresh committed this row after our delete ran.
+    stale = _rows(test_db)[("charge", charge.id)]
+    stale.client_record_id = None
+    stale.title = "stale"
+    test_db.commit()
+
+    WorkQueueReadModelRepository(test_db).refresh_clients(israel_today(), [biz.client_id])
+    test_db.commit()
+
+    test_db.expire_all()
+    row = _rows(test_db)[("charge", charge.id)]
+    assert (row.client_record_id, row.title != "stale") == (biz.client_id, True)
+
+
+def test_dialects_without_upsert_delete_then_insert(test_db, monkeypatch):
+    monkeypatch.setattr(work_queue_read_model_repository, "_UPSERT_INSERTS", {})
+    biz = create_business(test_db)
+    charge = _charge(test_db, biz)
+    test_db.commit()
+    WorkQueueReadModelService(test_db).rebuild()
+    test_db.commit()
+    stale = _rows(test_db)[("charge", charge.id)]
+    stale.client_record_id = None
+    stale.title = "stale"
+    test_db.commit()
+
+    WorkQueueReadModelRepository(test_db).refresh_clients(israel_today(), [biz.client_id])
+    test_db.commit()
+    test_db.expire_all()
+    row = _rows(test_db)[("charge", charge.id)]
+    assert (row.client_record_id, row.title != "stale") == (biz.client_id, True)
+
+    charge.status = ChargeStatus.PAID
+    test_db.commit()
+    assert ("charge", charge.id) not in _rows(test_db)
+    assert WorkQueueReadModelService(test_db).check().ok
+
+
+def test_rolled_back_writes_leave_read_model_untouched(test_db):
+    biz = create_business(test_db)
+    WorkQueueReadModelService(test_db).rebuild()
+    test_db.commit()
+
+    _charge(test_db, biz)
+    test_db.rollback()
+    test_db.add(Task(title="Unrelated"))
+    test_db.commit()
+
+    assert [key[0] for key in _rows(test_db)] == ["task"]
+
+
+def test_hooks_are_inactive_until_first_rebuild(test_db):
+    biz = create_business(test_db)
+    charge = _charge(test_db, biz)
+    test_db.commit()
+
+    assert _rows(test_db) == {}
+    service = WorkQueueService(test_db)
+    assert not service._read_model_is_current()
+    assert [item.source_id for item in service.list_items()] == [charge.id]
+    report = WorkQueueReadModelService(test_db).check()
+    assert report.is_stale and not report.ok
+    assert report.missing == [("charge", charge.id)]
+
+
+def test_rebucket_rebuilds_only_after_date_rolls_over(test_db):
+    create_business(test_db)
+    service = WorkQueueReadModelService(test_db)
+    assert service.rebucket() is None
+
+    service.rebuild(israel_today() - timedelta(days=1))
+    test_db.commit()
+    # A stale bucket is never served: reads fall back to the live projection.
+    assert not WorkQueueService(test_db)._read_model_is_current()
+
+    assert service.rebucket() == 0
+    assert test_db.get(WorkQueueReadModelState, 1).bucket_date == israel_today()
+    assert service.rebucket() is None
+
+
+def test_check_reports_drift(test_db):
+    biz = create_business(test_db)
+    charge = _charge(test_db, biz)
+    test_db.commit()
+    WorkQueueReadModelService(test_db).rebuild()
+    test_db.commit()
+
+    row = _rows(test_db)[("charge", charge.id)]
+    row.urgency_rank = 3
+    row.linked_count = 2
+    test_db.add(
+        WorkQueueReadModelItem(
+            source_type="binder",
+            source_id=999,
+            client_record_id=biz.client_id,
+            urgency_rank=0,
+            item_kind=1,
+            status_rank=9,
+            priority_rank=9,
+            linked_count=0,
+            title="ghost",
+            search_text="ghost",
+        )
+    )
+    test_db.flush()
+
+    report = WorkQueueReadModelService(test_db).check()
+
+    assert not report.ok
+    assert report.unexpected == [("binder", 999)]
+    assert {mismatch.field for mismatch in report.mismatched} == {
+        "urgency",
+        "linked_tasks_count",
+    }